@@ -6,15 +6,24 @@ class Character {
   final String? zodiac;
   final String? mbti;
   final String rawText;
+  // [offset, length] of the text in the raw text blob when rawText was
+  // moved out of the dataset (see RawTextStore)
+  final List<int>? rawTextRef;
   final String? image;
+  // Asset path of the cached thumbnail of [image], when one was generated
+  final String? thumbnail;
   final double? bmi;
   final String? hometown;
   final String currentLocation;
   final String occupation;
   final List<String> interests;
+  // Ids into the corpus interest vocabulary (compare these, not strings)
+  final List<int> interestIds;
   final bool? hasHouse;
   final bool? hasCar;
   final String? maritalStatus;
+  // Ids of the most similar profiles, nearest first ("more like this")
+  final List<String> similarIds;
 
   // UI state properties
   bool isBookmarked;
@@ -30,15 +39,19 @@ class Character {
     this.zodiac,
     this.mbti,
     required this.rawText,
+    this.rawTextRef,
     this.image,
+    this.thumbnail,
     this.bmi,
     this.hometown,
     required this.currentLocation,
     required this.occupation,
     required this.interests,
+    this.interestIds = const [],
     this.hasHouse,
     this.hasCar,
     this.maritalStatus,
+    this.similarIds = const [],
     this.isBookmarked = false,
     this.isLiked = false,
     this.isRejected = false,
@@ -55,15 +68,21 @@ class Character {
       zodiac: json['zodiac'],
       mbti: json['mbti'],
       rawText: json['raw_text'] ?? '',
+      rawTextRef: json['raw_text_ref'] == null
+          ? null
+          : List<int>.from(json['raw_text_ref']),
       image: json['image'],
+      thumbnail: json['thumbnail'],
       bmi: json['bmi']?.toDouble(),
       hometown: json['hometown'],
       currentLocation: json['current_location'] ?? '',
       occupation: json['occupation'] ?? '',
       interests: List<String>.from(json['interests'] ?? []),
+      interestIds: List<int>.from(json['interest_ids'] ?? []),
       hasHouse: json['has_house'],
       hasCar: json['has_car'],
       maritalStatus: json['marital_status'],
+      similarIds: List<String>.from(json['similar_ids'] ?? []),
       isBookmarked: json['is_bookmarked'] ?? false,
       isLiked: json['is_liked'] ?? false,
       isRejected: json['is_rejected'] ?? false,
@@ -81,15 +100,19 @@ class Character {
       'zodiac': zodiac,
       'mbti': mbti,
       'raw_text': rawText,
+      'raw_text_ref': rawTextRef,
       'image': image,
+      'thumbnail': thumbnail,
       'bmi': bmi,
       'hometown': hometown,
       'current_location': currentLocation,
       'occupation': occupation,
       'interests': interests,
+      'interest_ids': interestIds,
       'has_house': hasHouse,
       'has_car': hasCar,
       'marital_status': maritalStatus,
+      'similar_ids': similarIds,
       'is_bookmarked': isBookmarked,
       'is_liked': isLiked,
       'is_rejected': isRejected,
@@ -144,15 +167,19 @@ class Character {
     String? zodiac,
     String? mbti,
     String? rawText,
+    List<int>? rawTextRef,
     String? image,
+    String? thumbnail,
     double? bmi,
     String? hometown,
     String? currentLocation,
     String? occupation,
     List<String>? interests,
+    List<int>? interestIds,
     bool? hasHouse,
     bool? hasCar,
     String? maritalStatus,
+    List<String>? similarIds,
     bool? isBookmarked,
     bool? isLiked,
     bool? isRejected,
@@ -166,15 +193,19 @@ class Character {
       zodiac: zodiac ?? this.zodiac,
       mbti: mbti ?? this.mbti,
       rawText: rawText ?? this.rawText,
+      rawTextRef: rawTextRef ?? this.rawTextRef,
       image: image ?? this.image,
+      thumbnail: thumbnail ?? this.thumbnail,
       bmi: bmi ?? this.bmi,
       hometown: hometown ?? this.hometown,
       currentLocation: currentLocation ?? this.currentLocation,
       occupation: occupation ?? this.occupation,
       interests: interests ?? this.interests,
+      interestIds: interestIds ?? this.interestIds,
       hasHouse: hasHouse ?? this.hasHouse,
       hasCar: hasCar ?? this.hasCar,
       maritalStatus: maritalStatus ?? this.maritalStatus,
+      similarIds: similarIds ?? this.similarIds,
       isBookmarked: isBookmarked ?? this.isBookmarked,
       isLiked: isLiked ?? this.isLiked,
       isRejected: isRejected ?? this.isRejected,
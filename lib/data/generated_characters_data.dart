@@ -0,0 +1,6518 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND.
+// Written by lib/data_generate_python/csv_to_flutter_converter.py
+// (create_dart_file); regenerate with scripts/prebuild.py.
+
+import 'character.dart';
+
+class GeneratedCharactersData {
+  static const int count = 427;
+
+  /// Fresh Character objects; UI state on them is mutable
+  static List<Character> getCharacters() => [
+    Character(
+      id: 'profile_men_100_98',
+      gender: 'male',
+      age: 44,
+      height: 180,
+      zodiac: '天蝎',
+      mbti: 'ENTJ',
+      rawText: '编号98\n出生：81\n身高：180\n体重：85\n性别：男\n地区：松户\n家乡：沈阳\n学历：大学\n职业：软件\n星座：天蝎\n房车：有房无车\n婚史：离婚\n爱好：书法，摄影，户外，运动，音乐，旅行\n人格：ENTJ\n\n自我介绍\n你好，我是一个真诚、有责任感,阳光自信的男生，81年生，\n目前从事IT行业，平时工作虽然有点忙，\n但我始终相信生活不仅只有工作，更需要有人一起分享喜怒哀乐。\n性格稳重但不失幽默，爱好广泛，喜欢互相尊重，鼓励，支持的交流和交往,\n并喜欢美食、看电影，同时享受安静宅家的时光。\n\n择偶要求\n希望遇到一个善良、皮肤白净，有爱心、懂得沟通的你，不需要完美，\n但愿彼此有共同话题，有心走进对方的世界。\n两个人一起努力、一起成长，携手走过未来的每一个春夏秋冬。',
+      image: 'https://github.com/user-attachments/assets/c91186f8-d2d6-4183-9463-7fef32fabdcb',
+      bmi: 26.2,
+      hometown: '沈阳',
+      currentLocation: '松户',
+      occupation: '软件',
+      interests: const <String>['书法', '户外', '摄影', '旅游', '电影', '美食', '运动', '音乐'],
+      interestIds: const <int>[0, 1, 2, 3, 4, 5, 6, 7],
+      hasHouse: true,
+      hasCar: false,
+      maritalStatus: '离婚',
+      similarIds: const <String>['profile_men_500_484', 'profile_men_200_143', 'profile_men_300_213', 'profile_men_400_346', 'profile_men_600_518', 'profile_men_200_124', 'profile_women_400_364', 'profile_men_600_523', 'profile_men_300_223', 'profile_men_300_298'],
+    ),
+    Character(
+      id: 'profile_men_100_97',
+      gender: 'male',
+      age: 21,
+      zodiac: '巨蟹',
+      mbti: 'ENFP',
+      rawText: '编号97\n\n04江苏南京人。\n从小在日本出生长大，\n目前大二就读于东京某所国立大学。\n巨蟹座，enfp。\n喜欢唱歌逛街打球旅游看电影。\n喜欢性格开朗，爱笑，\n跟自己有共同爱好的00后学生妹。',
+      hometown: '江苏南京',
+      currentLocation: '东京',
+      occupation: '学生',
+      interests: const <String>['唱歌', '逛街', '旅游', '电影'],
+      interestIds: const <int>[8, 9, 3, 4],
+      similarIds: const <String>['profile_women_200_112', 'profile_men_300_207', 'profile_men_400_319', 'profile_men_300_232', 'profile_men_100_22', 'profile_men_600_554', 'profile_men_400_378', 'profile_men_300_243', 'profile_men_300_285', 'profile_men_600_559'],
+    ),
+    Character(
+      id: 'profile_men_100_95',
+      gender: 'male',
+      age: 0,
+      rawText: '编号95 - (',
+      image: 'https://github.com/141801/info/assets/42635299/0f8e72a3-fb0c-487c-a3fc-6a6235c9f808',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_100_4', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_men_100_94',
+      gender: 'male',
+      age: 30,
+      height: 178,
+      rawText: '编号94\n\n男 95年\n身高178 体重75左右\n现居横滨戸塚\n大学院毕业，\n现从事IT行业，工作生活稳定\n\n兴趣爱好广泛，健身，攀岩，\n徒步，滑雪，滑板等等，不定期发展新爱好\n\n希望对方：\n能玩到一起聊的来就行，户外运动，\n逛街啥的，或者一起发展寻找新爱好\n顺其自然，慢慢来吧。',
+      bmi: 23.7,
+      currentLocation: '横滨戸塚',
+      occupation: 'IT行业',
+      interests: const <String>['健身', '徒步', '攀岩', '滑板', '滑雪'],
+      interestIds: const <int>[10, 11, 12, 13, 14],
+      similarIds: const <String>['profile_men_100_84', 'profile_men_400_349', 'profile_men_300_297', 'profile_men_500_471', 'profile_men_600_520', 'profile_men_600_539', 'profile_men_100_4', 'profile_men_400_333', 'profile_men_600_561', 'profile_men_300_247'],
+    ),
+    Character(
+      id: 'profile_men_100_93',
+      gender: 'male',
+      age: 37,
+      height: 178,
+      rawText: '编号93\n\n男 88年\n身高178 体重75\n居住东京 户籍辽宁大连\n在日13年 从事电商贸易工作\n爱好 自驾 旅游 滑雪等',
+      bmi: 23.7,
+      hometown: '辽宁大连',
+      currentLocation: '东京',
+      occupation: '电商贸易',
+      interests: const <String>['旅游', '滑雪', '自驾'],
+      interestIds: const <int>[3, 14, 15],
+      similarIds: const <String>['profile_men_200_165', 'profile_men_100_33', 'profile_men_100_2', 'profile_men_700_632', 'profile_men_300_220', 'profile_men_200_176', 'profile_men_400_310', 'profile_men_300_288', 'profile_women_400_315', 'profile_men_400_305'],
+    ),
+    Character(
+      id: 'profile_men_100_92',
+      gender: 'male',
+      age: 37,
+      height: 172,
+      zodiac: '天秤',
+      rawText: '编号92\n\n性别：男\n出厂日：1988（天秤）\n产地：辽宁大连\n身高体重：172/63kg\n学历：本科大连理工，\n硕士九州大学\n居住地：琦玉 蕨\n工作：内装设计+项目管理\n房：已购房，离蕨车站5分钟\n属性：性格开朗，可静可动，不抽烟，不酗酒\n兴趣爱好（方便找共同点)：\n游泳，爬山，户外写生，绘画，\n弹琴🎹，听音乐会，看艺术展，\n电子游戏，吃吃逛逛\n希望找一个聊的来，\n三观契合，兴趣爱好相近，\n情绪稳定，温柔体贴的女生',
+      bmi: 21.3,
+      hometown: '辽宁大连',
+      currentLocation: '琦玉蕨',
+      occupation: '内装设计+项目管理',
+      interests: const <String>['吃吃逛逛', '音乐', '钢琴', '户外', '画画', '游泳', '爬山', '游戏', '看展'],
+      interestIds: const <int>[16, 7, 17, 1, 18, 19, 20, 21, 22],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_600_550', 'profile_men_100_2', 'profile_men_600_514', 'profile_men_500_420', 'profile_women_200_190', 'profile_men_500_446', 'profile_women_400_315', 'profile_men_400_358', 'profile_men_300_238', 'profile_men_100_33'],
+    ),
+    Character(
+      id: 'profile_men_100_91',
+      gender: 'male',
+      age: 0,
+      rawText: '编号91 - （',
+      image: 'https://github.com/user-attachments/assets/44916912-0096-4a3a-8e33-2cc846cd61ee',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_100_4', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_men_100_90',
+      gender: 'male',
+      age: 28,
+      height: 180,
+      zodiac: '狮子座',
+      mbti: 'INFP',
+      rawText: '编号90\n\n性别：男\n出生年：97年\n星座：狮子座\n身高：180.2\n体重：70kg\n学历：南京艺术学院\n工作：动画编剧（目前学生）\n出生地：南通\n现居住地：蒲田\nmbti:infp\n兴趣爱好：动画韩剧电影写小说。\n职业：国内当过两年动画编剧，\n参与过《我气哭了百万修炼者》《完美世界》\n《百炼成神》等动画制作，之前工资6-8k。\n目前没房，车房家里已做好准备，\n打算在日本呆5年左右，\n回国后去南京浙江上海发展，\n继续从事动画制作。\n母胎单身，嘴比较笨不太会说话，\n不是很擅长找聊天话题，\n所以希望你最好是e人，\n如果是i人不怕尴尬也行[冷汗]\n希望你97年以后，未来也打算在上海附近发展的，\n哪里人不限，江浙沪附近的最好\n\n- （',
+      bmi: 21.6,
+      hometown: '南通',
+      currentLocation: '蒲田',
+      occupation: '动画编剧',
+      interests: const <String>['动漫', '追剧', '电影', '阅读'],
+      interestIds: const <int>[23, 24, 4, 25],
+      hasHouse: false,
+      maritalStatus: '母胎单身',
+      similarIds: const <String>['profile_men_500_437', 'profile_men_100_81', 'profile_men_100_7', 'profile_men_500_432', 'profile_men_300_216', 'profile_men_100_31', 'profile_men_100_70', 'profile_men_500_444', 'profile_men_700_620', 'profile_men_200_139'],
+    ),
+    Character(
+      id: 'profile_men_100_89',
+      gender: 'male',
+      age: 30,
+      height: 172,
+      mbti: 'ENFJ',
+      rawText: '编号89\n\n炒奶粉\n95年，男，ENFJ，广东深圳\n身高172\n早大建筑修士毕业\n目前在建筑事务所工作\n年收450-600\n兴趣爱好比较多的正常的\n喜欢笑眯眯的一般市民。\n弹吉他，摄影，驾驶等各种兴趣爱好……\n很喜欢小动物。\n希望对方：\n有自己喜欢的事情，\n拥有独立的人格的阳光的女生。\n\n- （',
+      currentLocation: '广东深圳',
+      occupation: '建筑事务所工作',
+      interests: const <String>['宠物', '吉他', '摄影', '自驾'],
+      interestIds: const <int>[26, 27, 2, 15],
+      similarIds: const <String>['profile_men_100_4', 'profile_men_500_430', 'profile_men_400_349', 'profile_men_100_34', 'profile_men_600_544', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_men_100_85',
+      gender: 'male',
+      age: 29,
+      height: 168,
+      rawText: '编号85\n\n男 96年\n身高：168。 籍贯：黑龙江哈尔滨。\n现居住地：横滨\n喜欢动漫 K歌 摄影 数码\n瑜伽 日本 三体\n文学爱好者 爱唱歌 爱听音乐\n喜欢国风音乐 LoL 创意设计师\n好想恋爱 喜欢主动的人\n追求三观一致 甜甜的恋爱\n✔自我描述\n2017年赴日留学、2022年入职营业90周年的日企、\n2023年担任包装设计组C组组长。\n优点：性格乐观开朗、有上进心和同理心。\n缺点：一开始相处时会为了避免冷场和尴尬会主动找话题聊，\n活跃气氛。但是如果长期没有得到回应的话就会慢慢冷下来。\n✔家庭背景\n三口之家！赶上计划生育了，要不然应该有兄弟姐妹\n✔兴趣爱好\n爱好：摄影、唱歌、做饭、看电影、打卡美食店\n最不喜欢的事：加班、尤其是休日加班。\n(然而工作性质原因，平日没有一天不加班)\n✔爱情观\n结婚不是拖垮彼此，而是两个相爱相知相伴的人，\n在生活中给对方鼓励和勇气，遇到事情能有个人商量，\n在生活累的时候彼此有个依靠，相互安慰和鼓励。\n下班回家能有个人一起吃饭，在外面受了委\n屈回到家有个温暖的怀抱。\n✔理想的另一半\n有眼缘！(这很重要！)\n以及稳定的情绪。(只是理想、如果有眼缘一切条件なし! )\n✔我为什么单身?\n平日加班、休日就宅在家里、收拾房间洗衣服做饭。\n怎么可能有“出会い”\n✔如果遇到对的人，我期待什么样的生活?\n我期待一段健康稳定的婚姻。\n婚姻里，懂比爱更重要，耐心比适合更重要。\n最甜的情话不是我爱你，而是我对你现在有耐心，\n以后有，一直都会有耐心。一辈子遇到愿意对你好的人，\n或许很容易，但是遇到待你如初的人却很难，\n好的婚姻，不是一下子把你感动，\n而是细水长流的把你宠着。\n\n- （',
+      hometown: '黑龙江哈尔滨',
+      currentLocation: '横滨',
+      occupation: '创意设计师',
+      interests: const <String>['唱歌', '游戏', '三体', '做饭', '动漫', '音乐', '美食', '摄影', '数码', '阅读'],
+      interestIds: const <int>[8, 21, 28, 29, 23, 7, 5, 2, 30, 25],
+      similarIds: const <String>['profile_men_600_578', 'profile_men_100_49', 'profile_women_400_322', 'profile_men_700_635', 'profile_men_100_21', 'profile_men_100_89', 'profile_women_100_96', 'profile_men_100_4', 'profile_men_500_470', 'profile_men_400_349'],
+    ),
+    Character(
+      id: 'profile_men_100_84',
+      gender: 'male',
+      age: 30,
+      height: 183,
+      rawText: '编号84\n\n1995年出生\n男老家在江苏扬州（独生子）家庭关系不复杂\n身高183cm无不良嗜好\n12年来的日本已经12年了\n现在是永驻年收在5～600左右\n在横滨买的房子和父母一起住\n国内也有准备婚房（自己的）\n有学区房也有商用店面房\n学历大专（中医学的推拿按摩）\n最近两三年内估计会在都内开店\n父母有养老医疗（国内有日本也有）\n\n- （',
+      hometown: '江苏扬州',
+      currentLocation: '横滨',
+      occupation: '推拿按摩',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_500_471', 'profile_men_400_333', 'profile_men_100_94', 'profile_men_100_81', 'profile_men_600_561', 'profile_men_600_530', 'profile_men_600_539', 'profile_men_400_349', 'profile_men_100_4', 'profile_men_400_352'],
+    ),
+    Character(
+      id: 'profile_men_100_83',
+      gender: 'male',
+      age: 34,
+      zodiac: '天蝎',
+      rawText: '编号83\n\n91年 男\n天蝎座目前住千叶靠近成田机场那里\n离异无孩 目前电商物流公司工作\n来日第二年\n\n希望找一个性格温和一些\n能一起安安稳稳过日子\n无论在日还是在哪，\n优先偏向长发女生一些\n短发不是不能接受\n不介意对方有过婚史\n如果有孩子最多能接受一个\n\n- （',
+      currentLocation: '千叶靠近成田机场那里',
+      occupation: '电商物流公司工作',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '离异无孩',
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_men_100_81',
+      gender: 'male',
+      age: 29,
+      height: 178,
+      zodiac: '金牛',
+      rawText: '编号81\n\n在日，辽宁大连人。\n寻找伴侣，目前在东京都一都三县附近。\n96年178金牛男！\n特定技能1号签证，工作是建筑公司上班。\n月薪40W左右，圈子小，干净，不抽，不赌，不嫖！\n对我感性兴趣的可以加我哦～谢谢！\n希望另一半160左右，上下差5岁都可以，\n对温柔的女孩纸毫无抵抗力ヾ(≧∇≦谢谢≧∇≦)ノ\n\n- （',
+      hometown: '辽宁大连',
+      currentLocation: '东京都一都三县附近',
+      occupation: '建筑公司上班',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_7', 'profile_men_300_278', 'profile_men_100_35', 'profile_men_100_70', 'profile_men_100_4', 'profile_men_200_125', 'profile_men_600_570', 'profile_men_200_179', 'profile_men_100_59', 'profile_men_100_90'],
+    ),
+    Character(
+      id: 'profile_men_100_80',
+      gender: 'male',
+      age: 23,
+      height: 180,
+      mbti: 'ENFJ',
+      rawText: '编号80\n\n2.性别：男\n3.出生年份：2002\n4.籍贯：山东省济南市\n5.身高体重：180/104kg\n6.学历：大学在读\n7.居住地：千叶市川\n8.工作：学生\n9、车房：济南市有房，无车\n兴趣爱好（方便找共同点)：性格enfj，\n在日本：爱调酒，自学吉他弹，喜欢红茶，\n喜欢健身房不喜欢户外，爱开车正在换驾照，\n喜欢卡比，游戏手游LOL，端游LOL，\ncsgo，老登环，帕鲁。\n想找一位25岁以下的女性谈恋爱。\n\n- （',
+      bmi: 32.1,
+      hometown: '山东省济南市',
+      currentLocation: '千叶市川',
+      occupation: '学生',
+      interests: const <String>['游戏', '健身', '喜欢卡比', '喝茶', '帕鲁', '自驾', '老登环', '吉他', '喝酒'],
+      interestIds: const <int>[21, 10, 31, 32, 33, 15, 34, 27, 35],
+      hasHouse: true,
+      hasCar: false,
+      similarIds: const <String>['profile_men_200_150', 'profile_men_400_304', 'profile_men_100_24', 'profile_men_300_284', 'profile_men_600_532', 'profile_men_300_232', 'profile_men_100_65', 'profile_men_600_539', 'profile_men_200_158', 'profile_men_400_378'],
+    ),
+    Character(
+      id: 'profile_men_100_34',
+      gender: 'male',
+      age: 29,
+      height: 177,
+      mbti: 'INFJ',
+      rawText: '编号34\n\n96年，男，INFJ，属于瘦子，\n不穿鞋身高177，头像是自己。\n国内211末流本科毕业，\n目前计划在日本长住，工作稳定。\n情绪稳定，性格温柔善良，\n热爱生活，不悲不丧，有同理心，人品端正。\n爱干净（每天洗澡，穿出门的衣服绝不沾床等），\n圈子简单，无不良嗜好。\n喜欢摄影（目前是视觉中国签约摄影师），\n阅读，游泳，潜水，也玩一点游戏。\n\n希望对方：\n脾气不要太差，\n有在日本长期生活的打算，瘦子，靠谱专一。\n年龄差距上下最好不要超过五岁。\n如果对自己的外观有自信的话就更好了，\n很乐意成为她的摄影师。\n\n摄影作品 - (',
+      image: 'https://github.com/141801/info/assets/42635299/7347509c-2ec8-475f-ac33-d5a8f24342cb',
+      currentLocation: '日本',
+      occupation: '',
+      interests: const <String>['摄影', '游戏', '游泳', '潜水', '阅读'],
+      interestIds: const <int>[2, 21, 19, 36, 25],
+      similarIds: const <String>['profile_men_100_89', 'profile_men_100_4', 'profile_men_100_19', 'profile_men_100_81', 'profile_men_600_573', 'profile_men_600_539', 'profile_men_100_75', 'profile_men_500_471', 'profile_men_600_544', 'profile_men_100_84'],
+    ),
+    Character(
+      id: 'profile_men_100_75',
+      gender: 'male',
+      age: 28,
+      height: 174,
+      mbti: 'INTJ',
+      rawText: '编号75\n\n男 97 哈尔滨 174\n来日本9年\n不抽烟、不酗酒\nintj\n职业：ICU护士\n爱好：游泳、潜水、健身、自驾游\n居住: 千叶县\n希望对方:无纹身、不抽烟、不酗酒、\n互相理解、互相成长、体型偏瘦',
+      hometown: '哈尔滨',
+      currentLocation: '千叶县',
+      occupation: 'ICU护士',
+      interests: const <String>['健身', '游泳', '潜水', '自驾'],
+      interestIds: const <int>[10, 19, 36, 15],
+      similarIds: const <String>['profile_men_600_557', 'profile_men_100_34', 'profile_men_500_432', 'profile_men_100_89', 'profile_men_100_7', 'profile_men_100_4', 'profile_men_300_300', 'profile_men_300_215', 'profile_men_600_544', 'profile_men_100_81'],
+    ),
+    Character(
+      id: 'profile_men_100_74',
+      gender: 'male',
+      age: 31,
+      height: 171,
+      rawText: '编号74\n\n2.性别：男\n3.出生年份：1994\n4.籍贯：河南\n5.身高体重：171/65\n6.学历：本科\n7.居住地：埼玉\n8.工作：日本大手it\n9.车房：埼玉有套小房子，暂无车\n兴趣爱好（方便找共同点)：爬山，\n健身，朋友聚餐，看电影\n我自己: 不吸烟不喝酒，无不良嗜好，\n生活简单，工作稳定，身体健康，独生子\n希望她: 生活简单，工作稳定，\n颜值平均水平以上，标准身材，无不良嗜好',
+      bmi: 22.2,
+      hometown: '河南',
+      currentLocation: '埼玉',
+      occupation: '日本大手it',
+      interests: const <String>['健身', '朋友聚餐', '爬山', '电影'],
+      interestIds: const <int>[10, 37, 20, 4],
+      hasHouse: true,
+      hasCar: false,
+      similarIds: const <String>['profile_men_100_4', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_100_49'],
+    ),
+    Character(
+      id: 'profile_men_100_72',
+      gender: 'male',
+      age: 28,
+      height: 183,
+      rawText: '编号72\n\n97 183 77\n福建的 做IT的，\n除了不抽烟不咋喝酒，\n啥都有点兴趣。\n择偶标准 合得来就行',
+      bmi: 23.0,
+      hometown: '福建',
+      currentLocation: '',
+      occupation: 'IT',
+      interests: const <String>['啥都有点兴趣'],
+      interestIds: const <int>[38],
+      similarIds: const <String>['profile_men_600_530', 'profile_men_400_333', 'profile_men_600_539', 'profile_men_100_84', 'profile_men_100_81', 'profile_men_100_7', 'profile_men_500_471', 'profile_men_200_158', 'profile_men_500_469', 'profile_men_100_34'],
+    ),
+    Character(
+      id: 'profile_men_100_71',
+      gender: 'male',
+      age: 36,
+      mbti: 'INTP',
+      rawText: '编号71\n\n<img src="https://github.com/141801/info/assets/42635299/580f4b0e-9baa-4af7-8ca4-a1bf84a44435" />\n\n广州人 男 1989年\n国内985 2022年来日本\n主业大阪IT公司 高才80分\n副业投资埼玉千叶的不动产收租\n计划明年拿永住搬回东京定居（交往后也可以共同协商）\n也不排斥归化日籍（现在不够时间）\n单身未婚无孩\nINTP理论学者（不热衷研究这个，单纯当作社交话题聊一下）\n不抽烟 在聚餐时会可以一两杯\n\n【兴趣】\n拍摄（照片和vlog，对vlog更感兴趣）\n滑雪（两年前刚开始）\n旅游（努力攒全日空里程换环球机票2张ing）\n\n【对另一半的期待】\n遇到问题可以一起解决，不要玩猜猜猜\n未来没有回国定居的打算',
+      hometown: '广州',
+      currentLocation: '大阪',
+      occupation: 'IT公司',
+      interests: const <String>['摄影', '旅游', '滑雪'],
+      interestIds: const <int>[2, 3, 14],
+      maritalStatus: '单身未婚无孩',
+      similarIds: const <String>['profile_women_400_369', 'profile_men_400_332', 'profile_men_400_339', 'profile_men_200_109', 'profile_men_700_624', 'profile_men_600_565', 'profile_men_500_497', 'profile_men_100_2', 'profile_women_300_233', 'profile_women_700_606'],
+    ),
+    Character(
+      id: 'profile_men_100_70',
+      gender: 'male',
+      age: 29,
+      height: 180,
+      mbti: 'ENFP',
+      rawText: '编号70\n\n<img src="https://github.com/141801/info/assets/42635299/30216e4c-91af-4f7c-b062-637ba7814909" />\n\n96年吉林人 爹系的宝宝\nENFP精神状况不太稳定不定时发癫\nよろしく身高180 体重160\n研2学生 住池袋，\n喜欢唱歌，剧本杀，羽毛球，打游戏。\n喜欢甜妹！乖乖的小女生',
+      bmi: 22.2,
+      hometown: '吉林',
+      currentLocation: '池袋',
+      occupation: '',
+      interests: const <String>['桌游', '唱歌', '游戏', '羽毛球'],
+      interestIds: const <int>[39, 8, 21, 40],
+      similarIds: const <String>['profile_men_100_81', 'profile_men_100_35', 'profile_men_200_179', 'profile_women_500_448', 'profile_men_700_626', 'profile_men_100_59', 'profile_men_100_90', 'profile_men_100_7', 'profile_men_700_620', 'profile_men_200_125'],
+    ),
+    Character(
+      id: 'profile_men_100_69',
+      gender: 'male',
+      age: 33,
+      height: 183,
+      mbti: 'ISTP',
+      rawText: '编号69\n\n上海人 92年 男\n身高183 体重82kg 最近在减肥中\n日本大学院毕业 现住东京\n来日5年目 社会人1年目\n中小公司社畜，年收300+\n无车无房无存款无不良嗜好\n\n性格：ISTP\n直男一枚，但是性格比较温和\n有情绪习惯憋着自己慢慢消化，\n但是累积到一定程度会忽然爆发\n不怎么会说话，嘴贱\n爱好自由，不喜欢被过度束缚，我也不会大男子主义\n\n爱好：动漫，游戏，电影，唱歌，足球，摄影\n希望另一半：\n心地善良，性格温和\n遇到问题愿意一起真诚解决\n年龄92以后\n学历大学以上，有正常工作',
+      bmi: 24.5,
+      hometown: '上海',
+      currentLocation: '东京',
+      occupation: '中小公司社畜',
+      interests: const <String>['动漫', '唱歌', '摄影', '游戏', '电影', '足球'],
+      interestIds: const <int>[23, 8, 2, 21, 4, 41],
+      hasHouse: false,
+      hasCar: false,
+      similarIds: const <String>['profile_men_600_501', 'profile_men_300_286', 'profile_men_500_471', 'profile_men_200_182', 'profile_men_300_244', 'profile_men_600_586', 'profile_men_700_632', 'profile_men_300_239', 'profile_men_400_381', 'profile_men_300_201'],
+    ),
+    Character(
+      id: 'profile_men_100_68',
+      gender: 'male',
+      age: 30,
+      height: 187,
+      mbti: 'ENFJ',
+      rawText: '编号68\n个人简介\n【年龄】95\n【MBTI】ENFJ\n【体形】 187cm，91kg。\n高高的有点儿壮（有在健身）\n【籍贯】辽宁\n【工作】IT项目主管\n【学历】立命馆大学学部\n【专业】情报理工学\n【兴趣】健身、游泳、爬山、逛美术馆、\n看侦探小说，旅游出行、吃吃喝喝\n\n期待的另一半\n【希望对方】年龄相近或年下，\n成熟些，有长期留在东京的想法。\n身高165+\n\n- （',
+      image: 'https://github.com/141801/info/assets/42635299/527c7f2e-57de-4b80-bc1b-8c39513aa825',
+      bmi: 26.0,
+      hometown: '辽宁',
+      currentLocation: '东京',
+      occupation: 'IT项目主管',
+      interests: const <String>['健身', '吃吃喝喝', '旅游', '游泳', '爬山', '阅读', '看展'],
+      interestIds: const <int>[10, 42, 3, 19, 20, 25, 22],
+      similarIds: const <String>['profile_men_300_244', 'profile_men_200_158', 'profile_men_400_381', 'profile_men_400_333', 'profile_men_300_286', 'profile_men_200_139', 'profile_men_600_539', 'profile_men_100_31', 'profile_men_300_278', 'profile_men_400_327'],
+    ),
+    Character(
+      id: 'profile_men_100_65',
+      gender: 'male',
+      age: 25,
+      height: 176,
+      mbti: 'ESFJ',
+      rawText: '编号65\n\n<img src="https://github.com/141801/info/assets/42635299/bd3418ea-0e5d-40d1-ab0a-205c8403df47" />\n\n00年 男 75kg 176\n国内本科 现住东京 现读语校\n准备再读学部 n1 esfj\n性格 富有弹性 一般不喝酒\n从不吸烟 喜欢拍照 品茗 闻香\n煮饭 偶尔会在屋子里锻炼\n懂拍照 平时一个人喜欢看书\n如果周末有时间会逛神社和跳蚤市场\n希望能够相互平等 无论是物质和思想上的\n能够有共同话题 相互理解和进步\n我觉得提升自己比相信能够通过话术搭讪别人更加重要\n相信无论一个人还是两个人都是能够轻松快乐的',
+      bmi: 24.2,
+      currentLocation: '东京',
+      occupation: '语校学生',
+      interests: const <String>['喝茶', '摄影', '做饭', '阅读', '跳蚤市场', '逛神社', '健身', '闻香'],
+      interestIds: const <int>[32, 2, 29, 25, 43, 44, 10, 45],
+      similarIds: const <String>['profile_men_500_444', 'profile_men_200_122', 'profile_men_100_22', 'profile_men_400_378', 'profile_men_500_437', 'profile_men_600_554', 'profile_men_600_559', 'profile_men_700_626', 'profile_men_600_517', 'profile_men_300_284'],
+    ),
+    Character(
+      id: 'profile_men_100_64',
+      gender: 'male',
+      age: 35,
+      height: 178,
+      zodiac: '射手座',
+      rawText: '编号64\n\n辽宁大连人 男 现居住在横滨\n家庭和谐父母恩爱\n1990年 射手座\n国内本科毕业\n178 65kg 感兴趣可互换照片\nIT行业\n单身无婚史\n无不良嗜好，平常偶尔小酌\n\n·兴趣\n平常会打篮球，偶尔游泳，滑雪（单板初心者）\n偶尔跟朋友打打台球和一些休闲运动\n遇到感兴趣的文物书画展会去参观\n喜欢观看各类赛事\ncity walk（发现新事物会很有趣）\n\n·性格\n开朗，情绪稳定，很好相处，有包容心\n愿意倾听\n\n·理想型\n心地善良，细心，性格开朗温和\n喜欢彼此沟通 ✅\n冷战，无故不理人，过于自我 ❌\n身材匀称就好\n希望遇到的那个她能在以后的生活中互相扶持，\n尊重彼此的爱好，一起拥抱属于我们二人的美好的生活\n\n- （',
+      bmi: 20.5,
+      hometown: '辽宁大连',
+      currentLocation: '横滨',
+      occupation: 'IT行业',
+      interests: const <String>['city', '散步', '参观文物书画展', '台球', '篮球', '游泳', '滑雪', '观看各类赛事'],
+      interestIds: const <int>[46, 47, 48, 49, 50, 19, 14, 51],
+      maritalStatus: '单身无婚史',
+      similarIds: const <String>['profile_men_300_203', 'profile_men_400_372', 'profile_men_400_382', 'profile_men_200_180', 'profile_men_600_596', 'profile_men_400_361', 'profile_men_600_561', 'profile_men_600_550', 'profile_men_500_428', 'profile_men_400_362'],
+    ),
+    Character(
+      id: 'profile_men_100_63',
+      gender: 'male',
+      age: 0,
+      rawText: '编号63\n\n<img src="https://github.com/141801/info/assets/42635299/610f969a-de27-4b9f-938b-e139dca6b85a" />',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_100_4', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_men_100_60',
+      gender: 'male',
+      age: 28,
+      height: 174,
+      mbti: 'INTJ',
+      rawText: '编号60\n\n性别: 男\n出生年份: 1997年10月\n故乡: 浙江杭州\n身高体重: 174cm/57kg\n学历:硕士（东大-机械工学）\n居住地:枥木县\n工作: 工程师\n留日时长: 第3年\n爱好: 跑步，骑车，motorsports\n性格: intj\n理想型: 95后，身高＞159',
+      bmi: 18.8,
+      hometown: '浙江杭州',
+      currentLocation: '枥木县',
+      occupation: '工程师',
+      interests: const <String>['motorsports', '跑步', '骑行'],
+      interestIds: const <int>[52, 53, 54],
+      similarIds: const <String>['profile_men_100_7', 'profile_men_700_612', 'profile_women_700_614', 'profile_men_400_344', 'profile_men_500_432', 'profile_men_100_4', 'profile_men_700_618', 'profile_men_100_81', 'profile_men_200_126', 'profile_men_600_588'],
+    ),
+    Character(
+      id: 'profile_men_100_59',
+      gender: 'male',
+      age: 29,
+      rawText: '编号59\n\n28岁，目前住在东京，河北唐山人，\n喜欢游戏，动漫，喝酒，旅游，ktv\n希望能找一个能包容我的人吧，\n最好有同样的兴趣\n即便没共同兴趣也最少希望别嫌弃我这些兴趣。\n而且也希望对面是个比较爱和我一起出去玩的类型\n\n- （',
+      hometown: '河北唐山',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['唱歌', '动漫', '喝酒', '旅游', '游戏'],
+      interestIds: const <int>[8, 23, 35, 3, 21],
+      similarIds: const <String>['profile_men_100_35', 'profile_men_600_534', 'profile_women_500_448', 'profile_men_100_81', 'profile_women_700_614', 'profile_men_200_179', 'profile_men_700_626', 'profile_men_200_125', 'profile_men_500_461', 'profile_women_600_594'],
+    ),
+    Character(
+      id: 'profile_men_100_57',
+      gender: 'male',
+      age: 34,
+      height: 173,
+      rawText: '编号57\n\n天津人，男，173cm，65kg，1991年\n毕业院校 国内前50，日本有名私立\n\nIT大手 正社员 年收 600w\n\n江东区有自己的房子\n\n会认真听别人讲话，尊重个人价值观\n体育运动比较擅长，愿意体验各种户外活动\n\n理想型\n心地善良，热爱每一天\n年龄92年以后\n\n- （',
+      bmi: 21.7,
+      hometown: '天津',
+      currentLocation: '江东区',
+      occupation: 'IT大手 正社员',
+      interests: const <String>['运动', '户外'],
+      interestIds: const <int>[6, 1],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_300_295', 'profile_men_600_593', 'profile_men_600_570', 'profile_women_600_507', 'profile_men_500_423', 'profile_men_600_552', 'profile_men_200_138', 'profile_men_600_543', 'profile_women_500_459', 'profile_men_100_2'],
+    ),
+    Character(
+      id: 'profile_men_100_56',
+      gender: 'male',
+      age: 43,
+      height: 163,
+      zodiac: '白羊座',
+      mbti: 'INFJ',
+      rawText: '编号56\n\n性别：男\n出生年份：1982\n星座：白羊座 INFJ\n籍贯：戶籍东京練馬 原籍台湾\n身高体重：163/49kg\n学历：大学+日本建築专校\n居住地：东京都内 年中会搬至琦玉新家\n工作：建築工程\n运动：散步、賽车（Gokart,但长年無參加）、射箭(初心者程度)\n兴趣：相機・摄影、旅行、美食与雑貨探访、\n模型、桌遊、绘画、音乐与电影欣賞\n饮食习惯：不吃辣 不喝酒。也不吸菸 喜欢喝茶。一有時間会下廚。\n房：新築一戸建て(駐車スペース2台分、於埼玉・到池袋特急僅3站、\n購物便利、対面有巨型溫泉設施) 车：年內購入\n体質是吃不胖型，偏瘦，但也因此衣服好买 注重穿著打扮。\n交友圈单純，偏文靜型、不喜欢吵架。\n\n希望对方：\n身高基本不拘。如中等或偏瘦更喜欢。\n有工作或兼职，或经营个人事业。\n偶尔会做饭就更好。\n家事部分不重要。(我平時就已喜欢打掃整理環境 纖細衣物还都手洗)\n不抽菸，酒类小酌程度。\n性格溫和开朗，有话能直说。\n\n- （',
+      bmi: 18.4,
+      hometown: '台湾',
+      currentLocation: '东京都内',
+      occupation: '建築工程',
+      interests: const <String>['做饭', '射箭', '散步', '旅游', '桌游', '乐高', '摄影', '画画', '美食', '賽车'],
+      interestIds: const <int>[29, 55, 47, 3, 39, 56, 2, 18, 5, 57],
+      hasHouse: true,
+      hasCar: true,
+      similarIds: const <String>['profile_women_600_537', 'profile_women_400_364', 'profile_men_500_484', 'profile_men_600_523', 'profile_men_600_535', 'profile_women_400_318', 'profile_women_500_486', 'profile_men_300_268', 'profile_men_300_223', 'profile_men_400_313'],
+    ),
+    Character(
+      id: 'profile_men_100_54',
+      gender: 'male',
+      age: 36,
+      height: 170,
+      zodiac: '双子座',
+      mbti: 'INFP',
+      rawText: '编号54\n\n性别：男\n生年：89\n籍贯：吉林长春\n身高：170\n学历：硕士\n居住地：东京立川\n工作：机械设计\n兴趣爱好：读书、传统文化、狼人杀、剧本杀\n综合描述：不抽烟，跟朋友聚会会喝酒，永驻申请中。\nINFP，情绪稳定性格好，\n虽然内向但是冷场的时候也会硬头皮化身e人。\n双子座，可动可静，能宅在家里看书，也能外出上山下海。\n\n期望对方：大一到小五左右，三观眼缘合得来，\n有主见但不执拗，自由但是有度，不嫌弃直男，不会太自我\n身高，我一米七，所以一米七以下或者能接受我身高的就行。\n长相，普通以上，不一定很漂亮，耐看就行\n性格，不执拗，做事有度，遇事可以商量，\n可以最后不同意，但是不要连反对意见都不能说，开朗文静都可以\n学历，大学以上\n信仰，不要信基督教\n职业，正常工作\n\n- （',
+      hometown: '吉林长春',
+      currentLocation: '东京立川',
+      occupation: '机械设计',
+      interests: const <String>['传统文化', '桌游', '阅读'],
+      interestIds: const <int>[58, 39, 25],
+      similarIds: const <String>['profile_men_100_2', 'profile_men_600_571', 'profile_men_300_238', 'profile_men_400_358', 'profile_women_500_459', 'profile_men_600_593', 'profile_women_400_380', 'profile_men_100_33', 'profile_men_400_312', 'profile_men_300_277'],
+    ),
+    Character(
+      id: 'profile_men_100_51',
+      gender: 'male',
+      age: 31,
+      height: 175,
+      zodiac: '白羊座',
+      mbti: 'ISFJ-A',
+      rawText: '编号51\n\n94年 男 东京 ，175/65，不胖不瘦，\n出生年份：1994\n性别：男\n出身地：福建\n学历 工作：本科 建筑业\n年收 签证：700+ 永驻者\n身高体重：175/65 不胖不瘦\n星座：白羊座\nmbti：ISFJ-A\n兴趣爱好：运动 看小说 电影 岩盘浴 温泉\n优点：情绪稳定 重承诺 真诚\n缺点：做饭不行，只会煮简单的饭菜。\n比较宅。恋爱脑。\n其他：不抽烟，不喝酒。\n理想女友 ：能相互理解 包容 能正常沟通\n面对问题时能一起面对解决 真诚',
+      bmi: 21.2,
+      hometown: '福建',
+      currentLocation: '东京',
+      occupation: '建筑业',
+      interests: const <String>['温泉', '电影', '阅读', '运动'],
+      interestIds: const <int>[59, 4, 25, 6],
+      similarIds: const <String>['profile_men_300_216', 'profile_men_600_570', 'profile_men_200_179', 'profile_men_300_227', 'profile_men_600_574', 'profile_men_100_81', 'profile_men_700_633', 'profile_men_600_509', 'profile_men_600_552', 'profile_women_600_594'],
+    ),
+    Character(
+      id: 'profile_men_100_49',
+      gender: 'male',
+      age: 30,
+      height: 171,
+      zodiac: '天平座',
+      rawText: '编号49\n\n出生年份：1995\n性别：男\n出身地：吉林\n学历：本科 目前是日本公司的正社员\n身高体重：171/65\n星座：天平座\n兴趣爱好：\n比较喜欢动漫以及游戏\n骑行 爬山 乐高\n不抽烟，一般不喝酒，\n平时会在家做饭\n择偶标准 ：兴趣爱好相似 ，聊得来\n短期应该不会有回国的打算\n可以接受比自己大3岁的\n\n- （',
+      bmi: 22.2,
+      hometown: '吉林',
+      currentLocation: '',
+      occupation: '日本公司的正社员',
+      interests: const <String>['乐高', '动漫', '做饭', '游戏', '爬山', '骑行'],
+      interestIds: const <int>[56, 23, 29, 21, 20, 54],
+      similarIds: const <String>['profile_men_100_4', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_700_618'],
+    ),
+    Character(
+      id: 'profile_men_100_48',
+      gender: 'male',
+      age: 24,
+      height: 173,
+      zodiac: '水瓶座',
+      mbti: 'INTP',
+      rawText: '编号48\n\n男，01年，江苏人，水瓶座，\n住在荒川区西日暮里，大学在都内，\nINTP，来日第三年，身高173，体重57.4kg，\n偶尔会和朋友喝点酒，爱好摄影，音乐。\n想找一个比自己大的姐姐，\n比我小也没事，年龄差在3岁就行\n\n- （',
+      bmi: 19.0,
+      hometown: '江苏',
+      currentLocation: '荒川区西日暮里',
+      occupation: '',
+      interests: const <String>['喝酒', '摄影', '音乐'],
+      interestIds: const <int>[35, 2, 7],
+      similarIds: const <String>['profile_men_400_347', 'profile_men_100_7', 'profile_men_200_122', 'profile_men_100_45', 'profile_men_300_207', 'profile_men_600_554', 'profile_men_400_337', 'profile_men_100_13', 'profile_men_600_559', 'profile_men_300_285'],
+    ),
+    Character(
+      id: 'profile_men_100_45',
+      gender: 'male',
+      age: 27,
+      height: 178,
+      zodiac: '巨蟹座',
+      mbti: 'INTJ',
+      rawText: '编号45\n\n出生年份：1998\n性别：男\n出身地：湖北\n学历：本科211 东京修士在读\n身高体重：178/65\n星座：巨蟹座\nmbti：intj\n兴趣爱好：平时比较宅\n比较喜欢动漫以及游戏\n还有美食探店\n也爱好健身摄影\n其他：不抽烟，一般不喝酒，\n平时会在家做饭\n择偶标准 ：兴趣爱好相似 ，\n聊得来 ，不抽烟，\n然后最好也是学生(不是也没关系)\n\n- （',
+      bmi: 20.5,
+      hometown: '湖北',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['健身', '摄影', '动漫', '做饭', '游戏', '美食'],
+      interestIds: const <int>[10, 2, 23, 29, 21, 5],
+      similarIds: const <String>['profile_men_700_626', 'profile_men_100_7', 'profile_men_400_337', 'profile_men_400_347', 'profile_men_500_437', 'profile_men_700_620', 'profile_men_200_122', 'profile_men_600_559', 'profile_men_100_81', 'profile_men_400_344'],
+    ),
+    Character(
+      id: 'profile_men_100_35',
+      gender: 'male',
+      age: 30,
+      height: 175,
+      rawText: '编号35\n\n性别：男\n生年：95\n籍贯：江西\n身高：175\n学历：国内本科\n居住地：东京（练马区）\n工作：it\n兴趣爱好：唱歌（算是麦霸？），游戏（主机pc各种）\n标准i人，刚来日本一年，各方面还不是很熟悉，\n目前打算是在这边长期发展。不抽烟不酗酒，\n最近也开始保持锻炼。希望能找一个志趣相投，\n三观比较合的对象一起努力。\n\n- （',
+      hometown: '江西',
+      currentLocation: '东京（练马区）',
+      occupation: 'it',
+      interests: const <String>['唱歌', '游戏', '健身'],
+      interestIds: const <int>[8, 21, 10],
+      similarIds: const <String>['profile_men_100_59', 'profile_women_500_448', 'profile_men_600_534', 'profile_men_100_81', 'profile_men_600_552', 'profile_men_100_70', 'profile_men_400_374', 'profile_men_500_461', 'profile_women_700_614', 'profile_men_700_633'],
+    ),
+    Character(
+      id: 'profile_men_100_33',
+      gender: 'male',
+      age: 37,
+      height: 173,
+      zodiac: '白羊座',
+      rawText: '编号33\n\n◇お名前 Jacky\n◇星座 :白羊座\n◇生年月日: 1988\n◇ご年齢 : 36\n◇国籍: 中国\n◇戸籍地 : 河南省\n◇現住所 : 东京\n◇身長: 173cm\n◇体重: 66kg\n◇最終学歴 : 大学本科\n◇ご職業: it\n◇ご年収: 1200万+\n◇赴日经历：11年\n◇签证类型：高度技术人材（永驻申请中）\n◇婚歴 : 未婚\n◇家族との同居 : 无\n◇趣味 : 旅游，健身，户外，开车，看书\n\n- （',
+      bmi: 22.1,
+      hometown: '河南省',
+      currentLocation: '东京',
+      occupation: 'it',
+      interests: const <String>['健身', '自驾', '户外', '旅游', '阅读'],
+      interestIds: const <int>[10, 15, 1, 3, 25],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_100_2', 'profile_men_500_411', 'profile_men_100_93', 'profile_men_400_358', 'profile_men_300_238', 'profile_men_600_571', 'profile_men_200_155', 'profile_women_400_315', 'profile_men_300_288', 'profile_women_200_190'],
+    ),
+    Character(
+      id: 'profile_men_100_31',
+      gender: 'male',
+      age: 29,
+      height: 186,
+      zodiac: '射手',
+      rawText: '编号31\n\n性别：男\n星座：射手\n生年月日：1996\n年龄：27\n国籍：中国\n户籍地：辽宁大连\n现住所：东京\n身高：186\n体重：78kg\n学历：本科\n职业：日语老师\n日语：n1\n赴日经历：在日本出生，3岁时去了国内，\n12岁时回到日本东京 3+15\n签证：永驻\n婚历：未婚\n趣味：动漫 音乐 电影 散步 旅行\n感情经历简单 责任感强 喜欢动物和大自然\n喜欢挑战新事物 家里开的两个中餐馆\n还有三套租出去的店铺',
+      bmi: 22.5,
+      hometown: '辽宁大连',
+      currentLocation: '东京',
+      occupation: '日语老师',
+      interests: const <String>['动漫', '散步', '旅游', '电影', '音乐'],
+      interestIds: const <int>[23, 47, 3, 4, 7],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_200_125', 'profile_men_300_285', 'profile_men_100_81', 'profile_men_100_90', 'profile_men_300_244', 'profile_men_700_620', 'profile_men_200_139', 'profile_men_400_333', 'profile_men_100_70', 'profile_men_400_381'],
+    ),
+    Character(
+      id: 'profile_men_100_30',
+      gender: 'male',
+      age: 33,
+      height: 182,
+      rawText: '编号30\n92年 大连 身高182 体重70\n都内工作 喜好美食 滑雪等\n不抽烟无不良嗜好\n无婚史同居史长年单身\n希望自己另一半也无婚史\n善良专一 计划长期在日本\n合得来最重要\n\n- （',
+      image: 'https://github.com/141801/info/assets/42635299/7b507179-bc24-43c5-8e19-21d5d3067388',
+      bmi: 21.1,
+      hometown: '大连',
+      currentLocation: '都内',
+      occupation: '',
+      interests: const <String>['滑雪', '美食'],
+      interestIds: const <int>[14, 5],
+      maritalStatus: '无婚史同居史长年单身',
+      similarIds: const <String>['profile_men_500_419', 'profile_men_300_252', 'profile_men_500_474', 'profile_men_500_428', 'profile_men_500_471', 'profile_men_500_423', 'profile_men_600_570', 'profile_men_200_172', 'profile_men_600_586', 'profile_men_600_561'],
+    ),
+    Character(
+      id: 'profile_men_100_24',
+      gender: 'male',
+      age: 27,
+      height: 182,
+      zodiac: '巨蟹座',
+      mbti: 'INFP',
+      rawText: '编号24\n\n98年 四川人\ninfp 巨蟹座\n182/88kg\n学历：北海道大学硕士\n现东北大学医疗药学博士在读\n（毕业之后不太考虑科研，首选医院其次研究所最后公司）\n爱好：各种策略游戏，桌游剧本杀狼人杀，或者是卡牌（以及宝可梦）\n以及很喜欢徒步骑车去很远的地方\n然后就是做饭和健身\n最后是因为工作的原因涉猎了非常多不同的研究领域，生命科学化学材料植物科学什么的都略通，平时也很喜欢了解\n性格：心思细腻，善于思考，长于逻辑。\n非常独立，工作和情绪不太依赖别人，比较体贴，情绪非常稳定\n没事喜欢探索新知识，新店铺，很喜欢和不同人请教他们的专业内容\n也蛮爱玩儿的，精力很好，想到处旅游到处玩儿只是碍于现在的工作原因暂时不行\n现实和理想主义每时每刻都在交织，属于究极捧哽，很需要话多的人一直输入。\n几乎没有压力感受器，经历过很多压力已经无感了，自我调节能力也很强，暂时没什么事情和人会让我破防或者是情绪崩溃\n自我调节和抗压能力比较强\n缺点：非常非常p，大心脏的反面是每次都在最后关头才把事情完成 时间感很强的人可能受不了\n择偶标准：\n不喜欢太强势的人，不太喜欢对生活有非常非常明确的目标的人，我觉得生活就是乘兴而来 兴尽而返，对未来有大致规划就行不想要每个节点非得做到什么样\n另外就是希望另一半能有自己的专业知识领域，能有独立思考的能力\n然后生活习惯的话就最好不要吸烟，也不要宿醉\n喜欢能和我分享很多的人，真的会有被在意的感觉，想要对视一眼就能相互明白的默契感\n\n- （',
+      bmi: 26.6,
+      hometown: '四川',
+      currentLocation: '',
+      occupation: '医疗药学博士在读',
+      interests: const <String>['做饭', '健身', '桌游', '游戏', '宝可梦', '徒步', '骑行', '探索新知识', '新店铺', '旅游'],
+      interestIds: const <int>[29, 10, 39, 21, 60, 11, 54, 61, 62, 3],
+      similarIds: const <String>['profile_men_600_539', 'profile_men_400_333', 'profile_men_200_158', 'profile_men_400_304', 'profile_men_300_284', 'profile_men_200_125', 'profile_men_400_327', 'profile_men_600_544', 'profile_men_200_146', 'profile_men_100_31'],
+    ),
+    Character(
+      id: 'profile_men_100_22',
+      gender: 'male',
+      age: 25,
+      height: 174,
+      zodiac: '白羊座',
+      rawText: '编号22\n\n00年男，目前东京修士在读，\ne人，白羊座，山东济南人，174，70kg，\n喜欢健身，旅行，不抽烟，偶然喝点酒，\n希望找一个聊得来的，年龄差不多的，\n最好和我一样喜欢旅行。\n\n- （',
+      bmi: 23.1,
+      hometown: '山东济南',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['健身', '偶然喝点酒', '旅游'],
+      interestIds: const <int>[10, 63, 3],
+      similarIds: const <String>['profile_men_200_122', 'profile_men_600_554', 'profile_men_600_559', 'profile_men_300_207', 'profile_men_400_337', 'profile_men_400_378', 'profile_men_100_65', 'profile_men_100_7', 'profile_men_500_437', 'profile_men_300_292'],
+    ),
+    Character(
+      id: 'profile_men_100_21',
+      gender: 'male',
+      age: 30,
+      height: 174,
+      zodiac: '水瓶座',
+      mbti: 'ISPT',
+      rawText: '编号21\n\n95辽宁男，174的ispt，水瓶座。\n会做菜，喜欢各种运动（キックボクシング、乒乓球等）和游戏、\n周末在家比较多（有人陪就喜欢外出 旅游）、\n来日7年定居在横滨附近，工作在商社。\n希望另一半温柔善良，年龄±5，最好活泼一些.\n\n- （',
+      hometown: '辽宁',
+      currentLocation: '横滨附近',
+      occupation: '商社',
+      interests: const <String>['乒乓球', '做饭', '旅游', '游戏', '运动'],
+      interestIds: const <int>[64, 29, 3, 21, 6],
+      similarIds: const <String>['profile_men_300_297', 'profile_men_600_520', 'profile_men_100_84', 'profile_men_400_349', 'profile_men_100_4', 'profile_men_100_85', 'profile_men_500_470', 'profile_men_200_110', 'profile_men_100_49', 'profile_men_600_598'],
+    ),
+    Character(
+      id: 'profile_men_100_19',
+      gender: 'male',
+      age: 29,
+      height: 176,
+      mbti: 'ENFP',
+      rawText: '编号19\n\n96东北男 ，176的enfp，\n人生就是喜欢体验未知，\n爱手碟、拍照、羽毛球，以前有入伍经历，\n福祉工作、暂定富良野，\n后面可能去东京或大阪。\n另一半的标准163以上，脾气好些，\n对事物有自己的看法，不人云亦云.\n\n- （',
+      hometown: '东北',
+      currentLocation: '富良野',
+      occupation: '福祉工作',
+      interests: const <String>['手碟', '摄影', '羽毛球'],
+      interestIds: const <int>[65, 2, 40],
+      similarIds: const <String>['profile_men_100_4', 'profile_men_100_34', 'profile_men_100_89', 'profile_men_100_81', 'profile_men_600_544', 'profile_men_600_539', 'profile_men_500_471', 'profile_men_600_561', 'profile_men_100_70', 'profile_men_100_84'],
+    ),
+    Character(
+      id: 'profile_men_100_15',
+      gender: 'male',
+      age: 28,
+      height: 183,
+      rawText: '编号15\n\n男 97年 183 77\n福建 住在千叶松户，IT。\n平时喜欢看看视频，音乐，打打游戏什么的。\n然后目前是想长期在日本发展的，\n希望对方能互相喜欢，在一起舒服适合就好。\n\n- （',
+      bmi: 23.0,
+      hometown: '福建',
+      currentLocation: '千叶松户',
+      occupation: 'IT',
+      interests: const <String>['游戏', '看视频', '音乐'],
+      interestIds: const <int>[21, 66, 7],
+      similarIds: const <String>['profile_men_300_300', 'profile_men_400_333', 'profile_men_600_595', 'profile_men_100_12', 'profile_men_600_539', 'profile_men_600_557', 'profile_men_500_469', 'profile_men_100_84', 'profile_men_100_81', 'profile_men_100_72'],
+    ),
+    Character(
+      id: 'profile_men_100_14',
+      gender: 'male',
+      age: 33,
+      rawText: '编号14\n\n男/广东/1992/现专门学校。\n日常喜欢柔道健身电影动漫阅读游戏旅游摄影。\n不烟不酒无不良嗜好，寻对象/搭子。',
+      hometown: '广东',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>['健身', '电影', '动漫', '阅读', '游戏', '旅游', '摄影'],
+      interestIds: const <int>[10, 4, 23, 25, 21, 3, 2],
+      similarIds: const <String>['profile_men_300_239', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561'],
+    ),
+    Character(
+      id: 'profile_men_100_13',
+      gender: 'male',
+      age: 25,
+      height: 173,
+      mbti: 'ENFP',
+      rawText: '编号13\n\n00年男 ENFP安徽人\n173/60 国内985物理系，韩国半导体专业，\n在日本东工读电子博，\n喜欢俄语，手风琴，舞狮，伤痕文学，\n田野调查以及做各种中餐韩餐。\n很外向话密，想找个不要比我大5岁以上且情绪稳定的人\n\n- （',
+      bmi: 20.0,
+      hometown: '安徽',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>['阅读', '俄语', '做中餐韩餐', '手风琴', '田野调查', '舞狮'],
+      interestIds: const <int>[25, 67, 68, 69, 70, 71],
+      similarIds: const <String>['profile_men_400_344', 'profile_women_200_171', 'profile_men_100_7', 'profile_men_400_357', 'profile_men_100_60', 'profile_men_600_591', 'profile_men_300_235', 'profile_women_100_96', 'profile_men_700_625', 'profile_men_500_444'],
+    ),
+    Character(
+      id: 'profile_men_100_12',
+      gender: 'male',
+      age: 26,
+      height: 184,
+      mbti: 'ENFJ',
+      rawText: '编号12\n\n男 99年 184 大连 ENFJ\n住在横滨，在东京工作(IT)\n平时喜欢旅旅游，音乐，足球，\n打打游戏什么的\n希望对方能互相喜欢，\n在一起舒服适合就好\n\n- （',
+      hometown: '大连',
+      currentLocation: '横滨',
+      occupation: 'IT',
+      interests: const <String>['游戏', '旅游', '足球', '音乐'],
+      interestIds: const <int>[21, 3, 41, 7],
+      similarIds: const <String>['profile_men_500_418', 'profile_men_300_285', 'profile_men_300_247', 'profile_men_500_469', 'profile_men_500_470', 'profile_men_100_15', 'profile_men_700_625', 'profile_men_100_84', 'profile_men_600_554', 'profile_men_400_366'],
+    ),
+    Character(
+      id: 'profile_men_100_8',
+      gender: 'male',
+      age: 32,
+      height: 170,
+      rawText: '编号8\n\n93年 男 南方人，170CM，BMI 20，\n国内本科，东京干IT，收入700+，\n长相白皙清秀型。\n不抽烟不赌博偶尔喝啤酒，会做饭。\n希望找个27-33岁，\n长相看着舒服就行，情绪稳定，\n在东京有自己的工作，本分的女孩。\n不接受离异\n\n- （',
+      bmi: 20.1,
+      hometown: '南方',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['做饭'],
+      interestIds: const <int>[29],
+      similarIds: const <String>['profile_men_400_330', 'profile_men_600_570', 'profile_men_500_488', 'profile_men_600_509', 'profile_men_200_126', 'profile_men_300_249', 'profile_men_500_423', 'profile_women_300_296', 'profile_women_200_134', 'profile_men_300_291'],
+    ),
+    Character(
+      id: 'profile_men_100_7',
+      gender: 'male',
+      age: 27,
+      height: 177,
+      mbti: 'INTJ',
+      rawText: '编号7\n\n98 男 日本东京在住\n现在是大学院生 177/65\nintj 不抽烟喝酒\n择偶标准 聊得来就行\n\n- （',
+      bmi: 20.7,
+      currentLocation: '日本东京',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_81', 'profile_men_100_45', 'profile_men_700_626', 'profile_men_400_337', 'profile_men_500_437', 'profile_men_500_444', 'profile_men_400_347', 'profile_men_200_167', 'profile_men_700_620', 'profile_men_200_122'],
+    ),
+    Character(
+      id: 'profile_men_100_4',
+      gender: 'male',
+      age: 31,
+      rawText: '编号4\n\n94年 男 辽宁人 普通打工人\n寻找有缘人投缘最重要 。\n\n- （',
+      hometown: '辽宁',
+      currentLocation: '',
+      occupation: '普通打工人',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_500_471'],
+    ),
+    Character(
+      id: 'profile_men_100_2',
+      gender: 'male',
+      age: 37,
+      rawText: '编号2\n\n性别男，88年，未婚，日籍福建人，\n东京有一户建房子一座，\n年收入1200－1600万日元，日本就他自己，\n没有抽烟喝酒习惯，未来没有回国打算，\n寻找不超过38岁，最好27-36，离异也可，\n不能生育过小孩，未来能够接受生育2个孩子的女孩，\n不接受只想生育一个小孩的人\n\n- （',
+      hometown: '福建',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      hasHouse: true,
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_500_459', 'profile_men_100_33', 'profile_women_400_315', 'profile_men_300_238', 'profile_women_200_190', 'profile_men_600_571', 'profile_men_400_358', 'profile_men_100_54', 'profile_men_500_428', 'profile_men_400_312'],
+    ),
+    Character(
+      id: 'profile_men_100_1',
+      gender: 'male',
+      age: 23,
+      height: 186,
+      mbti: 'ESFJ',
+      rawText: '编号1\n\n男，02年，身高186，\n住在琦玉，大学在都内，ESFJ，\n不抽烟不喝酒（偶尔小酌）。\n兴趣爱好现代舞（hipop、jazz、kpop），\n旅游，爬山，打游戏，看动漫\n（热血番：死火海。最喜欢的动漫是BLEACH）。\n来日本已经两年了，圈子很小，\n希望能找一个是年龄差不多，聊得来的女生。(^_^;)\n\n[下一页](https://github.com/141801/info/blob/main/men_200.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      currentLocation: '琦玉',
+      occupation: '',
+      interests: const <String>['jazz', 'kpop', '游戏', '旅游', '爬山', '舞蹈', '动漫'],
+      interestIds: const <int>[72, 73, 21, 3, 20, 74, 23],
+      similarIds: const <String>['profile_men_600_554', 'profile_men_400_319', 'profile_men_300_230', 'profile_men_100_12', 'profile_men_500_469', 'profile_men_400_378', 'profile_men_300_285', 'profile_men_700_625', 'profile_men_300_232', 'profile_men_400_366'],
+    ),
+    Character(
+      id: 'profile_men_200_193',
+      gender: 'male',
+      age: 32,
+      height: 183,
+      rawText: '编号193\n\n个人信息\n性别：男\n出生年：93年\n身高：183\n体重：68左右（较瘦）\n学历：专科\n工作：内装\n年收：500左右\n出生地：河南洛阳\n现居住地：千叶县松户市\n兴趣爱好：爬山，听音乐，打游戏\n不抽烟，偶尔喝酒，喜欢做家务，情绪稳定。\n会做饭（做的不咋地）\n家庭状况：父已故，母健在，有一妹妹今年大一\n其他：打算长期居住日本，\n工作签证，有驾照，有房（3DK）无车\n对女方的要求：96以后未婚的，\n身高160以上（越高越好，175为止都能接受）\n正常身材，情绪稳定',
+      bmi: 20.3,
+      hometown: '河南洛阳',
+      currentLocation: '千叶县松户市',
+      occupation: '内装',
+      interests: const <String>['做饭', '喝酒', '音乐', '喜欢做家务', '游戏', '爬山'],
+      interestIds: const <int>[29, 35, 7, 75, 21, 20],
+      hasHouse: true,
+      hasCar: false,
+      similarIds: const <String>['profile_men_200_157', 'profile_men_500_471', 'profile_men_600_595', 'profile_men_600_561', 'profile_men_300_215', 'profile_men_400_352', 'profile_men_400_330', 'profile_men_500_456', 'profile_men_600_576', 'profile_men_100_83'],
+    ),
+    Character(
+      id: 'profile_men_200_189',
+      gender: 'male',
+      age: 42,
+      height: 187,
+      rawText: '编号189\n\n◇生年月日: 80代前半\n◇国籍: 中国\n◇戸籍地 : 辽宁\n◇現住所 : 埼玉\n◇身長: 187cm\n◇体重: 76kg\n◇最終学歴 : 研究生\n◇ご職業: IT\n◇ご年収: 700W+\n◇日本語程度 :N1\n◇赴日经历：10年+\n◇签证类型： 高度人才\n◇家族との同居 : 无\n◇趣味 : 运动为主\n◇希望对方 : 善良，有素质，人品过关，身高155+，年龄32～39',
+      bmi: 21.7,
+      hometown: '辽宁',
+      currentLocation: '埼玉',
+      occupation: 'IT',
+      interests: const <String>['运动'],
+      interestIds: const <int>[6],
+      similarIds: const <String>['profile_men_200_181', 'profile_men_300_268', 'profile_men_400_346', 'profile_men_400_340', 'profile_men_400_308', 'profile_men_600_535', 'profile_men_500_484', 'profile_men_200_109', 'profile_men_600_569', 'profile_men_500_447'],
+    ),
+    Character(
+      id: 'profile_men_200_188',
+      gender: 'male',
+      age: 29,
+      height: 169,
+      mbti: 'ENFJ',
+      rawText: '编号188\n\n本人状况\n男\n.96年，裸足169/68 广西人\n.在日5年\n.ENFJ、性格比较随和，\n可以聊天聊地也可以默默倾听\n.目前工作是IT(入行3年，年收450)\n.不抽烟\n.平时都是自己做饭\n.短期内没有回国发展打算\n.对什么事都有一点兴趣，但不多。\n在家时玩玩游戏看看视频，\n出去的时候多数是逛超市或者和朋友一起吃饭，\n偶尔也会参加一些徒步活动。\n\n对女生要求\n.身体健康，以后打算在日本长期居住发展\n.可接受4岁以内的年龄差\n.主要还得看三观以及性格合得来',
+      bmi: 23.8,
+      hometown: '广西',
+      currentLocation: '日本',
+      occupation: 'IT',
+      interests: const <String>['徒步', '和朋友一起吃饭', '游戏', '看视频', '做饭', '逛街'],
+      interestIds: const <int>[11, 76, 21, 66, 29, 9],
+      similarIds: const <String>['profile_men_100_4', 'profile_women_300_202', 'profile_men_100_49', 'profile_men_600_539', 'profile_men_500_466', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_men_200_183',
+      gender: 'male',
+      age: 38,
+      height: 176,
+      zodiac: '双鱼座',
+      rawText: '编号183\n\n◇お名前 :李\n◇星座 :双鱼座\n◇生年月日: 1987\n◇国籍: 中国\n◇戸籍地 : 吉林\n◇現住所 : 横滨\n◇身長: 176cm\n◇体重: 80kg\n◇最終学歴 : 本科\n◇ご職業: 会社员\n◇ご年収: 400〜500万\n◇日本語程度 :N1\n◇赴日经历：14年\n◇签证类型： 永驻\n◇家族との同居 : 无\n◇趣味 : 运动，电影，游戏',
+      bmi: 25.8,
+      hometown: '吉林',
+      currentLocation: '横滨',
+      occupation: '会社员',
+      interests: const <String>['游戏', '电影', '运动'],
+      interestIds: const <int>[21, 4, 6],
+      similarIds: const <String>['profile_men_400_362', 'profile_men_400_308', 'profile_men_500_413', 'profile_men_200_180', 'profile_men_200_109', 'profile_men_300_271', 'profile_men_400_340', 'profile_men_500_446', 'profile_men_400_310', 'profile_men_400_399'],
+    ),
+    Character(
+      id: 'profile_men_200_182',
+      gender: 'male',
+      age: 33,
+      height: 175,
+      rawText: '编号182\n2.性别：男\n3.生年：92\n4.籍贯：大连\n5.身高：175\n6.体重：80\n7.居住地：吉祥寺\n8.工作：日料（工作稳定）\n兴趣爱好（方便找共同点)：\n一个有趣灵魂的辽宁小老爷们儿，\n爱追剧、爱运动、爱K歌、喜欢做好吃的\n经过岁月的磨合 硬生生把自己打造成了暖男！\n想找一个真心想谈恋爱 想结婚的人！\n希望早点脱掉单身狗的罪名[呲牙]',
+      image: 'https://github.com/user-attachments/assets/63e99308-9940-4c62-bc5b-ebdcea1bc858',
+      bmi: 26.1,
+      hometown: '大连',
+      currentLocation: '吉祥寺',
+      occupation: '日料',
+      interests: const <String>['唱歌', '做好吃的', '运动', '追剧'],
+      interestIds: const <int>[8, 77, 6, 24],
+      similarIds: const <String>['profile_men_600_501', 'profile_women_700_611', 'profile_men_300_286', 'profile_men_300_257', 'profile_men_600_570', 'profile_men_100_69', 'profile_men_700_605', 'profile_men_300_241', 'profile_men_300_201', 'profile_men_500_441'],
+    ),
+    Character(
+      id: 'profile_men_200_181',
+      gender: 'male',
+      age: 40,
+      height: 183,
+      rawText: '编号181\n性别：男\n生年：85\n籍贯：大连\n身高：183\n学历：大学\n婚史：未婚\n签证种类：永住\n居住地：埼玉県\n工作：電気工事士\n年收：500w上下\n车房：无车，有房。\n其他：电子烟，偶尔喝酒\n兴趣爱好：\n各种运动，美食，看电影，旅行。\n喜欢小动物，有时间会去猫咖。\n希望找一个情绪稳定，性格开朗的。',
+      image: 'https://github.com/user-attachments/assets/2f663b3a-6860-4d09-88c6-1a1ff91cc1b4',
+      hometown: '大连',
+      currentLocation: '埼玉県',
+      occupation: '電気工事士',
+      interests: const <String>['喝酒', '运动', '宠物', '旅游', '电子烟', '电影', '美食'],
+      interestIds: const <int>[35, 6, 26, 3, 78, 4, 5],
+      hasHouse: true,
+      hasCar: false,
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_200_189', 'profile_men_400_340', 'profile_men_400_308', 'profile_men_200_109', 'profile_men_200_176', 'profile_men_600_535', 'profile_men_500_446', 'profile_men_700_636', 'profile_men_200_124', 'profile_men_400_399'],
+    ),
+    Character(
+      id: 'profile_men_200_180',
+      gender: 'male',
+      age: 36,
+      height: 181,
+      mbti: 'INFJ',
+      rawText: '编号180\n\n家乡：上海\n现居: 横滨\n年龄: 1989\n学历: 本科\n身高: 181 cm\n体重: 77 kg\n工作: 用户体验 & 交互设计（在宅）\n年收: 1000\nmbti: INFJ 绿老头\n爱好: 学跳舞，玩桌游，抱石，推崇持续自我发展，\n爱学各种的像是心理学，商业，产品/游戏设计，\nComputer Science，也喜欢美食探店，电影音乐，撸🐱撸🐶。\n烟酒: 不抽烟🚭，偶尔小酌怡情\n\n期待能遇到人生路上的好拍档，希望对方:\n160+，\n中长期内打算定居在日本，\n兴趣爱好上能有一些交集，\n志同道合，有上进心，\n心思细腻，积极沟通，\n愿意积极经营生活和感情。',
+      bmi: 23.5,
+      hometown: '上海',
+      currentLocation: '横滨',
+      occupation: '用户体验 & 交互设计（在宅）',
+      interests: const <String>['Computer', 'Science', '美食', '产品', '游戏', '商业', '舞蹈', '抱石', '推崇持续自我发展', '宠物'],
+      interestIds: const <int>[79, 80, 5, 81, 21, 82, 74, 83, 84, 26],
+      similarIds: const <String>['profile_men_300_271', 'profile_men_100_64', 'profile_men_400_362', 'profile_men_400_382', 'profile_men_500_446', 'profile_men_400_388', 'profile_men_400_372', 'profile_men_400_309', 'profile_men_200_183', 'profile_men_500_414'],
+    ),
+    Character(
+      id: 'profile_men_200_179',
+      gender: 'male',
+      age: 30,
+      height: 175,
+      mbti: 'ENFJ',
+      rawText: '编号179\n2.性别：男\n3.生年：95\n4.籍贯：天津\n5.身高：175\n6.学历：大学这部\n7.居住地：东京\n8.工作：老师\n9.车房：都有\n兴趣爱好（方便找共同点)：\n滑雪，看电影，开车旅行。打游戏\nENFJ 工作稳定 想找一个年下的妹妹。\n天津人自带段子手被动，共情能力强，\n喜欢小动物，自己有一只小猫咪。\n希望找一个有情绪价值三观正，共同爱好的妹妹。',
+      image: 'https://github.com/141801/info/assets/42635299/f53ad8d0-aa9d-4793-83ab-1e517a8a7c92',
+      hometown: '天津',
+      currentLocation: '东京',
+      occupation: '老师',
+      interests: const <String>['宠物', '自驾', '旅游', '游戏', '滑雪', '电影'],
+      interestIds: const <int>[26, 15, 3, 21, 14, 4],
+      hasHouse: true,
+      hasCar: true,
+      similarIds: const <String>['profile_men_600_534', 'profile_men_300_227', 'profile_men_500_430', 'profile_men_100_81', 'profile_men_700_633', 'profile_men_400_338', 'profile_men_100_51', 'profile_men_500_461', 'profile_men_300_216', 'profile_men_100_59'],
+    ),
+    Character(
+      id: 'profile_men_200_176',
+      gender: 'male',
+      age: 40,
+      height: 178,
+      zodiac: '牛',
+      rawText: '编号176\n姓名：杨成伟 身高：178\n70kg大连人 1985年 父母退休\n身体健康 属牛\n09年赴日留现工作于日本电器公司\nビックカメラ正社员\n现在：永住签证 一直在东京生活，性格开朗\n无不良嗜好、不抽烟、\n会做饭还挺好吃、，性格温和，\n三观正常，兴趣广泛、\n爱好滑雪健身足球、电影、追剧\n对女生要求：工作稳定、性格开朗就好',
+      image: 'https://github.com/141801/info/assets/42635299/8b7da8d0-0d74-4262-8058-54158c28b90f',
+      bmi: 22.1,
+      hometown: '大连',
+      currentLocation: '东京',
+      occupation: '日本电器公司正社员',
+      interests: const <String>['滑雪', '健身', '足球', '电影', '追剧'],
+      interestIds: const <int>[14, 10, 41, 4, 24],
+      similarIds: const <String>['profile_men_200_124', 'profile_men_600_535', 'profile_men_600_585', 'profile_men_200_165', 'profile_women_400_318', 'profile_men_100_93', 'profile_men_400_399', 'profile_men_500_489', 'profile_men_400_340', 'profile_men_600_569'],
+    ),
+    Character(
+      id: 'profile_men_200_175',
+      gender: 'male',
+      age: 32,
+      height: 172,
+      zodiac: '水瓶座',
+      mbti: 'ISFP',
+      rawText: '编号175\n大连人。93年生。\n水瓶座 ISFP 身高172。体重70kg。来日8年。\n工作:中华物产贩卖。年收500。\n兴趣: 旅游 吃肉 在家宅一天。\n择偶标准:\n外貌的话 喜欢比较白的。\n大眼睛。双眼皮。\n性格的话聊的来 有共同话题就行。',
+      image: 'https://github.com/141801/info/assets/42635299/9ffdd692-7c29-4a7c-81ca-c33de9790259',
+      bmi: 23.7,
+      hometown: '大连',
+      currentLocation: '',
+      occupation: '中华物产贩卖',
+      interests: const <String>['吃肉', '在家宅一天', '旅游'],
+      interestIds: const <int>[85, 86, 3],
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_100_4', 'profile_men_600_561'],
+    ),
+    Character(
+      id: 'profile_men_200_173',
+      gender: 'male',
+      age: 31,
+      height: 171,
+      rawText: '编号173\n\n94年 身高171 体重60kg\n江苏人 工作第七年 大手\n年收500 中学就在日本 来日16年\n爱好 健身 摩托 。\n喜欢温柔 打算长期在日本的。\n\n- （',
+      bmi: 20.5,
+      hometown: '江苏',
+      currentLocation: '',
+      occupation: '大手',
+      interests: const <String>['健身', '摩托'],
+      interestIds: const <int>[10, 87],
+      similarIds: const <String>['profile_men_100_4', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561'],
+    ),
+    Character(
+      id: 'profile_men_200_172',
+      gender: 'male',
+      age: 32,
+      height: 175,
+      mbti: 'ENFJ',
+      rawText: '编号172\n\n性别：男\n出生年：1993\n出身地：山东\n现住：东京\n身高体重：175/60\n职业：外资咨询\n年收：750+\nmbti：ENFJ-A\n爱好：滑雪，电吉他，看书，徒步等\n其他：不抽烟，偶尔喝酒。\n原生家庭：父母均退休，家庭和睦，有养老金\n\n情绪稳定，性格温和。\n每天需要摄入和分享大量外界信息\n\n希望的另一半：\n积极沟通交流，工作稳定，情绪稳定\n对未来规划明晰，感情经历不能过于离谱。\n说话诚实，交际圈正常。\n正常人。\n\n- （',
+      bmi: 19.6,
+      hometown: '山东',
+      currentLocation: '东京',
+      occupation: '外资咨询',
+      interests: const <String>['徒步', '滑雪', '吉他', '阅读'],
+      interestIds: const <int>[11, 14, 27, 25],
+      similarIds: const <String>['profile_men_300_227', 'profile_men_600_579', 'profile_men_500_419', 'profile_men_600_534', 'profile_men_600_570', 'profile_men_500_430', 'profile_men_300_216', 'profile_women_600_507', 'profile_men_200_107', 'profile_men_200_179'],
+    ),
+    Character(
+      id: 'profile_men_200_167',
+      gender: 'male',
+      age: 27,
+      mbti: 'I',
+      rawText: '编号167\n\n男生199806，廣東人，\n我的話專業是生物醫學工程，\n加拿大研究生畢業-\n喜歡日本動畫和偶像\n（比如Lycoris Recoil和乃木板46），\n我在東京的話喜歡去看地下偶像演出，喜歡貓，I人，\n喜歡standard product冷色調和無印良品那種暖色調）。\n專業比較感興趣有經驗的領域是GWAS，計算機圖形學，分布式計算k8s，金融投研，大數據分析。\n之前在中國的公司工作過一段時間，廣發證券投研，Deloitte廣州.目前在日本涉谷那邊語言學校，\n平時的話工作還是兼職（mcdonalds兼職），目前沒有打算找全職工作。沒有讀博士打算。\n這就是我目前的學業和過往生活和未來的打算。\n我喜歡櫻花一樣的女生，我很喜歡日語的發音，\n之前有做過一個研究項目是機器學習自然語言到計算機編碼的Mapping（簡稱編譯器[愉快]），\n那時候就很喜歡日文，中文是象形文字，而日語含有象形和擬音文字，我覺得日文和中文都是很美的語言。\n也許以後我學好日文後我會好好地重新做這個專項吧。\n喜歡ASMR，喜歡同喜歡日文的女生，喜歡聲音溫柔的女生。\n\n- （',
+      hometown: '廣東',
+      currentLocation: '日本涉谷',
+      occupation: '語言學校學生，兼職',
+      interests: const <String>['ASMR', 'GWAS', 'product冷色調', 'standard', '偶像', '分布式計算k8s', '地下偶像演出', '大數據分析', '日文', '日本動畫'],
+      interestIds: const <int>[88, 89, 90, 91, 92, 93, 94, 95, 96, 97],
+      similarIds: const <String>['profile_men_100_7', 'profile_men_600_559', 'profile_men_100_81', 'profile_men_400_337', 'profile_men_500_437', 'profile_men_600_517', 'profile_women_700_614', 'profile_men_700_626', 'profile_women_700_621', 'profile_men_500_444'],
+    ),
+    Character(
+      id: 'profile_men_200_165',
+      gender: 'male',
+      age: 37,
+      height: 181,
+      zodiac: '巨蟹',
+      rawText: '编号165\n一、关于本人基础信息\n籍贯：辽宁沈阳\n性别：男\n身高：181cm\n体重：73kg\n出生年月：1988年7月\n签证种类：永驻\n毕业院校：早稻田大学大学院\n最终学历：修士\n二、关于工作\n所在单位：外资咨询公司\n岗位性质：商业咨询\n雇佣形式：正社员\n所在单位最近车站：东京站\n年收：1680\n三、关于生活\n是否已买房：购入3ldk\n是否独居：独居\n家最近车站：品川\n\n四、关于自己\n性格：阳光，开朗，有趣\n爱好：篮球，游泳，滑雪，旅游\n巨蟹座，顾家。不大男子主义，\n不抽烟，不喝酒无不良嗜好。\n对女朋友很好。\n有上进心，并且能付出努力。',
+      image: 'https://github.com/user-attachments/assets/01014551-fcc7-490c-a1ef-f908dfa9c397',
+      bmi: 22.3,
+      hometown: '辽宁沈阳',
+      currentLocation: '东京',
+      occupation: '商业咨询',
+      interests: const <String>['旅游', '游泳', '滑雪', '篮球'],
+      interestIds: const <int>[3, 19, 14, 50],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_100_93', 'profile_men_200_176', 'profile_men_500_428', 'profile_men_700_623', 'profile_men_100_33', 'profile_men_100_2', 'profile_women_400_315', 'profile_men_600_585', 'profile_men_400_361', 'profile_men_200_155'],
+    ),
+    Character(
+      id: 'profile_men_200_161',
+      gender: 'male',
+      age: 32,
+      height: 170,
+      rawText: '编号161\n个人基本情况\n出生年月：1993年\n身高： 170cm\n体重： 77kg\n籍贯： 湖南省\n民族：汉族\n学校：本科\n行业：化妆品贸易\n年收：700+\n在就资格：経営、管理\n家庭情况：两个姐姐在日本。\n兴趣爱好：赚钱，\n\n希望的另一半：\n学历本科➕\n年收：没要求\n双方看对眼就行\n\n- （',
+      image: 'https://github.com/141801/info/assets/42635299/1800022a-39f9-4261-89bc-8dc243ac6fc5',
+      bmi: 26.6,
+      hometown: '湖南省',
+      currentLocation: '',
+      occupation: '化妆品贸易',
+      interests: const <String>['赚钱'],
+      interestIds: const <int>[98],
+      similarIds: const <String>['profile_men_300_241', 'profile_women_700_611', 'profile_men_700_634', 'profile_men_300_201', 'profile_men_600_597', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_men_200_158',
+      gender: 'male',
+      age: 28,
+      height: 185,
+      zodiac: '天蝎',
+      mbti: 'INTP',
+      rawText: '编号158\n性别：男\n出生年：97年\n星座：天蠍\n身高：184.5\n体重：90kg\n学历：本科2年\n出生地：福建\n现居住地：港區\nmbti:intp\n希望你身高160以上\n\n- （',
+      image: 'https://github.com/141801/info/assets/42635299/7c76b0b6-6cc4-4c8f-a4a2-9de0c7c17e60',
+      bmi: 26.3,
+      hometown: '福建',
+      currentLocation: '港区',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_400_333', 'profile_men_600_539', 'profile_men_400_327', 'profile_men_300_284', 'profile_men_200_139', 'profile_men_100_81', 'profile_men_600_580', 'profile_men_100_68', 'profile_men_100_24', 'profile_men_300_278'],
+    ),
+    Character(
+      id: 'profile_men_200_157',
+      gender: 'male',
+      age: 32,
+      height: 180,
+      zodiac: '白羊',
+      mbti: 'ISFJ',
+      rawText: '编号157\n\n出生年：1993年\n来日年：2019年\nMBTI：ISFJ → ENFJ中\n星座：白羊\n籍贯：陕西\n现住：千葉\n身高：180\n体重：68\n学历：本科\n职业：IT\n婚歴：未婚单身\n爱好：篮球，游泳，喜欢猫狗，收拾家里（家里永远都不乱），最近经常组队户外～\n缺点：有时候比较直\n其它：大概率会留在日本，希望可以遇到认真生活的人\n希望对方：正常人，情绪稳定，三观契合，相互理解对方\n\n- （',
+      bmi: 21.0,
+      hometown: '陕西',
+      currentLocation: '千葉',
+      occupation: 'IT',
+      interests: const <String>['喜欢猫狗', '户外', '收拾家里', '游泳', '篮球'],
+      interestIds: const <int>[99, 1, 100, 19, 50],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_200_193', 'profile_men_500_471', 'profile_men_600_561', 'profile_men_100_83', 'profile_men_300_245', 'profile_men_500_456', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129'],
+    ),
+    Character(
+      id: 'profile_men_200_156',
+      gender: 'male',
+      age: 31,
+      height: 178,
+      zodiac: '天蝎座',
+      mbti: 'ISTP',
+      rawText: '编号156\n\n94年，178/75，istp，\n天蝎座，浙江人，现居大阪。\n2018-2023阪大修士+工科博士毕业，\n后就职大手子公司的研究岗位，\n喜欢看看番剧，可能偏二次元，但没那么宅，\n喜欢大自然，会自己逛逛，偶尔去看电影，\n因之前专注于学业，专业以外的人接触范围有限\n（+没必要就不会主动接触的性格）。\n不抽烟，聚餐时应酬式喝酒。性格情绪稳定。\n\n- （',
+      bmi: 23.7,
+      hometown: '浙江',
+      currentLocation: '大阪',
+      occupation: '研究岗位',
+      interests: const <String>['动漫', '户外', '电影', '逛街'],
+      interestIds: const <int>[23, 1, 4, 9],
+      similarIds: const <String>['profile_men_600_511', 'profile_men_500_471', 'profile_men_600_561', 'profile_men_500_432', 'profile_men_100_4', 'profile_men_400_381', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129'],
+    ),
+    Character(
+      id: 'profile_men_200_155',
+      gender: 'male',
+      age: 35,
+      height: 177,
+      zodiac: '天秤',
+      rawText: '编号155\n性别：男 山东人\n星座：太阳天秤 月亮巨蟹\n安全型依恋类型\n出生年：1990 属马 34岁\n现住：东京足立 已购房\n身高：177 体重140\n有健身习惯\n职业：食品会社营业\n年收：税后500+(2023年)\n日语：来日6年 父母退休且开明\n爱好：户外旅行，茶道，擅长料理，不玩游戏\n性格：成长性思维，\n有主见同时也尊重对方立场，比较包容不爱较真\n择偶要求：相比外在更看重内在，希望她知性温柔，\n两个人能把平凡生活过得更有趣充实\n\n- （',
+      image: 'https://github.com/141801/info/assets/42635299/bfaab4e9-e37a-45e3-a462-b0e443f1cde6',
+      bmi: 20.1,
+      hometown: '山东',
+      currentLocation: '东京足立',
+      occupation: '食品会社营业',
+      interests: const <String>['游戏', '户外', '旅游', '做饭', '健身', '茶道'],
+      interestIds: const <int>[21, 1, 3, 29, 10, 101],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_500_428', 'profile_men_400_361', 'profile_men_300_277', 'profile_women_300_224', 'profile_men_300_295', 'profile_men_100_33', 'profile_women_400_336', 'profile_men_100_57', 'profile_men_500_419', 'profile_men_500_423'],
+    ),
+    Character(
+      id: 'profile_men_200_152',
+      gender: 'male',
+      age: 32,
+      height: 170,
+      rawText: '编号152\n\n男 93年\n身高170 体重125左右\n现居横浜附近 祖籍福建\n社会人一枚\n性格稍微有点老实内向\n慢热型 熟悉之后就比较放得开\n喜欢追剧 美食\n对对方身高外貌没有过多要求\n就希望两个人一起努力\n过简简单单 普普通通的生活\n\n- （',
+      bmi: 43.3,
+      hometown: '福建',
+      currentLocation: '横浜附近',
+      occupation: '社会人',
+      interests: const <String>['美食', '追剧'],
+      interestIds: const <int>[5, 24],
+      similarIds: const <String>['profile_women_200_116', 'profile_men_300_208', 'profile_men_200_127', 'profile_men_200_150', 'profile_men_500_479', 'profile_women_700_611', 'profile_men_200_128', 'profile_men_300_279', 'profile_men_700_601', 'profile_men_100_80'],
+    ),
+    Character(
+      id: 'profile_men_200_150',
+      gender: 'male',
+      age: 27,
+      height: 175,
+      zodiac: '金牛座',
+      rawText: '编号150\n个人基本情况\n出生年月：1998年\n星座： 金牛座\n身高： 175cm\n体重： 102kg\n籍贯： 黑龙江省哈尔滨市方正县\n名族：汉族\n学校：日本专门学校\n行业/*单位：IT\n年收：420万\n在就资格：永住者\n家庭情况：父母-有一个弟弟\n兴趣爱好：游戏，小说\n\n希望的另一半：\n性格合得来就好。\n\n- （',
+      image: 'https://github.com/141801/info/assets/42635299/38419904-32a5-41db-a144-b7e632108c76',
+      bmi: 33.3,
+      hometown: '黑龙江省哈尔滨市方正县',
+      currentLocation: '',
+      occupation: 'IT',
+      interests: const <String>['阅读', '游戏'],
+      interestIds: const <int>[25, 21],
+      similarIds: const <String>['profile_men_400_329', 'profile_men_100_80', 'profile_men_600_532', 'profile_men_300_258', 'profile_men_100_24', 'profile_men_600_539', 'profile_men_300_208', 'profile_men_200_146', 'profile_men_200_158', 'profile_men_600_597'],
+    ),
+    Character(
+      id: 'profile_men_200_146',
+      gender: 'male',
+      age: 28,
+      height: 174,
+      rawText: '编号146\n\n自我介绍\n年龄：97年 25岁 （生日小）\n身高：174cm\n体重：80kg（努力减肥中）\n居住地：东京郊区\n学历：在这边上的初高专\n工作：教育相关\n收入： 500～700左右\n爱好：动漫 、露营、机车、健身。\n性格：比较温和吧 又怂又爱玩。\n现状况：来日12年 永驻\n回国的可能性比较小，家人也都在这边。\n有自己的房子（老破小）自己的车子\n对于另一半的要求：年龄的话上下三岁以内都可以，\n性格的话活泼点最好。\n\n- （',
+      bmi: 26.4,
+      currentLocation: '东京郊区',
+      occupation: '教育相关',
+      interests: const <String>['健身', '动漫', '机车', '户外'],
+      interestIds: const <int>[10, 23, 102, 1],
+      hasHouse: true,
+      hasCar: true,
+      similarIds: const <String>['profile_men_500_455', 'profile_men_600_532', 'profile_men_600_522', 'profile_men_200_125', 'profile_men_600_539', 'profile_men_300_278', 'profile_men_200_158', 'profile_men_100_81', 'profile_men_400_381', 'profile_men_500_437'],
+    ),
+    Character(
+      id: 'profile_men_200_144',
+      gender: 'male',
+      age: 31,
+      height: 165,
+      zodiac: '巨蟹',
+      rawText: '编号144\n\n出生年：1994\n来日时间:2022年4月\n星座:巨蟹\n户籍地：云南\n现住:名古屋\n身高：165\n体重：53kg\n学历：985硕士 日语专业\n职业：大手Sier ITインフラエンジニア\n年收：600〜700w\n婚歴：未婚单身\n爱好：旅行，自驾，游泳，收集朱印\n择偶要求：有自己的爱好，\n小个子，户外户内活动都可以，\n未来在日本发展，希望对日本有自己的见解',
+      bmi: 19.5,
+      hometown: '云南',
+      currentLocation: '名古屋',
+      occupation: '大手Sier ITインフラエンジニア',
+      interests: const <String>['收集朱印', '旅游', '游泳', '自驾'],
+      interestIds: const <int>[103, 3, 19, 15],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_women_100_29', 'profile_men_300_267', 'profile_men_100_4', 'profile_women_400_384', 'profile_men_600_563', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_men_200_143',
+      gender: 'male',
+      age: 40,
+      height: 174,
+      zodiac: '水瓶座',
+      mbti: 'ESTP',
+      rawText: '编号143\n\n性别：男\n出生年月：1985 水瓶座\n性格特点：ESTP乐观开朗好奇心强\n身高体重：174/73\n籍贯现居：北京/千叶\n感情状态：单身未婚\n工作休假：贸易电商/按日历周六可能有会议\n兴趣爱好：户外运动探店逛街阅读游戏自驾看演出',
+      bmi: 24.1,
+      hometown: '北京',
+      currentLocation: '千叶',
+      occupation: '贸易电商',
+      interests: const <String>['户外', '运动', '美食', '逛街', '阅读', '游戏', '自驾'],
+      interestIds: const <int>[1, 6, 5, 9, 25, 21, 15],
+      maritalStatus: '单身未婚',
+      similarIds: const <String>['profile_men_600_503', 'profile_men_500_447', 'profile_men_600_535', 'profile_men_200_109', 'profile_men_500_484', 'profile_men_700_636', 'profile_men_500_413', 'profile_women_600_526', 'profile_men_400_340', 'profile_men_200_183'],
+    ),
+    Character(
+      id: 'profile_men_200_139',
+      gender: 'male',
+      age: 29,
+      height: 183,
+      mbti: 'INTJ',
+      rawText: '编号139\n自我介绍\n年龄：96年 28\n身高：183cm\n体重：80kg\n居住地：东京圈内\n现状：筑波大学化学系博士在读，\n在日工作两年后回来读的博，\n单纯觉得工作没意义才去读的，\n有奖学金自给自足。\n爱好：读书，哲学（刚刚开始），\n健身，aimer，化学实验\n未来在日工作很长一段时间，\n可能是化学半导体maker公司为主\n期望女生：30岁以下\n喜欢高个子女生，希望能互相谅解包容。\n本人intj，学有机化学的老登[汗]',
+      image: 'https://github.com/141801/info/assets/42635299/c620e5d5-2699-4695-98d4-ad2d61be63cb',
+      bmi: 23.9,
+      currentLocation: '东京圈内',
+      occupation: '学生（筑波大学化学系博士在读）',
+      interests: const <String>['aimer', '健身', '化学实验', '哲学', '阅读'],
+      interestIds: const <int>[104, 10, 105, 106, 25],
+      similarIds: const <String>['profile_men_400_381', 'profile_men_100_81', 'profile_men_200_158', 'profile_men_400_333', 'profile_men_100_90', 'profile_men_300_244', 'profile_men_100_31', 'profile_men_100_68', 'profile_men_600_539', 'profile_men_500_437'],
+    ),
+    Character(
+      id: 'profile_men_200_138',
+      gender: 'male',
+      age: 33,
+      height: 177,
+      zodiac: '双子',
+      rawText: '编号138\n\n92年双子座，来自辽宁铁岭\n来日5年，已贷款买房打算常驻，身高177体重75，国内985本科，IT公司正社员年收600左右，热爱运动，喜欢户外，滑雪，散步，性格稳定，有一只猫，思维比较跳脱，性格开朗。\n希望对方不会钻牛角尖，有事可商量解决。有身材管理，有稳定工作。',
+      bmi: 23.9,
+      hometown: '辽宁铁岭',
+      currentLocation: '',
+      occupation: 'IT公司正社员',
+      interests: const <String>['户外', '散步', '滑雪', '运动'],
+      interestIds: const <int>[1, 47, 14, 6],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_500_471', 'profile_men_600_561', 'profile_men_600_543', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16'],
+    ),
+    Character(
+      id: 'profile_men_200_129',
+      gender: 'male',
+      age: 0,
+      rawText: '编号129 - (',
+      image: 'https://github.com/141801/info/assets/42635299/0c22458b-ba32-4928-ac3f-916ed6c533e4',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_100_4', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_men_200_128',
+      gender: 'male',
+      age: 33,
+      height: 175,
+      rawText: '编号128\n\n上海人 92年 男\n身高175 体重85kg\n日本大学毕业 现住东京\n来日10年人\n特定活动签证，年收400\n有2套房出租\n准备创业中\n直男性格比较温和\n不怎么会说话\n爱好自由，不喜欢被过度束缚\n爱好：旅游、美食\n希望另一半：\n心地善良，性格温和',
+      bmi: 27.8,
+      hometown: '上海',
+      currentLocation: '东京',
+      occupation: '准备创业中',
+      interests: const <String>['旅游', '美食'],
+      interestIds: const <int>[3, 5],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_500_441', 'profile_women_700_611', 'profile_men_300_286', 'profile_men_400_305', 'profile_men_200_182', 'profile_men_300_257', 'profile_men_300_201', 'profile_men_700_632', 'profile_men_400_307', 'profile_men_600_597'],
+    ),
+    Character(
+      id: 'profile_men_200_127',
+      gender: 'male',
+      age: 25,
+      height: 190,
+      zodiac: '双鱼',
+      mbti: 'ENFP',
+      rawText: '编号127\n\n00年日本音乐大学院修一在读，\n会一点钢琴。\n双鱼座enfp，\n对大多数人都很外向。\n江西人，和父母家庭合睦，\n偶尔抽烟，酒喝的少。\n家里养了一只猫，\n每周有两天左右的空闲时间。\n身高190/145偏瘦，\n会做饭 爱吃但就是不胖，\n想找一个女朋友一起享受生活。\n以上',
+      bmi: 40.2,
+      hometown: '江西',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>['享受生活', '做饭', '宠物', '喝酒', '抽烟', '钢琴'],
+      interestIds: const <int>[107, 29, 26, 35, 108, 17],
+      similarIds: const <String>['profile_men_200_150', 'profile_men_100_80', 'profile_men_300_208', 'profile_men_200_152', 'profile_men_100_24', 'profile_men_200_158', 'profile_men_600_532', 'profile_men_600_539', 'profile_men_400_329', 'profile_men_300_284'],
+    ),
+    Character(
+      id: 'profile_men_200_126',
+      gender: 'male',
+      age: 30,
+      height: 174,
+      rawText: '编号126\n\n95 年 男\n174cm 60kg 成都人\n重邮毕业\n不抽烟 社交场合喝酒\n来日 1 年 上海工作生活 7 年\n性格 内向\n东京 it 公司上班\n自我介绍：\n性格温和，\n喜欢安静专注在手里的事情上，\n偶尔会想要去人群里热闹活泼.\n我很乐于去探索可以带给我不同体验的事物，\n并测试它们哪些能够成为我日常的系统的一部分。\n如果你对滑板/网球/壁球/摄影感兴趣，\n我们可以一起玩儿，\n当然公园散步也是我很喜欢的方式.\n除开这些现充的事情以外，\n文艺和艺术的事物我也会好奇和喜欢，\n关于书籍关于影视作品。\n希望对方：\n笑起来好看的，眼睛大的，好看的。\n会相互理解和鼓励，真诚直率。',
+      bmi: 19.8,
+      hometown: '成都',
+      currentLocation: '东京',
+      occupation: 'it',
+      interests: const <String>['书籍', '散步', '壁球', '影视作品', '摄影', '滑板', '网球'],
+      interestIds: const <int>[109, 47, 110, 111, 2, 13, 112],
+      similarIds: const <String>['profile_men_100_81', 'profile_men_100_8', 'profile_men_300_249', 'profile_men_600_570', 'profile_men_500_430', 'profile_men_100_7', 'profile_men_100_4', 'profile_men_600_534', 'profile_men_600_509', 'profile_men_400_338'],
+    ),
+    Character(
+      id: 'profile_men_200_125',
+      gender: 'male',
+      age: 29,
+      height: 179,
+      mbti: 'ISFP',
+      rawText: '编号125\n\n27岁（96年9月）\n净身高179\n体重常年75前后浮动\n东京在住\n国内山东人\n未来打算日本发展有购房打算\n本科\n工作it\n年收700\n爱好户外运动喜欢大自然，\n健身,旅行，骑车，喜欢尝试新事物\n不抽烟不喝酒不打游戏，会烫头染头\nisfp 和isfj横跳，\n性格属于是情绪稳定，偏温柔类型，\n跟熟人会比较E，积极向上\n\n期待女生\n性格好，三观合得来，周末休息，\n同龄或年下，\n如果同样喜欢户外大自然就更好了',
+      bmi: 23.4,
+      hometown: '山东',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['游戏', '会烫头染头', '健身', '户外', '喜欢尝试新事物', '运动', '旅游', '骑行'],
+      interestIds: const <int>[21, 113, 10, 1, 114, 6, 3, 54],
+      similarIds: const <String>['profile_men_100_81', 'profile_men_300_278', 'profile_men_100_35', 'profile_men_100_31', 'profile_men_100_59', 'profile_men_400_381', 'profile_men_600_534', 'profile_men_300_244', 'profile_men_500_455', 'profile_women_700_614'],
+    ),
+    Character(
+      id: 'profile_men_200_124',
+      gender: 'male',
+      age: 41,
+      height: 179,
+      zodiac: '天蝎',
+      rawText: '编号124\n\n男179cm，75kg\n84年的，独生子\n原生家庭普通父母退休\n老家上海，在东京生活十几年\n普通大学硕士，年收600w➕\n天蝎座\n爱好潜水滑雪健身足球f1电影游戏\n为人正直，品行端正，无不良嗜好\n性格温和搞笑，脾气有点倔强\n爱做家务但不会料理\n未来可考虑润欧美\n蹲一位29～39岁的美女\n身高150-170cm\n有稳定收入日语英语不错就行\n\n- （',
+      bmi: 23.4,
+      hometown: '上海',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['潜水', '滑雪', '健身', '足球', '电影', '游戏'],
+      interestIds: const <int>[36, 14, 10, 41, 4, 21],
+      similarIds: const <String>['profile_men_200_176', 'profile_men_600_535', 'profile_men_300_298', 'profile_men_600_585', 'profile_women_400_318', 'profile_men_600_569', 'profile_men_500_447', 'profile_men_200_165', 'profile_men_400_342', 'profile_men_100_93'],
+    ),
+    Character(
+      id: 'profile_men_200_122',
+      gender: 'male',
+      age: 25,
+      height: 176,
+      rawText: '编号122\n姓名：俞\n2.性别：男\n3.出生年份：2000\n4.籍贯：日籍\n5.身高体重：176/67\n6.学历：高中\n7.居住地：东京 （小岩）\n8.工作：内装\n9、车房 在考虑中\n兴趣爱好（方便找共同点)：健身\n\n择偶标准：\n1:温柔体贴顾家\n2:晚饭要温热\n3:省略一万个字\n\n- （',
+      image: 'https://github.com/141801/info/assets/42635299/a3e602c2-a811-4392-9698-552b5a83ab56',
+      bmi: 21.6,
+      hometown: '日籍',
+      currentLocation: '东京（小岩）',
+      occupation: '内装',
+      interests: const <String>['健身'],
+      interestIds: const <int>[10],
+      similarIds: const <String>['profile_men_100_22', 'profile_men_400_337', 'profile_men_700_626', 'profile_men_500_437', 'profile_men_400_378', 'profile_men_100_7', 'profile_men_600_554', 'profile_men_100_45', 'profile_men_100_65', 'profile_men_400_319'],
+    ),
+    Character(
+      id: 'profile_men_200_115',
+      gender: 'male',
+      age: 31,
+      height: 170,
+      mbti: 'ESFJ',
+      rawText: '编号115\n\n出生年月：1994年8月\n身高：170\n体重：67.5\n出身：吉林\n毕业院校：东工大修士\n工作：建设业设计\n居住地：神奈川川崎\nmbti：esfj\n平时兴趣：喜欢社交，\n工作是纯日本人工作环境，\n所以没什么人玩，\n目前周末经常去剧本杀，\n和朋友约饭\n补充介绍：不抽烟，基本上不喝酒，\n因为个人计划32～35岁左右结婚，\n所以基本上不接受姐弟恋，感谢理解\n\n- （',
+      bmi: 23.5,
+      hometown: '吉林',
+      currentLocation: '神奈川川崎',
+      occupation: '建设业设计',
+      interests: const <String>['桌游', '和朋友约饭', '喜欢社交'],
+      interestIds: const <int>[39, 115, 116],
+      similarIds: const <String>['profile_men_100_4', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_700_635'],
+    ),
+    Character(
+      id: 'profile_men_200_113',
+      gender: 'male',
+      age: 25,
+      height: 172,
+      zodiac: '水瓶座',
+      mbti: 'INFG',
+      rawText: '编号113\n\n男 00年 水瓶座 INFG\n湖北人 现居大阪\n身高体重：裸足172 70kg\n学历：名古屋大学本科法学部\n工作：大阪某建筑公司本社管理部门\n（正在给未来跳槽做打算中，东京地区观望）\n收入：新卒第一年大概400w左右\n兴趣：名胜古迹旅游、ACGN、圣地巡礼、散步\n一些小爱好：歌剧，雅乐，\n历史学、哲学、考古学古生物学相关\n其他：禁烟（无法忍受烟草气味）不喝酒\n\n希望另一半年龄加减五岁之内，\n如果有共同爱好就更好了。\n\n- （',
+      bmi: 23.7,
+      hometown: '湖北',
+      currentLocation: '大阪',
+      occupation: '大阪某建筑公司本社管理部门',
+      interests: const <String>['ACGN', '历史', '旅游', '哲学', '圣地巡礼', '散步', '歌剧', '考古学古生物学相关', '雅乐'],
+      interestIds: const <int>[117, 118, 3, 106, 119, 47, 120, 121, 122],
+      similarIds: const <String>['profile_men_400_304', 'profile_men_600_559', 'profile_women_200_171', 'profile_men_100_22', 'profile_men_400_344', 'profile_men_300_207', 'profile_men_300_292', 'profile_men_700_612', 'profile_men_300_235', 'profile_men_500_444'],
+    ),
+    Character(
+      id: 'profile_men_200_110',
+      gender: 'male',
+      age: 32,
+      height: 174,
+      rawText: '编号110\n\n男，93，江苏南通人。\n174，68kg。\n2022年末到的日本，\n性格（我也不知道是内向还是外向）正常独处，\n喜欢旅游到处走走，拍照，了解接触新鲜事儿，\n画展博物馆。真诚开朗（跟对的人开朗，不论男女）。\n乒乓球象棋烘焙，觉知一二。\n……深层性格偏传统保守，\n希望认识到能处的来有眼缘的妹子。\n略抽烟无瘾，不咋喝酒一喝容易脸红。\n父母正常人有工作趋于双双退休。\n\n- （',
+      bmi: 22.5,
+      hometown: '江苏南通',
+      currentLocation: '日本',
+      occupation: '',
+      interests: const <String>['乒乓球', '了解接触新鲜事儿', '摄影', '旅游', '做饭', '看展', '象棋'],
+      interestIds: const <int>[64, 123, 2, 3, 29, 22, 124],
+      similarIds: const <String>['profile_men_300_239', 'profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409'],
+    ),
+    Character(
+      id: 'profile_men_200_109',
+      gender: 'male',
+      age: 39,
+      height: 178,
+      rawText: '编号109\n\n86虎，178cm， 72kg，\n真诚率性，重情重义，\n敢想敢作敢为。\n离异有双胞胎女儿（7岁）\n暂时在国内，\n计划年底把孩子接到日本来上学，\n五年后直接入日籍。\n\n来日一年有余，\n外资大手管理职，\n年收1000+,刚从东京调到大阪，\n工作经历和社会阅历颇为丰富，\n见过风浪也经历过生死，\n崇尚自由民主。\n\n以下是我对伴侣的期望：\n1，彼此看得上，偏向娇小型。\n2，人品好，相互理解相互支持，\n嫁鸡随鸡，嫁狗随狗就行。\n3，由于工作原因，将来可能会有所调动，\n或许是日本境内，也或许是其它国家。\n所以希望你能经得起折腾😂',
+      bmi: 22.7,
+      currentLocation: '大阪',
+      occupation: '外资大手管理职',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '离异',
+      similarIds: const <String>['profile_men_600_535', 'profile_men_700_636', 'profile_men_600_541', 'profile_men_400_340', 'profile_men_500_413', 'profile_men_100_2', 'profile_men_400_399', 'profile_men_500_489', 'profile_men_500_446', 'profile_men_400_310'],
+    ),
+    Character(
+      id: 'profile_men_200_107',
+      gender: 'male',
+      age: 33,
+      height: 175,
+      zodiac: '双鱼座',
+      mbti: 'ESTJ',
+      rawText: '编号107\n出生年份：1992年\n身高：175cm\n体型：63kg\n出生地：山西\n毕业院校：旧帝大修士\n工作：日资制造业大手\n居住：东京南边\n性格：双鱼座/ESTJ；开朗，善于沟通倾听，情绪比较丰富。\n兴趣：喜欢读书，去博物馆/咖啡店；另外对欧美流行音乐也比较有兴趣。\n其他：本人不吸烟，无饮酒习惯。\n\n对另一半的要求：\n硬性要求：不吸烟；有正确的三观。\n\n对另一半的期待：\n①年龄在92年以后。\n②性格善良/开朗；遇事会主动沟通、不逃避。\n③有健身/运动/学习的习惯。\n④希望找一位能够相互扶持、共同进步的人生伴侣。',
+      image: 'https://github.com/141801/info/assets/42635299/d365e3e1-5e35-46c8-b46b-8a533b7b83a0',
+      bmi: 20.6,
+      hometown: '山西',
+      currentLocation: '东京南边',
+      occupation: '日资制造业大手',
+      interests: const <String>['看展', '咖啡店', '音乐', '阅读'],
+      interestIds: const <int>[22, 125, 7, 25],
+      similarIds: const <String>['profile_men_600_570', 'profile_women_400_336', 'profile_men_300_277', 'profile_men_200_172', 'profile_men_500_474', 'profile_men_600_579', 'profile_women_500_478', 'profile_men_600_561', 'profile_women_600_507', 'profile_men_100_95'],
+    ),
+    Character(
+      id: 'profile_men_200_104',
+      gender: 'male',
+      age: 0,
+      rawText: '编号104 - (',
+      image: 'https://github.com/141801/info/assets/42635299/314f0316-57c7-443d-bee8-518cef23dc33',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_100_4', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_men_200_102',
+      gender: 'male',
+      age: 44,
+      height: 178,
+      zodiac: '白羊',
+      mbti: 'ENTJ',
+      rawText: '编号102\n\n出生年份：1981\n星座：白羊 ENTJ\n籍贯：辽宁\n身高体重：178/70kg\n学历：本科985 211\n居住地：琦玉在住 东京工作\n工作：IT相关\n收入：800+\n兴趣：滑雪 登山 集邮 羽毛球等\n饮食习惯：酸甜苦微辣麻鲜臭都吃。\n\n希望对方：\n88-92，情绪稳定，诚信。\n家庭和睦，无不良嗜好，\n\n[上一页](https://github.com/141801/info/blob/main/men_100.md) [下一页](https://github.com/141801/info/blob/main/men_300.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      bmi: 22.1,
+      hometown: '辽宁',
+      currentLocation: '琦玉在住 东京工作',
+      occupation: 'IT相关',
+      interests: const <String>['滑雪', '爬山', '羽毛球', '集邮'],
+      interestIds: const <int>[14, 20, 40, 126],
+      similarIds: const <String>['profile_women_400_364', 'profile_men_600_535', 'profile_men_500_484', 'profile_men_300_223', 'profile_men_600_569', 'profile_men_300_213', 'profile_men_200_124', 'profile_men_400_346', 'profile_women_400_318', 'profile_men_200_176'],
+    ),
+    Character(
+      id: 'profile_men_300_300',
+      gender: 'male',
+      age: 27,
+      height: 183,
+      zodiac: '天秤',
+      rawText: '编号300\n\n性别：男\n出生：1998年/天秤\n群ID：醒醒\n出生地：黑龙江\n现住：千叶\n身高体重：183/75\n职业：物产店店员（还有做副业）\n爱好：唱歌，户外运动，轮滑，弹弹吉他，\n偶尔打打游戏（还有什么没做过的也可以尝试）\n择偶标准：希望对方比我小点，性格上开朗有爱心\n话比我多的（我是属于聆听的那种话比较少的）\n外表上干净 （只要看的过去就行）\n然后事业上努力就成 共同进步',
+      bmi: 22.4,
+      hometown: '黑龙江',
+      currentLocation: '千叶',
+      occupation: '物产店店员',
+      interests: const <String>['游戏', '唱歌', '吉他', '户外', '运动', '轮滑'],
+      interestIds: const <int>[21, 8, 27, 1, 6, 127],
+      similarIds: const <String>['profile_men_100_15', 'profile_men_500_469', 'profile_men_600_557', 'profile_men_400_357', 'profile_men_600_595', 'profile_men_400_333', 'profile_men_100_75', 'profile_men_600_573', 'profile_men_200_125', 'profile_men_300_215'],
+    ),
+    Character(
+      id: 'profile_men_300_298',
+      gender: 'male',
+      age: 41,
+      height: 174,
+      zodiac: '狮子座',
+      rawText: '编号298\n\n个人信息\n◇性格タイプ : 开朗，乐观型\n◇星座 :♌️\n◇生年月日: 84年\n◇国籍: 中国\n◇戸籍地 : 哈尔滨\n◇現住所 : 东京\n◇身長: 174\n◇体重: 77\n◇最終学歴 : MBA\n◇ご職業: 饮食业、法人\n◇ご年収: 1000w➕\n◇日本語程度：N1\n◇签证类型： 永住\n◇婚歴 : 未婚\n◇家族との同居 : 无\n◇趣味 : 滑雪、海钓、自驾旅游，烹饪、\n\n◇自己PR：\n做一手好菜，喜欢小孩，工作收入都稳定，房、车、齐全\n◇择偶条件：\n希望88～92\n有爱心，孝顺父母，性格开朗，身高160cm以上，不丁克\n学历与收入并不重要❗️\n还希望对方是想结婚，好好过日子的。\n因为我不是帅哥，所以我不要求对方是美女，彼此有眼缘就好',
+      bmi: 25.4,
+      hometown: '哈尔滨',
+      currentLocation: '东京',
+      occupation: '饮食业、法人',
+      interests: const <String>['海钓', '滑雪', '做饭', '自驾', '旅游'],
+      interestIds: const <int>[128, 14, 29, 15, 3],
+      hasHouse: true,
+      hasCar: true,
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_600_535', 'profile_men_300_283', 'profile_men_500_447', 'profile_men_200_124', 'profile_men_200_176', 'profile_men_100_93', 'profile_women_400_318', 'profile_women_600_526', 'profile_men_400_342', 'profile_men_500_484'],
+    ),
+    Character(
+      id: 'profile_men_300_297',
+      gender: 'male',
+      age: 30,
+      mbti: 'I',
+      rawText: '编号297\n希望可以認識下\n性别：男\n出生年份：1995年8月\n籍贯：广东 母语是广东话\n居住地：神奈川平塚\n来日7年 学历：专门\n工作：整備士年收400左右\n兴趣爱好：运动方面基本都喜欢..（滑雪）\n性格：比较慢热…I人。基本都是一个人行动\n…希望的另一半\n住得近一点就好..',
+      image: 'https://github.com/user-attachments/assets/5d7490f2-094e-4d96-9a5d-6aef65185bb0',
+      hometown: '广东',
+      currentLocation: '神奈川平塚',
+      occupation: '整備士',
+      interests: const <String>['滑雪', '运动'],
+      interestIds: const <int>[14, 6],
+      similarIds: const <String>['profile_men_600_520', 'profile_men_100_21', 'profile_men_100_4', 'profile_men_100_94', 'profile_women_300_233', 'profile_men_500_404', 'profile_men_100_84', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63'],
+    ),
+    Character(
+      id: 'profile_men_300_295',
+      gender: 'male',
+      age: 34,
+      height: 174,
+      zodiac: '白羊',
+      rawText: '编号295\n\n性别:男\n出生年份:1991\n星座:白羊 籍贯:湖北\n身高体重:174/65kg\n学历:专门\n居住地:东京\n来日:7年\n工作:不動産\n兴趣:羽毛球、爬山、户外、旅游,对方的爱好也会去陪伴。其他介绍:性格开朗、温柔爱笑、不抽烟 很少喝酒。\n希望对方:\n性格:活泼开朗 五官端正、善良、不要太i就行、相互交流，一起去体验新事物、身高: 别比我高就行~\n身体健康，有自己的爱好、没有冷暴力。比较注重感觉\n我认为两个人的爱情是从相识▷相知，然后相爱到相守。',
+      bmi: 21.5,
+      hometown: '湖北',
+      currentLocation: '东京',
+      occupation: '不動産',
+      interests: const <String>['对方的爱好也会去陪伴', '户外', '旅游', '爬山', '羽毛球'],
+      interestIds: const <int>[129, 1, 3, 20, 40],
+      similarIds: const <String>['profile_men_100_57', 'profile_women_400_380', 'profile_men_500_417', 'profile_men_600_593', 'profile_men_600_570', 'profile_women_600_507', 'profile_men_400_305', 'profile_men_300_288', 'profile_men_400_361', 'profile_women_200_190'],
+    ),
+    Character(
+      id: 'profile_men_300_294',
+      gender: 'male',
+      age: 28,
+      height: 160,
+      zodiac: '天秤座',
+      mbti: 'ESFP',
+      rawText: '编号294\n现住：东京都中野区\n来日：7年\n出生地：江苏盐城\n性别：男\n年龄： 1997\n身高体重：160/54\n学历：上智本科+早大修士\n职业：外资金融（精算）\n年收：500+\n星座：天秤座\nmbti：ESFP\n爱好：滑雪，读书，散步\n其他：不抽烟，有时候小喝一点酒。\n原生家庭：家庭和睦，喜欢拌嘴但是是正常人类\n未来规划：在东京定居，明年申请永驻\n\n情绪可太稳定了，性格是真的温和。\n善于站在别人角度考虑问题\n\n希望的另一半：\n上下五岁以内，身高 不介意我的就行哈哈\n有事希望可以沟通，我有时候真的猜不出来。\n以后打算在东京长期发展。',
+      image: 'https://github.com/user-attachments/assets/f1502ae2-3657-4d5e-8238-5f6d695469ea',
+      bmi: 21.1,
+      hometown: '江苏盐城',
+      currentLocation: '东京都中野区',
+      occupation: '外资金融（精算）',
+      interests: const <String>['散步', '有时候小喝一点酒', '滑雪', '阅读'],
+      interestIds: const <int>[47, 130, 14, 25],
+      similarIds: const <String>['profile_women_400_354', 'profile_women_200_103', 'profile_women_500_480', 'profile_women_400_363', 'profile_women_600_545', 'profile_women_200_196', 'profile_women_200_186', 'profile_women_600_594', 'profile_men_300_209', 'profile_men_500_416'],
+    ),
+    Character(
+      id: 'profile_men_300_292',
+      gender: 'male',
+      age: 27,
+      zodiac: '白羊',
+      mbti: 'ESFJ',
+      rawText: '编号292\n\n98，男，esfj，\n平平无奇路人丙，热心市民肥胖青年陈先生，\n白羊座，户籍浙江宁波，杭州，宁波，上海，都很熟，\n祖上上海，国内养猫，房车自由，苦逼考研人，\n热爱旅游美食，热爱健身，健身就是为了吃更好吃的东西，\n追动漫，佛系追星杰伦俊杰，\n二十年老粉，废话晚期患者。',
+      hometown: '浙江宁波',
+      currentLocation: '杭州',
+      occupation: '考研人',
+      interests: const <String>['健身', '旅游', '美食', '动漫', '追星'],
+      interestIds: const <int>[10, 3, 5, 23, 131],
+      hasHouse: true,
+      hasCar: true,
+      similarIds: const <String>['profile_men_700_631', 'profile_women_200_171', 'profile_men_600_559', 'profile_men_700_612', 'profile_men_600_544', 'profile_men_100_22', 'profile_women_100_96', 'profile_men_600_599', 'profile_men_500_437', 'profile_men_400_344'],
+    ),
+    Character(
+      id: 'profile_men_300_291',
+      gender: 'male',
+      age: 32,
+      height: 163,
+      rawText: '编号291\n【名字】\n啊海\n【基本信息】\n93年广东人，IT行业\n【学历】\n本科\n【年收】\n约900万（主业600➕副业300），国内有房子出租，每个月5k人民币\n【身高体重】\n163，98🥹🥹，身体健康无遗传病\n【自我介绍】\n4年社会人，在东京工作，住琦玉。\ni人，不抽烟不喝酒不太爱出门，喜欢宅家。\n爱好打游戏，唱歌，做饭。会做煲仔饭，会煲汤。\n物欲比较低，除了衣食住行，一般只花钱在游戏上，一个月大概1～2万。\n主要玩pc，ps5，switch。\n性格比较随和，情绪稳定，基本没有太大的波动。\n高强度冲浪选手，跟朋友会说抽象话，同时也是朋友口中的老好人。\n\n希望你（非必须）：\n【年纪】\n年纪比我小或者大我3岁以\n【出身】\n最好是南方人\n【身高体重】\n身高体重不限（不嫌弃我个子小就好🥹🥹），bmi正常。身体健康无遗传病。\n【兴趣爱好】\n不抽烟或少抽，不酗酒。有自己的兴趣爱好',
+      image: 'https://github.com/user-attachments/assets/ad0189f4-a610-4ca6-9590-6a17d7da73d2',
+      bmi: 18.4,
+      hometown: '广东',
+      currentLocation: '东京（住琦玉）',
+      occupation: 'IT行业',
+      interests: const <String>['ps5', 'switch', '会做煲仔饭', '会煲汤', '做饭', '唱歌', '游戏', '玩pc'],
+      interestIds: const <int>[132, 133, 134, 135, 29, 8, 21, 136],
+      hasHouse: true,
+      similarIds: const <String>['profile_women_100_39', 'profile_women_200_134', 'profile_women_700_619', 'profile_women_600_542', 'profile_men_100_8', 'profile_women_500_458', 'profile_women_400_321', 'profile_women_400_383', 'profile_women_400_335', 'profile_women_400_377'],
+    ),
+    Character(
+      id: 'profile_men_300_288',
+      gender: 'male',
+      age: 35,
+      height: 170,
+      zodiac: '摩羯',
+      rawText: '编号288\n出生年份：1990\n最终学历：名古屋大学博士\n星座：摩羯\n籍贯：安徽蚌埠\n身高：170\n住所：静冈富士（每周末都去东京）\n工作：医疗技术开发IT\n年收：600\n父母：国内体制内退休\n兴趣：滑雪，爬山，旅游，动漫，迪士尼\n\n希望：三观一致',
+      image: 'https://github.com/user-attachments/assets/1506bc45-4537-4194-bd9d-0c5aa476bff4',
+      hometown: '安徽蚌埠',
+      currentLocation: '静冈富士（每周末都去东京）',
+      occupation: '医疗技术开发IT',
+      interests: const <String>['动漫', '旅游', '滑雪', '爬山', '迪士尼'],
+      interestIds: const <int>[23, 3, 14, 20, 137],
+      similarIds: const <String>['profile_women_500_459', 'profile_men_400_360', 'profile_men_400_305', 'profile_men_100_2', 'profile_women_400_380', 'profile_men_600_593', 'profile_women_200_153', 'profile_men_300_295', 'profile_men_600_570', 'profile_women_700_627'],
+    ),
+    Character(
+      id: 'profile_men_300_286',
+      gender: 'male',
+      age: 32,
+      height: 180,
+      rawText: '编号286\n性别：男\n出生年：1993\n出生地：辽宁丹东\n民族：汉\n现住：东京中野区\n身高体重：180/87\n在日：8年，打算定居日本，永驻/日籍未定\n职业：日本得物仓库管理\n爱好：健身，各项运动，旅游，唱歌，画画，萨克斯\n感情状况：未婚单身\n性格：随和，幽默大方，干净利索，无暴力倾向\n家庭情况：是独生子，家庭和睦，父母健康明白事理，不给儿女添麻烦\n不抽烟，无纹身；和朋友在一起时会喝一点酒但很少，平时不喝\n希望对方：细心，善良，温柔',
+      image: 'https://github.com/user-attachments/assets/7418c83f-9609-4098-a799-c37dee77e633',
+      bmi: 26.9,
+      hometown: '辽宁丹东',
+      currentLocation: '东京中野区',
+      occupation: '日本得物仓库管理',
+      interests: const <String>['健身', '运动', '唱歌', '旅游', '画画', '萨克斯'],
+      interestIds: const <int>[10, 6, 8, 3, 18, 138],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_200_182', 'profile_men_100_69', 'profile_men_500_455', 'profile_men_200_128', 'profile_men_100_68', 'profile_women_700_611', 'profile_men_300_201', 'profile_men_500_441', 'profile_men_400_381', 'profile_men_600_597'],
+    ),
+    Character(
+      id: 'profile_men_300_285',
+      gender: 'male',
+      age: 25,
+      height: 183,
+      rawText: '编号285\n\n出生年：2000\n国籍：中国\n户籍地：辽宁\n现住：东京都荒川区\n身高：183\n体重：75kg\n学历：专门学校\n婚歴：未婚单身\n工作：正社员\n喜欢音乐，看电影，做饭，旅行。\n来日本5年。未来定居日本。\n\n期待另一半：\n年龄：上下不差6岁\n身高：不限\n婚歴：未婚单身\n性格开朗。心地善良',
+      bmi: 22.4,
+      hometown: '辽宁',
+      currentLocation: '东京都荒川区',
+      occupation: '正社员',
+      interests: const <String>['做饭', '音乐', '旅游', '电影'],
+      interestIds: const <int>[29, 7, 3, 4],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_400_347', 'profile_men_100_31', 'profile_men_400_366', 'profile_men_100_7', 'profile_men_600_554', 'profile_men_600_559', 'profile_men_500_444', 'profile_men_300_284', 'profile_men_400_319', 'profile_men_100_22'],
+    ),
+    Character(
+      id: 'profile_men_300_284',
+      gender: 'male',
+      age: 26,
+      height: 183,
+      rawText: '编号284\n\n性别 ：男\n出生年：1999\n出生地：河北（天津户口）\n现住 ：东京 台东区\n身高体重：183/85\n在日 ：东京大学修士2年后 继续在东京大学 博士课程\n职业：研究员，年收300w\n爱好 ：自驾 旅行 遛弯 运动\n感情状态： 未婚单身\n感情经历比较少 圈子小 性格可I可E\n河北出生老家黑龙江小初高本科都在天津\n偏理性 随和 有事及时沟通解决\n喜欢说走就走的旅行\n家庭情况：够我花，但也不想太依赖家里 生活没啥压力\n希望对方 ：年龄相差+3~-5以内，不吸烟无纹身\n希望两个人的相处是给互相的生活加分而不是妥协\n工作稳定 不冷战 有事及时沟通\n想在东京长期发展的女生',
+      bmi: 25.4,
+      hometown: '河北（天津户口）',
+      currentLocation: '东京 台东区',
+      occupation: '研究员',
+      interests: const <String>['旅游', '自驾', '运动', '遛弯'],
+      interestIds: const <int>[3, 15, 6, 139],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_200_158', 'profile_men_400_327', 'profile_men_300_285', 'profile_men_400_366', 'profile_men_100_65', 'profile_men_400_333', 'profile_men_400_304', 'profile_men_600_580', 'profile_men_200_125', 'profile_men_600_539'],
+    ),
+    Character(
+      id: 'profile_men_300_283',
+      gender: 'male',
+      age: 40,
+      height: 167,
+      mbti: 'ESTP',
+      rawText: '编号283\n性别 ：男\n出生年：1985\n出生地：吉林长春\n现住 ：东京都江户川区\n身高体重：167/72（最近开始在控制饮食和做有氧）\n在日 ：15年\n学历 ：硕士\n职业 ：供应商管理\n收入 ：700w＋\n不动产：江户川区一套一户建（贷款），松户一套公寓（全款出租中）\nmbti ：ESTP\n爱好 ：登山，露营，旅游\n感情状态： 未婚单身\n性格 ：情绪稳定，慢热幽默型。对爱情忠贞。\n平时有空会自己做饭，周末基本一天外出一天在家模式。\n希望对方 ：乐观开朗，有事积极沟通。对家庭和孩子有向望。',
+      image: 'https://github.com/user-attachments/assets/44f61647-2e03-4184-82f5-69569bee87b7',
+      bmi: 25.8,
+      hometown: '吉林长春',
+      currentLocation: '东京都江户川区',
+      occupation: '供应商管理',
+      interests: const <String>['旅游', '爬山', '做饭', '户外'],
+      interestIds: const <int>[3, 20, 29, 1],
+      hasHouse: true,
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_300_298', 'profile_women_600_526', 'profile_women_600_564', 'profile_men_500_447', 'profile_men_600_535', 'profile_women_200_190', 'profile_men_100_2', 'profile_men_600_503', 'profile_men_400_348', 'profile_women_400_318'],
+    ),
+    Character(
+      id: 'profile_men_300_279',
+      gender: 'male',
+      age: 32,
+      height: 170,
+      mbti: 'INFP',
+      rawText: '编号279\n性别 ：男\n出生年：1993\n出生地：浙江\n现住 ：宇都宫（东京地区可以每周都见面）\n身高体重：170/80（最近开始在控制饮食和做有氧）\n在日 ：12年\n学历 ：硕士\n职业 ：整车制造业，开发职\n收入 ：600w\nmbti ：INFP\n爱好 ：摩旅，自驾游，滑雪，露营，摄影，自行车 等\n感情状态： 未婚单身\n性格 ：性格比较稳定，相对比较内向，\n但是熟络了以后是个逗比。\n比起宅家，更喜欢在外面野。\n兴趣爱好广泛，对于新的兴趣爱好的想法也比较多。\n希望对方 ：外向阳光，乐观向上，兴趣爱好广泛，\n不要求大富大贵，只希望能一起经营好我们自己的一亩三分地。',
+      image: 'https://github.com/user-attachments/assets/729735b5-9c32-423b-8683-2a61535e080a',
+      bmi: 27.7,
+      hometown: '浙江',
+      currentLocation: '宇都宫',
+      occupation: '整车制造业开发职',
+      interests: const <String>['摄影', '摩旅', '滑雪', '骑行', '自驾', '户外'],
+      interestIds: const <int>[2, 140, 14, 54, 15, 1],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_women_700_611', 'profile_men_300_258', 'profile_men_600_597', 'profile_men_400_395', 'profile_men_200_161', 'profile_men_300_241', 'profile_men_300_257', 'profile_men_600_522', 'profile_men_500_455', 'profile_men_700_601'],
+    ),
+    Character(
+      id: 'profile_men_300_278',
+      gender: 'male',
+      age: 29,
+      height: 178,
+      rawText: '编号278\n\n性别 ：男\n出生年：1996\n出生地：吉林延边\n民族：朝鲜族\n现住 ：东京 江东区\n身高体重：178/75\n在日 ：刚赴日 打算拿永驻 在日长居\n职业 ：IT\n爱好 ：露营 徒步 游泳 滑雪\n感情状态： 未婚单身\n感情经历比较少 圈子小 性格可I可E\n纯东北人 但不烟酒 情绪稳定 性格温和\n偏理性 随和 有事及时沟通解决\n喜欢说走就走的旅行\n家庭情况：父母在韩国 他们都有自己的存款\n没啥压力 偶尔会去看他们\n希望对方 ：年龄相差5岁以内 身高160以上\n工作稳定 不冷战 有事及时沟通\n想在东京长期发展的女生',
+      bmi: 23.7,
+      hometown: '吉林延边',
+      currentLocation: '东京 江东区',
+      occupation: 'IT',
+      interests: const <String>['徒步', '游泳', '滑雪', '旅游', '户外'],
+      interestIds: const <int>[11, 19, 14, 3, 1],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_100_81', 'profile_men_400_375', 'profile_men_200_125', 'profile_men_300_227', 'profile_men_200_179', 'profile_men_600_517', 'profile_men_500_455', 'profile_men_500_430', 'profile_men_400_327', 'profile_men_400_381'],
+    ),
+    Character(
+      id: 'profile_men_300_277',
+      gender: 'male',
+      age: 34,
+      height: 177,
+      rawText: '编号277\n出生年：1991\n国籍：中国\n户籍地：辽宁\n现住：东京都立川市\n身高：177\n体重：65kg\n学历：985本科\n婚歴：未婚单身\n烟酒：有酒量 只是应酬会喝 抽电子烟 不会戒烟\n工作：精密电化正社员\n喜欢音乐，看电影，萨克斯，做饭，旅行。\n来日本七年。未来定居日本。在东京购房。\n\n期待另一半：\n年龄：25-35\n身高：160+\n婚歴：未婚单身\n心地善良。没有礼貌直接拉黑。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/14506442-ed74-4a3f-b38c-e8b953fea379',
+      bmi: 20.7,
+      hometown: '辽宁',
+      currentLocation: '东京都立川市',
+      occupation: '精密电化正社员',
+      interests: const <String>['做饭', '音乐', '旅游', '电影', '萨克斯'],
+      interestIds: const <int>[29, 7, 3, 4, 138],
+      hasHouse: true,
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_200_155', 'profile_men_500_419', 'profile_men_600_570', 'profile_men_600_600', 'profile_men_500_428', 'profile_men_500_423', 'profile_women_400_380', 'profile_men_400_361', 'profile_women_400_336', 'profile_women_400_315'],
+    ),
+    Character(
+      id: 'profile_men_300_275',
+      gender: 'male',
+      age: 37,
+      height: 180,
+      rawText: '编号275\n\n个人信息\n性别：男\n出生：北京（已日籍）\n出生年：88年，未婚\n身高：180cm\n体重：85kg\n学历：硕士\n工作：大手外资（制造业）\n年收：800万日元\n现居住地：千叶\n兴趣爱好：骑行，开车，旅游，拍摄，不抽烟，酒量少\n其他：性格温和、人老实、话不多、脾气好\n\n对女方的要求：\n·32岁以下，身高160以上，未婚\n·本科以上、有N1水平、有稳定工作\n·身体健康，不抽烟、宠物不太多\n\n- （',
+      bmi: 26.2,
+      hometown: '北京',
+      currentLocation: '千叶',
+      occupation: '大手外资（制造业）',
+      interests: const <String>['自驾', '摄影', '旅游', '酒量少', '骑行'],
+      interestIds: const <int>[15, 2, 3, 141, 54],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_400_310', 'profile_men_300_220', 'profile_men_100_93', 'profile_men_500_413', 'profile_men_600_503', 'profile_men_700_632', 'profile_men_400_348', 'profile_men_200_143', 'profile_men_200_109', 'profile_men_100_83'],
+    ),
+    Character(
+      id: 'profile_men_300_274',
+      gender: 'male',
+      age: 32,
+      height: 174,
+      mbti: 'INFJ',
+      rawText: '编号274\n出生年月：1993.02\n最终学历：修士\nMBTI：INFJ\n籍贯：辽宁葫芦岛\n身高:174CM\n体重：65KG\n身份：永住\n住所：西川口（已购房，一户建）\n工作：IT咨询\n年收：800+\n兴趣：乐器，读书，做饭，游戏，台球，看LIVE，旅游等\n自我介绍：我是一个性格稳重、踏实的人，喜欢简单而充实的生活。\n不抽烟，不酗酒，无不良嗜好。爱干净，经常整理房间。\n想谈一场以结婚为前提的恋爱。\n\n希望：真诚，性格温柔，大方，两人能互相欣赏，互相尊重，也给彼此空间，\n有事好说话，实现相互奔赴。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/ba6549eb-df41-4012-b592-244940cd41ce',
+      bmi: 21.5,
+      hometown: '辽宁葫芦岛',
+      currentLocation: '西川口',
+      occupation: 'IT咨询',
+      interests: const <String>['乐器', '做饭', '台球', '旅游', '游戏', '看LIVE', '阅读'],
+      interestIds: const <int>[142, 29, 49, 3, 21, 143, 25],
+      hasHouse: true,
+      similarIds: const <String>['profile_women_500_499', 'profile_men_600_514', 'profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16'],
+    ),
+    Character(
+      id: 'profile_men_300_271',
+      gender: 'male',
+      age: 37,
+      height: 183,
+      zodiac: '天秤座',
+      rawText: '编号271\n\n星座：天秤座 E\n出生年：1988\n年龄：36\n户籍地：辽宁\n現住：神奈川 登户\n身高：183\n体重：79kg\n最终学历：大学\n职业：贸易进出口\n爱好：健身跑步游泳，户外爬山，吃烧烤\n個性：说不明白希望对方慢慢发觉\n希望伴侶：\n简单直接坦诚相处，可以有自己的性格\n任性撒泼都不是问题，相对保守一些，\n不要酒吧夜店玩的很疯那种\n\n- （',
+      bmi: 23.6,
+      hometown: '辽宁',
+      currentLocation: '神奈川 登户',
+      occupation: '贸易进出口',
+      interests: const <String>['健身', '跑步', '游泳', '吃烧烤', '户外', '爬山'],
+      interestIds: const <int>[10, 53, 19, 144, 1, 20],
+      similarIds: const <String>['profile_men_400_372', 'profile_men_200_180', 'profile_men_400_362', 'profile_men_500_446', 'profile_men_700_636', 'profile_men_500_414', 'profile_men_400_388', 'profile_men_200_165', 'profile_men_400_340', 'profile_men_100_64'],
+    ),
+    Character(
+      id: 'profile_men_300_270',
+      gender: 'male',
+      age: 35,
+      height: 165,
+      zodiac: '水瓶座',
+      mbti: 'ENTP',
+      rawText: '编号270\n\n星座：水瓶座 ENTP\n出生年：1990\n年龄：34\n户籍地：台灣\n現住：埼玉川口\n身高：165\n体重：62\n最终学历：專門\n职业：舞台LED架設\n日语：N2\n爱好：釣魚 養魚 園藝 開車兜風 旅遊 做飯（黑暗料理）\n手遊\n*關於不良嗜好：\n會抽菸但原則是家裡不抽、\n不喜歡煙味的人面前不抽、\n自己的車裡不抽、不喝酒不賭博\n\n個性：\n慢熱（？）熟起來瘋瘋癲癲的，分享欲強，\n路邊看到漂亮小蟲子都能拍照說的那種，\n會主動報備、打遊戲釣魚發個訊息都能找得到人、事事有回應\n\n希望伴侶：\n有主見、主要喜歡被人管自己管不住自己😂\n性格兇一點沒關係，主要是有雙方之間有問題不要拖\n\n- （',
+      bmi: 22.8,
+      hometown: '台灣',
+      currentLocation: '埼玉川口',
+      occupation: '舞台LED架設',
+      interests: const <String>['做饭', '園藝', '旅游', '釣魚', '開車兜風', '養魚'],
+      interestIds: const <int>[29, 145, 3, 146, 147, 148],
+      similarIds: const <String>['profile_men_600_514', 'profile_men_600_565', 'profile_women_500_459', 'profile_women_200_191', 'profile_women_500_475', 'profile_men_400_339', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129'],
+    ),
+    Character(
+      id: 'profile_men_300_268',
+      gender: 'male',
+      age: 43,
+      height: 172,
+      rawText: '编号268\n\n◇姓名 :馬俊\n◇出生日期:1982\n◇年龄 :41\n◇出生地 :吉林\n◇現住址 :琦玉县川口市\n◇电话 :080-9876-5888\n◇身高:172\n◇体重 :65公斤\n◇学历 :初中\n◇职业:自营\n◇血液型 :B\n◇日本語程度 :简单\n◇休息日 :周六周日\n◇婚姻状况 :离异\n◇离婚日:2013年\n◇同居者有无 :无\n◇酒 :有\n◇烟 :有\n◇爱好 :运动\n◇孩子有无抚养权 :有。\n希望对女方要求，开朗善良年龄在33至42岁\n\n- （',
+      bmi: 22.0,
+      hometown: '吉林',
+      currentLocation: '琦玉县川口市',
+      occupation: '自营',
+      interests: const <String>['运动'],
+      interestIds: const <int>[6],
+      maritalStatus: '离异',
+      similarIds: const <String>['profile_men_500_484', 'profile_men_200_189', 'profile_women_400_364', 'profile_men_600_535', 'profile_men_600_523', 'profile_men_400_346', 'profile_men_200_181', 'profile_men_500_447', 'profile_women_600_537', 'profile_women_400_318'],
+    ),
+    Character(
+      id: 'profile_men_300_267',
+      gender: 'male',
+      age: 31,
+      rawText: '编号267\n我叫jun\n坐标：栃木県宇都宮市\n出生地：湖北省\n生日：1994年10月\n任职于：某制造业超大手正社员\n年收入：550+\n兴趣爱好：自驾游 唱歌 足球 海外旅行\n对她的期待：29周岁以内。\n不隐瞒，不欺骗，真诚相待。\n兴趣爱好可以不同，愿意分享倾听与沟通。\n对基督教信仰不排斥，尊重包容。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/b5e32f5a-6e83-4e3f-a66d-c0d01d92cebe',
+      hometown: '湖北省',
+      currentLocation: '栃木県宇都宮市',
+      occupation: '某制造业超大手正社员',
+      interests: const <String>['唱歌', '旅游', '自驾', '足球'],
+      interestIds: const <int>[8, 3, 15, 41],
+      similarIds: const <String>['profile_men_600_519', 'profile_men_100_4', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409'],
+    ),
+    Character(
+      id: 'profile_men_300_258',
+      gender: 'male',
+      age: 31,
+      height: 175,
+      zodiac: '天秤座',
+      rawText: '编号258\n\n94年\n星座：天秤座\n身高体重175/83\n居住：现居住在長野过一段会去东京发展 老家黑龙江哈尔滨\n工作： 刚考完二种打算去当司机\n性格：有点社恐 大大咧咧 情绪稳定 脾气还客气\n兴趣爱好：喜欢开车 看风景 玩游戏 看小说 听音乐\n抽烟（可戒）酒还真不怎么喝 有点宅\n择偶标准：情绪稳定 不吸烟 互相能看的上眼\n虽然做不到给你最好的但是也不会太差 事事有回应\n看到信息就会回 我希望我能做到的对方也能做到 真诚找对象\n\n- （',
+      bmi: 27.1,
+      hometown: '黑龙江哈尔滨',
+      currentLocation: '長野',
+      occupation: '司机',
+      interests: const <String>['音乐', '自驾', '游戏', '阅读', '看风景'],
+      interestIds: const <int>[7, 15, 21, 25, 149],
+      similarIds: const <String>['profile_men_600_597', 'profile_men_300_241', 'profile_men_400_374', 'profile_men_400_329', 'profile_men_600_539', 'profile_men_300_279', 'profile_men_600_522', 'profile_women_700_611', 'profile_men_500_471', 'profile_men_200_161'],
+    ),
+    Character(
+      id: 'profile_men_300_257',
+      gender: 'male',
+      age: 34,
+      height: 172,
+      rawText: '编号257\n\n性别：男\n出生年：1991\n出身地：山东\n现住：东京\n身高体重：172/76kg\n职业：大学教师\n学历：博士（理工类）\n年收：700+\n感情状态：单身未婚\n爱好：喜欢逛动物园海洋馆博物馆美术馆（不懂但爱看），\n也喜欢city walk探索大自然。\n工作需要家里有很多书，但其实更爱追剧看电影。\n偶尔玩玩switch。\n其他：\n性格温和，乐观向上，包容力强，有责任心。\n圈子很小，不抽烟，不爱喝酒，无不良嗜好。\n喜欢动物和小孩子\n\n期待的女生：\n有长期生活在东京的打算\n对待感情认真专一，心地善良\n愿意分享鸡毛蒜皮日常\n\n- （',
+      bmi: 25.7,
+      hometown: '山东',
+      currentLocation: '东京',
+      occupation: '大学教师',
+      interests: const <String>['散步', '户外', '也喜欢city', '偶尔玩玩switch', '喜欢动物和小孩子', '看展', '追剧', '电影'],
+      interestIds: const <int>[47, 1, 150, 151, 152, 22, 24, 4],
+      maritalStatus: '单身未婚',
+      similarIds: const <String>['profile_men_400_307', 'profile_men_300_201', 'profile_women_700_611', 'profile_men_700_605', 'profile_men_600_593', 'profile_men_200_182', 'profile_men_600_570', 'profile_men_500_441', 'profile_men_500_460', 'profile_men_600_522'],
+    ),
+    Character(
+      id: 'profile_men_300_252',
+      gender: 'male',
+      age: 32,
+      height: 175,
+      rawText: '编号252\n\n2.性别：男\n3.出生年份：1993\n4.籍贯：天津\n5.身高体重：175 130\n6.学历：博士\n7.居住地：东京\n8.工作：香水贸易\n9.兴趣爱好（方便找共同点)：羽毛球，美食，唱歌，camping\n10.择偶标准 希望她和我可以有 共同价值观，耐心，温柔，积极的生活态度，愿意尝试新事物\n\n- （',
+      bmi: 21.2,
+      hometown: '天津',
+      currentLocation: '东京',
+      occupation: '香水贸易',
+      interests: const <String>['camping', '唱歌', '美食', '羽毛球'],
+      interestIds: const <int>[153, 8, 5, 40],
+      similarIds: const <String>['profile_men_600_570', 'profile_men_600_600', 'profile_men_600_561', 'profile_men_500_423', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73'],
+    ),
+    Character(
+      id: 'profile_men_300_249',
+      gender: 'male',
+      age: 30,
+      height: 175,
+      rawText: '编号249\n出生年：1995\n年龄：29\n国籍：中国\n户籍地：广东\n现住：八王子\n身高：175\n体重：60kg\n最终学历：专门（在学中）\n婚歴：未婚单身\n喜欢动漫，看电影，开车，做饭，平常比较宅，\n偶尔去周边东京周边県玩，\n喜欢自然风光。\n休息日两个人，\n一起去超市逛逛，买买菜，\n或者周边走走，\n简单的生活。\n来日两年，性格温和情绪稳定，待人真诚。\n\n期待另一半：\n年龄：25-30\n身高：160+\n婚歴：未婚单身\n性格温和情绪稳定\n\n- （',
+      image: 'https://github.com/user-attachments/assets/9a81b739-e824-4773-a1b8-bd324a95dc4e',
+      bmi: 19.6,
+      hometown: '广东',
+      currentLocation: '八王子',
+      occupation: '',
+      interests: const <String>['做饭', '偶尔去周边东京周边県玩', '动漫', '喜欢自然风光', '平常比较宅', '自驾', '电影'],
+      interestIds: const <int>[29, 154, 23, 155, 156, 15, 4],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_500_419', 'profile_women_600_594', 'profile_men_300_216', 'profile_men_400_330', 'profile_men_100_81', 'profile_men_600_509', 'profile_men_200_126', 'profile_men_600_534', 'profile_men_100_8', 'profile_men_500_430'],
+    ),
+    Character(
+      id: 'profile_men_300_247',
+      gender: 'male',
+      age: 28,
+      height: 177,
+      zodiac: '水瓶座',
+      mbti: 'ENTP',
+      rawText: '编号247\n\n性别：男\n年龄：97 年（27 岁）\n身高：177\n体重：65\n学历：硕士（早大理工）\n工作：半导体大手正社员第二年\n来日：5 年（永住申请中）\n年收：500+\n国内：常州\n坐标：川崎\n水瓶座/ENTP\n独子 父母都在常州 回国就是 enfp 快乐小狗\n兴趣爱好：滑雪，陆冲，旅游，以前打王者\n拼拼乐高，最近在研究相机和冰岛旅行。\n有只猫猫（三岁了）\n\n- （',
+      bmi: 20.7,
+      hometown: '常州',
+      currentLocation: '川崎',
+      occupation: '半导体大手正社员',
+      interests: const <String>['旅游', '游戏', '乐高', '滑雪', '摄影', '陆冲'],
+      interestIds: const <int>[3, 21, 56, 14, 2, 157],
+      similarIds: const <String>['profile_men_600_520', 'profile_men_400_349', 'profile_men_700_631', 'profile_men_100_84', 'profile_men_600_534', 'profile_men_500_418', 'profile_men_100_21', 'profile_men_500_470', 'profile_men_100_12', 'profile_men_100_85'],
+    ),
+    Character(
+      id: 'profile_men_300_245',
+      gender: 'male',
+      age: 31,
+      height: 181,
+      zodiac: '巨蟹',
+      rawText: '编号245\n94.\n181.70.\n985本中退，日本上位国公立城乡规划，旧帝大环境科学硕，博士中退。\n正常，偏白\n三人核心家庭，独生\n牡丹+处，不烟，只喝水果味的酒到微醺🥴，大学时期有2.3个和我女生表达过想交往。没谈因为忙\n巨蟹\nmbti看心情\n小时候是画画，现在喜欢看各方向专业书（浅尝辄止程度），喜欢逛各大学校校区\n主也在找中（原it，现在想继续环境保护追梦），副业给一个老板办日本升学私塾（部门主管）\n\n- （',
+      image: 'https://github.com/user-attachments/assets/e8bb1b34-4718-4715-9d26-50011aced6aa',
+      bmi: 21.4,
+      currentLocation: '',
+      occupation: '主也在找中（原it，现在想继续环境保护追梦），副业给一个老板办日本升学私塾（部门主管）',
+      interests: const <String>['喜欢逛各大学校校区', '画画'],
+      interestIds: const <int>[158, 18],
+      maritalStatus: '牡丹+处',
+      similarIds: const <String>['profile_men_500_471', 'profile_men_600_561', 'profile_men_100_84', 'profile_men_100_4', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73'],
+    ),
+    Character(
+      id: 'profile_men_300_244',
+      gender: 'male',
+      age: 31,
+      height: 184,
+      zodiac: '摩羯座',
+      mbti: 'INFJ',
+      rawText: '编号244\n【概况】94年1月·摩羯座·未婚·INFJ·184cm·81kg\n现居东京·洛阳人·16年来日·建筑学修士·\n建筑日企设计职·工作大半在宅不太忙·年收400-500\n【在留】高度专门签·计划明年换永驻。\n【性格】I人·自带稳定与秩序感·善于倾听·执行力强。\n理工+艺术脑，室内外活动占比7:3，不抽烟·只在聚会时喝酒\n【兴趣】会摄影，画画，做饭和小提琴，人形自走猫草。\n喜欢音乐，公路骑行，读书，动漫游戏，养有一只白文鸟。\n【家庭】独生子，家境殷实和睦幸福，\n父母退休前为国企机械工程师和外科医生。\n【希望你】90后，打算中长期在日本生活，\n工作稳定，有2~3年内结婚打算，无不良嗜好，\n相互尊重，情绪稳定，遇事一起商量解决困难的办法。\n有相近的兴趣爱好，在工作和柴米油盐之外的日常里\n可以一起探索乐趣，共同成长。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/eb0e7cec-8597-4f3d-a80c-82ef8081c4ff',
+      bmi: 23.9,
+      hometown: '洛阳',
+      currentLocation: '东京',
+      occupation: '建筑日企设计职',
+      interests: const <String>['做饭', '骑行', '养鸟', '动漫', '游戏', '小提琴', '摄影', '画画', '阅读', '音乐'],
+      interestIds: const <int>[29, 54, 159, 23, 21, 160, 2, 18, 25, 7],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_400_381', 'profile_men_100_68', 'profile_men_100_31', 'profile_men_200_125', 'profile_men_200_139', 'profile_men_100_69', 'profile_men_500_471', 'profile_men_100_81', 'profile_men_600_501', 'profile_men_400_333'],
+    ),
+    Character(
+      id: 'profile_men_300_243',
+      gender: 'male',
+      age: 20,
+      height: 176,
+      mbti: 'INTJ',
+      rawText: '编号243\n\n个人介绍：05\nINTJ INTJ INTJ\n176/65\n现住川崎，大一。有假浪的想法，最近正在准备。\n会抽烟，不喝酒。\n个人平常社交圈子不怎么大，但是也不至于很社恐，熟了就会开朗\n\n希望：情绪稳定，爱好的话可以是看书或者什么的。\n如果有学习的可以一起学习什么的。\n可以恋爱脑也可以智性恋。年龄没什么关系。\n\n- （',
+      bmi: 21.0,
+      currentLocation: '川崎',
+      occupation: '',
+      interests: const <String>['学习', '阅读'],
+      interestIds: const <int>[161, 25],
+      similarIds: const <String>['profile_women_200_112', 'profile_men_100_97', 'profile_men_300_230', 'profile_men_300_232', 'profile_men_700_625', 'profile_men_100_13', 'profile_men_400_319', 'profile_men_300_207', 'profile_men_100_48', 'profile_men_600_554'],
+    ),
+    Character(
+      id: 'profile_men_300_241',
+      gender: 'male',
+      age: 32,
+      height: 175,
+      mbti: 'ISTP',
+      rawText: '编号241\n\n自我介绍\n男，93年出生江西南昌人，istp，\n175/82，大学毕业来日读研工作现在日企it搬砖混日子年收700+。\n永驻有房有贷。\n国内情况是独生子父母退休在家。\n希望找个年龄差距不大，本科学历以上在关东发展的妹妹。\n个人兴趣之类的放在下面有相同或者类似的话大欢迎。\n\n⭐︎做饭\n⭐︎中餐馆巡游\n⭐︎辣党\n⭐︎肉党\n⭐︎自驾游\n⭐︎漂流\n⭐︎跑步\n⭐︎游泳\n⭐︎钢琴\n⭐︎主机游戏\n⭐︎手游\n⭐︎动漫\n⭐︎日麻\n⭐︎猫党\n⭐︎烟No酒少量\n\n- （',
+      bmi: 26.8,
+      hometown: '江西南昌',
+      currentLocation: '日本',
+      occupation: 'IT',
+      interests: const <String>['中餐馆巡游', '游戏', '做饭', '动漫', '桌游', '游泳', '漂流', '猫党', '肉党', '自驾'],
+      interestIds: const <int>[162, 21, 29, 23, 39, 19, 163, 164, 165, 15],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_200_161', 'profile_men_400_374', 'profile_men_300_258', 'profile_men_600_597', 'profile_women_700_611', 'profile_men_500_471', 'profile_men_200_182', 'profile_men_500_466', 'profile_men_300_279', 'profile_men_400_395'],
+    ),
+    Character(
+      id: 'profile_men_300_239',
+      gender: 'male',
+      age: 33,
+      height: 177,
+      rawText: '编号239\n\n92年177cm 辽宁人。\n之前社会人，现在在筑波读院生m1，就职中。\n有没有不介意现在是学生身份的女孩，\n以后就是打算留在日本不折腾了，好好稳定过生活。\n平时打乒乓球，看看历史方向的资料，健身一下，\n之前挺喜欢拍照。\n争取能好好走下去认认真真的\n\n- （',
+      hometown: '辽宁',
+      currentLocation: '筑波',
+      occupation: '学生，就职中',
+      interests: const <String>['健身', '乒乓球', '摄影', '历史'],
+      interestIds: const <int>[10, 64, 2, 118],
+      similarIds: const <String>['profile_men_100_14', 'profile_men_200_110', 'profile_men_600_561', 'profile_men_500_471', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73'],
+    ),
+    Character(
+      id: 'profile_men_300_238',
+      gender: 'male',
+      age: 37,
+      mbti: 'ISFP',
+      rawText: '编号238\n88年isfp，是一名摄影师，也做导演剪辑，拍摄过丁真的世界。\n平时爱好电影 看书 音乐 摄影 旅游，喜欢过真实自由的人生。\n打算在东京定居。\n\n对真实自然的风格特别青睐，喜欢看社会纪实类的纪录片，如瓦尔达的脸庞村庄。\n喜欢杨德昌的一一，李沧东的燃烧。。。\n美剧也看，权利的游戏、马男、大小谎言。。。\n心理悬疑也爱看，心理侦探杀人回忆那种。\n音乐基本什么风格都听，偏爱爵士和古典。\n读书看的比较慢，但买的比较多哈哈。\n平时偶尔运动听播客\n\n感情观比较简单，主要看眼缘，简单大方即可。\n更偏爱活泼开朗的女孩子，喜欢有灿烂笑容的人。\n希望两个人既是伴侣，也是精神灵魂的同行者，\n共同支持，共同成长进步，都成为更好的人\n\n- （',
+      image: 'https://github.com/user-attachments/assets/93ff925d-e1fd-4ca9-9202-561877360469',
+      currentLocation: '东京',
+      occupation: '摄影师，导演剪辑',
+      interests: const <String>['听播客', '摄影', '旅游', '电影', '阅读', '运动', '音乐'],
+      interestIds: const <int>[166, 2, 3, 4, 25, 6, 7],
+      similarIds: const <String>['profile_men_100_2', 'profile_men_400_358', 'profile_men_100_54', 'profile_women_200_190', 'profile_women_400_315', 'profile_men_600_571', 'profile_men_100_33', 'profile_women_400_380', 'profile_women_500_459', 'profile_men_600_593'],
+    ),
+    Character(
+      id: 'profile_men_300_235',
+      gender: 'male',
+      age: 27,
+      zodiac: '天秤座',
+      rawText: '编号235\n\n男 1998年 天秤座\n日本东京大学院生\n喜欢听音乐和运动，\n不吸烟不喝酒，偶尔也出去逛逛。\n性格：待人真诚善良，细心。\n希望能和性格开朗的女生相处\n\n- （',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>['偶尔出去逛逛', '音乐', '运动'],
+      interestIds: const <int>[167, 7, 6],
+      similarIds: const <String>['profile_women_100_96', 'profile_men_100_7', 'profile_men_500_470', 'profile_women_700_614', 'profile_women_200_171', 'profile_men_700_612', 'profile_men_300_292', 'profile_men_200_167', 'profile_men_600_580', 'profile_men_100_81'],
+    ),
+    Character(
+      id: 'profile_men_300_232',
+      gender: 'male',
+      age: 22,
+      height: 181,
+      mbti: 'INFJ',
+      rawText: '编号232\n\n2.性别：男\n3.出生年份：2003\n4.祖籍：浙江省温州市 出生：安徽合肥\n5.身高体重：181/80kg\n6.学历：大学在读 专业：日本文学\n7.居住地：东京\n7.1来日三年，高中来的日本。\n8.工作：学生\n9、车房：名下合肥一套房，家里一共四套，\n国内家里有给我买车但高中来日本还没考驾照。\n兴趣爱好（方便找共同点)：性格INFJ，\n平时大部分时间在看书，也会玩switch和一些小游戏，\n放假会去キャンプ和旅游。最近沉迷摄影和艺术。\n从小学开始喜欢坂本龙一，音乐喜欢古典和KPOP。\n理想型：对年上姐姐（+5以内）有好感，当然同龄人合适也欢迎！\n因为我不抽烟所以希望对方也不抽，温柔对我，\n在大家都有时间的时候可以一起看书玩游戏。\n未来计划：父亲现在在美国，未来也许会去，但毕业后还是想留在日本。\n现在的一个人住的房子很大二室一厅50平，\n希望可以和喜欢的人一起打造一个温馨小屋。\n\n- （',
+      bmi: 24.4,
+      hometown: '安徽合肥',
+      currentLocation: '东京',
+      occupation: '学生',
+      interests: const <String>['KPOP', 'キャンプ', '音乐', '摄影', '旅游', '游戏', '阅读', '艺术'],
+      interestIds: const <int>[168, 169, 7, 2, 3, 21, 25, 170],
+      hasHouse: true,
+      hasCar: false,
+      similarIds: const <String>['profile_men_600_554', 'profile_men_400_319', 'profile_men_400_378', 'profile_men_300_285', 'profile_men_100_65', 'profile_men_300_207', 'profile_men_100_22', 'profile_men_100_97', 'profile_women_200_112', 'profile_men_300_230'],
+    ),
+    Character(
+      id: 'profile_men_300_230',
+      gender: 'male',
+      age: 24,
+      height: 182,
+      zodiac: '金牛',
+      mbti: 'ISTJ',
+      rawText: '编号230\n01年某中坚大学大学院修一在读\n金牛，istj\n稍微有些内向\n四川人\n不抽烟，基本不喝酒\n圈子简单，基本上学上班回家三点一线。\n身高182\n爱好是学做饭，喜欢打羽毛球，骑车散步，看看小说之类的\n对对方的要求，希望圈子简单干净，有爱心\n\n希望这条能被pick到\n\n- （',
+      image: 'https://github.com/user-attachments/assets/08ae6564-e02e-455d-959c-222c97b46cc1',
+      hometown: '四川',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>['做饭', '羽毛球', '阅读', '骑行', '散步'],
+      interestIds: const <int>[29, 40, 25, 54, 47],
+      similarIds: const <String>['profile_men_700_625', 'profile_men_300_285', 'profile_men_500_444', 'profile_men_400_347', 'profile_men_400_319', 'profile_men_500_469', 'profile_men_400_344', 'profile_men_100_65', 'profile_men_100_7', 'profile_men_700_626'],
+    ),
+    Character(
+      id: 'profile_men_300_227',
+      gender: 'male',
+      age: 31,
+      height: 173,
+      rawText: '编号227\n\n个人信息\n·出生年月：1994/11/05\n·籍贯：山东菏泽\n·身高：173\n·学历：本科\n·工作：IT\n·来日：5年\n·现居住地：江东区东砂\n·家庭情况：逢年过节会给父母和妹妹买礼物发红包。家庭幸福｡\n·爱好：打球，徒步。\n·其他：性格稳定，不抽烟不喝酒，无不良嗜好。\n喜欢小动物，现养了一只猫。\n·对女方要求：不抽烟。无不良嗜好。身材匀称。\n孝顺父母。喜欢普通平凡的生活。\n\n- （',
+      hometown: '山东菏泽',
+      currentLocation: '江东区东砂',
+      occupation: 'IT',
+      interests: const <String>['宠物', '徒步', '打球'],
+      interestIds: const <int>[26, 11, 171],
+      similarIds: const <String>['profile_men_200_172', 'profile_men_600_570', 'profile_men_200_179', 'profile_women_600_507', 'profile_men_600_579', 'profile_men_700_633', 'profile_men_500_430', 'profile_men_400_375', 'profile_men_100_81', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_men_300_223',
+      gender: 'male',
+      age: 45,
+      height: 176,
+      rawText: '编号223\n\n男，80年生。身高176。未婚未育。\n北京人，现住东京都港区。工作稳定，年收1千万。\n性格稳定，喜欢旅游，看书。\n\n- （',
+      hometown: '北京',
+      currentLocation: '东京都港区',
+      occupation: '',
+      interests: const <String>['旅游', '阅读'],
+      interestIds: const <int>[3, 25],
+      maritalStatus: '未婚未育',
+      similarIds: const <String>['profile_women_400_364', 'profile_men_300_213', 'profile_men_600_569', 'profile_men_500_484', 'profile_men_600_535', 'profile_men_200_102', 'profile_men_600_566', 'profile_men_400_346', 'profile_men_200_124', 'profile_women_400_318'],
+    ),
+    Character(
+      id: 'profile_men_300_222',
+      gender: 'male',
+      age: 44,
+      height: 166,
+      rawText: '编号222\n\n性别：男\n出生年：1981/1\n籍贯： 山西\n现住：名古屋（24/9月开始東京）\n身高：166\n体重：75kg\n职业：会社员\n学历：大学院毕业\n车房：一户建（名古屋）贷款\n签证：永驻\n婚歴：离异\n爱好：打羽毛球、做菜、唱歌、\n性格：比较随和，不吸烟（偶尔和红酒🍷）\n大学、大学院都在名古屋。2005/3来日本\n\n对另一半的要求：\n性格柔和，身体健康 ，无不良嗜好、感情专一，\n对家庭有责任，年龄：38以下。\n\n- （',
+      bmi: 27.2,
+      hometown: '山西',
+      currentLocation: '名古屋（24/9月开始東京）',
+      occupation: '会社员',
+      interests: const <String>['做饭', '唱歌', '羽毛球'],
+      interestIds: const <int>[29, 8, 40],
+      hasHouse: true,
+      maritalStatus: '离异',
+      similarIds: const <String>['profile_women_400_364', 'profile_men_300_283', 'profile_men_300_298', 'profile_men_500_484', 'profile_men_300_213', 'profile_men_600_523', 'profile_men_600_518', 'profile_men_600_535', 'profile_women_600_564', 'profile_men_500_447'],
+    ),
+    Character(
+      id: 'profile_men_300_220',
+      gender: 'male',
+      age: 35,
+      height: 175,
+      zodiac: '天秤座',
+      rawText: '编号220\n\n个人信息\n性别：男\n出生：1990年10月\n身高：175cm\n体重：75kg\n学历：本科\n工作：自動車部品海外営業\n来日：10年\n年收：500\n出生地：山东\n现居住地：静岡三島\n星座：天秤座⚖️\n兴趣爱好：自驾，旅游，喜欢户外。\n家庭情况：独生子，父母在中国。\n性格：可e可i，偏i。情绪稳定，性格温和。\n其他：不抽烟不喝酒，无不良嗜好。\n真诚，顾家，有责任感。\n对生活充满热情，对爱情充满期待。\n\n【期待的另一半】\n身高160左右，清秀一点。喜欢恋爱脑。\n人品好，温柔善良，可以沟通。\n相信爱情，对生活充满热爱的女孩子。\n以上仅参考，非必要条件。\n\n- （',
+      bmi: 24.5,
+      hometown: '山东',
+      currentLocation: '静岡三島',
+      occupation: '自動車部品海外営業',
+      interests: const <String>['户外', '旅游', '自驾'],
+      interestIds: const <int>[1, 3, 15],
+      similarIds: const <String>['profile_men_600_565', 'profile_men_600_543', 'profile_men_100_93', 'profile_men_400_310', 'profile_men_400_332', 'profile_men_500_497', 'profile_men_100_33', 'profile_men_400_305', 'profile_men_600_561', 'profile_men_200_138'],
+    ),
+    Character(
+      id: 'profile_men_300_216',
+      gender: 'male',
+      age: 30,
+      height: 171,
+      zodiac: '射手座',
+      rawText: '编号216\n性别：男\n出生年：1995/12/03\n身高：171cm\n体重：62kg\n学历：本科\n工作：系统工程师\n来日：5年\n年收：500\n出生地：安徽\n现居住地：东京大田区\n兴趣爱好：健身，骑行，看书\n家庭情况：父母均在安徽\n性格：阳光开朗，逆商高\n其他：喜欢修心养性,喜欢接触能让自己不断成长的东西\n希望找一个三观合得来，懂得沟通的\n\n- （',
+      image: 'https://github.com/user-attachments/assets/8d50aeb6-e39a-417e-a64f-b71c6356ab6e',
+      bmi: 21.2,
+      hometown: '安徽',
+      currentLocation: '东京大田区',
+      occupation: '系统工程师',
+      interests: const <String>['修心养性', '健身', '阅读', '骑行'],
+      interestIds: const <int>[172, 10, 25, 54],
+      similarIds: const <String>['profile_women_600_594', 'profile_women_500_448', 'profile_men_100_51', 'profile_men_600_509', 'profile_women_700_614', 'profile_men_300_249', 'profile_men_200_179', 'profile_men_600_570', 'profile_men_500_430', 'profile_men_100_81'],
+    ),
+    Character(
+      id: 'profile_men_300_215',
+      gender: 'male',
+      age: 30,
+      height: 177,
+      rawText: '编号215\n\n2.性别：男\n3.出生年份：1995\n4.籍贯：湖北\n5.身高体重：177/140\n6.学历：大专\n7.居住地：千叶市船桥站附近\n8.工作：IT\n9.兴趣爱好（方便找共同点)：料理、运动、看书\n10.择偶标准 善良 有孝心 有同理心 真诚\n\n- （',
+      bmi: 22.3,
+      hometown: '湖北',
+      currentLocation: '千叶市船桥站附近',
+      occupation: 'IT',
+      interests: const <String>['做饭', '阅读', '运动'],
+      interestIds: const <int>[29, 25, 6],
+      similarIds: const <String>['profile_men_400_352', 'profile_men_600_557', 'profile_men_100_4', 'profile_men_500_471', 'profile_men_600_561', 'profile_men_600_597', 'profile_men_200_110', 'profile_men_100_51', 'profile_men_100_34', 'profile_men_100_95'],
+    ),
+    Character(
+      id: 'profile_men_300_213',
+      gender: 'male',
+      age: 45,
+      height: 178,
+      zodiac: '天蝎座',
+      rawText: '编号213\n个人信息\n性别：男\n出生年：80年\n星座：天蝎座♏\n身高：178\n体重：75左右\n学历：本科\n工作：自营业\n年收：1000左右\n出生地：黑龙江\n现居住地：東京都江戸川区\n兴趣爱好：打游戏，旅游，\n不抽烟，偶尔喝酒，会做饭\n家庭状况：父母和姐姐在上海\n其他：来日本18年，离异无孩\n有车，有房\n对女方的要求：\n正常身材，知冷知热，三观正',
+      image: 'https://github.com/user-attachments/assets/5d272d6c-0fab-4a5b-a5d5-7efd879746d2',
+      bmi: 23.7,
+      hometown: '黑龙江',
+      currentLocation: '東京都江戸川区',
+      occupation: '自营业',
+      interests: const <String>['做饭', '喝酒', '游戏', '旅游'],
+      interestIds: const <int>[29, 35, 21, 3],
+      hasHouse: true,
+      hasCar: true,
+      maritalStatus: '离异无孩',
+      similarIds: const <String>['profile_women_400_364', 'profile_men_300_223', 'profile_men_600_569', 'profile_men_500_484', 'profile_men_200_102', 'profile_men_200_124', 'profile_men_600_535', 'profile_men_300_298', 'profile_men_600_523', 'profile_men_600_566'],
+    ),
+    Character(
+      id: 'profile_men_300_209',
+      gender: 'male',
+      age: 29,
+      height: 164,
+      mbti: 'INFP',
+      rawText: '编号209\n个人信息\n•性别：男\n•出生年：96年\n•身高：164cm\n•体重：63kg\n•学历：本科\n•工作：项目主管\n•来日：3年，永驻申请中\n•年收：1000w+\n•出生地：杭州\n•现居住地：东京日本桥（独居）\n•兴趣爱好：健身，海外自驾，看展，netflix，摄影，摩托\n•家庭状况：父母均在杭州\n•性格：infp\n•其他：偶尔抽烟喝酒，对世界抱有好奇心，\n自己的人生态度—「Love·Life·Liberty」\n•对女方的要求：真诚且情绪稳定，身材正常',
+      image: 'https://github.com/user-attachments/assets/a233ea87-737a-4959-ab7e-73ed5ba39a5c',
+      bmi: 23.4,
+      hometown: '杭州',
+      currentLocation: '东京日本桥',
+      occupation: '项目主管',
+      interests: const <String>['netflix', '健身', '摄影', '摩托', '自驾', '看展'],
+      interestIds: const <int>[173, 10, 2, 87, 15, 22],
+      similarIds: const <String>['profile_women_200_103', 'profile_men_500_430', 'profile_women_500_480', 'profile_women_400_354', 'profile_women_500_476', 'profile_women_600_545', 'profile_men_100_89', 'profile_women_400_387', 'profile_women_500_424', 'profile_men_600_555'],
+    ),
+    Character(
+      id: 'profile_men_300_208',
+      gender: 'male',
+      age: 32,
+      height: 180,
+      zodiac: '白羊',
+      mbti: 'INFJ',
+      rawText: '编号208\n个人信息\n•性别：男\n•出生年：93年\n•身高：180cm\n•体重：110kg左右（减肥中）\n•学历：日本专门\n•工作：IT（项目开发和管理）\n•来日：6年\n•年收：400w+\n•出生地：大连\n•现居住地：小岩（独居）\n•兴趣爱好：K歌，旅行，麻将，摄影，偶尔做做黑暗料理\n•家庭状况：独子，父母健在\n•性格：虽然我是白羊座，但是性格INFJ。\n•其他：不抽烟喝酒，会做饭（还可以）。\n目前没有回国的打算，打算先挣钱为主\n•对女方的要求：未婚，性格开朗，合得来的。\n因为我是属于大家庭那种，希望能和我的家人相处融洽。',
+      image: 'https://github.com/user-attachments/assets/3d698407-aa3d-4667-a07a-b27d6e4fe623',
+      bmi: 34.0,
+      hometown: '大连',
+      currentLocation: '小岩',
+      occupation: 'IT（项目开发和管理）',
+      interests: const <String>['唱歌', '做饭', '摄影', '旅游', '桌游'],
+      interestIds: const <int>[8, 29, 2, 3, 39],
+      similarIds: const <String>['profile_men_200_128', 'profile_women_700_611', 'profile_men_300_286', 'profile_men_200_150', 'profile_men_300_241', 'profile_men_300_279', 'profile_men_200_182', 'profile_men_400_307', 'profile_men_500_455', 'profile_women_200_116'],
+    ),
+    Character(
+      id: 'profile_men_300_207',
+      gender: 'male',
+      age: 24,
+      height: 171,
+      mbti: 'INFJ',
+      rawText: '编号207\n\n01，男\n来日时间：三年多\n学历：March 学部在读\n净身高：171cm\n出身地：甘肃兰州人\nMBTI：INFJ\n爱好：滑雪、旅游、以及一些挑战自我的运动\n居住地：目前位于东京\n性格：不熟悉的时候会有一些i，\n一些内向。熟悉以后会很活泼。\n脾气很好，不容易生气。\n对女方的要求：身材匀称，性格稳定',
+      hometown: '甘肃兰州',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['运动', '旅游', '滑雪'],
+      interestIds: const <int>[6, 3, 14],
+      similarIds: const <String>['profile_men_100_22', 'profile_men_600_559', 'profile_men_100_7', 'profile_men_600_554', 'profile_men_100_65', 'profile_men_200_122', 'profile_men_200_167', 'profile_men_100_97', 'profile_men_500_437', 'profile_men_400_378'],
+    ),
+    Character(
+      id: 'profile_men_300_203',
+      gender: 'male',
+      age: 33,
+      height: 175,
+      rawText: '编号203\n个人信息\n•性别：男\n•出生年：92年\n•身高：175cm\n•体重：58kg左右\n•学历：本科\n•工作：IT（项目开发和管理）\n•来日：9年\n•年收：700w+\n•出生地：湖北荆州\n•现居住地：横滨市（独居）\n•兴趣爱好：溜冰,滑雪，游泳，健身，自驾游，爬山,以前偶尔玩玩游戏。\n•家庭状况：独子，父母健在\n•性格：可e可i（偏i）。可以雪季滑雪一个季度，闲在家时又可以撸撸猫做做饭看看视频一整天。\n•其他：不抽烟喝酒，会做饭（朋友评价还不错）,家有黑白两只猫咪，生活上打理的还不错。\n•对女方的要求：未婚，身材匀称。有尝试新的运动项目的勇气（滑雪游泳这些）。另外如果两边感觉合适，希望可以是有线下见面的，一直聊天我很可能会把天聊死。',
+      image: 'https://github.com/user-attachments/assets/1bca0075-0e83-463b-8e39-1aa87e260cd5',
+      bmi: 18.9,
+      hometown: '湖北荆州',
+      currentLocation: '横滨市',
+      occupation: 'IT（项目开发和管理）',
+      interests: const <String>['做饭', '健身', '宠物', '游泳', '溜冰', '滑雪', '爬山', '游戏', '看视频', '自驾'],
+      interestIds: const <int>[29, 10, 26, 19, 174, 14, 20, 21, 66, 15],
+      similarIds: const <String>['profile_men_600_598', 'profile_men_100_64', 'profile_men_600_596', 'profile_men_400_382', 'profile_men_600_578', 'profile_men_600_561', 'profile_men_400_349', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63'],
+    ),
+    Character(
+      id: 'profile_men_300_201',
+      gender: 'male',
+      age: 32,
+      height: 177,
+      rawText: '编号201\n\n【自我介绍】\n93，男\n来日一年，东京\n年收400，IT行业，本科毕业\n江苏南京人，未来有长期留在日本的打算\n日语很差，目前努力学习中\n性格比较宅，喜欢看电影，看小说，偶尔会出去逛逛\n身高177cm 体重80kg 目前努力减肥 争取今年减到70kg\n【对另一半的要求】\n不胖，性格稳定即可\n\n[上一页](https://github.com/141801/info/blob/main/men_200.md) [下一页](https://github.com/141801/info/blob/main/men_400.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      bmi: 25.5,
+      hometown: '江苏南京',
+      currentLocation: '东京',
+      occupation: 'IT行业',
+      interests: const <String>['偶尔会出去逛逛', '阅读', '电影'],
+      interestIds: const <int>[175, 25, 4],
+      similarIds: const <String>['profile_men_400_381', 'profile_men_300_257', 'profile_men_700_633', 'profile_men_600_522', 'profile_men_500_441', 'profile_women_700_611', 'profile_men_600_570', 'profile_women_600_507', 'profile_men_400_307', 'profile_men_200_161'],
+    ),
+    Character(
+      id: 'profile_men_400_399',
+      gender: 'male',
+      age: 38,
+      height: 175,
+      zodiac: '天蝎',
+      mbti: 'ISFJ',
+      rawText: '编号399\n\n1987年11月，身高175，离异无孩，\n来日本八年，有自己的住房无贷款，做软件编程工作，\n年收600万，性格ISFJ，兴趣爱好是看电影和日剧，\n也经常看YouTube上一些讲玄学的视频和旅游播主拍的去旅行的视频，\n周末去练自由搏击，平时虽然比较宅，\n但也希望与另一半环游世界\n\n- （',
+      currentLocation: '日本',
+      occupation: '软件编程',
+      interests: const <String>['看YouTube玄学视频', '旅游', '追剧', '电影', '自由搏击'],
+      interestIds: const <int>[176, 3, 24, 4, 177],
+      hasHouse: true,
+      maritalStatus: '离异无孩',
+      similarIds: const <String>['profile_men_500_489', 'profile_men_400_310', 'profile_men_500_446', 'profile_men_200_109', 'profile_men_100_2', 'profile_men_200_176', 'profile_men_600_585', 'profile_women_400_380', 'profile_men_400_340', 'profile_men_700_624'],
+    ),
+    Character(
+      id: 'profile_men_400_395',
+      gender: 'male',
+      age: 33,
+      height: 175,
+      rawText: '编号395\n\n92年\n性别：男\n出身：浙江0571。上海户口\n学校：美高，美本，美硕\n工作：年收~1500\n身高体重：175cm/80kg\n家庭条件：杭州有房\n家人：双亲已退休。\n兴趣爱好：不抽烟，不抽烟，潜水有证，网球，高尔夫，偶尔滑雪\n\n目前在九州，预计25年回东京\n\n- （',
+      bmi: 26.1,
+      hometown: '浙江0571',
+      currentLocation: '九州',
+      occupation: '',
+      interests: const <String>['滑雪', '潜水', '网球', '高尔夫'],
+      interestIds: const <int>[14, 36, 112, 178],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_500_471', 'profile_men_600_561', 'profile_men_200_138', 'profile_men_600_597', 'profile_women_700_611', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_men_400_388',
+      gender: 'male',
+      age: 35,
+      height: 182,
+      rawText: '编号388\n姓名：魏捷 / 男\n年龄：90年10月\n身高体重：182 / 78KG\n社员，年收 350，熬完永驻签证考虑转职\n爱好：健身 滑冰 手机游戏\n平常有时间就去健身房，周末有空闲就去滑冰。\n偶尔抽点烟，随时可以戒。不爱喝酒，一喝酒就犯困。\n喜欢出门散步晒阳光吹风。能开车，但是方向感不好。\n性格随和情绪稳定，多次被人说感觉不到一点情绪起伏，这点请见谅。\n上班时脑子转数拉满，下班懒狗一只。\n以上纯属主观见己，客观方面还需客观仔细观察指出。\n希望能有一个看的对眼的人陪伴走过下半生。\n祝大家事事顺遂，万事如愿。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/ddf31deb-6d33-42cd-91a0-a74a6f369e40',
+      bmi: 23.5,
+      currentLocation: '',
+      occupation: '社员',
+      interests: const <String>['健身', '散步', '游戏', '滑冰'],
+      interestIds: const <int>[10, 47, 21, 179],
+      similarIds: const <String>['profile_men_700_632', 'profile_men_500_471', 'profile_men_600_561', 'profile_men_600_501', 'profile_men_200_138', 'profile_men_300_239', 'profile_men_400_382', 'profile_men_200_155', 'profile_men_400_317', 'profile_men_100_69'],
+    ),
+    Character(
+      id: 'profile_men_400_386',
+      gender: 'male',
+      age: 35,
+      height: 191,
+      rawText: '编号386\n\n个人资料\n家乡：苏州\n工作地：东京\n生年：1990\n职业：翻译/排版/编辑（桌面游戏）\n学历：本科\n身高：191cm\n体重：Heavy\n年收：400万JPY（RMB+日币，个人存款有大概200m JPY）\n家庭情况：父母都退休在苏州，收入殷实，身体健康，无需照料\n兴趣爱好： TRPG/桌游（从业人员）/读书（悬疑、推理）\n/微缩模型（战锤等）/PEANUTS（史努比博物馆年卡会员）\n/钓鱼（新开发的爱好）/电子游戏（FF14，WoW，各种单机）\n不喜欢：一切要出远门的活动（除了出远门玩桌游/TRPG，去史努比博物馆）\n理想型（以结婚为目的）：\n希望兴趣爱好相近。能够给予彼此一定私人空间\n真诚交友，不冷暴力/养鱼，及时沟通。\n身高体重啥的没有多少要求。\n不过我自己也是亚健康状态（努力减肥中，2个月已经瘦身5公斤），\n希望至少有健康生活的志向！\n脸相互对的上眼就行。\n\n- （',
+      hometown: '苏州',
+      currentLocation: '东京',
+      occupation: '翻译/排版/编辑（桌面游戏）',
+      interests: const <String>['TRPG', '桌游', '阅读', 'WoW', '各种单机', '推理', '乐高', '看展', '钓鱼', '游戏'],
+      interestIds: const <int>[180, 39, 25, 181, 182, 183, 56, 22, 184, 21],
+      similarIds: const <String>['profile_men_500_428', 'profile_men_600_586', 'profile_men_100_69', 'profile_men_400_388', 'profile_men_200_165', 'profile_men_600_571', 'profile_men_100_30', 'profile_men_700_632', 'profile_men_600_576', 'profile_men_400_382'],
+    ),
+    Character(
+      id: 'profile_men_400_382',
+      gender: 'male',
+      age: 33,
+      height: 183,
+      zodiac: '摩羯',
+      rawText: '编号382\n山东济南人 男 32岁 摩羯座\n身高183 体重73kg 平时有健身习惯，身材挺好的，经常会被同事夸。\n皮肤也很好。平常有护肤习惯。\n现住横滨 东京工作 年收500w+\n不抽烟，除了朋友聚会以外也不怎么喝酒。\n性格比较温和，认真。\n爱好：健身 温泉 美食 游戏 交往以后也可以经常去旅游。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/86567d52-d1bb-4242-99b4-239dc213645f',
+      bmi: 21.8,
+      hometown: '山东济南',
+      currentLocation: '横滨',
+      occupation: '',
+      interests: const <String>['健身', '旅游', '温泉', '游戏', '美食'],
+      interestIds: const <int>[10, 3, 59, 21, 5],
+      similarIds: const <String>['profile_men_400_309', 'profile_men_600_598', 'profile_men_100_84', 'profile_men_500_471', 'profile_men_400_352', 'profile_men_400_349', 'profile_men_300_239', 'profile_men_500_456', 'profile_men_100_64', 'profile_men_300_203'],
+    ),
+    Character(
+      id: 'profile_men_400_381',
+      gender: 'male',
+      age: 31,
+      height: 182,
+      rawText: '编号381\n\n简介\n三十岁，江苏人，现居东京\n身高一米八二，体重七十八千克，日常保有健身阅读习惯，热爱户外\n日本生活第五年，帝大修士毕业，东京工作，社会人二年级，IT咨询\n为人行事直心直念，少有私藏曲隐，对身心经历经验有着不同体会认知\n尊重他人和自己，平视自己和他人，争取不被自我所裹挟桎梏，分得清口红色号的区别，明白高光修容的不同\n拥有好运气，拥有好朋友\n\n缺点\n抽烟-日常不抽纸烟\n无日本驾照-预计明年取得\n十分不擅长摄影\n在生活工作中间或恣意骄纵习性，说是常怀赤子之心也还是不够成熟\n职业初期为稻梁谋时间不如学生时代充裕，外加单身良久，相处需要在关系中摸索磨合\n\n- （',
+      bmi: 23.5,
+      hometown: '江苏',
+      currentLocation: '东京',
+      occupation: 'IT咨询',
+      interests: const <String>['健身', '户外', '阅读'],
+      interestIds: const <int>[10, 1, 25],
+      maritalStatus: '单身',
+      similarIds: const <String>['profile_men_300_201', 'profile_men_700_633', 'profile_men_200_139', 'profile_men_600_574', 'profile_men_300_244', 'profile_men_100_81', 'profile_men_200_125', 'profile_men_500_471', 'profile_men_100_68', 'profile_men_100_35'],
+    ),
+    Character(
+      id: 'profile_men_400_378',
+      gender: 'male',
+      age: 24,
+      height: 178,
+      mbti: 'ISFJ',
+      rawText: '编号378\n\n个人资料\n住址：东京都 御茶水附近\n家乡：陕西 西安\n生年：2001.09\n学历：四川大学口腔本科，目前就读于东京科学大学牙周病分野\nMBTI：isfj\n身高：178\n体重：75kg\n爱好：唱k，游戏，动漫，学日语\n性格：比较愿意迎合他人，利他主义人格，没怎么谈过恋爱。和陌生人说话比较拘束，和熟悉的人就比较放得开。比较认真，看重细节，诚实是底线。\n希望另一半：是三观正常的人类，不要和我住的太远。年龄和我相仿，最好比我小（喜欢可爱型），不胖不黑，能认真对待感情。\n\n- （',
+      bmi: 23.7,
+      hometown: '陕西西安',
+      currentLocation: '东京都御茶水附近',
+      occupation: '',
+      interests: const <String>['动漫', '唱k', '学日语', '游戏'],
+      interestIds: const <int>[23, 185, 186, 21],
+      similarIds: const <String>['profile_men_400_319', 'profile_men_200_122', 'profile_men_600_554', 'profile_men_100_22', 'profile_men_400_337', 'profile_men_100_65', 'profile_men_300_232', 'profile_men_700_626', 'profile_men_100_7', 'profile_men_300_285'],
+    ),
+    Character(
+      id: 'profile_men_400_375',
+      gender: 'male',
+      age: 31,
+      height: 175,
+      rawText: '编号375\n基本信息：\n籍贯：福建福清\n现居：东京足立\n年龄：1994年（31岁）\n身高：175\n体重：70kg\n学历：本科\n工作：食品贸易营业\n年收：600+\n自我概述：\n生在海南，长于济南，求学杭州。所以很难定义我的故乡？正所谓得到故乡的唯一方式便是离开故乡 。2020年疫情前夕来日，目前在东京从事食品贸易与加工。\n1.健强的身体孕育出健全的灵魂。作为一名足球狂热分子，热爱长跑(全程马拉松最好成绩为3:58:10)，喜欢户外徒步登山露营。\n2.知识可以改变气质。欢迎找我闲聊王小波的时代，索尔仁尼琴的良心，奥地利学派的大师们～～\n\n希望另一半：\n情绪稳定！情绪稳定！情绪稳定！\n真诚，尊重，沟通\n“爱情从来不是去寻找一个完美无缺的人，而是学会用完美的视角，去欣赏那个并不完美的伴侣。”——毛姆\n\n最后，希望大家都能在孤独的日子里，努力寻找那灿烂的瞬间～\n\n- （',
+      image: 'https://github.com/user-attachments/assets/a5bae730-be03-408c-b1a3-203273508cb5',
+      bmi: 22.9,
+      hometown: '福建福清',
+      currentLocation: '东京足立',
+      occupation: '食品贸易营业',
+      interests: const <String>['户外', '徒步', '爬山', '足球', '跑步'],
+      interestIds: const <int>[1, 11, 20, 41, 53],
+      similarIds: const <String>['profile_women_600_507', 'profile_men_300_278', 'profile_men_600_570', 'profile_men_600_579', 'profile_men_100_81', 'profile_men_400_330', 'profile_men_300_227', 'profile_men_600_543', 'profile_men_700_633', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_men_400_374',
+      gender: 'male',
+      age: 31,
+      height: 175,
+      zodiac: '射手座',
+      rawText: '编号374\n年龄：94年 射手座\n出生地：东北黑龙江人\n学历：大连理工本科\n身高：175cm\n体重：一直在宅所以这几年胖了一些。大概75？在控制中\n职业：在日本做it开发\n口味：东北口味，也偶尔爱吃辣（吃多了上火所以可不能老吃）\n兴趣爱好：游戏，听歌，唱歌，最欣赏的男歌手是李荣浩。\n中文听男声多一些因为容易学，英语的话就不限制男女了，因为男女对于我口语来说反正都不好唱。\n音乐方面说不上天才但是有点天赋。\n以前是看动画来日本后反而渐渐不看了。\n性格：大多数时间是外向嘻嘻哈哈，偶尔也有不希望别人接近我的时候(很少，原因我也不知道，可能是因为起床气？)。\n虽然看起来大大咧咧，但是粗中带细，感情细腻，会有意识记住自己在意的人说过的话和喜好。\n心软善良，没有坏心眼，但不是个受气包，只是对陌生人很有礼貌罢了。一旦发现对方不是好鸟直接断。\n其他：双胞胎都不一样何况两个陌生人，所以我不会要求对方和我完全一摸一样，两个人应该有一样的部分但是也一定要有不一样的部分。但是有时候悟性不够，如果不经意惹了对方生气的话直接告诉我，绝不重蹈覆辙。\n\n喜欢的女生类型：\n93年之后的，看眼缘和感觉（我有点意识流），有点活力，笑点低的。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/c43de558-7a24-44c1-b137-d4200004918a',
+      bmi: 24.5,
+      hometown: '黑龙江',
+      currentLocation: '日本',
+      occupation: 'it开发',
+      interests: const <String>['动漫', '音乐', '唱歌', '李荣浩', '游戏'],
+      interestIds: const <int>[23, 7, 8, 187, 21],
+      similarIds: const <String>['profile_men_100_4', 'profile_men_100_35', 'profile_men_500_471', 'profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73'],
+    ),
+    Character(
+      id: 'profile_men_400_372',
+      gender: 'male',
+      age: 36,
+      height: 180,
+      rawText: '编号372\n\n个人资料\n群昵称 微维\n住址：神奈川\n家乡：河南\n生年：1989\n学历：硕士\n身高/体重：180/68\n爱好：跑步，烹饪，偶尔户外徒步，开车自驾游\n不抽烟时不时会喝一点酒\n工作：目前在一家车企做技术开发，年收700左右\n性格：性格稳重，情绪稳定，三观正，遇到问题不逃避，愿意沟通商量。\n\n希望另一半：\n91年后的女生，以后会在东京圈长期发展的，\n遇到问题可以沟通的，不接受太做作的。\n\n- （',
+      bmi: 21.0,
+      hometown: '河南',
+      currentLocation: '神奈川',
+      occupation: '车企技术开发',
+      interests: const <String>['户外', '徒步', '自驾', '做饭', '跑步'],
+      interestIds: const <int>[1, 11, 15, 29, 53],
+      similarIds: const <String>['profile_men_600_596', 'profile_men_300_271', 'profile_men_100_64', 'profile_men_600_550', 'profile_men_400_362', 'profile_men_500_428', 'profile_men_500_446', 'profile_men_200_180', 'profile_men_700_636', 'profile_men_300_220'],
+    ),
+    Character(
+      id: 'profile_men_400_366',
+      gender: 'male',
+      age: 26,
+      height: 186,
+      mbti: 'ISFJ',
+      rawText: '编号366\n\n出生年份：1999年\n身高：186cm\n出生地：浙江\n毕业院校：国内211本→早大修士\n工作：半导体设计\n年收：500+\n居住：东京\n兴趣：历史 美食 逛街\nISFJ，社会人一年目，工作原因社交圈子很窄，不抽烟，能喝酒但是不常喝。\n希望有空的时候可以一起出去玩，一直宅在家里太无聊了哈哈\n\n对对方的要求：\n160cm以上（非硬性）\n年龄在96-01之间。（非硬性）\n工作了的话年收300+，学生党无要求\n情绪稳定 愿意交流 E人更好\n不抽烟 no ghosting\n\n- （',
+      hometown: '浙江',
+      currentLocation: '东京',
+      occupation: '半导体设计',
+      interests: const <String>['历史', '美食', '逛街'],
+      interestIds: const <int>[118, 5, 9],
+      similarIds: const <String>['profile_men_400_327', 'profile_men_300_285', 'profile_men_100_7', 'profile_men_300_284', 'profile_men_400_347', 'profile_men_100_31', 'profile_men_600_554', 'profile_men_100_81', 'profile_men_600_559', 'profile_men_500_437'],
+    ),
+    Character(
+      id: 'profile_men_400_362',
+      gender: 'male',
+      age: 37,
+      height: 176,
+      zodiac: '巨蟹座',
+      mbti: 'INFJ',
+      rawText: '编号362\n\n88年 男 INFJ 巨蟹座\n身高176 体重67.5kg\n出身上海 本科上海 广岛大学大学院\n工作机械相关 年收税前500+\n现居神奈川 工作地东京\n永驻 暂时没有将来回国打算\n\n不烟少酒（喝果酒等甜的）\n性格和善比较普通，尊重他人\n外貌一般，看上去不显老，可能比较令人在意的是光头\n兴趣方面以前比较宅，追动画漫画，打游戏（switch和手游）\n室内会玩剧本杀 狼人杀等桌游，唱歌，桌球，麻将等一众娱乐活动\n户外从去年10月开始，有稍微接触一点新手向爬山和徒步\n\n希望对方\n年龄比我小\nBMI正常范围\n江浙沪加分但不必须，四川成都加分（喜欢吃辣且对著名景点有憧憬：劳资蜀道山）\n有兴趣爱好且喜欢分享\n遇到事情乐于沟通，吵架也算是沟通的一种\n\n- （',
+      bmi: 22.0,
+      hometown: '上海',
+      currentLocation: '神奈川',
+      occupation: '机械相关',
+      interests: const <String>['唱歌', '徒步', '游戏', '桌球', '爬山', '桌游', '动漫'],
+      interestIds: const <int>[8, 11, 21, 188, 20, 39, 23],
+      similarIds: const <String>['profile_men_400_372', 'profile_men_300_271', 'profile_men_200_183', 'profile_men_200_180', 'profile_men_400_340', 'profile_men_700_636', 'profile_men_500_446', 'profile_men_100_64', 'profile_men_100_2', 'profile_men_400_399'],
+    ),
+    Character(
+      id: 'profile_men_400_361',
+      gender: 'male',
+      age: 35,
+      height: 177,
+      zodiac: '双鱼',
+      rawText: '编号361\n\n90年 上海 未婚未育\n身高177 体重61-63kg 正常体格，在努力奔向50+\n双鱼座 皮白，看起来应该30不到，声音被夸好听但五音不全\n上外+日硕\n现居东京，永驻，来日12年 年收600\n家里已退休，\n无抽烟酗酒习惯，爱吃水果\n兴趣\n旅游亲近大自然，各种水果狩，滑雪，温泉，岩盘浴\n游乐园（富士急），爬山，游泳（最多不淹死）\n看电影，童年的日漫\n巨能做饭，偏甜口，最近各种尝试上海早饭\n休息日在家做饭饱餐一顿为主，接着打扫屋子\n自己：\n凡事喜欢沟通，注重倾听，有困难就商量着来，情绪稳定能够包容\n皮起来话嘎嘎多，不内耗不冷战，试着尝试对方的兴趣\n希望你：\n89年～97年江浙沪女生\n健健康康不要太胖，真诚，三观合，以后能留日发展\n\n- （',
+      bmi: 19.8,
+      hometown: '上海',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['做饭', '各种水果狩', '温泉', '打扫屋子', '旅游', '户外', '游乐园（富士急', '游泳', '滑雪', '爬山'],
+      interestIds: const <int>[29, 189, 59, 190, 3, 1, 191, 19, 14, 20],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_400_336', 'profile_men_500_428', 'profile_men_200_155', 'profile_men_500_423', 'profile_men_300_295', 'profile_men_300_277', 'profile_men_600_593', 'profile_women_400_315', 'profile_men_100_2', 'profile_men_200_165'],
+    ),
+    Character(
+      id: 'profile_men_400_360',
+      gender: 'male',
+      age: 34,
+      height: 170,
+      mbti: 'ISTJ',
+      rawText: '编号360\n\n个人资料\n家乡：焦作\n工作地：东京\n生年：1991\n职业：IT\n年收：800\nMBTI：ISTJ\n身高：170\n体重：65kg\n学历：本科\n爱好：跑步，健身，爬山，读书\n\n- （',
+      bmi: 22.5,
+      hometown: '焦作',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['健身', '爬山', '阅读', '跑步'],
+      interestIds: const <int>[10, 20, 25, 53],
+      similarIds: const <String>['profile_women_600_507', 'profile_men_600_570', 'profile_men_300_288', 'profile_women_500_459', 'profile_men_500_488', 'profile_women_600_504', 'profile_men_100_2', 'profile_women_400_380', 'profile_men_400_358', 'profile_men_600_593'],
+    ),
+    Character(
+      id: 'profile_men_400_358',
+      gender: 'male',
+      age: 36,
+      height: 175,
+      zodiac: '白羊座',
+      rawText: '编号358\n\n福建 89年 男 白羊座\n身高175 体重67kg 身材匀称 平时有健身习惯\n永驻者，小时候来的日本，现住东京\n年收700w+\n不抽烟，平时不喝酒，聚餐时会喝点，无不良嗜好\n比较直男，性格温和，情绪稳定，真诚\n爱好：健身 球类运动 电影音乐 温泉 美食\n\n希望另一半：\n心地善良，性格温和\n彼此能沟通，理解，遇到问题愿意一起解决\n\n- （',
+      bmi: 21.9,
+      hometown: '福建',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['健身', '温泉', '运动', '电影', '音乐', '美食'],
+      interestIds: const <int>[10, 59, 6, 4, 7, 5],
+      similarIds: const <String>['profile_men_300_238', 'profile_men_100_2', 'profile_men_600_571', 'profile_men_100_33', 'profile_men_100_54', 'profile_men_600_593', 'profile_women_200_190', 'profile_men_500_428', 'profile_men_300_277', 'profile_men_100_57'],
+    ),
+    Character(
+      id: 'profile_men_400_357',
+      gender: 'male',
+      age: 25,
+      height: 179,
+      zodiac: '摩羯座',
+      rawText: '编号357\n\n老家：日本千叶\n国籍：日本\n中文水平：HSK五级\n出生年：2000年\n身高：179厘米\n体重：70千克\n星座：摩羯座\n学历：关西学院大学经济系统 本科\n家庭背景：独生子\n职业：公司职员 （在东京电力的子公司工作，很稳定）\n现住：千叶县千叶市\n爱好：旅游，卡拉OK，喝酒\n业余时间：跟朋友一起去玩玩\n生活方式：不抽烟\n\n我对中国文化感兴趣，所以我学了中文。\n我喜欢筷子兄弟，乌兰图雅，凤凰传奇等等。\n我很认真地在寻找一段稳定，长期的关系，\n希望我们可以一起成长、互相支持。\n\n希望对方\n①未婚未育\n②无不良嗜好(抽烟，酗酒，赌博，药物滥用等)\n\n- （',
+      bmi: 21.8,
+      hometown: '日本千叶',
+      currentLocation: '千叶县千叶市',
+      occupation: '公司职员（在东京电力的子公司工作）',
+      interests: const <String>['乌兰图雅', '凤凰传奇', '唱歌', '喜欢筷子兄弟', '喝酒', '旅游', '跟朋友一起去玩玩'],
+      interestIds: const <int>[192, 193, 8, 194, 35, 3, 195],
+      similarIds: const <String>['profile_men_300_300', 'profile_men_500_469', 'profile_men_400_344', 'profile_men_400_304', 'profile_men_100_13', 'profile_men_100_7', 'profile_men_100_75', 'profile_men_600_557', 'profile_women_200_171', 'profile_men_300_285'],
+    ),
+    Character(
+      id: 'profile_men_400_352',
+      gender: 'male',
+      age: 31,
+      height: 181,
+      rawText: '编号352\n年龄：94\n身高：181\n体重：72\n工作：IT\n年收：500左右\n籍贯：吉林长春\n关于我：\n情绪稳定，一般不会发脾气。善于沟通，性格随和。不抽烟，偶尔少喝一点酒。\n喜欢美食，平时会自己做饭。喜欢小动物，以后想养条狗。\n自己的话偏室内一些，有女朋友的话回想多出去玩。\n未来打算留在日本，对未来有自己的规划，以结婚为目的恋爱。\n\n期望对方：\n年龄90-99，不要太胖，BMI正常范围，会注意自己健康。\n不冷战，有问题能沟通，不要把分手挂在嘴边。交往后，希望可以主动表达自己的想法。\n享受生活，愿意尝试一点新鲜事物。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/93e2e217-af1c-4d6f-95ec-086fac47de85',
+      bmi: 22.0,
+      hometown: '吉林长春',
+      currentLocation: '',
+      occupation: 'IT',
+      interests: const <String>['做饭', '宠物', '美食'],
+      interestIds: const <int>[29, 26, 5],
+      similarIds: const <String>['profile_men_500_471', 'profile_men_300_215', 'profile_men_600_561', 'profile_men_600_546', 'profile_men_500_466', 'profile_men_200_110', 'profile_men_100_84', 'profile_men_100_4', 'profile_men_100_95', 'profile_men_100_91'],
+    ),
+    Character(
+      id: 'profile_men_400_349',
+      gender: 'male',
+      age: 31,
+      height: 175,
+      rawText: '编号349\n年龄：94年\n籍贯：山东\n身高：175\n学历：本科\n基本情况:来日五年，在神奈川做设计，年收500+\n\n兴趣爱好：篮球🏀，旅游，兜风，摄影\n希望对方：温柔真诚，有共度余生的打算\n\n- （',
+      image: 'https://github.com/user-attachments/assets/26c74991-e6ae-4dad-86c3-e1adb60b7463',
+      hometown: '山东',
+      currentLocation: '神奈川',
+      occupation: '设计',
+      interests: const <String>['自驾', '摄影', '旅游', '篮球'],
+      interestIds: const <int>[15, 2, 3, 50],
+      similarIds: const <String>['profile_men_100_89', 'profile_men_300_239', 'profile_men_300_267', 'profile_men_100_84', 'profile_men_600_520', 'profile_men_100_4', 'profile_men_600_561', 'profile_men_100_14', 'profile_men_100_21', 'profile_men_100_95'],
+    ),
+    Character(
+      id: 'profile_men_400_348',
+      gender: 'male',
+      age: 37,
+      height: 175,
+      zodiac: '天蝎',
+      rawText: '编号348\n\n个人资料\n住址：东京\n家乡：河北 承德\n生年：1988年10月(天蝎)\n学历：吉林外国语大学(英语日语双学位)，庆应(商科)\nMBTI：没整。。。\n身高：175\n体重：80kg\n爱好：羽毛球，健身，烹饪(拿手菜：锅包肉，雪棉豆沙，\n东坡肉，红烧排骨等)，读书，泡温泉，偶尔旅游，开得一手好车\n不抽烟不喝酒(不介意另一半稍微喝点)\n有房无车\n目前在一家外国咨询工作，年收700+\n性格：\n外冷内热，话不多，平时微信很少聊但喜欢见面聊或者语音聊，\n愿意给另一半做饭的居家型天蝎暖男，三观正，愿意倾听愿意商量\n\n希望另一半：\n88年后的女生，以后会在东京长期发展的，不太希望对方有纹身，不接受太做作的。\n希望找个能接受彼此的身高相貌身材，有些共同话题和爱好，\n在有感情的基础上把彼此当作“队友”，互相依赖互相帮助，把小家庭的日子过好。\n希望对方一年内有结婚打算。\n\n- （',
+      bmi: 26.1,
+      hometown: '河北承德',
+      currentLocation: '东京',
+      occupation: '外国咨询',
+      interests: const <String>['东坡肉', '健身', '旅游', '开得一手好车', '温泉', '做饭', '红烧排骨等', '羽毛球', '阅读', '雪棉豆沙'],
+      interestIds: const <int>[196, 10, 3, 197, 59, 29, 198, 40, 25, 199],
+      hasHouse: true,
+      hasCar: false,
+      similarIds: const <String>['profile_men_700_632', 'profile_men_700_623', 'profile_men_100_2', 'profile_men_400_310', 'profile_men_100_93', 'profile_men_100_33', 'profile_men_400_307', 'profile_women_400_315', 'profile_men_300_238', 'profile_men_400_358'],
+    ),
+    Character(
+      id: 'profile_men_400_347',
+      gender: 'male',
+      age: 25,
+      height: 178,
+      mbti: 'ISTJ',
+      rawText: '编号347\n现住：东京\n出生地：广东\n性别：男\n出生年份：2000\n身高体重：178/65\n学历：本科\nmbti：istj\n爱好：电影 音乐 city walk\n性格：有些内向，慢热型\n其他：目前大学院在读，不抽烟，偶尔喝一点小酒\n希望的另一半：年龄相差不大，乐观开朗，无不良嗜好\n\n- （',
+      image: 'https://github.com/user-attachments/assets/8a93736a-4725-49a8-9735-e8cc508979ce',
+      bmi: 20.5,
+      hometown: '广东',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['city', '散步', '电影', '音乐'],
+      interestIds: const <int>[46, 47, 4, 7],
+      similarIds: const <String>['profile_men_300_285', 'profile_men_100_7', 'profile_men_600_559', 'profile_men_100_45', 'profile_men_500_437', 'profile_men_500_444', 'profile_men_400_319', 'profile_men_100_48', 'profile_men_700_626', 'profile_men_200_122'],
+    ),
+    Character(
+      id: 'profile_men_400_346',
+      gender: 'male',
+      age: 43,
+      height: 180,
+      zodiac: '狮子座',
+      rawText: '编号346\n关于我：身高180cm、体重65KG、生于1982年、\n狮子座、南京人、职高学历、离异（女儿随前妻）\n于2024年9月24日来到日本，技能实习1号签证，在千叶从事农业工作；\n除抽烟外无不良嗜好；爱干净、不暴力、会做饭、无纹身、工作稳定、\n生活规律、身体健康、无宗教信仰、生活习惯良好；\n\n关于她：爱干净、不暴力、不抽烟、无纹身、工作稳定，\n生活规律、身体健康、无堕胎经历、无宗教信仰、\n生活习惯良好，有长期留日计划 。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/6e718e5f-a406-42aa-b615-2708299f2c59',
+      bmi: 20.1,
+      hometown: '南京',
+      currentLocation: '千叶',
+      occupation: '农业工作',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '离异',
+      similarIds: const <String>['profile_men_500_484', 'profile_men_600_535', 'profile_men_600_569', 'profile_women_400_364', 'profile_men_600_523', 'profile_men_200_102', 'profile_men_200_189', 'profile_men_200_109', 'profile_men_300_268', 'profile_men_300_223'],
+    ),
+    Character(
+      id: 'profile_men_400_344',
+      gender: 'male',
+      age: 26,
+      height: 177,
+      zodiac: '巨蟹',
+      mbti: 'INFJ',
+      rawText: '编号344\n个人资料\n家乡：辽宁 大连\n生年：1999年6月\n职业：现明治MBA在读\nMBTI：INFJ\n身高：177\n体重：65kg\n最终学历：明治修士\n爱好：羽毛球、健身、网球，黑胶唱片，做饭，滑雪，台球，\n保龄球，贝斯，单簧管，精酿啤酒，国内家里3只黑猫。\n平时不抽烟 但是偶尔会喝酒。一周会喝2～3次\n但是肯定会控制着量，不会喝到宿醉的程度。\n今后打算：现在修士一年下半学期正在寻找实习。\n毕业之后目标是大手商社或者海运专门商社、メーカー。\n有长期在东京发展的打算。\n性格：见生人会i但是日后会越来越熟 更倾向于倾听。\n有着很规律的作息，性格踏实稳重，情绪稳定。\n三观正，偶尔不太会表达自己的想法，比较标准的顾家巨蟹男哈哈。\n\n希望另一半：\n以后会在东京长期发展\n知书达理，日常合得来，开朗爱笑，积极向上。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/cb691bc3-6064-43a6-a786-f52e5e41f23e',
+      bmi: 20.7,
+      hometown: '辽宁 大连',
+      currentLocation: '',
+      occupation: '明治MBA在读',
+      interests: const <String>['保龄球', '做饭', '健身', '喝酒', '单簧管', '台球', '国内家里3只黑猫', '滑雪', '精酿啤酒', '网球'],
+      interestIds: const <int>[200, 29, 10, 35, 201, 49, 202, 14, 203, 112],
+      similarIds: const <String>['profile_men_100_45', 'profile_men_100_7', 'profile_men_500_437', 'profile_men_300_292', 'profile_men_500_469', 'profile_men_600_599', 'profile_men_200_122', 'profile_men_100_13', 'profile_men_400_347', 'profile_men_700_626'],
+    ),
+    Character(
+      id: 'profile_men_400_342',
+      gender: 'male',
+      age: 40,
+      height: 180,
+      zodiac: '水瓶座',
+      rawText: '编号342\n个人信息： 1985年 水瓶座 身高180cm，父母国家电网公司退休。\n出生地：上海\n国籍：加拿大\n工作地：东京\n学历：硕士\n爱好： 开车 前沿科技 骑车\n收入：折合年收入800万日元\n\n希望对方： 37岁或以下 本科学历或以上。\n身体健康 通情达理 三观正 与人为善 无不良嗜好 无不良历史 无大额负债。无子女。\n最好未婚。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/7cf2c485-3a9d-469a-88b9-6c7c5951606e',
+      hometown: '上海',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['前沿科技', '自驾', '骑行'],
+      interestIds: const <int>[204, 15, 54],
+      similarIds: const <String>['profile_men_500_447', 'profile_men_600_535', 'profile_men_700_636', 'profile_men_200_176', 'profile_men_400_340', 'profile_men_100_93', 'profile_men_200_124', 'profile_men_200_109', 'profile_men_100_2', 'profile_men_600_585'],
+    ),
+    Character(
+      id: 'profile_men_400_340',
+      gender: 'male',
+      age: 39,
+      height: 180,
+      rawText: '编号340\n身高180，体重70、86年、不吸\n烟，不喝酒，无纹身，不烫头。\n来日13年，老家是黑龙江牡丹江，日本大学毕业，营业，日本国籍。\n年收400+，日本有自己的房子。\n会讲，英文、日文。喜欢运动，健身，游泳、电影，KTV，篮球，做美食。\n为人性格开朗，积极向上。\n一直忙于学业和工作，至今未婚。现在想找个合得来的女生交往，\n想找个没有婚史，单身的温柔的女生，年龄最好在26-33区间。\n\n（现在着急结婚，理想处一段时间就结婚，婚后想马上要孩子，\n如果只想想谈恋爱或者想先聊着慢慢再找的请绕道，只想找个诚信过日子的）\n\n- （',
+      image: 'https://github.com/user-attachments/assets/c9ea759e-7759-4380-a971-c208eaf2c243',
+      bmi: 21.6,
+      hometown: '黑龙江牡丹江',
+      currentLocation: '日本',
+      occupation: '营业',
+      interests: const <String>['唱歌', '美食', '健身', '游泳', '电影', '篮球', '运动'],
+      interestIds: const <int>[8, 5, 10, 19, 4, 50, 6],
+      hasHouse: true,
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_500_446', 'profile_men_700_636', 'profile_men_200_109', 'profile_men_200_181', 'profile_men_200_176', 'profile_men_600_585', 'profile_men_600_535', 'profile_men_400_399', 'profile_men_500_489', 'profile_men_200_165'],
+    ),
+    Character(
+      id: 'profile_men_400_339',
+      gender: 'male',
+      age: 36,
+      height: 161,
+      zodiac: '天蝎',
+      rawText: '编号339\n\n河北人，89年的天蝎座，未婚未育。身高161，不胖不瘦。\n住在大阪，来日本第六年，日语N2，一直做设计工作。\n父母健在，一个姐姐已经结婚在国内。\n\n- （',
+      hometown: '河北',
+      currentLocation: '大阪',
+      occupation: '设计',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_300_242', 'profile_women_500_459', 'profile_women_700_606', 'profile_women_500_475', 'profile_men_600_565', 'profile_women_600_502', 'profile_men_100_71', 'profile_women_500_486', 'profile_men_100_2', 'profile_women_400_369'],
+    ),
+    Character(
+      id: 'profile_men_400_338',
+      gender: 'male',
+      age: 31,
+      height: 170,
+      mbti: 'INTJ',
+      rawText: '编号338\n94年，\n【出生地】福建福州\n【居住地】东京\n【身高】170\n【学历】本科\n【工作】IT程序员\n【收入】500+\n【婚歴】未婚单身\n【MBTI】INTJ（喜欢学习和思考）\n【爱好】\n主にインドア派、アウトドアも好き\n旅游\n料理\n读书\n游戏\n电影（迪士尼，黑客帝国，复仇者联盟，蝙蝠侠，教父，12怒汉，指环王，盗梦空间。。）\n摄影\n开车\n【性格】\n温和稳重優しい\n不抽烟 不喜欢喝酒 无不良嗜好\n【资格证】運転免許、日本語N２、英検IELTS5.5\n【資産】預貯金\n\n未来打算长居日本，打算结婚\n希望对方：90后，身体健康，身高150+，性格温柔真诚、人品好，能互相尊重理解\n\n- （',
+      image: 'https://github.com/user-attachments/assets/eee8cffb-a842-449d-9a47-5322c012bc2c',
+      hometown: '福建福州',
+      currentLocation: '东京',
+      occupation: 'IT程序员',
+      interests: const <String>['12怒汉', '复仇者联盟', '自驾', '指环王', '摄影', '教父', '做饭', '旅游', '游戏', '电影'],
+      interestIds: const <int>[205, 206, 15, 207, 2, 208, 29, 3, 21, 4],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_600_570', 'profile_women_300_280', 'profile_men_500_461', 'profile_men_200_179', 'profile_women_700_628', 'profile_women_400_387', 'profile_men_600_509', 'profile_men_500_466', 'profile_men_100_4', 'profile_men_500_430'],
+    ),
+    Character(
+      id: 'profile_men_400_337',
+      gender: 'male',
+      age: 26,
+      height: 177,
+      mbti: 'INTP',
+      rawText: '编号337\n\n概况：男，99年生人，东京顶级公立大学理工科博士在读，\nINTP，无不良嗜好，身高177cm，体重69kg。有欧美留学经历\n现居地：东京都\n未来计划：主要是科研工作者，可能在高校也可能在企业。\n最近一段时间在考虑在东京买房的事情\n兴趣爱好：比较宅，偏二次元一点，动漫游戏都略有涉及，喜欢硬科幻。\n业余时间做一些偏保守策略的投资。\n\n对另一半的要求：\n98年以后，正经大学毕业（即学历本科以上），身高体重外貌正常，\n身材匀称，情绪稳定，三观契合，能够包容，比较独立，可以共同进步的\n\n- （',
+      bmi: 22.0,
+      currentLocation: '东京都',
+      occupation: '科研工作者',
+      interests: const <String>['保守策略投资', '动漫', '游戏', '硬科幻'],
+      interestIds: const <int>[209, 23, 21, 210],
+      similarIds: const <String>['profile_men_200_122', 'profile_men_100_7', 'profile_men_700_626', 'profile_men_100_45', 'profile_men_200_167', 'profile_men_500_437', 'profile_men_100_22', 'profile_men_400_378', 'profile_men_100_81', 'profile_men_600_554'],
+    ),
+    Character(
+      id: 'profile_men_400_333',
+      gender: 'male',
+      age: 29,
+      height: 185,
+      zodiac: '鼠',
+      rawText: '编号333\n微信名：廾匸\n出生 ：1996（属耗子的）\n身高体重：185/172（正在减肥中）\n性格 ：外表冷酷（内心火热）\n工作 ：介护（今年四月刚入职）\n择偶标准：155以上，年龄上下不超过五岁，身材偏瘦，\n性格开朗乐观向上，希望在生活上彼此互相鼓励进步。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/abd0bf32-2875-440b-a194-00c7d1cf9adb',
+      bmi: 25.1,
+      currentLocation: '',
+      occupation: '介护',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_600_539', 'profile_men_200_158', 'profile_men_100_84', 'profile_men_500_471', 'profile_men_100_72', 'profile_men_100_81', 'profile_men_600_597', 'profile_men_100_24', 'profile_men_400_327', 'profile_men_200_139'],
+    ),
+    Character(
+      id: 'profile_men_400_332',
+      gender: 'male',
+      age: 35,
+      height: 169,
+      mbti: 'I',
+      rawText: '编号332\n\n【个人简介】\n\n90年来自南方，169/57(偏瘦)，IT(个人事业主)\n年收1000➕\n兴趣爱好：摄影，自驾(有车)，旅游，喜欢户外，偶尔喜欢喝甜的酒(例如鸡尾酒)。\n性格：I人，真诚，顾家，有责任感，通常考虑别人比自己多一些。\n\n【期待的另一半】\n\n文静，性格好，温柔善良，重要的是孝顺。\n不能有纹身，不要太胖。\n\n【展望未来】\n\n希望可以和她自驾旅游，给她拍照 ，带她吃好吃的。\n合适的话（一年左右）谈婚论嫁。\n明年有购房打算。\n\n- （',
+      bmi: 20.0,
+      hometown: '南方',
+      currentLocation: '',
+      occupation: 'IT(个人事业主)',
+      interests: const <String>['户外', '摄影', '旅游', '自驾'],
+      interestIds: const <int>[1, 2, 3, 15],
+      hasHouse: false,
+      hasCar: true,
+      similarIds: const <String>['profile_men_600_565', 'profile_men_500_497', 'profile_men_300_220', 'profile_men_500_411', 'profile_men_100_14', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_men_400_330',
+      gender: 'male',
+      age: 32,
+      height: 177,
+      rawText: '编号330\n微信名字：lyon\n老家：广东省\n现居住：日本东京\n年龄：1993年\n现工作：IT\n年收：750w+\n签证：人文\n学历：大学\n身高/体重：177/70\n爱好:爬山.散步\n\n比较偏理工男，平时工作比较忙，三观正，对待感情认真\n\n择偶标准\n1990以下 163+，喜欢圈子简单的，对待感情认真的，能玩到一起最好。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/02d11a45-55e3-467b-beb6-65ac5c5548d3',
+      bmi: 22.3,
+      hometown: '广东省',
+      currentLocation: '日本东京',
+      occupation: 'IT',
+      interests: const <String>['散步', '爬山'],
+      interestIds: const <int>[47, 20],
+      similarIds: const <String>['profile_men_600_529', 'profile_men_100_8', 'profile_men_600_570', 'profile_men_400_375', 'profile_men_300_249', 'profile_men_600_561', 'profile_men_500_471', 'profile_women_600_507', 'profile_men_100_81', 'profile_men_600_586'],
+    ),
+    Character(
+      id: 'profile_men_400_329',
+      gender: 'male',
+      age: 29,
+      height: 175,
+      zodiac: '天蝎',
+      rawText: '编号329\n年龄：96 东北人\n星座：天蝎\n身高：175 体重83公斤左右有点偏胖\n性格：非常内向\n目前在横滨住\n爱好：游戏 小说\n择偶标准：乐观开朗 粘人一点\n\n- （',
+      image: 'https://github.com/user-attachments/assets/7d3844ae-99ce-4a59-bb18-05bdf11f3ff9',
+      bmi: 27.1,
+      hometown: '东北',
+      currentLocation: '横滨',
+      occupation: '',
+      interests: const <String>['阅读', '游戏'],
+      interestIds: const <int>[25, 21],
+      similarIds: const <String>['profile_men_300_258', 'profile_men_500_470', 'profile_men_600_539', 'profile_men_600_572', 'profile_men_600_597', 'profile_men_400_333', 'profile_men_600_532', 'profile_men_600_544', 'profile_men_400_374', 'profile_men_100_85'],
+    ),
+    Character(
+      id: 'profile_men_400_327',
+      gender: 'male',
+      age: 28,
+      height: 181,
+      rawText: '编号327\n\n男97年东北黑龙江，\n181/80\n现居地東京上野\n爱好：逛街 吃好吃的 旅游和钓钓鱼\n接触新鲜事物 心情好时喜欢做点好吃的\n理想异性：有缘的话希望碰到一个性格开朗温柔的女孩，\n其他的不是很在意主要脾气合的来就好我个人性格比较随和，\n希望碰到一个互相喜欢走到最后一步的人[嘿哈]',
+      bmi: 24.4,
+      hometown: '黑龙江',
+      currentLocation: '東京上野',
+      occupation: '',
+      interests: const <String>['美食', '心情好时喜欢做点好吃的', '接触新鲜事物', '旅游', '逛街', '钓鱼'],
+      interestIds: const <int>[5, 211, 212, 3, 9, 184],
+      similarIds: const <String>['profile_men_100_81', 'profile_men_400_366', 'profile_men_200_158', 'profile_men_400_333', 'profile_men_300_278', 'profile_men_600_539', 'profile_men_200_125', 'profile_men_300_284', 'profile_men_500_437', 'profile_men_100_7'],
+    ),
+    Character(
+      id: 'profile_men_400_323',
+      gender: 'male',
+      age: 28,
+      height: 178,
+      zodiac: '水瓶',
+      mbti: 'ESTJ',
+      rawText: '编号323\n个人资料\n家乡：大连\n坐标：琦玉草加\n生年：1997\n职业：上市公司正社员\n年收: 500+\n星座：水瓶\nMBTI：estj\n身高：178\n体重：80\n学历：语言学校+本科\n爱好：旅游 自驾游 听歌\n\n个人不吸烟 朋友圈干净\n不熬夜 情绪稳定\n有车 有购房打算\n\n期待的关系：\n陪伴 鼓励 支持 信任\n\n期待的理想型：\n92-00年 性格开朗、 合眼缘、喜欢旅行 身高165以上本科或以上学历；\n在东京 或琦玉工作，年收500万日元以上；\n不吸烟、不邋遢、身体健康 无特殊不良嗜好 。',
+      image: 'https://github.com/user-attachments/assets/8e353237-99f5-4ab6-8429-5c5b72eacef8',
+      bmi: 25.2,
+      hometown: '大连',
+      currentLocation: '琦玉草加',
+      occupation: '上市公司正社员',
+      interests: const <String>['音乐', '旅游', '自驾'],
+      interestIds: const <int>[7, 3, 15],
+      hasCar: true,
+      similarIds: const <String>['profile_men_600_539', 'profile_men_400_333', 'profile_men_600_544', 'profile_men_300_284', 'profile_men_700_612', 'profile_men_400_304', 'profile_men_300_258', 'profile_men_600_573', 'profile_men_600_599', 'profile_men_100_81'],
+    ),
+    Character(
+      id: 'profile_men_400_319',
+      gender: 'male',
+      age: 23,
+      height: 181,
+      mbti: 'ESFJ',
+      rawText: '编号319\n【基本信息】：\n2002年，男，福建人，现居东京北新宿大久保，身高181/体重74kg，2022年来日，ESFJ，\n对宠物过敏，不抽烟不喝酒，原生家庭和睦，独生子，日语水平N1是23年拿的日常交流没问题不过专门话题一些太难的名词需要查。\n\n【专业】：本科中央大学IT相关计算机科学专业2024年入学\n\n【性格】：\n比较好商量，有主动能动性，积极发现解决问题，接触感兴趣的事物，能和对方换位思考得出一个双方都比较同意的方案，不太喜欢吵架，偶尔喜欢抽象和逗人玩。\n\n因为过去总是期望太高没达成后数落自己，现在在自我催眠努力过了即便失败也没关系。能努力就多努力一些不过累了也就休息休息这样的态度，朋友心情不好的时候会主动想办法让他开心。会和大部分人搞好关系，但很好的朋友只会保留聊得最投机的几个。\n\n【爱好】：\n平时除了上学之外爱好大概是看动画，打游戏，吃好吃的（比较喜欢吃辣，水果，肉类），以及听音乐（日语为主也有一些偶尔听到喜欢上的各种语种曲），平时会去健身房和卡拉OK。\n\n算是二次元，喜欢有趣的事物知道一些梗（但不喜欢别人乱刷）看一些番手游二游端游（主要是协作类PVE可以和朋友聚会，以及roguelike或者是刷子类RPG，FPS也会玩）除主机基本都会感兴趣就去试一试。游戏和动画都了解不少但比较少积极参与线下活动或是加相关讨论群什么的。\n\n比较宅不太喜欢出远门但还是会让自己多多出门去逛逛转换心情，可以加上微信有很多生活会记录在微信QQ朋友圈空间之类的相册中，也希望对方可以和我交换一些对过去生活的记录让我更好地了解对方。\n\n【将来规划】：\n考研/就业，对图形学方向感兴趣，未来几年的主格调主要是保持学习和放松的平衡，以及提升自己包括专业，社交，健康等多方面上的能力。未来个人想要结婚但可能不太想要小孩（经济负担觉得有些重，不过也还是很遥远的事仍需考虑）。\n\n【希望另一半】：\n在东京，年龄与我相差不到5年，有一定上进心不过也不会把自己逼得太狠，能有比较相近的爱好或是专业上的追求可以相互分享或是互相促进会更好，也相对比较宅但有主观能动性会去积极接触自己感兴趣的东西，试着尝试没尝试过的新事物。能够在努力的时候互相鼓励，难过的时候相互安慰，一起进步。\n\n有一定接话的情商能聊得来生活格调轻松一些，性格比较温和能客观角度换位思考商量事情，无烟瘾，酒可以喝虽然我不太行不过我会偶尔陪朋友喝，真诚一些有什么事可以说出来商量。原生家庭和睦，是独生女会更好一些些。',
+      image: 'https://github.com/user-attachments/assets/f8220c91-a78c-4624-9699-e4f94e2c01b7',
+      bmi: 22.6,
+      hometown: '福建',
+      currentLocation: '东京北新宿大久保',
+      occupation: '学生',
+      interests: const <String>['FPS', 'roguelike', '动漫', '刷子类RPG', '唱歌', '健身', '美食', '音乐', '游戏'],
+      interestIds: const <int>[213, 214, 23, 215, 8, 10, 5, 7, 21],
+      similarIds: const <String>['profile_men_400_378', 'profile_men_600_554', 'profile_men_200_122', 'profile_men_300_232', 'profile_men_300_285', 'profile_men_400_347', 'profile_men_100_65', 'profile_men_100_22', 'profile_men_500_469', 'profile_men_300_230'],
+    ),
+    Character(
+      id: 'profile_men_400_317',
+      gender: 'male',
+      age: 35,
+      height: 175,
+      zodiac: '双鱼座',
+      mbti: 'ENTJ',
+      rawText: '编号317\n性别：男\n出生年月：1990年3月\n星座：双鱼座\n出生地：福建省福州市\n现住：千葉\n工作地：东京\n身高：175cm\n体重：71.4KG\n职业：制药公司研究职\n毕业学校：日本東北大学\n学历：医学博士\n年收：本业+副业800W左右\n在日期间：15年\n签证：高度人才。申请永驻已过了8个多月。\n婚姻：未婚\n爱好：高尔夫球，乒乓球，健身，做菜，资产运用等\n\n性格：\nENTJ指挥官性格。\n非常乐观开朗，比较温和，不强势。情绪非常稳定。\n做事情认真踏实，比较有计划性，有始有终，不会半途而废。\n好奇心，责任心很强。\n\n理财：\n我认为在今后的人生里有一份工资以外的收入十分重要，\n一直在学习资产的管理和运用。\n目前周末的大部分时间用在了研究和分析股票投资方面。\n\n爱好：\n高尔夫球，乒乓球，健身，做料理等。\n坚持健身，想打造好看的身材，跟以前相比现在瘦了很多。\n最近有配合整骨，矫正身体的姿势。\n\n自我评价：\n情绪超级稳定，几乎不生气，和大家都能非常愉快的相处。\n做事情有计划性，且持之以恒。\n我不敢坐移动很剧烈的过山车。\n\n关于对方：\n我希望对方情绪稳定，乐观开朗，爱说爱笑。\n做事情有耐心有毅力，遇到困难和挫折不会轻易的放弃和退缩。\n是个孝顺父母的人，原生家庭很和睦。\n会开车。\n对资产的管理和运用有了解或者有兴趣了解。\n让我们相互成就，一起成长。',
+      image: 'https://github.com/user-attachments/assets/25883868-eeb5-4497-8e45-6ba62e307a03',
+      bmi: 23.2,
+      hometown: '福建省福州市',
+      currentLocation: '千葉',
+      occupation: '制药公司研究职',
+      interests: const <String>['乒乓球', '做饭', '健身', '资产运用等', '高尔夫球'],
+      interestIds: const <int>[64, 29, 10, 216, 217],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_100_83', 'profile_men_600_521', 'profile_men_400_388', 'profile_men_300_239', 'profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_men_400_313',
+      gender: 'male',
+      age: 38,
+      height: 167,
+      mbti: 'ISFP',
+      rawText: '编号313\n\n现住：东京\n来日：9年 永驻\n出生地：辽宁\n性别：男\n年龄： 1987\n身高体重：167/60\n学历：本科\n职业：IT\n年收：1000+\n婚歷：未婚\nmbti：isfp\n爱好：city walk，美食探店，逛超市\n其他：不抽烟，偶尔喝一杯，五官自我感觉端正\n原生家庭：普通家庭，父母有养老金，独子\n未来规划：结婚\n性格：善良温和，有时候也有脾气，上进,\n老实人，喜欢倾听，有点宅\n\n希望的另一半：\n善良，乐观，不丁克，有眼缘',
+      bmi: 21.5,
+      hometown: '辽宁',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['city', '散步', '美食', '逛街'],
+      interestIds: const <int>[46, 47, 5, 9],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_100_2', 'profile_women_200_190', 'profile_men_400_312', 'profile_women_700_627', 'profile_women_400_315', 'profile_women_500_459', 'profile_women_600_558', 'profile_women_600_524', 'profile_men_300_238', 'profile_women_600_537'],
+    ),
+    Character(
+      id: 'profile_men_400_312',
+      gender: 'male',
+      age: 38,
+      height: 166,
+      rawText: '编号312\n87年，福建人，住池袋，立教大学硕士\nみずほ情報総合研究所正社员6年→(现)自营业、兼大学教师(休职中)。\n喜欢打羽毛球（运动类基本都喜欢），散步，看搞笑的影视内容，做投资，DIY，听书，阅读，游戏，弄吃的，尝试没做过的事。\n身高166\n年收700w~800w（稳定增长中）\n希望遇到一个乐观主义，有爱心的人，可以带你一起探店，一起旅行，一起探索世界上美好的点点滴滴。\n本人性格开朗，能静能动的猫科动物性格。智商情商在线，上的了厅堂下的了厨房。有责任感的顾家型。欢迎找我聊天^^',
+      image: 'https://github.com/user-attachments/assets/fb9d0b4c-3940-4a90-a65b-223ceadf8d4c',
+      hometown: '福建',
+      currentLocation: '池袋',
+      occupation: '自营业、大学教师',
+      interests: const <String>['DIY', '做投资', '听书', '尝试没做过的事', '弄吃的', '羽毛球', '散步', '游戏', '看搞笑的影视内容', '阅读'],
+      interestIds: const <int>[218, 219, 220, 221, 222, 40, 47, 21, 223, 25],
+      similarIds: const <String>['profile_men_100_2', 'profile_women_500_459', 'profile_men_400_313', 'profile_women_600_524', 'profile_men_100_54', 'profile_women_200_190', 'profile_women_700_627', 'profile_women_500_486', 'profile_women_400_315', 'profile_women_200_137'],
+    ),
+    Character(
+      id: 'profile_men_400_310',
+      gender: 'male',
+      age: 37,
+      height: 180,
+      zodiac: '龙',
+      rawText: '编号310\n\n大连人、88年出生、属龙、\n身高180、体重80公斤。\n来日16年、永驻、有自己房子、\n无婚史。大学学历。独生子。\n年收500w左右。爱好体育、蒸桑拿。\n不吸烟、应酬会喝酒。\n属相羊、狗、兔、不考虑。\n另外想要比自己小一些的、最好独生女。\n肥胖不考虑、身高155以上。',
+      bmi: 24.7,
+      hometown: '大连',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>['体育', '蒸桑拿'],
+      interestIds: const <int>[224, 225],
+      hasHouse: true,
+      maritalStatus: '无婚史',
+      similarIds: const <String>['profile_men_400_399', 'profile_men_300_220', 'profile_men_100_93', 'profile_men_700_632', 'profile_men_500_413', 'profile_men_400_348', 'profile_men_300_275', 'profile_men_500_446', 'profile_men_200_109', 'profile_men_700_623'],
+    ),
+    Character(
+      id: 'profile_men_400_309',
+      gender: 'male',
+      age: 33,
+      height: 180,
+      rawText: '编号309\n\n【基本信息】\n92年辽宁人\n【学历】\n大学学士\n【职业年收】\n建设业工程师 700\n【身高体重】\n180，身体健康无遗传病\n【自我介绍】。\n高中开始来到日本，\n在关西地区完成学业后来到东京工作，\n现居住在横滨。\n不抽烟，可以喝酒\n爱好电影，游戏，旅行\n\n性格比较随和，情绪稳定，\n个人觉得属于开朗性格。\n家庭关系和睦，父母身体健康。',
+      hometown: '辽宁',
+      currentLocation: '横滨',
+      occupation: '建设业工程师',
+      interests: const <String>['旅游', '游戏', '电影'],
+      interestIds: const <int>[3, 21, 4],
+      similarIds: const <String>['profile_men_400_382', 'profile_men_500_471', 'profile_men_100_14', 'profile_men_600_561', 'profile_men_100_84', 'profile_men_400_349', 'profile_men_300_239', 'profile_men_100_21', 'profile_men_600_598', 'profile_men_100_95'],
+    ),
+    Character(
+      id: 'profile_men_400_308',
+      gender: 'male',
+      age: 40,
+      height: 187,
+      rawText: '编号308\n性别 ：男\n出生年：1985\n出生地：烟台\n现住 ：川崎\n身高体重：187cm/85kg\n在日 ：07年来日本至今\n学历 ：硕士（日本东北大学）\n职业 ：大手日企IT云服务设计+开发管理\n年收 ：850-900w\n爱好 ：读书，电影，运动，旅游，料理\n感情状态： 未婚单身\n性格 ：成熟稳重，情绪稳定温和，\n比较善于洞察身边人情绪，照顾朋友，解决问题。\n希望对方 ：有眼缘，好相处，善解人意。',
+      image: 'https://github.com/user-attachments/assets/40d94b23-b9e4-404c-9102-b0dbe5cecafb',
+      bmi: 24.3,
+      hometown: '烟台',
+      currentLocation: '川崎',
+      occupation: '大手日企IT云服务设计+开发管理',
+      interests: const <String>['做饭', '旅游', '电影', '阅读', '运动'],
+      interestIds: const <int>[29, 3, 4, 25, 6],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_200_181', 'profile_men_200_183', 'profile_men_400_340', 'profile_men_200_189', 'profile_men_300_271', 'profile_men_200_109', 'profile_men_400_310', 'profile_men_200_124', 'profile_men_200_176', 'profile_men_200_180'],
+    ),
+    Character(
+      id: 'profile_men_400_307',
+      gender: 'male',
+      age: 34,
+      height: 172,
+      zodiac: '水瓶',
+      mbti: 'INFJ',
+      rawText: '编号307\n\n性别 ：男\n出生年：1991\n出生地：河北\n现住 ：东京江东区\n身高体重：172cm / 77kg\n在日 ：10年\n学历 ：硕士\n职业 ：医药化学メーカ\n收入 ：500w\nmbti ：INFJ(水瓶)\n爱好 ：撸猫，电影，做饭。自驾游，摄影，吉他。（不抽烟，偶尔小酌）\n感情状态： 未婚单身\n性格 ：随和 稳定 偶尔发疯\n希望对方 ：同龄或者稍小几岁 猫毛不过敏 明事理 顾家',
+      bmi: 26.0,
+      hometown: '河北',
+      currentLocation: '东京江东区',
+      occupation: '医药化学メーカ',
+      interests: const <String>['做饭', '喝酒', '吉他', '摄影', '宠物', '电影', '自驾'],
+      interestIds: const <int>[29, 35, 27, 2, 26, 4, 15],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_300_257', 'profile_women_700_611', 'profile_men_500_441', 'profile_men_300_201', 'profile_men_500_460', 'profile_men_600_570', 'profile_men_400_360', 'profile_men_400_348', 'profile_men_200_182', 'profile_men_200_161'],
+    ),
+    Character(
+      id: 'profile_men_400_305',
+      gender: 'male',
+      age: 34,
+      height: 171,
+      zodiac: '雙子',
+      rawText: '编号305\n\n星座：雙子\n生年：1991\n戶籍：長春\n現住地：東京\n身長：171\n體重：68\n學歷：大學\n職業：人力派遣\n年收：1000+\n赴日：7年\n婚歷：未婚\n趣味：旅遊\n對女方要求：性格好，容易相處',
+      bmi: 23.3,
+      hometown: '長春',
+      currentLocation: '東京',
+      occupation: '人力派遣',
+      interests: const <String>['旅游'],
+      interestIds: const <int>[3],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_200_153', 'profile_men_600_570', 'profile_men_500_441', 'profile_men_300_288', 'profile_women_400_380', 'profile_men_600_600', 'profile_men_300_295', 'profile_women_400_336', 'profile_women_500_459', 'profile_women_300_233'],
+    ),
+    Character(
+      id: 'profile_men_400_304',
+      gender: 'male',
+      age: 25,
+      height: 176,
+      rawText: '编号304\n户籍：辽宁沈阳铁西区\n民族：满\n出生年：2000年7月3日\n身高：176/80\n在日四年 现在是青山学院大学大一学生\n之前在都留文科大学读过两年\n今年在备考东大\n爱好：三国历史 跑步五公里\n性格：脾气好 有礼貌\n家庭情况：仅有妈妈\n希望对方：细心 体贴\n\n[上一页](https://github.com/141801/info/blob/main/men_300.md) [下一页](https://github.com/141801/info/blob/main/men_500.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      image: 'https://github.com/user-attachments/assets/228f25c2-5ee8-46fa-bc0d-f0d94992be7c',
+      bmi: 25.8,
+      hometown: '辽宁沈阳铁西区',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>['历史', '跑步'],
+      interestIds: const <int>[118, 53],
+      similarIds: const <String>['profile_men_100_22', 'profile_men_100_24', 'profile_men_300_284', 'profile_men_700_625', 'profile_men_400_357', 'profile_men_600_539', 'profile_men_200_113', 'profile_men_700_612', 'profile_men_300_292', 'profile_men_600_559'],
+    ),
+    Character(
+      id: 'profile_men_500_497',
+      gender: 'male',
+      age: 34,
+      height: 171,
+      rawText: '编号497\n- [ ] 91年，大阪出生，在中国上过学的中日混血。身高171，现居住さいたま市大宮附近。\n- [ ] 有房有车有摩托，只有房子有贷款。工作现在是在东京都内开taxi，年收入浮动较大700-900之间。（之前做过コンサルティング、不動産、行政書士、公務員、カメラマン)\n- [ ] 家里有四只猫。\n- [ ] 兴趣爱好比较多，喜欢旅行，兜风，骑摩托，摄影，游泳（减肥健身中），看展，听jpop看演唱会，听交响乐，看日剧和综艺，看电影（邦画为主，欧美看过漫威，喜欢恋爱/剧情/推理/漫改/搞笑/文艺，欢迎安利）。\n- [ ] 二次元方面平时休息也会看看动画漫画，打打游戏，玩ps5和switch，最近准备玩怪物猎人新作。喜欢三丽鸥（クロミ＆マイメロ推し)，喜欢初音未来，喜欢pokemon。\n- [ ] 丁克！希望对方会生活在日本。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/96d40508-b3b7-4959-a099-801c6db433e5',
+      hometown: '大阪',
+      currentLocation: 'さいたま市大宮附近',
+      occupation: '出租车司机',
+      interests: const <String>['pokemon', '三丽鸥', '自驾', '初音未来', '音乐', '听交响乐', '怪物猎人', '游戏', '摄影', '旅游'],
+      interestIds: const <int>[226, 227, 15, 228, 7, 229, 230, 21, 2, 3],
+      hasHouse: true,
+      hasCar: true,
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_100_14', 'profile_men_600_561'],
+    ),
+    Character(
+      id: 'profile_men_500_496',
+      gender: 'male',
+      age: 31,
+      height: 178,
+      rawText: '编号496\n\n性别：男\n生年：94\n身高：178\n体重 ：67kg\n婚史：无\n\n学历：博士\n工作单位：外资IT\n职业：IT咨询\n签证：高度人才1号\n地点：京都（明年可能会调到东京）\n\n兴趣爱好：游泳，登山，球类\n希望对方：在日华人，有长居日本打算。聊得来。\n\n- （',
+      bmi: 21.1,
+      currentLocation: '京都',
+      occupation: 'IT咨询',
+      interests: const <String>['游泳', '球类', '爬山'],
+      interestIds: const <int>[19, 231, 20],
+      maritalStatus: '无',
+      similarIds: const <String>['profile_men_600_561', 'profile_men_500_471', 'profile_men_100_4', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16'],
+    ),
+    Character(
+      id: 'profile_men_500_493',
+      gender: 'male',
+      age: 0,
+      height: 176,
+      mbti: 'ENFJ',
+      rawText: '编号493\n\n本人男 身高176体重120\n兴趣爱好方面的话，有音乐方面的也有户外运动方面的，\n最近看Kpop比较多所以比较沉迷跳舞。\n最喜欢的组合是seventeen和stray kids。\nmbti是Enfj，心情好是E人心情差是I人，\n对朋友基本都是比较好心情，\n目前为止没有和朋友吵过架或是闹过矛盾，\n相对来说属于比较包容的类型。\n工作的话，目前在汽车零部件行业top10\n（以前是top500但是出丑闻排名下跌了）的公司做开发，\n休息时间也属于比较多的企业。\n关于喜欢的类型，我属于是看眼缘的人，一般以见面聊天为主，\n可以的话希望见面聊后再考虑下一步，即便不成能做好朋友也可以。\n\n- （',
+      bmi: 19.4,
+      currentLocation: '',
+      occupation: '汽车零部件行业开发',
+      interests: const <String>['户外', '运动', '看Kpop', '舞蹈', '音乐'],
+      interestIds: const <int>[1, 6, 232, 74, 7],
+      similarIds: const <String>['profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_men_500_492',
+      gender: 'male',
+      age: 32,
+      height: 177,
+      zodiac: '天秤',
+      mbti: 'ISFP',
+      rawText: '编号492\n\n大阪工作 ，可以换到对我们有好处的地方\n年收360\n1993年天秤 177cm ， 63kg A型\n国内山东\n喜欢： 修 损坏的东西、街健、游戏、电影\nisfp,istp\n性格：内向，比较宅有喜欢的人一起可以随时出门。别人觉得很反感的事情我觉得没什么，包容性强，同理心，宿命论\n想找一个：\n性格温柔善良最重要，内向腼腆，越胖越好\n人生观：\n人和物都有消亡的一天，但是信息没有。\n如果80岁的时候失去了79年的所有记忆，那就只活了1年。\n人生几十年，跟我一起创造我们的回忆，我们的故事。\n化成灰我们创造的信息也是独一无二不可复制存在某个地方的！\n你抚伤不痛，你慰心不累，你笑我也甜，你苦我亦泪。\n\n- （',
+      bmi: 20.1,
+      hometown: '山东',
+      currentLocation: '大阪',
+      occupation: '',
+      interests: const <String>['修损坏的东西', '游戏', '电影', '街健'],
+      interestIds: const <int>[233, 21, 4, 234],
+      similarIds: const <String>['profile_men_600_561', 'profile_men_500_466', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409'],
+    ),
+    Character(
+      id: 'profile_men_500_489',
+      gender: 'male',
+      age: 38,
+      height: 175,
+      zodiac: '天蝎',
+      mbti: 'ISFJ',
+      rawText: '编号489\n\n1987年11月，身高175，来日本八年，日本国籍，\n有自己的住房无贷款，做软件编程工作，\n年收600万，性格ISFJ，兴趣爱好是看电影和日剧，\n也经常看YouTube上一些讲玄学的视频和旅游播主拍的去旅行的视频，\n周末去练自由搏击，平时虽然比较宅，\n但也希望与另一半环游世界\n希望另一半年龄比我小，\n喜欢小孩，打算长期在日本生活\n\n- （',
+      currentLocation: '日本',
+      occupation: '软件编程',
+      interests: const <String>['看YouTube玄学视频', '旅游', '追剧', '电影', '练自由搏击'],
+      interestIds: const <int>[176, 3, 24, 4, 235],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_400_399', 'profile_men_200_109', 'profile_men_100_2', 'profile_men_200_176', 'profile_men_400_340', 'profile_men_500_446', 'profile_men_400_310', 'profile_men_700_624', 'profile_men_500_413', 'profile_men_300_238'],
+    ),
+    Character(
+      id: 'profile_men_500_488',
+      gender: 'male',
+      age: 33,
+      height: 171,
+      mbti: 'ISTJ',
+      rawText: '编号488\n\n.性别：男\n.出生年份：1992.11\n.籍贯：江苏无锡\n.身高体重：171/65\n.学历：神户大学法学修士 本科国内一本理工科\n.居住地：东京练马区\n.工作：大手日企 知财（基本在宅）年收600～\n.兴趣爱好（方便找共同点)：MBTI:ISTJ. 吉他弹了很多年，\n每周游泳一次，做饭，考证，计划型人格～重视工作生活平衡\n.择偶标准：江浙沪优先，希望年龄不比我大（不绝对），真诚，脾气好，\n因为暂时需要考证什么要花很多时间，可能感觉I人会比较好相处（不绝对）\n\n- （',
+      bmi: 22.2,
+      hometown: '江苏无锡',
+      currentLocation: '东京练马区',
+      occupation: '大手日企 知财',
+      interests: const <String>['做饭', '吉他', '游泳', '考证', '计划型人格', '重视工作生活平衡'],
+      interestIds: const <int>[29, 27, 19, 236, 237, 238],
+      similarIds: const <String>['profile_men_600_570', 'profile_women_300_204', 'profile_men_100_8', 'profile_men_400_360', 'profile_men_500_423', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_men_500_484',
+      gender: 'male',
+      age: 43,
+      rawText: '编号484\n\n82年12月生，离异，一女，不生育\n学历：研究生，语校签，期间考察项目，目标是永驻或者归化。\n择偶标准：年龄上下相差十周岁，身高155以上，学历大专以上。\n\n- （',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '离异',
+      similarIds: const <String>['profile_women_400_364', 'profile_men_600_535', 'profile_men_600_523', 'profile_men_400_346', 'profile_men_300_268', 'profile_women_400_318', 'profile_women_600_526', 'profile_women_600_537', 'profile_men_300_223', 'profile_men_600_569'],
+    ),
+    Character(
+      id: 'profile_men_500_479',
+      gender: 'male',
+      age: 34,
+      height: 163,
+      rawText: '编号479\n性別 -男\n生年 -1991 台灣\n地點 - 東京\n身高 - 163cm\n體重 - 77kg\n年收 - 900-1000+\n興趣 - 旅行 看劇/電影 投資 健身\n（台灣以前有考一張健身教練證照）\n三項大約450kg 深蹲硬舉臥推\n2024 考了潛水 🤿 OW+AOW\n外資公司上班 生活正常 不菸 酒少喝\n有自己的退休目標 穩定前進\n我希望可以提早退休 去體驗世界！\n\n希望妳\n1.眼緣 彼此看得順眼\n2.聊得來\n3.年紀 同年紀或是比我小都可以\n\n- （',
+      image: 'https://github.com/user-attachments/assets/5e7e93ef-0318-452c-a5cf-1e8f56bc7343',
+      bmi: 29.0,
+      hometown: '台灣',
+      currentLocation: '東京',
+      occupation: '外資公司上班',
+      interests: const <String>['健身', '投資', '旅游', '潛水', '看劇', '電影'],
+      interestIds: const <int>[10, 239, 3, 240, 241, 242],
+      similarIds: const <String>['profile_women_700_611', 'profile_women_500_421', 'profile_men_200_128', 'profile_men_400_307', 'profile_men_700_610', 'profile_men_300_257', 'profile_men_300_279', 'profile_men_400_305', 'profile_men_200_161', 'profile_women_500_459'],
+    ),
+    Character(
+      id: 'profile_men_500_474',
+      gender: 'male',
+      age: 34,
+      height: 175,
+      rawText: '编号474\n\n性别：男\n出生年：91年\n身高：175\n体重：70kg左右\n学历：初中\n工作：厨师\n年收：500多点\n出生地：辽宁铁岭\n现居住地：东京日暮里\n兴趣爱好，听听音乐，\n抽烟，不喝酒，做家务，情绪稳定，性格比较随和，人简单\n家庭状况：父母健在，有退休金，还有个姐姐一家在静冈\n其他：技能签证，有驾照\n对女方的要求：90以后\n身高160以上，善良，简单一点，喜欢沟通，情绪稳定，社交圈子不复杂\n\n- （',
+      bmi: 22.9,
+      hometown: '辽宁铁岭',
+      currentLocation: '东京日暮里',
+      occupation: '厨师',
+      interests: const <String>['做家务', '音乐', '抽烟'],
+      interestIds: const <int>[243, 7, 108],
+      similarIds: const <String>['profile_men_600_570', 'profile_women_200_153', 'profile_men_300_277', 'profile_men_600_561', 'profile_men_600_593', 'profile_men_100_30', 'profile_men_100_2', 'profile_men_300_288', 'profile_men_100_95', 'profile_men_100_91'],
+    ),
+    Character(
+      id: 'profile_men_500_471',
+      gender: 'male',
+      age: 32,
+      height: 180,
+      rawText: '编号471\n称呼（姓）：姜\n性别：男\n出生年月：93年\n身高：180\n体重：75\n籍贯：黑龙江哈尔滨\n工作单位：贸易物流公司、正社员\n年收：480➕\n学历（学校）：本科\n是否已婚：未婚\n父母工作情况：母亲待家生活、姐姐以成家，和我一样在日本\n自己的优点：不吸烟，偶尔喝点酒，无不良嗜好。\n开朗乐观、向上阳光，实在、真诚直率有责任。\n希望另一半：能遇到一个心地善良，性格温和情绪稳定，\n三观正、彼此能包容、遇到问题一起解决。\n简简单单的在一起相互关心和相互扶持、开心快乐的度过每天。\n备注：当兵（服兵役2年）、退伍后一段时间～来的日本，\n打算长期在日本工作生活。\n希望你是诚心寻找另一半，奔着成家过日子去的。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/53c68b25-d280-4e6a-8219-a2c56ac6d004',
+      bmi: 23.1,
+      hometown: '黑龙江哈尔滨',
+      currentLocation: '日本',
+      occupation: '贸易物流公司、正社员',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_men_500_470',
+      gender: 'male',
+      age: 27,
+      height: 175,
+      zodiac: '射手座',
+      rawText: '编号470\n\n性别：男\n出生年：98年\n星座：射手座\n身高：175\n体重：70kg\n学历：日本工学院（専門学校）\n工作：サッシ屋（体力活,但不怎么加班）\n年收：300+\n出生地：黑龙江省绥化市\n现居住地：神奈川県藤沢市（最近的车站是高座渋谷）一个人独居\n爱好：运动，游戏，小说\n希望找到一个兴趣爱好相同的女友。\n\n- （',
+      bmi: 22.9,
+      hometown: '黑龙江省绥化市',
+      currentLocation: '神奈川県藤沢市',
+      occupation: 'サッシ屋',
+      interests: const <String>['阅读', '游戏', '运动'],
+      interestIds: const <int>[25, 21, 6],
+      similarIds: const <String>['profile_men_400_329', 'profile_men_100_21', 'profile_men_100_85', 'profile_men_600_557', 'profile_men_100_34', 'profile_men_700_625', 'profile_men_300_297', 'profile_men_300_235', 'profile_men_300_247', 'profile_men_600_530'],
+    ),
+    Character(
+      id: 'profile_men_500_469',
+      gender: 'male',
+      age: 26,
+      height: 184,
+      zodiac: '双鱼',
+      rawText: '编号469\n本人条件：\n出生地：黑龙江\n身高：184\n年龄：99\n星座：双鱼\n工作：上市车企正社员（开发部门）\n学历：大学院毕业\n兴趣爱好：滑雪，冲浪，篮球，唱歌，酷爱J-POP很爱参加演唱会\n要求：\n年龄4岁上下吧，希望孝顺有爱心，能一起旅行陪伴彼此看日出日落。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/afeee91f-bbbe-4d5c-82de-c065d481ffc5',
+      hometown: '黑龙江',
+      currentLocation: '',
+      occupation: '上市车企正社员（开发部门）',
+      interests: const <String>['冲浪', '唱歌', '滑雪', '篮球', '音乐'],
+      interestIds: const <int>[244, 8, 14, 50, 7],
+      similarIds: const <String>['profile_men_300_300', 'profile_men_400_344', 'profile_men_100_12', 'profile_men_400_333', 'profile_men_300_285', 'profile_men_400_357', 'profile_men_200_122', 'profile_men_100_7', 'profile_men_500_437', 'profile_men_100_72'],
+    ),
+    Character(
+      id: 'profile_men_500_466',
+      gender: 'male',
+      age: 31,
+      height: 174,
+      zodiac: '天蝎',
+      rawText: '编号466\n\n本人条件：\n出生地：福建福州\n身高：174\n年龄：94年\n星座：天蝎\n工作：上市车企正社员（开发部门）\n学历：大学院毕业\n家庭情况：爸妈都有退休金，福州市区有房子。\n兴趣爱好：喜欢自驾游，推理类游戏（比如剧本杀)，折腾电脑，吃各地美食，唱歌，做饭（但是不一定好吃😂）\n\n要求：\n1.想找一个也在日本94到00的女生，就正常长相就可以\n2.学部或大学院毕业（包括卒業見込み）\n3.如果1和2不满足的话那希望是长得稍微好看一丢丢\n3.开朗，不会整天负能量爆棚要报复社会😂\n4.原生家庭里没有犯罪的，赌博的，爸妈如果还没退休的话有正经工作的。\n\n骗子，杀猪盘，yp等勿扰\n\n- （',
+      hometown: '福建福州',
+      currentLocation: '日本',
+      occupation: '上市车企正社员（开发部门）',
+      interests: const <String>['做饭', '美食', '唱歌', '折腾电脑', '游戏', '桌游', '自驾'],
+      interestIds: const <int>[29, 5, 8, 245, 21, 39, 15],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_100_4', 'profile_men_600_561', 'profile_men_300_267', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16'],
+    ),
+    Character(
+      id: 'profile_men_500_461',
+      gender: 'male',
+      age: 32,
+      rawText: '编号461\n\n93年，东京大学博士，东京品川区在住。\n不烟不酒。目前毕业工作不满一年，年收700，发际线十分健康\n标准BMI，经常运动（羽毛球）+健身环忠实玩家。\n常年接触乐器（最近是电吉他）\n除此以外的兴趣爱好就是普通的打打游戏+看看动画，有机会也会去看演唱会\n有驾照，旅游有机会都会自驾\n期望：没啥硬性要求，不烟不酒，标准BMI就好。\n比较期待的是性格能合拍，并且能有一些共同话题\n\n- （',
+      currentLocation: '东京品川区',
+      occupation: '',
+      interests: const <String>['健身', '游戏', '吉他', '动漫', '音乐', '羽毛球', '自驾', '旅游'],
+      interestIds: const <int>[10, 21, 27, 23, 7, 40, 15, 3],
+      similarIds: const <String>['profile_men_600_570', 'profile_men_600_552', 'profile_men_600_534', 'profile_men_400_338', 'profile_men_100_35', 'profile_men_200_179', 'profile_men_600_579', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63'],
+    ),
+    Character(
+      id: 'profile_men_500_460',
+      gender: 'male',
+      age: 33,
+      height: 172,
+      zodiac: '处女',
+      mbti: 'ENFJ',
+      rawText: '编号460\n\n性别：男\n身高：172\n体重：70kg\n年龄：92年\n星座：处女\nMBTI：ENFJ\n籍贯：东京出生，上海长大\n现居地：东京都内\n学历：本科\n工作：IT\n年收：450\n\n兴趣爱好：假装喜欢加班，做饭，干饭，散步聊天，游戏，听音乐，\n爱看电影（漫威，和2010年前后的欧美电影，惊悚恐怖推理片除外）\n\n优点：爱做家务（比较在意地板的干净程度），爱做饭且味道自认还不错！\n共情能力强，擅于提供情绪价值\n情绪稳定，现实中比较成熟稳重（和朋友在一起可能绷不住比较神经病），网络上搞笑幽默\n原生家庭可能旁人看着感觉不太幸福，但是清楚知道自己是幸福的，\n所以从小时候的内向寡言成长为现在的神经病的外向\n\n缺点：压力大的时候有时晚上会emo，但是睡醒会reset。比较他律。\n不说话的时候外表比较看着不好惹（但是短视频刷的都是猫猫狗狗ww）\n\n从小就想组建有爱的家庭（喜欢小孩，尊重接受对方如果有不想生孩子的想法）\n希望对方：情绪稳定，如果比较强势的话希望可以心平气和的促膝长谈。喜欢小动物。\n如果相处有问题时希望多沟通，不要互相累积误解。期待平平淡淡，\n下班一起买菜回家，我来做饭看你吃的香喷喷（累的时候可以出去吃吃逛逛）\n\n- （',
+      bmi: 23.7,
+      hometown: '东京出生，上海长大',
+      currentLocation: '东京都内',
+      occupation: 'IT',
+      interests: const <String>['假装喜欢加班', '做饭', '音乐', '电影', '美食', '惊悚恐怖推理片除外', '散步', '游戏'],
+      interestIds: const <int>[246, 29, 7, 4, 5, 247, 47, 21],
+      similarIds: const <String>['profile_men_700_634', 'profile_men_600_570', 'profile_men_600_501', 'profile_men_500_461', 'profile_men_400_338', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_men_500_457',
+      gender: 'male',
+      age: 34,
+      height: 162,
+      zodiac: '天秤座',
+      rawText: '编号457\n性别：男\n出生日期：1991\n身高体重：162/55\n来日：8年\n籍贯：吉林长春\n婚姻状况：未婚单身\n学历：国内本科日本修士\n职业：建筑结构设计\n现居地：东京都新宿区\n年收：500\n星座：天秤座\n爱好：乒乓球，游泳，滑雪，钢琴，羽毛球，摄影，旅行\n其他：不抽烟，有时会喝一点酒\n未来规划：在东京附近定居，明年申请永驻。\n\n自我评价：认真负责，性格温和，办事稳重。喜欢看展览，参观建筑赏风景，追剧。可动可静的类型。\n虽然矮了点，长得不帅气。但自认为是暖男型，会细心照顾好自己的另一半及家庭。喜欢小孩子，有耐心。\n\n希望的另一半：有良好的沟通，情绪稳定。以后打算长期在日本发展。\n具体详情可以线下交流，谢谢。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/e127a305-6d3d-4646-a748-14bbeb19942c',
+      bmi: 21.0,
+      hometown: '吉林长春',
+      currentLocation: '东京都新宿区',
+      occupation: '建筑结构设计',
+      interests: const <String>['乒乓球', '参观建筑赏风景', '摄影', '旅游', '游泳', '滑雪', '看展', '羽毛球', '追剧', '钢琴'],
+      interestIds: const <int>[64, 248, 2, 3, 19, 14, 22, 40, 24, 17],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_women_600_587', 'profile_women_500_459', 'profile_women_700_602', 'profile_women_400_335', 'profile_women_700_619', 'profile_women_200_137', 'profile_women_500_485', 'profile_women_200_154', 'profile_women_300_204', 'profile_women_400_377'],
+    ),
+    Character(
+      id: 'profile_men_500_456',
+      gender: 'male',
+      age: 33,
+      height: 182,
+      zodiac: '射手座',
+      mbti: 'ISFJ',
+      rawText: '编号456\n92年12月\n四川人\n182/70\nISFJ\n985本，九大硕\n谈过两次，白纸一张\n广岛外资大手，年薪900+\n爱好动漫，网游，爬山，烧烤，旅游\n分享欲强，熟悉之后吧啦吧啦没完没了\n将来打算长期在日本定居，如果合适回国也成\n希望对方30以下，身高不限，不要太胖，情绪稳定\n\n- （',
+      image: 'https://github.com/user-attachments/assets/09db18df-aec2-4a1d-9b67-a67aa564e280',
+      bmi: 21.1,
+      hometown: '四川',
+      currentLocation: '广岛',
+      occupation: '外资大手',
+      interests: const <String>['动漫', '旅游', '烧烤', '爬山', '网游'],
+      interestIds: const <int>[23, 3, 249, 20, 250],
+      similarIds: const <String>['profile_men_500_471', 'profile_men_300_239', 'profile_men_600_561', 'profile_men_600_586', 'profile_men_400_382', 'profile_men_500_417', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129'],
+    ),
+    Character(
+      id: 'profile_men_500_455',
+      gender: 'male',
+      age: 30,
+      height: 175,
+      rawText: '编号455\n出生年份：1995\n籍贯：中国辽宁\n身高体重：175cm/82kg\n学历：大学毕业\n居住地：东京\n工作：国际贸易\n兴趣爱好：滑雪，户外运动，健身，可户外也可宅。\n择偶标准：92年～98年\n希望对方心地善良，不急躁，能够互相沟通，互相尊重，真诚对待彼此感情，双向奔赴。\n对未来有憧憬，一起努力一起进步\n本人：\n有分享欲，无论是多么小的事，有应必回。\n不抽烟，不酗酒\n独生子，父母和睦，还没退休\n明年申请永驻，打算长期在东京发展\n会开车，技术你放心\n对于未来也有规划，为了目标奋斗中\n\n- （',
+      image: 'https://github.com/user-attachments/assets/d0cd838f-83da-47a6-a4bb-63d26d24c08c',
+      bmi: 26.8,
+      hometown: '中国辽宁',
+      currentLocation: '东京',
+      occupation: '国际贸易',
+      interests: const <String>['健身', '户外', '运动', '滑雪'],
+      interestIds: const <int>[10, 1, 6, 14],
+      hasCar: true,
+      similarIds: const <String>['profile_men_200_146', 'profile_men_600_532', 'profile_men_300_286', 'profile_men_600_580', 'profile_men_300_278', 'profile_men_200_125', 'profile_men_300_201', 'profile_men_600_522', 'profile_men_400_381', 'profile_women_700_611'],
+    ),
+    Character(
+      id: 'profile_men_500_447',
+      gender: 'male',
+      age: 40,
+      height: 176,
+      rawText: '编号447\n\n性别：男\n出生年份：1985年12月25\n籍贯：辽宁铁岭\n身高体重：176/75\n学历：博士(北海道大学)\n居住地：东京八王子\n工作：科研\n年收:1000+\n兴趣爱好（方便找共同点)：自驾，户外运动，唱歌\n择偶标准:专科以上学历，身高155以上，相貌端正，年纪相仿或者比自己小\n\n- （',
+      bmi: 24.2,
+      hometown: '辽宁铁岭',
+      currentLocation: '东京八王子',
+      occupation: '科研',
+      interests: const <String>['唱歌', '户外', '运动', '自驾'],
+      interestIds: const <int>[8, 1, 6, 15],
+      similarIds: const <String>['profile_men_400_342', 'profile_men_600_535', 'profile_men_300_298', 'profile_men_700_636', 'profile_men_100_2', 'profile_men_100_93', 'profile_men_100_33', 'profile_men_200_143', 'profile_men_200_124', 'profile_men_200_176'],
+    ),
+    Character(
+      id: 'profile_men_500_446',
+      gender: 'male',
+      age: 37,
+      height: 179,
+      zodiac: '巨蟹座',
+      mbti: 'INFJ',
+      rawText: '编号446\n\n名字：蟹bro\n年龄：36（1988/07）星座：巨蟹座mbti：INFJ（51的I，49的E时而切换）\n身高：179cm体型：偏胖（减脂中）\n职业：IT项目管理（日企大手子公司）\n学历：明治大学（本科）\n在日时间：17年（07年～）\n籍贯：辽宁\n宗教信仰：无\n签证：永驻硬件：有车有房有贷款\n爱好：户外运动（慢跑，游泳，骑车），\n球类（网球🎾学校周一次通学中，羽毛球🏸周2次）\n美食探店，电影，听播客…\n\n希望对方：年纪上下五岁以内，有一份自己喜欢的工作。\n有共同爱好当然好，不相同也有自己的爱好（工作之余可以充实生活，缓解压力）。\n对自己，对生活，对世界有自己的观察和见解，并有一颗去了解世界体验新事物的好奇心。\n\n- （',
+      hometown: '辽宁',
+      currentLocation: '',
+      occupation: 'IT项目管理',
+      interests: const <String>['听播客', '户外', '运动', '游泳', '网球', '电影', '美食', '羽毛球', '骑行'],
+      interestIds: const <int>[166, 1, 6, 19, 112, 4, 5, 40, 54],
+      hasHouse: true,
+      hasCar: true,
+      similarIds: const <String>['profile_men_400_340', 'profile_men_400_399', 'profile_men_400_310', 'profile_men_200_109', 'profile_men_600_550', 'profile_men_600_571', 'profile_men_500_489', 'profile_men_100_2', 'profile_men_700_636', 'profile_men_400_358'],
+    ),
+    Character(
+      id: 'profile_men_500_444',
+      gender: 'male',
+      age: 27,
+      height: 176,
+      zodiac: '双鱼',
+      rawText: '编号444\n年龄：1998\n户籍：大连\n星座：双鱼\n现住：东京\n身高：176\n体重：70\n学历：国内本科，日本修士\n婚姻：未婚\n收入：明年就职\n性格：比较安静，性格稳定\n爱好：料理，看书。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/9222b73d-3180-4392-9806-bbf31c27fd6c',
+      bmi: 22.6,
+      hometown: '大连',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['做饭', '阅读'],
+      interestIds: const <int>[29, 25],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_600_517', 'profile_men_100_7', 'profile_men_500_437', 'profile_men_700_626', 'profile_men_100_81', 'profile_men_600_559', 'profile_men_100_65', 'profile_men_100_90', 'profile_men_100_45', 'profile_men_700_620'],
+    ),
+    Character(
+      id: 'profile_men_500_441',
+      gender: 'male',
+      age: 33,
+      height: 175,
+      rawText: '编号441\n\n性别：男\n出生年:1992\n出生地:上海\n现住：东京板桥\n身高：175\n体重：75\n学历：大学\n职业：IT正社员\n年收 ：500+\n性格：\n兴趣：喜欢探美食店 喜欢小动物（有计划养，现在主要去朋友家玩） 旅游\n个人背景以及其他补充:\n现在高度人才签证，最快1年永驻\n不抽烟偶尔喝酒，无不良嗜好,性格稳定很喜欢小孩子\n（之前去镰仓，正好753好多小可爱穿着特别可爱的衣服。感觉心都要化了）\n希望你 ：\n1.未来会在日本生活的 2.圈子不复杂\n3.年龄在93~ 4.学历在大专(专门)以上\n身高158以上,身材匀称,性格温柔+\n家庭关系没有很复杂.\n工作稳定.\n\n- （',
+      bmi: 24.5,
+      hometown: '上海',
+      currentLocation: '东京板桥',
+      occupation: 'IT正社员',
+      interests: const <String>['宠物', '美食', '旅游', '现在主要去朋友家玩'],
+      interestIds: const <int>[26, 5, 3, 251],
+      similarIds: const <String>['profile_men_200_128', 'profile_men_400_305', 'profile_men_600_570', 'profile_men_300_201', 'profile_men_400_307', 'profile_women_700_611', 'profile_men_600_561', 'profile_women_200_153', 'profile_men_300_257', 'profile_men_500_460'],
+    ),
+    Character(
+      id: 'profile_men_500_439',
+      gender: 'male',
+      age: 32,
+      height: 177,
+      rawText: '编号439\n性别：男\n出生年份：1993\n籍贯：山东烟台\n身高体重：177/70\n学历：大专\n居住地：福冈\n工作：营业\n兴趣爱好（方便找共同点)：健身 篮球 音乐 动漫\n择偶标准：年龄最好比我小，身高160左右，最主要要有孝心。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/63646431-e47d-4bd7-876f-a6da66b48122',
+      bmi: 22.3,
+      hometown: '山东烟台',
+      currentLocation: '福冈',
+      occupation: '营业',
+      interests: const <String>['健身', '动漫', '篮球', '音乐'],
+      interestIds: const <int>[10, 23, 50, 7],
+      similarIds: const <String>['profile_men_600_561', 'profile_men_500_471', 'profile_men_400_374', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16'],
+    ),
+    Character(
+      id: 'profile_men_500_437',
+      gender: 'male',
+      age: 27,
+      height: 176,
+      rawText: '编号437\n性别：男\n出生年：1998\n出生地：黑龙江\n现住：东京\n身高体重：176cm/70kg\n在日：17年\n职业：整備士\n年收：500+\n兴趣：健身，滑雪，岩盘浴，电影，美食\n性格：性格开朗，活泼，乐观向上\n休息日：不定休\n希望对方：身高160以上 年龄28岁以下 三观一致\n不抽烟少喝酒没纹身 不要离的太远 休息日能碰上\n\n- （',
+      image: 'https://github.com/user-attachments/assets/264aa0d5-e6a6-4113-af95-898dd52fcc46',
+      bmi: 22.6,
+      hometown: '黑龙江',
+      currentLocation: '东京',
+      occupation: '整備士',
+      interests: const <String>['健身', '温泉', '滑雪', '电影', '美食'],
+      interestIds: const <int>[10, 59, 14, 4, 5],
+      similarIds: const <String>['profile_men_100_90', 'profile_men_100_7', 'profile_men_100_81', 'profile_men_500_444', 'profile_men_200_122', 'profile_men_600_517', 'profile_women_500_448', 'profile_men_100_45', 'profile_men_700_626', 'profile_men_600_559'],
+    ),
+    Character(
+      id: 'profile_men_500_435',
+      gender: 'male',
+      age: 28,
+      height: 170,
+      rawText: '编号435\n『个人资料』\n生年：1997年\n年龄：27岁\n身高：170cm\n体重：110斤（就是不长肉）\n外貌：普通，能见人，不会打扮\n居地：京都\n行业：餐饮，新卒第1年\n来日：第5年\n收入：第一年没结束\n预计扣税350附近\n烟： 不吸\n酒： 偶尔，周1，月3左右\n不喝白酒和清酒\n基本都是果实酒\n性格：沉稳，乐观，偏内向，愿意相信他人，嘴笨不会表达，只会去行动\n兴趣：音乐，日麻，动漫，外出觅食\n『期望』\n体型普通附近，有正式工作，有结婚意向，年龄32岁及以下，收入相近，相貌普通及以上就行，因为我个人没有感情经历，希望对方是一位值得相信的人，渴望一份动漫中的恋爱。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/c2d2e9ec-9c51-4217-b126-1bf13c61f6d2',
+      bmi: 19.0,
+      currentLocation: '京都',
+      occupation: '餐饮',
+      interests: const <String>['动漫', '外出觅食', '桌游', '音乐'],
+      interestIds: const <int>[23, 252, 39, 7],
+      similarIds: const <String>['profile_men_600_591', 'profile_men_500_432', 'profile_women_600_594', 'profile_men_600_588', 'profile_men_600_509', 'profile_men_200_173', 'profile_men_300_235', 'profile_men_600_513', 'profile_men_700_618', 'profile_men_300_216'],
+    ),
+    Character(
+      id: 'profile_men_500_432',
+      gender: 'male',
+      age: 29,
+      height: 178,
+      mbti: 'INTJ',
+      rawText: '编号432\n1996年12月，178/67，intj\n上海，独生子\n本科211 硕士旧帝\n工作在日企做it（二年目），年收算上加班500出个头\n偶尔健身\n喜欢看电影和看海\n\n希望另一半\n年龄上下三岁，体态正常\n能一起培养爱好，互相热烈一些\n\n- （',
+      image: 'https://github.com/user-attachments/assets/e0994541-46e8-443e-8f2b-938d5d879e6c',
+      bmi: 21.1,
+      currentLocation: '上海',
+      occupation: 'IT',
+      interests: const <String>['健身', '电影'],
+      interestIds: const <int>[10, 4],
+      similarIds: const <String>['profile_men_700_618', 'profile_men_100_90', 'profile_men_300_216', 'profile_men_300_249', 'profile_men_100_81', 'profile_men_100_4', 'profile_men_200_173', 'profile_men_500_437', 'profile_men_100_7', 'profile_men_100_89'],
+    ),
+    Character(
+      id: 'profile_men_500_430',
+      gender: 'male',
+      age: 30,
+      height: 172,
+      mbti: 'ENFJ',
+      rawText: '编号430\n\n个人资料]\n家乡：青海 西宁\n工作地:东京 神奈川附近\n生年：1995\nMBTI：ENFJ\n职业：大手外资 工程师(永驻)\n学历: 旧帝国大学 修士\n身高：172\n体重：65 kg\n年收：600+\n[性格]\nWork hard Play hard~\n自律，情绪稳定，行动力较强，做事比较沉稳细心，有主见，容易相处。\n家庭：独生子，父母银行职员，家庭关系和睦。\n[兴趣爱好]\n摩托车，游泳，滑雪，赶海➕钓鱼，摄影，\nVlog，料理，户外露营，自驾游，健身，撸猫。\n兴趣爱好比较广泛，喜欢尝试新鲜事物，学习新技能。\n期待的另一半:\n年龄:95-02年\n温柔乐观，积极向前，有上进心，有主见，情绪稳定，有自己的兴趣爱好。然后最重要的一点是，遇到事情的时候乐于沟通解决。\n遇到好的事情我希望听你分享，遇到不好事情\n时也2个人一起交流解决问题。拒绝各种冷暴力❌，拒绝负能量垃圾桶。\n其它补充：\nP.s 自己家养了一只猫，所以如果对猫毛过敏或者对宠物不太喜欢的人，可能不太合适。\n\n- （',
+      bmi: 22.0,
+      hometown: '青海 西宁',
+      currentLocation: '东京 神奈川附近',
+      occupation: '大手外资 工程师(永驻)',
+      interests: const <String>['Vlog', '健身', '户外', '摄影', '摩托车', '宠物', '做饭', '游泳', '滑雪', '自驾'],
+      interestIds: const <int>[253, 10, 1, 2, 254, 26, 29, 19, 14, 15],
+      similarIds: const <String>['profile_men_200_179', 'profile_men_100_89', 'profile_men_300_209', 'profile_men_300_227', 'profile_women_400_387', 'profile_men_100_81', 'profile_women_500_448', 'profile_men_600_570', 'profile_men_300_216', 'profile_men_700_633'],
+    ),
+    Character(
+      id: 'profile_men_500_428',
+      gender: 'male',
+      age: 36,
+      height: 182,
+      rawText: '编号428\n\n职业：小公司社长\n生日：1989年\n年收: 看公司业绩，1000W-5000W之间不定\n身高：182\n体重：65KG-70KG之间浮动\n学历：硕士\n地点：目前在东京，但可以自由变动，接受全国。\n另一半希望：\n情绪稳定，心理成熟。有适度的自信。\n不是去改变对方以达到自己的要求，而是接受对方原本的样子。\n不合自己的意就发脾气的人NG。性格温和，为人和善。\n160以上，不要太瘦或太胖，我有轻微颜控。\n年龄20岁以上39岁以下。\n她可以在外面做自己喜欢的工作，也可到我公司工作。\n能成为我事业上的辅助那就更好了（不是必须条件）。\n\n- （',
+      bmi: 19.6,
+      currentLocation: '东京',
+      occupation: '小公司社长',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_2', 'profile_men_400_361', 'profile_men_200_155', 'profile_men_600_571', 'profile_men_200_165', 'profile_men_300_277', 'profile_men_500_401', 'profile_men_400_358', 'profile_men_600_585', 'profile_men_100_30'],
+    ),
+    Character(
+      id: 'profile_men_500_423',
+      gender: 'male',
+      age: 34,
+      height: 172,
+      rawText: '编号423\n个人简介\n91年 172cm 62kg\n籍贯：湖北\n工作地：东京\n学历：本科\n工作：it\n年收：500+\n家庭：父母公务员\n性格：性格温和，情绪稳定，较自律，会包容，会换位思考。不抽烟，偶尔微醺，会做饭，喜欢小动物。\n兴趣：喜欢户外，city walk, 徒步，骑行，游泳，潜水，滑雪之类。\n\n喜欢户外也能陪你宅在家。可以在户外走一天，也可以在家做饭看电影，安安静静躺一天。\n不要求对方能跟我一起去徒步滑雪，希望至少可以一起散步遛弯。\n有分享欲，想跟喜欢的人一起探索未知，品尝美食，分享快乐的心情。\n可以有不同的兴趣爱好，能互相尊重即可。我也愿意尝试新鲜事物，愿意花时间陪你做你喜欢的事。\n\n期待的另一半\n90后\n身材匀称（不卡外在，重在感情）\n心地善良，脾气不急躁，能好好沟通，互相尊重并理解。喜欢聊天，愿意分享，有结婚打算。下雨了会往家跑~\n\n- （',
+      image: 'https://github.com/user-attachments/assets/1c287ef5-e194-41f8-b925-608c50479dda',
+      bmi: 21.0,
+      hometown: '湖北',
+      currentLocation: '东京',
+      occupation: 'it',
+      interests: const <String>['city', '散步', '做饭', '徒步', '户外', '游泳', '滑雪', '潜水', '电影', '骑行'],
+      interestIds: const <int>[46, 47, 29, 11, 1, 19, 14, 36, 4, 54],
+      similarIds: const <String>['profile_men_600_593', 'profile_men_600_570', 'profile_men_500_419', 'profile_men_100_57', 'profile_women_200_153', 'profile_men_400_361', 'profile_men_300_277', 'profile_women_600_507', 'profile_women_400_380', 'profile_women_500_459'],
+    ),
+    Character(
+      id: 'profile_men_500_420',
+      gender: 'male',
+      age: 37,
+      height: 168,
+      zodiac: '双鱼座',
+      rawText: '编号420\n自我介紹\n\n1988年生人 龍 雙魚座 O型血\n裸腳身高 168 😅\n體重55公斤左右(成年以來一直這樣)\n體脂肪率15 皮膚咖啡色\n食量不小 就是不胖\n\n出身山東省 家境一般 父母健康\n獨生子 來日14年\n2015-2019 福島大學經濟學系畢業\n大手會社正社員 稅後500+\n目前在茨城日立市居住工作\n自己住 自己做飯 只喜歡中華料理\n感覺自己個子不夠高 （山東小漢）\n皮膚不夠白皙\n\n喜歡看動漫 看電影\n喜歡聽歌聽音樂 但是是音癡\n體育的話喜歡籃球🏀去年開始了滑雪🏂\n喜歡小動物 一直想養狗🐶\n偶爾去爬山 富士山登頂四次\n喜歡汽車 摩托車\n休息日喜歡自駕去看山川湖海 欣賞自然風光\n不玩任何遊戲 不吸煙 厭惡煙草的氣味\n不喜歡酒 幾乎不喝酒👏幸運的是酒精過敏\n\n希望對方：\n最好比我小5-10歲左右\n或許因為自己皮膚稍黑\n對皮膚白皙的女孩子沒有抵抗力😅\n互相理解·尊重和包容\n將心比心 你對我好我會對你更好\n如果雙方投緣 一兩年內能結婚最好不過了\n\n非誠勿擾\n\n- （',
+      image: 'https://github.com/user-attachments/assets/81a705b4-5161-4320-a815-3f97e60e1c6e',
+      bmi: 19.5,
+      hometown: '山东省',
+      currentLocation: '茨城日立市',
+      occupation: '大手会社正社员',
+      interests: const <String>['音乐', '宠物', '喜欢汽车摩托车', '滑雪', '爬山', '动漫', '电影', '篮球', '自驾'],
+      interestIds: const <int>[7, 26, 255, 14, 20, 23, 4, 50, 15],
+      similarIds: const <String>['profile_women_600_556', 'profile_men_400_332', 'profile_women_100_86', 'profile_men_600_565', 'profile_men_600_550', 'profile_men_100_2', 'profile_men_700_624', 'profile_women_700_606', 'profile_men_500_411', 'profile_women_600_502'],
+    ),
+    Character(
+      id: 'profile_men_500_419',
+      gender: 'male',
+      age: 32,
+      height: 178,
+      mbti: 'ISTJ',
+      rawText: '编号419\n\n个人简介\n93年 178cm 65kg\n【籍贯】安徽\n【工作地】东京\n【学历】本科\n【工作】it\n【年收】600+\n【性格】ISTJ 性格温和，情绪稳定，较自律，会包容。不抽烟，不喝酒，会做饭，在健身。\n【兴趣】喜欢户外，city walk, 徒步、滑雪之类。喜欢旅游，自驾兜风，逛博物馆。\n\n喜欢户外但也不是不能宅在家。可以在户外走一天，也可以在家看看电影做做饭，安安静静躺一天。\n不要求对方能跟我一起去徒步滑雪，希望至少可以一起散步遛弯。\n想跟喜欢的人一起探索未知，品尝美食，分享快乐的心情。\n可以有不同的兴趣爱好，能互相尊重即可。我也愿意尝试新鲜事物，陪你做你喜欢的事。\n\n期待的另一半\n年龄：91年～98年之间。\n身高大概158以上，身材匀称（不卡外在，看对眼了这些都不重要）\n心地善良，脾气不急躁，能好好沟通，互相尊重并理解。喜欢聊天，愿意分享。活泼有趣点就更好。\n有稳定工作，最好年收400以上。有结婚打算。\n\n- （',
+      bmi: 20.5,
+      hometown: '安徽',
+      currentLocation: '东京',
+      occupation: 'it',
+      interests: const <String>['city', '散步', '做饭', '健身', '徒步', '户外', '旅游', '滑雪', '电影', '自驾'],
+      interestIds: const <int>[46, 47, 29, 10, 11, 1, 3, 14, 4, 15],
+      similarIds: const <String>['profile_men_600_579', 'profile_men_500_423', 'profile_men_100_30', 'profile_men_300_249', 'profile_men_200_172', 'profile_men_300_277', 'profile_men_600_570', 'profile_men_600_534', 'profile_men_400_375', 'profile_men_400_338'],
+    ),
+    Character(
+      id: 'profile_men_500_418',
+      gender: 'male',
+      age: 27,
+      height: 185,
+      zodiac: '处女',
+      rawText: '编号418\n\n性别：男\n出生年：1998\n星座：处女\n出生地:福建\n现住：横滨\n身高：185\n体重：70\n学历：日本大学院\n职业：上市IT公司社员第二年\n年收 ：500+\n性格：跟熟悉的人会侃侃而谈,谈恋爱的时候喜欢聊天,分享日常.相对来说比较有主见,可能会让人感觉有点强势,但是绝对尊重你的意见!!(可能不适合同样强势的女生,,容易吵架)\n兴趣：料理(中日西全涉猎,不止于单纯的"做饭",更喜欢精致的料理),甜品(最近沉迷),拍照(主要还是拍自己的料理或者甜品比较多),旅游(虽然我没去过很多地方...但是我是想去的)\n个人背景以及其他补充:\n小学时期赴日,现在也是全家定居日本.没有长期回国生活的打算.不抽烟不喝酒(工作应酬会陪喝)无不良嗜好,性格绝对稳定不超雄.然后很喜欢小孩子,学生时期的兼职也是跟小孩子有关的.\n希望对方 ：\n硬性条件👉🏻1.未来会在日本(东京圈)生活的 2.圈子不复杂(你有太多异性朋友我可能会吃醋) 3.年龄在95~02之间 4.学历在大专(专门)以上\n加分项👉🏻\n身高158以上,身材匀称,性格温柔+话多的.\n家庭关系没有很复杂.\n工作稳定.\n将来有意愿要小孩.\n\n- （',
+      bmi: 20.5,
+      hometown: '福建',
+      currentLocation: '横滨',
+      occupation: '上市IT公司社员第二年',
+      interests: const <String>['做饭', '摄影', '旅游', '甜品(最近沉迷'],
+      interestIds: const <int>[29, 2, 3, 256],
+      similarIds: const <String>['profile_men_100_12', 'profile_men_100_84', 'profile_men_300_247', 'profile_men_300_285', 'profile_men_100_7', 'profile_men_700_620', 'profile_men_100_45', 'profile_men_600_530', 'profile_men_100_31', 'profile_men_600_546'],
+    ),
+    Character(
+      id: 'profile_men_500_417',
+      gender: 'male',
+      age: 34,
+      height: 177,
+      zodiac: '天秤',
+      mbti: 'INFJ',
+      rawText: '编号417\n◇生年月日: 1991.10\n◇MBTI : INFJ\n◇星座: 天秤\n◇国籍: 中国\n◇戸籍地 : 山西太原\n◇現住所 : 东京\n◇身長: 177cm\n◇体重: 70kg\n◇最終学歴 : 早稻田修士\n◇ご職業: IT咨询\n◇日本語程度 :N1\n◇赴日经历：7年\n◇签证类型： 永驻\n◇婚歴 : 未婚，两段感情经历。\n◇家族との同居 : 无\n◇趣味 : 比较杂🤣街舞，文史，书法，摄影，登山，乒乓等等！\n\n自己PR:\n性格温和，包容，可i 也可e,富有共情力。\n\n希望女生家庭和睦，有相近的教育经历,\n真诚对待感情，能够换位思考。\n剩下的就都交给眼缘和缘分吧！\n希望可以找到双向奔赴的另一半！\n\n- （',
+      image: 'https://github.com/user-attachments/assets/3a729347-d387-43fb-bf7f-3a604d8b41f4',
+      bmi: 22.3,
+      hometown: '山西太原',
+      currentLocation: '东京',
+      occupation: 'IT咨询',
+      interests: const <String>['乒乓', '书法', '摄影', '文史', '爬山', '舞蹈'],
+      interestIds: const <int>[257, 0, 2, 258, 20, 74],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_300_295', 'profile_women_400_380', 'profile_men_300_239', 'profile_men_600_570', 'profile_men_400_305', 'profile_men_600_600', 'profile_men_400_330', 'profile_men_300_277', 'profile_men_300_288', 'profile_men_600_561'],
+    ),
+    Character(
+      id: 'profile_men_500_416',
+      gender: 'male',
+      age: 29,
+      height: 168,
+      mbti: 'INFP',
+      rawText: '编号416\n96年 168/54kg\n现住：东京\n家乡：江西\n学历：本科\n职业：程序员 年收600\n不抽烟，不喝酒\n爱好：滑雪，小游戏\n性格INFP，不争不吵恋爱脑\n\n期望另一半：\n93~99年，不胖甜妹\n\n- （',
+      image: 'https://github.com/user-attachments/assets/02803925-c55b-4e62-bc7e-29c6dd3295d1',
+      bmi: 19.1,
+      hometown: '江西',
+      currentLocation: '东京',
+      occupation: '程序员',
+      interests: const <String>['游戏', '滑雪'],
+      interestIds: const <int>[21, 14],
+      similarIds: const <String>['profile_men_600_534', 'profile_women_200_134', 'profile_women_100_39', 'profile_men_200_179', 'profile_men_100_59', 'profile_women_500_480', 'profile_women_400_356', 'profile_women_700_621', 'profile_women_600_545', 'profile_women_600_594'],
+    ),
+    Character(
+      id: 'profile_men_500_414',
+      gender: 'male',
+      age: 36,
+      height: 174,
+      zodiac: '狮子座',
+      mbti: 'ENTJ',
+      rawText: '编号414\n89年，来自上海，狮子座，ENTJ，174cm，70kg 住在川崎站。\n目前在一家半导体商社里做FAE，年收800+吧，挺勤俭持家的。\n兴趣爱好是看看剧，还有旅行。\n我平时不算特别忙，周末也不加班。\n生活比较有计划性，周末不出门的话，在家做做家务。\n\n对于另一半\n90年～94年左右的女生吧。有稳定的工作，收入500左右就可以了。\n加班别太多，并且愿意把业余时间的一部分放在谈恋爱上（这点尤其重要）。\n谈恋爱还是需要一点时间的，太忙的可能没时间交流。\n对于容貌，没啥要求，双方都能接受对方外貌即可。\n对于身材，微胖就好，生活不自律，太胖的不合适。\n性格不要太强势就好，有共同的爱好那就最棒了。\n一只宠物OK，太多就不适合。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/41559cad-40ee-4285-8140-60d09c78dc4d',
+      bmi: 23.1,
+      hometown: '上海',
+      currentLocation: '川崎站',
+      occupation: '半导体商社FAE',
+      interests: const <String>['做家务', '旅游', '追剧'],
+      interestIds: const <int>[243, 3, 24],
+      similarIds: const <String>['profile_men_300_220', 'profile_men_400_399', 'profile_men_500_489', 'profile_men_400_310', 'profile_men_700_605', 'profile_men_100_2', 'profile_women_400_380', 'profile_men_300_271', 'profile_men_400_362', 'profile_men_400_309'],
+    ),
+    Character(
+      id: 'profile_men_500_413',
+      gender: 'male',
+      age: 38,
+      height: 177,
+      zodiac: '天蝎座',
+      mbti: 'ESFP-A',
+      rawText: '编号413\n我》87年,177cm,78kg, 北京人，\n硕士研究生毕业。（机械类）天蝎座，ESFP-A人格\n日本大手公司，从事汽车部品设计开发工作。\n永驻签，年收：700万円、有房(新築戸建)。\n坐标：名古屋市。不烟不酒，圈子干净，会做饭。\n\n她》160以上，35岁以下，\n不胖，讲道理，不烟不嗜酒，圈子干净。大学以上学历。\n\n眼缘决定可不可能在一起，性格觉定适不适合在一起，信任决定能不能长久在一起。\n\n我北京人性格，大大咧咧，不喜欢墨迹，主打一真诚。\n要是看的上就带照片和资料私信我就可以※如果谈的好，\n以后可以申请调回横滨工作\n\n- （',
+      image: 'https://github.com/user-attachments/assets/1026a206-54a5-4ec9-8b19-22c3e1d1fb5f',
+      bmi: 24.9,
+      hometown: '北京',
+      currentLocation: '名古屋市',
+      occupation: '汽车部品设计开发',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_200_109', 'profile_men_400_310', 'profile_men_100_2', 'profile_men_400_399', 'profile_men_500_489', 'profile_men_700_636', 'profile_men_200_183', 'profile_men_400_348', 'profile_men_600_535', 'profile_men_100_93'],
+    ),
+    Character(
+      id: 'profile_men_500_411',
+      gender: 'male',
+      age: 36,
+      height: 170,
+      zodiac: '狮子',
+      mbti: 'INTP',
+      rawText: '编号411\n\n性别：男\n出生年：1989\n星座：狮子\nMBTI：intp\n现住：东京品川\n身高：170\n体重：57\n学历：双一流本科\n职业：上市IT公司社员\n年收 ：手取600+\n性格：内向（生活中不擅长社交和网络聊天/但工作中会侃侃而谈）、温和（几乎没有生气过）、超级乐观（无论遇到什么困难都能积极冷静的应对）、责任感强、精神力量强大\n兴趣：看书学习（平均每天5小时以上）、赛车飞行（PPL学习中）、户外（自驾徒步冲浪足球跑步滑翔伞摩托艇等）、钢琴吉他二胡\n希望对方 ：\n因为比较容易相信人，最重要是希望对方是真诚的人，以真诚之心处对象\n因为特别相信爱情的山盟海誓，希望能彼此忠诚，特别憧憬“你若不离我便不弃”的爱情\n因为只在乎人品，在客观条件中只希望对方不胖，其他没要求，学历和收入有没有都行\n\n- （',
+      bmi: 19.7,
+      currentLocation: '东京品川',
+      occupation: '上市IT公司社员',
+      interests: const <String>['户外', '自驾', '徒步', '冲浪', '足球', '跑步', '阅读', '赛车飞行（PPL学习中', '钢琴', '吉他'],
+      interestIds: const <int>[1, 15, 11, 244, 41, 53, 25, 259, 17, 27],
+      similarIds: const <String>['profile_men_100_33', 'profile_men_100_2', 'profile_men_600_510', 'profile_women_400_336', 'profile_men_400_332', 'profile_men_100_57', 'profile_women_500_459', 'profile_men_600_571', 'profile_men_400_358', 'profile_men_200_155'],
+    ),
+    Character(
+      id: 'profile_men_500_404',
+      gender: 'male',
+      age: 32,
+      height: 175,
+      rawText: '编号404\n\n我1993年31岁，湖北人，\n离过婚不带孩子，年收1300万，\n自营业，装修公司，有房子在川口，\n不抽烟不喝酒，身高175，体重65KG，\n爱运动滑雪唱歌，高中毕业在日本7年白手起家，\n努力有上进心，因为将来有投资民宿打算，\n想找一个日语好一些身份好一些性格稳定的女生，\n\n- （',
+      bmi: 21.2,
+      hometown: '湖北',
+      currentLocation: '川口',
+      occupation: '自营业，装修公司',
+      interests: const <String>['运动', '滑雪', '唱歌'],
+      interestIds: const <int>[6, 14, 8],
+      hasHouse: true,
+      maritalStatus: '离婚',
+      similarIds: const <String>['profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_men_500_401',
+      gender: 'male',
+      age: 35,
+      height: 175,
+      zodiac: '摩羯',
+      mbti: 'ISTJ',
+      rawText: '编号401\n现住：东京\n来日：8年\n出生地：湖北武汉\n性别：男\n出生年份： 1990\n身高体重：175/63\n学历：本科\n职业：IT\n年收：600+\n星座：摩羯\nmbti：ISTJ\n爱好：逛B站 看剧追番 游戏（偶尔）\n其他：不抽烟，不喝酒。\n家庭：家庭和睦，父母有养老金\n未来规划：没有回国打算，有可能在东京购房，长期生活发展。\n\n喜欢看电影，打游戏，平常比较宅。\n情绪稳定，性格温和，包容心强，有同理心，善于换位思考，喜欢为他人考虑。\n\n希望的另一半：\n有事及时沟通，不要生闷气，有稳定工作，打算在东京长期发展。情绪稳定，有同理心、不过于自我自私。对未来规划清晰，坦诚相待。\n\n[上一页](https://github.com/141801/info/blob/main/men_400.md)[下一页](https://github.com/141801/info/blob/main/men_600.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      image: 'https://github.com/user-attachments/assets/67dda06f-4e99-4115-a1e9-8c6449722551',
+      bmi: 20.6,
+      hometown: '湖北武汉',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['游戏', '追剧', '电影', '逛B站'],
+      interestIds: const <int>[21, 24, 4, 260],
+      similarIds: const <String>['profile_women_400_380', 'profile_men_500_428', 'profile_men_600_593', 'profile_men_100_2', 'profile_men_300_277', 'profile_men_200_155', 'profile_men_600_571', 'profile_men_600_570', 'profile_men_500_423', 'profile_men_400_358'],
+    ),
+    Character(
+      id: 'profile_men_600_600',
+      gender: 'male',
+      age: 33,
+      height: 176,
+      rawText: '编号600\n.性别：男\n.出生年份：1992\n.籍贯：武汉\n.身高体重：176cm/65kg\n.学历：大专\n.居住地：东京 离新宿20分钟 武汉市内有两套房 东京可贷款买房\n.工作：电工 保安業務 設備点検 会出差 年收500w日币以上\n.兴趣爱好（方便找共同点)：旅游 自由行 想去没去过的地方 唱歌\n.择偶标准 年龄相仿或者小一点 不胖不瘦或微胖 身高没什么要求\n对生活保持热爱 未来可以一起努力 一起奋斗\n\n- （',
+      image: 'https://github.com/user-attachments/assets/160c03b1-09eb-4eb0-a64c-2efa653795ca',
+      bmi: 21.0,
+      hometown: '武汉',
+      currentLocation: '东京',
+      occupation: '电工 保安業務 設備点検',
+      interests: const <String>['唱歌', '想去没去过的地方', '旅游', '自由行'],
+      interestIds: const <int>[8, 261, 3, 262],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_600_570', 'profile_men_600_586', 'profile_men_400_305', 'profile_men_300_252', 'profile_women_400_336', 'profile_men_300_277', 'profile_women_200_153', 'profile_men_300_295', 'profile_men_600_561', 'profile_men_600_579'],
+    ),
+    Character(
+      id: 'profile_men_600_599',
+      gender: 'male',
+      age: 27,
+      height: 172,
+      rawText: '编号599\n【个人信息】\n性别：男\n出生年：98年\n身高：172\n体重：67kg\n学历：大学本科\n工作：IT软件相关（不加班接近500）\n出生地：福建\n现居住地：埼玉\n兴趣爱好：动漫看剧跑步，随便逛逛拍照，偶尔游戏，city walk等\n签证：永驻\n家庭构成：妈妈和哥哥（父亲离世）\n不抽烟极少喝酒\n目前定居日本\n\n【希望对方】\n97以下，长居日本\n无纹身，不抽烟\n正常人类\n其他的没啦，缘分很重要\n\n- （',
+      image: 'https://github.com/user-attachments/assets/bbe48b29-1730-48d9-90f0-e3dda4c6d10d',
+      bmi: 22.6,
+      hometown: '福建',
+      currentLocation: '埼玉',
+      occupation: 'IT软件相关',
+      interests: const <String>['city', '散步', '游戏', '动漫', '追剧', '跑步', '摄影'],
+      interestIds: const <int>[46, 47, 21, 23, 24, 53, 2],
+      similarIds: const <String>['profile_men_300_292', 'profile_men_100_45', 'profile_men_400_344', 'profile_men_700_626', 'profile_men_600_573', 'profile_men_100_85', 'profile_men_600_559', 'profile_men_100_49', 'profile_women_200_171', 'profile_women_100_96'],
+    ),
+    Character(
+      id: 'profile_men_600_598',
+      gender: 'male',
+      age: 32,
+      height: 175,
+      zodiac: '天蝎',
+      mbti: 'INFP',
+      rawText: '编号598\n\n93年男\n身高175 体重65公斤\n居住在横滨\n户籍江苏苏州\n在日6年多，读的大学院，在上市公司メーカー研发类工作，年收550到600\n爱好 运动，玄学，徒步登山，游戏，钢琴，推理小说，心理学哲学，二次元炒股等等，好奇心重\n天蝎座➕INFP 有时也会INFJ\n性格方面比较软，有点粘人的类型\n希望对方年龄比自己小，三观正，有爱心\n\n- （',
+      bmi: 21.2,
+      hometown: '江苏苏州',
+      currentLocation: '横滨',
+      occupation: '上市公司メーカー研发类工作',
+      interests: const <String>['动漫', '徒步', '爬山', '心理学哲学', '阅读', '游戏', '玄学', '运动', '钢琴'],
+      interestIds: const <int>[23, 11, 20, 263, 25, 21, 264, 6, 17],
+      similarIds: const <String>['profile_men_400_382', 'profile_men_300_203', 'profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16'],
+    ),
+    Character(
+      id: 'profile_men_600_597',
+      gender: 'male',
+      age: 31,
+      height: 176,
+      rawText: '编号597\n基本信息： 籍贯：扬州\n现居：市川本八幡\n年龄：1994年（31岁）\n身高：176 体重：82kg\n工作：海淘代切\n年收：400+\n自我概述：扬州人 独生子 父母在国内 母亲退休 父亲明年退休\n本人刚来日本不久 希望另一半：孝顺 真诚即可\n\n- （',
+      image: 'https://github.com/user-attachments/assets/e3c702bb-469d-4245-ac5a-fcb2f7ab9045',
+      bmi: 26.5,
+      hometown: '扬州',
+      currentLocation: '市川本八幡',
+      occupation: '海淘代切',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_600_539', 'profile_men_500_471', 'profile_men_400_333', 'profile_men_300_258', 'profile_men_100_4', 'profile_men_600_561', 'profile_men_300_241', 'profile_women_700_611', 'profile_men_400_374', 'profile_men_100_95'],
+    ),
+    Character(
+      id: 'profile_men_600_596',
+      gender: 'male',
+      age: 35,
+      height: 182,
+      rawText: '编号596\n浙江温州人，今年34岁。身高182cm，体重65kg。\n2013年毕业于同济大学机械系。\n2015年独自来日本工作，因为不是日本本地大学毕业，仅靠大学自学的一点日语基础，先来日本做了派遣。\n后跳槽到日立，现在在全球最大的连接器制造公司工作。\n职位是部门经理，工资年收1000w左右。\n横滨当地有房（贷款）和车子。由于专业和职业的原因，平时基本上遇不到女生，\n加上当时独自来的日本，没有什么亲戚朋友可以帮忙介绍对象。\n平时爱好钓鱼，唱歌。也会偶尔独自一人开车出去旅游。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/70134489-cd9a-401a-9820-dc52db8ee97f',
+      bmi: 19.6,
+      hometown: '浙江温州',
+      currentLocation: '横滨',
+      occupation: '部门经理',
+      interests: const <String>['唱歌', '自驾', '旅游', '钓鱼'],
+      interestIds: const <int>[8, 15, 3, 184],
+      hasHouse: true,
+      hasCar: true,
+      similarIds: const <String>['profile_men_400_372', 'profile_men_300_203', 'profile_men_400_309', 'profile_men_500_428', 'profile_men_400_382', 'profile_men_100_64', 'profile_men_600_550', 'profile_men_600_600', 'profile_men_400_362', 'profile_men_600_586'],
+    ),
+    Character(
+      id: 'profile_men_600_595',
+      gender: 'male',
+      age: 29,
+      height: 182,
+      zodiac: '射手',
+      rawText: '编号595\n出生年：96年11月\n星座：射手\n身高：182\n体重：68kg\n学历：日本某中坚私立大学学部毕业\n工作：会社员三年目，目前年收450-500\n现居住地：千叶（未来会有工作地变动但不会出关东）\n出身地：江浙沪\n家庭情况：独身子，家庭条件良好。父母均为知识分子，国企退休返聘。家庭和睦无负债。\n自我介绍：来日八年，不抽烟，应酬时会喝一点点小酒。明年计划换永驻，有购房计划和购房能力。\n性格偏E，平时下班后回家喜欢玩玩游戏（lol，瓦，steam，switch基本什么都玩！）。\n休息日会比较户外一点，喜欢开着车去乡下爬爬山吃点当地的好吃的。\n理想型：\n年龄+2-4，收入无所谓但有一份稳定的工作。不抽烟（我对味道有点敏感），不是回避性性格，情绪稳定。\n不是颜控但会看眼缘x如果能有相同的兴趣爱好是最好的！\n理想中的生活就是两个人在一起天气好的时候可以一起出去享受户外，下雨的时候窝在家里一起看恐怖片或者玩游戏🥹\n其他：\n感觉自己年纪不小了，希望双方都能以结婚为目标认真谈一段恋爱～比起微信聊天会更希望能语音或者线下约杯咖啡当面交流。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/b5503a88-57bd-4345-9b88-57502adf090f',
+      bmi: 20.5,
+      hometown: '江浙沪',
+      currentLocation: '千叶',
+      occupation: '会社员',
+      interests: const <String>['steam', 'switch基本什么都玩', '吃当地好吃的', '自驾', '爬山', '游戏', '瓦', '看恐怖片'],
+      interestIds: const <int>[265, 266, 267, 15, 20, 21, 268, 269],
+      hasCar: true,
+      similarIds: const <String>['profile_men_100_15', 'profile_men_200_193', 'profile_men_300_300', 'profile_men_100_84', 'profile_men_300_215', 'profile_men_100_81', 'profile_men_100_75', 'profile_men_700_618', 'profile_men_500_471', 'profile_men_300_249'],
+    ),
+    Character(
+      id: 'profile_men_600_593',
+      gender: 'male',
+      age: 35,
+      zodiac: '双子',
+      rawText: '编号593\n年龄：34 双子座O型血\n职业 ：银行 社内se\n业务描述 決済系统维护\n（故障时周末出勤可能性有）\n性格特点 開朗直爽，陽光向上。e型人格\n年收入 8百万左右（根据业绩浮动）\n居住地 東京中心城区，自住公寓一套。\n学历 MBA 筑波大学\n加分點 無抽烟酗酒赌博炒币等任何不良喜好，交友关系单纯，不搞暧昧关系。\n兴趣爱好 滑雪爬山野营等户外运动，另外在家喜欢看電影追剧。\n最近比较喜欢citywalk\n朋友评价 會照顧人，喜歡動物有愛心，男人味足。\n希望你的性格是：沟通能力强有话直说，孝敬长辈父母，能照顾人心疼人。\n善于换位思考，精神稳定成熟最加分👍\n\n- （',
+      image: 'https://github.com/user-attachments/assets/c89e0acc-72d5-45eb-b19c-cf2556c73c85',
+      currentLocation: '東京中心城区',
+      occupation: '银行 社内se',
+      interests: const <String>['散步', '滑雪', '爬山', '户外', '运动', '电影', '追剧'],
+      interestIds: const <int>[47, 14, 20, 1, 6, 4, 24],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_100_57', 'profile_women_400_380', 'profile_men_500_423', 'profile_men_300_295', 'profile_men_100_2', 'profile_men_300_288', 'profile_women_500_459', 'profile_women_200_190', 'profile_men_600_570', 'profile_men_400_358'],
+    ),
+    Character(
+      id: 'profile_men_600_591',
+      gender: 'male',
+      age: 27,
+      height: 168,
+      rawText: '编号591\n家乡：云南昆明\n生日：1998.4.27\n身高：168cm\n体重：58kg\n学历：东北大硕士\n职业：四大审计\n年收：600w\n爱好：电影，看书，旅游，オタク等（喜欢室内活动但不抗拒出门）\n性格：情绪十分稳定，性格测试一直在变就没记，还算是幽默风趣（？）至少是高强度冲浪的人\n居住：京都\n补充：不抽烟可以喝酒，不会开车未来打算长居日本（大概率是京都）\n\n【希望对方可以是】\n年龄：95～04年之间\n不要介意我的身高就好（不穿鞋比我高我都无所谓），\n最好可以一起旅游，玩游戏（双人成行1=1），可以一起发疯\n如果可以一起思考人生就更好了\n\n- （',
+      image: 'https://github.com/user-attachments/assets/dafba4f2-606a-423f-8245-d0c5b30c14ea',
+      bmi: 20.5,
+      hometown: '云南昆明',
+      currentLocation: '京都',
+      occupation: '四大审计',
+      interests: const <String>['旅游', '电影', '阅读'],
+      interestIds: const <int>[3, 4, 25],
+      hasCar: false,
+      similarIds: const <String>['profile_men_500_435', 'profile_women_200_171', 'profile_women_400_354', 'profile_men_700_612', 'profile_men_300_292', 'profile_women_100_96', 'profile_women_400_356', 'profile_women_600_545', 'profile_men_100_13', 'profile_men_700_631'],
+    ),
+    Character(
+      id: 'profile_men_600_588',
+      gender: 'male',
+      age: 27,
+      height: 173,
+      rawText: '编号588\n.性别：男\n.出生年份：1998\n.籍贯：吉林长春\n.身高体重：173/48kg\n.学历：立命館修士\n.居住地：長野県諏訪市\n.工作：開発設計（機械装置）\n.年収：450万円～550万円\n.兴趣爱好：开车兜风，日本动漫，手办模型\n.择偶标准：\n体重相近\n年龄上下5岁以内皆可\n无赌博等不良嗜好\n\n- （',
+      image: 'https://github.com/user-attachments/assets/459d86d1-0e12-4ef0-8e71-3298d29a5239',
+      bmi: 16.0,
+      hometown: '吉林长春',
+      currentLocation: '長野県諏訪市',
+      occupation: '開発設計（機械装置）',
+      interests: const <String>['自驾', '乐高', '动漫'],
+      interestIds: const <int>[15, 56, 23],
+      similarIds: const <String>['profile_men_500_435', 'profile_men_100_60', 'profile_men_300_249', 'profile_men_100_7', 'profile_men_500_432', 'profile_men_700_618', 'profile_men_400_344', 'profile_men_200_122', 'profile_men_700_631', 'profile_men_100_13'],
+    ),
+    Character(
+      id: 'profile_men_600_586',
+      gender: 'male',
+      age: 33,
+      height: 183,
+      rawText: '编号586\n学历:本科毕业\n专业:经济学\n身高:183\n体重:71\n出生年:1992\n在日本生活地方:东京千叶柏\n中国生活:北京\n家庭成员:父母在北京个体户，独生子。\n兴趣爱好:健身，动漫，爬山，猫，自驾游，喜欢到处走走。\n自我介绍:永驻申请中，现在是租房，今年打算买房，吉林户口，从小北京长大，独生子，性格比较随和，善于倾听和陪伴 如果遇到认定的人会全力支持对方 但也有自己独立的社交圈 不会干涉伴侣的私生活 做饭比较拿手但是比不过厨子，有时候也犯懒。高中毕业来了日本，大学毕业后就参加了工作。\n伴侣的期望:年纪相差不大，生活积极乐观，相同的价值观，相互理解，彼此相互扶持成长向前走，人都不完美，能接受彼此的缺点，遇到问题解决问题。 她:年纪90后,地域不限制南北方都可 以,有正式工作,未婚,签证不限,有自 己的思维和处理方式,如果自己有梦想和 规划,我会全力支持你,出现问题及时沟 通不希望出现冷暴力,感情是相互的,势 均力敌的,希望当热烈褪去之时也可以彼 此相互陪伴让生活平静而不失去光彩。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/95f48ca3-6f30-45ff-963b-432c54fc83a0',
+      bmi: 21.2,
+      hometown: '北京',
+      currentLocation: '东京千叶柏',
+      occupation: '',
+      interests: const <String>['健身', '动漫', '喜欢到处走走', '爬山', '猫', '自驾'],
+      interestIds: const <int>[10, 23, 270, 20, 271, 15],
+      hasHouse: false,
+      similarIds: const <String>['profile_men_600_600', 'profile_men_600_529', 'profile_men_400_330', 'profile_men_500_419', 'profile_men_500_428', 'profile_men_500_471', 'profile_men_500_456', 'profile_men_100_69', 'profile_men_100_30', 'profile_men_400_381'],
+    ),
+    Character(
+      id: 'profile_men_600_585',
+      gender: 'male',
+      age: 39,
+      height: 180,
+      zodiac: '天蝎',
+      rawText: '编号585\n出生：1986/10\n身高：180\n体重：145\n性别：男\n地区：东京23区内\n家乡：辽宁大连\n学历：国内本科\n职业：IT\n星座：天蝎\n婚史：未婚\n爱好：旅行、打球（羽毛球、排球、篮球、台球）\n人格：偏i人，熟悉起来后也挺e\n年收：600左右\n自己紹介\n不喜欢争吵、性格温和，情绪稳定。\n\n相手の要望\n年龄90后、身体健康。\n有稳定的工作、性格温柔贤惠，知书达理。相互理解，双向奔赴。\n休息日或在家收拾家一起做饭吃，或者一起出去玩儿。\n谢绝冷暴力\n\n- （',
+      image: 'https://github.com/user-attachments/assets/96171ded-6e31-4722-94c8-2266ff2eb496',
+      bmi: 20.1,
+      hometown: '辽宁大连',
+      currentLocation: '东京23区内',
+      occupation: 'IT',
+      interests: const <String>['台球', '羽毛球', '排球', '旅游', '篮球'],
+      interestIds: const <int>[49, 40, 272, 3, 50],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_200_176', 'profile_men_200_165', 'profile_men_500_428', 'profile_men_600_535', 'profile_men_200_124', 'profile_men_400_340', 'profile_men_400_399', 'profile_men_600_571', 'profile_men_100_2', 'profile_men_100_33'],
+    ),
+    Character(
+      id: 'profile_men_600_580',
+      gender: 'male',
+      age: 29,
+      height: 178,
+      zodiac: '摩羯水瓶座',
+      mbti: 'INTP',
+      rawText: '编号580\n\n我尽人事听天命。该还的还、该给的我给。\n浙江宁波人鄞州（老江东）。定住身份96年的在日本11年。\n现住东京上野附近，目前二种司机。日本（山手线）国内（潘火街道）都有房。\n婚房新装修空了几年了（因为我一直单身。婚房家里人不想被人糟蹋也不想租出去）\n我自己没有车🚗目前是电车党。（曾经也骑过一段时间摩托车）\n星座摩羯水瓶座。身材偏壮（偏胖）体重80 身高178\nintp、会拉小提琴🎻正在自学吹口琴。烟瘾很大\n\n想找一个身材和我匹配一样高高壮壮的女孩。\n我喜欢有生命力的人。会做饭能提供情绪价值加满分💯\n\n- （',
+      bmi: 25.2,
+      hometown: '浙江宁波鄞州',
+      currentLocation: '东京上野',
+      occupation: '二种司机',
+      interests: const <String>['拉小提琴', '自学吹口琴'],
+      interestIds: const <int>[273, 274],
+      hasHouse: true,
+      hasCar: false,
+      maritalStatus: '单身',
+      similarIds: const <String>['profile_men_200_158', 'profile_men_100_81', 'profile_men_500_455', 'profile_men_200_125', 'profile_men_600_539', 'profile_men_400_333', 'profile_men_300_235', 'profile_men_300_278', 'profile_men_400_327', 'profile_men_300_284'],
+    ),
+    Character(
+      id: 'profile_men_600_579',
+      gender: 'male',
+      age: 32,
+      height: 172,
+      rawText: '编号579\n\n性别：男\n生日：1993\n家乡：福建\n身高体重：172/61\n学历：筑波大学修士\n居住地：新宿\n工作：行政书士，自营业第二年\n年收：1200万➕\n属性：来日第六年，超搞笑，不抽烟不喝酒，物欲低到快出家的感觉\n兴趣爱好：看艺术展，文物展，历史，脱口秀，动漫，NBA，搞钱\n希望找一个真诚有趣，聊天话风投机，情绪稳定的女生\n\n- （',
+      bmi: 20.6,
+      hometown: '福建',
+      currentLocation: '新宿',
+      occupation: '行政书士，自营业',
+      interests: const <String>['NBA', '动漫', '历史', '搞钱', '文物展', '看展', '脱口秀'],
+      interestIds: const <int>[275, 23, 118, 276, 277, 22, 278],
+      similarIds: const <String>['profile_men_200_172', 'profile_men_600_570', 'profile_women_600_507', 'profile_men_300_227', 'profile_men_500_419', 'profile_men_400_375', 'profile_women_400_336', 'profile_women_700_628', 'profile_men_500_461', 'profile_women_700_609'],
+    ),
+    Character(
+      id: 'profile_men_600_578',
+      gender: 'male',
+      age: 31,
+      height: 168,
+      zodiac: '双鱼座',
+      mbti: 'ENFJ',
+      rawText: '编号578\n出生：1994\n身高：168\n体重：58kg\n性别：男\n现居地：神奈川县川崎市\n家乡：天津\n学历：修士\n职业：メーカー系软件开发工程师\n星座：双鱼座\n婚史：未婚未育\n爱好：读书（看的不是很多），动漫，手办，游戏，唱歌（周董专精），旅行\n性格：ENFJ（感觉自己偏I）\n收入：社会人第二年，今年目测500w+\n\n自我介绍\n国内大学毕业后在天津工作过一段时间，之后去西藏旅游期间思考了很多决定来日本留学\n2020年年末来的日本，一年语校，两年大学院 24年进入公司。目前人在川崎居住，公司也在川崎车站附近\n不抽烟，不酗酒\n可线下见面（纯约饭也可）\n烤肉，烤鱼，火锅，等等。。比较喜欢吃辣\n\n择偶要求\n今后决定在日本发展，且长期在日本定居。\n无不良嗜好（酗酒，吸烟等）\n沟通至上，冷战NG\n标准BMI\n\n- （',
+      image: 'https://github.com/user-attachments/assets/64ebfde6-01c8-4ad4-a2dc-ecfe90cd5c74',
+      bmi: 20.5,
+      hometown: '天津',
+      currentLocation: '神奈川县川崎市',
+      occupation: 'メーカー系软件开发工程师',
+      interests: const <String>['动漫', '唱歌', '乐高', '旅游', '游戏', '阅读'],
+      interestIds: const <int>[23, 8, 56, 3, 21, 25],
+      maritalStatus: '未婚未育',
+      similarIds: const <String>['profile_men_700_635', 'profile_men_100_85', 'profile_men_600_563', 'profile_men_400_349', 'profile_men_100_14', 'profile_men_600_598', 'profile_men_300_267', 'profile_women_600_531', 'profile_men_100_4', 'profile_men_600_520'],
+    ),
+    Character(
+      id: 'profile_men_600_576',
+      gender: 'male',
+      age: 34,
+      height: 185,
+      rawText: '编号576\n\n出生：1991\n现居住：西川口\n身高体重：185（67公斤）\n职业：内装\n爱好：看书听音乐也会打会游戏\n来日10年\n婚姻：未婚\n收入：500万～700万\n希望你：。基本没啥要求。 能聊的来。三观正常就好了。\n\n- （',
+      bmi: 19.6,
+      currentLocation: '西川口',
+      occupation: '内装',
+      interests: const <String>['阅读', '音乐', '游戏'],
+      interestIds: const <int>[25, 7, 21],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_500_499', 'profile_men_500_428', 'profile_men_400_382', 'profile_men_200_193', 'profile_men_300_274', 'profile_men_500_471', 'profile_men_600_527', 'profile_men_200_107', 'profile_men_600_561', 'profile_men_400_388'],
+    ),
+    Character(
+      id: 'profile_men_600_574',
+      gender: 'male',
+      age: 30,
+      height: 180,
+      rawText: '编号574\n\n95\n四川\n180 65kg\n浙大本科东大硕士\n东京\nAI工程师\n看书 户外运动 乒乓球 羽毛球 投资理财 动漫\n95后 00后，合眼缘，性格好\n\n- （',
+      bmi: 20.1,
+      hometown: '四川',
+      currentLocation: '东京',
+      occupation: 'AI工程师',
+      interests: const <String>['乒乓球', '动漫', '户外', '运动', '投资理财', '阅读', '羽毛球'],
+      interestIds: const <int>[64, 23, 1, 6, 279, 25, 40],
+      similarIds: const <String>['profile_men_100_81', 'profile_men_400_381', 'profile_men_100_51', 'profile_men_100_90', 'profile_men_200_172', 'profile_men_300_249', 'profile_men_100_7', 'profile_men_200_125', 'profile_men_600_534', 'profile_men_600_579'],
+    ),
+    Character(
+      id: 'profile_men_600_573',
+      gender: 'male',
+      age: 29,
+      height: 182,
+      rawText: '编号573\n\n出生年份：1996年\n身高：182cm\n体型：普通\n出生地：北京\n毕业院校：国内985/211\n工作：外企酒店（大手）\n希望对方可以接受不定休，计划周末一起出门或出远门旅游的话会用希望休或有休\n工作地点：六本木\n居住：川口（已购房，无房贷）\n兴趣：动漫，收集手办，游戏，唱歌，尝试各种风格的穿搭，摄影，宠物（家里有一只两岁的布偶猫）。\n烟酒：不抽烟，一个人的时候滴酒不沾，出去聚会气氛到了才会举杯🍻，酒品好，喝再多都能保持意识清醒😂\n来日第六年\n\n性格：\n因为是北方人，喜欢有话直说，不喜欢掖着藏着，\n最接受不了的就是聊着聊着人没了，觉得不合适可以直接说，我心里承受能力极强，哈哈哈。\n\n擅长沟通，E人绝对不会让你冷场，算个活跃气氛小能手。\n\n工作和生活分得很开，完全是两种风格，工作中极其认真，生活中比较随性。\n考虑问题全面，有事儿喜欢商量着来，不会大男子主义。\n\n对另一半的要求不高，聊得来，三观基本一致就可以。\n希望可以约时间线下见面，更直观的了解对方。\n\n- （',
+      hometown: '北京',
+      currentLocation: '川口',
+      occupation: '外企酒店（大手）',
+      interests: const <String>['动漫', '唱歌', '宠物', '尝试各种风格的穿搭', '摄影', '乐高', '游戏'],
+      interestIds: const <int>[23, 8, 26, 280, 2, 56, 21],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_600_508', 'profile_men_100_34', 'profile_men_400_333', 'profile_men_100_35', 'profile_men_600_599', 'profile_men_100_84', 'profile_men_500_432', 'profile_men_100_81', 'profile_men_100_89', 'profile_men_500_471'],
+    ),
+    Character(
+      id: 'profile_men_600_572',
+      gender: 'male',
+      age: 29,
+      height: 171,
+      zodiac: '双鱼座',
+      mbti: 'ENTP',
+      rawText: '编号572\n\n出生：1996\n身高：171\n体重：77kg\n性别：男\n现在居住地区：神奈川川崎\n家乡：江苏南京\n学历：京都大学应用数学系硕士（今年四月准备边工作边继续完成博士论文）\n职业：富士通的一家子公司的IT社畜\n星座：双鱼座\n房车：家乡有房有车原生家庭和谐良好，日本我刚开始工作无房无车\n婚史：没有结过婚\n爱好：钢琴，音乐\n人格：前不久测得是entp还是啥的，主人公类型好像\n收入：今年目测350-400w\n联系方式：qq303521743\n\n自我介绍\n我是2015年来到日本，本科在立教大学理学部数学科，硕士和博士在京都大学情报学应用数学系，今年刚过29岁生日，你们好哈。基本条件都写好了，对于女性我的第一原则是把对方当人，女性在性别之前先是个人。对我感兴趣的大胆一点联系我哈，我当然也会主动去联系我感兴趣的女性的。\n\n择偶要求\n在相互尊重的基础上先纯粹地从颜值，身材，性格思想上看看身为异性会不会互相吸引。但是不做海王！\n\n- （',
+      bmi: 26.3,
+      hometown: '江苏南京',
+      currentLocation: '神奈川川崎',
+      occupation: 'IT',
+      interests: const <String>['钢琴', '音乐'],
+      interestIds: const <int>[17, 7],
+      hasHouse: false,
+      hasCar: false,
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_300_297', 'profile_men_400_329', 'profile_men_300_235', 'profile_men_600_539', 'profile_men_500_470', 'profile_men_300_258', 'profile_men_100_85', 'profile_men_400_374', 'profile_men_500_455', 'profile_men_600_580'],
+    ),
+    Character(
+      id: 'profile_men_600_571',
+      gender: 'male',
+      age: 37,
+      height: 176,
+      rawText: '编号571\n.性别： 男\n.出生年份： 1988\n.籍贯： 山东\n.身高体重：176/ 65\n.学历：本科\n.居住地：东京\n.工作：旅行社职员\n.兴趣爱好（方便找共同点)：电影 跑步 温泉\n.择偶标准 日本生活 不要太胖\n\n- （',
+      image: 'https://github.com/user-attachments/assets/100d6cdb-be62-4ded-82b2-baa3be1942e7',
+      bmi: 21.0,
+      hometown: '山东',
+      currentLocation: '东京',
+      occupation: '旅行社职员',
+      interests: const <String>['温泉', '电影', '跑步'],
+      interestIds: const <int>[59, 4, 53],
+      similarIds: const <String>['profile_men_100_2', 'profile_men_400_358', 'profile_men_100_54', 'profile_men_500_428', 'profile_men_300_238', 'profile_men_100_33', 'profile_men_500_411', 'profile_men_500_401', 'profile_women_400_380', 'profile_men_600_585'],
+    ),
+    Character(
+      id: 'profile_men_600_570',
+      gender: 'male',
+      age: 0,
+      rawText: '编号570\n\n杨超38岁、江苏省徐州市、\n离异有一个儿子12岁、\n收入50万日元左右在东京做厨师的\n\n- （',
+      hometown: '江苏省徐州市',
+      currentLocation: '东京',
+      occupation: '厨师',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '离异',
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_men_600_569',
+      gender: 'male',
+      age: 43,
+      height: 180,
+      rawText: '编号569\n**个人基本情况**\n男，42周岁，日籍，身高180cm，体重70公斤，学历大学本科，现居东京周边，职业是餐馆经营者，年收入日本平均水平之上，车房都不用担心\n\n**性格爱好**\n性格开朗乐观，待人真诚；喜欢阅读、花草、健身、烹饪、生活规律，无不良嗜好，家庭观念强，爱干净整洁，热爱生活，温柔体贴，希望共同经营温馨小家，教育好子女\n\n**理想伴侣**\n希望对方年龄28-40岁，本科以上学历，身高160cm以上，身心健康，有稳定职业，积极热爱生活，脾气好有教养，热爱家庭，孝敬父母，重视子女教育，爱干净\n\n- （',
+      image: 'https://github.com/user-attachments/assets/1c994b7b-c070-411b-83b6-35048822b276',
+      bmi: 21.6,
+      currentLocation: '东京周边',
+      occupation: '餐馆经营者',
+      interests: const <String>['健身', '做饭', '生活规律', '花草', '阅读'],
+      interestIds: const <int>[10, 29, 281, 282, 25],
+      hasHouse: true,
+      hasCar: true,
+      similarIds: const <String>['profile_men_600_535', 'profile_men_300_223', 'profile_women_400_364', 'profile_men_200_176', 'profile_men_500_484', 'profile_men_200_124', 'profile_men_300_213', 'profile_men_400_346', 'profile_men_200_102', 'profile_women_400_318'],
+    ),
+    Character(
+      id: 'profile_men_600_566',
+      gender: 'male',
+      age: 47,
+      height: 168,
+      rawText: '编号566\n东北人，78年，来日本18年，日籍，未来不会回国生活，离异无孩，硕士毕业，自住一户建，\n身高168，体重124，外貌不丑普通人，\n不要求您的外貌，更看重内在，与外貌相比更吸引我的是一个人的思想。\n离异，无孩，很喜欢孩子，面对现实，以后要不要孩子随缘。\n普通社员，年收500，平时时间自由。\n并非不擅长，只是不喜欢社交，厌恶灯红酒绿与莺莺燕燕，更愿意享受家庭的快乐，三餐四季两个人。\n有轻微洁癖，家务料理，都擅长。\n兴趣爱好比较多，拼乐高、看书、打游戏、爬山、徒步、自驾、旅行。\n金钱：只是为了更好生活的工具，生活的乐趣与爱情都比钱重要\n婚姻：沟通与理解，共同付出，双向奔赴\n爱情：也许这个年纪在这样的现实社会里，没人相信爱情，但我相信。\n生活：也许我们决定不了生命的长度，但我们可以共同增加我们生命的宽度，一起去经历这个世界有趣的事情，一起去看山看海看世界。\n事业：一直很随性，没为了什么去拼尽全力过，未来5年，打算努力到无能为力再创业，希望我们可以共同奋斗一次，无论结果，生命里的经历。\n曾经有人教育我：婚姻爱情很现实，但我更愿意相信会有一个人出现。\n唯一的要求：希望你拥有趣的灵魂\n希望我们能一起在这个操蛋的世界里，经营出我们自己的精彩\n\n- （',
+      image: 'https://github.com/user-attachments/assets/a2522f29-74b5-448e-99ee-a6d3fff24568',
+      bmi: 22.0,
+      hometown: '东北',
+      currentLocation: '日本',
+      occupation: '普通社员',
+      interests: const <String>['徒步', '游戏', '乐高', '旅游', '爬山', '阅读', '自驾'],
+      interestIds: const <int>[11, 21, 56, 3, 20, 25, 15],
+      hasHouse: true,
+      maritalStatus: '离异',
+      similarIds: const <String>['profile_women_400_364', 'profile_men_300_223', 'profile_men_500_484', 'profile_men_300_213', 'profile_men_600_523', 'profile_women_600_562', 'profile_men_200_102', 'profile_men_300_268', 'profile_men_400_346', 'profile_men_600_569'],
+    ),
+    Character(
+      id: 'profile_men_600_565',
+      gender: 'male',
+      age: 36,
+      height: 165,
+      zodiac: '蛇',
+      rawText: '编号565\n\n年龄：1989，属蛇\n身高：165、\n籍贯福建\n来日14年、\n学历：国立硕士\n年收：500+\n现在在富山县，酒店服务行业，目前也在转行准备、也可以去对方的城市生活\n喜欢旅行，工作的性质，时间相对充裕，时常会自驾游，或者跟朋友一起结伴同行。\n不抽烟，喝点小酒，但是酒瘾不大、不会有酒后暴乱的情绪😂\n择偶要求：希望能有话说，有天聊，不会说聊天太过于敷衍，毕竟两个人生活还是一辈子的事情，希望是90后吧，善良，温柔吧，如果遇见的话，希望能早点见面，毕竟网上聊天太多，也不如见面来的干脆，有效果。\n\n- （',
+      hometown: '福建',
+      currentLocation: '富山县',
+      occupation: '酒店服务行业',
+      interests: const <String>['旅游', '自驾'],
+      interestIds: const <int>[3, 15],
+      similarIds: const <String>['profile_men_400_332', 'profile_men_300_220', 'profile_women_600_556', 'profile_women_500_459', 'profile_men_500_497', 'profile_men_400_339', 'profile_men_400_305', 'profile_men_100_33', 'profile_men_100_2', 'profile_women_200_137'],
+    ),
+    Character(
+      id: 'profile_men_600_563',
+      gender: 'male',
+      age: 32,
+      height: 166,
+      zodiac: '巨蟹座',
+      rawText: '编号563\n\n自我介绍一下\n出生：93年\n身高：166\n体重：55kg\n性别：男\n地区：横滨市\n家乡：吉林\n学历：大学本科\n职业：工厂工业设备设计（管道居多）\n星座：巨蟹座\n房车：无房无车\n婚史：无\n爱好：电影解说，历史\n人格：熟了很很健谈，不熟很腼腆\n收入：私聊可告知\n相手の要望 :年龄比我小或者比我大一岁两岁五官端正，\n不抽烟，其它的想起来再说吧，暂时没有了\n\n- （',
+      bmi: 20.0,
+      hometown: '吉林',
+      currentLocation: '横滨市',
+      occupation: '工厂工业设备设计（管道居多）',
+      interests: const <String>['历史', '电影'],
+      interestIds: const <int>[118, 4],
+      hasHouse: false,
+      hasCar: false,
+      maritalStatus: '无',
+      similarIds: const <String>['profile_women_600_531', 'profile_men_600_578', 'profile_women_200_191', 'profile_men_700_635', 'profile_women_300_233', 'profile_men_100_14', 'profile_women_700_628', 'profile_men_700_607', 'profile_women_600_538', 'profile_men_100_95'],
+    ),
+    Character(
+      id: 'profile_men_600_561',
+      gender: 'male',
+      age: 0,
+      height: 175,
+      rawText: '编号561\n\n00本地绍兴越城人，独生男孩子，175身高，学历本科，\n家里备好了28.8彩礼+买车+一套镜湖万科房子的money，\n父母有房，工作工资低，躺平男，生活中女生少，有意向的可以dd，\n互相换个照片，打个电话，希望对方积极主动点，\n真诚直接点，能线下见面聊聊\n\n- （',
+      hometown: '绍兴越城',
+      currentLocation: '绍兴越城',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      hasHouse: true,
+      hasCar: true,
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_500_471', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_men_600_560',
+      gender: 'male',
+      age: 64,
+      height: 173,
+      zodiac: '牛',
+      rawText: '编号560\n黄生，61年版本，属牛。 上海人。70公斤，173高。大学加留学，经济及企业管理专业。\n年轻时做过20年的财务管理。也开过7年的工厂。\n有10年的挪威生活工作经历（挪威绿卡持有者），也有正规的厨师证（业余爱好而已）。除了无飞机驾照外（也准备挤出时间去学），车，船都有驾照。\n驾驶技术也不是一般的好！是曾经三次生死车祸换来的结果。\n喜欢开车，有点属于另类地球人。国内三家私企的业主（网上可查）。\n上海拥有130平的自有公司车间，江苏拥有2000平的厂房，均合法有权证。\n会英语，挪威语，普通话，广东话，上海方言。日语正在学习中。\n拥有中国联通公司最早的手机号码至今，1300族，没有变过号码，人品的好坏懂得人应该都懂。\n目前是5年多次的日本旅游签证，已经来过日本四次，一次比一次更深入的了解日本社会，自己的亲侄子加侄女也都在东京，他们属于比较资深的在日华人。\n本人也已在去年取得了菲律宾的永住身份。父母都已经谢世了。\n为了把自己留给最合适的你，本人已单身20余年，虽膝下有三个孩子，但基本都不用操心了。\n本人重视家庭生活，会平衡好事业和家庭的关系。\n精力旺盛，希望在日可以继续发挥余力,也有能力开展各种经济活动。\n要求对方：经历简单，年龄40以下，已经归化或在日永住。\n有一定的经济基础=正常的收入来源，（否则无法结婚申请另一半来日），有意结婚，\n开始新的生活的有缘女士，有能力能够把过去的生活翻篇的，\n国籍不限。谢谢您的耐心阅读🫶\n\n- （',
+      image: 'https://github.com/user-attachments/assets/ff6d0d2a-c87d-44a6-b3ea-56892f827c80',
+      bmi: 23.4,
+      hometown: '上海',
+      currentLocation: '',
+      occupation: '财务管理，工厂业主，私企业主',
+      interests: const <String>['学习语言', '自驾', '做饭'],
+      interestIds: const <int>[283, 15, 29],
+      hasHouse: true,
+      hasCar: true,
+      maritalStatus: '单身',
+      similarIds: const <String>['profile_men_600_566', 'profile_women_600_562', 'profile_women_400_364', 'profile_men_300_213', 'profile_men_300_223', 'profile_men_200_102', 'profile_men_300_222', 'profile_men_100_98', 'profile_men_500_484', 'profile_men_600_523'],
+    ),
+    Character(
+      id: 'profile_men_600_559',
+      gender: 'male',
+      age: 26,
+      rawText: '编号559\n性别：男\n出生年份：1999年\n籍贯：安徽\n身材：身材匀称，热爱健身，生活习惯规律\n学历：硕士在读，预计明年毕业\n居住地：东京近郊，生活稳定\n职业：美企知名半导体企业内定（年收约700万日元）\n兴趣爱好：\n热爱旅行，喜欢探索世界各地美食美景，性格开朗随和，享受有品质的生活方式\n擅长烹饪，平时热衷研究美食，善于创造生活中的小惊喜\n关于未来的她：\n希望遇到一个能与我共享美食乐趣、一起下厨，一起旅行探索世界的人。\n彼此陪伴，共同体验平淡日子里的美好与温暖\n\n- （',
+      image: 'https://github.com/user-attachments/assets/3fa7e25e-0369-48cd-88a0-91079fa9bcde',
+      hometown: '安徽',
+      currentLocation: '东京近郊',
+      occupation: '美企知名半导体企业内定',
+      interests: const <String>['美食', '做饭', '旅游'],
+      interestIds: const <int>[5, 29, 3],
+      similarIds: const <String>['profile_men_500_444', 'profile_men_400_347', 'profile_men_100_22', 'profile_men_100_7', 'profile_men_300_292', 'profile_men_700_626', 'profile_men_500_437', 'profile_men_200_167', 'profile_men_100_45', 'profile_men_300_207'],
+    ),
+    Character(
+      id: 'profile_men_600_557',
+      gender: 'male',
+      age: 28,
+      height: 173,
+      rawText: '编号557\n\n关于我\n97年/173/70kg\n坐标：来自四川，现居千叶市（暂时在千叶站附近，谈恋爱了的话会选择搬家）\n学历：国内靠前211+旧帝大理工科修士\n工作：日本大手二年目，材料研究开发，工作非常稳定，年收600（房补另算）。双休，工作时间自由，愿意花时间到恋爱和家庭上。\n家庭：家在四川县城，家庭情况简单，独生子。父母国企工作，身体健康，容易相处，十分开明。\n婚歴：未婚单身\n烟酒：不抽烟，可以饮酒不酗酒（飲み会之类的，一个人一般不喝），身体健康无不良嗜好。\n签证：目前人文国际签，分已够永驻资格，准备近期去换，长期在日本生活打算\n\n性格：随和，情绪稳定，不乱发脾气。包容心强好说话，乐观积极，开朗~体谅他人。顾家的类型。\n爱好：运动（篮球乒乓球游泳，只是喜欢但不算擅长），外出，旅游，二次元（浓度不算太高，主要看番，イベント有人一起会想参加，谷子可买可不买）,游戏（主机游戏，手游不怎么玩），吃，温泉\n也比较愿意尝试新的爱好\n家庭：家里大大小小的事两个人商量着来，积极分担家务。以后是想要孩子的~\n其他：喜欢小动物，如果两人都愿意以后可以考虑喂养~\n\n希望你：\n年龄：95后\n居住地：东京千叶附近，打算长期在日本的，以结婚为目的。\n身高体重：比我矮就行，体重正常范围\n学历：最好本科以上（不卡死）\n工作：有一份正经的工作，稳定的收入来源，能养活自己\n性格：孝顺，坦诚。喜欢开朗活泼一点的，对生活有热情，随和，愿意沟通，三观正，不娇情，懂得尊重和体谅他人\n爱好：如果能喜欢二次元或者游戏更好，不一定要喜欢，但是不排斥。能一起到处玩，吃吃喝喝那种~适当运动\n其他：身体健康，无天价彩礼。无婚史，不抽烟，不丁克，会适当捯饬自己\n\nPS：在确定关系之后，粘人一点没关系。希望能拥有一个自己的小家，两个人互相体谅和扶持，遇到事情和矛盾冷静对待，坦诚相待。\n\n- （',
+      bmi: 23.4,
+      hometown: '四川',
+      currentLocation: '千叶市',
+      occupation: '日本大手材料研究开发',
+      interests: const <String>['动漫', '吃', '外出', '尝试新的爱好', '旅游', '温泉', '游戏', '运动', '篮球', '乒乓球'],
+      interestIds: const <int>[23, 284, 285, 286, 3, 59, 21, 6, 50, 64],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_300_215', 'profile_men_600_544', 'profile_women_200_171', 'profile_men_100_75', 'profile_men_500_470', 'profile_men_300_300', 'profile_men_300_292', 'profile_men_700_612', 'profile_men_200_188', 'profile_men_600_597'],
+    ),
+    Character(
+      id: 'profile_men_600_555',
+      gender: 'male',
+      age: 28,
+      height: 170,
+      zodiac: '双鱼',
+      mbti: 'ENFJ',
+      rawText: '编号555\n\n山东济南人～来日8年，大学-修士都在日本。\n\n97年，170/65/双鱼 ENFJ\n\n目前在东京工作 都市コンサルタント的新入社员\n\n父母都是大学教授。目前无养老疾病之虞。家庭合睦少有矛盾。有时间回国就团聚一下。\n\n目前打算长期在日本发展\n\n爱好：\n摄影\n自驾游\n逛古村落•遗迹•牧场•动物园•各种跳蚤市场•设计展\n平日运动不多，但擅长长跑 喜欢登山和骑车\n作为消遣偶尔打游戏（NS，电脑）\n\n没有烟酒等成瘾嗜好\n\n- （',
+      bmi: 22.5,
+      hometown: '山东济南',
+      currentLocation: '东京',
+      occupation: '都市コンサルタント的新入社员',
+      interests: const <String>['游戏', '摄影', '电脑', '爬山', '自驾', '跑步', '骑行'],
+      interestIds: const <int>[21, 2, 287, 20, 15, 53, 54],
+      similarIds: const <String>['profile_women_700_614', 'profile_men_100_81', 'profile_women_200_103', 'profile_men_500_430', 'profile_men_200_179', 'profile_men_100_59', 'profile_men_600_517', 'profile_men_100_7', 'profile_women_600_545', 'profile_men_100_49'],
+    ),
+    Character(
+      id: 'profile_men_600_554',
+      gender: 'male',
+      age: 24,
+      height: 180,
+      zodiac: '白羊座',
+      mbti: 'ENFJ-A',
+      rawText: '编号554\n出生：01\n身高：180\n体重：72\n性别：男\n现居：东京都八王子市（明年可能会搬到都心）\n家乡：山西省\n学历：大专学历\n职业：介护（明年转护士）\n星座：白羊座\n房车：无房无车\n婚史：无\n爱好：打游戏，看动漫、旅游拍拍照，还有做家务\n性格：比较认真，适应性强可I可E,温柔，稳重，\n人格：ENFJ-A\n自己紹介：本人想找以结婚为目的的长期恋爱。\n在外面有主见、看得懂地图，懂得规划路线，是一个活导航，\n在家里比较安静，擅长倾听、擅长家务属于那种主管内务的类型。\n照顾过老人也照顾过小孩。处的熟了可能会粘人。\n不抽烟，不赌博，酒的话可以喝也可以不喝。\n将来打算长期定居日本\n\n对另一半期望：年龄希望21〜28\n身高160 ± 10\n收入：有一份基本工作就可以\n性格：最好是可爱型的（粘人的最好）、能陪着我出去玩、出去旅游、一起生活下去的。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/94af740c-90c5-40d9-b59a-d7e4c7ba3bd0',
+      bmi: 22.2,
+      hometown: '山西省',
+      currentLocation: '东京都八王子市',
+      occupation: '介护',
+      interests: const <String>['游戏', '旅游', '摄影', '动漫', '还有做家务'],
+      interestIds: const <int>[21, 3, 2, 23, 288],
+      hasHouse: false,
+      hasCar: false,
+      maritalStatus: '无',
+      similarIds: const <String>['profile_men_100_22', 'profile_men_200_122', 'profile_men_400_378', 'profile_men_400_319', 'profile_men_300_232', 'profile_men_300_285', 'profile_men_400_337', 'profile_men_100_65', 'profile_men_100_45', 'profile_men_100_7'],
+    ),
+    Character(
+      id: 'profile_men_600_552',
+      gender: 'male',
+      age: 32,
+      height: 170,
+      rawText: '编号552\n.昵称：单\n.性别：男\n.出生年份：93/3\n.籍贯：山东\n.身高体重：170/62公斤\n.学历：专门\n.居住地：暂定东京\n.工作：刚毕业\n.兴趣爱好（方便找共同点)：游戏 健身 运动\n.择偶标准：孝顺父母 能结婚\n\n- （',
+      image: 'https://github.com/user-attachments/assets/448e7712-7831-4907-9779-1925a5850930',
+      bmi: 21.5,
+      hometown: '山东',
+      currentLocation: '东京',
+      occupation: '刚毕业',
+      interests: const <String>['健身', '游戏', '运动'],
+      interestIds: const <int>[10, 21, 6],
+      similarIds: const <String>['profile_men_600_570', 'profile_women_600_542', 'profile_men_500_461', 'profile_men_100_35', 'profile_men_600_534', 'profile_men_600_509', 'profile_men_100_57', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63'],
+    ),
+    Character(
+      id: 'profile_men_600_550',
+      gender: 'male',
+      age: 36,
+      height: 176,
+      rawText: '编号550\n年龄： 1989\n学历： 本科（国内TOP类院校）\n身高体重： 176/65\n爱好： 喝茶，养花，看书，做饭，运动，吃烤肉\n工作： 大手正社，work&balance还不错\n年收： 800〜900\n来日时间： 12年，永住\n其他_1： 不抽烟，偶尔喝酒，不秃头，没有大肚子\n其他_2： 有过一段婚姻\n\n■希望对方\n33岁以下※考虑要小朋友\n本科以上\n160以上，BMI正常，身体健康\n有正式工作\n\n- （',
+      image: 'https://github.com/user-attachments/assets/6a6a96f3-7108-48cb-8fab-6f713b2f91fd',
+      bmi: 21.0,
+      currentLocation: '',
+      occupation: '大手正社',
+      interests: const <String>['做饭', '养花', '吃烤肉', '喝茶', '阅读', '运动'],
+      interestIds: const <int>[29, 289, 290, 32, 25, 6],
+      maritalStatus: '有过一段婚姻',
+      similarIds: const <String>['profile_men_700_624', 'profile_men_100_2', 'profile_men_400_372', 'profile_men_400_358', 'profile_men_500_428', 'profile_men_500_411', 'profile_men_600_541', 'profile_men_100_33', 'profile_men_400_332', 'profile_men_600_571'],
+    ),
+    Character(
+      id: 'profile_men_600_548',
+      gender: 'male',
+      age: 29,
+      height: 166,
+      zodiac: '狮子座',
+      rawText: '编号548\n\n自我介绍\n出生：96年\n星座：狮子座\n老家：黑龙江哈尔滨\n现居住：埼玉县川口，独居\n现工作地：东京惠比寿\n在日本生活近十年\n签证：永驻\n职业：厨师\n身高166\n比较童颜（绝对与实际年龄不相符的那种）哈哈哈\n不抽烟，偶尔会喝点酒（基本一杯就满足）\n\n爱好：看书，看电影，爬山，拳击，滑雪\n喜欢大自然，喜欢听音乐\n性格：比较擅长倾听，注重约定，有点内向，喜欢安静（但不会冷暴力，注重沟通，解决问题）\n我是一个比较慢热的人，但一旦熟悉起来，会感受到我的真诚和温柔，\n我希望自己能找到一个分享生活的伴侣，一起看世界，制作美好回忆。\n\n希望另一半不冷暴力，可以沟通一起解决问题，性格开朗的。\n\n如果你也喜欢简简单单，那就给我发个消息吧！\n愿我们都能找到属于自己的幸福及伴侣！\n期待与你相遇\n\n- （',
+      hometown: '黑龙江哈尔滨',
+      currentLocation: '埼玉县川口',
+      occupation: '厨师',
+      interests: const <String>['音乐', '户外', '拳击', '滑雪', '爬山', '阅读', '电影'],
+      interestIds: const <int>[7, 1, 291, 14, 20, 25, 4],
+      similarIds: const <String>['profile_men_100_74', 'profile_women_200_168', 'profile_women_200_103', 'profile_men_100_4', 'profile_women_600_545', 'profile_women_300_202', 'profile_women_500_480', 'profile_women_400_354', 'profile_women_600_594', 'profile_men_100_49'],
+    ),
+    Character(
+      id: 'profile_men_600_546',
+      gender: 'male',
+      age: 29,
+      height: 179,
+      zodiac: '摩羯',
+      mbti: 'ESFP-ISFP摇摆',
+      rawText: '编号546\n96 上海人 179cm 66kg 四大咨询\n摩羯，中日韩英四语\n京都高中本科 英国G5+韩国sky 文理双硕\nesfp-isfp摇摆，性格做事有点佛系，\n但又随心所欲。愿意倾听别人的故事。\n热衷世界美食（也会自己做），骑马，国内养猫，\n喜欢旅行探险，玩单机\n\n简单希望对方：95后00后均可，能适当收拾自己，\n生活上不要有压迫感，年纪经历地区有相仿部分就再好不过了\n\n- （',
+      image: 'https://github.com/user-attachments/assets/ecb09ab4-1ee7-4aba-b1b5-0c4c8b22718a',
+      bmi: 20.6,
+      hometown: '上海',
+      currentLocation: '',
+      occupation: '四大咨询',
+      interests: const <String>['旅游', '宠物', '美食', '玩单机', '骑马'],
+      interestIds: const <int>[3, 26, 5, 292, 293],
+      similarIds: const <String>['profile_men_400_352', 'profile_women_100_96', 'profile_men_600_519', 'profile_men_100_81', 'profile_men_700_612', 'profile_men_100_4', 'profile_men_100_84', 'profile_men_600_544', 'profile_men_600_508', 'profile_men_300_292'],
+    ),
+    Character(
+      id: 'profile_men_600_544',
+      gender: 'male',
+      age: 29,
+      height: 174,
+      zodiac: '金牛座',
+      rawText: '编号544\n\n个人基本情况\n出生年月：1996年\n星座： 金牛座\n身高： 174cm\n体重： 72kg\n籍贯： 湖南湘潭\n民族：汉族\n学校：本：双非一本 ，硕：谢菲尔德大学\n行业/*单位：美国上市互联网企业\n年收入:1500+\n在就资格：五月拿到高度人才\n家庭情况：父母-独生子\n兴趣爱好：健身，看书，旅游，羽毛球、爬山\n\n希望的另一半：\n95后，长期在东京\n有想法，对自己人生有规划，\n有上进心，有爱心，温柔\n身高不低于160，偏瘦白，喜欢运动，一定不能冷暴力\n\n- （',
+      bmi: 23.8,
+      hometown: '湖南湘潭',
+      currentLocation: '',
+      occupation: '美国上市互联网企业',
+      interests: const <String>['健身', '旅游', '爬山', '阅读', '羽毛球'],
+      interestIds: const <int>[10, 3, 20, 25, 40],
+      similarIds: const <String>['profile_women_200_171', 'profile_men_100_89', 'profile_men_100_4', 'profile_men_100_49', 'profile_men_600_539', 'profile_men_700_612', 'profile_men_600_557', 'profile_men_100_81', 'profile_men_100_19', 'profile_men_300_292'],
+    ),
+    Character(
+      id: 'profile_men_600_543',
+      gender: 'male',
+      age: 33,
+      height: 174,
+      rawText: '编号543\n姓名：小雨\n性别：男\n年龄：1992\n家乡：大连中山区\n身高：身高174cm\n体重：70kg\n学历：硕士\n职业：上市日企IT社员（已拿永驻、无秃顶 ：） ）\n工作内容：云服务、后端开发、研究所（基本在宅勤务）\n年收：600w+\n爱好：户外（中级网球、骑行、徒步）、室内（木吉他、钢琴）、长年健身、风景旅游\n\n期望对方\n年龄：90年以内\n有稳定工作、性格温柔、热爱生活、期待在日本长期生活、身高155cm以上、体重BMI非肥胖\n\n- （',
+      image: 'https://github.com/user-attachments/assets/4206b162-60ef-4b25-ab16-e817181ea2f0',
+      bmi: 23.1,
+      hometown: '大连中山区',
+      currentLocation: '',
+      occupation: '上市日企IT社员',
+      interests: const <String>['吉他', '徒步', '户外', '网球', '钢琴', '健身', '旅游', '骑行'],
+      interestIds: const <int>[27, 11, 1, 112, 17, 10, 3, 54],
+      similarIds: const <String>['profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_300_239'],
+    ),
+    Character(
+      id: 'profile_men_600_541',
+      gender: 'male',
+      age: 37,
+      height: 181,
+      zodiac: '巨蟹',
+      rawText: '编号541\n\nAlex 1988年 巨蟹 身高181，体重68，有点偏瘦，\n离异有小孩归对方，现在在大阪建筑方面工作，\n东京短大毕业 母亲在日本，分隔两地，\n性格温和，顾家型很粘人，\nN1现在备考catti三笔，\n爱好散步，历史，音乐，运动等\n希望对方，情绪稳定，有素质，没有家庭暴力\n\n- （',
+      bmi: 20.8,
+      currentLocation: '大阪',
+      occupation: '建筑方面工作',
+      interests: const <String>['历史', '散步', '运动', '音乐'],
+      interestIds: const <int>[118, 47, 6, 7],
+      maritalStatus: '离异有小孩归对方',
+      similarIds: const <String>['profile_men_200_109', 'profile_men_600_550', 'profile_men_500_428', 'profile_women_400_315', 'profile_men_100_71', 'profile_men_500_446', 'profile_men_400_340', 'profile_women_400_369', 'profile_men_300_277', 'profile_men_200_165'],
+    ),
+    Character(
+      id: 'profile_men_600_539',
+      gender: 'male',
+      age: 29,
+      height: 180,
+      mbti: 'ENFJ-T',
+      rawText: '编号539\n\n出生月：96年5月\nmbti：ENFJ-T\n职业：某メーカー的芯片工程师\n居住地：茨城県ひたちなか市\n年收：550+\n婚姻状况：未婚\n籍贯：陕西\n身高：180\n体重：84\n学历：国内本日本硕\n家庭：父母在国内，双体制内\n\n- （',
+      bmi: 25.9,
+      hometown: '陕西',
+      currentLocation: '茨城県ひたちなか市',
+      occupation: '芯片工程师',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_400_333', 'profile_men_600_597', 'profile_men_500_471', 'profile_men_200_158', 'profile_men_100_81', 'profile_men_100_84', 'profile_men_100_24', 'profile_men_600_544', 'profile_men_100_4', 'profile_men_100_72'],
+    ),
+    Character(
+      id: 'profile_men_600_536',
+      gender: 'male',
+      age: 30,
+      height: 168,
+      mbti: 'INTP-A',
+      rawText: '编号536\n出生月：95年3月\nmbti：intp-a\n职业：大手银行se\n居住地：神奈川 川崎市\n年收：600+\n婚姻状况：没结婚 没有私生子\n籍贯：四川\n身高：168\n体重：60\n学历：国内本日本硕\n家庭：父母在日本，不和他们住一起。自己有小公司，不需要我养老。\n\n比较喜欢有深度的聊天，也可以接受一个下午什么都不做只晒太阳。\n兴趣是了解新的东西，本科是建筑设计，硕士是学过建筑物理（没毕业）和经济学，现在做IT。\n\n希望对方喜欢探讨一些有意思的东西\n然后如果做IT也不错，可以一起交流\n\n- （',
+      image: 'https://github.com/user-attachments/assets/c7f24d93-e066-4832-8390-72790ca90ea8',
+      bmi: 21.3,
+      hometown: '四川',
+      currentLocation: '神奈川 川崎市',
+      occupation: '大手银行se',
+      interests: const <String>['IT', '了解新的东西', '建筑物理', '建筑设计', '有深度的聊天', '经济学'],
+      interestIds: const <int>[294, 295, 296, 297, 298, 299],
+      maritalStatus: '没结婚 没有私生子',
+      similarIds: const <String>['profile_men_100_4', 'profile_men_400_349', 'profile_men_300_297', 'profile_men_100_85', 'profile_men_700_607', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_men_600_535',
+      gender: 'male',
+      age: 41,
+      height: 175,
+      rawText: '编号535\n\n东京 找女朋友\n84年出生 沈阳人\n身高175 离异\n自己开公司 做旅游行业\n没有不良嗜好 情绪稳定 会煮饭\n希望找一个东京都内160以上的温柔贤惠的女生，能够共同发展的最好\n\n- （',
+      hometown: '沈阳',
+      currentLocation: '东京',
+      occupation: '自己开公司 做旅游行业',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '离异',
+      similarIds: const <String>['profile_men_500_484', 'profile_women_400_318', 'profile_men_200_176', 'profile_men_200_124', 'profile_men_500_447', 'profile_men_400_342', 'profile_men_100_2', 'profile_women_400_364', 'profile_women_600_537', 'profile_men_200_109'],
+    ),
+    Character(
+      id: 'profile_men_600_534',
+      gender: 'male',
+      age: 30,
+      height: 174,
+      zodiac: '水瓶座',
+      rawText: '编号534\n\n家乡：辽宁大连\n工作地：东京\n生年：1995 水瓶座 未婚\n职业：码农\n学历：本科\n身高：174\n体重：62KG\n年收：510\n兴趣爱好：\n动漫，游戏，旅游，溜达。\n\n自我介绍：\n基本每天在宅工作，能兼顾家庭和工作，不抽烟不喝酒无纹身不乱跑。\n一个人的话平时宅属性偏多，有另一半会想一起做些户外活动。\n社交圈比较窄，下班周末一般看看动漫或玩玩游戏，不沉迷，对cos周边等没什么兴趣。\n会做一些简单的饭菜，什么都能吃无忌口\n\n性格：\n性格偏稳，不内向，有分享欲，会报备，能接话题，拒绝冷战。\n相处时会多会考虑对方感受，不限制另一半社交爱好\n会听取另一半想法，并且努力改正不足之处\n\n理想型：\n希望妳与我年龄相仿，情绪稳定，三观正常，外表双方合眼缘。\n有矛盾能及时沟通，有一定分享欲，拒绝冷暴力。\n有自己的工作，有对事物的独立的见解和底线，不丁克。\n社交圈子不复杂，有一颗走入婚姻殿堂的心。\n\n- （',
+      bmi: 20.5,
+      hometown: '辽宁大连',
+      currentLocation: '东京',
+      occupation: '码农',
+      interests: const <String>['动漫', '旅游', '游戏', '溜达'],
+      interestIds: const <int>[23, 3, 21, 300],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_100_59', 'profile_men_100_35', 'profile_men_200_179', 'profile_men_500_416', 'profile_men_500_461', 'profile_men_600_552', 'profile_men_100_81', 'profile_men_200_172', 'profile_men_500_419', 'profile_men_600_579'],
+    ),
+    Character(
+      id: 'profile_men_600_532',
+      gender: 'male',
+      age: 28,
+      height: 171,
+      zodiac: '巨蟹座',
+      mbti: 'ESFP',
+      rawText: '编号532\n\n97年 巨蟹座\n171cm\n80kg（努力减肥中，已成功减重20斤，争取再减20斤）\nESFP（測两回都是这个，但我感觉不是很准）\n家乡：辽宁\n工作地：东京\n学历：UMN\n工作：IT（个人事业主）\n年收：500~600\n未来的计划：目前打算以后回国\n性格：内向外向各一半吧，应该是比较随和，包容性较强，和大多数人都能成为朋友，朋友也说过我比较成熟稳重\n兴趣：二次元相关（主要是看番，漫画，小说），游戏（玩的不多，目前只剩下手游的崩铁和zzz了，等待秋季发售的pokemon中），\n各种运动（因为减肥尝试过很多，爬山，徒步，轮滑，篮球，滑雪等等，可以说是会的比较多但都没有很精）\n比较愿意尝试新鲜事物，不吸烟，酒的话能喝，但不太爱喝，感情经历较少\n\n期待的另一半\n20-30，正常人，无不良嗜好（我与赌毒不共戴天）\n\n过日子是两个人一起过的，简介里能表现出来的东西不多，\n我们可以微信或者线下慢慢聊，看看眼缘，能成当然大家都幸福，\n不行做个朋友也没损失，轻松的来吧\nPS：希望这里的大家都能找到心仪的TA\n\n- （',
+      bmi: 27.4,
+      hometown: '辽宁',
+      currentLocation: '东京',
+      occupation: 'IT（个人事业主）',
+      interests: const <String>['动漫', '运动', '阅读', '徒步', '比较愿意尝试新鲜事物', '游戏', '滑雪', '漫画', '爬山', '篮球'],
+      interestIds: const <int>[23, 6, 25, 11, 301, 21, 14, 302, 20, 50],
+      similarIds: const <String>['profile_men_500_455', 'profile_men_200_146', 'profile_men_600_517', 'profile_men_600_522', 'profile_men_400_329', 'profile_men_600_539', 'profile_men_100_65', 'profile_men_600_580', 'profile_men_300_258', 'profile_men_600_544'],
+    ),
+    Character(
+      id: 'profile_men_600_530',
+      gender: 'male',
+      age: 28,
+      height: 178,
+      rawText: '编号530\n◆自我介绍\n◇年龄: 97\n◇籍贯: 辽宁\n◇現住所: 神奈川\n◇身高: 178\n◇体重: 73\n◇职业: IT会社社员\n◇婚歴: 未婚\n◇其他: 情绪稳定，爱干净，社交圈子小，平时生活比较简单，喜欢安静，有一只小猫。\n\n◆择偶条件\n◇年龄: 96～（非必要条件）\n◇身高体重正常即可\n◇其他: 有稳定工作，有长居日本打算。遇到问题能及时有效沟通，性格正常。有结婚生子计划。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/8c891457-45fb-4378-960f-60d09f3024c6',
+      bmi: 23.0,
+      hometown: '辽宁',
+      currentLocation: '神奈川',
+      occupation: 'IT会社社员',
+      interests: const <String>['有一只小猫'],
+      interestIds: const <int>[303],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_100_72', 'profile_men_100_84', 'profile_men_500_470', 'profile_men_600_539', 'profile_men_400_333', 'profile_men_100_81', 'profile_men_100_94', 'profile_men_300_247', 'profile_men_100_21', 'profile_men_100_7'],
+    ),
+    Character(
+      id: 'profile_men_600_529',
+      gender: 'male',
+      age: 32,
+      height: 178,
+      rawText: '编号529\n\n.性别：男\n.出生年份：19930919\n.籍贯：吉林\n.身高体重：178/138\n.学历：本科\n.居住地：品川\n.工作：IT\n.兴趣爱好（方便找共同点)：看海，偶尔远足爬山，逛街吃饭\n.择偶标准\n希望对方是93以后的，性格外向，最好也喜欢户外活动或者出去逛一逛\n\n- （',
+      bmi: 21.8,
+      hometown: '吉林',
+      currentLocation: '品川',
+      occupation: 'IT',
+      interests: const <String>['爬山', '看海', '逛街'],
+      interestIds: const <int>[20, 304, 9],
+      similarIds: const <String>['profile_men_400_330', 'profile_men_600_570', 'profile_men_600_561', 'profile_men_500_471', 'profile_men_400_375', 'profile_men_600_586', 'profile_men_100_81', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63'],
+    ),
+    Character(
+      id: 'profile_men_600_527',
+      gender: 'male',
+      age: 31,
+      height: 184,
+      zodiac: '水瓶',
+      rawText: '编号527\n94/苏州/水瓶\n184cm/62kg\n已归化日籍，将来无回国打算\n上場会社web designer，年收550左右\n\n爱好&日常：\nゲーム、vtuber、温泉♨️\n最近几年开始小额股票投资，cover株式会社上市后成为第一批股东。\n将来理想是去伊豆居住\n\n- （',
+      image: 'https://github.com/user-attachments/assets/d63d09aa-217f-4c6a-93b6-ec59ac0065df',
+      bmi: 18.3,
+      currentLocation: '苏州',
+      occupation: 'web designer',
+      interests: const <String>['vtuber', 'ゲーム', '温泉', '股票投资'],
+      interestIds: const <int>[305, 306, 59, 307],
+      similarIds: const <String>['profile_men_300_245', 'profile_men_600_574', 'profile_men_400_352', 'profile_men_700_618', 'profile_men_500_471', 'profile_men_600_546', 'profile_men_100_84', 'profile_men_500_456', 'profile_men_600_561', 'profile_men_600_508'],
+    ),
+    Character(
+      id: 'profile_men_600_523',
+      gender: 'male',
+      age: 43,
+      rawText: '编号523\n寻找共度余生的你 (82年真诚男士征婚)\n\n**关于我：82年出生，吉林/烟台/大连/苏州，国内生活过的城市，未来打算在日本长久生活，\n目前在一家贸易公司工作，底薪300万+，绩效另算，经济基础稳固，已购房，生活品质有保障。\n* 经历过一段婚姻，无孩，更加懂得珍惜和经营感情，渴望找到一个心灵契合的伴侣，携手共度余生。\n* 性格温和，成熟稳重，待人真诚，踏实可靠，热爱生活，喜欢尝试新鲜事物。\n* 热爱美食，擅长料理，闲暇时光喜欢研究菜谱，为心爱的人下厨是我表达爱意的方式。\n\n**希望你：年龄相仿，性格开朗，善良孝顺，有稳定的工作和收入。\n* 热爱生活，有共同的兴趣爱好，愿意一起分享生活中的喜怒哀乐。\n* 对待感情认真专一，愿意携手共建温馨幸福的家庭。\n\n**如果你觉得我们合适，请联系我，期待与你相遇！\n\n* 以上信息真实有效，非诚勿扰。\n* 期待与你一起品尝生活的酸甜苦辣，共同创造美好的未来！\n\n- （',
+      image: 'https://github.com/user-attachments/assets/bbff6b28-9f6b-41f0-b2d9-ee6236394c29',
+      currentLocation: '日本',
+      occupation: '贸易公司工作',
+      interests: const <String>['喜欢研究菜谱', '做饭', '美食'],
+      interestIds: const <int>[308, 29, 5],
+      hasHouse: true,
+      maritalStatus: '离异无孩',
+      similarIds: const <String>['profile_men_500_484', 'profile_women_400_364', 'profile_men_600_535', 'profile_men_400_346', 'profile_women_600_526', 'profile_women_400_318', 'profile_men_300_268', 'profile_men_600_569', 'profile_men_300_213', 'profile_women_600_537'],
+    ),
+    Character(
+      id: 'profile_men_600_522',
+      gender: 'male',
+      age: 31,
+      height: 173,
+      zodiac: '双鱼',
+      mbti: 'ESFP',
+      rawText: '编号522\n\n坐标东京\n94 男 性取向女 福建厦门人\n173cm/80kg（在减肥中，已减15kg，灵魂有趣的胖子）\n双鱼 esfp\n\n技人国签证，来日7年\n日语n1，年金税都有按时交\n计划长期留在日本\n\n户外党，几乎隔周末都出门玩\n有一辆白牌代步车\n喜欢自驾\n已经自驾走过了日本33个都道府县\n喜欢听jpop，前j家boy，前绿团饭（欅坂天下第一）\n前二刺螈，acgn曾经均沾（目前已退坑）\n喜欢去场k，华语歌跟日语歌都可行（jpop+anisong）\n\n家里有一只俄罗斯蓝猫\n直球型选手\n身体健康工作稳定\n年收500万日元+\n\n想找一个同样在东京，兴趣爱好相似的女孩子\n90后基本都可以\n性格好,易沟通的女生\n以结婚为目的\n\n- （',
+      bmi: 26.7,
+      hometown: '福建厦门',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['anisong', '宠物', '华语歌', '听Jpop', '唱K', '户外', '日语歌', '自驾'],
+      interestIds: const <int>[309, 26, 310, 311, 312, 1, 313, 15],
+      hasCar: true,
+      similarIds: const <String>['profile_men_300_201', 'profile_women_700_611', 'profile_men_500_455', 'profile_men_200_146', 'profile_men_300_257', 'profile_men_300_258', 'profile_men_700_633', 'profile_men_600_597', 'profile_men_500_441', 'profile_men_300_279'],
+    ),
+    Character(
+      id: 'profile_men_600_521',
+      gender: 'male',
+      age: 34,
+      height: 176,
+      rawText: '编号521\n.性别：男\n.出生年份：1991/10/19\n.籍贯：辽宁沈阳（定居山东威海）\n.身高体重：176/63\n.学历：硕士\n.居住地：千叶县船桥市\n.工作：研究所做技术预研\n.兴趣爱好（方便找共同点)：打魔兽世界，喜欢看一些投资相关的事\n.择偶标准 希望是个懂得换位思考的人，懂得将心比心，能容得下相手方缺点的人。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/e4483db5-e8c2-4b46-99eb-5187b17fcedb',
+      bmi: 20.3,
+      hometown: '辽宁沈阳',
+      currentLocation: '千叶县船桥市',
+      occupation: '研究所做技术预研',
+      interests: const <String>['喜欢看一些投资相关的事', '打魔兽世界'],
+      interestIds: const <int>[314, 315],
+      similarIds: const <String>['profile_men_100_83', 'profile_men_600_561', 'profile_men_400_317', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16'],
+    ),
+    Character(
+      id: 'profile_men_600_520',
+      gender: 'male',
+      age: 30,
+      height: 173,
+      zodiac: '水瓶',
+      rawText: '编号520\n\n现住：横滨\n来日：6年\n出生地：上海\n性别：男\n年龄： 1995\n身高体重：173/65\n学历：top3国公立\n职业：IT\n年收：580\n星座：水瓶\n爱好：滑雪，旅游\n其他：不抽烟，有时候小喝一点酒。\n原生家庭：家庭和睦 父母在国企 即将退休\n\n性格温和 善解人意\n刚认识的时候比较内敛 熟了之后是话痨\n\n希望的另一半：\n江浙沪人士\n有共同话题或者兴趣爱好\n工作稳定 性格温和 有自己的理想\n\n- （',
+      bmi: 21.7,
+      hometown: '上海',
+      currentLocation: '横滨',
+      occupation: 'IT',
+      interests: const <String>['旅游', '有时候小喝一点酒', '滑雪'],
+      interestIds: const <int>[3, 130, 14],
+      similarIds: const <String>['profile_men_300_297', 'profile_women_300_233', 'profile_men_100_21', 'profile_men_400_349', 'profile_men_300_247', 'profile_men_100_4', 'profile_men_100_84', 'profile_men_100_94', 'profile_men_600_519', 'profile_men_600_534'],
+    ),
+    Character(
+      id: 'profile_men_600_519',
+      gender: 'male',
+      age: 30,
+      height: 174,
+      rawText: '编号519\n个人信息\n性别：男\n出生年：95年\n身高：174\n体重：64左右\n学历：硕士\n工作：システムエンジニア\n收入：500左右\n出生地：吉林长春\n兴趣爱好：魔术，民族乐器，旅行\n家庭状况：父母在日本，独生子\n\n在欧洲念完书后发下不好混，由于父母在日本，就润到日本工作了。\n挺爱展现自己的。在这里给大家跳个街舞吧！\nጿ ኈ ቼ ዽ ጿ ኈ ቼ ዽ ጿ ኈ ቼ ዽ ጿ ኈ ቼ ዽ ጿ ኈ ቼ ዽ\n\n- （',
+      image: 'https://github.com/user-attachments/assets/24425648-aed2-47db-89c3-e407eda364f8',
+      bmi: 21.1,
+      hometown: '吉林长春',
+      currentLocation: '日本',
+      occupation: 'システムエンジニア',
+      interests: const <String>['旅游', '民族乐器', '魔术'],
+      interestIds: const <int>[3, 316, 317],
+      similarIds: const <String>['profile_men_300_267', 'profile_men_100_4', 'profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16'],
+    ),
+    Character(
+      id: 'profile_men_600_518',
+      gender: 'male',
+      age: 42,
+      height: 175,
+      rawText: '编号518\n\n个人信息：↓\n性别：男\n籍贯：山西\n年龄：83年9月\n身高：1米75\n体重：85公斤\n婚否：未婚\n职业：软件工程师\n收入：年收600万日元\n现居住地点：埼玉県川口市\n性格：看似外向粗放型，其实内心情感很丰富敏感\n兴趣爱好：踢足球，打网球，爬山旅游，体验人文地理，阅读，哲学社会科学，喜欢一个人思考。\n来日本第10年。\n******* ****** ****** *****\n理想中的女士：↓\n在日本工作或者留学的华人女子，身体健康，不抽烟，心地善良。\n年龄范围：83年以下\n身高：1米58以上\n长相：没有硬性要求\n职业：不限\n籍贯：不限\n婚否：未婚或者离异无孩\n收入：不限\n\n- （',
+      bmi: 27.8,
+      hometown: '山西',
+      currentLocation: '埼玉県川口市',
+      occupation: '软件工程师',
+      interests: const <String>['体验人文地理', '哲学社会科学', '喜欢一个人思考', '网球', '爬山', '旅游', '足球', '阅读'],
+      interestIds: const <int>[318, 319, 320, 112, 20, 3, 41, 25],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_300_298', 'profile_men_300_283', 'profile_men_600_503', 'profile_men_500_484', 'profile_men_300_222', 'profile_men_100_98', 'profile_women_600_526', 'profile_men_600_535', 'profile_men_200_181', 'profile_men_600_523'],
+    ),
+    Character(
+      id: 'profile_men_600_517',
+      gender: 'male',
+      age: 28,
+      height: 174,
+      mbti: 'ENFJ',
+      rawText: '编号517\n97年的，上海人，174/70，enfj，\n目前在制造业大手工作，性格阳光，脾气好，\n自认为比较浪漫有仪式感，爱做饭，爱猫，在东京两年半\n\n兴趣爱好的话偏户外，徒步，滑雪，潜水，\n网球什么的都挺喜欢的。室内也喜欢看展，\n喝茶，撸猫，刷剧。\n不抽烟，少喝酒，家里有一只布偶猫宝宝\n\n希望你，家庭和睦，本科及以上，\n有稳定工作，不抽烟，爱动物，爱旅游，\n希望能一起体验世上的一切美好\n\n- （',
+      image: 'https://github.com/user-attachments/assets/1b052ae5-ebe7-4842-9fd1-e20dcf74ba08',
+      bmi: 23.1,
+      hometown: '上海',
+      currentLocation: '东京',
+      occupation: '制造业',
+      interests: const <String>['做饭', '追剧', '喝茶', '徒步', '宠物', '滑雪', '潜水', '爱猫', '看展', '网球'],
+      interestIds: const <int>[29, 24, 32, 11, 26, 14, 36, 321, 22, 112],
+      similarIds: const <String>['profile_men_500_444', 'profile_men_100_81', 'profile_men_500_437', 'profile_men_100_7', 'profile_men_300_227', 'profile_men_300_278', 'profile_men_500_430', 'profile_men_200_179', 'profile_women_700_614', 'profile_men_600_555'],
+    ),
+    Character(
+      id: 'profile_men_600_514',
+      gender: 'male',
+      age: 34,
+      height: 173,
+      rawText: '编号514\n\n91年 今年34岁\n未婚 江苏连云港人\n来日本13年了 最终学学历是私立大学的修士\n现在工作了 IT行业 年收450（入行短还在努力涨）\n身高173 现在住在西川口 有了个小房子2ldk （不想交房租了）\n家庭情况 独生子 父母公务员退休\n爱好 喜欢做饭 其他的属于很喜欢参与\n爬山 旅行 都很喜欢享受过程 喜欢电影 和看书\n希望可以找到合适的人相互理解 相互迁就\n\n- （',
+      hometown: '江苏连云港',
+      currentLocation: '西川口',
+      occupation: 'IT行业',
+      interests: const <String>['做饭', '旅游', '爬山', '电影', '阅读'],
+      interestIds: const <int>[29, 3, 20, 4, 25],
+      hasHouse: true,
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_500_499', 'profile_men_300_274', 'profile_men_100_14', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16'],
+    ),
+    Character(
+      id: 'profile_men_600_513',
+      gender: 'male',
+      age: 31,
+      height: 168,
+      zodiac: '狮子座',
+      mbti: 'INTP',
+      rawText: '编号513\n基本情况：\n男 重庆人（汉族）\n1994年 168/52（瘦）狮子座 intp(ie大概六四比例）\n来日10年 准备拿永驻\n现居大阪\n国内高中毕业 日本 本科毕业\n目前游戏大厂工作5年+ 游戏美术（画师）big稳定 年收700+（每年都涨）\n不抽烟不喝酒 无不良嗜好\n父：国企退休 母：私企退休\n\n爱好：\n二次元相关（看番 打游戏 手办 周边收集）电影（各种类型） 音乐（主hiphop）\n产图（偶尔去コミケ出摊） 去外面找吃的（辣的） 抽象文化（不太好解释 懂的都懂）\n研究做川菜 想养宠物（奈何条件不允许）\n\n希望对方：\n年龄最好比我小 95~（都可以谈）\n有共同爱好或者共同话题（理想是可以一起 外出觅食 听歌 打游戏 开黑）\n不抽烟酗酒；无不良嗜好 三观正 情绪稳定 家庭和睦\n打算长期留在日本\n最好喜欢吃辣的\n\n- （',
+      image: 'https://github.com/user-attachments/assets/411c4057-8da8-458f-857a-5a42948fa598',
+      bmi: 18.4,
+      hometown: '重庆',
+      currentLocation: '大阪',
+      occupation: '游戏美术（画师）',
+      interests: const <String>['动漫', '电影', '音乐', '宠物', '乐高', '游戏'],
+      interestIds: const <int>[23, 4, 7, 26, 56, 21],
+      similarIds: const <String>['profile_women_600_594', 'profile_men_500_492', 'profile_men_200_173', 'profile_women_200_134', 'profile_women_200_151', 'profile_men_100_14', 'profile_men_300_216', 'profile_women_100_39', 'profile_men_600_578', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_men_600_511',
+      gender: 'male',
+      age: 33,
+      height: 175,
+      zodiac: '双鱼',
+      rawText: '编号511\n◆自我介绍\n◇生年月日 :1992\n◇星座: 双鱼\n◇籍贯: 湖北\n◇現住所:大阪\n◇身高: 175\n◇学历 : 本科\n◇职业: IT\n◇年收：700+\n◇婚歴 : 未婚\n◇趣味 : 户外活动\n◇其他: 性格开朗，懂得包容和理解\n\n◆择偶条件\n◇年龄：28～34\n◇身高：160+\n◇年收：400+\n◇其他：乐观开朗 有话直言\n懂得沟通 互相理解 对待生活有积极乐观的态度，有健康的兴趣爱好。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/b34c66b1-01bd-467b-b598-ad9284588e49',
+      hometown: '湖北',
+      currentLocation: '大阪',
+      occupation: 'IT',
+      interests: const <String>['户外'],
+      interestIds: const <int>[1],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_600_561', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_200_156'],
+    ),
+    Character(
+      id: 'profile_men_600_510',
+      gender: 'male',
+      age: 36,
+      height: 171,
+      rawText: '编号510\n性别：男\n出生年份：89年\n籍贯：福建福州\n身高-体重：171-52\n签证：永住\n学历：日本专科\n居住地：东京\n工作：工地监理（建筑）\n\n自我介绍：\n.兴趣爱好\n骑车 徒步 爬山 旅游 ……\n不抽烟，偶尔喝点酒。\n社交圈比较小，借此平台希望能找到另一半。\n\n.择偶标准\n身高≥160 未来打算在日本发展。\n希望你性格活泼，善良，不吸烟……\n\n- （',
+      image: 'https://github.com/user-attachments/assets/3bf6bfe8-27cc-4a28-85ee-a6f53aea74bf',
+      bmi: 17.8,
+      hometown: '福建福州',
+      currentLocation: '东京',
+      occupation: '工地监理（建筑）',
+      interests: const <String>['偶尔喝点酒', '徒步', '旅游', '爬山', '骑行'],
+      interestIds: const <int>[322, 11, 3, 20, 54],
+      similarIds: const <String>['profile_men_500_411', 'profile_women_200_136', 'profile_women_400_302', 'profile_men_400_361', 'profile_women_600_512', 'profile_women_400_336', 'profile_women_400_380', 'profile_men_500_428', 'profile_men_100_2', 'profile_men_500_423'],
+    ),
+    Character(
+      id: 'profile_men_600_509',
+      gender: 'male',
+      age: 30,
+      height: 168,
+      rawText: '编号509\n\n1.昵称: 潘\n2.性别：男\n3.出生年份：1995/09/21\n4.籍贯：浙江\n5.身高体重：168/60\n6.学历：大阪大学修士\n7.居住地：东京\n8.工作：金融\n9.兴趣爱好（方便找共同点)：\n- 电影，音乐。会一点乐器\n- 设计师品牌\n- 晒太阳\n- 注重健康生活，不抽烟不喝酒，会做饭，会去健身房\n10.择偶标准：\n- - 沉稳冷静\n- 注重健康\n\n- （',
+      bmi: 21.3,
+      hometown: '浙江',
+      currentLocation: '东京',
+      occupation: '金融',
+      interests: const <String>['会一点乐器', '做饭', '健身', '晒太阳', '注重健康生活', '电影', '设计师品牌', '音乐'],
+      interestIds: const <int>[323, 29, 10, 324, 325, 4, 326, 7],
+      similarIds: const <String>['profile_women_600_594', 'profile_women_700_614', 'profile_men_300_216', 'profile_women_500_480', 'profile_men_600_552', 'profile_men_700_634', 'profile_women_200_151', 'profile_men_400_338', 'profile_men_600_570', 'profile_men_300_249'],
+    ),
+    Character(
+      id: 'profile_men_600_508',
+      gender: 'male',
+      age: 29,
+      height: 185,
+      mbti: 'ESFJ',
+      rawText: '编号508\n.性别：男\n.出生年份：1996\n.籍贯：辽宁大连\n.身高体重：185/75\n.学历：修士\n.居住地：埼玉\n.工作：IT infra\n.兴趣爱好：养猫\n.ESFJ\n.择偶标准\n\n1️⃣乐观开朗，希望可以互相提供情绪价值。\n2️⃣父母退休后有保障\n3️⃣相同价值观\n4️⃣想找离家近的(辽宁)，这样回国比较方便些\n5️⃣不能对猫毛过敏\n\n外貌身高普通就好。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/16219c49-942e-4ea3-a3f3-974f23f34243',
+      bmi: 21.9,
+      hometown: '辽宁大连',
+      currentLocation: '埼玉',
+      occupation: 'IT infra',
+      interests: const <String>['宠物'],
+      interestIds: const <int>[26],
+      similarIds: const <String>['profile_men_600_573', 'profile_men_400_352', 'profile_men_600_546', 'profile_men_400_333', 'profile_men_100_84', 'profile_women_500_499', 'profile_men_100_34', 'profile_men_400_381', 'profile_men_500_471', 'profile_men_300_215'],
+    ),
+    Character(
+      id: 'profile_men_600_503',
+      gender: 'male',
+      age: 39,
+      height: 174,
+      rawText: '编号503\n性别：男\n出生年:1986\n现住：千叶船桥\n身高：174\n体重：78\n学历：大学\n签证：人文\n职业：正社员\n年收 ：700\n\n已经买房\n有需要的话车随时可买\n\n休日喜欢户外活动\n（爬山、下海、徒步）。\n\n千叶附近的或者是山东老乡请联系我\n不试试怎么知道合不合适\nよろしくお願いします🙇‍♂️\n\n- （',
+      image: 'https://github.com/user-attachments/assets/a2112737-6882-4515-826a-568cadf560f3',
+      bmi: 25.8,
+      hometown: '山东',
+      currentLocation: '千叶船桥',
+      occupation: '正社员',
+      interests: const <String>['下海', '徒步', '户外', '爬山'],
+      interestIds: const <int>[327, 11, 1, 20],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_200_143', 'profile_women_600_526', 'profile_men_700_636', 'profile_men_500_413', 'profile_men_300_275', 'profile_men_300_283', 'profile_men_200_109', 'profile_men_500_447', 'profile_men_600_535', 'profile_men_300_271'],
+    ),
+    Character(
+      id: 'profile_men_600_501',
+      gender: 'male',
+      age: 33,
+      height: 178,
+      rawText: '编号501\n\n.性别：男\n.出生年份：1992\n.籍贯：浙江\n.身高体重：178CM/77KG\n.学历：大专\n.居住地：东京都\n.工作：东京大手企业（年收1000万日币）\n.兴趣爱好（方便找共同点)：以前喜欢打游戏，现在也没有啥特别喜欢的。希望你能带我培养。\n.择偶标准：92年以后，最好会做饭。最好独生女 剩下的看感觉\n\n[上一页](https://github.com/141801/info/blob/main/men_500.md)\n[下一页](https://github.com/141801/info/blob/main/men_700.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      bmi: 24.3,
+      hometown: '浙江',
+      currentLocation: '东京都',
+      occupation: '东京大手企业',
+      interests: const <String>['游戏'],
+      interestIds: const <int>[21],
+      similarIds: const <String>['profile_men_200_182', 'profile_men_100_69', 'profile_men_700_633', 'profile_men_600_570', 'profile_men_700_632', 'profile_men_500_460', 'profile_men_500_471', 'profile_men_500_461', 'profile_men_600_552', 'profile_men_100_35'],
+    ),
+    Character(
+      id: 'profile_men_700_636',
+      gender: 'male',
+      age: 39,
+      height: 178,
+      rawText: '编号636\n性别：男\n出生：86年\n身高：178cm\n体重：70kg\n地区：福井市\n家乡：河南洛阳\n职业：眼镜行业数控技术\n爱好：爬山，跑步，麦霸\n\n自我介绍：不抽烟，小酌，喜欢休息日开车自驾游，\n来日本是为了享受生活，健康平和的过日子，\n为自己人生的下半场负责。\n\n择偶要求\n希望遇到一个性格开朗，情绪稳定，\n愿意长期留日，互相尊重，彼此欣赏的正常人。\n\n生活需要意义，\n一起谱写属于我们自己独一无二的乐章，\n慢慢的感受生命的美好',
+      image: 'https://github.com/user-attachments/assets/a860376f-1b2e-4fac-b571-433eaa34ef79',
+      bmi: 22.1,
+      hometown: '河南洛阳',
+      currentLocation: '福井市',
+      occupation: '眼镜行业数控技术',
+      interests: const <String>['爬山', '自驾', '跑步', '唱歌'],
+      interestIds: const <int>[20, 15, 53, 8],
+      similarIds: const <String>['profile_men_200_109', 'profile_men_400_342', 'profile_men_400_340', 'profile_men_500_447', 'profile_men_600_535', 'profile_men_500_446', 'profile_men_100_2', 'profile_women_600_526', 'profile_men_500_413', 'profile_men_400_362'],
+    ),
+    Character(
+      id: 'profile_men_700_635',
+      gender: 'male',
+      age: 31,
+      height: 165,
+      rawText: '编号635\n\n30岁\n广东人\n横滨\n制造业\n165\n年收500\n来日本8年，大学院毕业后现在工作\n打算在日本长期发展和拿永驻\n有买房的打算\n不抽烟不喝酒\ni人，兴趣爱好是：股票，日剧，Jpop，\n卡拉OK，看live，爬山，海边散步，旅游\n\n希望你：年龄+3/-5，在关东圈，身体健康，\n有工作能生活独立，有普世价值观，最好不吃辣',
+      hometown: '广东',
+      currentLocation: '横滨',
+      occupation: '制造业',
+      interests: const <String>['Jpop', '唱歌', '旅游', '追剧', '散步', '爬山', '看live', '股票'],
+      interestIds: const <int>[328, 8, 3, 24, 47, 20, 329, 330],
+      similarIds: const <String>['profile_men_600_578', 'profile_men_100_85', 'profile_women_200_191', 'profile_men_100_4', 'profile_men_600_563', 'profile_men_200_115', 'profile_men_100_49', 'profile_men_700_607', 'profile_men_100_95', 'profile_men_100_91'],
+    ),
+    Character(
+      id: 'profile_men_700_634',
+      gender: 'male',
+      age: 32,
+      height: 168,
+      rawText: '编号634\n\n1.昵称 18画生\n2.性别：男\n3.出生年份：1993\n4.籍贯：山东\n5.身高体重：168/66\n6.学历：国内大专\n7.居住地：东京\n8.工作：互联网大厂系统工程师\n9.兴趣爱好（方便找共同点)：电影、音乐\n10.择偶标准：身体健康/爱干净/年纪比我小或同岁/北京以南的省份都可',
+      bmi: 23.4,
+      hometown: '山东',
+      currentLocation: '东京',
+      occupation: '互联网大厂系统工程师',
+      interests: const <String>['电影', '音乐'],
+      interestIds: const <int>[4, 7],
+      similarIds: const <String>['profile_men_600_570', 'profile_men_500_460', 'profile_men_600_509', 'profile_women_200_151', 'profile_women_500_485', 'profile_men_500_461', 'profile_women_600_594', 'profile_men_200_161', 'profile_men_100_95', 'profile_men_100_91'],
+    ),
+    Character(
+      id: 'profile_men_700_633',
+      gender: 'male',
+      age: 31,
+      height: 174,
+      rawText: '编号633\n出生年份： 1994年\n身高： 174cm\n体重：69kg\n家乡：哈尔滨 、现住东京近郊\n家庭：独生子\n职业：旅游业\n爱好： 主机游戏 户外 小说 惊悚刺激主题\n性格： 7静3动 情绪稳定 性格温柔\n收入：400+\n自己紹介： 永驻 有房/有车/有存款\n\n⭐️来日十几年一直居住在关东地区，\n有过几段感情经历 现在空窗三年+，\n性格温柔不强势相对理性 不是活泼\n好动类型，相对宅一些 但也喜欢户外\n惊悚刺激的主题内容。\n不抽烟 -偶尔喝酒以情绪为主。\n爱干净整洁有一点儿小洁癖。\n\n另一半：\n⭐️偏喜欢可爱活泼类型or同类型都喜欢，\n性格好三观正、爱干净整洁、不胖甜美类型\n乐观积极向上、能一起培养共同的兴趣\n爱好、和小目标。\n能以恋爱到结婚为前提是最好的，后续以\n在日本生活发展为主。\n年龄比我小、不太能接受抽烟，如果有看\n到感兴趣的可以认识一下🤝',
+      image: 'https://github.com/user-attachments/assets/2ad6cbc7-776b-4385-b74a-5135bc4becf3',
+      bmi: 22.8,
+      hometown: '哈尔滨',
+      currentLocation: '东京近郊',
+      occupation: '旅游业',
+      interests: const <String>['游戏', '阅读', '惊悚刺激主题', '户外'],
+      interestIds: const <int>[21, 25, 331, 1],
+      hasHouse: true,
+      hasCar: true,
+      similarIds: const <String>['profile_men_600_570', 'profile_men_400_381', 'profile_men_300_201', 'profile_men_200_179', 'profile_men_300_227', 'profile_women_600_507', 'profile_men_100_81', 'profile_men_100_35', 'profile_men_400_375', 'profile_men_600_501'],
+    ),
+    Character(
+      id: 'profile_men_700_632',
+      gender: 'male',
+      age: 36,
+      height: 181,
+      rawText: '编号632\n.性别：男\n.出生年份：1989，离异无孩（有个上海前妻）\n.籍贯：河北 （户籍在北京）\n.身高体重：181/84\n.学历：G5硕 肯定不是牛津剑桥就对了\n.居住地：东京（2023年从上海到东京）\n签证：HSP 80分+，去年六月开始申请PR了，等待中\n现职业：IT 年收1000的样子，但是完全在宅，不过如果未来换大手工作的话，想要1200+.\n曾经工作经历：最拿的出手就是微软的前工程师\n.兴趣爱好：CITYWALK，游戏，去非发达国家旅游。\n.择偶标准： 未育，谈得来，互相看得顺眼，\n\n雷点：1. 离异\n2. 工作一直用英语日语很烂 JLPT N2正好90分通过\n3. 在家有些懒\n4. 有时候是长发会扎起来\n5. 我有一只布偶，对猫毛敏感的话 X',
+      image: 'https://github.com/user-attachments/assets/4872e90e-0e86-47cc-bc4e-1e67188ff74f',
+      bmi: 25.6,
+      hometown: '河北',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['散步', '旅游', '游戏'],
+      interestIds: const <int>[47, 3, 21],
+      maritalStatus: '离异无孩',
+      similarIds: const <String>['profile_men_400_348', 'profile_men_100_93', 'profile_men_600_501', 'profile_men_400_388', 'profile_men_400_310', 'profile_men_100_69', 'profile_men_200_165', 'profile_men_400_305', 'profile_men_300_220', 'profile_men_700_623'],
+    ),
+    Character(
+      id: 'profile_men_700_631',
+      gender: 'male',
+      age: 27,
+      height: 171,
+      zodiac: '天秤',
+      mbti: 'INFJ',
+      rawText: '编号631\n出生日期： 1998.10\n戸籍所在地： 江苏苏州\n现住所：横滨\n身高: 171cm\n体重: 61kg\n学历： 国内985本科，日本东大硕士\n职业: 大手電子メーカー的程序员\n年收： 500+\n性格： INFJ，熟人面前比较high\n兴趣爱好： 爱看历史类的podcast, youtube。乒乓围棋，动漫\n\n自己PR:\n性格温和，比较随和\n\n期望另一半：\n年龄±3\n无不良嗜好',
+      image: 'https://github.com/user-attachments/assets/94d11fbe-95cd-4fd6-b8ec-9ba2422bc9e9',
+      bmi: 20.9,
+      hometown: '江苏苏州',
+      currentLocation: '横滨',
+      occupation: '大手電子メーカー的程序员',
+      interests: const <String>['youtube。乒乓围棋', '动漫', '历史'],
+      interestIds: const <int>[332, 23, 118],
+      similarIds: const <String>['profile_men_300_292', 'profile_men_300_247', 'profile_women_200_171', 'profile_women_400_322', 'profile_men_100_85', 'profile_men_700_612', 'profile_men_600_520', 'profile_women_600_531', 'profile_men_400_349', 'profile_men_600_578'],
+    ),
+    Character(
+      id: 'profile_men_700_626',
+      gender: 'male',
+      age: 27,
+      height: 175,
+      zodiac: '天蝎',
+      rawText: '编号626\n身高：175\n体重：66kg\n年龄：98年\n星座：天蝎\n现居地：东京都内\n学历：难关国公立修士\n\n爱好：健身，羽毛球，做饭，游戏，动漫\n\n📍关于我\n我一直坚持健身，目前体脂率个位数，健康、阳光、自律是我生活的一部分。\n但比起外表，我更看重内心的交流。\n我憧憬的是一段真正触及灵魂的恋爱——能在昏黄的灯光下彻夜长谈，\n从童年的糗事聊到长大后的委屈与失落，不止是喜欢，更希望有双方的理解与接纳。\n\n🎯关于我理想中的你\n我喜欢年纪比我小一点的可爱风格的女生，\n如果你也喜欢动漫、喜欢或者想要运动，\n我们或许会有很多共同话题。',
+      image: 'https://github.com/user-attachments/assets/1c6eed70-916c-4d7b-b97d-893ecc3c69af',
+      bmi: 21.6,
+      currentLocation: '东京都内',
+      occupation: '',
+      interests: const <String>['做饭', '健身', '动漫', '游戏', '羽毛球'],
+      interestIds: const <int>[29, 10, 23, 21, 40],
+      similarIds: const <String>['profile_men_100_45', 'profile_men_100_7', 'profile_men_400_337', 'profile_men_200_122', 'profile_men_500_444', 'profile_men_100_81', 'profile_women_500_448', 'profile_men_100_59', 'profile_men_100_35', 'profile_men_500_437'],
+    ),
+    Character(
+      id: 'profile_men_700_625',
+      gender: 'male',
+      age: 25,
+      height: 180,
+      rawText: '编号625\n\n个人信息\n出生年月： 2000年\n出生地：河北\n身高：180cm\n体重：75kg\n职业：工程师\n年收：税后500+\n现居住地：神奈川\n兴趣爱好：跑步 羽毛球 徒步 爬山 健身\n泡温泉\n其他：不抽烟 无纹身 平时有运动 一分60个俯卧撑 有时候工作比较忙 但是看见消息都会回复的\n\n期待另一半： 95-02年 喜欢个子矮矮的女生\n喜欢长发女生 有共同兴趣爱好 不抽烟 无纹身\n喜欢性格直爽的 不斤斤计较 有问题直接提出来 不让对方猜\n年收无所谓 两个人在一起把日子过好比什么都强',
+      bmi: 23.1,
+      hometown: '河北',
+      currentLocation: '神奈川',
+      occupation: '工程师',
+      interests: const <String>['健身', '徒步', '温泉', '爬山', '羽毛球', '跑步'],
+      interestIds: const <int>[10, 11, 59, 20, 40, 53],
+      similarIds: const <String>['profile_men_300_230', 'profile_men_500_470', 'profile_women_200_171', 'profile_men_100_12', 'profile_men_500_469', 'profile_men_400_304', 'profile_men_200_122', 'profile_men_400_344', 'profile_men_600_530', 'profile_men_600_544'],
+    ),
+    Character(
+      id: 'profile_men_700_624',
+      gender: 'male',
+      age: 37,
+      height: 172,
+      mbti: 'ISFJ',
+      rawText: '编号624\n年龄：36岁，单身 没结过婚 没孩子\n身高：172\n体重：65\n出身地：辽宁 沈阳\n现住地：栃木\n有固定工作~没不良嗜好，不抽烟 不喝酒\n工作：自动驾驶关联系统工程师\n年收：850 无副业\n爱好：滑雪，冲浪\n人格：ISFJ\n来日15年，永驻\n性格：踏实稳重 诚实 比较安于现状 乐观知足',
+      image: 'https://github.com/user-attachments/assets/5b90ee36-fa91-4089-bfac-8b8f7cb7bbda',
+      bmi: 22.0,
+      hometown: '辽宁沈阳',
+      currentLocation: '栃木',
+      occupation: '自动驾驶关联系统工程师',
+      interests: const <String>['冲浪', '滑雪'],
+      interestIds: const <int>[244, 14],
+      maritalStatus: '单身',
+      similarIds: const <String>['profile_men_100_2', 'profile_men_600_550', 'profile_men_500_420', 'profile_men_100_71', 'profile_men_400_399', 'profile_men_500_489', 'profile_men_100_93', 'profile_men_200_109', 'profile_women_600_526', 'profile_men_300_288'],
+    ),
+    Character(
+      id: 'profile_men_700_623',
+      gender: 'male',
+      age: 36,
+      height: 175,
+      rawText: '编号623\n\n1.昵称：胡\n2.性别：男\n3.出生年份：1989\n4.籍贯：辽宁大连\n5.身高体重：175 74kg\n6.学历：本科\n7.居住地：东京\n8.工作：IT行业\n9.兴趣爱好（方便找共同点)：篮球 游泳 羽毛球 吃\n10.择偶标准：身高160以上',
+      bmi: 24.2,
+      hometown: '辽宁大连',
+      currentLocation: '东京',
+      occupation: 'IT行业',
+      interests: const <String>['吃', '游泳', '篮球', '羽毛球'],
+      interestIds: const <int>[284, 19, 50, 40],
+      similarIds: const <String>['profile_men_100_2', 'profile_women_400_380', 'profile_men_200_165', 'profile_men_400_348', 'profile_men_400_358', 'profile_men_100_33', 'profile_women_200_190', 'profile_women_400_315', 'profile_men_300_288', 'profile_men_400_310'],
+    ),
+    Character(
+      id: 'profile_men_700_622',
+      gender: 'male',
+      age: 27,
+      height: 178,
+      mbti: 'INFP',
+      rawText: '编号622\n\n98年 178cm 75kg INFP 超级自然卷\n岐阜出生 大连长大 现在実家在名古屋郊外 本科学历 年收500万\n现在在江东区丰州全日本第二的水产流通的会社工作 也住在东京的丰州\n喜欢车 现在自己有一台\n以结婚为目的的认真处对象\n\n希望你\n24-30岁 正常体型 （不极端的胖或瘦）\n我对颜值和工作收入没有要求\n有上进心并且愿意和我一起踏实的过日子\n会流利的日语（非限定条件,因为我中文日文双母语,有学日语的欲望,我可以教你）\n如果是从小在日本长大的或者是混血更好（非限定条件）\n必须条件：今后和我一起留在日本生活',
+      bmi: 23.7,
+      hometown: '大连',
+      currentLocation: '东京丰州',
+      occupation: '水产流通会社工作',
+      interests: const <String>['喜欢车'],
+      interestIds: const <int>[333],
+      hasCar: true,
+      similarIds: const <String>['profile_men_100_81', 'profile_men_100_7', 'profile_men_200_158', 'profile_men_500_437', 'profile_men_500_444', 'profile_men_400_327', 'profile_men_400_337', 'profile_men_100_90', 'profile_men_600_539', 'profile_men_300_278'],
+    ),
+    Character(
+      id: 'profile_men_700_620',
+      gender: 'male',
+      age: 28,
+      height: 183,
+      rawText: '编号620\n【个人信息】\n性别：男\n出生年：97年\n身高：183\n体重：70kg\n学历：大学本科\n工作：IT行业\n年收：400\n出生地：黑龙江\n现居住地：龟户\n兴趣爱好：看剧，跑步，游泳，游戏，网球或者散散步。\n签证：人文\n\n个人性格比较好说话，比较能包容别人，也希望对方是个能够包容别人的人。\n希望一段有互相支持，互相尊重的关系。\n平时的时候想有个人一起去美术馆，去看樱花，分享日常心得，\n每一刻的快乐和悲伤都有人感同身受。\n我觉得有时候和爱人在一起不只是合作共赢，\n也是可以作为一个“史官”去互相记录对方的人生，毕竟大概率能终生陪伴的人只能是伴侣。\n两个人如果能够去尽可能的理解和学习对方，即便磕磕绊绊，\n最后也会达成一种默契，这是一件很幸福的事。\n希望有个人能够携手一起看遍世界和人生。',
+      image: 'https://github.com/user-attachments/assets/e1cfac24-219e-4117-a228-9ad838076615',
+      bmi: 20.9,
+      hometown: '黑龙江',
+      currentLocation: '龟户',
+      occupation: 'IT行业',
+      interests: const <String>['游戏', '游泳', '追剧', '网球', '散步', '跑步'],
+      interestIds: const <int>[21, 19, 24, 112, 47, 53],
+      similarIds: const <String>['profile_men_100_81', 'profile_men_100_7', 'profile_men_100_45', 'profile_men_700_626', 'profile_men_100_90', 'profile_men_100_70', 'profile_men_100_31', 'profile_men_500_444', 'profile_men_600_517', 'profile_men_300_278'],
+    ),
+    Character(
+      id: 'profile_men_700_618',
+      gender: 'male',
+      age: 30,
+      height: 176,
+      rawText: '编号618\n\n年龄:1995\n籍贯:江苏\n身高体重:176/63\n居住地:三重\n工作:医生\n收入:1000w+\n兴趣爱好:躺平宅，睡大觉，二次元，钓钓鱼\n自我PR:典型宅男一枚，喜欢闷在家里。比较自由主义。\n本来来日本gap year学学动漫和日语的。\n后来想想来都来了还是拿个绿卡回去吧，现在就顺便在乡下找了个医生的工作。\n以后回国还是在日本均可。\n希望她: 柔弱性格好、可爱，顾家，年纪要比我小，身高无所谓但不能胖。无学历收入要求。\n希望以后能和她一起在下着小雨的阴天午后一起躲在被窝里打游戏追番。\nNG❌→要强、事业型、比我大（超过30岁）、丁克。',
+      bmi: 20.3,
+      hometown: '江苏',
+      currentLocation: '三重',
+      occupation: '医生',
+      interests: const <String>['动漫', '睡大觉', '躺平宅', '钓鱼'],
+      interestIds: const <int>[23, 334, 335, 184],
+      similarIds: const <String>['profile_men_100_4', 'profile_men_100_49', 'profile_men_500_432', 'profile_men_200_173', 'profile_men_600_561', 'profile_men_300_249', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129'],
+    ),
+    Character(
+      id: 'profile_men_700_612',
+      gender: 'male',
+      age: 28,
+      height: 174,
+      rawText: '编号612\n\n年龄:97\n身高:174cm\n学历:硕士\n职业:it\n语言:日语n1，英语日常会话程度。\n年收:500万+\n兴趣:骑车，看实况，旅行。\n做事有计划性。父母都是国企单位的，有退休金。\n工签，以后想继续留在日本。\n\n择偶标准:能沟通，能交流，尊彼此的兴趣爱好的女生',
+      currentLocation: '日本',
+      occupation: 'it',
+      interests: const <String>['旅游', '看实况', '骑行'],
+      interestIds: const <int>[3, 336, 54],
+      similarIds: const <String>['profile_men_600_519', 'profile_men_300_292', 'profile_men_600_544', 'profile_men_100_4', 'profile_women_200_171', 'profile_men_100_81', 'profile_men_100_49', 'profile_men_100_7', 'profile_men_600_546', 'profile_men_300_267'],
+    ),
+    Character(
+      id: 'profile_men_700_610',
+      gender: 'male',
+      age: 37,
+      height: 165,
+      zodiac: '水瓶',
+      mbti: 'ESFJ',
+      rawText: '编号610\n出生年份：1988\n籍贯：山东\n身高体重：165/75\n血型：AB\n星座：水瓶\n人格：ESFJ\n学历：本科\n居住地：东京\n工作：日本大手it咨询\n车房：暂无\n兴趣爱好：电影，理财，不动产\n自己PR: 不抽烟，不酗酒，无不良嗜好，生活简单，工作及情绪稳定，身体健康\n希望她: 生活简单，情绪稳定，善良勤俭，年龄最好在1990年以后。',
+      image: 'https://github.com/user-attachments/assets/8539d815-9749-4dd2-8354-065418abd2b4',
+      bmi: 27.5,
+      hometown: '山东',
+      currentLocation: '东京',
+      occupation: '日本大手it咨询',
+      interests: const <String>['不动产', '理财', '电影'],
+      interestIds: const <int>[337, 338, 4],
+      hasHouse: false,
+      hasCar: false,
+      similarIds: const <String>['profile_women_500_421', 'profile_women_700_611', 'profile_men_700_605', 'profile_men_400_307', 'profile_women_500_459', 'profile_men_100_2', 'profile_men_300_257', 'profile_men_500_479', 'profile_men_400_348', 'profile_men_300_283'],
+    ),
+    Character(
+      id: 'profile_men_700_607',
+      gender: 'male',
+      age: 33,
+      height: 165,
+      rawText: '编号607\n\n.出生年份：1992\n.籍贯：河南商丘\n.身高体重：165/55kg\n.学历：大学本科\n.居住地：横滨（已购房定居）已经拿了永驻；\n.工作：软件开发（年入750万）\n.兴趣爱好（方便找共同点)：比较宅、没啥特别的爱好、不抽烟不喝酒\n.择偶标准：年龄接受大3小5；无不良嗜好、有爱心、最好一两年可以结婚的、不丁克',
+      bmi: 20.2,
+      hometown: '河南商丘',
+      currentLocation: '横滨',
+      occupation: '软件开发',
+      interests: const <String>['比较宅', '没啥特别的爱好'],
+      interestIds: const <int>[339, 340],
+      hasHouse: true,
+      similarIds: const <String>['profile_women_100_29', 'profile_men_700_635', 'profile_women_400_326', 'profile_men_600_563', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73'],
+    ),
+    Character(
+      id: 'profile_men_700_605',
+      gender: 'male',
+      age: 36,
+      height: 170,
+      rawText: '编号605\n.性别：男\n.出生年份：89年\n.籍贯：安徽\n.身高体重：170/72\n.学历：大学\n.居住地：东京\n.工作：东京\n.兴趣爱好（方便找共同点)：比较宅\n.择偶标准 能过日子就行，没特殊要求 无婚史',
+      image: 'https://github.com/user-attachments/assets/1bf3808a-a978-4e36-b087-80f227684455',
+      bmi: 24.9,
+      hometown: '安徽',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['比较宅'],
+      interestIds: const <int>[339],
+      maritalStatus: '无婚史',
+      similarIds: const <String>['profile_men_100_2', 'profile_men_300_257', 'profile_women_400_380', 'profile_women_500_459', 'profile_men_600_593', 'profile_men_200_182', 'profile_women_700_611', 'profile_men_700_623', 'profile_men_400_348', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_men_700_604',
+      gender: 'male',
+      age: 31,
+      height: 174,
+      zodiac: '射手座',
+      rawText: '编号604\n\n性别：男\n出生：94年\n星座：射手座\n身高：174cm\n体重：72kg\n学历：京大硕士\n工作：日企嵌入式工程师\n出生地：河北石家庄\n现居住：京都（打算近期搬到大阪）\n兴趣爱好：旅行，烹饪料理，miku\n对女方的期望：年龄+-3，古灵精怪调皮一些，或者温柔一些。',
+      bmi: 23.8,
+      hometown: '河北石家庄',
+      currentLocation: '京都（打算近期搬到大阪）',
+      occupation: '日企嵌入式工程师',
+      interests: const <String>['miku', '旅游', '做饭'],
+      interestIds: const <int>[341, 3, 29],
+      similarIds: const <String>['profile_men_100_4', 'profile_men_600_561', 'profile_men_200_110', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16'],
+    ),
+    Character(
+      id: 'profile_men_700_603',
+      gender: 'male',
+      age: 33,
+      height: 168,
+      zodiac: '金牛',
+      rawText: '编号603\n■个人情况：\n168,60kg，92，金牛，浙江人，本科，独生子。\n来日本8年了，永驻。现住荒川区。\n工作IT 年收700～800左右。\n东京已买房，父母有退休金，和睦的小康家庭。\n性格随和，情绪稳定，可动可静，有耐心，有同理心，有点讨好型人格。家里不乱，不抽烟，无不良嗜好，圈子干净。\n体力好，逛街一般女生先累。旅游徒步走多久都没问题。\n喜欢日漫(王道系 日常系)。对滑雪有点上瘾。喜欢滑板，冲浪，露营等户外活动。冬天会去雪场做滑雪教练。\n游戏最近玩得不多，但是也会玩。偏主机游戏多一点，怪猎玩得挺久。\n■希望：\n找一位在一起时不尴尬，有共同兴趣能玩在一起，能对我好的女生做伴侣。\n不太会找话题，但是有话题的时候还是非常能聊的。\n所以希望另一半可以话多点。\n然后希望身体健康，不要太胖。',
+      image: 'https://github.com/user-attachments/assets/e7ad7b8c-d235-4c19-9931-fd7351bc72ed',
+      bmi: 21.3,
+      hometown: '浙江',
+      currentLocation: '荒川区',
+      occupation: 'IT',
+      interests: const <String>['游戏', '冲浪', '怪猎', '户外', '日常系', '日漫(王道系', '滑板', '滑雪'],
+      interestIds: const <int>[21, 244, 342, 1, 343, 344, 13, 14],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_600_570', 'profile_women_500_459', 'profile_men_600_552', 'profile_men_500_423', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73'],
+    ),
+    Character(
+      id: 'profile_men_700_601',
+      gender: 'male',
+      age: 34,
+      height: 176,
+      zodiac: '双鱼',
+      mbti: 'ENTP',
+      rawText: '编号601\n年龄（属相）：羊 91\n星座：双鱼\nMBTI: ENTP\n身高 ：176\n体重 ：85kg\n学历：国内本科\n登陆日本时间：2025.3.4 人文签1年\n职业 ：大手外企IT程序员、剧本杀作者、脱口秀演员\n年收：主业700+ 不加班\n籍贯： 四川绵阳\n工作城市（区域）：横滨 靠近东京\n居住地：川崎\n婚姻状况 ：未婚\n名下是否有房（区域）：成都\n是否烟酒：不抽烟 非必要不喝酒\n兴趣爱好：电影 话剧 脱口秀 剧本杀 骑行 旅行 浅度二次元\n自我介绍：目前日语零基础 独自搞定赴日适宜 一个月极速登陆日本\n有趣的斜杠青年 原生家庭和谐 家风正 三观正\n双商在线 自我认知清晰 喜欢尝试新鲜的事物 高能量体\n择偶要求：善良有趣 高能量 26-30岁 160以上\n原生家庭和谐 非销售行业 外表时尚 内心保守\n带的出去带的回来 可留日也可回国\n\n[上一页](https://github.com/141801/info/blob/main/men_600.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      image: 'https://github.com/user-attachments/assets/cd92f076-0e53-4027-aaf1-9e3b3a358ea9',
+      bmi: 27.4,
+      hometown: '四川绵阳',
+      currentLocation: '川崎',
+      occupation: '大手外企IT程序员、剧本杀作者、脱口秀演员',
+      interests: const <String>['桌游', '旅游', '动漫', '电影', '脱口秀', '话剧', '骑行'],
+      interestIds: const <int>[39, 3, 23, 4, 278, 345, 54],
+      hasHouse: true,
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_300_220', 'profile_men_300_279', 'profile_men_400_395', 'profile_men_200_161', 'profile_men_600_543', 'profile_men_300_241', 'profile_women_700_611', 'profile_men_200_138', 'profile_men_200_128', 'profile_men_300_201'],
+    ),
+    Character(
+      id: 'profile_women_100_96',
+      gender: 'male',
+      age: 28,
+      mbti: 'ISFP',
+      rawText: '编号96\n\n女生 浙江人，97年isfp\n从事医疗工作，喜欢小动物\n（有空喜欢去猫咖之类的），\n以后会有养宠物的打算\n兴趣爱好：唱歌，探店，\n吃美食，睡觉，发现新的兴趣😌\n择偶标准\n希望对方情绪稳定，积极沟通，\n最好是e人能带我出门带我飞，\ni人的话相互扶持着出门₍˄·͈༝·͈˄*₎◞ ̑̑，\n从相互了解开始',
+      hometown: '浙江',
+      currentLocation: '',
+      occupation: '医疗工作',
+      interests: const <String>['宠物', '发现新的兴趣', '美食', '唱歌', '睡觉'],
+      interestIds: const <int>[26, 346, 5, 8, 347],
+      similarIds: const <String>['profile_men_600_546', 'profile_men_300_235', 'profile_men_100_4', 'profile_men_300_292', 'profile_men_100_85', 'profile_women_200_171', 'profile_men_600_544', 'profile_men_600_519', 'profile_men_500_437', 'profile_men_100_81'],
+    ),
+    Character(
+      id: 'profile_women_100_88',
+      gender: 'male',
+      age: 32,
+      height: 160,
+      rawText: '编号88\n女 93年\n身高160 体重106上下\n现居埼玉靠东京 、祖籍福建\n社畜一枚\ni人比较社恐（陌生人跟熟人面前两种人）\n个人感觉相对随和\n相对慢热且被动\n喜欢登山、旅游、探店、美食！\n\n希望对方：\n身高172以上、体重没有概念不要太胖看着OK就行\n有稳定工作、有耐心\n性格好、情绪稳定！真诚！（兴趣爱好有一致的加分）\n年龄：40为止',
+      image: 'https://github.com/user-attachments/assets/d5bcdc14-157e-4fb7-8fb3-2b4e56a26dda',
+      bmi: 18.7,
+      hometown: '福建',
+      currentLocation: '埼玉靠东京',
+      occupation: '社畜',
+      interests: const <String>['美食', '旅游', '爬山'],
+      interestIds: const <int>[5, 3, 20],
+      similarIds: const <String>['profile_women_600_512', 'profile_women_300_280', 'profile_women_600_538', 'profile_women_200_159', 'profile_women_700_628', 'profile_women_200_120', 'profile_women_400_383', 'profile_women_600_504', 'profile_women_300_260', 'profile_women_300_240'],
+    ),
+    Character(
+      id: 'profile_women_100_86',
+      gender: 'male',
+      age: 37,
+      height: 166,
+      rawText: '编号86\n基础信息\n女 黑龙江人（日籍）\n1988年 166/45\n小时候来日，高中大学都在日本\n工作方面：贸易・跨境电商各做过几年，\n现在享受生活做一些事務事宜\n父母均在日本，性格温和，\n不会干涉子女，家庭合睦\n不抽烟，长得偏年轻\n（周围的朋友都说不像35 苦笑）\n性格比较温和\n爱好：旅游，探店，一切新事物，\n逛美术馆，展览，演唱会，奶茶等\n\n希望男生：\n年龄±5 都可（最好是性格温和成熟）\n不抽烟，少量喝酒\n和父母关系好\n可以一起努力，开心过日子的人',
+      image: 'https://github.com/user-attachments/assets/c9d6fde0-ac1d-4446-b95f-b6b619c3a5a3',
+      bmi: 16.3,
+      hometown: '黑龙江',
+      currentLocation: '日本',
+      occupation: '贸易・跨境电商，事務',
+      interests: const <String>['一切新事物', '奶茶', '看展', '美食', '旅游', '音乐'],
+      interestIds: const <int>[348, 349, 22, 5, 3, 7],
+      similarIds: const <String>['profile_women_600_556', 'profile_men_500_420', 'profile_men_400_332', 'profile_men_600_510', 'profile_women_400_302', 'profile_women_200_108', 'profile_women_500_452', 'profile_women_200_136', 'profile_men_500_411', 'profile_women_600_537'],
+    ),
+    Character(
+      id: 'profile_women_100_77',
+      gender: 'male',
+      age: 30,
+      height: 151,
+      rawText: '编号77\n\n基础信息\n女 山东人（汉族）\n1995年 151/42\n国内211 985 毕业来日本读研（旧帝大）\n现在四大做咨询 在东京工作\n\n爱好：普拉提 电影 看展 看舞台剧，\n听音乐会 岩盘浴 温泉\n\n希望男生：\n年龄±3（心理年龄希望较成熟）\n不抽烟；\n和父母关系和睦\n积极向上 有责任心 谦虚\n性格开朗直爽 是有梗\n能活跃气氛的小太阳性格',
+      bmi: 18.4,
+      hometown: '山东',
+      currentLocation: '东京',
+      occupation: '四大做咨询',
+      interests: const <String>['音乐', '温泉', '瑜伽', '电影', '看展', '看舞台剧'],
+      interestIds: const <int>[7, 59, 350, 4, 22, 351],
+      similarIds: const <String>['profile_women_100_42', 'profile_women_700_619', 'profile_women_300_260', 'profile_women_400_383', 'profile_women_400_321', 'profile_women_200_186', 'profile_women_200_159', 'profile_women_200_134', 'profile_women_100_39', 'profile_women_500_480'],
+    ),
+    Character(
+      id: 'profile_women_100_76',
+      gender: 'male',
+      age: 34,
+      height: 155,
+      rawText: '编号76\n基础信息\n女 云南人（汉族）\n1991年 155/53（微胖）\n国内211毕业来日本读研（横滨国立大学）\n现在动漫玩具相关行业工作\n已获得永驻\n父母均国企退休 有养老金\n家庭和睦，从小就喜欢旅游\n\n爱好：逛美术馆，看各种感兴趣的展览；\n看动漫，看电影，看演唱会，看舞台剧，\n听音乐会；穿lo裙，穿汉服，吃美食；\n研究做饭；打推理剧本杀（仅限推理）\n\n希望男生：\n年龄±3（主要是心理年龄希望比较成熟）\n不抽烟；\n想要孩子，愿意买房（一起还贷）\n不热爱滑雪（因为我实在是不喜欢没办法一起玩），其他户外🉑️\n和父母关系好（可以单亲，但是希望和家里人关系好）；\n不沉迷刷短视频；\n对自己的人生有规划不是得过且过。\n希望能找到一个有共同爱好的人一起去看有趣的世界。',
+      image: 'https://github.com/141801/info/assets/42635299/6770bddd-1639-4f36-b07b-16b05a5f5d32',
+      bmi: 22.1,
+      hometown: '云南',
+      currentLocation: '',
+      occupation: '动漫玩具相关行业',
+      interests: const <String>['美食', '音乐', '桌游', '动漫', '看展', '电影', '看舞台剧', '做饭', '穿lo裙', '穿汉服'],
+      interestIds: const <int>[5, 7, 39, 23, 22, 4, 351, 29, 352, 353],
+      similarIds: const <String>['profile_women_500_475', 'profile_women_200_191', 'profile_women_600_587', 'profile_women_100_53', 'profile_women_200_154', 'profile_women_400_326', 'profile_women_400_353', 'profile_women_400_398', 'profile_men_400_339', 'profile_women_600_502'],
+    ),
+    Character(
+      id: 'profile_women_100_73',
+      gender: 'male',
+      age: 0,
+      rawText: '编号73 - (',
+      image: 'https://github.com/141801/info/assets/42635299/dd95eacd-b827-43bf-b6eb-0d77343422c3',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_100_4', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_women_100_66',
+      gender: 'male',
+      age: 34,
+      height: 156,
+      zodiac: '水瓶',
+      rawText: '编号66\n\n星冉，女\n出生日期：1991年1月23日\n籍贯：湖南邵阳\n现居地：神奈川横滨市\n星座：水瓶\n职业：护士\n体型：普通(156/48)\n兴趣爱好：喜欢旅游大自然，\n温泉，美食，瑜伽等\n简介：\n出生在伟人故乡，\n一个无辣不欢的辣妹子，不辣的也喜欢哦！\n日料西餐各国料理都喜欢。\n来日本九年了，现在一家养老机构做护士。\n每天和老人打交道，有爱心有耐心。\n真诚寻找可以牵手一生的灵魂伴侣。\n对另一半的要求：希望对方是一个积极向上,\n性格好, 情绪稳定，成熟稳重，\n孝顺,爱干净,健康不吸烟的阳光男孩。\n\n- （',
+      bmi: 19.7,
+      hometown: '湖南邵阳',
+      currentLocation: '神奈川横滨市',
+      occupation: '护士',
+      interests: const <String>['旅游', '户外', '温泉', '瑜伽', '美食'],
+      interestIds: const <int>[3, 1, 59, 350, 5],
+      similarIds: const <String>['profile_women_200_135', 'profile_women_200_154', 'profile_women_400_335', 'profile_women_500_475', 'profile_women_100_76', 'profile_women_600_556', 'profile_women_400_383', 'profile_women_400_351', 'profile_women_300_260', 'profile_men_600_563'],
+    ),
+    Character(
+      id: 'profile_women_100_53',
+      gender: 'male',
+      age: 34,
+      height: 153,
+      zodiac: '巨蟹',
+      mbti: 'INTJ',
+      rawText: '编号53\n\n上海人 家庭和睦\n女 性取向男\n1991年巨蟹座\n153 不胖 外表可以看我的xhs\n上智大学院\nIT行业 正社员 年收600+ 永驻\n单身未婚无孩\n不抽烟少酒（基本在家喝甜的酒😂儿童口味）\n\n·兴趣\n滑雪（人菜瘾大，还恐高恐速，大写的怂）\n拍照 （业余只图自己开心）\n整理房间\n做手工（羊毛氈 bjd 衣服 樹脂 熱縮片 玻璃 木工等等啥都沾點）\n逛美术馆博物馆（油畫&各種文物比較感興趣）\n玩游戏看动漫（老2次元了，在国内时候还出cos）\n看恐怖惊悚靈異片（真的挺解压的）\n养花（虽然养死了很多）\n\n·性格\nINTJ（想E也是可以E起来的，只是上班时候比较I）\n情绪稳定，算是好相处的性格，比较理性，\n有分歧也愿意主动和对方沟通\n有些恋爱脑哈哈哈哈',
+      hometown: '上海',
+      currentLocation: '',
+      occupation: 'IT行业',
+      interests: const <String>['做手工', '养花', '摄影', '整理房间', '滑雪', '游戏', '动漫', '看恐怖惊悚灵异片', '看展'],
+      interestIds: const <int>[354, 289, 2, 355, 14, 21, 23, 356, 22],
+      maritalStatus: '单身未婚无孩',
+      similarIds: const <String>['profile_women_500_475', 'profile_women_100_76', 'profile_women_200_154', 'profile_women_200_191', 'profile_women_300_260', 'profile_women_400_353', 'profile_men_500_457', 'profile_women_700_602', 'profile_women_600_502', 'profile_women_200_135'],
+    ),
+    Character(
+      id: 'profile_women_100_42',
+      gender: 'male',
+      age: 31,
+      height: 152,
+      zodiac: '巨蟹座',
+      rawText: '编号42\n\n94年，it，巨蟹座，152/43kg\n现居东京\n运动：游泳、羽毛球、乒乓球、健身、\n兴趣：看展（喜欢看有趣好看的），\n赏花，拍照，对有趣的都有兴趣，\n也想尝试你的兴趣爱好。\n饮食习惯：吃饭不挑食，好吃的食物都喜欢，\n偏爱肉类。只对芒果过敏所以不能吃，\n但是不会限制你也别吃芒果。\n体内的酶活性不足，不太能喝酒，\n但是不会限制你喝，只要不酗酒就行。\n其他：\n23年10月来的日本，圈子简单干净，\n没有复杂的关系让你尴尬。\n脾气好，慢热。两个人慢慢磨合中，\n有问题说问题，互相包容和理解，\n别玩冷战玩猜猜看。\n希望对方有责任心+专一，\n所以也会有责任心+专一。\n希望对方：\n年龄90后。身高170以上，\n体型不太能接受太胖或有个大肚子之类的，\n体重嘛健康就行。\n外貌普通以下就算了，看眼缘，清爽干净会加分。\n有稳定工作，有自己的兴趣爱好。\n平常会做饭就更好了，不会也没事。\n不接受抽烟的、离异的、小气抠门的、\n脾气不好的、还有宅男。\n一定要有责任心、真诚。\n\n- （',
+      bmi: 18.6,
+      currentLocation: '东京',
+      occupation: 'it',
+      interests: const <String>['乒乓球', '健身', '摄影', '游泳', '看展', '羽毛球', '赏花'],
+      interestIds: const <int>[64, 10, 2, 19, 22, 40, 357],
+      similarIds: const <String>['profile_women_100_77', 'profile_women_700_619', 'profile_women_400_321', 'profile_women_300_260', 'profile_women_400_377', 'profile_women_100_39', 'profile_women_200_159', 'profile_women_400_335', 'profile_women_500_438', 'profile_men_300_291'],
+    ),
+    Character(
+      id: 'profile_women_100_40',
+      gender: 'male',
+      age: 28,
+      height: 156,
+      zodiac: '射手座',
+      mbti: 'ENTP',
+      rawText: '编号40\n\n性别：女\n出生年：97年\n星座：射手座\n身高：156\n体重：43kg\n学历：国内本科\n工作：it\n出生地：湖北\n现居住地：神奈川\nmbti:entp(ie一半一半的感觉)\n兴趣爱好：有趣的事都有兴趣，\n最近喜欢爬山游泳。\n理想型：身高175以上，年龄30以内，\n体型偏瘦，北方人更好。\n\n- （',
+      bmi: 17.7,
+      hometown: '湖北',
+      currentLocation: '神奈川',
+      occupation: 'it',
+      interests: const <String>['爬山', '游泳', '有趣的事都有兴趣'],
+      interestIds: const <int>[20, 19, 358],
+      similarIds: const <String>['profile_women_500_450', 'profile_women_400_321', 'profile_women_400_322', 'profile_women_200_186', 'profile_women_100_42', 'profile_women_600_531', 'profile_women_100_77', 'profile_women_700_621', 'profile_women_100_88', 'profile_women_700_629'],
+    ),
+    Character(
+      id: 'profile_women_100_39',
+      gender: 'male',
+      age: 31,
+      height: 161,
+      rawText: '编号39\n\n1994年、性别女、上海人、身高161cm、体重48kg、\n大学（上海）和大学院（日本）都学的艺术、现东京工作。\n爱好比较偏男性化（键盘、高达、无论什么平台的游戏等）\n希望找一个江浙沪90～96年之间的、\n不抽烟不酗酒、三观正聊得来的、\n有稳定工作、身高175cm以上的男生。\n\n- （',
+      bmi: 18.5,
+      hometown: '上海',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['游戏', '键盘', '高达'],
+      interestIds: const <int>[21, 359, 360],
+      similarIds: const <String>['profile_men_300_291', 'profile_women_600_504', 'profile_women_200_134', 'profile_women_600_594', 'profile_men_600_552', 'profile_women_400_383', 'profile_women_200_159', 'profile_women_500_480', 'profile_women_600_542', 'profile_men_500_416'],
+    ),
+    Character(
+      id: 'profile_women_100_32',
+      gender: 'male',
+      age: 33,
+      height: 158,
+      rawText: '编号32\n\n92年女上海，身高158，微胖来日6年，\n现住千叶，2年内有回国打算 日企正社员，\n土日祝休，比较宅，休息日在家洗洗晒晒打扫卫生，\n看看综艺追追剧或者出门逛个街做做美甲头发，\n朋友很少几乎没有\n偶尔追个星，月光族，无存款择偶标准：\n88年～92年江浙沪男生\n爱干净，爱打扫卫生，不抽烟不喝酒，情绪稳定，\n身高178以上，身材正常，工作稳定，年收…还没想过，\n脾气好会照顾人，不打游戏\n\n- （',
+      hometown: '上海',
+      currentLocation: '千叶',
+      occupation: '日企正社员',
+      interests: const <String>['在家洗洗晒晒打扫卫生', '宅', '追剧', '追星', '逛街'],
+      interestIds: const <int>[361, 362, 24, 131, 9],
+      similarIds: const <String>['profile_women_700_630', 'profile_women_500_475', 'profile_women_400_326', 'profile_women_400_398', 'profile_men_100_83', 'profile_women_200_154', 'profile_women_200_191', 'profile_women_100_76', 'profile_women_500_459', 'profile_women_500_476'],
+    ),
+    Character(
+      id: 'profile_women_100_29',
+      gender: 'male',
+      age: 32,
+      height: 164,
+      rawText: '编号29\n\n女 ，93年山东人 身高164、55kg\n平常工作家两点一线的普通上班族生活\n爱好自驾游 最近刚学滑雪、\n想找个年上5岁之内的、不抽烟、\n无不良嗜好、人品端正的男朋友\n\n- （',
+      bmi: 20.4,
+      hometown: '山东',
+      currentLocation: '',
+      occupation: '上班族',
+      interests: const <String>['滑雪', '自驾'],
+      interestIds: const <int>[14, 15],
+      similarIds: const <String>['profile_women_300_233', 'profile_men_700_607', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409'],
+    ),
+    Character(
+      id: 'profile_women_100_16',
+      gender: 'male',
+      age: 0,
+      rawText: '编号16\n\n女 福建，来日本20多年，现在日籍，\n有个6岁女儿一起生活，\n2022之前一直在东京，目前在三重买房了，\n对对方也没有什么要求，\n就希望彼此能和的来，工作稳定\n\n[下一页](https://github.com/141801/info/blob/main/women_200.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      hometown: '福建',
+      currentLocation: '三重',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      hasHouse: true,
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_100_4', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_women_200_200',
+      gender: 'male',
+      age: 38,
+      height: 158,
+      zodiac: '射手',
+      rawText: '编号200\n◆自我介绍\n◇生年月日 :1987.12\n◇星座: 射手\n◇籍贯: 哈尔滨\n◇現住所:川崎\n◇身高: 158\n◇学历 : 本科\n◇职业: IT\n◇年收：700+\n◇婚歴 : 未婚\n◇趣味 : 户外活动，健身\n◇其他: 性格开朗，乐观善良\n\n◆择偶条件\n◇年龄：95～\n◇身高：172+\n◇年收：700+\n◇其他：真诚善良，有上进心，有责任感，无不良嗜好。\n会沟通、情绪稳定。对待生活有积极乐观的态度，有健康的兴趣爱好。\n期待和你一起创造美好的未来！',
+      image: 'https://github.com/141801/info/assets/42635299/1c972879-01b2-488a-b904-6165e6a74191',
+      hometown: '哈尔滨',
+      currentLocation: '川崎',
+      occupation: 'IT',
+      interests: const <String>['健身', '户外'],
+      interestIds: const <int>[10, 1],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_500_486', 'profile_women_600_502', 'profile_men_400_339', 'profile_women_700_627', 'profile_women_700_606', 'profile_women_400_325', 'profile_women_100_66', 'profile_women_500_459', 'profile_women_600_524', 'profile_women_600_556'],
+    ),
+    Character(
+      id: 'profile_women_200_196',
+      gender: 'male',
+      age: 29,
+      height: 162,
+      zodiac: '天蝎座',
+      mbti: 'ESTP',
+      rawText: '编号196\n• 性别：女\n• 职业：通信业界采购\n• 学历：硕士（日本名校私立大学本科➕硕士）\n• 年收：500w-700w\n•年齢：1996\n•星座 ：天蝎座 ESTP\n• 家乡： 重庆\n•家庭：双编制\n•现住：东京\n• 体型：偏瘦\n•身高：161.5cm\n• 爱好：羽毛球、健身、旅行、学习外语、美食探店，香港料理巡り\n• 性格特点：比较随和\n• 对伴侣的期望：\n性格温和不强势，身体健康无遗传疾病， 身高168cm以上，无不良嗜好，本科学历或以上\n有责任心上进心',
+      image: 'https://github.com/141801/info/assets/42635299/28d57316-5b8d-40d2-9bfe-46eccac87e56',
+      hometown: '重庆',
+      currentLocation: '东京',
+      occupation: '通信业界采购',
+      interests: const <String>['健身', '学习外语', '旅游', '美食', '羽毛球', '做饭'],
+      interestIds: const <int>[10, 363, 3, 5, 40, 29],
+      similarIds: const <String>['profile_women_500_480', 'profile_women_200_159', 'profile_women_400_363', 'profile_women_300_280', 'profile_women_700_628', 'profile_men_600_509', 'profile_women_300_296', 'profile_women_500_424', 'profile_men_300_294', 'profile_women_600_545'],
+    ),
+    Character(
+      id: 'profile_women_200_191',
+      gender: 'male',
+      age: 33,
+      height: 162,
+      rawText: '编号191\n基本情况：\n92年\n身高162，体型微胖（正在健身）\n厦门人，早大本科毕业\n游戏业界\n年收700+\n\n兴趣：\n二次元三次元都有涉猎，\n宅家看电影聊天，出门唱k散步爬山以及海内外旅行都可\n性格随和，共情力高\n用现在流行的表达估计是能提供稳定向上的情绪价值\n\n希望对方：\n无不良爱好（不吸烟不酗酒），认真对待感情\n成熟稳重，遇到问题一起沟通解决\n三观正常，能聊得来（欢迎加微信先语音聊聊）\n外貌干净清爽\n未婚\n身高170+\n年收相差不大或者往上',
+      image: 'https://github.com/141801/info/assets/42635299/06618f2e-1c31-4dd6-bd36-d3dcbe4234f7',
+      hometown: '厦门',
+      currentLocation: '',
+      occupation: '游戏业界',
+      interests: const <String>['动漫', '散步', '爬山', '旅游', '电影'],
+      interestIds: const <int>[23, 47, 20, 3, 4],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_500_475', 'profile_women_100_76', 'profile_women_200_154', 'profile_men_100_14', 'profile_women_300_296', 'profile_men_700_635', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129'],
+    ),
+    Character(
+      id: 'profile_women_200_190',
+      gender: 'male',
+      age: 37,
+      height: 170,
+      zodiac: '处女座',
+      mbti: 'ISFJ',
+      rawText: '编号190\n\n性别：女\n出生年份：1988\n星座：处女座 ISFJ\n籍贯：大连\n身高：170\n居住地：东京\n工作：IT\n收入：500+\n兴趣：羽毛球，爬山，徒步，露营🏕️，\n旅游，city walk，演唱会，各种活动等。\n其他介绍：比较慢热，情绪稳定，喜欢户外\n\n希望对方：\n年龄：85-95\n性格：情绪稳定，成熟，诚信，人品三观好。\n可以一起出去旅行，露营或者徒步都可以。\n身体健康，有自己的爱好，长期在日本发展。\n年收500+\n身高：178+',
+      hometown: '大连',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['city', '散步', '各种活动', '徒步', '旅游', '音乐', '爬山', '羽毛球', '户外'],
+      interestIds: const <int>[46, 47, 364, 11, 3, 7, 20, 40, 1],
+      similarIds: const <String>['profile_men_100_2', 'profile_women_400_315', 'profile_men_300_238', 'profile_women_400_380', 'profile_men_600_593', 'profile_men_400_313', 'profile_men_300_295', 'profile_men_400_358', 'profile_men_100_33', 'profile_women_500_459'],
+    ),
+    Character(
+      id: 'profile_women_200_187',
+      gender: 'male',
+      age: 33,
+      height: 169,
+      rawText: '编号187\n【年龄】1992\n【身高】 169\n【出身】重庆\n【在留】永住\n【工作】制造业技术开发\n【年收】700+\n【学历】东京大学修士\n【兴趣】唱歌画画乐器手工撸猫看花\n【希望对方】有定居日本的打算，有稳定工作，\n身体健康，无不良嗜好。有共同话题，\n可以一起学习和体验有趣的事。\n学历本科以上，年收相差不太大或者更好。\n我穿高跟鞋时看起来比我高。',
+      image: 'https://github.com/141801/info/assets/42635299/f69a6bdd-089c-43be-b2a0-c91e3850b4f9',
+      hometown: '重庆',
+      currentLocation: '',
+      occupation: '制造业技术开发',
+      interests: const <String>['唱歌', '画画', '宠物'],
+      interestIds: const <int>[8, 18, 26],
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_600_561', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_women_200_186',
+      gender: 'male',
+      age: 27,
+      height: 155,
+      zodiac: '天蝎',
+      rawText: '编号186\n基本信息\n・出生年月：1998/11\n・身高体重：155/45\n・职业：康复教育\n・学历：硕士\n・现居住地：东京\n・户籍：吉林\n\n性格\n・上进乐观，开朗爱笑～！\n・性格比较直爽，有问题尽量沟通解决，不会让对方猜\n・大部分比较佛系，不会因为小事计较\n・责任感较强，分享欲较多 哈哈\n\n兴趣爱好\n・喜欢旅游，打卡各种美景\n・悠闲时间撸猫，散步，吃美食，唱歌\n・有点二次元成分，偶尔玩游戏\n\n期待对方\n・90-00，175+，70kg以下\n・爱干净，不抽烟，可少量喝酒\n・可适当喜欢玩游戏，但不可以是没游戏活不下去的\n・有运动习惯最好，带我一起运动\n・喜欢旅游，可以一起自驾游～\n・打算在以后在东京定居的，不接受以后回国发展\n・有事共同面对，一起解决，愿意沟通，真诚对待感情\n・对生活工作有积极思想，有上进心责任心\n・以后一起进步一起快乐玩耍(｡･ω･｡)ﾉ',
+      image: 'https://github.com/user-attachments/assets/9253fd71-dfe9-4701-bdc3-68c6193d2359',
+      bmi: 18.7,
+      hometown: '吉林',
+      currentLocation: '东京',
+      occupation: '康复教育',
+      interests: const <String>['动漫', '美食', '唱歌', '打卡美景', '宠物', '散步', '旅游', '游戏'],
+      interestIds: const <int>[23, 5, 8, 365, 26, 47, 3, 21],
+      similarIds: const <String>['profile_men_300_294', 'profile_women_700_629', 'profile_women_400_363', 'profile_women_200_196', 'profile_women_400_356', 'profile_women_100_39', 'profile_women_500_450', 'profile_women_200_159', 'profile_women_100_77', 'profile_women_400_354'],
+    ),
+    Character(
+      id: 'profile_women_200_171',
+      gender: 'male',
+      age: 27,
+      mbti: 'ENFP',
+      rawText: '编号171\n\n个人简介\n\n【年龄】98\n【MBTI】ENFP\n【体形】正常（有在健身）\n【工作】大手咨询\n【学历】旧帝硕\n【性格】外向开朗活泼 乐观向上\n【兴趣】旅行、健身、徒步、爬山、逛博物馆、志愿者活动等，喜欢尝试各种新鲜事物、历史地理等话题\n\n期待的另一半\n【年龄】年上5年下3以内\n【学历】理工类本科及以上\n【性格】情绪稳定、认真踏实有上进心\n【 身高】175+\n\n（PS：不接受异地、加我之后请先自我介绍）',
+      currentLocation: '',
+      occupation: '大手咨询',
+      interests: const <String>['健身', '历史', '喜欢尝试各种新鲜事物', '徒步', '志愿者活动等', '旅游', '爬山', '看展'],
+      interestIds: const <int>[10, 118, 366, 11, 367, 3, 20, 22],
+      similarIds: const <String>['profile_men_600_544', 'profile_men_300_292', 'profile_men_600_557', 'profile_men_700_612', 'profile_women_100_96', 'profile_men_600_591', 'profile_men_100_89', 'profile_men_700_631', 'profile_men_500_437', 'profile_men_300_235'],
+    ),
+    Character(
+      id: 'profile_women_200_168',
+      gender: 'male',
+      age: 29,
+      height: 165,
+      zodiac: '双子',
+      rawText: '编号168\n\n性别：女\n出生年份：1996\n星座：双子\n籍贯：哈尔滨\n身高体重：165左右/58kg\n居住地：西川口\n兴趣：做甜点，追星，逛街，恐怖片，ktv\n希望对方：\n年龄：相差不太大就好\n性格：性格正常，可以主动聊天的，不是特别粘人，不是拖延症\n身高：比我高就行',
+      bmi: 21.3,
+      hometown: '哈尔滨',
+      currentLocation: '西川口',
+      occupation: '',
+      interests: const <String>['唱歌', '做甜点', '恐怖片', '追星', '逛街'],
+      interestIds: const <int>[8, 368, 369, 131, 9],
+      similarIds: const <String>['profile_men_600_548', 'profile_women_300_202', 'profile_women_500_476', 'profile_men_100_4', 'profile_men_200_188', 'profile_women_500_480', 'profile_men_600_599', 'profile_men_100_49', 'profile_men_100_74', 'profile_men_100_85'],
+    ),
+    Character(
+      id: 'profile_women_200_159',
+      gender: 'male',
+      age: 31,
+      height: 160,
+      zodiac: '处女座',
+      mbti: 'ISTJ',
+      rawText: '编号159\n\n性别：女\n出生年份：1994\n星座：处女座 ISTJ\n籍贯：湖北\n身高体重：160/53kg BMI 20.8\n居住地：东京\n工作：IT\n收入：700+\n兴趣：健身，旅游，city walk，看展，追番\n其他介绍：比较慢热，\n经常被不熟的人说高冷，熟悉了很疯\n\n希望对方：\n年龄：85-94\n性格：情绪稳定，成熟，诚信，\n能主动点经常约我出门，带动我到处吃喝玩乐\n年收500+\n身高：178+\n身体健康，有自己的爱好\n家庭和睦，无不良嗜好',
+      bmi: 20.7,
+      hometown: '湖北',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['city', '散步', '健身', '旅游', '看展', '追番'],
+      interestIds: const <int>[46, 47, 10, 3, 22, 370],
+      similarIds: const <String>['profile_women_300_280', 'profile_women_500_480', 'profile_women_200_196', 'profile_women_100_88', 'profile_women_300_296', 'profile_women_700_628', 'profile_women_300_260', 'profile_women_700_619', 'profile_women_400_356', 'profile_women_700_609'],
+    ),
+    Character(
+      id: 'profile_women_200_154',
+      gender: 'male',
+      age: 33,
+      height: 160,
+      zodiac: '天秤座',
+      rawText: '编号154\n\n个人基本情况\n出生年月：1992年\n星座： 天秤座\n身高： 160cm\n体重： -\n籍贯： 福建福州\n民族：汉族\n学校：本：211 ，硕：九州大学\n行业/*单位：外企物流大手\n在就资格：高度人才\n家庭情况：父母-独生女\n兴趣爱好：钢琴，看书，旅游，看展\n\n希望的另一半：\n90后，日本大学毕业，身高175，\n有想法，对自己人生有规划，\n有上进心，爱心！',
+      hometown: '福建福州',
+      currentLocation: '',
+      occupation: '外企物流',
+      interests: const <String>['旅游', '阅读', '看展', '钢琴'],
+      interestIds: const <int>[3, 25, 22, 17],
+      similarIds: const <String>['profile_women_500_475', 'profile_women_200_191', 'profile_men_500_457', 'profile_women_400_369', 'profile_women_300_260', 'profile_women_100_53', 'profile_women_100_76', 'profile_women_200_187', 'profile_women_700_609', 'profile_women_500_490'],
+    ),
+    Character(
+      id: 'profile_women_200_153',
+      gender: 'male',
+      age: 33,
+      height: 173,
+      zodiac: '摩羯',
+      rawText: '编号153\n性别：女\n星座：摩羯\n出生年：1992\n年龄：32\n现住：东京\n身高：173\n职业：时尚行业MKT\n年收：600+\n日语：来日10年\n爱好：滑雪⛷️潜水🤿瑜伽🧘‍♀️旅行✈️红酒🍷\n性格：情感细腻容易共情，\n喜欢和亲近的人撒娇，浪漫主义。\n择偶要求：年收800+。\n成熟稳重，沟通能力强，\n人生规划清晰。\n\n- （',
+      image: 'https://github.com/141801/info/assets/42635299/d443a39f-d89d-4756-958b-e3944a9dda8d',
+      currentLocation: '东京',
+      occupation: '时尚行业MKT',
+      interests: const <String>['滑雪', '潜水', '瑜伽', '旅游'],
+      interestIds: const <int>[14, 36, 350, 3],
+      similarIds: const <String>['profile_men_600_570', 'profile_men_400_305', 'profile_women_300_233', 'profile_men_300_288', 'profile_men_500_423', 'profile_men_500_474', 'profile_men_600_600', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63'],
+    ),
+    Character(
+      id: 'profile_women_200_151',
+      gender: 'male',
+      age: 31,
+      height: 166,
+      rawText: '编号151\n性别：女，94，黑龙江\n166/54kg，本科，\n东京\n长期计划在日本\n未婚未育\n亲姐在日本\n父母在韩国\n工作：it程序员\n兴趣：喜欢溜达看花看树看演唱会周末基本不宅家，喜欢听音乐\n年收：600+\n\n对方要求：\n身高178+ 身材匀称 性格开朗\n喜欢听音乐就更好了\n\n- （',
+      image: 'https://github.com/user-attachments/assets/9d96db05-e557-4f52-8c8e-25d7991a2642',
+      bmi: 19.6,
+      hometown: '黑龙江',
+      currentLocation: '东京',
+      occupation: 'it程序员',
+      interests: const <String>['音乐'],
+      interestIds: const <int>[7],
+      maritalStatus: '未婚未育',
+      similarIds: const <String>['profile_women_600_594', 'profile_men_700_634', 'profile_men_600_509', 'profile_women_500_478', 'profile_women_500_480', 'profile_men_600_570', 'profile_women_500_485', 'profile_men_500_461', 'profile_women_200_136', 'profile_women_700_614'],
+    ),
+    Character(
+      id: 'profile_women_200_137',
+      gender: 'male',
+      age: 36,
+      height: 162,
+      zodiac: '双鱼',
+      rawText: '编号137\n年龄：35黑龙江人 父母健康都建在\n婚姻状况：单身(未婚,没有婚史)\n身高：162\n星座：双鱼\n学历：本科\n工作：it\n现居住城市：日本东京\n*自我性格特征：\n善良，有爱心，孝顺父母：性格活泼开朗，对男友有很强的包容力，对人对物有耐心：\n因为是双鱼座，自己是一只比较感性而敏感的鱼儿，有时候会有情绪化的一面，\n有时候有会很急躁，随着岁月的沉淀，相信自己会迈向更加成熟的一面，\n有时候有点傻呆萌，有时候会有点幼稚，双重性人格。\n希望未来老公的胸膛是我小鸟依人的向往。\n*兴趣爱好：\n闲暇之余可以喜欢追求内心的满足平静与安稳，出生游，春看樱花，夏看海，秋赏红叶，冬泡温泉。\n可以让我更加有心灵的感知能力，希望和未来喜欢的人一起谋划去看世界。\n*择偶标准：\n硬性标准：本科以上学历，身高165以上，收入700万以上，离婚的也可以,\n只是不希望伤害带给我就好.最好是没有孩子，如果经济条件特别好，\n比如说每个月可以给我足够生活费的话，有孩子也可以。\n希望对方可以承担家庭的大部分开支,能够负担家庭的经济负担.\n性格标准：脾气好，性情温厚，知冷知热，积极上进，诚实可靠，有耐心，有包容心，诚实守信用。\n家庭观：会心疼女人，爱家，有爱包容的家庭观，对家庭有责任感，不大男子主义，不自私, 希望可以有一颗白头到老的心。\n生活观：生活松弛有度，游刃有余的生活节奏。\n父母观：互相孝顺彼此的父母，希望对方的父母是和蔼可亲的人。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/18630787-c570-4e61-a6c6-7e7b1f6777ef',
+      hometown: '黑龙江',
+      currentLocation: '日本东京',
+      occupation: 'it',
+      interests: const <String>['温泉', '夏看海', '旅游', '春看樱花', '秋赏红叶', '追求内心的满足平静与安稳'],
+      interestIds: const <int>[59, 371, 3, 372, 373, 374],
+      maritalStatus: '单身',
+      similarIds: const <String>['profile_women_500_459', 'profile_women_500_494', 'profile_women_400_353', 'profile_men_500_457', 'profile_women_700_627', 'profile_women_600_556', 'profile_women_600_558', 'profile_men_100_2', 'profile_women_400_336', 'profile_women_500_453'],
+    ),
+    Character(
+      id: 'profile_women_200_136',
+      gender: 'male',
+      age: 34,
+      height: 168,
+      zodiac: '处女座',
+      rawText: '编号136\n\n性别：女\n星座：处女座\n出生年：1991\n年龄：32\n国籍：中国\n籍贯：辽宁\n现住：东京板桥区\n身高：168\n体重：50～52之间游走\n最终学历：中日两个大学本科\n职业：ip授权兼电影制作\n日语：N1（来日第12年）\n婚歴：未婚单身\n爱好：动漫二次元，音乐，旅行，弓道等\n性格：不抽烟不喝酒，生活简单，偏宅，\n有点怕生，混熟前被说高冷，\n但混熟了其实是个缺根筋的话唠。\n不太会撒娇，\n想找位甜甜女生做女朋友的，本人可能不太适合。\n择偶要求：希望对方175以上，不抽烟，\n交友圈简单，无不良嗜好。\n互相最好不要离得太远，\n准备长期定居日本，工作稳定。\n有什么事两个人商量着来，\n对彼此爱好，价值观等可以不加入但彼此尊重和理解。\n假日一起逛逛街，唱唱k，\n去展会，打游戏啥的就非常理想啦！\n\n- （',
+      bmi: 18.1,
+      hometown: '辽宁',
+      currentLocation: '东京板桥区',
+      occupation: 'ip授权兼电影制作',
+      interests: const <String>['动漫', '弓道', '旅游', '音乐'],
+      interestIds: const <int>[23, 375, 3, 7],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_women_400_302', 'profile_men_600_579', 'profile_women_300_224', 'profile_women_400_336', 'profile_women_500_478', 'profile_women_200_151', 'profile_women_600_538', 'profile_women_600_512', 'profile_men_600_510', 'profile_women_200_108'],
+    ),
+    Character(
+      id: 'profile_women_200_135',
+      gender: 'male',
+      age: 34,
+      height: 151,
+      zodiac: '天秤座',
+      mbti: 'INFJ',
+      rawText: '编号135\n\n星座：天秤座，INFJ\n出生年：1991\n年龄：32\n国籍：中国\n户籍地：吉林省长春市\n现住：横滨\n身高：151\n体重：46\n最终学历：日本公立大学本科\n职业：化学行业企划顾问\n年收：500w\n日语：N1\n婚歴：未婚单身\n爱好：旅行，美食\n择偶要求：不抽烟，无不良嗜好，长期定居日本，工作稳定\n\n- （',
+      bmi: 20.2,
+      hometown: '吉林省长春市',
+      currentLocation: '横滨',
+      occupation: '化学行业企划顾问',
+      interests: const <String>['旅游', '美食'],
+      interestIds: const <int>[3, 5],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_women_100_66', 'profile_women_400_351', 'profile_women_500_475', 'profile_women_100_76', 'profile_women_100_53', 'profile_women_100_88', 'profile_women_200_154', 'profile_women_300_260', 'profile_women_700_616', 'profile_women_300_262'],
+    ),
+    Character(
+      id: 'profile_women_200_134',
+      gender: 'male',
+      age: 32,
+      height: 163,
+      mbti: 'ENTP',
+      rawText: '编号134\n93年，女，\n东京在住，年收400，\n高度人才签证，庆应修士毕业，\n养一只布偶猫，身高163，体重50kg，\n母亲公务员，父亲律师，\n喜欢做饭，咖啡，偶尔喝酒。\n性格网上e人线下i人，entp，\n喜欢看电影，打游戏，平常比较宅。\n希望能找到上下年龄不超过3岁的，\n喜欢宅家一起做饭看电影，\n偶尔出去玩的另一半。\n理想的感情状态是下暴雨的天能两个人一起在家聊天撸猫看电影。\n\n- （',
+      image: 'https://github.com/141801/info/assets/42635299/bf2e5ba7-21f3-4334-8a60-4e96769c5ebe',
+      bmi: 18.8,
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['做饭', '喝酒', '咖啡', '游戏', '宠物', '电影'],
+      interestIds: const <int>[29, 35, 376, 21, 26, 4],
+      similarIds: const <String>['profile_women_700_619', 'profile_men_300_291', 'profile_women_500_458', 'profile_women_100_39', 'profile_men_100_8', 'profile_women_500_485', 'profile_women_600_538', 'profile_men_500_457', 'profile_men_500_416', 'profile_women_400_335'],
+    ),
+    Character(
+      id: 'profile_women_200_120',
+      gender: 'male',
+      age: 31,
+      height: 163,
+      zodiac: '摩羯',
+      rawText: '编号120\n◇お名前 : 李\n◇星座 : 摩羯\n◇生年月日: 1994\n◇ご年齢 : 30\n◇国籍 : 中国\n◇戸籍地 : 沈阳\n◇現住所 : 千叶\n◇身長 : 163\n◇体重 : 50\n◇最終学歴 : 大学\n◇ご職業 ： 化妆品\n◇赴日经历 ： 10➕\n◇签证类型 ：永驻\n◇婚歴 : 未婚\n◇家族との同居 : ✅\n◇趣味 : 旅行 探店打卡\n要求男方工作稳定 有责任感\n最好有购房打算或以购房\n不斤斤计较 性格开朗幽默 有眼缘\n\n- （',
+      image: 'https://github.com/141801/info/assets/42635299/daeea4ce-40d8-4f9e-9ffb-b00827fda2ab',
+      bmi: 18.8,
+      hometown: '沈阳',
+      currentLocation: '千叶',
+      occupation: '化妆品',
+      interests: const <String>['美食', '旅游'],
+      interestIds: const <int>[5, 3],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_300_280', 'profile_women_100_88', 'profile_women_600_538', 'profile_women_700_628', 'profile_women_600_512', 'profile_women_400_356', 'profile_men_600_563', 'profile_women_200_159', 'profile_men_200_144', 'profile_women_400_326'],
+    ),
+    Character(
+      id: 'profile_women_200_116',
+      gender: 'male',
+      age: 34,
+      height: 160,
+      rawText: '编号116\n\n91年北京人，160/90，\n工作是设计职基本完全在宅，\n在日10年无回国计划，\n目前住在高田马场。\n爱好是养小动物（猫和狗）\n玩塑料小人和游戏，\n一周去三到四次普拉提，\n户外citywalk找一些好吃的店\n然后偶尔会去钓鱼啊プチ旅行这样\n\n- （',
+      bmi: 35.2,
+      hometown: '北京',
+      currentLocation: '高田马场',
+      occupation: '设计职',
+      interests: const <String>['旅游', '宠物', '户外', '散步', '瑜伽', '游戏', '钓鱼'],
+      interestIds: const <int>[3, 26, 1, 47, 350, 21, 184],
+      similarIds: const <String>['profile_men_500_479', 'profile_women_700_611', 'profile_men_300_208', 'profile_men_300_279', 'profile_men_200_150', 'profile_men_200_128', 'profile_men_700_610', 'profile_men_200_161', 'profile_men_200_152', 'profile_men_300_258'],
+    ),
+    Character(
+      id: 'profile_women_200_112',
+      gender: 'male',
+      age: 20,
+      zodiac: '金牛座',
+      mbti: 'ENFJ',
+      rawText: '编号112\n\n05四川人\n目前在东京交换留学\n金牛座ENFJ\n喜欢逛街旅游唱歌画画\n和可爱的东西！爱说话\n希望认识温柔的人\n\n- （',
+      hometown: '四川',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['逛街', '旅游', '唱歌', '画画'],
+      interestIds: const <int>[9, 3, 8, 18],
+      similarIds: const <String>['profile_men_100_97', 'profile_men_300_207', 'profile_men_300_243', 'profile_men_300_232', 'profile_men_400_319', 'profile_men_600_554', 'profile_men_400_378', 'profile_men_100_22', 'profile_men_200_122', 'profile_men_100_48'],
+    ),
+    Character(
+      id: 'profile_women_200_108',
+      gender: 'male',
+      age: 34,
+      height: 162,
+      rawText: '编号108\n女，91，福建厦门\n162/43kg，本科，定期运动\n东京居住，来日13年，长期计划\n工作：日系大手海外销售 收入900+\n出差比较多，在一起后双方协商愿意换一份出差少的公司\n\n兴趣：旅行，泡汤，自驾，户外\n学生和上班后大概走过30个国家左右\n\n性格：爱笑，熟了之后话比较多，不乱发脾气 ，不喜欢和人争论。\n属于大方向对了不太抠细节的人\n性格缺点：有时候会比较犹豫不决\n\n对方要求：\n不太看外表，但注重双方性格匹配度\n有稳定经济能力\n情绪稳定成熟 有同理心\n不太过于宅不太过于寡言，沟通能力\n\n对物质生活有一定要求，所以自己愿意努力。希望对方也是比较上进的人。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/8cde9709-f93a-4487-8d41-16178ff1ed34',
+      bmi: 16.4,
+      hometown: '福建厦门',
+      currentLocation: '东京',
+      occupation: '日系大手海外销售',
+      interests: const <String>['运动', '户外', '旅游', '温泉', '自驾'],
+      interestIds: const <int>[6, 1, 3, 59, 15],
+      similarIds: const <String>['profile_women_400_383', 'profile_women_400_377', 'profile_women_500_458', 'profile_women_600_512', 'profile_women_600_538', 'profile_women_400_335', 'profile_women_200_136', 'profile_women_100_88', 'profile_men_500_411', 'profile_women_700_619'],
+    ),
+    Character(
+      id: 'profile_women_200_103',
+      gender: 'male',
+      age: 29,
+      height: 162,
+      rawText: '编号103\n\n出生年份：1996年\n身高：162cm\n体型：偏瘦\n出生地：浙江\n毕业院校：国内2本→早大修士\n工作：日资IT大手\n居住：东京的东边\n兴趣：喜欢户外运动。\n爬山，网球，今年冬天也想学滑雪⛷️\n喜欢温泉，泡汤，桑拿\n爸爸国企员工已退休，妈妈私企财务方面的工作。\n\n对另一半的要求：\n170cm以上。\n年龄在92-98之间（不是硬性要求）\n有正经工作。年收最好500➕\n乐观向上。\n最好也喜欢户外。或者对户外运动有兴趣的也行。\n希望找一个能够一起共同进步的伴侣\n\n[上一页](https://github.com/141801/info/blob/main/women_100.md) [下一页](https://github.com/141801/info/blob/main/women_300.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      hometown: '浙江',
+      currentLocation: '东京的东边',
+      occupation: '日资IT大手',
+      interests: const <String>['户外', '运动', '桑拿', '温泉', '滑雪', '爬山', '网球'],
+      interestIds: const <int>[1, 6, 377, 59, 14, 20, 112],
+      similarIds: const <String>['profile_women_500_480', 'profile_men_300_209', 'profile_women_600_545', 'profile_women_400_354', 'profile_women_500_476', 'profile_women_500_424', 'profile_men_300_294', 'profile_women_400_363', 'profile_men_600_555', 'profile_women_400_356'],
+    ),
+    Character(
+      id: 'profile_women_300_299',
+      gender: 'male',
+      age: 35,
+      height: 156,
+      mbti: 'ENFJ',
+      rawText: '编号299\n\n性别：女\n出生年份：1990\n出生地：吉林\n国内居住地：苏州\n日本居住地：千叶\n日本工作地：东京\n身高：156cm\n体重：45kg\n学历：国内本科 日本硕士\n在日：10年 永驻\n职业：化学营业\nmbti ：enfj\n感情状态：单身未婚\n喜欢：慢节奏亲近自然的旅行和徒步\n虽然很久没去了，但也会滑雪和潜水技能\n其他：性格开朗 也比较独立 会顾及他人感受 。\n嘴有点刁，所以有时间基本都自己下厨。\n不喜欢烟酒 工作原因偶尔需要出差和应酬。\n\n希望能找一个：也不抽烟 身高170cm以上 五官端正\n善良勤劳 诚实守信 孝敬父母 认真踏实的伴儿。\n期待可以一起吃饭追剧看电影过平淡的小日子，\n也可以一起等日出追日落看星星，探索未知且更广阔的天地。',
+      bmi: 18.5,
+      hometown: '吉林',
+      currentLocation: '千叶',
+      occupation: '化学营业',
+      interests: const <String>['做饭', '旅游', '徒步', '滑雪', '潜水', '电影', '追剧'],
+      interestIds: const <int>[29, 3, 11, 14, 36, 4, 24],
+      maritalStatus: '单身未婚',
+      similarIds: const <String>['profile_women_400_351', 'profile_women_400_398', 'profile_women_700_602', 'profile_women_500_467', 'profile_women_100_76', 'profile_women_700_630', 'profile_women_600_556', 'profile_women_500_475', 'profile_women_100_32', 'profile_women_600_512'],
+    ),
+    Character(
+      id: 'profile_women_300_296',
+      gender: 'male',
+      age: 32,
+      height: 162,
+      rawText: '编号296\n性别：女\n出生年：1993\n出生地：湖北\n现住：东京\n身高体重：162cm/60kg\n在日：8年\n职业：看护\n年收：400+\n兴趣：逛公园，料理，健身，\n性格：性格开朗，活泼，乐观向上，\n希望对方：年龄相差5岁以内 身高175以上\n成熟稳重 有责任心，有上进心，\n以后打算在日本长期发展',
+      image: 'https://github.com/user-attachments/assets/9e956694-6a7e-4e8d-ac37-c57519d26609',
+      bmi: 22.9,
+      hometown: '湖北',
+      currentLocation: '东京',
+      occupation: '看护',
+      interests: const <String>['健身', '做饭', '逛公园'],
+      interestIds: const <int>[10, 29, 378],
+      similarIds: const <String>['profile_women_500_480', 'profile_women_300_240', 'profile_women_200_159', 'profile_women_200_191', 'profile_men_600_570', 'profile_women_500_459', 'profile_men_100_8', 'profile_men_500_488', 'profile_men_600_509', 'profile_women_600_504'],
+    ),
+    Character(
+      id: 'profile_women_300_280',
+      gender: 'male',
+      age: 31,
+      height: 167,
+      rawText: '编号280\n\n微信名字：🍬\n老家：黑龙江省\n现居住：日本埼玉県(靠近东京)\n年龄：1994年\n现工作：日本企业IT相关工作\n年收：750w+\n签证：永驻\n学历：大学\n身高/体重：167/58\n爱好：旅游，美食',
+      bmi: 20.8,
+      hometown: '黑龙江省',
+      currentLocation: '日本埼玉県(靠近东京)',
+      occupation: '日本企业IT相关工作',
+      interests: const <String>['旅游', '美食'],
+      interestIds: const <int>[3, 5],
+      similarIds: const <String>['profile_women_700_628', 'profile_women_100_88', 'profile_women_400_356', 'profile_women_700_609', 'profile_men_400_338', 'profile_women_600_538', 'profile_women_400_387', 'profile_women_500_478', 'profile_women_200_159', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_women_300_262',
+      gender: 'male',
+      age: 36,
+      height: 160,
+      zodiac: '天蝎座',
+      mbti: 'ISFJ',
+      rawText: '编号262\n个人信息\n性别：女\n出生年：89年\n身高：160cm\n体重：52kg\n工作：IT营业\n年收：500+\n现居住地：江东区\n兴趣爱好：跑步，羽毛球，网球，旅游，美食探店\n其他：isfj 、天蝎座、已归化、大阪大学毕业\n对男方的要求：\n·合眼缘\n·以后打算在日本长期发展的\n·有担当，真诚直率，三观契合能聊得来的\n·来日5年以上的（本人10岁来日本，偏日系）',
+      image: 'https://github.com/user-attachments/assets/87e0effe-de43-4b3d-afc8-9538bcec3343',
+      bmi: 20.3,
+      currentLocation: '江东区',
+      occupation: 'IT营业',
+      interests: const <String>['旅游', '网球', '美食', '羽毛球', '跑步'],
+      interestIds: const <int>[3, 112, 5, 40, 53],
+      similarIds: const <String>['profile_women_600_558', 'profile_women_500_459', 'profile_women_500_494', 'profile_women_700_627', 'profile_women_600_587', 'profile_women_600_524', 'profile_women_400_335', 'profile_women_700_602', 'profile_women_200_137', 'profile_men_500_457'],
+    ),
+    Character(
+      id: 'profile_women_300_260',
+      gender: 'male',
+      age: 32,
+      height: 153,
+      rawText: '编号260\n出生地：山东\n-93年12月生，153/48公斤\n-目前居住在新小岩，工作在新宿，来日本第四年\n-喜欢逛街旅游泡温泉……\n-不吸烟不喝酒，平时休息也会比较宅，温柔型，嘴不是那种特别会说的，\n-父母健康，家庭合睦，一家四口，妹妹已经结婚生子。\n-对于另一半\n年上年下都可以接受……\n喜欢个子高点的，最好一七六以上，收入高点低点没关系，\n有上进心就好……毕竟钱可以两个人一起挣，希望对方情绪稳定，\n不自私，有事可以一起商量，对方可以主动点的话就很棒了……\n-当然如果对方互相看对眼，要求就是没要求。\n不介意闪婚……很期待有个人可以带我走出日本孤单的生活……',
+      image: 'https://github.com/user-attachments/assets/f2c78a68-1647-4c0b-b895-5795cafc749c',
+      bmi: 20.5,
+      hometown: '山东',
+      currentLocation: '新小岩',
+      occupation: '',
+      interests: const <String>['逛街', '旅游', '温泉'],
+      interestIds: const <int>[9, 3, 59],
+      similarIds: const <String>['profile_women_200_159', 'profile_women_700_619', 'profile_women_100_88', 'profile_women_100_42', 'profile_women_200_154', 'profile_women_700_602', 'profile_women_100_77', 'profile_women_400_335', 'profile_women_400_383', 'profile_women_500_475'],
+    ),
+    Character(
+      id: 'profile_women_300_242',
+      gender: 'male',
+      age: 35,
+      height: 162,
+      zodiac: '双鱼',
+      rawText: '编号242\n\n女 90年 双鱼 山东人已归化\n在大阪15年\n目前自营业 有房（贷款）无车 单身未婚 身高162cm 体重55kg\n年收500+\n喜欢旅游，游泳，美食，平时比较宅\n期待对方：三观正，情绪稳定，收入稳定。',
+      bmi: 21.0,
+      hometown: '山东',
+      currentLocation: '大阪',
+      occupation: '自营业',
+      interests: const <String>['平时比较宅', '旅游', '游泳', '美食'],
+      interestIds: const <int>[379, 3, 19, 5],
+      hasHouse: true,
+      hasCar: false,
+      maritalStatus: '单身未婚',
+      similarIds: const <String>['profile_men_400_339', 'profile_women_400_369', 'profile_men_600_565', 'profile_women_700_606', 'profile_women_400_351', 'profile_women_200_137', 'profile_women_500_459', 'profile_women_500_475', 'profile_women_600_556', 'profile_men_100_71'],
+    ),
+    Character(
+      id: 'profile_women_300_240',
+      gender: 'male',
+      age: 32,
+      height: 160,
+      rawText: '编号240\n\n个人信息\n- 出生年月：1993/02/16\n- 籍贯：山西朔州\n- 身高体重：160/55kg\n- 学历：硕士\n- 工作：IT\n- 来日：1年\n- 现居住地：江东龟户\n- 家庭情况：父母，2姐姐1哥哥均已成家有娃\n- 爱好：常喜欢健身，登山，徒步，看海，看日出与日落。\n- 其他：不抽烟。偶尔喝酒，无不良嗜好。养两只猫。\n- 期待另一半：年龄差+-10以内，有共同兴趣爱好。\n待人真诚，不抽烟。本科以上学历，\n年收入可以养活自己就行😄。三观正。',
+      bmi: 21.5,
+      hometown: '山西朔州',
+      currentLocation: '江东龟户',
+      occupation: 'IT',
+      interests: const <String>['健身', '徒步', '爬山', '看日出与日落', '看海'],
+      interestIds: const <int>[10, 11, 20, 380, 304],
+      similarIds: const <String>['profile_women_600_504', 'profile_women_500_480', 'profile_women_300_296', 'profile_women_500_485', 'profile_women_500_424', 'profile_women_500_459', 'profile_women_700_628', 'profile_women_500_475', 'profile_women_200_191', 'profile_women_100_88'],
+    ),
+    Character(
+      id: 'profile_women_300_233',
+      gender: 'male',
+      age: 32,
+      height: 170,
+      rawText: '编号233\n\n大连 170 93年\n独生女 爸妈退休\n休息日和朋友旅游 滑雪在学\n希望找个175以上 情绪稳定的男生',
+      currentLocation: '大连',
+      occupation: '',
+      interests: const <String>['旅游', '滑雪'],
+      interestIds: const <int>[3, 14],
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_100_4', 'profile_men_600_561'],
+    ),
+    Character(
+      id: 'profile_women_300_224',
+      gender: 'male',
+      age: 35,
+      height: 169,
+      zodiac: '白羊',
+      mbti: 'I',
+      rawText: '编号224\n\nLily出身上海目前人在东京\n出生年月：1990年4月\n身高：169\n体重：110\n年收：450\n在日：5年\n日大硕士\n日企正社员、人文签\n【自我介绍】\n任性，故情感经历少，但不好骗\n白羊，但I\n气血不足，日常基本养生局\n真玩起来也疯、喜欢动漫\n狗喜欢卡斯罗猫喜欢缅因\n\n【个人规划】\n考虑长驻日本\n根据情况或者考虑创业\n\n【优点】\n包容都高，宠自己对象\n沟通的反馈率高，不冷战\n愿意通过沟通学习对方接受的表达方式\n以便提供情绪价值\n长相中上\n\n【缺点】\n没耐性\n\n【期待的对方】\n年龄：下三岁上五岁是能接受的极限\n身高180上下\n年收800上下\n有结婚打算，考虑日本长驻\n有或者愿意养宠物\n生命里没有白月光，喝醉了也不会乱嗷嗷\n情绪稳定，情商在线，\n会主动低头，不冷战，宠自己对象\n能兼容不同思想\n能共同成长',
+      bmi: 19.3,
+      hometown: '上海',
+      currentLocation: '东京',
+      occupation: '日企正社员',
+      interests: const <String>['养生', '动漫', '喜欢狗卡斯罗', '喜欢猫缅因'],
+      interestIds: const <int>[381, 23, 382, 383],
+      similarIds: const <String>['profile_men_200_155', 'profile_men_500_423', 'profile_women_500_459', 'profile_women_200_136', 'profile_women_400_302', 'profile_men_100_8', 'profile_men_300_277', 'profile_women_500_458', 'profile_men_600_593', 'profile_men_100_2'],
+    ),
+    Character(
+      id: 'profile_women_300_204',
+      gender: 'male',
+      age: 33,
+      height: 167,
+      rawText: '编号204\n\n年龄：1992\n籍贯：辽宁沈阳\n身高：167\n东京在住，从事医疗方面的工作，年收的话可以自给自足。\n最近的兴趣是游泳，但因为不是周末定休，\n所以目前累的话休息日会比较宅。\n对对方的期待：不抽烟不酗酒牙齿整洁，175+ ，\n已工作，情绪稳定，遇事积极沟通，别太e\n希望两人相处能互相留有一定空间，\n尽可能地互相理解，尊重和包容。',
+      hometown: '辽宁沈阳',
+      currentLocation: '东京',
+      occupation: '医疗方面的工作',
+      interests: const <String>['游泳'],
+      interestIds: const <int>[19],
+      similarIds: const <String>['profile_men_600_570', 'profile_men_500_488', 'profile_women_500_459', 'profile_women_400_336', 'profile_men_500_423', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_women_300_202',
+      gender: 'male',
+      age: 30,
+      height: 164,
+      mbti: 'INFJ/INTJ',
+      rawText: '编号202\n出生年份：1995年\n身高体重：164cm/60kg\n出生地：重庆\n经历：来日8年，日本普通大学本科，京大修士，工作两年\n工作：日企it大手Solution Sales\n年收：600w+\n\n性格：乐观安静。比较宅，喜欢植物喜欢大自然。mbti测的一直是INFJ/INTJ\n爱好：徒步、露营、园艺、料理\n\n希望对方：比我大小不超过三岁，\n净身高170cm以上，BMI正常（18.5～26），\n年收450w+（随年龄和工作时间变化）\n性格上能静得下来。\n遵纪守法尊重他人。\n\n[上一页](https://github.com/141801/info/blob/main/women_200.md) [下一页](https://github.com/141801/info/blob/main/women_400.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      image: 'https://github.com/user-attachments/assets/18ef88e9-9ef6-4b5c-981f-11fe37e0ae8b',
+      bmi: 22.3,
+      hometown: '重庆',
+      currentLocation: '',
+      occupation: '日企it大手Solution Sales',
+      interests: const <String>['园艺', '徒步', '做饭', '户外'],
+      interestIds: const <int>[384, 11, 29, 1],
+      similarIds: const <String>['profile_men_100_4', 'profile_men_200_188', 'profile_women_500_480', 'profile_women_500_476', 'profile_women_200_168', 'profile_women_400_384', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129'],
+    ),
+    Character(
+      id: 'profile_women_400_398',
+      gender: 'male',
+      age: 35,
+      height: 160,
+      rawText: '编号398\n\n本人，女，90年，北方人，国内本科毕业，\n单身未婚，身高160.体重58kg，之后会减一些，\n来日本7年左右，工作签形式过来，现在在千叶一家公司做事务员。\n正常事务薪资。勤俭持家，不会胡花乱造。\n自给自足。也会做饭，但未必算好吃。\n为人善良乐观，热情爱笑。和身边朋友同事等相处融洽。\n工作环境比较难遇到合适的男士。\n对另一半想法，男、年龄相当，北方人最好东北人这样两家回家时离家近些，\n单身未婚，学历国内大专或者日本本科以上，有赚钱能力，稳定工作。\n为人真诚相待，有啥事实话实说，踏实肯干。无负债（房贷除外）。\n身高170以上，体重都可以。可以勤俭持家但别抠搜，品行好，性格温和。\n家庭责任感强，工作签以上签证，最好永驻（因为我还得过几年换永驻，\n这样可以不那么着急，两个人也稳定在日本的可能性大）希望不吸烟，少喝酒。\n最好也会做饭，幽默比较加分。\n我有的时候容易纠结，遇到事拿不定主意。\n希望和另一半有商有量。共同为小家努力。\n目前在千叶，以后可以两个人商量在哪安家和发展。有合适的请加微信\n\n- （',
+      bmi: 22.7,
+      hometown: '北方',
+      currentLocation: '千叶',
+      occupation: '事务员',
+      interests: const <String>['做饭'],
+      interestIds: const <int>[29],
+      maritalStatus: '单身未婚',
+      similarIds: const <String>['profile_women_200_191', 'profile_women_500_475', 'profile_women_100_76', 'profile_women_700_630', 'profile_men_100_83', 'profile_women_500_459', 'profile_men_400_339', 'profile_women_400_351', 'profile_women_600_524', 'profile_women_100_32'],
+    ),
+    Character(
+      id: 'profile_women_400_387',
+      gender: 'male',
+      age: 31,
+      height: 169,
+      zodiac: '巨蟹',
+      mbti: 'INFJ',
+      rawText: '编号387\n94年巨蟹女 169cm\n北京人，独生女。\n从本科起已在日本十年以上，庆应研究生毕业。\n现居东京，在品牌市场部工作。\n\n在家的话喜欢做饭，烘焙，手工，会自己做咖啡。\n出门的话看展，探店，旅游，喜欢做攻略发掘好玩的地方。\n户外也很有兴趣但是去的不多。喜欢传统文化。\ninfj，很重视周围人的情绪，但自己也会有点敏感。\n\n希望他身高173〜、90年以后生人。\n家在城市。未婚。年收500w以上。\n三观正不恨guo，积极工作积极享受生活。\n\n情绪稳定，能开朗一点最好啦。\n尊重彼此的想法和爱好。\n\n有结婚生子打算，但不想孩子接受日本教育。\n希望大家都能找到对的人～\n\n- （',
+      image: 'https://github.com/user-attachments/assets/e64ac0e7-5488-4158-88bb-a3a61ba9e430',
+      hometown: '北京',
+      currentLocation: '东京',
+      occupation: '品牌市场部工作',
+      interests: const <String>['传统文化', '做咖啡', '做攻略', '做饭', '户外', '手工', '美食', '旅游', '看展'],
+      interestIds: const <int>[58, 385, 386, 29, 1, 387, 5, 3, 22],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_300_280', 'profile_men_600_570', 'profile_men_500_430', 'profile_women_700_609', 'profile_men_400_338', 'profile_women_500_480', 'profile_men_700_633', 'profile_men_600_579', 'profile_women_400_356', 'profile_women_700_628'],
+    ),
+    Character(
+      id: 'profile_women_400_384',
+      gender: 'male',
+      age: 30,
+      height: 160,
+      rawText: '编号384\n个人资料\n家乡：湖南，定居广东\n工作地：名古屋\n来日：2年\n生年：1995\n职业：自动贩卖机相关\n年收: 400\n身高：160\n体重：58kg\n学历：大专\n爱好：料理、户外活动、近郊游、马杀鸡\n房产：国内有房90平\n酒：果酒，啤酒 偶尔\n个人相关：内向，不喜欢酒吧 可以宅家也可以户外，家族会做\n家庭：家庭和睦 非独生子女\n弟弟日本留学目前已经工作\n\n另一半希望：\n性格温和、为人和善、干净不吸烟、有商量能沟通、不沉迷游戏、不宅男\n175以上年龄88年～97年\n目前在名古屋\n\n- （',
+      image: 'https://github.com/user-attachments/assets/0d1f0e47-a687-446c-b65e-b934e980a661',
+      bmi: 22.7,
+      hometown: '湖南',
+      currentLocation: '名古屋',
+      occupation: '自动贩卖机相关',
+      interests: const <String>['啤酒', '户外', '做饭', '果酒', '近郊游', '马杀鸡'],
+      interestIds: const <int>[388, 1, 29, 389, 390, 391],
+      hasHouse: true,
+      similarIds: const <String>['profile_women_300_202', 'profile_women_500_480', 'profile_men_200_144', 'profile_women_500_475', 'profile_women_200_191', 'profile_women_500_476', 'profile_women_200_103', 'profile_women_400_326', 'profile_men_100_4', 'profile_women_200_196'],
+    ),
+    Character(
+      id: 'profile_women_400_383',
+      gender: 'male',
+      age: 33,
+      height: 158,
+      rawText: '编号383\n【关于我】\n- [ ] 出生：1992年\n- [ ] 身高158cm\n- [ ] 体重：46kg\n- [ ] 家乡：辽宁丹东\n- [ ] 现住：东京江东区\n- [ ] 学历：本科\n- [ ] 职业：不动产买取\n- [ ] 性格：慢热、熟悉后会喜欢开玩笑、有责任感\n- [ ] 爱好：瑜伽、旅游、听歌唱歌\n享受安静的时光、也喜欢户外运动\n在静与动之间找平衡\n\n【期待的另一半】\n- [ ] 情绪稳定·有责任心·有上进心\n- [ ] 对待感情认真·有矛盾时不逃避沟通\n- [ ] 希望我们相互欣赏、相互扶持\n\n- （',
+      image: 'https://github.com/user-attachments/assets/2b08a8df-df56-43ef-a409-82c76e4a86fe',
+      bmi: 18.4,
+      hometown: '辽宁丹东',
+      currentLocation: '东京江东区',
+      occupation: '不动产买取',
+      interests: const <String>['享受安静的时光', '音乐', '唱歌', '户外', '运动', '在静与动之间找平衡', '旅游', '瑜伽'],
+      interestIds: const <int>[392, 7, 8, 1, 6, 393, 3, 350],
+      similarIds: const <String>['profile_women_200_108', 'profile_women_400_377', 'profile_women_700_619', 'profile_women_500_458', 'profile_women_100_88', 'profile_women_400_335', 'profile_women_700_602', 'profile_women_600_512', 'profile_women_100_39', 'profile_men_300_291'],
+    ),
+    Character(
+      id: 'profile_women_400_380',
+      gender: 'male',
+      age: 35,
+      height: 173,
+      rawText: '编号380\n\n个人资料\n家乡：大连\n工作地：东京\n生年：1990\n职业：会计\n学历：大学院\n身高：173\n体重：BMI正常范围\n年收：450+\n兴趣爱好： 羽毛球（新手阶段），徒步， 爬山（初中级阶段），旅行，看电影\n（比较喜欢刑侦推理，盗墓题材类的也是我的菜），\n有一些爱好因为不会开车没办法开展………\n理想型（以结婚为目的）：\n学历本科以上，最好是少抽烟或者是不抽烟（对味道比较敏感）\n有责任心，真诚，不冷暴力及时沟通\n身高最好是177以上，BMI正常范围，年收500万以上，年纪最好相差不要超过5岁上下\n感谢你的浏览，希望大家都早日找到合适的另一半\n\n- （',
+      hometown: '大连',
+      currentLocation: '东京',
+      occupation: '会计',
+      interests: const <String>['徒步', '旅游', '爬山', '盗墓题材类的也是我的菜', '电影', '羽毛球'],
+      interestIds: const <int>[11, 3, 20, 394, 4, 40],
+      similarIds: const <String>['profile_men_300_295', 'profile_men_600_593', 'profile_men_100_2', 'profile_men_500_417', 'profile_men_300_288', 'profile_men_400_305', 'profile_women_200_190', 'profile_men_700_623', 'profile_men_500_401', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_women_400_377',
+      gender: 'male',
+      age: 34,
+      height: 156,
+      zodiac: '水瓶座',
+      rawText: '编号377\n辽宁人 女 现居住在东京 永驻\n5口小康家庭 经济无负担（父母·本人·妹妹·弟弟）家庭氛围和谐\n\n1991年水瓶座\n高中毕业来日，明治大学学部+明治大学大学院\n156\n46kg\n日系IT咨询大手公司\n単身无婚史\n无不良嗜好，平常偶尔小酌\n\n・兴趣爱好：\n1喜欢 和众多朋友一起出去玩\n频率较高的会组织朋友吃饭 唱歌 开车出去玩\n2喜欢 拍照、迪士尼、自驾、旅行\n3喜欢 运动 （一直很喜欢 但是都是断断续续的 最近在打羽毛球🏸）\n4喜欢旅行（和朋友一起，或者自己去）\n5喜欢 篮球 （经朋友确认 投篮命中率还可以）\n\n・性格\n因为家中排行老大 所以独立以及责任感较强 性格属于开朗活泼。对人真诚，情绪稳定，愿意倾听\n\n・理想型\n北方人，身高173左右，学历大学本科以上\n有稳定工作\n年收500以上越多越好\n心地善良，细心，性格开朗温和\n对人真诚，情绪稳定，有责任感\n不冷战，喜欢彼此沟通\n\n・对于未来的期待\n1关于婚姻。希望两个人彼此相爱 互相理解包容 从一而终\n2关于爱情。两个人久处不腻，可以一起谈天说地，也可以彼此安静，做各自的事情，并且享受有对方的陪伴。\n3关于未来。期待找到对的人，和对方一起努力加油，互相支持实现各自的梦想。一起为两个人的小家努力奋斗。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/cb44172e-ef09-40bc-9e85-f26fff8f4dc2',
+      bmi: 18.9,
+      hometown: '辽宁',
+      currentLocation: '东京',
+      occupation: '日系IT咨询大手公司',
+      interests: const <String>['和朋友一起出去玩', '唱歌', '自驾', '羽毛球', '摄影', '旅游', '篮球', '组织朋友吃饭', '运动', '迪士尼'],
+      interestIds: const <int>[395, 8, 15, 40, 2, 3, 50, 396, 6, 137],
+      maritalStatus: '単身无婚史',
+      similarIds: const <String>['profile_women_400_383', 'profile_women_700_602', 'profile_women_200_108', 'profile_women_600_587', 'profile_men_500_457', 'profile_women_400_335', 'profile_women_700_619', 'profile_men_300_291', 'profile_women_100_88', 'profile_women_300_262'],
+    ),
+    Character(
+      id: 'profile_women_400_369',
+      gender: 'male',
+      age: 34,
+      height: 171,
+      rawText: '编号369\n\n女生 91年 上海人，身高171 本科 ，未婚，独生女。\n现居日本大阪，在日德合资公司从事贸易工作，正社员。\n个人爱好：运动、美食、旅游、逛博物馆等。\n寻求在大阪、京都、神户等周边城市，\n或在东京有机会工作调动和有比较灵活居家办公，\n愿意双向奔赴的未婚男生。\n年龄82-94年间，身高175以上，学历本科及以上。\n希望男生品行端正，成熟稳重，阳光大气，\n不吸烟不酗酒不沉迷游戏，工作稳定，\n今后长期在日本生活\n\n- （',
+      hometown: '上海',
+      currentLocation: '日本大阪',
+      occupation: '贸易工作',
+      interests: const <String>['旅游', '美食', '运动', '看展'],
+      interestIds: const <int>[3, 5, 6, 22],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_100_14', 'profile_women_300_242'],
+    ),
+    Character(
+      id: 'profile_women_400_367',
+      gender: 'male',
+      age: 34,
+      height: 145,
+      zodiac: '射手',
+      rawText: '编号367\n\n性别：女\n身高：145\n体重：47kg\n年龄：91年\n星座：射手\n籍贯：福建\n现居地：世田谷区\n学历：本科\n工作：IT\n\n性格：活泼开朗没城府，可盐可甜\n\n兴趣爱好：唱歌，干饭，探店，聊天，室内活动(UNO，打健康麻将等)，\n看脱口秀，出去旅行，画油画（其实是偶尔去Workshop 有老师指导的，自己画不了），\n喜欢尝试新鲜事物（太刺激恐怖的不太行，孩怕）\n\n希望对方：身高尽量170以上，不胖不瘦，年龄相近或心理年龄成熟，\n学历本科，工作稳定，情绪稳定，性格好（幽默加分）\nPS：自带笑点，偶尔靠谱，平时可以互相调侃，关键时刻不会掉链子。\n一起走下去，不求轰轰烈烈，但求一日三餐，偶尔四季旅行。\n\n- （',
+      bmi: 22.4,
+      hometown: '福建',
+      currentLocation: '世田谷区',
+      occupation: 'IT',
+      interests: const <String>['旅游', '唱歌', '喜欢尝试新鲜事物', '室内活动(UNO', '美食', '桌游', '画油画', '看脱口秀', '聊天'],
+      interestIds: const <int>[3, 8, 397, 398, 5, 39, 399, 400, 401],
+      similarIds: const <String>['profile_women_700_616', 'profile_women_300_260', 'profile_women_700_602', 'profile_women_100_76', 'profile_women_200_135', 'profile_women_100_53', 'profile_women_500_475', 'profile_women_400_377', 'profile_women_600_587', 'profile_women_400_353'],
+    ),
+    Character(
+      id: 'profile_women_400_364',
+      gender: 'male',
+      age: 45,
+      rawText: '编号364\n我是80后，老家河北，来日本之前一直在北京生活，不介意年龄的可以联系我。\n我保养的还可以，外在和心态都还年轻。\n我来日本2年，我有自己的事业，年收保守2000+，具体的熟悉了再说。\n时间也很自由，能让生活过得很好。工作的时候认真靠谱效率高，\n生活里爱打闹说笑你可能有时候觉得我幼稚[笑哭R]。\n我大大咧咧风趣幽默，该细心的地方就会细心，\n上的厅堂下的厨房绝不会给你拖后腿，希望你也是个有一份自己事业、\n能劳逸结合、包容心强、有责任心能担事情商高的人，情绪价值太重要了，\n它真的可以帮人度过任何艰难岁月。\n有的时候一个拥抱都比任何重要……我其实是一个很容易被对方带动的人，\n有时候你急了我可能也会跟着急，你心平气和的我也就跟着温顺下来了，\n所以想找一个情绪相对稳定能安抚我能跟我一起承担事的人。\n本人诚心找也有结婚意愿的男士组建家庭，未来能一起在东京生活。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/a3c06221-aace-48dd-9bb4-d200f9979063',
+      hometown: '河北',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_500_484', 'profile_men_300_223', 'profile_men_600_535', 'profile_men_300_213', 'profile_men_200_102', 'profile_men_600_523', 'profile_men_600_569', 'profile_men_600_566', 'profile_women_400_318', 'profile_men_400_346'],
+    ),
+    Character(
+      id: 'profile_women_400_363',
+      gender: 'male',
+      age: 28,
+      height: 160,
+      rawText: '编号363\n个人资料\n名称: キン\n家乡：北京\n工作地：东京\n生年：1997年\n职业：咨询（正在转sales）\n年收: 600～700\n身高：160\n爱好：地雷系/lolita/宅舞/social/拍照/养生\n性格：80%E人但也享受一个人的时间；英国留子，日语学习中：）\n\n希望另一半：\n身高：170以上\n收入：＞我\n性格：大方，和我金钱观一致；情绪稳定，包容，主动，\n每天有时间能一起聊天，喜欢能量高的人\n\n- （',
+      image: 'https://github.com/user-attachments/assets/ff9ebea3-294d-4fa8-af3b-59cd28790c83',
+      hometown: '北京',
+      currentLocation: '东京',
+      occupation: '咨询（正在转sales）',
+      interests: const <String>['地雷系', '游戏', '宅舞', 'social', '摄影', '养生'],
+      interestIds: const <int>[402, 21, 403, 404, 2, 381],
+      similarIds: const <String>['profile_women_600_545', 'profile_women_500_480', 'profile_women_200_196', 'profile_women_200_103', 'profile_men_300_294', 'profile_women_600_525', 'profile_men_300_209', 'profile_women_400_354', 'profile_women_200_186', 'profile_women_400_314'],
+    ),
+    Character(
+      id: 'profile_women_400_356',
+      gender: 'male',
+      age: 29,
+      height: 165,
+      mbti: 'INFJ',
+      rawText: '编号356\n\n个人资料\n家乡：浙江\n工作地：新宿\n生年：1996\n职业：IT（基本在宅）\n年收: 400\nMBTI：INFJ\n身高：165\n体重：53kg\n学历：关关同立本科\n爱好：吸猫、美食探店、古琴、户外、睡觉\n家庭：独生女、家庭和睦、三代以内无家族遗传病\n有长寿基因 父母养老有保障\n对对方的要求：\n原生家庭幸福 无家族遗传病\n性格温顺不暴躁不急躁 做事有计划\n裸足172以上、bmi正常、不秃、爱干净\n不抽烟\n年龄88年～04年（属🐂🐒优先）\n在东京长期发展、江浙沪优先考虑\n有稳定工作、有结婚生娃计划\n\n- （',
+      bmi: 19.5,
+      hometown: '浙江',
+      currentLocation: '新宿',
+      occupation: 'IT（基本在宅）',
+      interests: const <String>['古琴', '宠物', '户外', '睡觉', '美食'],
+      interestIds: const <int>[405, 26, 1, 347, 5],
+      similarIds: const <String>['profile_women_300_280', 'profile_women_600_545', 'profile_women_500_480', 'profile_women_400_387', 'profile_women_400_354', 'profile_women_200_159', 'profile_women_700_628', 'profile_women_700_609', 'profile_women_200_103', 'profile_men_600_579'],
+    ),
+    Character(
+      id: 'profile_women_400_354',
+      gender: 'male',
+      age: 28,
+      height: 163,
+      rawText: '编号354\n\n个人资料\n名称:小葵\n家乡：河南\n工作地：东京\n生年：1997年12月\n职业：电商运营\n年收: 400～\n身高：163m\n爱好：宠物\n性格：成熟稳重，真诚善良\n希望另一半：\n年龄：85年～95年\n身高：163以上\n职业：有稳定的工作，专业技术类或创业\n收入：年收700万日元～\n性格：善解人意，不苛刻,没有酗酒习惯，情绪稳定,有结婚打算。\n\n- （',
+      hometown: '河南',
+      currentLocation: '东京',
+      occupation: '电商运营',
+      interests: const <String>['宠物'],
+      interestIds: const <int>[26],
+      similarIds: const <String>['profile_women_200_103', 'profile_men_300_294', 'profile_women_500_480', 'profile_men_300_209', 'profile_women_600_545', 'profile_women_700_609', 'profile_women_400_356', 'profile_women_600_594', 'profile_men_300_216', 'profile_men_500_444'],
+    ),
+    Character(
+      id: 'profile_women_400_353',
+      gender: 'male',
+      age: 36,
+      height: 158,
+      mbti: 'INTJ',
+      rawText: '编号353\n【个人资料】\n家乡：东南沿海\n年龄：35\n身高：158，BMI正常\n学历：有两个比较好的私立硕士学位\n家庭：独生女，家庭和睦\n爱好：喜欢逛博物馆美术馆、潜水、料理、旅行\n居住：东京都杉并区\nMBTI：INTJ，性格比较温和的类型，很好沟通。\n\n【对对方的期待】\n年龄没有硬性要求\n身高可能喜欢高一些的？但也不做硬性规定。\n之后可能会考虑去欧美国家，希望对方不排斥~（长期计划，不是马上动身，会商讨）\n会开车就更好啦（我虽然有驾照但是开的不怎么样呜呜），可以一起出门玩儿！\n\n硬性要求：\n① 喜欢猫狗，不过敏（之后有养宠物的计划）\n② 有清洁感，不邋遢\n③ 不抽烟（我对味道有点敏感）\n④ 无黄赌毒之类的原则性问题\n⑤ 身体健康，性格稳定，有礼貌和一定的边界感。遇到问题不要冷暴力。\n\n不喜欢用条条框框进行筛选和被筛选，不是目的性特别强的人。\n交友也大欢迎~\n\n- （',
+      image: 'https://github.com/user-attachments/assets/fdb6202a-d820-4c9c-95b1-8486343346f2',
+      hometown: '东南沿海',
+      currentLocation: '东京都杉并区',
+      occupation: '',
+      interests: const <String>['看展', '做饭', '旅游', '潜水'],
+      interestIds: const <int>[22, 29, 3, 36],
+      similarIds: const <String>['profile_women_200_137', 'profile_women_700_627', 'profile_women_500_459', 'profile_women_600_524', 'profile_women_500_494', 'profile_women_600_558', 'profile_women_600_556', 'profile_women_500_486', 'profile_women_300_262', 'profile_women_100_76'],
+    ),
+    Character(
+      id: 'profile_women_400_351',
+      gender: 'male',
+      age: 36,
+      height: 158,
+      rawText: '编号351\n年龄：35岁（1989年）\n身高：158cm\n体重：52kg\n学历：大学本科\n血型：O型\n兴趣爱好：旅游，美食，唱歌\n出身：山东济宁\n住址：千叶县市川市\n职业：免税店销售\n年收：300万+\n婚姻状况：未婚\n人文国际技术签证（签证种类）初次2017年去日2019回国，\n第二次2023年至今\n在国内名下有一套房，父母不到60岁，\n有一个妹妹已出嫁，家庭无负担\n择偶标准：希望以结婚为目的，可以尽快结婚的那种，\n只谈恋爱不结婚的勿扰，家庭无负担，\n性格好，阳光，有担当，有责任感。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/18adab4f-6f0e-4d19-a27f-4096c57b661a',
+      bmi: 20.8,
+      hometown: '山东济宁',
+      currentLocation: '千叶县市川市',
+      occupation: '免税店销售',
+      interests: const <String>['唱歌', '旅游', '美食'],
+      interestIds: const <int>[8, 3, 5],
+      hasHouse: true,
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_600_556', 'profile_women_300_299', 'profile_women_300_262', 'profile_women_300_242', 'profile_men_600_565', 'profile_women_600_502', 'profile_women_400_398', 'profile_men_400_339', 'profile_women_600_558', 'profile_women_200_135'],
+    ),
+    Character(
+      id: 'profile_women_400_343',
+      gender: 'male',
+      age: 34,
+      height: 163,
+      zodiac: '摩羯座',
+      mbti: 'INFJ-A',
+      rawText: '编号343\n\n微信名：小鱼\n居住地：埼玉川口市\n身高体重： 163/53\n出生年份：1991\n性别：女\n出身地：吉林省\n学历 工作：本科 IT 来日七年\n年收 签证：600+ 高度人才\n星座：摩羯座\nmbti：INFJ-A\n兴趣爱好：户外活动（滑雪，露营，自驾，钓鱼），温泉，养绿植，养猫养鱼\n优点：情绪稳定，理性不作，爱干净讲效率。会做面食。\n缺点：体力一般，户外活动强度低可。\n理想男友：170+ 讲卫生， 情绪稳定，双商在线，有话聊，言之有物。\n尊重女生，抱有认真正常的态度寻找另一半。\n\n- （',
+      bmi: 19.9,
+      hometown: '吉林省',
+      currentLocation: '埼玉川口市',
+      occupation: 'IT',
+      interests: const <String>['宠物', '养绿植', '户外', '滑雪', '温泉', '自驾', '钓鱼'],
+      interestIds: const <int>[26, 406, 1, 14, 59, 15, 184],
+      similarIds: const <String>['profile_women_100_29', 'profile_men_400_332', 'profile_women_500_452', 'profile_women_500_475', 'profile_women_700_615', 'profile_women_500_467', 'profile_women_500_459', 'profile_women_200_154', 'profile_men_600_565', 'profile_men_100_95'],
+    ),
+    Character(
+      id: 'profile_women_400_336',
+      gender: 'male',
+      age: 34,
+      height: 173,
+      rawText: '编号336\n\n定位 东京-山东\n身高 91年 173/60kg\n学历 MBA明治大学\n工作 メーカー，年收500万＋\n车房 日本无车无房 国内有房无贷款\n家庭 原生家庭有一个姐姐，自营业。父母均已退休\n性格 活泼开朗，自信大方\n爱好 游泳，旅行，读书\n未来规划 来日本4年未满，目前高度人才签证申请中。\n可两人协商以后在日本/回国/其他国家\n\n- （',
+      bmi: 20.0,
+      hometown: '山东',
+      currentLocation: '东京',
+      occupation: 'メーカー',
+      interests: const <String>['旅游', '游泳', '阅读'],
+      interestIds: const <int>[3, 19, 25],
+      hasHouse: true,
+      hasCar: false,
+      similarIds: const <String>['profile_men_400_361', 'profile_men_600_579', 'profile_women_300_204', 'profile_men_600_570', 'profile_men_600_600', 'profile_men_400_305', 'profile_men_300_277', 'profile_men_200_107', 'profile_men_500_423', 'profile_men_300_295'],
+    ),
+    Character(
+      id: 'profile_women_400_335',
+      gender: 'male',
+      age: 34,
+      height: 160,
+      rawText: '编号335\n家乡：山东\n工作：东京\n生年：91年\n行业：HR\n身高：160 | 50\n学历：早大硕\n爱好：羽毛球，瑜伽，看书。\n性格：乐观开朗，待人比较真诚，希望共同成长[愉快]\n\n希望另一半：\n本科以上学历。\n不抽烟，没有酗酒习惯。\n对情绪稳定，爱学习的男士有好感。',
+      image: 'https://github.com/user-attachments/assets/9c092fd4-ae41-4849-8100-49d35ce786b9',
+      bmi: 19.5,
+      hometown: '山东',
+      currentLocation: '东京',
+      occupation: 'HR',
+      interests: const <String>['瑜伽', '阅读', '羽毛球'],
+      interestIds: const <int>[350, 25, 40],
+      similarIds: const <String>['profile_women_700_619', 'profile_men_500_457', 'profile_women_500_459', 'profile_women_400_383', 'profile_women_600_587', 'profile_women_400_377', 'profile_women_500_453', 'profile_women_300_262', 'profile_men_300_291', 'profile_women_200_108'],
+    ),
+    Character(
+      id: 'profile_women_400_326',
+      gender: 'male',
+      age: 0,
+      height: 163,
+      rawText: '编号326\n\n本人条件：163偏胖，理系修士毕业，\n大手maker一年目，刚开始在宅率少，三年后如果不能全在宅会跳槽。\n倾向于丁克（主要是没钱没法想象生小孩的生活）\n本人不会滑雪，爬山也比较弱，有驾照，\n爱打游戏（主要爱打主机游戏和原神，但现在电子养胃中），\n爱看演唱会，爱看剧（英美剧为主），爱做美食\n希望对象：90后，有日本本科及以上的学历，\n有稳定的工作，有驾照，不秃头，可宅可户外，喜欢长假出门旅游。\n兴趣爱好有重合要不然我不知道跟你聊啥好。\n本人雷点：喜形于色，不爽了就直说懒得客气。\n有问题的时候会先解决问题，再解决对方的情绪。\n矛盾会当天解决，不记仇也不想别人记我仇。\n家里养两只猫，比较脏乱，猫掉毛，爱叫，会跟我一起睡，介意勿扰。\n本人优点：不藏着捏着，会记得各种节日会互相送礼会主动询问你喜欢什么想要什么然后直接买。\n广东人，结婚风俗习惯好，没有高额彩礼不用大办婚礼，\n也没有一定要生娃的习俗，一切从简（但是不能结婚啥都没有）。\n本人期待的生活：达成了恋爱关系可以跟男生一周见一次\n（希望男生比较粘人，毕竟我不是找搭子我是找人生伴侣），\n相处合适的话（一年左右）开始谈婚论嫁互相见家长，订婚求婚，最后结婚。\n结婚的时候两个人搬到一起住。\n（因为我家养猫，建议你在谈恋爱期间可以来我家看看能不能适应我的猫）',
+      hometown: '广东',
+      currentLocation: '',
+      occupation: '大手maker',
+      interests: const <String>['美食', '游戏', '追剧', '音乐'],
+      interestIds: const <int>[5, 21, 24, 7],
+      similarIds: const <String>['profile_women_500_475', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_women_400_325',
+      gender: 'male',
+      age: 37,
+      height: 150,
+      rawText: '编号325\nfangfang\n88年\n来自西北甘肃\n来日7年\n旅游业\n收入一般\n人文签证\n150cm 44kg左右\n住多摩地区\n\n家人都在国内，有个弟弟已成家\n性格自认为较温柔，直接坦率\n喜欢吃辣，喜欢面食，有点偏素食，\n不抽烟有时候喝酒，不打游戏，自认为比较节约，\n平时有时间会去慢跑，打羽毛球，乒乓球，\n都是入门水平，偶尔去徒步，冬天比较喜欢温泉。\n以后留日回国都可，喜欢孩子\n希望对方：年龄相近，真心,以结婚为目的，\n不拐弯抹角，情绪稳定,不暴力，遇事愿意沟通，\n不抽烟不沉迷游戏，生活习惯良好，\n有担当,打算正经过日子，喜欢户外活动更好',
+      image: 'https://github.com/user-attachments/assets/475c6b48-0b0d-45cd-83cf-fdc5d36f472d',
+      bmi: 19.6,
+      hometown: '甘肃',
+      currentLocation: '多摩地区',
+      occupation: '旅游业',
+      interests: const <String>['喝酒', '乒乓球', '喜欢吃辣', '喜欢面食', '徒步', '慢跑', '羽毛球', '有点偏素食', '温泉'],
+      interestIds: const <int>[35, 64, 407, 408, 11, 409, 40, 410, 59],
+      similarIds: const <String>['profile_women_600_584', 'profile_women_500_486', 'profile_women_600_556', 'profile_women_100_53', 'profile_women_600_502', 'profile_women_100_66', 'profile_women_100_76', 'profile_men_400_339', 'profile_women_600_524', 'profile_women_300_299'],
+    ),
+    Character(
+      id: 'profile_women_400_322',
+      gender: 'male',
+      age: 28,
+      height: 163,
+      mbti: 'INFP',
+      rawText: '编号322\n个人资料\n家乡：吉林\n工作地：公司在川崎住葛饰\n生年：1997\n职业：IT营业（基本在宅）\n年收: 450+\nMBTI：INFP\n身高：163\n体重：57kg\n学历：庆应硕\n爱好：吸猫、健身、吃东西\n家庭：有双胞胎妹妹，家庭和睦\n对对方的要求：\n身材和脸都有要求👀\n身高170以上\n不抽烟\n年龄90年～99年\n以后会在东京长期发展\n社会人的话有稳定工作\n学生的话毕业会留在东京',
+      image: 'https://github.com/user-attachments/assets/93884502-d036-42dc-b8ef-846842e50b1e',
+      bmi: 21.5,
+      hometown: '吉林',
+      currentLocation: '公司在川崎住葛饰',
+      occupation: 'IT营业',
+      interests: const <String>['健身', '吃东西', '宠物'],
+      interestIds: const <int>[10, 411, 26],
+      similarIds: const <String>['profile_men_100_85', 'profile_women_500_450', 'profile_men_700_631', 'profile_women_400_354', 'profile_men_600_578', 'profile_men_300_209', 'profile_men_700_635', 'profile_women_200_171', 'profile_men_100_89', 'profile_men_600_536'],
+    ),
+    Character(
+      id: 'profile_women_400_321',
+      gender: 'male',
+      age: 30,
+      height: 158,
+      zodiac: '火象',
+      mbti: 'ENTJ',
+      rawText: '编号321\n个人简介\n坐标：东京文京区\n年龄：95年11月\n身高：158\n体重：48\n学历：中医科大学 护理系\n职业：医院透析科护士👩🏻‍⚕️\n星座：火象\n年收：400+\n家乡：河南洛阳\n19年4月来日至今\nENTJ\n兴趣爱好：羽毛球🏸 爬山🧗‍♀️喜欢自然风景\n漫步逛街🛍️\n拍照📷记录生活点滴幸福时刻 也喜欢给别人拍照\n喜欢吃辣狂吃不胖 性格开朗不会吵架不记仇\n择偶标准：\n身高不低于170\n东京都内工作（不绝对）\n喜欢大方、爱干净的男生',
+      image: 'https://github.com/user-attachments/assets/b5793968-192c-4b91-ab8e-7d65e13a1e6c',
+      bmi: 19.2,
+      hometown: '河南洛阳',
+      currentLocation: '东京文京区',
+      occupation: '医院透析科护士',
+      interests: const <String>['摄影', '喜欢吃辣狂吃不胖', '逛街', '爬山', '羽毛球'],
+      interestIds: const <int>[2, 412, 9, 20, 40],
+      similarIds: const <String>['profile_women_100_42', 'profile_women_100_88', 'profile_men_300_291', 'profile_women_500_480', 'profile_women_700_619', 'profile_women_200_103', 'profile_women_300_260', 'profile_women_100_39', 'profile_women_500_476', 'profile_women_300_240'],
+    ),
+    Character(
+      id: 'profile_women_400_318',
+      gender: 'male',
+      age: 41,
+      rawText: '编号318\n84年，女，永住，来日30年，有车，有房\n⭐︎学历：本科\n⭐︎出生地：厦门\n⭐︎居住地：东京\n⭐︎工作：人事部\n⭐︎婚歴：未婚单身\n⭐︎爱好：\n旅游\n探店（小红书账号：荟子游日本）\n刷剧\n网球\n台球\n滑雪\n古筝\n骑马\n迪士尼\n环球影城\n\n🧍‍♂️希望对方：身体健康，不秃，不胖，不出轨，年收600以上',
+      image: 'https://github.com/user-attachments/assets/43a90996-8065-4e3b-a6d1-bc13214149cf',
+      hometown: '厦门',
+      currentLocation: '东京',
+      occupation: '人事部',
+      interests: const <String>['追剧', '古筝', '台球', '美食', '旅游', '滑雪', '环球影城', '网球', '迪士尼', '骑马'],
+      interestIds: const <int>[24, 413, 49, 5, 3, 14, 414, 112, 137, 293],
+      hasHouse: true,
+      hasCar: true,
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_men_600_535', 'profile_men_200_176', 'profile_men_500_484', 'profile_women_600_537', 'profile_men_200_124', 'profile_men_300_298', 'profile_men_100_2', 'profile_women_400_364', 'profile_women_600_526', 'profile_men_500_447'],
+    ),
+    Character(
+      id: 'profile_women_400_315',
+      gender: 'male',
+      age: 37,
+      height: 172,
+      zodiac: '射手座',
+      rawText: '编号315\n个人信息：88年，射手座，172cm，64kg\n籍贯：北京\n居住地：东京\n学历：本科\n爱好：烹饪，听音乐，旅游。喜欢尝试没做过的事情。\n\n希望对方\n身体健康，无不良嗜好，三观正。\n对生活充满热情，以后可以一起尝试没有做过的事情。',
+      image: 'https://github.com/user-attachments/assets/2ca8f3a8-bf1e-41d3-8cc6-b351909306e2',
+      bmi: 21.6,
+      hometown: '北京',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['音乐', '喜欢尝试没做过的事情', '旅游', '做饭'],
+      interestIds: const <int>[7, 415, 3, 29],
+      similarIds: const <String>['profile_men_100_2', 'profile_women_200_190', 'profile_men_300_238', 'profile_men_300_277', 'profile_men_100_33', 'profile_women_400_336', 'profile_men_200_165', 'profile_women_700_627', 'profile_men_400_361', 'profile_men_400_358'],
+    ),
+    Character(
+      id: 'profile_women_400_314',
+      gender: 'male',
+      age: 26,
+      height: 163,
+      zodiac: '处女座',
+      rawText: '编号314\n\n个人信息：\n99年9月\n出生地：吉林\n居住地：川崎\n星座：处女座\n性格：偏内向爱宅家\n爱好：游戏🎮电影🎬去咖啡厅☕️探店美食\n目前在日搬砖人\n身高163/62 努力减肥中\n不抽烟 喝酒比较少 无不良嗜好\n对方要求：真诚有责任心',
+      bmi: 23.3,
+      hometown: '吉林',
+      currentLocation: '川崎',
+      occupation: '在日搬砖人',
+      interests: const <String>['游戏', '电影', '美食'],
+      interestIds: const <int>[21, 4, 5],
+      similarIds: const <String>['profile_women_400_363', 'profile_men_100_85', 'profile_women_600_545', 'profile_men_500_470', 'profile_women_500_462', 'profile_women_400_322', 'profile_women_500_450', 'profile_men_300_292', 'profile_men_600_599', 'profile_men_700_631'],
+    ),
+    Character(
+      id: 'profile_women_400_302',
+      gender: 'male',
+      age: 35,
+      height: 167,
+      zodiac: '白羊',
+      mbti: 'ENTJ',
+      rawText: '编号302\n个人资料\n家乡：吉林\n坐标：东京\n生年：1990\n职业：事务\n星座：外冷内热的白羊♈️\nMBTI：ENTJ（感情里ISFJ）\n身高：167\n体重：52Kg\n学历：211本科&🇬🇧硕士\n爱好：烹饪、烘培、旅行、装饰家、听🎵、唱歌\n\n硬性条件：\n身高175以上、学历全日制本科及以上；年收600万日元以上；\n不吸烟或可以戒烟、不邋遢、无不良嗜好、没有大男子主义。\n\n加分项：\n有眼缘、思想成熟、情绪稳定；有解决问题和冲突的能力；\n性格开朗、乐观、豁达；体贴、有责任心、\n同理心、对自己未来有规划；有生活情趣。\n\n[上一页](https://github.com/141801/info/blob/main/women_300.md) [下一页](https://github.com/141801/info/blob/main/women_500.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      image: 'https://github.com/user-attachments/assets/baf7250a-6d39-4531-918a-8c35f5abbc7a',
+      bmi: 18.6,
+      hometown: '吉林',
+      currentLocation: '东京',
+      occupation: '事务',
+      interests: const <String>['音乐', '唱歌', '旅游', '烘培', '做饭', '装饰家'],
+      interestIds: const <int>[7, 8, 3, 416, 29, 417],
+      similarIds: const <String>['profile_women_200_136', 'profile_women_300_224', 'profile_women_400_315', 'profile_women_500_459', 'profile_men_600_510', 'profile_women_500_458', 'profile_men_300_277', 'profile_women_700_627', 'profile_women_400_336', 'profile_women_400_383'],
+    ),
+    Character(
+      id: 'profile_women_500_499',
+      gender: 'male',
+      age: 33,
+      height: 180,
+      zodiac: '水瓶座',
+      mbti: 'INFJ',
+      rawText: '编号499\n家乡：天津\n居住地：埼玉县\n性别：女\n出生：1992年\n身高：179.9\nmbti：INFJ\n星座：水瓶座\n学历：日本高中+短大+本科\n工作：跨境医疗·医疗翻译\n年收：400+\n签证：永驻申请中\n未来规划：日本定居\n家庭：父母都在国内，家庭合睦\n性格：善良独立慢热，参考水瓶座\n爱好：旅游，撸小动物（不仅限猫咪）\n家有猫咪一只，拒绝任何理由的弃养。\n希望对方：无不良嗜好，情绪稳定，乐观，做事有计划性\n身高比我高即可，年收500+\n\n- （',
+      image: 'https://github.com/user-attachments/assets/67823fb4-e9c6-48d1-ac1e-ecc7520b92c2',
+      hometown: '天津',
+      currentLocation: '埼玉县',
+      occupation: '跨境医疗·医疗翻译',
+      interests: const <String>['宠物', '旅游'],
+      interestIds: const <int>[26, 3],
+      similarIds: const <String>['profile_men_600_514', 'profile_men_300_274', 'profile_men_500_471', 'profile_men_600_561', 'profile_men_600_576', 'profile_men_200_110', 'profile_men_300_239', 'profile_men_100_14', 'profile_men_400_382', 'profile_men_400_352'],
+    ),
+    Character(
+      id: 'profile_women_500_494',
+      gender: 'male',
+      age: 37,
+      height: 160,
+      rawText: '编号494\n性别：女\n出生年份：1988\n国内居住地：浙江嘉兴\n日本居住工作地：东京\n身高：160cm\n体重：53kg\n学历：本科\n职业：护士，医疗翻译\n\n我：\n性格比较温和，依赖型，\n喜欢旅游，游泳，宅家，睡觉\n性格偏E（外向型）\n\n希望你：\n情绪稳定，积极向上，\n收入600+，不抽烟不喝酒\n身高170cm+\n长相清秀干净\n\n- （',
+      image: 'https://github.com/user-attachments/assets/09f91e13-3cb3-409a-902e-56058d0eb180',
+      bmi: 20.7,
+      hometown: '浙江嘉兴',
+      currentLocation: '东京',
+      occupation: '护士，医疗翻译',
+      interests: const <String>['宅家', '旅游', '游泳', '睡觉'],
+      interestIds: const <int>[418, 3, 19, 347],
+      similarIds: const <String>['profile_women_200_137', 'profile_women_700_627', 'profile_women_500_459', 'profile_women_600_524', 'profile_women_600_558', 'profile_women_500_486', 'profile_women_300_262', 'profile_women_400_353', 'profile_women_600_556', 'profile_women_700_602'],
+    ),
+    Character(
+      id: 'profile_women_500_490',
+      gender: 'male',
+      age: 32,
+      height: 165,
+      zodiac: '射手座',
+      mbti: 'INFP',
+      rawText: '编号490\n93年 165/60 射手座 INFP 山东威海人\n日本普通本科毕业\n现居大阪，中小日企在职（有副业）\n\n爱好：拍照，唱歌，旅游，喜欢小动物（爱狗）喜欢仪式感。会开车～\n性格：阳光开朗随和，不会因为小事斤斤计较。可I可E，熟人面前比较E。\n\n无不良爱好，不抽烟，不喝酒，不泡吧。\n圈子简单干净。\n\n希望对方：\n年龄相仿\n身高175+ 主要看眼缘\n不抽烟不喝酒\n在大阪有稳定工作，有长期留日打算。\n有责任心，上进心，情绪稳定，尊重女性，孝顺，爱干净，为人处事成熟稳重。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/1ecf3207-be4a-481e-81f1-0426d9063711',
+      bmi: 22.0,
+      hometown: '山东威海',
+      currentLocation: '大阪',
+      occupation: '中小日企在职（有副业）',
+      interests: const <String>['自驾', '唱歌', '宠物', '摄影', '旅游'],
+      interestIds: const <int>[15, 8, 26, 2, 3],
+      similarIds: const <String>['profile_men_300_267', 'profile_women_400_369', 'profile_women_200_187', 'profile_women_200_154', 'profile_men_100_14', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104'],
+    ),
+    Character(
+      id: 'profile_women_500_486',
+      gender: 'male',
+      age: 39,
+      height: 155,
+      zodiac: '天蝎座',
+      rawText: '编号486\n基本资料\n• 性别：女\n• 出生年份：1986年\n• 星座：天蝎座\n• 身高：155cm\n• 学历：硕士\n• 职业：企业管理层\n• 年薪：800万日元以上\n• 来日时间：10年\n现居住地 东京\n自我评价\n我是一个长相甜美、性格温和、情绪稳定的人。\n对待感情，我会像一只猫：有时候高冷不爱搭理，但更多时候会撒娇粘人，带给你甜甜的恋爱体验。\n如果我们在一起，我会认真对待这段感情，也会对你负责到底。\n\n小缺点\n• 工作忙的时候可能没法及时回复你，但这绝对不是因为不在乎你。\n• 假期更喜欢宅在家，不过如果你喜欢外出，我也愿意陪伴，和你一起享受美好时光。\n\n理想中的你\n• 年龄：比我小5岁至大10岁以内\n• 身高：175cm以上\n• 收入：月薪800万日元以上\n• 习惯：不抽烟，愿意沟通，杜绝冷暴力\n• 性格：积极向上，充满热情，有责任心，考虑近期进入一段稳定的感情\n\n加分项\n• 理解我的工作节奏，愿意一起分享生活中的小美好\n• 擅长沟通，懂得用行动传递关爱\n• 拥有自己的热情和目标，同时愿意为我们的未来努力\n\n如果你符合这些条件，并期待一段认真又甜蜜的恋爱，那我们可能会很合适！期待与你的相遇！\n\n- （',
+      image: 'https://github.com/user-attachments/assets/e2c358a6-6d26-43b8-a8f0-b48b4079b836',
+      currentLocation: '东京',
+      occupation: '企业管理层',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_women_600_524', 'profile_women_600_558', 'profile_women_500_494', 'profile_women_700_627', 'profile_women_600_537', 'profile_women_600_564', 'profile_women_500_459', 'profile_women_400_353', 'profile_women_600_584', 'profile_men_400_312'],
+    ),
+    Character(
+      id: 'profile_women_500_485',
+      gender: 'male',
+      age: 33,
+      height: 161,
+      zodiac: '水瓶座',
+      rawText: '编号485\n\n性别：女\n出生年份：1992.2月 水瓶座、月白羊、上升双子\n籍贯：山东青岛\n家庭：父母弟弟、父母均退休，有退休金。\n身高体重：161/53-56kg\n学历：日本本科\n居住地：东京\n工作：it、500w左右\n兴趣爱好：爬山、滑雪，其他有机会也想尝试。也喜欢在家看电影、临摹字帖、听着音乐打扫卫生…\n脾气性格：大部分时间很好说话、几乎没脾气。性子大大咧咧男孩子气，\n对工作学习没有啥上进心（也不会要求另一半有上进心（有的话更好）有那心思我不如多鸡自己。\n如果对另一半要求好学、好强不服输、那可以pass掉我了，我是咸鱼）对物质没啥太大要求，所以更追求精神上的合拍。\n\n【希望对方】\n前提：三观正常。无不良嗜好，不黄赌毒，不酗酒不嫖娼，没有暴力倾向，不沉溺于游戏。\n不妈宝，爹宝。正常人❗️\n年龄：84-96（86属老虎的不行）\n身高：净身高173以上\n体重：匀称即可\n长相：看眼缘\n收入：500w以上\n性格：乐观，真诚。会照顾人不自私，对家庭有责任心、有担当，思想成熟，\n情绪稳定、能够互相沟通交流的，互相尊重体谅。\n※不丁克，最近一两年想结婚的。\n兴趣爱好：有共同兴趣爱好最好，也可以一起培养\n硬性：干净整洁，吃饭不吧唧嘴❗️\n\n- （',
+      bmi: 21.2,
+      hometown: '山东青岛',
+      currentLocation: '东京',
+      occupation: 'it',
+      interests: const <String>['临摹字帖', '音乐', '滑雪', '爬山', '电影'],
+      interestIds: const <int>[419, 7, 14, 20, 4],
+      similarIds: const <String>['profile_women_600_587', 'profile_women_500_459', 'profile_men_700_634', 'profile_men_500_457', 'profile_women_600_504', 'profile_women_300_240', 'profile_women_200_151', 'profile_women_200_134', 'profile_women_200_191', 'profile_women_700_602'],
+    ),
+    Character(
+      id: 'profile_women_500_480',
+      gender: 'male',
+      age: 30,
+      height: 162,
+      mbti: 'ISFJ',
+      rawText: '编号480\n家乡：广东\n居住地：东京\n性别：女\n出生：1995年\n身高：162\nmbti：isfj\n学历：国内top艺术院校本+日本top艺术院校修士\n工作：大手建筑设计组织公司\n年收：700+\n签证：永驻申请中\n未来规划：无论是回国还是在日长期发展都可以\n家庭：父母都在国内，双教师家庭，家庭和睦\n性格：温柔独立，务实派\n\n期待的关系：人生不是一帆风顺，有欢乐也会有许多需要勇敢面对的事情。\n希望互相是成为靠谱的战友，并肩作战。\n希望对方：同样以发展长期稳定的关系为目标的务实派。\n身高比我高即可，年收400+，学历国内本科为一本及以上最佳\n\n- （',
+      image: 'https://github.com/user-attachments/assets/7f189ccf-8a50-4bc4-845f-99d8604b468f',
+      hometown: '广东',
+      currentLocation: '东京',
+      occupation: '大手建筑设计组织公司',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_women_500_424', 'profile_women_500_476', 'profile_women_200_103', 'profile_men_600_570', 'profile_women_700_628', 'profile_women_600_525', 'profile_women_200_159', 'profile_men_300_209', 'profile_women_400_354', 'profile_men_600_509'],
+    ),
+    Character(
+      id: 'profile_women_500_478',
+      gender: 'male',
+      age: 32,
+      height: 170,
+      zodiac: '巨蟹',
+      mbti: 'I',
+      rawText: '编号478\n\n关于自己】\n性别 ：女\n出生年：1993（属鸡，巨蟹）\n出生地：辽宁\n现住 ：东京（目前没买房买车）\n身高体重：大约170cm/56kg\n长相：5分？/10分，短发\n在日 ：12，3年（有永驻），将来准备一直留在日本或者二润也可。暂无回国打算。\n职业 ：IT\n收入：1k左右\nMBTI：I人（type经常变）\n爱好 ：看小说，追剧，玩农药，逛街，吃美食，旅行（喜欢大海，森林等自然风光），逛艺术馆，听音乐，钢琴曲（最近想学钢琴）\n感情状态： 未婚单身。喜欢孩子所以成家后想要小孩。\n性格：随和，真诚，外冷内热，和熟悉的人比较健谈爱开玩笑，生人刚开始可能害羞，看着严肃。\n家庭情况：父亲不在了，母亲国企刚退休退休金可以自给自足，在国内。\n烟酒：不抽烟，酒偶尔小酌\n\n【希望对方】\n年龄：88年以后（88年也可）\n身高：比我高就行（》170）\n体重：匀称即可\n长相：看眼缘\n收入：高于800w\n家庭：原生家庭幸福\n性格：内心成熟，乐观，温暖善良，会照顾人不自私，\n有幽默感，有责任心（对事业，对家庭），真诚不欺骗对方\n兴趣爱好：可一起培养共同爱好，没什么要求\n烟酒：不抽烟，不酗酒（小酌可）\n重点：想寻找有意已结婚为目标认真谈恋爱的人。\n其次，因为两人目标步调一致才能长久和谐的走下去所以对未来事业，\n家庭经营有构想最好。这个到时候再细聊。\n\n- （',
+      bmi: 19.4,
+      hometown: '辽宁',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['美食', '音乐', '旅游', '玩农药', '阅读', '追剧', '逛艺术馆', '逛街', '钢琴'],
+      interestIds: const <int>[5, 7, 3, 420, 25, 24, 421, 9, 17],
+      hasHouse: false,
+      hasCar: false,
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_women_300_280', 'profile_men_600_570', 'profile_women_200_151', 'profile_women_600_512', 'profile_men_600_579', 'profile_women_700_613', 'profile_women_400_336', 'profile_men_500_461', 'profile_women_600_594', 'profile_men_300_252'],
+    ),
+    Character(
+      id: 'profile_women_500_476',
+      gender: 'male',
+      age: 30,
+      height: 163,
+      rawText: '编号476\n\n【基本信息】\n·95年，辽宁大连人，在东京工作\n·身高163 体重60kg\n·本科毕业\n·就职于外资IT咨询公司，年收700+\n·性格大大咧咧，容易急眼，共情力强\n【兴趣爱好】\n·喜欢户外，觉得会让自己变开心\n·喜欢逛街\n【期待的另一半】\n·91年-97年，近1到2年内有结婚打算，想早点安稳下来\n·年收700+，身高175+，不要太胖（因为我自己胖）\n·积极沟通，有耐心性格好\n\n- （',
+      bmi: 22.6,
+      hometown: '辽宁大连',
+      currentLocation: '东京',
+      occupation: '外资IT咨询公司',
+      interests: const <String>['户外', '逛街'],
+      interestIds: const <int>[1, 9],
+      similarIds: const <String>['profile_women_500_480', 'profile_women_200_103', 'profile_men_300_209', 'profile_women_300_202', 'profile_women_500_424', 'profile_men_600_570', 'profile_women_600_545', 'profile_women_400_387', 'profile_women_200_168', 'profile_women_400_356'],
+    ),
+    Character(
+      id: 'profile_women_500_475',
+      gender: 'male',
+      age: 33,
+      height: 158,
+      zodiac: '天秤座',
+      mbti: 'ENTJ',
+      rawText: '编号475\n个人信息\n性别：女\n出生年月：1992年10月（天秤座）\n出生地：东北-吉林省（汉族）\n身高：158cm\n学历：日本私立大学\n在日：13年（国内高中毕业后来日）\n职业：保险营业/不动产营业（经济独立）\n婚史：未婚未育\nmbti：ENTJ\n\n自我介绍：性格开朗，情绪稳定，识大体懂进退，撒娇卖萌全都会。\n\n希望对方：\n（1）人品好，有担当，三观正，情绪稳定，有一定经济基础，工作努力上进。\n（2）父母通情达理，不要过多干涉，妈宝男不可，扣扣搜搜不可。\n（3）1984-1991（年龄不是必须，有成熟的思想）\n\n- （',
+      image: 'https://github.com/user-attachments/assets/3fdb294d-87e8-4259-a054-7071569a7c69',
+      hometown: '吉林省',
+      currentLocation: '',
+      occupation: '保险营业/不动产营业',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '未婚未育',
+      similarIds: const <String>['profile_women_200_154', 'profile_women_200_191', 'profile_women_100_76', 'profile_women_500_459', 'profile_women_400_326', 'profile_women_100_53', 'profile_men_400_339', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63'],
+    ),
+    Character(
+      id: 'profile_women_500_467',
+      gender: 'male',
+      age: 34,
+      height: 157,
+      zodiac: '天秤座',
+      mbti: 'ENFP',
+      rawText: '编号467\n\n个人简介\n性别：女\n出生年：1991\n星座：天秤座\n身高：157\n体重：47\n出生：湖南岳阳\n现居：琦玉大宫\n职业：美容相关\n学历：大专\n年收：300左右\n兴趣：旅游，音乐，美容，拍照，做饭，刷剧，学习。\n备注：ENFP，性格比较女汉子，搞笑女之类的，不是文静端庄的类型。\n基本没有不良嗜好，性格比较温和。\n要求：人品好，情绪稳定，有清洁感。\n条件非硬性，仅供参考。还是要实际视频或见面看眼缘和气场是否相合。\n\n- （',
+      bmi: 19.1,
+      hometown: '湖南岳阳',
+      currentLocation: '琦玉大宫',
+      occupation: '美容相关',
+      interests: const <String>['做饭', '追剧', '学习', '摄影', '旅游', '美容', '音乐'],
+      interestIds: const <int>[29, 24, 161, 2, 3, 422, 7],
+      similarIds: const <String>['profile_women_700_602', 'profile_women_500_475', 'profile_women_500_452', 'profile_women_300_299', 'profile_women_400_343', 'profile_women_100_76', 'profile_women_400_377', 'profile_women_400_383', 'profile_women_200_191', 'profile_men_500_457'],
+    ),
+    Character(
+      id: 'profile_women_500_462',
+      gender: 'male',
+      age: 26,
+      height: 160,
+      zodiac: '白羊',
+      mbti: 'ENFJ',
+      rawText: '编号462\n\n个人情况\n身高160体重55kg25岁白羊女\n滋贺本科学历，圈子超干净\n目前是艺术类自由职，有留日打算的北京女孩\n月收在30万-100万日元区间（因为是自由职业相对不太稳定，但是月收30以上是没问题的）\n平均年薪700万日元以上\n对对象外貌没有太大要求，对胖胖的男孩子有好感\n对毛茸茸特别没有抵抗力喜欢可爱的小东西！\n很能提供情绪价值，ENFJ超级小E人\n喜欢画画，逛街，料理和照顾小动物\n家里有两只毛孩子\n\n对另一半的要求：\n在关西地区\n希望另一半也很喜欢小动物，同时不介意我喜欢收集娃娃的爱好\n是艺术类相关的超加分，因为我本人二次元浓度超级高，也希望另一半懂任天堂游戏和部分美漫\n喜欢漫威，奥特曼等也加分。\n希望年龄比我大一点，身高比我高\n希望对方已经工作并已有永驻，收入多少无所谓\n希望另一半会开车！！！会打扫屋子分担家务负担\n未来可以一起在日本关西买房的\n\n- （',
+      bmi: 21.5,
+      hometown: '北京',
+      currentLocation: '滋贺',
+      occupation: '艺术类自由职业',
+      interests: const <String>['游戏', '奥特曼', '收集娃娃', '做饭', '漫威', '宠物', '画画', '美漫', '逛街'],
+      interestIds: const <int>[21, 423, 424, 29, 425, 26, 18, 426, 9],
+      similarIds: const <String>['profile_women_600_545', 'profile_women_400_354', 'profile_women_400_363', 'profile_men_300_294', 'profile_men_200_188', 'profile_women_400_314', 'profile_women_200_186', 'profile_women_400_322', 'profile_women_500_450', 'profile_men_600_591'],
+    ),
+    Character(
+      id: 'profile_women_500_459',
+      gender: 'male',
+      age: 35,
+      height: 164,
+      rawText: '编号459\n\n【关于我】\n•基本信息：女 90后 浙江杭州人\n•外貌：身高164，正常体重，正常外貌\n•工作：外资金融，收入xhs平均以上\n•学历：QS top10硕，理工\n•所在地：东京市区\n•婚史：未婚\n•性格：正常人，无不良嗜好\n\n【希望你】\n•情绪稳定，有担当，无不良嗜好，圈子干净\n• 88年以后，未婚，大学学历以上\n•身高170+ 正常外貌\n•年收900+\n•认真对待婚姻，共同扶持共同成长\n\n- （',
+      hometown: '浙江杭州',
+      currentLocation: '东京市区',
+      occupation: '外资金融',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_100_2', 'profile_men_600_570', 'profile_women_200_137', 'profile_women_600_587', 'profile_men_500_457', 'profile_men_400_339', 'profile_men_300_288', 'profile_women_500_475', 'profile_women_300_204', 'profile_women_500_453'],
+    ),
+    Character(
+      id: 'profile_women_500_458',
+      gender: 'male',
+      age: 33,
+      height: 165,
+      zodiac: '白羊',
+      mbti: 'INTP',
+      rawText: '编号458\n\n个人简介\n性别：女\n出生年：1992\n星座：白羊\n身高：165cm\n体重：52kg\n出生：江苏苏州\n现居：日本东京\n职业：在宅牛马偶尔营业\n学历：国内普本庆应修士\n年收：500\n兴趣：看电视、旅游、散步、看电影、去迪士尼\n备注：intp、即兴发挥选手、喜欢猫猫狗狗山山水水、\n可适量体验一些不危害生命的新鲜事（常年怂、偶尔大胆）、\n不抽烟不酗酒、偶尔运动、玩一点单机游戏、对神秘学感兴趣\n要求：比我高、生活自理、请尽量情绪稳定、互相尊重、真诚有趣、\n拒绝拉扯、有话直说但要好好说、\n有一定规划、一起做大做强、建议想清楚再聊\n（时间宝贵谢谢辽( ´▽｀)祝好！\n\n- （',
+      bmi: 19.1,
+      hometown: '江苏苏州',
+      currentLocation: '日本东京',
+      occupation: '在宅牛马偶尔营业',
+      interests: const <String>['体验新鲜事', '运动', '即兴发挥', '去迪士尼', '喜欢猫猫狗狗山山水水', '对神秘学感兴趣', '散步', '旅游', '游戏', '电影'],
+      interestIds: const <int>[427, 6, 428, 429, 430, 431, 47, 3, 21, 4],
+      similarIds: const <String>['profile_women_200_134', 'profile_women_400_383', 'profile_men_300_291', 'profile_women_600_538', 'profile_women_500_478', 'profile_men_100_8', 'profile_women_200_108', 'profile_women_300_224', 'profile_women_700_619', 'profile_men_500_457'],
+    ),
+    Character(
+      id: 'profile_women_500_453',
+      gender: 'male',
+      age: 36,
+      height: 160,
+      rawText: '编号453\n\n性别：女\n出生年份：1989/11\n籍贯：福州\n身高体重：160cm/52kg\n学历：大學\n居住地：東京\n工作：諮詢公司\n兴趣爱好（方便找共同点)：閒暇時候去自然和運動，也會癱在家裡。\n可靜可動，愛好廣泛，當然半途而廢的也不少，看書，滑雪，跳舞是堅持下來的。\n择偶标准：170cm以上，願意運動，有自己的愛好。\n遇事可以一起商量解決，互相尊重。\n我的優點：脾氣好，可以提供情緒價值的愛笑甜妹\n\n- （',
+      bmi: 20.3,
+      hometown: '福州',
+      currentLocation: '東京',
+      occupation: '諮詢公司',
+      interests: const <String>['也會癱在家裡。可靜可動', '愛好廣泛', '滑雪', '當然半途而廢的也不少', '看書', '舞蹈', '閒暇時候去自然和運動'],
+      interestIds: const <int>[432, 433, 14, 434, 435, 74, 436],
+      similarIds: const <String>['profile_women_500_459', 'profile_women_700_627', 'profile_women_600_558', 'profile_women_400_335', 'profile_women_200_137', 'profile_women_500_494', 'profile_women_700_602', 'profile_women_300_262', 'profile_women_500_486', 'profile_men_500_457'],
+    ),
+    Character(
+      id: 'profile_women_500_452',
+      gender: 'male',
+      age: 34,
+      height: 166,
+      rawText: '编号452\n\n【基本信息】\n1991年，福建福州人，现住于琦玉浦和\n身高体重：166cm/50kg\n学历 ：名古屋大学本科毕业\n大手日企生产管理 年收 ：400w～500w\n爱好 ：性格内向，喜欢宅在家里看电影，动漫，打VR游戏，\n会一点电钢和吉他，还喜欢旅行，美食，不喝酒不吸烟，\n未婚单身，工作后因为交际圈窄的原因一直没有找到合适对象\n性格 ：内向文静，情绪稳定，非常乐观\n家庭背景 ： 家庭氛围良好，有一个妹妹\n\n【希望对方 】\n认真负责，以结婚为目的交往\n身高175+，正常身材， 年龄相仿（差6岁上下），至少本科毕业，\n有稳定收入，人品好，能共同规划未来，不抽烟更好。\n\n- （',
+      bmi: 18.1,
+      hometown: '福建福州',
+      currentLocation: '琦玉浦和',
+      occupation: '大手日企生产管理',
+      interests: const <String>['吉他', '动漫', '电影', '游戏', '美食', '旅游'],
+      interestIds: const <int>[27, 23, 4, 21, 5, 3],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_women_600_538', 'profile_women_200_136', 'profile_men_100_14', 'profile_women_400_343', 'profile_men_600_563', 'profile_men_400_332', 'profile_women_200_191', 'profile_women_500_467', 'profile_women_600_512', 'profile_men_600_514'],
+    ),
+    Character(
+      id: 'profile_women_500_450',
+      gender: 'male',
+      age: 27,
+      height: 160,
+      rawText: '编号450\n\n性别：女\n出生年:1998\n来日年数：6年\n家庭背景：独生子女，父母感情和睦\n学历：帝大硕\n身高体重：160/48\n居住地：神奈川川崎\n工作：大手it正社员\n年收：500+\n爱好：吉他，看书，拳击，唱歌，看电影，看展\n家庭成员：一只猫。（国内家里养狗）\n性格：喜欢小动物，喜欢可爱事物。开朗活泼，有幽默感，\n兴趣爱好广泛所以不会要求天天粘在一起。有包容心，喜欢听取不同意见。\n外形：短发\n\n【希望对方可以是】\n年龄：93～99年之间\n身高喜欢高一些的，175+\n年收500+，学历本科以上\n最好不抽烟\n希望对方尊重我的爱好，喜欢小动物，有自己的兴趣爱好，情绪稳定，有解决困难的能力。\n*吵架摔东西打人绝对❌🆖\n*聊天发现不合适希望你友好说再见\n\n【不是要求但是有的话会很加分】\n会做饭，会开车（准备学车但目前还不会开车，\n谈恋爱想多出去旅游，并没有要求对方当司机的意思），能吃辣\n\n如果和我有共同爱好的话只交友也大欢迎～祝大家都能找到自己喜欢的人💕\n\n- （',
+      bmi: 18.7,
+      currentLocation: '神奈川川崎',
+      occupation: '大手it正社员',
+      interests: const <String>['吉他', '唱歌', '拳击', '阅读', '看展', '电影'],
+      interestIds: const <int>[27, 8, 291, 25, 22, 4],
+      similarIds: const <String>['profile_women_400_322', 'profile_women_200_186', 'profile_women_100_40', 'profile_women_600_531', 'profile_men_100_85', 'profile_men_600_591', 'profile_women_400_314', 'profile_men_700_631', 'profile_men_600_578', 'profile_women_500_462'],
+    ),
+    Character(
+      id: 'profile_women_500_448',
+      gender: 'male',
+      age: 29,
+      mbti: 'ISTJ',
+      rawText: '编号448\n\n96，老家山东济南，母单\nistj，性格可能有点人机，最近比较偏e\n现居东京，打算长时间在日发展，已申永驻\n职业：建筑业\n来日10年，修士毕业\n爱好：整体比较二次元，最近现充一点\n宅一点的：动漫（看的比较多可以来对对碰x）游戏（switch.steam.ps4.网游都涉猎过）小说电影kpop\n要出门的：剧本杀，卡拉ok，游泳，羽毛球\n\n希望男生：真诚，吸烟絶対だめ\n可能比较喜欢i人\n比较重要的是希望能有共同话题聊得来\n其次可能眼缘x\n大家都是普通人，对高矮胖瘦没什么要求\n在异国能找到一个能聊得来的相伴之人就好了\n\n- （',
+      hometown: '山东济南',
+      currentLocation: '东京',
+      occupation: '建筑业',
+      interests: const <String>['kpop', '桌游', '动漫', '唱歌', '阅读', '游戏', '游泳', '电影', '羽毛球'],
+      interestIds: const <int>[73, 39, 23, 8, 25, 21, 19, 4, 40],
+      maritalStatus: '母单',
+      similarIds: const <String>['profile_men_100_35', 'profile_men_100_59', 'profile_men_300_216', 'profile_women_600_594', 'profile_men_100_81', 'profile_men_700_626', 'profile_men_500_430', 'profile_men_100_70', 'profile_men_500_437', 'profile_men_200_179'],
+    ),
+    Character(
+      id: 'profile_women_500_438',
+      gender: 'male',
+      age: 29,
+      height: 150,
+      rawText: '编号438\n\n性别：女\n生年：96\n籍贯：贵州安龙\n身高：150\n学历：大专\n居住地：东京板桥\n工作：IT\n兴趣爱好：动漫，电视剧，喜欢接受挑战新事物，现在有在游泳和学习自由潜\n综合描述：长相属于普通但也不差。朋友圈小，干净。属于慢热型，不太会说话，但是性格很好，很喜欢倾听，会很考虑对方的感受，我自己也在慢慢变得更好更优秀...\n\n未来的他：170,大一到小三都可以，三观眼缘合得来，\n有事情有商有量，热爱生活，有责任心。\n长相正常就ok。\n性格好，不打人，不pua，不冷暴力，家务能一起分担。\n职业，正常工作。\n对生活有点仪式感，小惊喜。\n\n我希望和未来的他：\n工作的时候各自工作，发信息看到的时候就会回，出门或者做什么事情的时候给对方说一下。周末不休息的时候可以一起逛逛街，运动，散散步，宅家都可以。\n当然你需要自己空间的时候不打扰。\n\nPS：在确定关系之后，自己可能会有点粘人，也可以撒娇。也接受爹系男友\n\n- （',
+      hometown: '贵州安龙',
+      currentLocation: '东京板桥',
+      occupation: 'IT',
+      interests: const <String>['动漫', '喜欢接受挑战新事物', '学习自由潜', '游泳', '追剧'],
+      interestIds: const <int>[23, 437, 438, 19, 24],
+      similarIds: const <String>['profile_women_500_480', 'profile_women_100_42', 'profile_women_600_525', 'profile_women_200_186', 'profile_women_400_363', 'profile_women_500_424', 'profile_women_100_77', 'profile_women_200_196', 'profile_women_300_260', 'profile_women_100_39'],
+    ),
+    Character(
+      id: 'profile_women_500_424',
+      gender: 'male',
+      age: 30,
+      height: 162,
+      rawText: '编号424\n\n【个人资料】\n家乡：四川乐山\n年龄：29，95年\n身高：162cm\n学历：日语硕士\n家庭：普通县城，父母，妹妹（01年）\n爱好：茶道（中国茶、日本抹茶道）、植物（种花 插花 观景）、做新菜、身心活动（瑜伽 冥想 CI）、徒步、其他：对佛教与灵性成长感兴趣\n居住：东京都目黑区\n\n【希望对方可以是】\n年龄：95～86年之间\n身高喜欢高一些的，174+\n年收500+，学历本科以上\n心地善良，是可以彼此欣赏的人，最好不抽烟\n\n*️⃣不是要求，有的话，会很开心：\n收入：有存款或资产\n会开车（我感觉自己不适合开车）\n有清洁感，不邋遢\n有上进心，正能量\n有一定浪漫和审美品味，至少可以聆听和理解（不希望生活只是柴米油盐，还有诗和远方）\n\n说了这么多，还是要实际见面了解看眼缘啦～\n也非常欢迎交友（女生也可加我）～\n\n- （',
+      hometown: '四川乐山',
+      currentLocation: '东京都目黑区',
+      occupation: '',
+      interests: const <String>['CI', '佛教与灵性成长', '做新菜', '冥想', '徒步', '插花', '日本抹茶道', '植物（种花', '茶道（中国茶', '观景'],
+      interestIds: const <int>[439, 440, 441, 442, 11, 443, 444, 445, 446, 447],
+      similarIds: const <String>['profile_women_500_480', 'profile_women_200_103', 'profile_women_300_240', 'profile_men_600_509', 'profile_women_200_159', 'profile_women_700_628', 'profile_women_700_614', 'profile_women_300_296', 'profile_women_200_196', 'profile_women_500_476'],
+    ),
+    Character(
+      id: 'profile_women_500_421',
+      gender: 'male',
+      age: 35,
+      height: 160,
+      zodiac: '天蝎',
+      rawText: '编号421\n\n年龄：1990\n户籍：湖南\n星座：天蝎\n现住：东京\n身高：160\n体重：65（可能谎报1-2斤）不太稳定\n学历：本科\n婚姻：未婚\n收入：1000w+\n性格：活泼开朗，和蔼可亲，宜静宜动\n爱好：电影、美食、爬山，看展，画画。\n\n自我评价：性格比较慢热、有钝感力，但是很有分享欲，平时会跑步，健身，但是身材却并不好、因为只偶尔迈开腿，没有管住嘴。\n另一半的：我觉得另外一半除了是伴侣外、更应该是最好的朋友、彼此的战友，所以我希望找个正直，善良，爱生活，愿意对生活中所见所闻能耐的下心探讨和分享的人。我对另一半的工作各方面都没要求，你能干自己喜欢的，完成自我的期许就行，我不会试图改变您。希望双方是因为喜欢而在一起的，基于对彼此的尊重和信任而建立起的亲密关系。我不是美女、所以也不要求您是帅哥，干净整洁就行。\n\n- （',
+      bmi: 25.4,
+      hometown: '湖南',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['健身', '爬山', '电影', '画画', '看展', '美食', '跑步'],
+      interestIds: const <int>[10, 20, 4, 18, 22, 5, 53],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_500_459', 'profile_men_400_360', 'profile_women_600_587', 'profile_women_600_502', 'profile_women_700_616', 'profile_women_200_137', 'profile_women_700_611', 'profile_women_400_353', 'profile_women_100_76', 'profile_women_200_191'],
+    ),
+    Character(
+      id: 'profile_women_500_409',
+      gender: 'male',
+      age: 0,
+      rawText: '编号409 [上一页](https://github.com/141801/info/blob/main/women_400.md)\n[下一页](https://github.com/141801/info/blob/main/women_600.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      image: 'https://github.com/user-attachments/assets/3115a2de-dcb7-4c96-9530-a73dfcfd1b1d',
+      currentLocation: '',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      similarIds: const <String>['profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_men_600_561', 'profile_men_100_4', 'profile_men_600_570'],
+    ),
+    Character(
+      id: 'profile_women_600_594',
+      gender: 'male',
+      age: 30,
+      height: 168,
+      rawText: '编号594\n\n·出生：1995\n·身高：168\n·体重：58kg\n·居住地区：东京千叶交界\n·家乡：山东沿海城市\n·学历：私立top硕士\n·职业：咨询\n·性格：开朗，话多，同理心强，笑点泪点低，情绪相对稳定，indoor/outdoor➡️7/3，自认责任感和道德感强，三观正得发邪。\n家庭：独生女，家庭幸福，父母开明，亲朋友好。\n未来：可留日可回国，留日的话希望退休之后回国（视情况而定），以结婚为前提，若交往希望在1～2年内结婚。\n兴趣爱好：悬疑科幻烧脑反转类电影，情节跌宕的电视剧/动漫，文笔优越描写细腻的小说，音乐（流行与古典兼修），唱歌（五音俱全），手绘（会素描）。\n其他：不抽烟，不喝酒，无纹身，无任何不良嗜好，感情经历简单。\n\n希望另一半：\n年龄+5-3。\n身高173+，标准bmi。\n不抽烟，不喝酒，无纹身，无任何不良嗜好，感情经历简单。\n责任心和道德感强，懂得换位思考，能够倾听和尊重对方意见，真心渴望家庭和亲密关系。\n最好有相似的教育和家庭背景。\n具备基本的为人处事能力和情商，有直面问题的勇气和解决问题的能力，可以商量一起解决。\n喜欢说话，能聊得来阳春白雪也不忌讳下里巴人。\n有适量的上进心，婚后一起搞钱！！\n\n- （',
+      bmi: 20.5,
+      hometown: '山东沿海城市',
+      currentLocation: '东京千叶交界',
+      occupation: '咨询',
+      interests: const <String>['唱歌', '电影', '追剧', '动漫', '手绘（会素描', '阅读', '音乐'],
+      interestIds: const <int>[8, 4, 24, 23, 448, 25, 7],
+      similarIds: const <String>['profile_men_300_216', 'profile_men_600_509', 'profile_women_700_614', 'profile_women_200_151', 'profile_women_500_448', 'profile_men_300_249', 'profile_women_500_480', 'profile_women_600_504', 'profile_men_100_59', 'profile_men_100_35'],
+    ),
+    Character(
+      id: 'profile_women_600_587',
+      gender: 'male',
+      age: 34,
+      height: 160,
+      rawText: '编号587\n\n【基本信息】\n出生年份：1991年\n籍贯：江苏\n身高/体重：160cm / 55kg\n学历：日本普通私立大学硕士\n职业：事务相关\n年收入：主业300+副业\n现居：东京都内\n家庭背景：独生女\n兴趣爱好：演唱会，电影，电视剧，美食探索\n性格：三观正，有点小急性子，但情绪稳定，沟通顺畅\n最近的尝试：运动健身，打羽毛球\n\n【希望对象】\n年龄：相差三岁左右\n地域：江浙沪优先，生活习惯相似\n身高：172cm以上，体型健康，BMI正常\n外貌：看眼缘，干净清爽\n职业：有稳定工作，有上进心，熟悉日本社会生活，考虑在日本长期发展\n性格人品：真诚可靠，三观正，有责任感，生活规律，无不良嗜好\n态度：尊重女生，不大男子主义，认真对待感情，有良好的沟通能力\n兴趣：有自己的兴趣爱好\n期待未来可以一起运动，看演唱会，也牵手环游世界～\n\n- （',
+      bmi: 21.5,
+      hometown: '江苏',
+      currentLocation: '东京都内',
+      occupation: '事务相关',
+      interests: const <String>['羽毛球', '音乐', '电影', '追剧', '美食', '运动', '健身'],
+      interestIds: const <int>[40, 7, 4, 24, 5, 6, 10],
+      similarIds: const <String>['profile_men_500_457', 'profile_women_500_459', 'profile_women_700_602', 'profile_women_500_485', 'profile_women_700_616', 'profile_women_400_326', 'profile_women_100_76', 'profile_women_400_335', 'profile_women_700_619', 'profile_women_600_504'],
+    ),
+    Character(
+      id: 'profile_women_600_584',
+      gender: 'male',
+      age: 37,
+      height: 153,
+      zodiac: '双鱼',
+      rawText: '编号584\n出生：1988\n身高：153\n体重：45\n性别：女\n地区：东京23区内\n家乡：辽宁\n学历：国内985研究生\n职业：家电商品开发\n星座：双鱼\n婚史：未婚\n爱好：温泉、打球（羽毛球、台球、乒乓球）、爬山、亲近自然\n人格：偏i人，熟悉起来后也挺e\n\n🔸自己紹介\n身材娇小，中等容貌。\n性格温和，情绪稳定。喜欢沟通和分享。\n干净整洁，不喜邋遢。\n在国内大学毕业后来东京工作，今年是第十年，准备申请永驻。\n平日上班周末休息，加班不算多。\n\n🔸相手の要望\n年龄78年以下、身体健康。\n有稳定的工作和收入。\n希望对方情绪稳定，大事儿小情可以相互沟通，两个人能聊得来。相互理解，双向奔赴。\n休息日或在家休息，或者一起出去玩儿。\n谢绝冷暴力、酒瘾烟瘾重！\n\n- （',
+      image: 'https://github.com/user-attachments/assets/f7358148-a48f-43d1-a9a9-02194a69d152',
+      bmi: 19.2,
+      hometown: '辽宁',
+      currentLocation: '东京23区内',
+      occupation: '家电商品开发',
+      interests: const <String>['乒乓球', '亲近自然', '台球', '羽毛球', '温泉', '爬山'],
+      interestIds: const <int>[64, 449, 49, 40, 59, 20],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_400_325', 'profile_women_500_486', 'profile_women_700_602', 'profile_women_400_335', 'profile_women_600_524', 'profile_women_300_262', 'profile_women_400_377', 'profile_women_500_494', 'profile_women_400_353', 'profile_women_500_453'],
+    ),
+    Character(
+      id: 'profile_women_600_583',
+      gender: 'male',
+      age: 30,
+      height: 162,
+      zodiac: '巨蟹座',
+      rawText: '编号583\n\n女/1995/巨蟹座/162/辽宁/大学学历\n东京留学➡️工作\n工作：IT（日企正社员）\n收入：400+\n兴趣：喜欢聚会，喜欢热闹。\n本人：有妹妹，本人身体健康，爱笑～爱和人沟通，直来直去。\n家庭为重的人～会考虑另一半的心情，爱操心\n缺点介绍：情绪一般（打直球，不会大呼小叫，但是会主动沟通）东西会乱放，不爱做家务。\n身材不咋好（130斤）并且有点恋爱脑～\n\n希望对方：\n年龄：93-97\n性格：爱做饭爱做家务爱干净，有家庭责任和担当，恋爱脑的男生，年收500+，\n大学学历以上（简单的说想要的就是顾家型成熟男生，愿意照顾女生的）\n\n拒绝：不爱干净❌话少不爱沟通❌幼稚只知道吃喝玩乐❌情绪不稳定❌\n打游戏抽烟喝酒❌恋爱超过三段的❌不想结婚不会爱人自私的❌\n\n- （',
+      bmi: 24.8,
+      hometown: '辽宁',
+      currentLocation: '东京',
+      occupation: 'IT（日企正社员）',
+      interests: const <String>['喜欢热闹', '喜欢聚会'],
+      interestIds: const <int>[450, 451],
+      similarIds: const <String>['profile_women_500_480', 'profile_women_500_476', 'profile_men_300_209', 'profile_women_500_424', 'profile_men_600_509', 'profile_women_200_103', 'profile_women_300_296', 'profile_men_600_570', 'profile_women_600_525', 'profile_women_200_196'],
+    ),
+    Character(
+      id: 'profile_women_600_564',
+      gender: 'male',
+      age: 40,
+      height: 160,
+      zodiac: '金牛座',
+      rawText: '编号564\n\n.性别：女\n.出生年份：1985\n.籍贯：山东济南\n.身高体重：160/65\n.学历：本科\n.居住地：东京\n.工作：一般事务\n.兴趣爱好（方便找共同点)：滑雪、赶海、旅行\n.择偶标准：173以上80后未婚，工作稳定收入无忧，\n不油嘴滑舌，最好是土象星座，因为我是比较实际的金牛座，\n谢绝那些轻浮聊骚式的聊天方式，\n希望你对ASD有了解并且能接受包容，\n是情绪稳定性格大方善良的人。\n\n- （',
+      bmi: 25.4,
+      hometown: '山东济南',
+      currentLocation: '东京',
+      occupation: '一般事务',
+      interests: const <String>['旅游', '滑雪', '赶海'],
+      interestIds: const <int>[3, 14, 452],
+      similarIds: const <String>['profile_women_500_486', 'profile_men_300_283', 'profile_women_400_318', 'profile_men_300_298', 'profile_women_700_627', 'profile_men_400_312', 'profile_women_600_558', 'profile_women_600_526', 'profile_women_600_524', 'profile_men_100_2'],
+    ),
+    Character(
+      id: 'profile_women_600_562',
+      gender: 'male',
+      age: 48,
+      height: 155,
+      rawText: '编号562\n\n.性别：女\n.出生年份：1977\n.籍贯：吉林\n.身高体重：155/49\n.学历：大学本科\n.居住地：埼玉\n.工作：事務\n.兴趣爱好（方便找共同点)：爬山、カラオケ、羽毛球\n.择偶标准：工作稳定、情绪稳定、168cm以上、本科以上学历\n\n- （',
+      bmi: 20.4,
+      hometown: '吉林',
+      currentLocation: '埼玉',
+      occupation: '事務',
+      interests: const <String>['カラオケ', '爬山', '羽毛球'],
+      interestIds: const <int>[453, 20, 40],
+      similarIds: const <String>['profile_men_600_566', 'profile_women_400_364', 'profile_men_500_484', 'profile_men_100_56', 'profile_men_300_268', 'profile_men_600_523', 'profile_women_600_537', 'profile_men_200_102', 'profile_men_300_222', 'profile_men_300_223'],
+    ),
+    Character(
+      id: 'profile_women_600_558',
+      gender: 'male',
+      age: 37,
+      height: 160,
+      zodiac: '天蝎',
+      rawText: '编号558\n个人资料\n女\n1988.11 天蝎座\n祖籍福建\n小时候来的日本 现日籍\n现住东京足立区\n三姐弟的長女\n160cm 55kg\n血型O\n大学毕业 一家小公司的社员\n年收500＋\n兴趣爱好：运动(跑步，瑜伽，网球在学习中）旅行，美食，音乐等等\n\n希望找到一个成熟稳重以结婚为目的的另一半\n\n- （',
+      image: 'https://github.com/user-attachments/assets/61449238-acc2-4ccb-a8ca-e6b090fb666d',
+      bmi: 21.5,
+      hometown: '福建',
+      currentLocation: '东京足立区',
+      occupation: '一家小公司的社员',
+      interests: const <String>['瑜伽', '网球', '旅游', '美食', '运动', '跑步', '音乐'],
+      interestIds: const <int>[350, 112, 3, 5, 6, 53, 7],
+      similarIds: const <String>['profile_women_300_262', 'profile_women_500_459', 'profile_women_500_486', 'profile_women_500_494', 'profile_women_700_627', 'profile_women_600_587', 'profile_women_200_137', 'profile_women_500_453', 'profile_women_400_353', 'profile_women_200_190'],
+    ),
+    Character(
+      id: 'profile_women_600_556',
+      gender: 'male',
+      age: 37,
+      height: 162,
+      rawText: '编号556\n\n基本信息\n女 天津市\n1988年 162/51\n2010年來日本，在日本畢業\n工作方面:現在在奢侈品做銷售\n父母均在天津。已退休。\n性格熟悉的人比較聊的開。不熟悉的人可能有點不愛說話。\n愛好是寵物。家裡目前有2隻狗狗。也喜歡旅行。\n希望男方:身高在175以上。具有上進心，性格穩定。\n不需要多麼富有，今後可以一起努力奮鬥。要懂得孝敬父母。\n\n- （',
+      bmi: 19.4,
+      hometown: '天津',
+      currentLocation: '日本',
+      occupation: '奢侈品销售',
+      interests: const <String>['宠物', '旅游'],
+      interestIds: const <int>[26, 3],
+      similarIds: const <String>['profile_women_100_86', 'profile_men_600_565', 'profile_women_200_137', 'profile_women_600_502', 'profile_men_500_420', 'profile_women_400_353', 'profile_women_500_494', 'profile_women_700_627', 'profile_men_400_332', 'profile_women_400_351'],
+    ),
+    Character(
+      id: 'profile_women_600_545',
+      gender: 'male',
+      age: 28,
+      height: 163,
+      zodiac: '狮子座',
+      mbti: 'ENFJ',
+      rawText: '编号545\n【关于我】\n•基本信息：女 97年狮子座 上海人\n•外貌：163 减肥中\n•工作：国内エンタメ相关，目前就活中（26卒）\n•学历：艺术类国立修士\n•所在地：东京（上学在横滨）\n•爱好：美食（会自己做）、温泉♨️桑拿、旅行、电影、摄影\n游戏只会switch，有段时间沉迷splatoon\n想要尝试滑雪、钓鱼、徒步等户外活动（等一个搭子。）\n•性格：enfj，开朗大方，怕生，遇到事会直说不会憋着，不搞冷战让你猜。工作上被说有点强势，但生活中很平和。\n•家庭：和谐，父母开明。\n•烟酒：不烟，偶尔和朋友小酌，酒量很差。\n\n【希望你】\n•情绪相对稳定，不要动不动就烦躁\n愿意周末多出门走走，尝试新事物\n能有各自的独处空间，当然粘人也很好\n不要冷战，能够多沟通。\n如果是e人就更好了！\n两个人在一起开心快乐就好了～\n• 90~03（91抱歉有点迷信），未婚\n•身高173+ 不要太胖（因为我胖🥹），愿意一起减肥也可以，正常外貌\n•接受烟酒，但适度，能自我控制\n•江浙沪人\n接受可以在日本发展，也可以回国发展\n\n- （',
+      image: 'https://github.com/user-attachments/assets/9d80e2c9-64ba-48cc-b765-27cf8c144fbf',
+      hometown: '上海',
+      currentLocation: '东京',
+      occupation: '国内エンタメ相关，目前就活中',
+      interests: const <String>['游戏', '徒步', '户外', '摄影', '旅游', '温泉', '滑雪', '电影', '美食', '钓鱼'],
+      interestIds: const <int>[21, 11, 1, 2, 3, 59, 14, 4, 5, 184],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_400_363', 'profile_women_200_103', 'profile_women_400_354', 'profile_women_400_356', 'profile_women_500_480', 'profile_men_300_209', 'profile_women_700_628', 'profile_men_300_294', 'profile_men_600_555', 'profile_women_500_476'],
+    ),
+    Character(
+      id: 'profile_women_600_542',
+      gender: 'male',
+      age: 32,
+      height: 164,
+      mbti: 'ESFJ',
+      rawText: '编号542\n\n93年女生，老家河南信阳市，\n现在在东京，从事IT，ESFJ，\n净身高164，体重57kg，未来打算留日，\n兴趣爱好摄影，打王者，其他的活动有空也会参加；\n性格外向，性子比较直，喜欢分享生活\n理想型：身高体重正常，单身，未婚，年龄相仿，±4岁，\n不抽烟，可喝一点酒，不喝最好，不赌博，\n工作稳定，互相尊重，顾家体贴人，三观一致，目标一致，能过一辈子的人\n\n- （',
+      bmi: 21.2,
+      hometown: '河南信阳市',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['其他的活动有空也会参加', '游戏', '摄影'],
+      interestIds: const <int>[454, 21, 2],
+      similarIds: const <String>['profile_men_600_552', 'profile_women_500_480', 'profile_men_600_570', 'profile_men_300_291', 'profile_men_500_457', 'profile_women_500_459', 'profile_men_700_603', 'profile_women_100_39', 'profile_men_400_338', 'profile_women_200_103'],
+    ),
+    Character(
+      id: 'profile_women_600_538',
+      gender: 'male',
+      age: 32,
+      height: 166,
+      rawText: '编号538\n出生：1993\n学历：本科\n身高体重：166cm/46.5kg\n爱好：美食🍴，旅游🌏，电影🎬\n性格：感性，善良温暖，有上进心\n工作：东京上市公司正社员\n年收：700+\n现住：东京\n家乡：福建平潭\n理想的另一半：\n身高170以上\n脾气好，有上进心，真诚靠谱\n未婚未育\n有稳定的工作\n最好不抽烟\n希望你能和我一起探索世界、分享平凡又温馨的日常。你可以成熟稳重，\n也可以带点幽默感，偶尔宠宠我的小任性，\n但更多时候，我们是彼此欣赏、彼此懂得的存在。\n最理想的关系，大概就是即使日子平淡，也因为有你而闪闪发光吧。\n能一起玩，一起闹，也能相互依赖❤️\n\n- （',
+      image: 'https://github.com/user-attachments/assets/a4e3f242-0d4c-41cf-ac3d-eec3f441788b',
+      bmi: 16.7,
+      hometown: '福建平潭',
+      currentLocation: '东京',
+      occupation: '东京上市公司正社员',
+      interests: const <String>['旅游', '电影', '美食'],
+      interestIds: const <int>[3, 4, 5],
+      similarIds: const <String>['profile_women_100_88', 'profile_women_600_512', 'profile_women_300_280', 'profile_women_700_628', 'profile_women_500_478', 'profile_women_500_458', 'profile_women_200_108', 'profile_women_200_136', 'profile_women_200_120', 'profile_women_200_134'],
+    ),
+    Character(
+      id: 'profile_women_600_537',
+      gender: 'male',
+      age: 41,
+      height: 165,
+      rawText: '编号537\n\n征婚城市:日本\n祈岄，女，山东人，84年出生，\n签证:永驻，身高:165cm，体重:51kg，\n在东京埼玉县工作，国内有房，无贷款，\n心地善良，性格随和，通情达理。\n经历过一段婚姻（闪婚）无孩，\n更加懂得珍惜和经营感情，\n渴望找到一个心灵契合的伴侣，携手共度余生。\n家庭情况:\n父母均在机关事业单位已退休，\n妹妹妹夫均在事业单位工作已结婚。\n择偶要求：\n找年龄相仿身高170cm以上，在日本工作的中国人，\n1980年～1988年出生的未婚和短婚未育出生的男士，\n工作稳定的和自己有事业的都可以。\n希望可以遇到一位人品好，有责任心，通情达理，心理健康的有缘的他，\n对待感情认真专一，愿意携手共建温馨幸福的家庭。\n\n以上信息真实有效\n\n- （',
+      bmi: 18.7,
+      hometown: '山东',
+      currentLocation: '东京埼玉县',
+      occupation: '',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      hasHouse: true,
+      maritalStatus: '离婚',
+      similarIds: const <String>['profile_men_600_535', 'profile_men_100_56', 'profile_women_500_486', 'profile_men_500_484', 'profile_women_400_318', 'profile_men_400_313', 'profile_men_100_2', 'profile_women_400_364', 'profile_men_400_312', 'profile_women_700_627'],
+    ),
+    Character(
+      id: 'profile_women_600_531',
+      gender: 'male',
+      age: 30,
+      height: 167,
+      mbti: 'ISFJ',
+      rawText: '编号531\n\n【基本资料】\n年龄：1995年\n籍贯：山东\n身高体重：167cm/51kg\n学历：国内211本，日本旧帝大硕\n职业：日企IT正社员\n年收：500+\n现居住地：横滨\nMBTI：isfj\n家庭背景：独生女，家庭和睦\n兴趣爱好：旅行，电影，画画（但没什么天赋…），\n看展，徒步，喜欢猫咪但是还没机会养，也想尝试更多户外的爱好\n性格：性格温和，情绪稳定，同理心强，\n随遇而安，热爱生活的淡人，有点小洁癖\n\n【希望对方】\n92年及以下\n身高170+，BMI正常\n长相看眼缘，干净清爽的会加分\n学历本科以上\n有稳定工作，年收500+\n人品好，三观正，有责任心，生活习惯良好，无不良嗜好，\n不丁克，尊重女生，认真对待感情\n有自己的兴趣爱好，不要太宅\n希望以后能一起牵手去世界旅行～\n\n- （',
+      bmi: 18.3,
+      hometown: '山东',
+      currentLocation: '横滨',
+      occupation: '日企IT正社员',
+      interests: const <String>['喜欢猫咪', '徒步', '户外', '旅游', '电影', '画画', '看展'],
+      interestIds: const <int>[455, 11, 1, 3, 4, 18, 22],
+      similarIds: const <String>['profile_men_600_563', 'profile_men_600_578', 'profile_women_400_356', 'profile_women_700_613', 'profile_men_700_631', 'profile_women_500_450', 'profile_men_600_520', 'profile_men_100_4', 'profile_women_400_322', 'profile_men_100_85'],
+    ),
+    Character(
+      id: 'profile_women_600_526',
+      gender: 'male',
+      age: 40,
+      height: 171,
+      zodiac: '白羊',
+      mbti: 'ISFP',
+      rawText: '编号526\n出生：1985\n身高：171cm\n体重：66kg\n性别：女\n学历：阪大硕士\n职业：日企职员\n星座：白羊\n婚史：离异不带孩\n爱好：旅行、露营、滑雪、做饭\n人格：ISFP\n收入：500万\n\n我是一个勇敢且敢于冒险的人，热爱探索世界，也享受生活中的细腻情感。\n海外生活和旅行的经历，让我更加开放、包容，也更喜欢用自己的方式去理解世界。\n\n性格上，我是个慢热的人，随性自在，但内心藏着一份“乐观的悲观主义”，\n既能看透现实，也始终相信美好值得追寻。\n感情里，我自认是个清醒的恋爱脑，既能保持理智，又愿意为爱投入真心。\n热爱旅行和户外运动，登山、徒步、滑雪、露营\n\n相手の要望\n年龄：45以下\n身高：178以上\n性格：有责任感，情绪稳定，有同理心\n\n- （',
+      image: 'https://github.com/user-attachments/assets/558ed50c-30b7-4feb-92f0-194179ee76fc',
+      bmi: 22.6,
+      currentLocation: '',
+      occupation: '日企职员',
+      interests: const <String>['做饭', '徒步', '旅游', '滑雪', '爬山', '户外'],
+      interestIds: const <int>[29, 11, 3, 14, 20, 1],
+      maritalStatus: '离异不带孩',
+      similarIds: const <String>['profile_men_500_484', 'profile_men_300_283', 'profile_men_600_535', 'profile_women_200_190', 'profile_men_200_109', 'profile_men_600_503', 'profile_men_700_636', 'profile_men_300_298', 'profile_women_400_318', 'profile_men_400_399'],
+    ),
+    Character(
+      id: 'profile_women_600_525',
+      gender: 'male',
+      age: 30,
+      height: 157,
+      zodiac: '摩羯',
+      rawText: '编号525\n\n◆自我介绍\n◇生年月日 :1995-11\n◇星座: 摩羯\n◇血型:0型\n◇籍贯: 四川\n◇現住所:东京目黑\n◇身高: 157\n◇职业: 护士\n◇年收：500+\n◇婚歴 : 未婚\n◇趣味 : ps、尤克里里（现在住的地方不允许荒废了[捂脸]）偶尔王者、会一些家常小菜。\n◇其他: 性格开朗，积极向上、热爱生活、热爱我的职业\n\n◆择偶条件\n◇年龄：比我大一些的或者心理年龄成熟的\n◇身高：172+ 体重健康最好\n◇年收：600+\n◇其他：有责任心、幽默、情绪稳定、有长居日本打算。\n家务是有分担义务的、接受有矛盾可以小吵吵我觉得这很正常拒绝粗话暴力、\n然后是以结婚为目的交往、非诚勿扰。\n\n- （',
+      hometown: '四川',
+      currentLocation: '东京目黑',
+      occupation: '护士',
+      interests: const <String>['ps', '家常小菜', '尤克里里', '游戏'],
+      interestIds: const <int>[456, 457, 458, 21],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_500_480', 'profile_women_400_363', 'profile_women_500_424', 'profile_women_200_103', 'profile_women_500_476', 'profile_women_600_542', 'profile_women_100_39', 'profile_women_300_240', 'profile_women_200_196', 'profile_women_500_438'],
+    ),
+    Character(
+      id: 'profile_women_600_524',
+      gender: 'male',
+      age: 37,
+      height: 158,
+      rawText: '编号524\n家乡 ：河北\n工作地 ：东京\n生年：1988\n职业：贸易\n学历：大学\n身高 ：158\n年收：400\n兴趣：羽毛球（新手） 宅家 散步\n理想型\n有责任心、耐心、以我们的小家为中心\n不冷暴力，有问题能互相沟通。\n希望身高175左右（不是硬性要求）\n抽烟喝酒适量\n\n- （',
+      image: 'https://github.com/user-attachments/assets/b22d3f5b-0b4b-456b-b31b-6fe31e234e40',
+      hometown: '河北',
+      currentLocation: '东京',
+      occupation: '贸易',
+      interests: const <String>['宅家', '散步', '羽毛球'],
+      interestIds: const <int>[418, 47, 40],
+      similarIds: const <String>['profile_women_500_486', 'profile_women_500_494', 'profile_women_500_459', 'profile_women_400_353', 'profile_women_700_627', 'profile_men_400_312', 'profile_women_300_262', 'profile_women_600_558', 'profile_men_400_313', 'profile_women_200_137'],
+    ),
+    Character(
+      id: 'profile_women_600_512',
+      gender: 'male',
+      age: 33,
+      height: 163,
+      zodiac: '巨蟹座',
+      rawText: '编号512\n本人：\n女 92年\n身高163\n体重48\n巨蟹座\n内蒙古出生大连长大，家在大连\n现居东京\n从事it行业\n喜欢旅游、看剧、美食。徒步爬山也可\n\n希望对方：\n最好身高180以上\n体重健康就行\n情绪稳定\n家庭和睦\n未婚未育\n有份稳定的工作\n如果是东北的、家是北方的离得近就更棒了\n\n目标：今年脱单！！！\n总跟小姐妹一起嘻嘻又哈哈，圈子小，\n认识不到什么男生，希望可以遇到合适的缘分。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/59bb1095-03c1-4eec-9534-8d95f652aa44',
+      bmi: 18.1,
+      hometown: '内蒙古出生大连长大，家在大连',
+      currentLocation: '东京',
+      occupation: 'it行业',
+      interests: const <String>['徒步', '爬山', '旅游', '追剧', '美食'],
+      interestIds: const <int>[11, 20, 3, 24, 5],
+      similarIds: const <String>['profile_women_100_88', 'profile_women_600_538', 'profile_women_600_504', 'profile_women_300_280', 'profile_women_500_478', 'profile_women_700_628', 'profile_women_200_108', 'profile_women_400_383', 'profile_women_200_136', 'profile_women_500_458'],
+    ),
+    Character(
+      id: 'profile_women_600_507',
+      gender: 'male',
+      age: 33,
+      height: 172,
+      mbti: 'INTJ-A',
+      rawText: '编号507\n\n【关于自己】\n出生年：1992\n出生地：辽宁\n现住 ：东京\n身高：172\n职业：IT\n收入：600+\nMBTI：INTJ-A\n爱好 ：看展，户外登山徒步（不定期更换）\n\n【希望对方】\n年龄：87～93年\n身高：>178、身材匀称\n希望对方性格积极乐观，有幽默感，责任感，有主见，有上进心，不抽烟。\n\n- （',
+      hometown: '辽宁',
+      currentLocation: '东京',
+      occupation: 'IT',
+      interests: const <String>['户外', '爬山', '徒步', '看展'],
+      interestIds: const <int>[1, 20, 11, 22],
+      similarIds: const <String>['profile_men_600_570', 'profile_men_400_375', 'profile_men_600_579', 'profile_men_400_360', 'profile_men_300_227', 'profile_men_300_295', 'profile_men_700_633', 'profile_men_100_57', 'profile_men_500_423', 'profile_women_400_380'],
+    ),
+    Character(
+      id: 'profile_women_600_504',
+      gender: 'male',
+      age: 32,
+      height: 165,
+      zodiac: '水瓶',
+      rawText: '编号504\n关于自己\n性别：女\n出生年：1993（属鸡，水瓶）\n出生地：黑龙江（12岁移居山东）\n现住：东京\n身高体重：165/55\n来日时间：2013年3月（高度人才签，申请永驻中）\n学历：日本的文教大学的本科➕大学院（明治大学院会计专门职）\n职业：税理士事务所\n年收：暂时目前550w➕\n爱好：健身，爬山，室内攀岩等。\n感情状态：未婚单身\n性格：幽默，自信，待人实在，大方，成熟，靠谱儿，情绪稳定，涵养性高，不吐脏话。\n家庭情况：父母和亲弟（亲弟在日本读书）\n烟酒：不抽不喝\n理想型：正常人。\n性格温柔，情绪稳定，成熟，靠谱，尽量幽默点。学历：至少大学本科。\n一份稳定的工作，性格内敛，轻微颜控，骨骼五官端正。\n身材匀称，瘦点更好。清爽感。真诚，实在，细心。更注重相处，内在的精神世界。懂得推己及人，不浮夸。\n未婚。\n不接受父母离异。\n不接受异地。\n不抽烟。可以小酌。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/2de5ad18-2371-4e2e-9f83-78430a131273',
+      bmi: 20.2,
+      hometown: '黑龙江',
+      currentLocation: '东京',
+      occupation: '税理士事务所',
+      interests: const <String>['健身', '室内攀岩等', '爬山'],
+      interestIds: const <int>[10, 459, 20],
+      maritalStatus: '未婚单身',
+      similarIds: const <String>['profile_women_300_240', 'profile_women_600_512', 'profile_women_600_594', 'profile_men_600_570', 'profile_men_600_552', 'profile_women_100_88', 'profile_women_500_485', 'profile_women_100_39', 'profile_women_600_587', 'profile_women_500_480'],
+    ),
+    Character(
+      id: 'profile_women_600_502',
+      gender: 'male',
+      age: 37,
+      height: 160,
+      zodiac: '处女',
+      mbti: 'ENFP',
+      rawText: '编号502\n籍贯：重庆\n性别：女\n身高：160\n出生年月：1988年9月\n来日时间：2012年8月\n签证种类：永住\n最终学历：修士\n所在单位：商社\n岗位性质：営業\n年收：800万以上\nENFP快乐的小狗\n\n喜欢：旅行，美食，画画，看展览\n羽毛球，动漫电影，追剧，\n探索新店新世界，对世界遗产感兴趣，\n和家人朋友相聚享受生活，\n享受在一起的点点滴滴的幸福时光\n\n自评：爱笑乐观开朗的重庆妹纸，\n独立自主努力上进，会享受生活，\n懂得沟通和感恩，喜欢小孩\n\n偏好：性格开朗，人品好，\n有担当有责任心上进心，\n懂得沟通交流，情绪稳定，\n两个人合得来，在一起相处舒服开心最重要，希望会照顾人更好😊\n\n[上一页](https://github.com/141801/info/blob/main/women_500.md)\n[下一页](https://github.com/141801/info/blob/main/women_700.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      image: 'https://github.com/user-attachments/assets/83c6d6cc-f605-441c-bfc3-8137760d7181',
+      hometown: '重庆',
+      currentLocation: '',
+      occupation: '商社営業',
+      interests: const <String>['动漫', '电影', '和家人朋友相聚享受生活', '对世界遗产感兴趣', '探索新店新世界', '旅游', '画画', '看展', '美食', '羽毛球'],
+      interestIds: const <int>[23, 4, 460, 461, 462, 3, 18, 22, 5, 40],
+      similarIds: const <String>['profile_women_700_606', 'profile_women_600_556', 'profile_men_400_339', 'profile_men_600_565', 'profile_women_500_459', 'profile_women_700_627', 'profile_women_500_421', 'profile_women_400_351', 'profile_women_100_76', 'profile_men_500_420'],
+    ),
+    Character(
+      id: 'profile_women_700_630',
+      gender: 'male',
+      age: 35,
+      height: 160,
+      zodiac: '巨蟹',
+      mbti: 'INFJ',
+      rawText: '编号630\n来日10余年，IT行业，东北人，infj巨蟹，身高160，90年，现千叶在住。\n有自信觉得自己不丑。😆\n以后也是打算常驻日本，不回国。\n平时喜欢跟朋友吃饭聊天。看剧。\n喜欢有山有水的日归。\n喜欢看海。\n尝试没做过的事。\n\n期望对方：\n工作稳定，170cm以上。年龄在88-93。（如果不显老的话可以适当放宽）年收600-700。最好有房。\n交友真诚，以结婚为前提的交往。看起来不臃肿，不显老。（因为自己真的不臃肿不显老😆）\n离异，离异有娃的有点困难。\n\n恋爱观：\n关于沟通的话\n俩个人还是聊的到一起，所谓同频，才能沟通的下去。\n希望对方心里戏不要太多，把话说清楚，至少不会彼此误会。\n关于真诚的话\n希望对方不钓鱼，选妃。\n如果跟我聊的还不错，觉得有发展可能，就不要养备胎了。\n因为在日本大家都很忙，也没那么多精力同时投入多份感情，养鱼的人不要过来啊～不要浪费彼此时间。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/2c428405-afbc-45bc-bab4-62bee6f1280a',
+      hometown: '东北',
+      currentLocation: '千叶',
+      occupation: 'IT',
+      interests: const <String>['尝试没做过的事', '有山有水的日归', '追剧', '看海', '跟朋友吃饭聊天'],
+      interestIds: const <int>[221, 463, 24, 304, 464],
+      similarIds: const <String>['profile_women_100_32', 'profile_women_400_398', 'profile_women_500_475', 'profile_men_100_83', 'profile_women_400_351', 'profile_women_500_459', 'profile_men_400_339', 'profile_women_300_299', 'profile_women_100_53', 'profile_women_400_326'],
+    ),
+    Character(
+      id: 'profile_women_700_629',
+      gender: 'male',
+      age: 26,
+      height: 163,
+      mbti: 'INFP',
+      rawText: '编号629\n基本信息 女\n出生：1999年\n身高体重：163cm / 46kg\n居住地：东京\n家乡：河南郑州\n学历：国内本科\n职业：学生\n性格：INFP，共情力强，有同理心，责任感强\n家庭：家庭合睦\n未来打算：未来会在日本长期工作生活\n兴趣：旅游\n习惯：不抽烟喝酒、无纹身、不良嗜好，感情经历简单\n\n希望你：\n年龄：1994-1999\n身高：175cm以上，体型正常。\n未婚未育，不抽烟，无不良嗜好，爱干净，有耐心，有责任心，不大男子主义，无暴力倾向，有问题及时沟通，家庭合睦。工作党和学生党都可以。\n希望可以聊到一起吃到一起玩到一起。\n未来在日本长期工作生活。两个人相互扶持理解信任。以结婚为前提认真交往。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/74ac470e-c157-4a06-86fb-79d47f9697d2',
+      bmi: 17.3,
+      hometown: '河南郑州',
+      currentLocation: '东京',
+      occupation: '学生',
+      interests: const <String>['旅游'],
+      interestIds: const <int>[3],
+      similarIds: const <String>['profile_women_200_186', 'profile_women_400_356', 'profile_women_700_621', 'profile_men_600_559', 'profile_men_600_591', 'profile_men_500_416', 'profile_men_300_207', 'profile_women_700_613', 'profile_women_600_545', 'profile_men_100_48'],
+    ),
+    Character(
+      id: 'profile_women_700_628',
+      gender: 'male',
+      age: 31,
+      height: 165,
+      rawText: '编号628\n1.昵称：欣欣\n2.性别：女\n3.出生年份：1994年\n4.家乡：上海\n5.身高体重：165cm/58kg\n6.学历：阪大本科\n7.居住地：东京23区\n8.工作：财务尽职调查（会计师），年收850+\n9.兴趣爱好：旅游，电影，徒步，悬疑推理，美食\n10.性格：乐观上进独立，情绪稳定\n11.择偶标准：身高170以上，出生1988年以后，\n真诚善良，有责任心，对待感情认真专一，最好是江浙沪或者南方人\n\n- （',
+      image: 'https://github.com/user-attachments/assets/224664e0-4e04-4fff-8dc2-066877e07ba2',
+      bmi: 21.3,
+      hometown: '上海',
+      currentLocation: '东京23区',
+      occupation: '财务尽职调查（会计师）',
+      interests: const <String>['徒步', '悬疑推理', '旅游', '电影', '美食'],
+      interestIds: const <int>[11, 465, 3, 4, 5],
+      similarIds: const <String>['profile_women_300_280', 'profile_women_500_480', 'profile_men_600_579', 'profile_men_400_338', 'profile_men_600_570', 'profile_women_100_88', 'profile_women_700_609', 'profile_women_200_159', 'profile_women_600_538', 'profile_men_700_634'],
+    ),
+    Character(
+      id: 'profile_women_700_627',
+      gender: 'male',
+      age: 37,
+      height: 162,
+      rawText: '编号627\n.性别：女\n.出生年份：1988，未婚\n.籍贯：上海\n.身高体重：162/55\n.学历：985本+C9 MBA\n.居住地：东京（2025年从上海relocate至东京）\n.工作：金融（年收1000w+）\n.兴趣爱好：健身、滑雪（初学）、旅行、烹饪\n.择偶标准：年龄±5岁，未育，有责任心、热爱生活、背景相似\n\n- （',
+      image: 'https://github.com/user-attachments/assets/d6496155-59df-4b00-b237-d2ec28f147e1',
+      bmi: 21.0,
+      hometown: '上海',
+      currentLocation: '东京',
+      occupation: '金融',
+      interests: const <String>['健身', '旅游', '滑雪', '做饭'],
+      interestIds: const <int>[10, 3, 14, 29],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_400_353', 'profile_women_500_459', 'profile_women_500_494', 'profile_men_300_288', 'profile_women_600_524', 'profile_women_600_558', 'profile_women_200_137', 'profile_women_500_453', 'profile_men_100_2', 'profile_women_300_262'],
+    ),
+    Character(
+      id: 'profile_women_700_621',
+      gender: 'male',
+      age: 28,
+      height: 168,
+      rawText: '编号621\n\n.性别：女\n.出生年份：1997/03/09\n.籍贯：长春\n.身高体重：168/ 55\n.学历：本科\n.居住地：东京\n.工作：舞蹈老师\n.兴趣爱好（方便找共同点)：游泳，运动，逛街，\n.择偶标准：\n我的性格比较直接，也很开朗。\n希望对方不大男子主义，不妈宝男，不冷暴力是前提。\n脾气好，希望你底色就是个很好的人。\n而不是最开始装出来的样子。\n希望两个人相处能合得来，舒适。\n物质：在日本的基本保障，房，车要有。\n年收800以上\n\n- （',
+      bmi: 19.5,
+      hometown: '长春',
+      currentLocation: '东京',
+      occupation: '舞蹈老师',
+      interests: const <String>['游泳', '运动', '逛街'],
+      interestIds: const <int>[19, 6, 9],
+      similarIds: const <String>['profile_men_100_7', 'profile_women_700_614', 'profile_men_600_509', 'profile_women_500_480', 'profile_men_500_416', 'profile_women_500_476', 'profile_men_200_167', 'profile_women_400_356', 'profile_women_500_448', 'profile_women_700_613'],
+    ),
+    Character(
+      id: 'profile_women_700_619',
+      gender: 'male',
+      age: 32,
+      height: 158,
+      rawText: '编号619\n•河南人，在东京，93年 158 48kg\n•性格不是开朗活泼型 比较温柔吧 情绪稳定（只要对方不找茬）恋爱关系中会比较黏人\n•国内大学毕业\n•工作稳定 年收500出头\n•社交圈很小很干净，生活基本就是上班，瑜伽，和固定好朋友出去玩 宅家的话追剧 看书 运动\n•喜欢羽毛球 滑雪 散步 瑜伽\n•原生家庭普通但也合睦幸福 父母体制内都有退休金 无负担\n\n希望对方：\n•170以上 可以不帅但别邋遢\n•有担当 有责任心 善良 真诚 •性格能互补的话那最好了\n•工作稳定 年收500以上\n•为了健康着想，希望有运动的习惯\n•是比较主动的人\n•能一起逛超市 探小店 做好吃的 散步 运动 看书 旅行～\n·有一只猫 希望对方也喜欢猫 喜欢小动物！\n\n- （',
+      image: 'https://github.com/user-attachments/assets/bdd45337-f716-4885-9a2d-287ed6c864f6',
+      bmi: 19.2,
+      hometown: '河南',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['散步', '滑雪', '瑜伽', '阅读', '羽毛球', '运动', '追剧'],
+      interestIds: const <int>[47, 14, 350, 25, 40, 6, 24],
+      similarIds: const <String>['profile_women_400_335', 'profile_women_200_134', 'profile_men_500_457', 'profile_women_400_383', 'profile_men_300_291', 'profile_women_600_587', 'profile_women_200_159', 'profile_women_300_260', 'profile_women_100_42', 'profile_women_400_377'],
+    ),
+    Character(
+      id: 'profile_women_700_616',
+      gender: 'male',
+      age: 33,
+      height: 154,
+      zodiac: '处女座',
+      mbti: 'ISFP',
+      rawText: '编号616\n\n洛阳人 现居东京\n1992 154/56（努力减肥中）\n高考结束来日本\n大学march，毕业后进IT咨询搬砖\n处女座ISFP 人多的时候比较i，熟人面前是搞笑女😄\n喜欢猫猫狗狗，家里有一只六岁英短\n喜欢美食，旅游，探店，看电影\n性格随和，朋友都觉得我属于好说话的人😂\n不抽烟不喝酒\n\n希望男生\n有稳定工作，性格阳光开朗，i人e人都ok\n清爽干净，不抽烟，适度饮酒，无不良嗜好，\n家庭氛围和睦\n可以一起发展兴趣爱好，一起旅游\n\n- （',
+      bmi: 23.6,
+      hometown: '洛阳',
+      currentLocation: '东京',
+      occupation: 'IT咨询',
+      interests: const <String>['喜欢猫猫狗狗', '美食', '旅游', '电影'],
+      interestIds: const <int>[466, 5, 3, 4],
+      similarIds: const <String>['profile_women_600_587', 'profile_women_400_367', 'profile_women_700_602', 'profile_women_300_260', 'profile_men_500_457', 'profile_women_500_421', 'profile_women_100_76', 'profile_women_500_459', 'profile_women_700_628', 'profile_women_500_475'],
+    ),
+    Character(
+      id: 'profile_women_700_615',
+      gender: 'male',
+      age: 0,
+      height: 168,
+      zodiac: '双子座',
+      mbti: 'INFJ',
+      rawText: '编号615\n自我介绍\n30代，身高168，体重55，黑龙江人。\nmbti是infj，双子座，性格属于温柔系。\n平时休息时候做瑜伽，冬天滑雪，偶尔打羽毛球，最近开始学网球。\nIT工作，圈子干净，平时不忙，大部分在宅。\n很少加班，年收700+\n\n对另一半的要求\n希望你也30代，身高175+，体重匀称。\n性格的话，喜欢果断爷们一点的男生。能接受姐弟恋。\n希望你工作认真，有上进心，年收550+，有结婚打算。\n\n- （',
+      image: 'https://github.com/user-attachments/assets/944f8cd8-7ea3-423c-8315-9d9070d612f8',
+      bmi: 19.5,
+      hometown: '黑龙江',
+      currentLocation: '',
+      occupation: 'IT',
+      interests: const <String>['滑雪', '瑜伽', '网球', '羽毛球'],
+      interestIds: const <int>[14, 350, 112, 40],
+      similarIds: const <String>['profile_women_100_29', 'profile_men_100_95', 'profile_men_100_91', 'profile_men_100_63', 'profile_men_200_129', 'profile_men_200_104', 'profile_women_100_73', 'profile_women_100_16', 'profile_women_500_409', 'profile_men_100_4'],
+    ),
+    Character(
+      id: 'profile_women_700_614',
+      gender: 'male',
+      age: 29,
+      height: 170,
+      mbti: 'INFJ-T',
+      rawText: '编号614\n\n基本信息 女\n出生：1996年\n身高体重：170cm / 62kg\n居住地：东京-千叶交界\n家乡：安西省会\n学历：国内211-日本国立Top硕士\n职业：IT大手 650W＋\n性格：熟人面前话多，有同理心，INFJ-T，责任感强\n家庭：独生女，家庭和睦，父母开明\n未来打算：计划留日永住申请中，希望以结婚为前提认真交往，合适的话1年内结婚\n兴趣：骑车、网球、听歌唱歌、吉他入门中（有钢琴基础）\n习惯：不抽烟、偶尔喝酒、无纹身、不良嗜好，感情经历简单\n\n希望你：\n年龄：比我大不超5岁，小不超2岁\n身高：170cm以上，体型不太胖\n生活习惯：不抽烟，无不良嗜好，感情经历简单\n工作：Base东京正社员，年收600W＋\n性格品质：愿倾听沟通，有责任心\n背景：城市独生子\n相处方式：三观契合，能聊能侃，互相鼓劲成长。\n不丁克\n\n如你一样认真对待感情，我们可以聊聊 🙂\n\n- （',
+      bmi: 21.5,
+      hometown: '安西省会',
+      currentLocation: '东京-千叶交界',
+      occupation: 'IT大手',
+      interests: const <String>['吉他', '钢琴', '音乐', '唱歌', '网球', '骑行'],
+      interestIds: const <int>[27, 17, 7, 8, 112, 54],
+      similarIds: const <String>['profile_men_600_509', 'profile_women_600_594', 'profile_men_100_59', 'profile_men_300_216', 'profile_men_100_35', 'profile_men_600_555', 'profile_men_100_81', 'profile_women_500_448', 'profile_women_500_480', 'profile_men_200_125'],
+    ),
+    Character(
+      id: 'profile_women_700_613',
+      gender: 'male',
+      age: 30,
+      height: 169,
+      zodiac: '白羊',
+      mbti: 'ISTJ',
+      rawText: '编号613\n.出生年份：95年白羊座\n.籍贯：江苏南通\n.身高体重：169cm 49kg\n.学历：日本top研究生，本科国内985\n.居住地：东京，前两年在公司附近买了房子（有贷款）\n.工作：大手日企，收入800+\n.兴趣爱好（方便找共同点)：徒步，登山，羽毛球，书法，看展，喝茶，无任何不良嗜好，mbti是istj\n.择偶标准：人品好，三观正，有责任心，年龄不限相近更好，\n生活习惯良好，无不良嗜好，不抽烟，不丁克，\n互相尊重，性格稳重认真对待感情。\n有稳定工作，希望可以像朋友一样相处\n\n- （',
+      image: 'https://github.com/user-attachments/assets/60bf04eb-31a3-400b-b278-01b7d9218d91',
+      bmi: 17.2,
+      hometown: '江苏南通',
+      currentLocation: '东京',
+      occupation: '大手日企',
+      interests: const <String>['书法', '喝茶', '徒步', '爬山', '看展', '羽毛球'],
+      interestIds: const <int>[0, 32, 11, 20, 22, 40],
+      hasHouse: true,
+      similarIds: const <String>['profile_women_500_478', 'profile_women_400_356', 'profile_women_600_538', 'profile_women_600_512', 'profile_men_600_579', 'profile_women_100_88', 'profile_women_700_621', 'profile_men_100_51', 'profile_women_300_280', 'profile_men_300_249'],
+    ),
+    Character(
+      id: 'profile_women_700_611',
+      gender: 'male',
+      age: 33,
+      height: 170,
+      rawText: '编号611\n💫【关于我】\n📍 基本信息\n出生年份：1992年\n籍贯：青岛\n身高 / 体重：170cm / 80kg+\n现居地：日本东京市区 永住申请中\n职业：IT开发\n年收入：约700万日元\n学历：本科毕业\n婚姻状况：未婚\n家庭成员：父母、妹妹\n性格特点：稳重踏实、有责任感、注重沟通和成长（欢迎了解更多）\n\n💖【希望的你】\n身高：180cm以上，外貌自然得体\n职业：正社员，有稳定收入（年收800万日元以上）\n情绪稳定：成熟有担当，能理性处理问题\n生活习惯：无不良嗜好，社交圈简单清爽\n学历 / 婚姻状况：本科及以上学历，未婚\n价值观：认真对待两性关系，愿与伴侣携手成长、互相支持\n\n- （',
+      image: 'https://github.com/user-attachments/assets/774be191-2d7e-4e62-a23e-3656baf374a9',
+      bmi: 27.7,
+      hometown: '青岛',
+      currentLocation: '日本东京市区',
+      occupation: 'IT开发',
+      interests: const <String>[],
+      interestIds: const <int>[],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_men_200_128', 'profile_men_300_257', 'profile_men_200_182', 'profile_men_400_307', 'profile_men_500_479', 'profile_men_600_522', 'profile_men_600_570', 'profile_men_200_161', 'profile_men_300_201', 'profile_men_500_441'],
+    ),
+    Character(
+      id: 'profile_women_700_609',
+      gender: 'male',
+      age: 31,
+      height: 167,
+      zodiac: '狮子座',
+      rawText: '编号609\n94年狮子座，\n身高167cm，略有点圆润。\n辽宁大连人，现在定居东京\n有稳定的工作。\n生活状态：\n平时最喜欢的就是旅行，喜欢去那些人少安静的小岛看海\n家里有一只7岁的猫咪，打算一直陪它养老（无弃养打算）\n\n希望对方：\n有稳定的工作，身高比我高一些，体型不要太瘦（不然会有种不该有的保护欲）\n不抽烟最好，偶尔喝点小酒可以（最好能带我一起喝）但不能酗酒～\n希望你也喜欢小动物，能接受猫狗。\n最重要的一点：拒绝懒人！\n\n- （',
+      image: 'https://github.com/user-attachments/assets/3f69b36f-4e52-41d5-ab64-9b03f256b6b9',
+      hometown: '辽宁大连',
+      currentLocation: '东京',
+      occupation: '',
+      interests: const <String>['宠物', '旅游', '看海'],
+      interestIds: const <int>[26, 3, 304],
+      similarIds: const <String>['profile_women_300_280', 'profile_men_600_570', 'profile_women_500_480', 'profile_women_400_387', 'profile_men_600_579', 'profile_women_700_628', 'profile_men_300_227', 'profile_women_400_354', 'profile_men_100_4', 'profile_men_300_216'],
+    ),
+    Character(
+      id: 'profile_women_700_608',
+      gender: 'male',
+      age: 32,
+      height: 161,
+      rawText: '编号608\n性别‬： 女\n最高学历:本科，在日本9年，工龄6年，医疗工作签\n出生日期：1993,10月\n婚姻况状‬：未婚\n职业：正看护士\n祖籍：河南漯河市\n年收入:400万日元以上\n目前工作所区在‬域：大阪府大阪市（可以调整）\n兴趣爱好：瑜伽，料理，大自然\n身高：161cm\n体重：51k\n目前居住区地‬：日本大阪府大阪市\n家庭员人‬：父母 经商 弟弟从事网络工作 ，家庭和睦\n本人性格：性格开朗，随和，没有不良嗜好。\n择偶标准:情绪稳定，人品好，工作稳定！没有不良嗜好！\n\n- （',
+      image: 'https://github.com/user-attachments/assets/f772d683-b933-46fd-940b-24e88e2355a8',
+      bmi: 19.7,
+      hometown: '河南漯河市',
+      currentLocation: '日本大阪府大阪市',
+      occupation: '正看护士',
+      interests: const <String>['户外', '做饭', '瑜伽'],
+      interestIds: const <int>[1, 29, 350],
+      maritalStatus: '未婚',
+      similarIds: const <String>['profile_women_500_475', 'profile_women_300_202', 'profile_women_700_619', 'profile_women_500_458', 'profile_women_200_191', 'profile_women_400_383', 'profile_women_700_615', 'profile_women_500_490', 'profile_men_100_8', 'profile_women_100_29'],
+    ),
+    Character(
+      id: 'profile_women_700_606',
+      gender: 'male',
+      age: 38,
+      height: 165,
+      rawText: '编号606\n\n87年辽宁大连人\n有过一段六年的婚姻\n女儿在国内\n目前人在大阪\n签证特定一号\n国内统招大专学历\n身高165 长相普通且平凡\n性格温柔文静不张扬\n兴趣爱好: 动漫、旅行、艺术展、歌舞剧、研究美食、爬山、各种球类、桌游数独等等。\n希望对方性格稳定，兴趣相投，三观相似\n\n- （',
+      hometown: '辽宁大连',
+      currentLocation: '大阪',
+      occupation: '',
+      interests: const <String>['动漫', '各种球类', '旅游', '桌游', '歌舞剧', '爬山', '美食', '看展'],
+      interestIds: const <int>[23, 467, 3, 39, 468, 20, 5, 22],
+      maritalStatus: '离婚',
+      similarIds: const <String>['profile_men_400_339', 'profile_women_600_502', 'profile_women_400_369', 'profile_women_600_556', 'profile_men_500_420', 'profile_women_300_242', 'profile_men_100_71', 'profile_men_600_565', 'profile_men_200_109', 'profile_men_100_2'],
+    ),
+    Character(
+      id: 'profile_women_700_602',
+      gender: 'male',
+      age: 35,
+      height: 157,
+      rawText: '编号602\n\n基本信息\n⚫︎出生年月：1990\n⚫︎身高体重：157/49\n⚫︎职业：IT程序员\n⚫︎现居住地：东京都\n⚫︎户籍：辽宁大连\n\n性格\n⚫︎温和型，不吵不闹不尬聊\n⚫︎内向七分外向三分（熟了之后可能会放飞）\n⚫︎ 理性和感性五五开，左脑和右脑和平共处\n⚫︎ 责任心+共情力+靠谱\n⚫︎ 擅长倾听，也擅长让人安心\n\n兴趣爱好\n︎⚫︎追剧，看综艺（边吃边看边笑，三不误）\n⚫︎听歌（歌单丰富，边听边唱）\n⚫︎和朋友逛街（填饱肚子才能逛）\n⚫︎偶尔旅行，远足，摄影（又菜又爱拍，只要拍的够多总会出片的）\n\n期待对方\n⚫︎不需要多高多瘦，但最好体型匀称\n⚫︎不抽烟，可少量饮酒\n⚫︎虽然本人没有那么爱聊天，但希望TA喜欢聊天\n⚫︎细节控\n⚫︎如果能句句有回应，事事有着落，那就上大分了\n⚫︎正向表达，不逃避沟通，共同面对\n\n[上一页](https://github.com/141801/info/blob/main/women_600.md)\n[返回导航页](https://github.com/141801/info/blob/main/tinder.md)',
+      bmi: 19.9,
+      hometown: '辽宁大连',
+      currentLocation: '东京都',
+      occupation: 'IT程序员',
+      interests: const <String>['旅游', '音乐', '逛街', '摄影', '看综艺', '远足', '追剧'],
+      interestIds: const <int>[3, 7, 9, 2, 469, 470, 24],
+      similarIds: const <String>['profile_women_600_587', 'profile_men_500_457', 'profile_women_500_459', 'profile_women_400_377', 'profile_women_400_383', 'profile_women_500_485', 'profile_women_300_262', 'profile_women_600_558', 'profile_women_300_260', 'profile_women_500_467'],
+    ),
+  ];
+}
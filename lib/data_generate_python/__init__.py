@@ -3,19 +3,32 @@ Dating App Data Processing Pipeline
 A comprehensive Python pipeline to process dating profile data using DeepSeek API
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Dating App Data Team"
 
-# Main components
-from .deepseek_data_processor import DeepSeekProcessor, ProcessedPerson
-from .csv_to_flutter_converter import FlutterDataConverter
-from .data_pipeline import DataPipeline
-from .batch_processor import BatchProcessor
-
-__all__ = [
-    "DeepSeekProcessor",
-    "ProcessedPerson",
-    "FlutterDataConverter",
-    "DataPipeline",
-    "BatchProcessor",
-]
+# Main components, imported lazily on first attribute access so that
+# importing the package does not pull in pandas or requests
+_EXPORTS = {
+    "DeepSeekProcessor": "deepseek_data_processor",
+    "ProcessedPerson": "deepseek_data_processor",
+    "FlutterDataConverter": "csv_to_flutter_converter",
+    "DataPipeline": "data_pipeline",
+    "RawDataManifest": "raw_data_manifest",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so __getattr__ is only hit once
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,286 @@
+"""
+Flutter Asset Builder
+Hash-gated prebuild step: rebuilds the Flutter JSON from cached extractions,
+and the app's generated Dart data module and search index from the JSON, only
+when one of their inputs changed, without touching the network
+"""
+
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+if __package__:
+    from .deepseek_data_processor import SYSTEM_PROMPT
+    from .raw_data_manifest import RawDataManifest
+    from .image_cache import DEFAULT_INDEX as DEFAULT_IMAGE_INDEX, ImageCache
+else:
+    from deepseek_data_processor import SYSTEM_PROMPT
+    from raw_data_manifest import RawDataManifest
+    from image_cache import DEFAULT_INDEX as DEFAULT_IMAGE_INDEX, ImageCache
+
+current_dir = Path(__file__).parent
+project_root = current_dir.parent.parent
+
+# Bump when the meaning of cached extractions changes without a code change
+PIPELINE_VERSION = "1"
+
+DATA_PATTERNS = ["men_*.md", "women_*.md"]
+
+# Source files whose contents define each fingerprint component
+PIPELINE_SOURCES = ["deepseek_data_processor.py", "data_pipeline.py"]
+CONVERTER_SOURCES = [
+    "csv_to_flutter_converter.py",
+    "interest_canonicalizer.py",
+    "interest_vocabulary.py",
+    "text_search_index.py",
+    "similar_profiles.py",
+    "compatibility_matcher.py",
+]
+
+DEFAULT_CSV = current_dir / "output" / "processed_dating_profiles.csv"
+DEFAULT_JSON = current_dir / "output" / "flutter_characters.json"
+DEFAULT_DART = project_root / "lib" / "data" / "generated_characters_data.dart"
+DEFAULT_SEARCH_INDEX = project_root / "assets" / "data" / "search_index.bin"
+DEFAULT_STAMP = current_dir / "output" / "prebuild_stamp.json"
+DEFAULT_VOCABULARY = current_dir / "output" / "interest_vocabulary.json"
+
+# Fingerprint components that invalidate the cached extractions themselves
+EXTRACTION_INPUTS = ["raw_data", "prompt", "pipeline_code"]
+# Fingerprint components the Flutter JSON is generated from
+JSON_INPUTS = ["converter", "extractions", "thumbnails"]
+
+
+def _sha256_files(paths: List[Path], salt: str = "") -> str:
+    digest = hashlib.sha256(salt.encode("utf-8"))
+    for path in paths:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def atomic_write_bytes(target: Path, data: bytes):
+    """Write bytes to a temp file next to the target, then rename over it"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+    os.replace(tmp_file, target)
+
+
+class AssetBuilder:
+    """Rebuild the Flutter character data only when its inputs changed"""
+
+    def __init__(
+        self,
+        raw_data_path=None,
+        csv_file=None,
+        json_file=None,
+        dart_file=None,
+        stamp_file=None,
+        vocabulary_file=None,
+        image_index_file=None,
+        search_index_file=None,
+    ):
+        self.raw_data_path = Path(raw_data_path or current_dir / "raw_data")
+        self.csv_file = Path(csv_file or DEFAULT_CSV)
+        self.json_file = Path(json_file or DEFAULT_JSON)
+        self.dart_file = Path(dart_file or DEFAULT_DART)
+        self.stamp_file = Path(stamp_file or DEFAULT_STAMP)
+        self.vocabulary_file = Path(vocabulary_file or DEFAULT_VOCABULARY)
+        self.image_index_file = Path(image_index_file or DEFAULT_IMAGE_INDEX)
+        self.search_index_file = Path(search_index_file or DEFAULT_SEARCH_INDEX)
+        self.manifest = RawDataManifest(self.raw_data_path)
+
+    def compute_fingerprints(self) -> Dict[str, str]:
+        """Hash every input of the asset: raw data, prompt, code and cache"""
+        self.manifest.refresh(DATA_PATTERNS)
+        raw_digest = hashlib.sha256()
+        for file_path in self.manifest.data_files(DATA_PATTERNS):
+            raw_digest.update(file_path.name.encode("utf-8"))
+            raw_digest.update(self.manifest.files[file_path.name]["sha256"].encode())
+
+        return {
+            "raw_data": raw_digest.hexdigest(),
+            "prompt": hashlib.sha256(SYSTEM_PROMPT.encode("utf-8")).hexdigest(),
+            "pipeline_code": _sha256_files(
+                [current_dir / name for name in PIPELINE_SOURCES], PIPELINE_VERSION
+            ),
+            "converter": _sha256_files(
+                [current_dir / name for name in CONVERTER_SOURCES]
+            ),
+            "extractions": (
+                _sha256_files([self.csv_file]) if self.csv_file.exists() else ""
+            ),
+            # Thumbnails are fetched by the network stage; here only the index
+            "thumbnails": (
+                _sha256_files([self.image_index_file])
+                if self.image_index_file.exists()
+                else ""
+            ),
+        }
+
+    def load_stamp(self) -> Dict[str, str]:
+        if not self.stamp_file.exists():
+            return {}
+        try:
+            with open(self.stamp_file, "r", encoding="utf-8") as f:
+                return json.load(f).get("fingerprints", {})
+        except (OSError, ValueError):
+            return {}
+
+    def save_stamp(self, fingerprints: Dict[str, str]):
+        data = {"fingerprints": fingerprints, "built_at": time.time()}
+        atomic_write_bytes(
+            self.stamp_file, json.dumps(data, indent=2).encode("utf-8")
+        )
+
+    def pending_profiles(self) -> List[str]:
+        """Profile ids present in raw_data but missing from the extraction cache"""
+        import csv
+
+        cached_ids = set()
+        if self.csv_file.exists():
+            with open(self.csv_file, "r", encoding="utf-8-sig", newline="") as f:
+                cached_ids = {row["id"] for row in csv.DictReader(f)}
+
+        pending = []
+        for file_path in self.manifest.data_files(DATA_PATTERNS):
+            pending.extend(
+                pid
+                for pid in self.manifest.profile_ids(file_path.name)
+                if pid not in cached_ids
+            )
+        return pending
+
+    def rebuild_json(self):
+        """Regenerate the Flutter JSON from the cached CSV (atomic replace)"""
+        if __package__:
+            from .csv_to_flutter_converter import FlutterDataConverter
+            from .similar_profiles import DEFAULT_K as SIMILAR_K
+        else:
+            from csv_to_flutter_converter import FlutterDataConverter
+            from similar_profiles import DEFAULT_K as SIMILAR_K
+
+        thumbnails = ImageCache(index_file=self.image_index_file).thumbnails()
+        # Streamed row by row; the file is replaced whole once written
+        return FlutterDataConverter(thumbnails).stream_character_data(
+            str(self.csv_file),
+            str(self.json_file),
+            str(self.vocabulary_file),
+            similar_k=SIMILAR_K,
+        )
+
+    def render_search_index(self, json_bytes: bytes) -> bytes:
+        """Build the full-text search index asset from the Flutter JSON"""
+        if __package__:
+            from .text_search_index import build_index_bytes
+        else:
+            from text_search_index import build_index_bytes
+
+        return build_index_bytes(json.loads(json_bytes.decode("utf-8")))
+
+    def render_dart(self, json_bytes: bytes) -> bytes:
+        """Render the generated Dart data module from the Flutter JSON"""
+        if __package__:
+            from .csv_to_flutter_converter import FlutterDataConverter
+        else:
+            from csv_to_flutter_converter import FlutterDataConverter
+
+        characters = json.loads(json_bytes.decode("utf-8"))
+        return FlutterDataConverter.render_dart_module(characters).encode("utf-8")
+
+    def publish(self, json_bytes: Optional[bytes] = None) -> List[str]:
+        """Write the app's Dart module and search index for the JSON
+
+        Files whose bytes would not change are left alone. Returns the
+        paths that were rewritten.
+        """
+        if json_bytes is None:
+            json_bytes = self.json_file.read_bytes()
+        rebuilt = []
+        # The app imports the data as a generated Dart module, and free-text
+        # search reads the index instead of scanning raw_text
+        for target, data in (
+            (self.dart_file, self.render_dart(json_bytes)),
+            (self.search_index_file, self.render_search_index(json_bytes)),
+        ):
+            if not target.exists() or target.read_bytes() != data:
+                atomic_write_bytes(target, data)
+                rebuilt.append(str(target))
+        return rebuilt
+
+    def build(self, force: bool = False) -> Dict[str, object]:
+        """Run the hash-gated build and report what was (re)built"""
+        start = time.perf_counter()
+        fingerprints = self.compute_fingerprints()
+        stamp = self.load_stamp()
+        changed = [key for key in fingerprints if stamp.get(key) != fingerprints[key]]
+
+        report = {
+            "changed": changed,
+            "rebuilt": [],
+            "pending_profiles": [],
+            # Cached rows were extracted with an older prompt or pipeline
+            "stale_extractions": bool(stamp)
+            and bool({"prompt", "pipeline_code"} & set(changed)),
+        }
+
+        outputs_exist = (
+            self.json_file.exists()
+            and self.dart_file.exists()
+            and self.search_index_file.exists()
+        )
+        if not force and not changed and outputs_exist:
+            report["elapsed_ms"] = (time.perf_counter() - start) * 1000
+            return report
+
+        if force or set(changed) & set(EXTRACTION_INPUTS):
+            # Extraction needs the API; only report what a full run would add
+            report["pending_profiles"] = self.pending_profiles()
+
+        if not self.csv_file.exists():
+            raise FileNotFoundError(f"No cached extractions at {self.csv_file}")
+
+        if force or set(changed) & set(JSON_INPUTS) or not self.json_file.exists():
+            report["profiles"] = self.rebuild_json()
+            report["rebuilt"].append(str(self.json_file))
+
+        report["rebuilt"].extend(self.publish())
+
+        self.save_stamp(fingerprints)
+        report["elapsed_ms"] = (time.perf_counter() - start) * 1000
+        return report
+
+
+def run_prebuild(force: bool = False, **paths) -> int:
+    """Prebuild entry point used by scripts/prebuild.py"""
+    builder = AssetBuilder(**paths)
+    try:
+        report = builder.build(force=force)
+    except Exception as e:
+        print(f"❌ Prebuild failed: {e}")
+        print("⚠️  Continuing with existing data...")
+        return 1
+
+    if not report["changed"] and not report["rebuilt"]:
+        print(f"✅ Flutter data up to date ({report['elapsed_ms']:.1f} ms)")
+        return 0
+
+    print(f"🔄 Changed inputs: {', '.join(report['changed']) or 'none'}")
+    for output in report["rebuilt"]:
+        print(f"   📁 Rebuilt: {output}")
+    if report["pending_profiles"]:
+        print(
+            f"⚠️  {len(report['pending_profiles'])} profiles have no cached "
+            "extraction; run data_pipeline.py to extract them"
+        )
+    if report["stale_extractions"]:
+        print(
+            "⚠️  Prompt or pipeline code changed since the cached extractions; "
+            "re-run data_pipeline.py to refresh them"
+        )
+    print(f"✅ Prebuild finished in {report['elapsed_ms']:.1f} ms")
+    return 0
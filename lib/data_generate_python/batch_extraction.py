@@ -0,0 +1,173 @@
+"""
+Batch Extraction
+Bulk extraction through the OpenAI-compatible batch API: pending profile
+blocks go into one JSONL request file, which is uploaded, submitted as an
+asynchronous job and polled; results are matched back by custom_id
+"""
+
+import os
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+current_dir = Path(__file__).parent
+DEFAULT_BATCH_DIR = current_dir / "output" / "batches"
+
+COMPLETION_WINDOW = "24h"
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchJobError(Exception):
+    """A batch API call failed or returned something unusable"""
+
+
+def write_batch_requests(
+    tasks: Iterable[Dict[str, Any]], output_file, processor, endpoint
+) -> int:
+    """Write one chat completion request per task in the batch JSONL format
+
+    The task id becomes the request's custom_id. Returns the request count.
+    """
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    url = urlparse(endpoint.url).path
+
+    count = 0
+    tmp_file = output_file.with_name(f".{output_file.name}.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        for task in tasks:
+            request = {
+                "custom_id": task["id"],
+                "method": "POST",
+                "url": url,
+                "body": processor.build_payload(task["content"], endpoint.model),
+            }
+            f.write(json.dumps(request, ensure_ascii=False) + "\n")
+            count += 1
+    os.replace(tmp_file, output_file)
+    return count
+
+
+def parse_batch_output(
+    lines: Iterable[str], parse_completion: Callable[[Dict[str, Any]], Dict[str, Any]]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """Split batch output/error lines into extracted fields and errors by custom_id"""
+    results: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, str] = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        custom_id = record["custom_id"]
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            error = record.get("error") or response.get("body", {}).get("error")
+            errors[custom_id] = str(error or f"HTTP {response.get('status_code')}")
+            continue
+        try:
+            extracted = parse_completion(response["body"])
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            errors[custom_id] = f"Unreadable API response: {e}"
+            continue
+        if extracted:
+            results[custom_id] = extracted
+        else:
+            errors[custom_id] = "No data extracted"
+    return results, errors
+
+
+class BatchClient:
+    """Files + batches endpoints of an OpenAI-compatible API"""
+
+    def __init__(self, endpoint, timeout: float = 60):
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def _request(self, method: str, path: str, **kwargs):
+        import requests
+
+        headers = {"Authorization": f"Bearer {self.endpoint.api_key}"}
+        try:
+            response = requests.request(
+                method,
+                f"{self.endpoint.api_root}{path}",
+                headers=headers,
+                timeout=self.timeout,
+                **kwargs,
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise BatchJobError(f"{method} {path} failed: {e}") from e
+        return response
+
+    def upload(self, jsonl_file) -> str:
+        """Upload a request file; return its file id"""
+        with open(jsonl_file, "rb") as f:
+            response = self._request(
+                "POST",
+                "/files",
+                data={"purpose": "batch"},
+                files={"file": (Path(jsonl_file).name, f, "application/jsonl")},
+            )
+        return response.json()["id"]
+
+    def create(self, input_file_id: str) -> Dict[str, Any]:
+        """Start a batch job over an uploaded request file"""
+        body = {
+            "input_file_id": input_file_id,
+            "endpoint": urlparse(self.endpoint.url).path,
+            "completion_window": COMPLETION_WINDOW,
+        }
+        return self._request("POST", "/batches", json=body).json()
+
+    def retrieve(self, batch_id: str) -> Dict[str, Any]:
+        return self._request("GET", f"/batches/{batch_id}").json()
+
+    def download(self, file_id: str) -> List[str]:
+        """Lines of an output or error file"""
+        return self._request("GET", f"/files/{file_id}/content").text.splitlines()
+
+    def wait(
+        self,
+        batch_id: str,
+        poll_interval: float = 60,
+        timeout: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> Dict[str, Any]:
+        """Poll until the job reaches a terminal status (or the timeout passes)"""
+        started = time.monotonic()
+        while True:
+            batch = self.retrieve(batch_id)
+            counts = batch.get("request_counts") or {}
+            print(
+                f"   ⏳ Batch {batch_id}: {batch['status']} "
+                f"({counts.get('completed', 0)}/{counts.get('total', '?')} done, "
+                f"{counts.get('failed', 0)} failed)"
+            )
+            if batch["status"] in TERMINAL_STATUSES:
+                return batch
+            if timeout is not None and time.monotonic() - started >= timeout:
+                return batch
+            sleep(poll_interval)
+
+    def results(
+        self, batch: Dict[str, Any], parse_completion
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """Extracted fields and errors by custom_id for a finished job
+
+        Expired or cancelled jobs still return the requests that completed.
+        """
+        lines: List[str] = []
+        for key in ("output_file_id", "error_file_id"):
+            if batch.get(key):
+                lines.extend(self.download(batch[key]))
+        return parse_batch_output(lines, parse_completion)
+
+
+def new_batch_file(batch_dir=None) -> Path:
+    """Timestamped path for a new request file"""
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return Path(batch_dir or DEFAULT_BATCH_DIR) / f"batch_{stamp}.jsonl"
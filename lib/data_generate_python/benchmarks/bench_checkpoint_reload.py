@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Checkpoint reload benchmark
+Compares resuming from the CSV export (old nested convert_csv_row path and
+the new person_from_csv_row) with the typed Parquet checkpoint, and the
+converter's DataFrame load from CSV vs Parquet
+
+Usage: python benchmarks/bench_checkpoint_reload.py [N]   (default 100000)
+"""
+
+import csv
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+
+from deepseek_data_processor import DeepSeekProcessor, ProcessedPerson
+from processed_store import (
+    load_processed_people,
+    person_from_csv_row,
+    save_to_parquet,
+)
+
+
+def legacy_convert_csv_row(row):
+    """The pre-Parquet resume parser from run_full_pipeline_with_retry"""
+    converted = {}
+    for key, value in row.items():
+        if value == "" or value == "None" or value is None:
+            converted[key] = None
+        elif key in ("age", "height_cm", "weight_kg") and value:
+            converted[key] = int(value) if str(value).isdigit() else None
+        elif key == "bmi" and value:
+            try:
+                converted[key] = float(value)
+            except (ValueError, TypeError):
+                converted[key] = None
+        elif key in ["has_house", "has_car"] and value:
+            converted[key] = str(value).lower() in ["true", "1", "yes"]
+        else:
+            converted[key] = value
+    return converted
+
+
+def build_people(count: int):
+    """Replicate the committed processed CSV up to `count` profiles"""
+    source = package_dir / "output" / "processed_dating_profiles.csv"
+    with open(source, "r", encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    people = []
+    for i in range(count):
+        row = dict(rows[i % len(rows)])
+        row["id"] = f"{row['id']}_{i}"
+        people.append(person_from_csv_row(row))
+    return people
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"   {label:<42} {elapsed * 1000:9.1f} ms")
+    return elapsed, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    import pandas as pd
+
+    print(f"📦 Checkpoint Reload Benchmark ({count:,} profiles)")
+    print("=" * 60)
+
+    people = build_people(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = Path(tmp, "profiles.csv")
+        parquet_file = Path(tmp, "profiles.parquet")
+        DeepSeekProcessor("test-key").save_to_csv(people, csv_file)
+        save_to_parquet(people, parquet_file)
+        print(
+            f"   CSV {csv_file.stat().st_size / 1e6:.1f} MB, "
+            f"Parquet {parquet_file.stat().st_size / 1e6:.1f} MB\n"
+        )
+
+        def legacy_resume():
+            with open(csv_file, "r", encoding="utf-8-sig", newline="") as f:
+                return [
+                    ProcessedPerson(**legacy_convert_csv_row(row))
+                    for row in csv.DictReader(f)
+                ]
+
+        def csv_resume():
+            with open(csv_file, "r", encoding="utf-8-sig", newline="") as f:
+                return [person_from_csv_row(row) for row in csv.DictReader(f)]
+
+        print("Resume (ProcessedPerson objects):")
+        legacy, _ = timed("CSV + nested convert_csv_row (old)", legacy_resume)
+        timed("CSV + person_from_csv_row", csv_resume)
+        parquet, loaded = timed(
+            "Parquet load_processed_people", lambda: load_processed_people(parquet_file)
+        )
+        assert len(loaded) == count
+
+        print("\nConverter input (DataFrame):")
+        read_csv, _ = timed("pd.read_csv", lambda: pd.read_csv(csv_file))
+        read_parquet, _ = timed("pd.read_parquet", lambda: pd.read_parquet(parquet_file))
+
+    print(f"\n✅ Resume {legacy / parquet:.1f}x faster, DataFrame load "
+          f"{read_csv / read_parquet:.1f}x faster from Parquet")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Checkpoint writer benchmark
+How long the request loop is held up per checkpoint: writing progress JSON
+and CSV inline (the old save_if_due) vs handing a snapshot to the
+background CheckpointWriter, for growing numbers of processed profiles
+
+Usage: python benchmarks/bench_checkpoint_writer.py [N ...]   (default 1000 10000 50000)
+"""
+
+import csv
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+
+from checkpoint_writer import CheckpointWriter
+from data_pipeline import DataPipeline
+from processed_store import person_from_csv_row
+
+
+def build_people(count: int):
+    """Replicate the committed processed CSV up to `count` profiles"""
+    source = package_dir / "output" / "processed_dating_profiles.csv"
+    with open(source, "r", encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    people = []
+    for i in range(count):
+        row = dict(rows[i % len(rows)])
+        row["id"] = f"{row['id']}_{i}"
+        people.append(person_from_csv_row(row))
+    return people
+
+
+def snapshot(people):
+    progress = {
+        "completed_profiles": [{"id": p.id, "timestamp": time.time()} for p in people],
+        "failed_profiles": [],
+        "last_updated": time.time(),
+    }
+    return {"progress": progress, "people": people}
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 50000]
+    pipeline = DataPipeline("bench-key")
+
+    print("💾 Checkpoint Writer Benchmark (loop stall per checkpoint)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_output = Path(tmp, "profiles.csv")
+        progress_file = str(Path(tmp, "progress.json"))
+
+        def write_checkpoint(state):
+            pipeline.save_progress(state["progress"], progress_file)
+            pipeline.processor.save_to_csv(state["people"], csv_output)
+
+        for count in counts:
+            people = build_people(count)
+            state = snapshot(people)
+
+            start = time.perf_counter()
+            write_checkpoint(state)
+            inline = time.perf_counter() - start
+
+            writer = CheckpointWriter(write_checkpoint)
+            start = time.perf_counter()
+            writer.submit(
+                {
+                    "progress": {
+                        **state["progress"],
+                        "completed_profiles": list(state["progress"]["completed_profiles"]),
+                    },
+                    "people": list(people),
+                }
+            )
+            handed_over = time.perf_counter() - start
+            writer.close()
+
+            print(
+                f"   {count:>7,} profiles: inline {inline * 1000:8.1f} ms, "
+                f"background {handed_over * 1000:6.2f} ms  ({inline / handed_over:,.0f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Compatibility scoring benchmark
+Top-k matches for N men x N women built from the committed profiles:
+a naive double loop over pair_score vs the blocked NumPy matcher, with
+pairs per second, peak RSS and the projected time for 100k x 100k.
+The naive loop only runs for the smaller sizes
+
+Usage: python benchmarks/bench_compatibility.py [N ...]   (default 300 2000 10000)
+"""
+
+import csv
+import resource
+import sys
+import time
+from pathlib import Path
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+
+from compatibility_matcher import CompatibilityMatcher
+from processed_store import person_from_csv_row
+
+NAIVE_LIMIT = 500
+FULL_SCALE = 100_000
+
+
+def build_people(count: int):
+    """`count` men and `count` women, replicated from the committed CSV"""
+    source = package_dir / "output" / "processed_dating_profiles.csv"
+    with open(source, "r", encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    people = []
+    for i in range(count):
+        for prefix in ("men", "women"):
+            row = dict(rows[(2 * i + (prefix == "women")) % len(rows)])
+            row["id"] = f"{prefix}_{i}"
+            people.append(person_from_csv_row(row))
+    return people
+
+
+def naive_top(matcher, k):
+    for i in range(len(matcher.men)):
+        scores = [(matcher.pair_score(i, j), -j) for j in range(len(matcher.women))]
+        sorted(scores, reverse=True)[:k]
+    for j in range(len(matcher.women)):
+        scores = [(matcher.pair_score(i, j), -i) for i in range(len(matcher.men))]
+        sorted(scores, reverse=True)[:k]
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [300, 2000, 10000]
+
+    print("💞 Compatibility Scoring Benchmark (top 10 per profile)")
+    print("=" * 60)
+
+    for count in counts:
+        matcher = CompatibilityMatcher(build_people(count), reference_year=2025)
+        pairs = count * count
+
+        start = time.perf_counter()
+        matcher.top_matches(k=10)
+        blocked = time.perf_counter() - start
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        projected = blocked / pairs * FULL_SCALE**2
+
+        line = (
+            f"   {count:>6,} x {count:<6,} blocked {blocked:7.2f} s "
+            f"({pairs / blocked / 1e6:5.1f}M pairs/s, peak RSS {peak_mb:.0f} MB, "
+            f"100k x 100k ≈ {projected / 3600:.1f} h)"
+        )
+        if count <= NAIVE_LIMIT:
+            start = time.perf_counter()
+            naive_top(matcher, 10)
+            naive = time.perf_counter() - start
+            line += f"; naive {naive:.2f} s ({naive / blocked:.0f}x slower)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Converter load benchmark
+Time and peak RSS of loading the processed CSV for growing row counts:
+pd.read_csv of every column with inferred dtypes, one Series per row (the
+old converter load) vs the converter's projected read of only the
+CHARACTER_FIELDS source columns, declared as text. Each run is a fresh
+process
+
+Usage: python benchmarks/bench_converter_load.py [N ...]   (default 10000 50000 100000)
+"""
+
+import csv
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+
+MODES = ["inferred", "projected"]
+
+
+def replicate_csv(target: Path, count: int):
+    """The committed CSV's rows repeated up to `count` rows, ids made unique"""
+    source = package_dir / "output" / "processed_dating_profiles.csv"
+    with open(source, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        rows = list(reader)
+    with open(target, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for i in range(count):
+            writer.writerow({**rows[i % len(rows)], "id": f"p{i}"})
+
+
+def child(mode: str, csv_file: str):
+    """Load every row once and print peak RSS (MB), time (s) and columns"""
+    import pandas as pd
+
+    from csv_to_flutter_converter import (
+        CHARACTER_FIELDS,
+        DEFAULT_CHUNK_SIZE,
+        _header_columns,
+        _read_row_chunks,
+    )
+
+    if mode == "projected":
+        needed = {"id"} | {column for _, column, _ in CHARACTER_FIELDS}
+        columns = [column for column in _header_columns(csv_file) if column in needed]
+    else:
+        columns = _header_columns(csv_file)
+
+    start = time.perf_counter()
+    if mode == "inferred":
+        df = pd.read_csv(csv_file)
+        rows = [df.iloc[i] for i in range(len(df))]
+    else:
+        rows = [
+            row
+            for chunk in _read_row_chunks(csv_file, DEFAULT_CHUNK_SIZE, columns)
+            for row in chunk
+        ]
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{peak_mb} {elapsed} {len(columns)} {len(rows)}")
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10000, 50000, 100000]
+
+    print("📥 Converter Load Benchmark (peak RSS / load time)")
+    print("=" * 60)
+    print(f"   {'rows':>8}  " + "  ".join(f"{mode:>24}" for mode in MODES) + "   saved")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in counts:
+            csv_file = Path(tmp, f"profiles_{count}.csv")
+            replicate_csv(csv_file, count)
+            results = {}
+            for mode in MODES:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", mode, str(csv_file)],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout.split()
+                results[mode] = (float(output[-4]), float(output[-3]), int(output[-2]))
+            csv_file.unlink()
+
+            cells = [
+                f"{peak:6.1f} MB {elapsed:6.2f} s ({columns:>2} col)"
+                for peak, elapsed, columns in results.values()
+            ]
+            (full_mb, full_s, _), (projected_mb, projected_s, _) = results.values()
+            print(
+                f"   {count:>8,}  " + "  ".join(f"{cell:>24}" for cell in cells)
+                + f"   {1 - projected_mb / full_mb:4.0%} RSS, {full_s / projected_s:4.1f}x faster"
+            )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:4])
+    else:
+        main()
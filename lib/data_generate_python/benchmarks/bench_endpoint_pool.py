@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Endpoint pool throughput benchmark
+Runs N local OpenAI-compatible stand-ins, each enforcing its own per-key
+rate limit and answering after a fixed latency, and measures extraction
+throughput through a pool of 1, 2, ... N of them
+
+Usage: python benchmarks/bench_endpoint_pool.py [REQUESTS] [ENDPOINTS]
+       (defaults: 120 requests, up to 4 endpoints)
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+
+from deepseek_data_processor import DeepSeekProcessor
+from endpoint_pool import Endpoint
+
+KEY_RATE_PER_SECOND = 20  # what each stand-in key allows
+LATENCY = 0.1  # seconds per completion
+
+
+def start_stand_in():
+    """A chat completions server that rejects requests above its key's rate
+
+    Like the hosted APIs it counts requests in a sliding window (one second
+    here, with a little slack for network jitter).
+    """
+    lock = threading.Lock()
+    state = {"recent": deque(), "rejected": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            with lock:
+                now = time.monotonic()
+                recent = state["recent"]
+                while recent and recent[0] <= now - 1.0:
+                    recent.popleft()
+                allowed = len(recent) < KEY_RATE_PER_SECOND + 2
+                if allowed:
+                    recent.append(now)
+                else:
+                    state["rejected"] += 1
+            if not allowed:
+                self.send_response(429)
+                self.send_header("Retry-After", "1")
+                self.end_headers()
+                return
+            time.sleep(LATENCY)
+            content = json.dumps({"height_cm": 170, "hobbies": "旅游"})
+            payload = json.dumps({"choices": [{"message": {"content": content}}]})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(payload.encode())
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1", state
+
+
+def run(servers, requests: int):
+    endpoints = [
+        Endpoint(
+            f"key-{i}",
+            url,
+            name=f"key-{i}",
+            max_requests_per_minute=KEY_RATE_PER_SECOND * 60,
+            max_concurrency=4,
+        )
+        for i, (_, url, _) in enumerate(servers)
+    ]
+    processor = DeepSeekProcessor("unused", endpoints=endpoints)
+    rejected_before = sum(state["rejected"] for _, _, state in servers)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=processor.pool.max_concurrency) as workers:
+        results = list(workers.map(processor.request_extraction, ["编号1"] * requests))
+    elapsed = time.perf_counter() - start
+
+    assert all(results)
+    rejected = sum(state["rejected"] for _, _, state in servers) - rejected_before
+    return elapsed, rejected
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    max_endpoints = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    print(f"🔑 Endpoint Pool Benchmark ({requests} requests)")
+    print(f"   Each key: {KEY_RATE_PER_SECOND} req/s, {LATENCY * 1000:.0f} ms latency")
+    print("=" * 60)
+
+    baseline = None
+    for count in range(1, max_endpoints + 1):
+        servers = [start_stand_in() for _ in range(count)]
+        try:
+            elapsed, rejected = run(servers, requests)
+        finally:
+            for server, _, _ in servers:
+                server.shutdown()
+        throughput = requests / elapsed
+        baseline = baseline or throughput
+        print(
+            f"   {count} endpoint(s): {elapsed:6.2f} s  {throughput:6.1f} req/s  "
+            f"({throughput / baseline:.1f}x, {rejected} rejected by servers)"
+        )
+
+
+if __name__ == "__main__":
+    main()
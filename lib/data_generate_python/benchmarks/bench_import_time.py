@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark
+Runs `python -X importtime` on the package entry points and reports the
+cumulative import time and whether pandas / requests were loaded
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+
+# The package lives in lib/data_generate_python, so import it from lib/
+package_dir = Path(__file__).resolve().parent.parent
+lib_dir = package_dir.parent
+
+TARGETS = [
+    "data_generate_python",
+    "data_generate_python.raw_data_manifest",
+    "data_generate_python.deepseek_data_processor",
+    "data_generate_python.data_pipeline",
+]
+
+
+def measure_import(module: str) -> dict:
+    """Import a module in a fresh interpreter and parse the -X importtime log"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=lib_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    loaded = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [part.strip() for part in line[len("import time:") :].split("|")]
+        if not parts[0].isdigit():
+            continue  # header line
+        loaded[parts[2].strip()] = int(parts[1])  # cumulative microseconds
+
+    return {
+        "module": module,
+        "total_ms": loaded.get(module, 0) / 1000,
+        "pandas": "pandas" in loaded,
+        "requests": "requests" in loaded,
+        "cwd_output": result.stdout.strip(),
+    }
+
+
+def main():
+    print("⏱️  Package Import-Time Benchmark")
+    print("=" * 60)
+
+    all_lean = True
+    for module in TARGETS:
+        stats = measure_import(module)
+        print(
+            f"   {stats['module']:<45} {stats['total_ms']:8.1f} ms  "
+            f"pandas={'yes' if stats['pandas'] else 'no'}  "
+            f"requests={'yes' if stats['requests'] else 'no'}"
+        )
+        if stats["pandas"] or stats["requests"] or stats["cwd_output"]:
+            all_lean = False
+
+    if all_lean:
+        print("\n✅ Extraction path imports without pandas, requests or output")
+    else:
+        print("\n❌ Heavy dependencies or prints leaked into import time")
+    return all_lean
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
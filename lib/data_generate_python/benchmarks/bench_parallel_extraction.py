@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Parallel extraction benchmark
+Runs run_parallel_pipeline against a local stand-in that answers after a
+fixed latency, with 1, 2, 4 and 8 worker processes. Throughput grows with
+the workers until the key's shared rate budget is the limit
+
+Usage: python benchmarks/bench_parallel_extraction.py [PROFILES] [RATE]
+       (defaults: 40 profiles, 20 requests/s allowed for the key)
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+
+from data_pipeline import DataPipeline
+from endpoint_pool import Endpoint
+
+LATENCY = 0.25  # seconds per completion
+
+
+def start_stand_in():
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(LATENCY)
+            content = json.dumps({"height_cm": 170, "hobbies": "旅游"})
+            payload = json.dumps({"choices": [{"message": {"content": content}}]})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(payload.encode())
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def run(url: str, profiles: int, rate: float, workers: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        raw = tmp / "raw_data"
+        raw.mkdir()
+        (raw / "men_1.md").write_text(
+            "".join(f"编号{i}\n身高170 爱好旅游\n\n" for i in range(1, profiles + 1)),
+            encoding="utf-8",
+        )
+        pipeline = DataPipeline(
+            "bench-key",
+            endpoints=[Endpoint("bench-key", url, max_requests_per_minute=rate * 60)],
+        )
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert pipeline.run_parallel_pipeline(
+                input_folder=str(raw),
+                csv_output=str(tmp / "out" / "profiles.csv"),
+                json_output=str(tmp / "out" / "characters.json"),
+                progress_file=str(tmp / "progress.json"),
+                workers=workers,
+                unit_size=5,
+                parts_dir=str(tmp / "parts"),
+            )
+        return time.perf_counter() - start
+
+
+def main():
+    profiles = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+
+    print(f"🧵 Parallel Extraction Benchmark ({profiles} profiles)")
+    print(f"   Key budget: {rate:.0f} req/s shared, {LATENCY * 1000:.0f} ms latency")
+    print("=" * 60)
+
+    server, url = start_stand_in()
+    try:
+        baseline = None
+        for workers in (1, 2, 4, 8):
+            elapsed = run(url, profiles, rate, workers)
+            throughput = profiles / elapsed
+            baseline = baseline or throughput
+            print(
+                f"   {workers} worker(s): {elapsed:6.2f} s  {throughput:5.1f} profiles/s  "
+                f"({throughput / baseline:.1f}x)"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
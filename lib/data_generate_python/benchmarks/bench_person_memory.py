@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+ProcessedPerson memory benchmark
+Builds N profiles the way run_full_pipeline_with_retry does (one parsed API
+response per profile) and compares peak RSS of the old dict-backed dataclass
+holding raw_text copies against the slotted, interned, RawTextRef version
+
+Usage: python benchmarks/bench_person_memory.py [N]   (default 100000)
+"""
+
+import gc
+import sys
+import json
+import random
+import resource
+import tempfile
+import subprocess
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+
+ZODIACS = ["白羊", "金牛", "双子", "巨蟹", "狮子", "处女", "天秤", "天蝎", "射手", "摩羯"]
+MBTIS = ["ENTJ", "INFP", "ISTJ", "ENFP", "INTJ", "ESFJ"]
+PLACES = ["东京", "千叶", "埼玉", "横滨", "大阪", "沈阳", "上海", "北京"]
+STATUSES = ["未婚", "离婚", "单身"]
+
+
+@dataclass
+class LegacyProcessedPerson:
+    """The pre-slots representation: per-instance __dict__, raw_text copies"""
+
+    id: str
+    raw_text: Optional[str] = None
+    gender: Optional[str] = None
+    birth_year: Optional[str] = None
+    age: Optional[int] = None
+    zodiac: Optional[str] = None
+    mbti: Optional[str] = None
+    height_cm: Optional[int] = None
+    weight_kg: Optional[int] = None
+    bmi: Optional[float] = None
+    hometown: Optional[str] = None
+    current_location: Optional[str] = None
+    education: Optional[str] = None
+    occupation: Optional[str] = None
+    annual_income: Optional[str] = None
+    hobbies: Optional[str] = None
+    personality: Optional[str] = None
+    has_house: Optional[bool] = None
+    has_car: Optional[bool] = None
+    marital_status: Optional[str] = None
+    partner_preferences: Optional[str] = None
+    self_introduction: Optional[str] = None
+
+
+def write_corpus(path: Path, count: int):
+    """Write a synthetic raw_data file with `count` profile blocks
+
+    Block byte ranges are written next to it, so the measured processes do
+    not pay for splitting a huge file before the baseline is taken.
+    """
+    rng = random.Random(42)
+    offsets = []
+    position = len("- (".encode("utf-8"))
+    with open(path, "wb") as f:
+        for i in range(count):
+            block = (
+                f"- (编号{i})\n```\n出生：{rng.randint(80, 99)}\n"
+                f"星座：{rng.choice(ZODIACS)}\n地区：{rng.choice(PLACES)}\n"
+                "自我介绍\n" + "你好，我是一个真诚、有责任感的人。" * 8 + "\n```\n\n"
+            ).encode("utf-8")
+            f.write(block)
+            offsets.append([str(i), position, position + len(block)])
+            position += len(block)
+    offsets[-1][2] -= len("- (".encode("utf-8"))  # last block runs to EOF
+
+    with open(path.with_suffix(".offsets.json"), "w", encoding="utf-8") as f:
+        json.dump(offsets, f)
+
+
+def api_response(rng: random.Random, i: int) -> str:
+    """A JSON document like the one the extraction API returns"""
+    return json.dumps(
+        {
+            "birth_year": str(rng.randint(1980, 1999)),
+            "zodiac": rng.choice(ZODIACS),
+            "mbti": rng.choice(MBTIS),
+            "height_cm": rng.randint(150, 190),
+            "weight_kg": rng.randint(45, 90),
+            "hometown": rng.choice(PLACES),
+            "current_location": rng.choice(PLACES),
+            "education": "大学",
+            "marital_status": rng.choice(STATUSES),
+        },
+        ensure_ascii=False,
+    )
+
+
+def run_child(mode: str, corpus: str, count: int):
+    """Build `count` people in this process and print the peak RSS in KB"""
+    from deepseek_data_processor import ProcessedPerson, RawTextRef
+
+    with open(Path(corpus).with_suffix(".offsets.json"), "r", encoding="utf-8") as f:
+        blocks = json.load(f)
+    gc.collect()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    rng = random.Random(7)
+    people = []
+    for i, (number, start, end) in enumerate(blocks):
+        info = json.loads(api_response(rng, i))
+        info["id"] = f"men_100_{number}"
+        info["gender"] = "male"
+        ref = RawTextRef(corpus, start, end)
+        if mode == "legacy":
+            info["raw_text"] = ref.load()  # a fresh copy of the block text
+            people.append(LegacyProcessedPerson(**info))
+        else:
+            info["raw_text"] = ref
+            people.append(ProcessedPerson(**info))
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"peak_kb": peak, "growth_kb": peak - baseline}))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"🧠 ProcessedPerson Memory Benchmark ({count:,} profiles)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(tmp, "men_100.md")
+        write_corpus(corpus, count)
+
+        results = {}
+        for mode in ["legacy", "compact"]:
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(corpus), str(count)],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            results[mode] = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"   {mode:<8} peak RSS {results[mode]['peak_kb'] / 1024:8.1f} MB  "
+                f"(+{results[mode]['growth_kb'] / 1024:.1f} MB for the people list)"
+            )
+
+    saved = results["legacy"]["growth_kb"] - results["compact"]["growth_kb"]
+    ratio = results["legacy"]["growth_kb"] / max(results["compact"]["growth_kb"], 1)
+    print(f"\n✅ Compact representation saves {saved / 1024:.1f} MB ({ratio:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    else:
+        main()
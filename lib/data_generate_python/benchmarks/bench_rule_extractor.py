@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Rule extractor benchmark
+Compares the original history/generate_data.py extract_person_info (30+
+full-text regex searches per block, kept in tests/test_rule_extractor.py as
+the parity reference) with the keyword-indexed rule extractor over every
+profile block in raw_data/, and checks both give the same fields
+
+Usage: python benchmarks/bench_rule_extractor.py [ROUNDS]   (default 5)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+sys.path.append(str(package_dir / "tests"))
+
+from rule_extractor import extract_person_info, split_blocks
+from test_rule_extractor import legacy_extract_person_info
+
+
+def load_blocks():
+    blocks = []
+    for md_file in sorted((package_dir / "raw_data").glob("*.md")):
+        blocks.extend(split_blocks(md_file.read_text(encoding="utf-8")))
+    return blocks
+
+
+def timed(label: str, func, blocks, rounds: int):
+    """Best of `rounds` passes over the corpus"""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for block in blocks:
+            func(block)
+        best = min(best, time.perf_counter() - start)
+    per_block = best / len(blocks) * 1e6
+    print(f"   {label:<34} {best * 1000:8.1f} ms  ({per_block:6.1f} µs/block)")
+    return best
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    blocks = load_blocks()
+
+    print(f"📝 Rule Extractor Benchmark ({len(blocks)} blocks, best of {rounds})")
+    print("=" * 60)
+
+    legacy = timed("legacy extract_person_info", legacy_extract_person_info, blocks, rounds)
+    indexed = timed("rule_extractor.extract_person_info", extract_person_info, blocks, rounds)
+
+    mismatches = sum(
+        legacy_extract_person_info(block) != extract_person_info(block) for block in blocks
+    )
+    print(f"\n   Blocks with different output: {mismatches}")
+    print(f"\n✅ Rule extractor {legacy / indexed:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
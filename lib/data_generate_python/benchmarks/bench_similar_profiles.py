@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Similar profiles benchmark
+Top 10 neighbours of every profile in a replicated dataset: the exact
+blocked search vs the approximate clustered search, with build time,
+recall@10 of the approximate search (a neighbour counts when it is no
+farther than the exact 10th) and peak RSS
+
+Usage: python benchmarks/bench_similar_profiles.py [N ...]   (default 10000 50000 100000)
+"""
+
+import json
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+
+from similar_profiles import SimilarProfiles
+
+K = 10
+
+
+def replicate_characters(count: int):
+    """The committed dataset's characters repeated up to `count`, ages jittered"""
+    with open(package_dir / "output" / "flutter_characters.json", "r", encoding="utf-8") as f:
+        characters = json.load(f)
+    rng = random.Random(0)
+    replicated = []
+    for i in range(count):
+        character = dict(characters[i % len(characters)], id=f"profile_{i}")
+        if character.get("age"):
+            character["age"] += rng.randint(-3, 3)
+        replicated.append(character)
+    return replicated
+
+
+def recall(profiles, exact, approximate) -> float:
+    vectors, squares = profiles.vectors, profiles.squares
+
+    def distances(i, row):
+        return (squares[i] + squares[row] - 2.0 * vectors[row] @ vectors[i]).round(6)
+
+    found = sum(
+        int((distances(i, a) <= distances(i, e).max()).sum())
+        for i, (a, e) in enumerate(zip(approximate, exact))
+    )
+    return found / exact.size
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10000, 50000, 100000]
+
+    print(f"🧭 Similar Profiles Benchmark (top {K} per profile)")
+    print("=" * 60)
+
+    for count in counts:
+        start = time.perf_counter()
+        profiles = SimilarProfiles(replicate_characters(count))
+        encode = time.perf_counter() - start
+
+        start = time.perf_counter()
+        exact = profiles.exact(K)
+        exact_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        approximate = profiles.approximate(K)
+        approximate_seconds = time.perf_counter() - start
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        print(
+            f"   {count:>7,} profiles: encode {encode:5.1f} s, exact {exact_seconds:6.1f} s, "
+            f"approximate {approximate_seconds:5.1f} s "
+            f"({exact_seconds / approximate_seconds:.1f}x, "
+            f"recall {recall(profiles, exact, approximate):.3f}), peak RSS {peak_mb:.0f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
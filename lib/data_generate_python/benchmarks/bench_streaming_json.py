@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON benchmark
+Peak RSS and time of the Flutter JSON conversion for growing CSVs: the
+in-memory csv_to_character_data (full DataFrame and list, one json.dump)
+vs stream_character_data (chunked rows, element-by-element writes), with
+indented and minified output. Each run is a fresh process
+
+Usage: python benchmarks/bench_streaming_json.py [N ...]   (default 1000 10000 100000)
+"""
+
+import csv
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+
+MODES = ["list", "stream", "stream-minified"]
+
+
+def replicate_csv(target: Path, count: int):
+    """The committed CSV's rows repeated up to `count` rows, ids made unique"""
+    source = package_dir / "output" / "processed_dating_profiles.csv"
+    with open(source, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        rows = list(reader)
+    with open(target, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for i in range(count):
+            writer.writerow({**rows[i % len(rows)], "id": f"p{i}"})
+
+
+def child(mode: str, csv_file: str, json_file: str):
+    """Run one conversion and print its peak RSS (MB) and time (s)"""
+    from csv_to_flutter_converter import FlutterDataConverter
+
+    converter = FlutterDataConverter()
+    start = time.perf_counter()
+    if mode == "list":
+        converter.csv_to_character_data(csv_file, json_file)
+    else:
+        converter.stream_character_data(csv_file, json_file, minify=mode == "stream-minified")
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{peak_mb} {elapsed}")
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+
+    print("🌊 Streaming JSON Benchmark (peak RSS / time per conversion)")
+    print("=" * 60)
+    print(f"   {'rows':>8}  " + "  ".join(f"{mode:>22}" for mode in MODES))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in counts:
+            csv_file = Path(tmp, f"profiles_{count}.csv")
+            replicate_csv(csv_file, count)
+            cells = []
+            for mode in MODES:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", mode, str(csv_file), str(Path(tmp, "out.json"))],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout.split()
+                peak_mb, elapsed = float(output[-2]), float(output[-1])
+                cells.append(f"{peak_mb:7.1f} MB {elapsed:7.2f} s")
+            csv_file.unlink()
+            print(f"   {count:>8,}  " + "  ".join(f"{cell:>22}" for cell in cells))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:5])
+    else:
+        main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Text search benchmark
+Free-text queries over a replicated dataset: the inverted index
+(TextSearchIndex.search, top 10) vs a linear scan of every profile's
+searchable text, already normalized and held in memory. Also reports
+index build time and size next to the dataset JSON
+
+Usage: python benchmarks/bench_text_search.py [N]   (default 100000)
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+package_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(package_dir))
+
+from text_search_index import (
+    TextSearchIndex,
+    build_index_bytes,
+    normalize,
+    query_terms,
+    searchable_text,
+)
+
+QUERIES = ["医疗", "埼玉", "猫", "东京 软件", "程序员", "entj", "不存在的词"]
+REPEATS = 5
+
+
+def replicate_characters(count: int):
+    """The committed dataset's characters repeated up to `count`, ids made unique"""
+    with open(package_dir / "output" / "flutter_characters.json", "r", encoding="utf-8") as f:
+        characters = json.load(f)
+    return [
+        {**characters[i % len(characters)], "id": f"profile_{i}"} for i in range(count)
+    ]
+
+
+def best_time(function) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    characters = replicate_characters(count)
+
+    print(f"🔎 Text Search Benchmark ({count:,} profiles)")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    data = build_index_bytes(characters)
+    build_seconds = time.perf_counter() - start
+    dataset_size = len(json.dumps(characters, ensure_ascii=False).encode("utf-8"))
+    index = TextSearchIndex(data)
+    print(
+        f"   index: {len(index.terms):,} terms, {len(data) / 2**20:.1f} MB "
+        f"(dataset {dataset_size / 2**20:.1f} MB), built in {build_seconds:.1f} s"
+    )
+
+    texts = [normalize(searchable_text(c)) for c in characters]
+
+    def scan(query):
+        terms = query_terms(query)
+        hits = [i for i, text in enumerate(texts) if all(term in text for term in terms)]
+        return hits[:10]
+
+    print(f"\n   {'query':<12} {'matches':>8} {'index':>10} {'scan':>10} {'speedup':>8}")
+    for query in QUERIES:
+        matches = len(index.match(query))
+        indexed = best_time(lambda: index.search(query, k=10))
+        scanned = best_time(lambda: scan(query))
+        print(
+            f"   {query:<12} {matches:>8,} {indexed * 1000:>8.2f}ms "
+            f"{scanned * 1000:>8.1f}ms {scanned / indexed:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
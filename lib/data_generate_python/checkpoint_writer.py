@@ -0,0 +1,99 @@
+"""
+Checkpoint Writer
+Writes pipeline checkpoints (progress JSON plus processed CSV) on a
+background thread, so the request loop hands over a snapshot and goes on
+dispatching instead of waiting for serialization and disk
+"""
+
+import threading
+from collections import Counter
+from typing import Any, Callable, Optional
+
+DEFAULT_MAX_COALESCED = 4
+
+
+class CheckpointWriter:
+    """One writer thread that always writes the newest snapshot
+
+    A snapshot submitted while another is still waiting replaces it (only
+    the latest state matters). If writes fall so far behind that
+    `max_coalesced` snapshots in a row were replaced, submit() waits for
+    the writer to take the pending one, which bounds how stale the file on
+    disk can get. Snapshots must not be changed after submit(): pass
+    copies of the lists the loop keeps appending to.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Any], None],
+        max_coalesced: int = DEFAULT_MAX_COALESCED,
+    ):
+        self._write = write
+        self.max_coalesced = max_coalesced
+        self.stats = Counter()
+        self.last_error: Optional[Exception] = None
+        self._condition = threading.Condition()
+        self._pending = None
+        self._has_pending = False
+        self._coalesced = 0  # snapshots replaced since the writer took one
+        self._writing = False
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="checkpoint-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, snapshot: Any):
+        """Queue a snapshot to be written; returns at once unless writes lag"""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("CheckpointWriter is closed")
+            if self._has_pending:
+                self._coalesced += 1
+                self.stats["coalesced"] += 1
+                if self._coalesced >= self.max_coalesced:
+                    # Backpressure: let the writer take the pending snapshot
+                    self.stats["waited"] += 1
+                    while self._has_pending:
+                        self._condition.wait()
+            self._pending = snapshot
+            self._has_pending = True
+            self.stats["submitted"] += 1
+            self._condition.notify_all()
+
+    def flush(self):
+        """Wait until every submitted snapshot is on disk"""
+        with self._condition:
+            while self._has_pending or self._writing:
+                self._condition.wait()
+
+    def close(self):
+        """Write what is pending and stop the thread (safe to call twice)"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._has_pending and not self._closed:
+                    self._condition.wait()
+                if not self._has_pending:
+                    return
+                snapshot, self._pending = self._pending, None
+                self._has_pending = False
+                self._coalesced = 0
+                self._writing = True
+                self._condition.notify_all()
+            try:
+                self._write(snapshot)
+                self.stats["written"] += 1
+            except Exception as e:
+                # The next snapshot tries again; the run itself goes on
+                self.last_error = e
+                self.stats["failed"] += 1
+                print(f"   ⚠️  Checkpoint write failed: {e}")
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
@@ -0,0 +1,130 @@
+"""
+Circuit Breaker
+Stops dispatching extraction requests during a provider outage and probes
+the endpoint (half-open) before letting traffic through again
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Error classes that indicate the endpoint itself is unhealthy
+TRIP_ERROR_CLASSES = {"server", "timeout", "network"}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the breaker is open"""
+
+    def __init__(self, retry_in: float):
+        super().__init__(f"Circuit open, next probe in {retry_in:.1f}s")
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with exponential open timeouts
+
+    closed -> open after `failure_threshold` consecutive unhealthy failures;
+    open -> half_open once the timeout passes, letting one probe through;
+    the probe's result closes the breaker or re-opens it for twice as long.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_reset_timeout: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.clock = clock
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.reset_timeout = reset_timeout
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.transitions: List[Dict[str, object]] = []
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str, reason: str):
+        self.transitions.append(
+            {
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "from": self.state,
+                "to": state,
+                "reason": reason,
+            }
+        )
+        print(f"🔌 Circuit breaker {self.state} → {state} ({reason})")
+        self.state = state
+
+    def retry_in(self) -> float:
+        """Seconds until a request may be sent (0 when closed or probing is due)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return 0.0
+            if self.state == HALF_OPEN:
+                # Another caller owns the probe; check back shortly
+                return 1.0 if self.probe_in_flight else 0.0
+            return max(0.0, self.opened_at + self.reset_timeout - self.clock())
+
+    def before_call(self):
+        """Admit a request or raise CircuitOpenError"""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            if self.state == OPEN:
+                remaining = self.opened_at + self.reset_timeout - self.clock()
+                if remaining > 0:
+                    raise CircuitOpenError(remaining)
+                self._transition(HALF_OPEN, "reset timeout elapsed, probing")
+            if self.probe_in_flight:
+                raise CircuitOpenError(1.0)
+            self.probe_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self.probe_in_flight = False
+            if self.state != CLOSED:
+                self._transition(CLOSED, "probe succeeded")
+                self.reset_timeout = self.base_reset_timeout
+
+    def record_failure(self, error_class: str) -> bool:
+        """Count a failure; return True if the breaker is open afterwards"""
+        with self._lock:
+            self.probe_in_flight = False
+            if error_class not in TRIP_ERROR_CLASSES:
+                # The endpoint answered; only the request was bad
+                if self.state == HALF_OPEN:
+                    self._transition(CLOSED, f"probe reached endpoint ({error_class})")
+                    self.reset_timeout = self.base_reset_timeout
+                self.consecutive_failures = 0
+                return False
+
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN:
+                self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+                self.opened_at = self.clock()
+                self._transition(OPEN, f"probe failed: {error_class}")
+            elif (
+                self.state == CLOSED
+                and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.opened_at = self.clock()
+                self._transition(
+                    OPEN,
+                    f"{self.consecutive_failures} consecutive {error_class} failures",
+                )
+            return self.state == OPEN
+
+    def report(self) -> Optional[List[Dict[str, object]]]:
+        """State transitions for the run report (None if it never tripped)"""
+        return list(self.transitions) or None
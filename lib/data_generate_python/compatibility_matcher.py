@@ -0,0 +1,519 @@
+"""
+Compatibility Matcher
+Parses the free-text partner_preferences of each profile into structured
+constraints and scores every men x women pair against them, both ways,
+with NumPy broadcasting over fixed-size blocks. Only the top-k matches of
+each profile are kept, so memory stays bounded for 100k x 100k pairs
+"""
+
+import datetime
+import json
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+if __package__:
+    from .deepseek_data_processor import ProcessedPerson
+else:
+    from deepseek_data_processor import ProcessedPerson
+
+DEFAULT_TOP_K = 10
+
+# Rows (preference holders) x columns (candidates) scored per block
+DEFAULT_BLOCK_SIZE = (512, 2048)
+
+# Scores are rounded to this many decimals; ties go to the earlier profile
+SCORE_DECIMALS = 6
+
+# How much each kind of constraint counts in a directional score
+CONSTRAINT_WEIGHTS = {
+    "age": 3.0,
+    "height": 2.0,
+    "bmi": 1.0,
+    "house": 1.0,
+    "car": 1.0,
+    "marital": 2.0,
+    "location": 2.0,
+}
+
+# Region -> keywords of current_location values in that region
+REGIONS = {
+    "东京": [
+        "东京", "東京", "都内", "23区", "新宿", "池袋", "涩谷", "涉谷", "品川",
+        "目黑", "大田", "蒲田", "江东", "足立", "板桥", "练马", "中野", "杉并",
+        "世田谷", "荒川", "日暮里", "龟户", "小岩", "八王子", "立川", "吉祥寺",
+        "港区",
+    ],
+    "埼玉": ["埼玉", "琦玉", "川口", "大宫", "浦和", "所泽", "蕨"],
+    "千叶": ["千叶", "千葉", "松户", "船桥", "市川", "成田"],
+    "神奈川": [
+        "神奈川", "横滨", "横浜", "川崎", "相模原", "藤泽", "平塚", "戸塚",
+    ],
+    "大阪": ["大阪"],
+    "京都": ["京都"],
+    "爱知": ["爱知", "名古屋"],
+    "福冈": ["福冈"],
+    "兵库": ["兵库", "神户"],
+}
+REGION_CODES = {region: code for code, region in enumerate(REGIONS)}
+# Names of several regions at once
+REGION_GROUPS = {
+    "关东": ["东京", "埼玉", "千叶", "神奈川"],
+    "一都三县": ["东京", "埼玉", "千叶", "神奈川"],
+    "关西": ["大阪", "京都", "兵库"],
+}
+
+# Never married / previously married, from marital_status
+NEVER_MARRIED, PREVIOUSLY_MARRIED = 1, 2
+
+BMI_NORMAL = (18.5, 25.0)
+HEIGHT_RANGE = (140, 210)
+AGE_RANGE = (18, 80)
+SIMILAR_AGE_SPAN = 5
+
+_NUMBER = r"(\d{1,2}|[一二三四五六七八九十])"
+_CHINESE_DIGITS = {c: i for i, c in enumerate("一二三四五六七八九十", start=1)}
+_DASH = r"\s*(?:-|~|〜|—|到|至)\s*"
+_AGE_RANGE_RE = re.compile(r"(\d{2})\s*岁?" + _DASH + r"(\d{2})\s*岁")
+_AGE_LABELLED_RE = re.compile(
+    r"(?:年龄|年纪)[^\d，。;]{0,6}(\d{2})" + _DASH + r"(\d{2})(?!\d|\s*年)"
+)
+_AGE_MAX_RE = re.compile(r"(\d{2})\s*岁\s*(?:或|及)?\s*以下")
+_AGE_MIN_RE = re.compile(r"(\d{2})\s*岁\s*(?:或|及)?\s*以上")
+_YEAR_RANGE_RE = re.compile(r"((?:19|20)?\d{2})\s*年?" + _DASH + r"((?:19|20)?\d{2})\s*年")
+_DECADE_RE = re.compile(r"(\d{2})后")
+_SIMILAR_AGE_RE = re.compile(r"(?:年龄|年纪)(?:相仿|相近|相当|差距不大|差不多)")
+_AGE_GAP_RE = re.compile(
+    r"(?:年龄|年纪)[^\d，。;]{0,4}(?:±|上下|差)\s*" + _NUMBER
+    + r"|上下\s*" + _NUMBER + r"\s*岁"
+)
+_HEIGHT_MIN_RE = re.compile(r"(?<![\d.])(1[4-9]\d|20\d)\s*(?:cm)?\s*(?:以上|\+)")
+_HEIGHT_MAX_RE = re.compile(r"(?<![\d.])(1[4-9]\d|20\d)\s*(?:cm)?\s*以下")
+_HEIGHT_SPAN_RE = re.compile(r"(\d{3})\s*(?:cm)?\s*±\s*(\d{1,2})")
+_BMI_RE = re.compile(r"bmi\s*(?:正常|标准)|(?:标准|正常)\s*bmi")
+_LOCAL_RE = re.compile(r"异地|同城")
+# A keyword in a clause with one of these is accepted, not required
+# ("不要求有房有车", "有没有房无所谓", "未婚或者离异")
+_RELAXED_RE = re.compile(r"不要求|不需要|无所谓|不介意|或|都可|均可|也可")
+_CLAUSE_SPLIT_RE = re.compile(r"[，,。；;！!？?\n]+")
+
+
+@dataclass
+class PartnerConstraints:
+    """What a profile asks of a partner; None means no requirement"""
+
+    min_age: Optional[float] = None
+    max_age: Optional[float] = None
+    min_height: Optional[float] = None
+    max_height: Optional[float] = None
+    min_bmi: Optional[float] = None
+    max_bmi: Optional[float] = None
+    needs_house: bool = False
+    needs_car: bool = False
+    never_married: bool = False
+    regions: int = 0  # bit mask of accepted REGION_CODES
+
+
+def _full_year(year: str) -> int:
+    value = int(year)
+    if value >= 100:
+        return value
+    return 2000 + value if value <= 30 else 1900 + value
+
+
+def region_of(location: Optional[str]) -> Optional[str]:
+    """Region of a current_location value, or None when it names none"""
+    if not location:
+        return None
+    for region, keywords in REGIONS.items():
+        if any(keyword in location for keyword in keywords):
+            return region
+    return None
+
+
+def marital_code(status: Optional[str]) -> int:
+    """NEVER_MARRIED, PREVIOUSLY_MARRIED or 0 when unknown"""
+    if not status:
+        return 0
+    if "离" in status or "丧" in status or "再婚" in status:
+        return PREVIOUSLY_MARRIED
+    if "未婚" in status or "单身" in status:
+        return NEVER_MARRIED
+    return 0
+
+
+def _requires(text: str, keyword: str) -> bool:
+    """Whether a clause asks for `keyword` rather than just accepting it"""
+    return any(
+        keyword in clause and not _RELAXED_RE.search(clause)
+        for clause in _CLAUSE_SPLIT_RE.split(text)
+    )
+
+
+def parse_preferences(
+    text: Optional[str],
+    own_age: Optional[int] = None,
+    own_location: Optional[str] = None,
+    reference_year: Optional[int] = None,
+) -> PartnerConstraints:
+    """Structured constraints found in a partner_preferences text
+
+    Ages come from age ranges and limits ("37岁以下"), birth-year ranges
+    ("88年～92年"), decades ("95后00后") and, relative to the profile's
+    own age, "年龄相仿" or "上下五岁"; heights from "170+" and "160 ± 10";
+    BMI, house, car, never married and same-region wishes from keywords
+    (house, car and never married only outside "不要求…" / "…无所谓" /
+    "…或…" clauses). Anything not recognised is not a constraint.
+    """
+    constraints = PartnerConstraints()
+    if not text:
+        return constraints
+    text = unicodedata.normalize("NFKC", text).lower()
+    year = reference_year or datetime.date.today().year
+
+    # Explicit ranges are alternatives (union); one-sided limits all apply
+    # ("20岁以上39岁以下" is 20-39), so they narrow the result
+    ages = []
+    age_floor = max((int(age) for age in _AGE_MIN_RE.findall(text)), default=None)
+    age_ceiling = min((int(age) for age in _AGE_MAX_RE.findall(text)), default=None)
+    for pattern in (_AGE_RANGE_RE, _AGE_LABELLED_RE):
+        for low, high in pattern.findall(text):
+            low, high = sorted((int(low), int(high)))
+            if AGE_RANGE[0] <= low and high <= AGE_RANGE[1]:
+                ages.append((low, high))
+    for first, last in _YEAR_RANGE_RE.findall(text):
+        born = sorted((_full_year(first), _full_year(last)))
+        ages.append((year - born[1], year - born[0]))
+    decades = [_full_year(decade) for decade in _DECADE_RE.findall(text)]
+    if decades:
+        ages.append((year - max(decades) - 9, year - min(decades)))
+    if own_age is not None:
+        for groups in _AGE_GAP_RE.findall(text):
+            gap = next(group for group in groups if group)
+            gap = _CHINESE_DIGITS.get(gap) or int(gap)
+            ages.append((own_age - gap, own_age + gap))
+        if _SIMILAR_AGE_RE.search(text):
+            ages.append((own_age - SIMILAR_AGE_SPAN, own_age + SIMILAR_AGE_SPAN))
+    low = min((low for low, _ in ages), default=None)
+    high = max((high for _, high in ages), default=None)
+    if age_floor is not None or age_ceiling is not None:
+        narrowed_low = max(low or AGE_RANGE[0], age_floor or AGE_RANGE[0])
+        narrowed_high = min(high or AGE_RANGE[1], age_ceiling or AGE_RANGE[1])
+        # Contradictory limits are ignored rather than matching nobody
+        if narrowed_low <= narrowed_high:
+            low, high = narrowed_low, narrowed_high
+    if low is not None:
+        constraints.min_age = float(low)
+        constraints.max_age = float(high)
+
+    heights = [int(h) for h in _HEIGHT_MIN_RE.findall(text)]
+    if heights:
+        constraints.min_height = float(min(heights))
+    heights = [int(h) for h in _HEIGHT_MAX_RE.findall(text)]
+    if heights:
+        constraints.max_height = float(max(heights))
+    for center, span in _HEIGHT_SPAN_RE.findall(text):
+        if HEIGHT_RANGE[0] <= int(center) <= HEIGHT_RANGE[1]:
+            constraints.min_height = float(int(center) - int(span))
+            constraints.max_height = float(int(center) + int(span))
+
+    if _BMI_RE.search(text):
+        constraints.min_bmi, constraints.max_bmi = BMI_NORMAL
+    constraints.needs_house = _requires(text, "有房")
+    constraints.needs_car = _requires(text, "有车")
+    constraints.never_married = _requires(text, "未婚")
+
+    regions = {region for region, keywords in REGIONS.items() if any(k in text for k in keywords)}
+    for group, members in REGION_GROUPS.items():
+        if group in text:
+            regions.update(members)
+    own_region = region_of(own_location)
+    if own_region and _LOCAL_RE.search(text):
+        regions.add(own_region)
+    for region in regions:
+        constraints.regions |= 1 << REGION_CODES[region]
+    return constraints
+
+
+def population_of(person: ProcessedPerson) -> Optional[str]:
+    """"male" or "female": from the raw data file (men_/women_), else gender"""
+    if person.id.startswith("women_"):
+        return "female"
+    if person.id.startswith("men_"):
+        return "male"
+    if person.gender in ("male", "男"):
+        return "male"
+    if person.gender in ("female", "女"):
+        return "female"
+    return None
+
+
+def _nan(value) -> float:
+    return float("nan") if value is None else float(value)
+
+
+class _Population:
+    """Column arrays of one side: attributes as candidates, constraints as seekers"""
+
+    def __init__(self, people: List[ProcessedPerson], reference_year: Optional[int]):
+        import numpy as np
+
+        self.ids = [person.id for person in people]
+        constraints = [
+            parse_preferences(
+                person.partner_preferences,
+                person.age,
+                person.current_location,
+                reference_year,
+            )
+            for person in people
+        ]
+        self.constraints = constraints
+
+        # Attributes (NaN when unknown)
+        self.age = np.array([_nan(p.age) for p in people])
+        self.height = np.array([_nan(p.height_cm) for p in people])
+        self.bmi = np.array([_nan(p.bmi) for p in people])
+        self.house = np.array([_nan(p.has_house) for p in people])
+        self.car = np.array([_nan(p.has_car) for p in people])
+        self.marital = np.array([marital_code(p.marital_status) for p in people])
+        self.region_bit = np.array(
+            [
+                1 << REGION_CODES[region] if region else 0
+                for region in (region_of(p.current_location) for p in people)
+            ],
+            dtype=np.int64,
+        )
+
+        # Constraints (-inf/inf bounds when only one side is given)
+        def bounds(low, high):
+            lows = [getattr(c, low) for c in constraints]
+            highs = [getattr(c, high) for c in constraints]
+            active = np.array([a is not None or b is not None for a, b in zip(lows, highs)])
+            lows = np.array([-np.inf if value is None else value for value in lows])
+            highs = np.array([np.inf if value is None else value for value in highs])
+            return active, lows, highs
+
+        self.age_bounds = bounds("min_age", "max_age")
+        self.height_bounds = bounds("min_height", "max_height")
+        self.bmi_bounds = bounds("min_bmi", "max_bmi")
+        self.needs_house = np.array([c.needs_house for c in constraints])
+        self.needs_car = np.array([c.needs_car for c in constraints])
+        self.never_married = np.array([c.never_married for c in constraints])
+        self.regions = np.array([c.regions for c in constraints], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def _directional(seekers: _Population, rows: slice, candidates: _Population, cols: slice):
+    """How well candidates[cols] meet the constraints of seekers[rows]
+
+    Per constraint a seeker has: met 1, unknown attribute 0.5, missed 0;
+    weighted mean over that seeker's constraints, 0.5 when it has none.
+    """
+    import numpy as np
+
+    numerator = np.zeros((rows.stop - rows.start, cols.stop - cols.start))
+    denominator = np.zeros((rows.stop - rows.start, 1))
+
+    def add(weight, active, known, met):
+        nonlocal numerator
+        points = np.where(known, met.astype(float), 0.5) * weight
+        numerator += np.where(active[:, None], points, 0.0)
+        denominator[:, 0] += active * weight
+
+    for name, attribute, (active, lows, highs) in (
+        ("age", candidates.age, seekers.age_bounds),
+        ("height", candidates.height, seekers.height_bounds),
+        ("bmi", candidates.bmi, seekers.bmi_bounds),
+    ):
+        values = attribute[None, cols]
+        met = (values >= lows[rows, None]) & (values <= highs[rows, None])
+        add(CONSTRAINT_WEIGHTS[name], active[rows], ~np.isnan(values), met)
+
+    for name, attribute, active in (
+        ("house", candidates.house, seekers.needs_house),
+        ("car", candidates.car, seekers.needs_car),
+    ):
+        values = attribute[None, cols]
+        add(CONSTRAINT_WEIGHTS[name], active[rows], ~np.isnan(values), values == 1.0)
+
+    marital = candidates.marital[None, cols]
+    add(
+        CONSTRAINT_WEIGHTS["marital"],
+        seekers.never_married[rows],
+        marital != 0,
+        marital == NEVER_MARRIED,
+    )
+
+    region_bit = candidates.region_bit[None, cols]
+    wanted = seekers.regions[rows, None]
+    add(
+        CONSTRAINT_WEIGHTS["location"],
+        wanted[:, 0] != 0,
+        region_bit != 0,
+        (wanted & region_bit) != 0,
+    )
+
+    return np.where(denominator > 0, numerator / np.maximum(denominator, 1e-12), 0.5)
+
+
+def _merge_top(top_keys, top_index, block_keys, first_column: int):
+    """The largest keys per row of [current top | new block], as many as top has"""
+    import numpy as np
+
+    k = top_keys.shape[1]
+    keys = np.concatenate([top_keys, block_keys], axis=1)
+    columns = np.arange(first_column, first_column + block_keys.shape[1])
+    index = np.concatenate([top_index, np.broadcast_to(columns, block_keys.shape)], axis=1)
+    keep = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(keys, keep, axis=1), np.take_along_axis(index, keep, axis=1)
+
+
+class CompatibilityMatcher:
+    """Scores men x women pairs and keeps each profile's best matches
+
+    The score of a pair is the mean of how well each meets the other's
+    constraints (see _directional), in [0, 1].
+    """
+
+    def __init__(
+        self,
+        people: Sequence[ProcessedPerson],
+        reference_year: Optional[int] = None,
+        block_size: Tuple[int, int] = DEFAULT_BLOCK_SIZE,
+    ):
+        populations = {"male": [], "female": []}
+        for person in people:
+            population = population_of(person)
+            if population:
+                populations[population].append(person)
+        self.men = _Population(populations["male"], reference_year)
+        self.women = _Population(populations["female"], reference_year)
+        self.block_size = block_size
+
+    def score_block(self, men: slice, women: slice):
+        """Pair scores of men[men] x women[women] (rows are men)"""
+        return 0.5 * (
+            _directional(self.men, men, self.women, women)
+            + _directional(self.women, women, self.men, men).T
+        )
+
+    def pair_score(self, man: int, woman: int) -> float:
+        """Score of one pair, computed with plain Python (the naive baseline)"""
+        return 0.5 * (
+            _score_one(self.men.constraints[man], self.women, woman)
+            + _score_one(self.women.constraints[woman], self.men, man)
+        )
+
+    def top_matches(self, k: int = DEFAULT_TOP_K) -> Dict[str, List[Tuple[str, float]]]:
+        """Every profile id -> its k best (id, score) of the other population
+
+        Blocks of at most block_size pairs are scored one at a time; only
+        the running top k per man and per woman are kept between blocks.
+        """
+        import numpy as np
+
+        n_men, n_women = len(self.men), len(self.women)
+        scale = 10 ** SCORE_DECIMALS
+        # Integer keys: rounded score, then the earlier profile on ties;
+        # -1 marks an empty slot
+        men_keys = np.full((n_men, min(k, n_women)), -1, dtype=np.int64)
+        men_index = np.full_like(men_keys, -1)
+        women_keys = np.full((n_women, min(k, n_men)), -1, dtype=np.int64)
+        women_index = np.full_like(women_keys, -1)
+
+        rows, cols = self.block_size
+        for r in range(0, n_men, rows):
+            men = slice(r, min(r + rows, n_men))
+            for c in range(0, n_women, cols):
+                women = slice(c, min(c + cols, n_women))
+                scores = np.rint(self.score_block(men, women) * scale).astype(np.int64)
+
+                keys = scores * (n_women + 1) + (n_women - np.arange(women.start, women.stop))
+                men_keys[men], men_index[men] = _merge_top(
+                    men_keys[men], men_index[men], keys, women.start
+                )
+                keys = scores.T * (n_men + 1) + (n_men - np.arange(men.start, men.stop))
+                women_keys[women], women_index[women] = _merge_top(
+                    women_keys[women], women_index[women], keys, men.start
+                )
+
+        matches = {}
+        for ids, other_ids, keys, index in (
+            (self.men.ids, self.women.ids, men_keys, men_index),
+            (self.women.ids, self.men.ids, women_keys, women_index),
+        ):
+            order = np.argsort(-keys, axis=1)
+            keys = np.take_along_axis(keys, order, axis=1).tolist()
+            index = np.take_along_axis(index, order, axis=1).tolist()
+            for row, profile_id in enumerate(ids):
+                matches[profile_id] = [
+                    (other_ids[j], key // (len(other_ids) + 1) / scale)
+                    for key, j in zip(keys[row], index[row])
+                ]
+        return matches
+
+
+def _score_one(constraints: PartnerConstraints, candidates: _Population, j: int) -> float:
+    """_directional for one seeker and one candidate, one value at a time"""
+    numerator = denominator = 0.0
+
+    def add(weight, known, met):
+        nonlocal numerator, denominator
+        numerator += (float(met) if known else 0.5) * weight
+        denominator += weight
+
+    for name, value, low, high in (
+        ("age", candidates.age[j], constraints.min_age, constraints.max_age),
+        ("height", candidates.height[j], constraints.min_height, constraints.max_height),
+        ("bmi", candidates.bmi[j], constraints.min_bmi, constraints.max_bmi),
+    ):
+        if low is None and high is None:
+            continue
+        known = value == value
+        met = (low is None or value >= low) and (high is None or value <= high)
+        add(CONSTRAINT_WEIGHTS[name], known, known and met)
+    if constraints.needs_house:
+        value = candidates.house[j]
+        add(CONSTRAINT_WEIGHTS["house"], value == value, value == 1.0)
+    if constraints.needs_car:
+        value = candidates.car[j]
+        add(CONSTRAINT_WEIGHTS["car"], value == value, value == 1.0)
+    if constraints.never_married:
+        code = candidates.marital[j]
+        add(CONSTRAINT_WEIGHTS["marital"], code != 0, code == NEVER_MARRIED)
+    if constraints.regions:
+        bit = int(candidates.region_bit[j])
+        add(CONSTRAINT_WEIGHTS["location"], bit != 0, bool(constraints.regions & bit))
+    return numerator / denominator if denominator else 0.5
+
+
+def write_top_matches(
+    people: Sequence[ProcessedPerson],
+    output_file,
+    k: int = DEFAULT_TOP_K,
+    reference_year: Optional[int] = None,
+) -> int:
+    """Write {profile id: [[match id, score], ...]} atomically; returns profiles written"""
+    matches = CompatibilityMatcher(people, reference_year).top_matches(k)
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_name(f".{output_file.name}.tmp")
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"k": k, "matches": {pid: [list(m) for m in top] for pid, top in matches.items()}},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    return len(matches)
@@ -3,115 +3,374 @@ CSV to Flutter Data Converter
 Converts processed dating profile CSV data to Dart format for Flutter app integration
 """
 
+import contextlib
+import csv
 import os
-import sys
-import pandas as pd
+import re
 import json
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+if __package__:
+    from .interest_canonicalizer import canonicalize_interests
+    from .interest_vocabulary import InterestVocabulary
+    from .processed_store import REF_COLUMNS, resolve_raw_text
+    from .raw_text_store import RawTextBlobWriter
+    from .similar_profiles import SimilarProfiles, attach_similar_ids
+else:
+    from interest_canonicalizer import canonicalize_interests
+    from interest_vocabulary import InterestVocabulary
+    from processed_store import REF_COLUMNS, resolve_raw_text
+    from raw_text_store import RawTextBlobWriter
+    from similar_profiles import SimilarProfiles, attach_similar_ids
 
-# Add current directory and parent directory to Python path
 current_dir = Path(__file__).parent
-sys.path.append(str(current_dir))
-sys.path.append(str(current_dir.parent.parent.parent))  # Add root folder
 
-# Change working directory to script location if running from elsewhere
-if Path.cwd() != current_dir:
-    print(f"Changing working directory to: {current_dir}")
-    os.chdir(current_dir)
+# Rows per chunk when streaming the CSV/Parquet checkpoint
+DEFAULT_CHUNK_SIZE = 1_000
+
+# Character JSON key, the CSV column it is made from and the converter
+# method applied to the cell, in output order ("id" comes first and is
+# built from the "id" column or the row index). Only these columns are
+# read (see iter_characters), so a new field here pulls in its source
+# column by itself
+CHARACTER_FIELDS = [
+    ("gender", "gender", "_safe_str"),
+    ("age", "age", "_safe_int"),  # No random fallback - keep actual data or null
+    ("height", "height_cm", "_safe_int"),  # height in cm
+    ("zodiac", "zodiac", "_safe_str"),
+    ("mbti", "mbti", "_safe_str"),
+    ("raw_text", "raw_text", "_clean_raw_text"),  # images removed
+    ("image", "raw_text", "_image_for_text"),  # extracted image URL
+    ("thumbnail", "raw_text", "_thumbnail_for_text"),
+    ("bmi", "bmi", "_safe_float"),
+    ("hometown", "hometown", "_safe_str"),
+    ("current_location", "current_location", "_safe_str"),
+    ("occupation", "occupation", "_safe_str"),
+    ("interests", "hobbies", "_extract_interests"),  # converted from hobbies
+    ("has_house", "has_house", "_safe_bool"),
+    ("has_car", "has_car", "_safe_bool"),
+    ("marital_status", "marital_status", "_safe_str"),
+]
+
+# pandas' default NA strings, so the pyarrow CSV reader nulls the same cells
+CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+# Character constructor argument, JSON key, Dart type and the value
+# Character.fromJson uses when the key is missing (None: argument omitted)
+DART_FIELDS = [
+    ("id", "id", "String", ""),
+    ("gender", "gender", "String", None),
+    ("age", "age", "int", 0),
+    ("height", "height", "int", None),
+    ("zodiac", "zodiac", "String", None),
+    ("mbti", "mbti", "String", None),
+    ("rawText", "raw_text", "String", ""),
+    ("image", "image", "String", None),
+    ("thumbnail", "thumbnail", "String", None),
+    ("bmi", "bmi", "double", None),
+    ("hometown", "hometown", "String", None),
+    ("currentLocation", "current_location", "String", ""),
+    ("occupation", "occupation", "String", ""),
+    ("interests", "interests", "List<String>", []),
+    ("interestIds", "interest_ids", "List<int>", None),
+    ("rawTextRef", "raw_text_ref", "List<int>", None),
+    ("hasHouse", "has_house", "bool", None),
+    ("hasCar", "has_car", "bool", None),
+    ("maritalStatus", "marital_status", "String", None),
+    ("similarIds", "similar_ids", "List<String>", None),
+]
+
+DART_HEADER = """// GENERATED CODE - DO NOT MODIFY BY HAND.
+// Written by lib/data_generate_python/csv_to_flutter_converter.py
+// (create_dart_file); regenerate with scripts/prebuild.py.
+
+import 'character.dart';
+"""
+
+
+def _is_missing(value) -> bool:
+    """None/NaN check that works without importing pandas"""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)  # NaN is the only value not equal to itself
+    except (TypeError, ValueError):
+        return True  # pandas.NA refuses to be coerced to bool
+
+
+def _header_columns(csv_file) -> List[str]:
+    """Column names of the CSV or Parquet checkpoint, without reading rows"""
+    if str(csv_file).endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(csv_file).schema_arrow.names
+    with open(csv_file, "r", encoding="utf-8-sig", newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def _read_row_chunks(
+    csv_file, chunk_size: int, columns: Optional[List[str]] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """Row dicts of the CSV or Parquet checkpoint, `chunk_size` at a time
+
+    Only `columns` (all when None; each must be in the file) are parsed.
+    CSV cells are declared as text (missing cells are null), so a column's
+    values do not change type from one chunk to the next, and are parsed
+    by pyarrow's multithreaded reader when it is installed, else by
+    pandas' C engine.
+    """
+    # pandas/pyarrow are only needed to read the rows, so imported on first use
+    if str(csv_file).endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(csv_file)
+        # raw_text may be stored as a reference into raw_data instead
+        refs = REF_COLUMNS[0] in parquet_file.schema_arrow.names and (
+            columns is None or "raw_text" in columns
+        )
+        if refs and columns is not None:
+            columns = [*columns, *REF_COLUMNS]
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+            rows = batch.to_pylist()
+            yield [resolve_raw_text(row) for row in rows] if refs else rows
+        return
+
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        pa_csv = None
+
+    if pa_csv is not None:
+        if columns is None:
+            columns = _header_columns(csv_file)
+        reader = pa_csv.open_csv(
+            csv_file,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types={column: pa.string() for column in columns},
+                null_values=CSV_NA_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+        for batch in reader:
+            for offset in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(offset, chunk_size).to_pylist()
+        return
+
+    import pandas as pd
+
+    with pd.read_csv(
+        csv_file,
+        usecols=columns,
+        dtype=str,
+        engine="c",
+        chunksize=chunk_size,
+    ) as reader:
+        for chunk in reader:
+            yield chunk.to_dict("records")
+
+
+def write_characters_json(
+    characters: Iterable[Dict[str, Any]], output_file, minify: bool = False
+) -> int:
+    """Write characters as a JSON array one element at a time; return the count
+
+    The file is the same as json.dump(characters, indent=2) would write;
+    with `minify` it has no whitespace and is encoded by the C encoder
+    (json only uses it without indent). Written to a temp file, then renamed.
+    """
+    encoder = json.JSONEncoder(
+        ensure_ascii=False,
+        default=str,
+        allow_nan=False,
+        indent=None if minify else 2,
+        separators=(",", ":") if minify else None,
+    )
+    # Elements sit one level deep; encoded strings never hold a raw newline
+    opening, separator, closing = ("[", ",", "]") if minify else ("[\n  ", ",\n  ", "\n]")
+    nested = None if minify else "\n  "
+
+    output_file = Path(output_file)
+    tmp_file = output_file.with_name(f".{output_file.name}.tmp")
+    count = 0
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            for character in characters:
+                encoded = encoder.encode(character)
+                if nested:
+                    encoded = encoded.replace("\n", nested)
+                f.write((separator if count else opening) + encoded)
+                count += 1
+            f.write(closing if count else "[]")
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    return count
 
 
 class FlutterDataConverter:
     """Convert processed CSV data to Flutter-compatible format"""
 
-    def __init__(self):
-        pass
+    def __init__(self, thumbnails: Optional[Dict[str, str]] = None):
+        # Image URL -> cached thumbnail path (see image_cache.py)
+        self.thumbnails = thumbnails or {}
+        self._fields = [
+            (key, column, getattr(self, method)) for key, column, method in CHARACTER_FIELDS
+        ]
+        self._last_image = (None, None)
 
     def csv_to_character_data(
-        self, csv_file: str, output_file: Optional[str] = None
+        self,
+        csv_file: str,
+        output_file: Optional[str] = None,
+        vocabulary_file: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Convert CSV data to Flutter Character format"""
-
-        # Read CSV
-        df = pd.read_csv(csv_file)
-
-        characters = []
-
-        for i in range(len(df)):
-            row = df.iloc[i]
-            character = self._convert_row_to_character(row, i)
-            characters.append(character)
+        """Convert CSV data to Flutter Character format
+
+        A .parquet checkpoint is read directly with its stored column types.
+        With a vocabulary_file, the corpus interest vocabulary is updated and
+        each character gets integer interest_ids. Holds every character in
+        memory; stream_character_data writes the same JSON without that.
+        """
+        characters = list(self.iter_characters(csv_file))
+
+        # Accumulate the corpus vocabulary; ids stay stable across runs
+        if vocabulary_file:
+            vocabulary = InterestVocabulary.load(vocabulary_file)
+            report = vocabulary.update(characters, prune=True)
+            vocabulary.save()
+            print(
+                f"🏷️ Interest vocabulary: {len(vocabulary.names)} interests, "
+                f"{report['added']} new profiles, {report['new_interests']} new interests"
+            )
 
         # Save to JSON if output file specified
         if output_file:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    characters,
-                    f,
-                    ensure_ascii=False,
-                    indent=2,
-                    default=str,
-                    allow_nan=False,
-                )
+            write_characters_json(characters, output_file)
 
         return characters
 
-    def _convert_row_to_character(self, row: pd.Series, index: int) -> Dict[str, Any]:
+    def stream_character_data(
+        self,
+        csv_file: str,
+        output_file: str,
+        vocabulary_file: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        minify: bool = False,
+        raw_text_blob: Optional[str] = None,
+        similar_k: int = 0,
+    ) -> int:
+        """Convert the CSV (or Parquet checkpoint) to JSON in constant memory
+
+        Rows are read `chunk_size` at a time and each character is written
+        as soon as it is converted; returns how many were written. The JSON
+        is the same as csv_to_character_data's, or minified with `minify`.
+        With `raw_text_blob`, cleaned texts go to that blob file (see
+        raw_text_store.py) and records carry a raw_text_ref instead.
+        With `similar_k`, a first pass encodes every profile (see
+        similar_profiles.py) and records carry their similar_ids.
+        """
+        vocabulary = InterestVocabulary.load(vocabulary_file) if vocabulary_file else None
+        report = {}
+        similar = None
+        if similar_k:
+            try:
+                profiles = SimilarProfiles(self.iter_characters(csv_file, chunk_size))
+                similar = profiles.similar_ids(similar_k)
+                print(f"🧭 Similar profiles: {similar_k} per profile for {len(profiles)} profiles")
+            except ImportError as e:
+                print(f"⚠️  Skipping similar profiles: {e}")
+
+        characters = self.iter_characters(csv_file, chunk_size)
+        if similar is not None:
+            characters = attach_similar_ids(characters, similar)
+        if vocabulary:
+            characters = vocabulary.stream(characters, prune=True, report=report)
+
+        blobs = RawTextBlobWriter(raw_text_blob) if raw_text_blob else None
+        with blobs or contextlib.nullcontext():
+            if blobs:
+                characters = blobs.detach(characters)
+            count = write_characters_json(characters, output_file, minify=minify)
+
+        if blobs:
+            print(
+                f"📦 Raw text blob: {blobs.stats['texts']} texts, "
+                f"{blobs.stats['stored']} stored ({blobs.stats['bytes'] / 2**20:.1f} MB) "
+                f"in {blobs.blob_file.name}"
+            )
+
+        if vocabulary:
+            vocabulary.save()
+            print(
+                f"🏷️ Interest vocabulary: {len(vocabulary.names)} interests, "
+                f"{report['added']} new profiles, {report['new_interests']} new interests"
+            )
+        return count
+
+    def iter_characters(
+        self, csv_file: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """Characters in file order, reading `chunk_size` rows at a time
+
+        Only the columns CHARACTER_FIELDS is made from are parsed.
+        """
+        header = _header_columns(csv_file)
+        needed = {"id"} | {column for _, column, _ in self._fields}
+        columns = [column for column in header if column in needed]
+        print(f"📥 Reading {len(columns)} of {len(header)} columns from {Path(csv_file).name}")
+
+        index = 0
+        for rows in _read_row_chunks(csv_file, chunk_size, columns):
+            for row in rows:
+                yield self._convert_row_to_character(row, index)
+                index += 1
+
+    def _convert_row_to_character(self, row: Dict[str, Any], index: int) -> Dict[str, Any]:
         """Convert a single CSV row to Character format with only required fields"""
+        row_id = row.get("id")
+        character = {"id": f"profile_{index if _is_missing(row_id) else row_id}"}
+        for key, column, convert in self._fields:
+            character[key] = convert(row.get(column))
+        return character
 
-        # Generate unique ID
-        char_id = f"profile_{row.get('id', index)}"
-
-        # Extract raw text and clean it
-        raw_text = self._safe_str(row.get("raw_text"))
-
-        # Extract image first, then clean the text
-        image_url = self._extract_image_from_text(raw_text)
-        cleaned_raw_text = self._remove_images_from_text(raw_text)
-
-        # Your required fields only
-        character = {
-            "id": char_id,
-            "gender": self._safe_str(row.get("gender")),
-            "age": self._safe_int(
-                row.get("age")
-            ),  # No random fallback - keep actual data or null
-            "height": self._safe_int(row.get("height_cm")),  # height in cm
-            "zodiac": self._safe_str(row.get("zodiac")),
-            "mbti": self._safe_str(row.get("mbti")),
-            "raw_text": cleaned_raw_text,  # cleaned profile text (images removed)
-            "image": image_url,  # extracted image URL
-            "bmi": self._safe_float(row.get("bmi")),
-            "hometown": self._safe_str(row.get("hometown")),
-            "current_location": self._safe_str(row.get("current_location")),
-            "occupation": self._safe_str(row.get("occupation")),
-            "interests": self._extract_interests(
-                row.get("hobbies")
-            ),  # converted from hobbies
-            "has_house": self._safe_bool(row.get("has_house")),
-            "has_car": self._safe_bool(row.get("has_car")),
-            "marital_status": self._safe_str(row.get("marital_status")),
-        }
+    def _clean_raw_text(self, raw_text) -> Optional[str]:
+        return self._remove_images_from_text(self._safe_str(raw_text))
 
-        return character
+    def _image_for_text(self, raw_text) -> Optional[str]:
+        # image and thumbnail come from the same cell; search it once
+        if raw_text is not self._last_image[0]:
+            self._last_image = (raw_text, self._extract_image_from_text(self._safe_str(raw_text)))
+        return self._last_image[1]
 
-    def _build_description(self, row: pd.Series) -> str:
+    def _thumbnail_for_text(self, raw_text) -> Optional[str]:
+        image_url = self._image_for_text(raw_text)
+        return self.thumbnails.get(image_url) if image_url else None
+
+    def _build_description(self, row: Dict[str, Any]) -> str:
         """Build character description from available data"""
         description_parts = []
 
         # Self introduction
-        if pd.notna(row.get("self_introduction")):
+        if not _is_missing(row.get("self_introduction")):
             description_parts.append(str(row["self_introduction"])[:150])
 
         # Partner preferences
-        if pd.notna(row.get("partner_preferences")):
+        if not _is_missing(row.get("partner_preferences")):
             description_parts.append(
                 "理想の相手：" + str(row["partner_preferences"])[:100]
             )
 
         # Personality
-        if pd.notna(row.get("personality")):
+        if not _is_missing(row.get("personality")):
             description_parts.append("性格：" + str(row["personality"])[:100])
 
         # Default description if nothing available
@@ -120,53 +379,90 @@ class FlutterDataConverter:
 
         return "\\n".join(description_parts)
 
-    def _extract_interests(self, hobbies_str: Optional[str]) -> List[str]:
-        """Extract and normalize interests from hobbies string - no random defaults"""
-        if pd.isna(hobbies_str):
-            return []  # Return empty array instead of random defaults
-
-        # Split by common delimiters
-        hobbies = str(hobbies_str).replace("、", ",").replace("，", ",")
-        interests = [h.strip() for h in hobbies.split(",") if h.strip()]
-
-        # Limit to 6 interests and clean up
-        interests = [interest for interest in interests[:6] if len(interest) < 10]
-
-        # Normalize interests to avoid redundancy
-        interests = type(self)._normalize_interests(interests)
+    def create_dart_file(self, characters: List[Dict[str, Any]], output_file: str):
+        """Write characters as a generated Dart module (no JSON parsing at startup)
 
-        return interests  # Return normalized interests or empty array
+        Output depends only on the records, in the given order, so unchanged
+        profiles produce unchanged lines.
+        """
+        output_file = Path(output_file)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = output_file.with_name(f".{output_file.name}.tmp")
+        with open(tmp_file, "w", encoding="utf-8", newline="\n") as f:
+            f.write(self.render_dart_module(characters))
+        tmp_file.replace(output_file)
 
     @classmethod
-    def _normalize_interests(cls, interests: List[str]) -> List[str]:
-        """Normalize interests to avoid redundancy like '游泳', '读书', '游泳读书'"""
-        if not interests:
-            return []
+    def render_dart_module(cls, characters: List[Dict[str, Any]]) -> str:
+        """Render the GeneratedCharactersData Dart source"""
+        lines = [
+            DART_HEADER,
+            "class GeneratedCharactersData {",
+            f"  static const int count = {len(characters)};",
+            "",
+            "  /// Fresh Character objects; UI state on them is mutable",
+            "  static List<Character> getCharacters() => [",
+        ]
+        for character in characters:
+            lines.append("    Character(")
+            for name, key, dart_type, default in DART_FIELDS:
+                value = character.get(key)
+                if _is_missing(value):
+                    if default is None:
+                        continue
+                    value = default
+                lines.append(f"      {name}: {cls._dart_literal(value, dart_type)},")
+            lines.append("    ),")
+        lines.extend(["  ];", "}", ""])
+        return "\n".join(lines)
 
-        # Sort interests by length (shortest first)
-        sorted_interests = sorted(interests, key=len)
-
-        normalized_interests = []
-
-        for interest in sorted_interests:
-            # Check if this interest is a combination of already processed interests
-            is_composite = any(
-                existing in interest and existing != interest
-                for existing in normalized_interests
-            )
+    @classmethod
+    def _dart_literal(cls, value, dart_type: str) -> str:
+        """Format a value as a Dart literal of the given type"""
+        if dart_type.startswith("List<"):
+            item_type = dart_type[5:-1]
+            items = ", ".join(cls._dart_literal(item, item_type) for item in value)
+            return f"const <{item_type}>[{items}]"
+        if dart_type == "String":
+            return cls._dart_string(str(value))
+        if dart_type == "int":
+            return str(int(value))
+        if dart_type == "double":
+            return repr(float(value))
+        return "true" if value else "false"
+
+    @staticmethod
+    def _dart_string(text: str) -> str:
+        """Single-quoted Dart string literal (escapes quotes, $ and controls)"""
+        escaped = []
+        for char in text:
+            if char in "\\'$":
+                escaped.append("\\" + char)
+            elif char == "\n":
+                escaped.append("\\n")
+            elif char == "\r":
+                escaped.append("\\r")
+            elif char == "\t":
+                escaped.append("\\t")
+            elif ord(char) < 0x20 or 0xD800 <= ord(char) <= 0xDFFF:
+                escaped.append(f"\\u{{{ord(char):x}}}")
+            else:
+                escaped.append(char)
+        return "'" + "".join(escaped) + "'"
 
-            if not is_composite:
-                normalized_interests.append(interest)
+    def _extract_interests(self, hobbies_str: Optional[str]) -> List[str]:
+        """Map hobbies to canonical interests (synonyms merged) - no random defaults"""
+        if _is_missing(hobbies_str):
+            return []  # Return empty array instead of random defaults
 
-        return normalized_interests
+        # One automaton pass per distinct hobby string (cached across rows)
+        return canonicalize_interests(str(hobbies_str))
 
     def _extract_image_from_text(self, raw_text: Optional[str]) -> Optional[str]:
         """Extract image URL from markdown text"""
-        if pd.isna(raw_text) or not raw_text:
+        if _is_missing(raw_text) or not raw_text:
             return None
 
-        import re
-
         # Look for markdown image syntax: ![alt](url)
         markdown_img = re.search(r"!\[.*?\]\((https?://[^\s\)]+)\)", str(raw_text))
         if markdown_img:
@@ -195,11 +491,9 @@ class FlutterDataConverter:
 
     def _remove_images_from_text(self, raw_text: Optional[str]) -> Optional[str]:
         """Remove image markdown and URLs from raw text with improved formatting"""
-        if pd.isna(raw_text) or not raw_text:
+        if _is_missing(raw_text) or not raw_text:
             return raw_text
 
-        import re
-
         cleaned_text = str(raw_text)
 
         # Remove markdown image syntax: ![alt](url) - with surrounding whitespace
@@ -271,7 +565,7 @@ class FlutterDataConverter:
 
     def _safe_str(self, value) -> Optional[str]:
         """Safely convert value to string, handling NaN"""
-        if pd.isna(value):
+        if _is_missing(value):
             return None
         try:
             return str(value)
@@ -280,7 +574,7 @@ class FlutterDataConverter:
 
     def _safe_int(self, value) -> Optional[int]:
         """Safely convert value to int"""
-        if pd.isna(value):
+        if _is_missing(value):
             return None
         try:
             return int(float(str(value)))
@@ -289,7 +583,7 @@ class FlutterDataConverter:
 
     def _safe_float(self, value) -> Optional[float]:
         """Safely convert value to float"""
-        if pd.isna(value):
+        if _is_missing(value):
             return None
         try:
             return float(str(value))
@@ -298,7 +592,7 @@ class FlutterDataConverter:
 
     def _safe_bool(self, value) -> Optional[bool]:
         """Safely convert value to bool"""
-        if pd.isna(value):
+        if _is_missing(value):
             return None
         if isinstance(value, bool):
             return value
@@ -314,8 +608,8 @@ def main():
     """Main function to convert CSV to Flutter format"""
 
     # File paths
-    csv_file = "test_profiles.csv"
-    json_output = "flutter_characters.json"
+    csv_file = current_dir / "test_profiles.csv"
+    json_output = current_dir / "flutter_characters.json"
 
     if not Path(csv_file).exists():
         print(f"CSV file {csv_file} not found!")
@@ -337,7 +631,7 @@ def main():
         print(f"\nConversion complete!")
         print(f"Total profiles: {len(characters)}")
         print(f"\nTo use in your Flutter app:")
-        print(f"1. Import: import 'data/generated_characters_data.dart';")
+        print(f"1. Run scripts/prebuild.py; it writes lib/data/generated_characters_data.dart")
         print(f"2. Use: GeneratedCharactersData.getCharacters()")
 
     except Exception as e:
@@ -4,57 +4,182 @@ This script orchestrates the complete process from raw data to Flutter-ready for
 """
 
 import os
+import csv
 import sys
+import hashlib
 import json
 import time
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, List
 
-# Add current directory and parent directory to Python path
+if __package__:
+    from .deepseek_data_processor import (
+        APIError,
+        DeepSeekProcessor,
+        ProcessedPerson,
+        RawTextRef,
+    )
+    from .asset_builder import DEFAULT_JSON as APP_DATA_JSON, AssetBuilder
+    from .checkpoint_writer import CheckpointWriter
+    from .compatibility_matcher import write_top_matches
+    from .similar_profiles import DEFAULT_K as SIMILAR_K
+    from .batch_extraction import BatchClient, new_batch_file, write_batch_requests
+    from .csv_to_flutter_converter import FlutterDataConverter
+    from .endpoint_pool import load_endpoints
+    from .raw_data_manifest import RawDataManifest
+    from .image_cache import ImageCache, print_prefetch_report
+    from .parallel_extraction import (
+        DEFAULT_UNIT_SIZE,
+        SharedRateLimiter,
+        endpoint_settings,
+        extract_tasks,
+        extract_unit,
+        init_worker,
+        merge_parts,
+        order_people,
+        plan_units,
+        read_part,
+    )
+    from .raw_data_watcher import RawDataWatcher
+    from .retry_queue import DeferredRetryQueue, retry_delay
+    from .schema_migration import (
+        FieldDeltaExtractor,
+        detect_added_fields,
+        estimate_prompt_chars,
+        merge_answers,
+    )
+    from .processed_store import (
+        load_processed_people,
+        parquet_available,
+        person_from_csv_row,
+        save_to_parquet,
+    )
+    from .work_queue import DEFAULT_LEASE_SECONDS, LeaseKeeper, LeasedWorkQueue
+else:
+    from deepseek_data_processor import (
+        APIError,
+        DeepSeekProcessor,
+        ProcessedPerson,
+        RawTextRef,
+    )
+    from asset_builder import DEFAULT_JSON as APP_DATA_JSON, AssetBuilder
+    from checkpoint_writer import CheckpointWriter
+    from compatibility_matcher import write_top_matches
+    from similar_profiles import DEFAULT_K as SIMILAR_K
+    from batch_extraction import BatchClient, new_batch_file, write_batch_requests
+    from csv_to_flutter_converter import FlutterDataConverter
+    from endpoint_pool import load_endpoints
+    from raw_data_manifest import RawDataManifest
+    from image_cache import ImageCache, print_prefetch_report
+    from parallel_extraction import (
+        DEFAULT_UNIT_SIZE,
+        SharedRateLimiter,
+        endpoint_settings,
+        extract_tasks,
+        extract_unit,
+        init_worker,
+        merge_parts,
+        order_people,
+        plan_units,
+        read_part,
+    )
+    from raw_data_watcher import RawDataWatcher
+    from retry_queue import DeferredRetryQueue, retry_delay
+    from schema_migration import (
+        FieldDeltaExtractor,
+        detect_added_fields,
+        estimate_prompt_chars,
+        merge_answers,
+    )
+    from processed_store import (
+        load_processed_people,
+        parquet_available,
+        person_from_csv_row,
+        save_to_parquet,
+    )
+    from work_queue import DEFAULT_LEASE_SECONDS, LeaseKeeper, LeasedWorkQueue
+
+# Relative paths (raw_data, output/, progress file) live next to this script
 current_dir = Path(__file__).parent
-sys.path.append(str(current_dir))
-sys.path.append(str(current_dir.parent.parent.parent))  # Add root folder
 
-# Change working directory to script location if running from elsewhere
-if Path.cwd() != current_dir:
-    print(f"Changing working directory to: {current_dir}")
-    os.chdir(current_dir)
+DATA_PATTERNS = ["men_*.md", "women_*.md"]
+# Task fields stored in the shared work queue (no machine-specific paths)
+QUEUE_TASK_KEYS = ("id", "rank", "file", "start", "end", "sha1", "gender")
 
-from deepseek_data_processor import DeepSeekProcessor
-from csv_to_flutter_converter import FlutterDataConverter
+# Failed attempts after which a profile is given up on
+MAX_ATTEMPTS = 3
+
+
+def resolve_path(path) -> Path:
+    """Resolve a relative path against the pipeline folder instead of the cwd"""
+    return current_dir / path
 
 
 class DataPipeline:
     """Complete data processing pipeline"""
 
-    def __init__(self, api_key: str):
-        self.api_key = api_key
+    def __init__(self, api_key: Optional[str] = None, endpoints=None):
+        # Fall back to the environment so non-interactive callers need no key
+        self.api_key = api_key or os.environ.get("DEEPSEEK_API_KEY", "")
+        # Several keys/endpoints can share the load: pass Endpoint objects or
+        # point EXTRACTION_ENDPOINTS at a JSON list (see endpoint_pool.py)
+        endpoints_file = os.environ.get("EXTRACTION_ENDPOINTS")
+        if endpoints is None and endpoints_file:
+            endpoints = load_endpoints(
+                endpoints_file, max_requests_per_minute=10, delay_between_requests=6.0
+            )
+        if endpoints:
+            self.api_key = self.api_key or endpoints[0].api_key
         self.processor = DeepSeekProcessor(
-            api_key=api_key,
+            api_key=self.api_key,
             max_requests_per_minute=10,  # Conservative rate
             delay_between_requests=6.0,  # 6-second delays
             max_retries=3,  # Add retry logic
             retry_delay=5.0,  # 5-second initial delay
+            endpoints=endpoints,
         )
         self.converter = FlutterDataConverter()
+        self._manifests = {}
+
+    def get_manifest(self, input_folder: str = "raw_data") -> RawDataManifest:
+        """Return the (cached) raw data manifest for an input folder"""
+        key = str(resolve_path(input_folder))
+        if key not in self._manifests:
+            self._manifests[key] = RawDataManifest(key)
+        return self._manifests[key]
 
     def check_prerequisites(self) -> bool:
         """Check if all required files and dependencies are available"""
         print("🔍 Checking prerequisites...")
 
         # Check if raw_data folder exists
-        raw_data_path = Path("raw_data")
+        raw_data_path = resolve_path("raw_data")
         if not raw_data_path.exists():
             print("❌ raw_data folder not found!")
             return False
 
-        # Check if there are data files
-        data_files = list(raw_data_path.glob("*.md"))
+        # Check if there are data files (only new or changed files are read)
+        manifest = self.get_manifest(raw_data_path)
+        report = manifest.refresh()
+        data_files = manifest.data_files()
         if not data_files:
             print("❌ No markdown data files found in raw_data folder!")
             return False
 
-        print(f"✅ Found {len(data_files)} data files")
+        print(
+            f"✅ Found {len(data_files)} data files "
+            f"({len(report['added']) + len(report['changed'])} new or changed)"
+        )
 
         # Check API key
         if not self.api_key or self.api_key == "your-api-key-here":
@@ -72,22 +197,14 @@ class DataPipeline:
         total_profiles = 0
         files_to_process = []
 
-        raw_data_path = Path("raw_data")
-
-        for pattern in file_patterns:
-            files = list(raw_data_path.glob(pattern))
-            for file_path in files:
-                if file_path.name in ["__init__.py", "tinder.md"]:
-                    continue
+        # Block counts come from the manifest; only changed files are re-split
+        manifest = self.get_manifest("raw_data")
+        manifest.refresh(file_patterns)
 
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                person_blocks = self.processor.extract_person_blocks(content)
-                total_profiles += len(person_blocks)
-                files_to_process.append(
-                    {"file": file_path.name, "profiles": len(person_blocks)}
-                )
+        for file_path in manifest.data_files(file_patterns):
+            profiles = manifest.block_count(file_path.name)
+            total_profiles += profiles
+            files_to_process.append({"file": file_path.name, "profiles": profiles})
 
         # Estimate time and cost
         seconds_per_request = self.processor.delay_between_requests
@@ -103,17 +220,185 @@ class DataPipeline:
     def save_progress(
         self, processed_data: dict, filename: str = "pipeline_progress.json"
     ):
-        """Save pipeline progress for resume capability"""
-        with open(filename, "w", encoding="utf-8") as f:
+        """Save pipeline progress for resume capability (temp file plus rename)"""
+        progress_file = resolve_path(filename)
+        tmp_file = progress_file.with_name(f".{progress_file.name}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
             json.dump(processed_data, f, indent=2, default=str)
+        os.replace(tmp_file, progress_file)
 
     def load_progress(self, filename: str = "pipeline_progress.json") -> Optional[dict]:
         """Load previous pipeline progress"""
-        if Path(filename).exists():
-            with open(filename, "r", encoding="utf-8") as f:
+        progress_file = resolve_path(filename)
+        if progress_file.exists():
+            with open(progress_file, "r", encoding="utf-8") as f:
                 return json.load(f)
         return None
 
+    def profile_tasks(
+        self, manifest: RawDataManifest, file_patterns: Optional[List[str]] = None
+    ) -> List[dict]:
+        """One task per person block of the manifest's data files, in file/block order
+
+        Every run mode builds its work from these, so ids ("<stem>_<番号>"),
+        genders and byte ranges are the same whichever mode extracted them.
+        """
+        tasks = []
+        data_files = manifest.data_files(file_patterns or DATA_PATTERNS)
+        for file_rank, file_path in enumerate(data_files):
+            gender = "female" if "women_" in file_path.name else "male"
+            blocks = manifest.blocks(file_path.name)
+            profile_ids = manifest.profile_ids(file_path.name)
+            for block_index, (person_id, block) in enumerate(zip(profile_ids, blocks)):
+                tasks.append(
+                    {
+                        "id": person_id,
+                        "file_path": str(file_path),
+                        "file": file_path.name,
+                        "rank": file_rank * 1_000_000 + block_index,
+                        "block": block_index,
+                        "start": block["start"],
+                        "end": block["end"],
+                        "sha1": block["sha1"],
+                        "gender": gender,
+                    }
+                )
+        return tasks
+
+    @staticmethod
+    def counts_as_attempt(error_class: Optional[str]) -> bool:
+        """Outage failures (open breaker) do not use up the MAX_ATTEMPTS"""
+        return error_class != "circuit_open"
+
+    @staticmethod
+    def given_up_ids(failed_profiles: List[dict]) -> set:
+        """Ids of profiles that failed MAX_ATTEMPTS times"""
+        return {f.get("id") for f in failed_profiles if f.get("attempts", 0) >= MAX_ATTEMPTS}
+
+    @classmethod
+    def record_failure(cls, failed_profiles: List[dict], failure: dict) -> int:
+        """Replace the profile's entry in failed_profiles (in place); returns its attempts
+
+        `failure` holds the id, error and error_class of this failure.
+        """
+        previous = next((f for f in failed_profiles if f.get("id") == failure["id"]), {})
+        attempts = previous.get("attempts", 0)
+        if cls.counts_as_attempt(failure.get("error_class")):
+            attempts += 1
+        cls.clear_failures(failed_profiles, [failure["id"]])
+        failed_profiles.append({**failure, "attempts": attempts, "timestamp": time.time()})
+        return attempts
+
+    @staticmethod
+    def clear_failures(failed_profiles: List[dict], person_ids):
+        """Drop the entries of profiles that have since succeeded (in place)"""
+        done = set(person_ids)
+        failed_profiles[:] = [f for f in failed_profiles if f.get("id") not in done]
+
+    @staticmethod
+    def repoint_raw_texts(people, tasks: List[dict]):
+        """Point raw_text references at their blocks' current byte ranges
+
+        References come back from the checkpoint as stored, but an edit
+        elsewhere in a raw file moves the blocks after it.
+        """
+        spans = {task["id"]: task for task in tasks}
+        for person in people:
+            task = spans.get(person.id)
+            if task is not None and isinstance(person.raw_text, RawTextRef):
+                person.raw_text = RawTextRef(task["file_path"], task["start"], task["end"])
+
+    def save_checkpoint(self, people: List[ProcessedPerson], csv_output: Path):
+        """Save processed people in one format per checkpoint
+
+        Typed Parquet when pyarrow is installed (raw texts stay references
+        into raw_data), else the CSV. export_flutter writes the CSV export
+        next to a Parquet checkpoint.
+        """
+        if parquet_available():
+            save_to_parquet(people, Path(csv_output).with_suffix(".parquet"))
+        else:
+            self.processor.save_to_csv(people, Path(csv_output))
+
+    def load_checkpoint(self, csv_output: Path) -> List[ProcessedPerson]:
+        """Load processed people, preferring the Parquet checkpoint over the CSV"""
+        parquet_output = Path(csv_output).with_suffix(".parquet")
+        if parquet_available() and parquet_output.exists():
+            print(f"\n🔄 Loading previously processed data from {parquet_output}...")
+            return load_processed_people(parquet_output)
+
+        print(f"\n🔄 Loading previously processed data from {csv_output}...")
+        with open(csv_output, "r", encoding="utf-8-sig", newline="") as f:
+            return [person_from_csv_row(row) for row in csv.DictReader(f)]
+
+    def prefetch_images(self, people: List[ProcessedPerson]):
+        """Cache thumbnails for the profiles' images before conversion"""
+        urls = [
+            self.converter._extract_image_from_text(person.get_raw_text())
+            for person in people
+        ]
+        cache = ImageCache()
+        try:
+            print_prefetch_report(cache.prefetch(urls))
+        except ImportError as e:
+            print(f"⚠️  Skipping thumbnails: {e}")
+        self.converter.thumbnails = cache.thumbnails()
+
+    def export_flutter(
+        self,
+        people: List[ProcessedPerson],
+        csv_output: Path,
+        json_output: Path,
+        raw_text_blob: Optional[Path] = None,
+    ) -> int:
+        """Prefetch thumbnails and stream the saved checkpoint to Flutter JSON
+
+        With `raw_text_blob`, profile texts are written there instead of
+        into the JSON. Each record lists its most similar profiles in
+        similar_ids, and each profile's best matches go to top_matches.json
+        beside it. Writing the default output also regenerates the app's
+        Dart data module. The CSV export is written first when the
+        checkpoint is Parquet. Returns the number of characters written.
+        """
+        if parquet_available():
+            # The checkpoint is Parquet; the CSV export is only written here
+            self.processor.save_to_csv(people, csv_output)
+
+        print(f"\n🖼️ Prefetching profile images...")
+        self.prefetch_images(people)
+
+        print(f"\n🔄 Converting to Flutter format...")
+        # The typed Parquet checkpoint loads faster and without re-parsing
+        parquet_output = csv_output.with_suffix(".parquet")
+        converter_input = (
+            parquet_output
+            if parquet_available() and parquet_output.exists()
+            else csv_output
+        )
+        exported = self.converter.stream_character_data(
+            converter_input,
+            json_output,
+            vocabulary_file=json_output.with_name("interest_vocabulary.json"),
+            raw_text_blob=raw_text_blob,
+            similar_k=SIMILAR_K,
+        )
+        print(f"✅ JSON saved to: {json_output}")
+
+        # The app bundles the default dataset as a generated Dart module (and a
+        # search index); other outputs, such as tests', leave the app alone
+        if Path(json_output).resolve() == APP_DATA_JSON.resolve():
+            for output in AssetBuilder(json_file=json_output).publish():
+                print(f"📁 Rebuilt: {output}")
+
+        # Best men x women matches per profile, next to the dataset
+        matches_output = json_output.with_name("top_matches.json")
+        try:
+            matched = write_top_matches(people, matches_output)
+            print(f"💞 Top matches for {matched} profiles saved to: {matches_output}")
+        except ImportError as e:
+            print(f"⚠️  Skipping top matches: {e}")
+        return exported
+
     def run_full_pipeline_with_retry(
         self,
         input_folder: str = "raw_data",
@@ -127,6 +412,10 @@ class DataPipeline:
         print("🚀 Starting Dating App Data Pipeline with Retry Logic")
         print("=" * 60)
 
+        input_folder = resolve_path(input_folder)
+        csv_output = resolve_path(csv_output)
+        json_output = resolve_path(json_output)
+
         # Initialize progress tracking variables at function start
         total_profiles_processed = 0
         total_profiles_failed = 0
@@ -137,7 +426,7 @@ class DataPipeline:
             return False
 
         # Show cost estimation
-        estimate = self.estimate_cost(["men_*.md", "women_*.md"])
+        estimate = self.estimate_cost(DATA_PATTERNS)
         print(f"\n💰 Cost Estimation:")
         print(f"   📊 Total profiles: {estimate['total_profiles']}")
         print(f"   ⏱️  Estimated time: {estimate['estimated_time_minutes']} minutes")
@@ -173,223 +462,245 @@ class DataPipeline:
             )
             print("   This prevents data loss if the process is interrupted")
 
+            # Fields added to the schema would stay empty for stored profiles
+            # once the checkpoint is rewritten with the new columns
+            added_fields = detect_added_fields(csv_output)
+            if added_fields:
+                print(
+                    f"\n⚠️  New schema fields {', '.join(added_fields)}: run the "
+                    "schema migration (option 6) first to fill them for stored profiles"
+                )
+
             # Load previously processed people if resuming
-            if resume and completed_profiles and Path(csv_output).exists():
-                print(f"\n🔄 Loading previously processed data from {csv_output}...")
+            parquet_output = csv_output.with_suffix(".parquet")
+            if resume and completed_profiles and (
+                parquet_output.exists() or csv_output.exists()
+            ):
                 try:
-                    import csv
-                    from deepseek_data_processor import ProcessedPerson
-
-                    def convert_csv_row(row):
-                        """Convert CSV row strings back to proper types for ProcessedPerson"""
-                        converted = {}
-                        for key, value in row.items():
-                            if value == "" or value == "None" or value is None:
-                                converted[key] = None
-                            elif key == "age" and value:
-                                converted[key] = (
-                                    int(value) if str(value).isdigit() else None
-                                )
-                            elif key == "height_cm" and value:
-                                converted[key] = (
-                                    int(value) if str(value).isdigit() else None
-                                )
-                            elif key == "weight_kg" and value:
-                                converted[key] = (
-                                    int(value) if str(value).isdigit() else None
-                                )
-                            elif key == "bmi" and value:
-                                try:
-                                    converted[key] = float(value)
-                                except (ValueError, TypeError):
-                                    converted[key] = None
-                            elif key in ["has_house", "has_car"] and value:
-                                converted[key] = str(value).lower() in [
-                                    "true",
-                                    "1",
-                                    "yes",
-                                ]
-                            else:
-                                converted[key] = value
-                        return converted
-
-                    previously_loaded = 0
-                    with open(csv_output, "r", encoding="utf-8", newline="") as f:
-                        reader = csv.DictReader(f)
-                        for row in reader:
-                            converted_row = convert_csv_row(row)
-                            person = ProcessedPerson(**converted_row)
-                            all_processed_people.append(person)
-                            previously_loaded += 1
-
+                    all_processed_people = self.load_checkpoint(csv_output)
+                    previously_loaded = len(all_processed_people)
                     print(
                         f"   ✅ Loaded {previously_loaded} previously processed profiles"
                     )
                     total_profiles_processed = previously_loaded
 
                 except Exception as e:
-                    print(f"   ⚠️  Warning: Could not load previous data from CSV: {e}")
+                    print(f"   ⚠️  Warning: Could not load previous data: {e}")
                     print(
                         "   🔄 Starting fresh (previous progress tracking will still work)"
                     )
                     all_processed_people = []
                     total_profiles_processed = 0
 
-            # Get all files to process
-            file_patterns = ["men_*.md", "women_*.md"]
-            files_to_process = []
-            for pattern in file_patterns:
-                files_to_process.extend(list(input_path.glob(pattern)))
+            # Every profile, from the manifest's block index
+            manifest = self.get_manifest(input_path)
+            manifest.refresh(DATA_PATTERNS)
+            profile_tasks = self.profile_tasks(manifest)
+            self.repoint_raw_texts(all_processed_people, profile_tasks)
+            completed_ids = {p.get("id") for p in completed_profiles}
 
             total_profiles_processed = 0
             total_profiles_failed = 0
+            total_recovered = 0
+
+            # Failed requests wait here (by error class and not-before time)
+            # while other profiles keep going; due retries are interleaved
+            retry_queue = DeferredRetryQueue()
+
+            def record_failure(task, error: str, error_class: str):
+                nonlocal total_profiles_failed
+                # The class is this failure's, not an earlier deferral's
+                attempts = self.record_failure(
+                    failed_profiles,
+                    {"id": task["id"], "error": error, "error_class": error_class},
+                )
+                total_profiles_failed += 1
+                print(f"   ❌ Failed {task['id']}: {error} (attempt {attempts})")
 
-            for file_path in files_to_process:
-                if file_path.name in ["__init__.py", "tinder.md"]:
-                    continue
+            def settle_profile(task, request) -> bool:
+                """Handle one finished request; defers the task on a retryable failure"""
+                nonlocal total_profiles_processed, total_recovered
+                person_id = task["id"]
+                try:
+                    extracted_info = request.result()
+                    if not extracted_info:
+                        raise APIError("bad_response", "No data extracted")
+                except APIError as e:
+                    delay = retry_queue.defer(task, e.error_class, e.retry_after)
+                    if delay is None:
+                        record_failure(task, str(e), e.error_class)
+                        return True
+                    if e.error_class == "circuit_open":
+                        print(f"   ⏸️  Parked {person_id} until the breaker probes")
+                    else:
+                        print(
+                            f"   ⏳ Deferred {person_id} ({e.error_class}), "
+                            f"retry in {delay:.1f}s"
+                        )
+                    return False
+                except Exception as e:
+                    record_failure(task, str(e), "unexpected")
+                    return True
 
-                print(f"\n📄 Processing file: {file_path.name}")
+                extracted_info["id"] = person_id
+                # Keep only a reference; the text is re-read on save
+                extracted_info["raw_text"] = RawTextRef(
+                    task["file_path"], task["start"], task["end"]
+                )
+                extracted_info["gender"] = task["gender"]
 
                 try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
+                    person = ProcessedPerson(**extracted_info)
+                except TypeError as e:
+                    record_failure(task, str(e), "bad_response")
+                    return True
+
+                all_processed_people.append(person)
+                completed_profiles.append({"id": person_id, "timestamp": time.time()})
+                completed_ids.add(person_id)
+                total_profiles_processed += 1
+                if task.get("attempts"):
+                    total_recovered += 1
+                print(f"   ✅ Successfully processed {person_id}")
+
+                # Remove from failed list if it was there
+                self.clear_failures(failed_profiles, [person_id])
+                return True
 
-                    person_blocks = self.processor.extract_person_blocks(content)
-                    print(
-                        f"   📊 Found {len(person_blocks)} profiles in {file_path.name}"
-                    )
+            def write_checkpoint(snapshot):
+                """Runs on the checkpoint writer thread"""
+                self.save_progress(snapshot["progress"])
+                # Save CSV incrementally to prevent data loss
+                if snapshot["people"]:
+                    self.save_checkpoint(snapshot["people"], csv_output)
+
+            # Checkpoints are written in the background; the loop only copies
+            # the lists (the people themselves are not changed once created)
+            checkpoint_writer = CheckpointWriter(write_checkpoint)
+
+            def save_if_due():
+                # Save progress periodically
+                if (
+                    total_profiles_processed + total_profiles_failed
+                ) % save_progress_interval != 0:
+                    return
+                checkpoint_writer.submit(
+                    {
+                        "progress": {
+                            "completed_profiles": list(completed_profiles),
+                            "failed_profiles": list(failed_profiles),
+                            "last_updated": time.time(),
+                            "total_processed": total_profiles_processed,
+                            "total_failed": total_profiles_failed,
+                        },
+                        "people": list(all_processed_people),
+                    }
+                )
+                print(
+                    f"   💾 Checkpoint queued ({len(all_processed_people)} profiles, "
+                    f"{total_profiles_processed} completed, {total_profiles_failed} failed)"
+                )
+
+            # Requests run on a worker per endpoint slot, so throughput grows
+            # with the pool; results are settled here, on the main thread
+            pool = self.processor.pool
+            executor = ThreadPoolExecutor(max_workers=pool.max_concurrency)
+            in_flight = {}
+
+            def collect_finished():
+                """Wait for at least one request and settle every finished one"""
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for request in finished:
+                    if settle_profile(in_flight.pop(request), request):
+                        save_if_due()
+
+            def dispatch(task):
+                while len(in_flight) >= pool.max_concurrency:
+                    collect_finished()
+                request = executor.submit(self.processor.request_extraction, task["content"])
+                in_flight[request] = task
+
+            def pause_while_circuit_open():
+                # Nothing can be sent while every breaker is open; the next
+                # request after the pause is a half-open probe
+                pause = pool.retry_in()
+                if pause > 0:
+                    print(f"   ⏸️  Circuit open, pausing dispatch for {pause:.1f}s...")
+                    time.sleep(pause)
+
+            def run_due_retries():
+                if pool.retry_in() > 0:
+                    return
+                task = retry_queue.pop_ready()
+                while task is not None:
+                    print(f"   🔁 Retrying {task['id']} (attempt {task.get('attempts', 0) + 1})...")
+                    dispatch(task)
+                    task = retry_queue.pop_ready()
+
+            for file_name, file_tasks in groupby(profile_tasks, key=itemgetter("file")):
+                file_tasks = list(file_tasks)
+                # Skip files whose profiles are all settled without reading them
+                given_up = self.given_up_ids(failed_profiles)
+                if all(
+                    task["id"] in completed_ids or task["id"] in given_up
+                    for task in file_tasks
+                ):
+                    print(f"\n⏭️  Skipping {file_name} (all profiles settled)")
+                    continue
+
+                print(f"\n📄 Processing file: {file_name}")
+                print(f"   📊 Found {len(file_tasks)} profiles in {file_name}")
 
-                    # Process each person with retry logic
-                    for i, block in enumerate(person_blocks, 1):
-                        person_id = f"{file_path.stem}_{block['番号']}"
+                try:
+                    # Process each person; failures are deferred, not slept on
+                    for i, task in enumerate(file_tasks, 1):
+                        person_id = task["id"]
 
                         # Skip if already completed
-                        if person_id in [p.get("id") for p in completed_profiles]:
+                        if person_id in completed_ids:
                             print(f"   ⏭️  Skipping {person_id} (already completed)")
                             continue
 
                         # Skip if previously failed and max retries exceeded
-                        failed_entry = next(
-                            (f for f in failed_profiles if f.get("id") == person_id),
-                            None,
-                        )
-                        if failed_entry and failed_entry.get("attempts", 0) >= 3:
+                        if person_id in given_up:
                             print(f"   ⏭️  Skipping {person_id} (max retries exceeded)")
                             continue
 
                         print(
-                            f"   🔄 Processing {person_id} ({i}/{len(person_blocks)})..."
+                            f"   🔄 Processing {person_id} ({i}/{len(file_tasks)})..."
                         )
-
-                        # Determine gender from filename
-                        gender = "female" if "women_" in file_path.name else "male"
-
-                        try:
-                            extracted_info = self.processor.call_api(block["content"])
-
-                            if extracted_info:
-                                extracted_info["id"] = person_id
-                                extracted_info["raw_text"] = block["content"]
-                                extracted_info["gender"] = gender
-
-                                from deepseek_data_processor import ProcessedPerson
-
-                                person = ProcessedPerson(**extracted_info)
-                                all_processed_people.append(person)
-                                completed_profiles.append(
-                                    {"id": person_id, "timestamp": time.time()}
-                                )
-                                total_profiles_processed += 1
-
-                                print(f"   ✅ Successfully processed {person_id}")
-
-                                # Remove from failed list if it was there
-                                failed_profiles = [
-                                    f
-                                    for f in failed_profiles
-                                    if f.get("id") != person_id
-                                ]
-
-                            else:
-                                # Add to failed list
-                                attempts = (
-                                    failed_entry.get("attempts", 0) + 1
-                                    if failed_entry
-                                    else 1
-                                )
-                                failed_profiles = [
-                                    f
-                                    for f in failed_profiles
-                                    if f.get("id") != person_id
-                                ]
-                                failed_profiles.append(
-                                    {
-                                        "id": person_id,
-                                        "attempts": attempts,
-                                        "timestamp": time.time(),
-                                        "error": "No data extracted",
-                                    }
-                                )
-                                total_profiles_failed += 1
-                                print(
-                                    f"   ❌ Failed to extract info for {person_id} (attempt {attempts})"
-                                )
-
-                        except Exception as e:
-                            # Add to failed list
-                            attempts = (
-                                failed_entry.get("attempts", 0) + 1
-                                if failed_entry
-                                else 1
-                            )
-                            failed_profiles = [
-                                f for f in failed_profiles if f.get("id") != person_id
-                            ]
-                            failed_profiles.append(
-                                {
-                                    "id": person_id,
-                                    "attempts": attempts,
-                                    "timestamp": time.time(),
-                                    "error": str(e),
-                                }
-                            )
-                            total_profiles_failed += 1
-                            print(
-                                f"   ❌ Error processing {person_id}: {e} (attempt {attempts})"
-                            )
-
-                        # Save progress periodically
-                        if (
-                            total_profiles_processed + total_profiles_failed
-                        ) % save_progress_interval == 0:
-                            # Save progress state
-                            self.save_progress(
-                                {
-                                    "completed_profiles": completed_profiles,
-                                    "failed_profiles": failed_profiles,
-                                    "last_updated": time.time(),
-                                    "total_processed": total_profiles_processed,
-                                    "total_failed": total_profiles_failed,
-                                }
-                            )
-
-                            # Save CSV incrementally to prevent data loss
-                            if all_processed_people:
-                                print(
-                                    f"   💾 Saving incremental CSV with {len(all_processed_people)} profiles..."
-                                )
-                                self.processor.save_to_csv(
-                                    all_processed_people, Path(csv_output)
-                                )
-
-                            print(
-                                f"   💾 Progress saved ({total_profiles_processed} completed, {total_profiles_failed} failed)"
-                            )
+                        task["content"] = RawTextRef(
+                            task["file_path"], task["start"], task["end"]
+                        ).load()
+                        pause_while_circuit_open()
+                        dispatch(task)
+                        run_due_retries()
 
                 except Exception as e:
-                    print(f"   ❌ Error processing file {file_path.name}: {e}")
+                    print(f"   ❌ Error processing file {file_name}: {e}")
                     continue
 
+            # Drain requests still in flight and deferred retries, sleeping
+            # only when nothing is running and no retry is due yet
+            if len(retry_queue) or in_flight:
+                print(
+                    f"\n🔁 Draining {len(in_flight)} in-flight requests and "
+                    f"{len(retry_queue)} deferred retries..."
+                )
+            while in_flight or len(retry_queue):
+                run_due_retries()
+                if in_flight:
+                    collect_finished()
+                    continue
+                ready_in = retry_queue.next_ready_in()
+                if ready_in:
+                    print(f"   ⏳ Waiting {ready_in:.1f}s for {len(retry_queue)} deferred retries...")
+                    time.sleep(ready_in)
+                pause_while_circuit_open()
+            executor.shutdown()
+            # Background checkpoints land before the final save replaces them
+            checkpoint_writer.close()
+
             # Final progress save
             self.save_progress(
                 {
@@ -398,6 +709,7 @@ class DataPipeline:
                     "last_updated": time.time(),
                     "total_processed": total_profiles_processed,
                     "total_failed": total_profiles_failed,
+                    "breaker_transitions": self.processor.pool.transitions(),
                 }
             )
 
@@ -406,7 +718,7 @@ class DataPipeline:
                 print(
                     f"💾 Saving final CSV with {len(all_processed_people)} profiles..."
                 )
-                self.processor.save_to_csv(all_processed_people, Path(csv_output))
+                self.save_checkpoint(all_processed_people, csv_output)
 
             if not all_processed_people:
                 print("❌ No profiles were processed successfully!")
@@ -415,21 +727,44 @@ class DataPipeline:
             print(f"\n📊 Processing Summary:")
             print(f"   ✅ Successfully processed: {total_profiles_processed}")
             print(f"   ❌ Failed: {total_profiles_failed}")
+            retry_stats = retry_queue.summary()
+            if retry_stats["deferred"]:
+                print(f"   🔁 Recovered after deferred retry: {total_recovered}")
+                print(f"   ⏳ Deferred by error class: {retry_stats['deferred']}")
+            if len(self.processor.pool) > 1:
+                print(f"   🔑 Requests per endpoint:")
+                for name, stats in self.processor.pool.report().items():
+                    print(
+                        f"      {name}: {stats['succeeded']} ok, "
+                        f"{stats['failed']} failed ({stats['rate_limited']} rate limited), "
+                        f"breaker {stats['state']}"
+                    )
+            breaker_transitions = self.processor.pool.transitions()
+            if breaker_transitions:
+                print(f"   🔌 Circuit breaker transitions:")
+                for transition in breaker_transitions:
+                    endpoint = (
+                        f"[{transition['endpoint']}] "
+                        if len(self.processor.pool) > 1
+                        else ""
+                    )
+                    print(
+                        f"      {transition['time']} {endpoint}{transition['from']} → "
+                        f"{transition['to']} ({transition['reason']})"
+                    )
 
             # Step 2: Final CSV verification (data saved incrementally during processing)
             print(f"\n💾 Finalizing CSV...")
-            self.processor.save_to_csv(all_processed_people, Path(csv_output))
+            self.save_checkpoint(all_processed_people, csv_output)
             print(f"✅ Final CSV saved to: {csv_output}")
 
             # Step 3: Convert to Flutter format
-            print(f"\n🔄 Converting to Flutter format...")
-            characters = self.converter.csv_to_character_data(csv_output, json_output)
-            print(f"✅ JSON saved to: {json_output}")
+            exported = self.export_flutter(all_processed_people, csv_output, json_output)
 
             # Step 4: Summary
             print(f"\n🎉 Pipeline Complete!")
             print("=" * 50)
-            print(f"📈 Total profiles processed: {len(characters)}")
+            print(f"📈 Total profiles processed: {exported}")
             print(f"📁 Files created:")
             print(f"   - {csv_output} (CSV data)")
             print(f"   - {json_output} (JSON data)")
@@ -445,6 +780,12 @@ class DataPipeline:
 
         except KeyboardInterrupt:
             print(f"\n\n⚠️  Pipeline interrupted by user")
+            if "executor" in locals():
+                # Requests still in flight are re-sent on resume
+                executor.shutdown(wait=False, cancel_futures=True)
+            if "checkpoint_writer" in locals():
+                # Flush queued checkpoints so none lands after the save below
+                checkpoint_writer.close()
             try:
                 print(
                     f"📊 Progress: {total_profiles_processed} completed, {total_profiles_failed} failed"
@@ -474,9 +815,7 @@ class DataPipeline:
                             f"💾 Saving {len(all_processed_people)} processed profiles to CSV before exit..."
                         )
                         try:
-                            self.processor.save_to_csv(
-                                all_processed_people, Path(csv_output)
-                            )
+                            self.save_checkpoint(all_processed_people, csv_output)
                             print("✅ CSV data saved successfully")
                         except Exception as csv_error:
                             print(f"⚠️  Failed to save CSV: {csv_error}")
@@ -491,6 +830,8 @@ class DataPipeline:
             return False
 
         except Exception as e:
+            if "checkpoint_writer" in locals():
+                checkpoint_writer.close()
             print(f"\n❌ Pipeline failed with unexpected error: {e}")
             try:
                 print(
@@ -500,13 +841,666 @@ class DataPipeline:
                 print("📊 Pipeline failed during initialization")
             return False
 
+    def run_batch_pipeline(
+        self,
+        input_folder: str = "raw_data",
+        csv_output: str = "output/processed_dating_profiles.csv",
+        json_output: str = "output/flutter_characters.json",
+        progress_file: str = "pipeline_progress.json",
+        batch_dir: str = "output/batches",
+        poll_interval: float = 60.0,
+        wait: bool = True,
+        endpoint=None,
+    ):
+        """Extract every pending profile through one asynchronous batch job
+
+        Submitted jobs are recorded in the progress file with the byte range
+        of each profile, so a later run (wait=False, or after an interruption)
+        polls the same job and imports its results instead of resubmitting.
+        """
+        print("📦 Starting Batch Extraction")
+        print("=" * 60)
+
+        input_path = resolve_path(input_folder)
+        csv_output = resolve_path(csv_output)
+        json_output = resolve_path(json_output)
+        endpoint = endpoint or self.processor.pool.endpoints[0]
+        client = BatchClient(endpoint)
+
+        progress = self.load_progress(progress_file) or {}
+        completed_profiles = progress.get("completed_profiles", [])
+        failed_profiles = progress.get("failed_profiles", [])
+        batch_jobs = progress.setdefault("batch_jobs", [])
+        completed_ids = {p.get("id") for p in completed_profiles}
+
+        def save():
+            progress.update(
+                {
+                    "completed_profiles": completed_profiles,
+                    "failed_profiles": failed_profiles,
+                    "last_updated": time.time(),
+                    "total_processed": len(completed_profiles),
+                    "total_failed": len(failed_profiles),
+                }
+            )
+            self.save_progress(progress, progress_file)
+
+        pending_jobs = [job for job in batch_jobs if not job.get("imported")]
+        if not pending_jobs:
+            # Step 1: Write every profile not yet completed (or given up on)
+            skip = completed_ids | self.given_up_ids(failed_profiles)
+            manifest = self.get_manifest(input_path)
+            manifest.refresh(DATA_PATTERNS)
+            tasks = [task for task in self.profile_tasks(manifest) if task["id"] not in skip]
+            for task in tasks:
+                task["content"] = RawTextRef(task["file_path"], task["start"], task["end"]).load()
+
+            if not tasks:
+                print("✅ No pending profiles, nothing to submit")
+                return True
+
+            request_file = new_batch_file(resolve_path(batch_dir))
+            count = write_batch_requests(tasks, request_file, self.processor, endpoint)
+            print(f"📝 Wrote {count} requests to {request_file}")
+
+            # Step 2: Upload and submit; record the job before anything else
+            batch = client.create(client.upload(request_file))
+            job = {
+                "batch_id": batch["id"],
+                "request_file": str(request_file),
+                "submitted": time.time(),
+                "status": batch.get("status"),
+                # custom_id -> where the profile text lives, for the import
+                "profiles": {
+                    task["id"]: {
+                        key: task[key] for key in ("file_path", "start", "end", "gender")
+                    }
+                    for task in tasks
+                },
+            }
+            batch_jobs.append(job)
+            save()
+            print(f"🚀 Submitted batch {batch['id']} with {count} profiles")
+            pending_jobs = [job]
+
+        if not wait:
+            print("💡 Run again to import the results once the batch completes")
+            return True
+
+        # Step 3: Poll each job and import its results as ProcessedPerson rows
+        csv_output.parent.mkdir(parents=True, exist_ok=True)
+        all_processed_people = []
+        if csv_output.exists() or csv_output.with_suffix(".parquet").exists():
+            all_processed_people = self.load_checkpoint(csv_output)
+        imported = failed = 0
+
+        for job in pending_jobs:
+            print(f"\n⏳ Polling batch {job['batch_id']}...")
+            batch = client.wait(job["batch_id"], poll_interval=poll_interval)
+            job["status"] = batch["status"]
+            if batch["status"] not in ("completed", "expired", "cancelled"):
+                print(f"❌ Batch {job['batch_id']} {batch['status']}")
+                job["imported"] = True  # nothing to import; resubmit next run
+                save()
+                continue
+
+            results, errors = client.results(batch, self.processor.parse_completion)
+            for person_id, location in job["profiles"].items():
+                if person_id in completed_ids:
+                    continue
+                extracted_info = results.get(person_id)
+                error = errors.get(person_id, "Not processed before the batch ended")
+                if extracted_info is not None:
+                    extracted_info["id"] = person_id
+                    extracted_info["raw_text"] = RawTextRef(
+                        location["file_path"], location["start"], location["end"]
+                    )
+                    extracted_info["gender"] = location["gender"]
+                    try:
+                        all_processed_people.append(ProcessedPerson(**extracted_info))
+                    except TypeError as e:
+                        error = str(e)
+                    else:
+                        completed_profiles.append(
+                            {"id": person_id, "timestamp": time.time()}
+                        )
+                        completed_ids.add(person_id)
+                        self.clear_failures(failed_profiles, [person_id])
+                        imported += 1
+                        continue
+
+                self.record_failure(
+                    failed_profiles, {"id": person_id, "error": error, "error_class": "batch"}
+                )
+                failed += 1
+
+            job["imported"] = True
+            if all_processed_people:
+                self.save_checkpoint(all_processed_people, csv_output)
+            save()
+
+        print(f"\n📊 Batch Summary:")
+        print(f"   ✅ Imported: {imported}")
+        print(f"   ❌ Failed: {failed} (retried in the next batch)")
+
+        if not all_processed_people:
+            print("❌ No profiles were processed successfully!")
+            return False
+
+        self.export_flutter(all_processed_people, csv_output, json_output)
+        return True
+
+    def run_parallel_pipeline(
+        self,
+        input_folder: str = "raw_data",
+        csv_output: str = "output/processed_dating_profiles.csv",
+        json_output: str = "output/flutter_characters.json",
+        progress_file: str = "pipeline_progress.json",
+        workers: Optional[int] = None,
+        unit_size: int = DEFAULT_UNIT_SIZE,
+        parts_dir: str = "output/parts",
+    ):
+        """Extract pending profiles in worker processes sharing one rate budget
+
+        Profiles are cut into units of `unit_size` consecutive blocks. Each
+        worker extracts a unit and writes it to its own part file; every
+        endpoint's rate limiter lives in shared memory, so the workers
+        together never exceed it. This process is the only writer of the
+        progress file and merges the parts into the checkpoint in file and
+        block order, so the output does not depend on scheduling.
+        """
+        print("🧵 Starting Parallel Extraction")
+        print("=" * 60)
+
+        input_path = resolve_path(input_folder)
+        csv_output = resolve_path(csv_output)
+        json_output = resolve_path(json_output)
+        parts_dir = resolve_path(parts_dir)
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        csv_output.parent.mkdir(parents=True, exist_ok=True)
+        workers = workers or os.cpu_count() or 1
+
+        progress = self.load_progress(progress_file) or {}
+        completed_profiles = progress.get("completed_profiles", [])
+        failed_profiles = progress.get("failed_profiles", [])
+        completed_ids = {p.get("id") for p in completed_profiles}
+
+        def save():
+            progress.update(
+                {
+                    "completed_profiles": completed_profiles,
+                    "failed_profiles": failed_profiles,
+                    "last_updated": time.time(),
+                    "total_processed": len(completed_profiles),
+                    "total_failed": len(failed_profiles),
+                }
+            )
+            self.save_progress(progress, progress_file)
+
+        def record_completed(person_ids):
+            for person_id in person_ids:
+                if person_id not in completed_ids:
+                    completed_profiles.append({"id": person_id, "timestamp": time.time()})
+                    completed_ids.add(person_id)
+            self.clear_failures(failed_profiles, person_ids)
+
+        # Every profile, and its file/block rank in the merged checkpoint
+        manifest = self.get_manifest(input_path)
+        manifest.refresh(DATA_PATTERNS)
+        profile_tasks = self.profile_tasks(manifest)
+        order = {}
+        for task in profile_tasks:
+            order.setdefault(task["id"], task["rank"])
+
+        def merge_into_checkpoint() -> List[ProcessedPerson]:
+            part_files = sorted(parts_dir.glob("*.csv"))
+            people = []
+            if csv_output.exists() or csv_output.with_suffix(".parquet").exists():
+                people = self.load_checkpoint(csv_output)
+            if part_files:
+                people = merge_parts(people, part_files, order)
+                print(f"💾 Merging {len(part_files)} parts into {csv_output}...")
+                self.save_checkpoint(people, csv_output)
+                for part_file in part_files:
+                    part_file.unlink()
+            return people
+
+        # Parts are written whole, so one left by an interrupted run is done;
+        # merge them first so no new unit can overwrite one
+        leftover_parts = sorted(parts_dir.glob("*.csv"))
+        if leftover_parts:
+            print(f"♻️  Recovering {len(leftover_parts)} parts from an interrupted run")
+            for part_file in leftover_parts:
+                record_completed([person.id for person in read_part(part_file)])
+            merge_into_checkpoint()
+            save()
+
+        # Step 1: Pending profiles, straight from the manifest's block index
+        skip = completed_ids | self.given_up_ids(failed_profiles)
+        tasks = [task for task in profile_tasks if task["id"] not in skip]
+
+        # Step 2: Extract the units in worker processes
+        units = plan_units(tasks, unit_size)
+        if units:
+            pool = self.processor.pool
+            limiters = [
+                SharedRateLimiter.create(endpoint.limiter.interval)
+                for endpoint in pool.endpoints
+            ]
+            settings = [endpoint_settings(endpoint) for endpoint in pool.endpoints]
+            print(
+                f"🚀 {len(tasks)} profiles in {len(units)} units on {workers} workers, "
+                f"sharing {len(pool)} endpoint rate limit(s)"
+            )
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=init_worker, initargs=(settings, limiters)
+            )
+            try:
+                futures = {
+                    executor.submit(extract_unit, unit, str(parts_dir)): unit
+                    for unit in units
+                }
+                for future in as_completed(futures):
+                    unit = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"   ❌ Unit {unit['name']} failed: {e}")
+                        for task in unit["tasks"]:
+                            self.record_failure(
+                                failed_profiles,
+                                {"id": task["id"], "error": str(e), "error_class": None},
+                            )
+                    else:
+                        record_completed(result["completed"])
+                        for failure in result["failed"]:
+                            self.record_failure(failed_profiles, failure)
+                    save()
+            except KeyboardInterrupt:
+                print(f"\n\n⚠️  Parallel extraction interrupted by user")
+                # Finished parts are kept and merged by the next run
+                executor.shutdown(wait=False, cancel_futures=True)
+                save()
+                print("💾 Progress saved. You can resume later.")
+                return False
+            executor.shutdown()
+        else:
+            print("✅ No pending profiles")
+
+        # Step 3: Deterministic merge of the checkpoint and every part
+        all_processed_people = merge_into_checkpoint()
+        save()
+
+        print(f"\n📊 Parallel Extraction Summary:")
+        print(f"   ✅ Completed: {len(completed_profiles)}")
+        print(f"   ❌ Failed: {len(failed_profiles)}")
+
+        if not all_processed_people:
+            print("❌ No profiles were processed successfully!")
+            return False
+
+        self.export_flutter(all_processed_people, csv_output, json_output)
+        return True
+
+    def run_queue_worker(
+        self,
+        queue_path: str = "output/work_queue.db",
+        input_folder: str = "raw_data",
+        csv_output: str = "output/processed_dating_profiles.csv",
+        json_output: str = "output/flutter_characters.json",
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        worker_id: Optional[str] = None,
+        poll_interval: float = 5.0,
+        export: bool = True,
+    ):
+        """Extract profiles from a work queue shared with other runs
+
+        Start one worker per machine (or several per machine) on the same
+        queue database and raw data: each seeds the queue with every
+        profile (already queued ids are kept), then claims batches under a
+        lease that a heartbeat thread extends while the requests run. The
+        extracted fields are stored in the queue, so no run overwrites
+        another's CSV; a crashed worker's leases expire and are reclaimed.
+        When nothing is pending or leased any more, the worker writes the
+        checkpoint and Flutter export from the queue's results.
+        """
+        print("🗂️  Starting Queue Worker")
+        print("=" * 60)
+
+        input_path = resolve_path(input_folder)
+        csv_output = resolve_path(csv_output)
+        json_output = resolve_path(json_output)
+        queue = LeasedWorkQueue(
+            resolve_path(queue_path), worker_id=worker_id, lease_seconds=lease_seconds
+        )
+
+        # Step 1: Seed the queue; ranks keep the merged output in file/block order
+        manifest = self.get_manifest(input_path)
+        manifest.refresh(DATA_PATTERNS)
+        tasks = [
+            # "file" is relative to each worker's own input folder
+            {key: task[key] for key in QUEUE_TASK_KEYS}
+            for task in self.profile_tasks(manifest)
+        ]
+        added = queue.add(tasks)
+        print(f"📥 Queue {queue.db_path}: {added} profiles added, {queue.counts()}")
+        print(f"👷 Worker {queue.worker_id}, {lease_seconds:.0f}s leases")
+
+        # Step 2: Claim, extract and settle until the queue is drained
+        pool = self.processor.pool
+        completed = failed = lost = 0
+
+        def settle(task, future):
+            nonlocal completed, failed, lost
+            try:
+                extracted_info = future.result()
+                if not extracted_info:
+                    raise APIError("bad_response", "No data extracted")
+                # Fields the dataclass does not know fail here, not at export
+                ProcessedPerson(**{**extracted_info, "id": task["id"], "gender": task["gender"]})
+            except APIError as e:
+                if not self.counts_as_attempt(e.error_class):
+                    retry_in = e.retry_after or pool.retry_in()
+                    stored = queue.fail(
+                        task["id"], str(e), e.error_class, retry_in, count_attempt=False
+                    )
+                else:
+                    retry_in = retry_delay(e.error_class, task["attempts"] + 1, e.retry_after)
+                    stored = queue.fail(task["id"], str(e), e.error_class, retry_in)
+                    if retry_in is None and stored:
+                        failed += 1
+                        print(f"   ❌ {task['id']}: {e}")
+            except Exception as e:
+                stored = queue.fail(task["id"], str(e))
+                if stored:
+                    failed += 1
+                    print(f"   ❌ {task['id']}: {e}")
+            else:
+                stored = queue.complete(task["id"], extracted_info)
+                if stored:
+                    completed += 1
+                    print(f"   ✅ {task['id']}")
+            if not stored:
+                lost += 1
+                print(f"   ⚠️  Lease on {task['id']} was lost; another worker has it")
+
+        def load_block(task):
+            """The queued block's text, or None when this worker's copy differs"""
+            text = RawTextRef(input_path / task["file"], task["start"], task["end"]).load()
+            if "sha1" in task and hashlib.sha1(text.encode("utf-8")).hexdigest() != task["sha1"]:
+                return None
+            return text
+
+        def mismatch(task):
+            nonlocal failed, lost
+            error = f"{task['file']} differs here from the queued block"
+            retry_in = retry_delay("source_mismatch", task["attempts"] + 1)
+            if not queue.fail(task["id"], error, "source_mismatch", retry_in):
+                lost += 1
+            elif retry_in is None:
+                failed += 1
+                print(f"   ❌ {task['id']}: {error}")
+            else:
+                print(f"   ⚠️  {task['id']}: {error}; left for another worker")
+
+        executor = ThreadPoolExecutor(max_workers=pool.max_concurrency)
+        keeper = LeaseKeeper(queue)
+        in_flight = {}
+        try:
+            with keeper:
+                while True:
+                    # Refill every free slot, so one slow request idles nothing
+                    free = pool.max_concurrency - len(in_flight)
+                    claimed = queue.claim(free) if free else []
+                    keeper.hold(task["id"] for task in claimed)
+                    for task in claimed:
+                        text = load_block(task)
+                        if text is None:
+                            mismatch(task)
+                            keeper.drop(task["id"])
+                            continue
+                        future = executor.submit(self.processor.request_extraction, text)
+                        in_flight[future] = task
+                    if claimed and len(in_flight) < pool.max_concurrency:
+                        continue  # a changed block gave its slot straight back
+                    if not in_flight:
+                        ready_in = queue.next_ready_in()
+                        if ready_in is None:
+                            break
+                        # Retries not yet due, or other workers' leases
+                        time.sleep(min(max(ready_in, 0.05), poll_interval))
+                        continue
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        task = in_flight.pop(future)
+                        settle(task, future)
+                        keeper.drop(task["id"])
+        except KeyboardInterrupt:
+            print(f"\n\n⚠️  Queue worker interrupted by user")
+            executor.shutdown(wait=False, cancel_futures=True)
+            # Unfinished claims go straight back instead of waiting out the lease
+            queue.release(keeper.held)
+            print("💾 Finished profiles are in the queue. Start a worker to resume.")
+            return False
+        executor.shutdown()
+
+        print(f"\n📊 Queue Worker Summary:")
+        print(f"   ✅ Completed here: {completed}")
+        print(f"   ❌ Failed here: {failed}")
+        if lost:
+            print(f"   ⚠️  Leases lost: {lost}")
+        print(f"   🗂️  Queue: {queue.counts()}")
+
+        if not export:
+            return True
+
+        # Step 3: Checkpoint and Flutter export from every worker's results
+        people = [
+            ProcessedPerson(
+                **{
+                    **task["result"],
+                    "id": task["id"],
+                    "gender": task["gender"],
+                    "raw_text": RawTextRef(
+                        input_path / task["file"], task["start"], task["end"]
+                    ),
+                }
+            )
+            for task in queue.results()
+        ]
+        if not people:
+            print("❌ No profiles were processed successfully!")
+            return False
+
+        csv_output.parent.mkdir(parents=True, exist_ok=True)
+        print(f"💾 Saving {len(people)} profiles to {csv_output}...")
+        self.save_checkpoint(people, csv_output)
+        self.export_flutter(people, csv_output, json_output)
+        return True
+
+    def run_watch_mode(
+        self,
+        input_folder: str = "raw_data",
+        csv_output: str = "output/processed_dating_profiles.csv",
+        json_output: str = "output/flutter_characters.json",
+        progress_file: str = "pipeline_progress.json",
+        debounce: float = 2.0,
+        poll_interval: float = 1.0,
+        stop: Optional[threading.Event] = None,
+    ):
+        """Keep the CSV and Flutter JSON in step with raw_data, without prompts
+
+        Catches up once, then polls the folder. When new or changed
+        men_*/women_* files have been quiet for `debounce` seconds, only the
+        blocks whose content hash is new (per the manifest) are extracted
+        and the checkpoint and Flutter JSON are rewritten. Completed
+        profiles remember their block hash in the progress file, so an
+        edited block is extracted again; profiles whose file or block was
+        deleted are dropped from the outputs. Runs until `stop` is set or Ctrl+C.
+        """
+        print("👀 Starting Watch Mode")
+        print("=" * 60)
+
+        input_path = resolve_path(input_folder)
+        csv_output = resolve_path(csv_output)
+        json_output = resolve_path(json_output)
+        csv_output.parent.mkdir(parents=True, exist_ok=True)
+        stop = stop or threading.Event()
+
+        file_patterns = DATA_PATTERNS
+        # Started first, so files landing during the catch-up are not missed
+        watcher = RawDataWatcher(input_path, file_patterns, debounce=debounce)
+        manifest = self.get_manifest(input_path)
+
+        progress = self.load_progress(progress_file) or {}
+        completed = {p.get("id"): p for p in progress.get("completed_profiles", [])}
+        failed_profiles = progress.get("failed_profiles", [])
+        people = {}
+        if csv_output.exists() or csv_output.with_suffix(".parquet").exists():
+            people = {person.id: person for person in self.load_checkpoint(csv_output)}
+
+        def update(reason: str) -> int:
+            """Extract new and changed blocks, then rewrite the outputs"""
+            manifest.refresh(file_patterns)
+            given_up = self.given_up_ids(failed_profiles)
+            order = {}
+            tasks = []
+            profile_tasks = self.profile_tasks(manifest, file_patterns)
+            self.repoint_raw_texts(people.values(), profile_tasks)
+            for task in profile_tasks:
+                person_id = task["id"]
+                order.setdefault(person_id, task["rank"])
+                entry = completed.get(person_id)
+                if entry is not None:
+                    # Profiles completed before hashes were kept count as current
+                    if entry.setdefault("sha1", task["sha1"]) == task["sha1"]:
+                        continue
+                elif person_id in given_up:
+                    continue
+                tasks.append(task)
+            # Profiles whose file or block is gone leave the outputs too
+            removed = (people.keys() | completed.keys()) - order.keys()
+            for person_id in removed:
+                people.pop(person_id, None)
+                completed.pop(person_id, None)
+            self.clear_failures(failed_profiles, removed)
+            if not tasks and not removed:
+                print(f"✅ {reason}: nothing new to extract")
+                return 0
+
+            if removed:
+                print(f"\n🗑️ {reason}: {len(removed)} profiles no longer in {input_path.name}")
+            extracted, failures = [], []
+            if tasks:
+                print(f"\n🔄 {reason}: extracting {len(tasks)} new or changed profiles...")
+                extracted, failures = extract_tasks(self.processor, tasks)
+            hashes = {task["id"]: task["sha1"] for task in tasks}
+            for person in extracted:
+                people[person.id] = person
+                completed[person.id] = {
+                    "id": person.id,
+                    "timestamp": time.time(),
+                    "sha1": hashes[person.id],
+                }
+            self.clear_failures(failed_profiles, [person.id for person in extracted])
+            for failure in failures:
+                attempts = self.record_failure(failed_profiles, failure)
+                print(f"   ❌ Failed {failure['id']}: {failure['error']} (attempt {attempts})")
+
+            progress.update(
+                {
+                    "completed_profiles": list(completed.values()),
+                    "failed_profiles": failed_profiles,
+                    "last_updated": time.time(),
+                    "total_processed": len(completed),
+                    "total_failed": len(failed_profiles),
+                }
+            )
+            self.save_progress(progress, progress_file)
+            if tasks:
+                print(f"   ✅ {len(extracted)} extracted, {len(failures)} failed")
+
+            if people or removed:
+                ordered = order_people(people, order)
+                self.save_checkpoint(ordered, csv_output)
+                self.export_flutter(ordered, csv_output, json_output)
+            return len(tasks)
+
+        try:
+            update("Catching up")
+            print(f"\n👀 Watching {input_path} (debounce {debounce:.1f}s), Ctrl+C to stop")
+            while not stop.is_set():
+                batch = watcher.poll()
+                if batch:
+                    update(f"{', '.join(batch)} changed")
+                    continue
+                stop.wait(poll_interval)
+        except KeyboardInterrupt:
+            print(f"\n\n⚠️  Watch mode stopped by user")
+        return True
+
+    def run_schema_migration(
+        self,
+        csv_output: str = "output/processed_dating_profiles.csv",
+        json_output: str = "output/flutter_characters.json",
+        field_specs: Optional[dict] = None,
+        batch_size: int = 10,
+        cache_file: Optional[str] = None,
+    ):
+        """Fill in fields added to the extraction schema for stored profiles
+
+        Only the new fields are requested, several profiles per request, so
+        a schema change costs a fraction of a full re-extraction.
+        """
+        print("🧬 Schema Migration")
+        print("=" * 60)
+
+        csv_output = resolve_path(csv_output)
+        json_output = resolve_path(json_output)
+        if field_specs is None:
+            field_specs = detect_added_fields(csv_output)
+        if not field_specs:
+            print("✅ Stored profiles already have every schema field")
+            return True
+
+        people = self.load_checkpoint(csv_output)
+        full_chars, delta_chars = estimate_prompt_chars(field_specs, people, batch_size)
+        print(f"🆕 New fields: {', '.join(field_specs)}")
+        print(
+            f"   📊 {len(people)} profiles in {-(-len(people) // batch_size)} requests, "
+            f"prompt size {delta_chars / full_chars:.0%} of a full re-extraction"
+        )
+
+        extractor = FieldDeltaExtractor(
+            self.processor,
+            field_specs,
+            cache_file=resolve_path(cache_file) if cache_file else None,
+            batch_size=batch_size,
+        )
+        answers = extractor.extract(people)
+        updated = merge_answers(people, answers)
+
+        stats = extractor.stats
+        print(f"\n📊 Migration Summary:")
+        print(f"   ✅ Updated: {updated} ({stats['cached']} from cache)")
+        print(f"   🔥 API requests: {stats['requests']}")
+        if stats["failed"]:
+            print(f"   ❌ No answer: {stats['failed']} (run again to retry)")
+
+        # Columns are only added once every profile has been asked
+        if stats["failed"]:
+            return False
+        self.save_checkpoint(people, csv_output)
+        self.export_flutter(people, csv_output, json_output)
+        return True
+
     def run_test_pipeline(self, test_file: str = "men_100.md", max_profiles: int = 10):
         """Run a small test of the pipeline"""
 
         print("🧪 Running Test Pipeline")
         print("=" * 30)
 
-        input_path = Path("raw_data") / test_file
+        input_path = resolve_path("raw_data") / test_file
         if not input_path.exists():
             print(f"❌ Test file {input_path} not found!")
             return False
@@ -536,8 +1530,6 @@ class DataPipeline:
                 extracted_info = self.processor.call_api(text)
 
                 if extracted_info:
-                    from deepseek_data_processor import ProcessedPerson
-
                     extracted_info["id"] = person_id
                     extracted_info["raw_text"] = text
 
@@ -549,10 +1541,10 @@ class DataPipeline:
 
             if processed_people:
                 # Save test results
-                test_csv = "output/test_profiles.csv"
-                test_json = "output/test_characters.json"
+                test_csv = resolve_path("output/test_profiles.csv")
+                test_json = resolve_path("output/test_characters.json")
 
-                self.processor.save_to_csv(processed_people, Path(test_csv))
+                self.processor.save_to_csv(processed_people, test_csv)
 
                 # Convert CSV to Flutter format
                 try:
@@ -587,14 +1579,23 @@ def main():
 
     pipeline = DataPipeline(API_KEY)
 
+    # Non-interactive: `python data_pipeline.py --watch` follows raw_data
+    if "--watch" in sys.argv[1:]:
+        pipeline.run_watch_mode()
+        return
+
     print("\nChoose an option:")
     print("1. Run test pipeline (10 profiles, minimal cost)")
     print("2. Run full pipeline with cost estimation")
     print("3. Run custom pipeline (specify parameters)")
     print("4. Check prerequisites and estimate costs only")
+    print("5. Run bulk extraction as a batch job (asynchronous, cheaper)")
+    print("6. Extract newly added schema fields for processed profiles")
+    print("7. Run full extraction in parallel worker processes")
+    print("8. Join a shared work queue as an extraction worker (several machines)")
 
     try:
-        choice = input("\nEnter your choice (1-4): ").strip()
+        choice = input("\nEnter your choice (1-8): ").strip()
 
         if choice == "1":
             print("\n🧪 Running test pipeline...")
@@ -605,7 +1606,7 @@ def main():
             if not pipeline.check_prerequisites():
                 return
 
-            estimate = pipeline.estimate_cost(["men_*.md", "women_*.md"])
+            estimate = pipeline.estimate_cost(DATA_PATTERNS)
             print(f"\n📊 Full Pipeline Estimation:")
             print(f"   Total profiles: {estimate['total_profiles']}")
             print(f"   Estimated time: {estimate['estimated_time_minutes']} minutes")
@@ -664,6 +1665,28 @@ def main():
                     )
                     print("   - Consider running overnight or in background")
             return
+        elif choice == "5":
+            print("\n📦 Running bulk extraction as a batch job...")
+            if not pipeline.check_prerequisites():
+                return
+            success = pipeline.run_batch_pipeline()
+        elif choice == "6":
+            print("\n🧬 Checking the stored profiles against the schema...")
+            success = pipeline.run_schema_migration()
+        elif choice == "7":
+            print("\n🧵 Running extraction in parallel worker processes...")
+            if not pipeline.check_prerequisites():
+                return
+            success = pipeline.run_parallel_pipeline()
+        elif choice == "8":
+            queue_path = (
+                input("Work queue database (default: output/work_queue.db): ").strip()
+                or "output/work_queue.db"
+            )
+            print(f"\n🗂️  Extracting profiles from the work queue {queue_path}...")
+            if not pipeline.check_prerequisites():
+                return
+            success = pipeline.run_queue_worker(queue_path=queue_path)
         else:
             print("❌ Invalid choice!")
             return
@@ -671,8 +1694,8 @@ def main():
         if success:
             print("\n🎉 Pipeline completed successfully!")
             print("\nNext steps:")
-            print("1. Copy the generated Dart file to your Flutter project")
-            print("2. Import and use the data in your app")
+            print("1. lib/data/generated_characters_data.dart now holds the new data")
+            print("2. Rebuild the Flutter app to bundle it")
             print("3. Test the integration")
         else:
             print("\n❌ Pipeline failed. Check the error messages above.")
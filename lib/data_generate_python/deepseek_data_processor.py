@@ -3,12 +3,17 @@ import json
 import time
 import re
 import csv
+import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
-import requests
+from typing import List, Dict, Any, Optional, Union
+from dataclasses import dataclass, fields
 from datetime import datetime
 
+if __package__:
+    from .endpoint_pool import Endpoint, EndpointPool
+else:
+    from endpoint_pool import Endpoint, EndpointPool
+
 
 def normalize_hobbies(hobbies_str: str) -> List[str]:
     """Split and normalize hobbies to avoid redundancy"""
@@ -25,12 +30,143 @@ def normalize_hobbies(hobbies_str: str) -> List[str]:
     return sorted(unique_hobbies)
 
 
-@dataclass
+def _normalize_block_header(person_content: str) -> Dict[str, Any]:
+    """Rewrite the first line of a block (after 编号) to a clean '编号N' header"""
+    person_number = None
+
+    if "\n" in person_content:
+
+        # extract the number ID
+        first_line = person_content[: person_content.find("\n")]
+        match = re.search(r"(\d+)", first_line)
+        person_number = match.group(1) if match else "None"
+
+        person_content = (
+            "编号"
+            + person_number
+            + "\n"
+            + person_content[person_content.find("\n") + 1 :]
+        )
+
+    return {"content": person_content, "番号": person_number}
+
+
+def split_person_blocks(content: str) -> List[Dict[str, Any]]:
+    """Split markdown content into person blocks, keeping UTF-8 byte offsets
+
+    Each block carries the byte range [start, end) of its source segment
+    (starting at the 编号 marker) so it can be re-read from disk later.
+    """
+    person_blocks = []
+    positions = [m.start() for m in re.finditer("编号", content)]
+    byte_pos = len(content[: positions[0]].encode("utf-8")) if positions else 0
+
+    for i, start in enumerate(positions):
+        end = positions[i + 1] if i + 1 < len(positions) else len(content)
+        segment = content[start:end]
+        segment_bytes = len(segment.encode("utf-8"))
+
+        # Drop the 编号 marker itself, then normalize the header line
+        block = _normalize_block_header(segment[len("编号") :])
+        if block["content"]:
+            block["id"] = i + 1
+            block["start"] = byte_pos
+            block["end"] = byte_pos + segment_bytes
+            person_blocks.append(block)
+
+        byte_pos += segment_bytes
+
+    return person_blocks
+
+
+class RawTextRef:
+    """Reference to a person block in its source file (path plus byte range)
+
+    Holding this instead of the block text keeps large runs small; the text
+    is read back from disk only when it is written out.
+    """
+
+    __slots__ = ("path", "start", "end")
+
+    def __init__(self, path, start: int, end: int):
+        self.path = sys.intern(str(path))  # shared by every block of a file
+        self.start = start
+        self.end = end
+
+    def load(self) -> str:
+        """Read the block and normalize it exactly like split_person_blocks"""
+        with open(self.path, "rb") as f:
+            f.seek(self.start)
+            segment = f.read(self.end - self.start).decode("utf-8")
+        return _normalize_block_header(segment[len("编号") :])["content"]
+
+    def __repr__(self):
+        return f"RawTextRef({self.path!r}, {self.start}, {self.end})"
+
+
+# Short, highly repeated values shared across profiles via sys.intern
+CATEGORICAL_FIELDS = (
+    "gender",
+    "birth_year",
+    "zodiac",
+    "mbti",
+    "hometown",
+    "current_location",
+    "education",
+    "marital_status",
+)
+
+
+# Extraction prompt; part of the prebuild fingerprint, so edits invalidate caches
+SYSTEM_PROMPT = """
+你是一个专业的个人信息提取助手。用户将提供包含个人档案信息的中文文本。
+
+请严格按以下JSON格式返回提取到的所有信息，未提及的字段返回null。
+注意：性别将由系统根据文件名自动确定，无需从文本中提取。
+
+{
+    "birth_year": "出生年份（4位数字字符串，如'1990'）或null",
+    "zodiac": "星座或null", 
+    "mbti": "MBTI性格类型（4字母，如'ENTJ'）或null",
+    "height_cm": "身高厘米数（整数）或null",
+    "weight_kg": "体重千克数（整数）或null",
+    "hometown": "家乡/出生地或null",
+    "current_location": "现居住地/地区或null", 
+    "education": "学历或null",
+    "occupation": "职业或null",
+    "annual_income": "年收入描述或null",
+    "hobbies": "爱好兴趣（合并为一个字符串）或null",
+    "personality": "性格描述或null",
+    "has_house": "是否有房（true/false/null）",
+    "has_car": "是否有车（true/false/null）",
+    "marital_status": "婚姻状况或null",
+    "partner_preferences": "择偶要求或null",
+    "self_introduction": "自我介绍或null"
+}
+
+提取规则：
+1. 年份转换：81年->1981年，04年->2004年，2位数年份：>30加1900，<=30加2000
+2. 单位转换：自动转换身高体重到厘米和千克
+3. 房车状态：从"有房无车"、"无房有车"等文本中提取布尔值
+4. ：将所有爱好合并为一个字符串合并相似字段
+5. 只返回JSON，不要其他文字说明
+6. 不要提取性别信息（系统会自动处理）
+
+示例输入："81年生，身高180，体重85，松户，沈阳，大学，软件，天蝎，有房无车，离婚，爱好：书法，摄影"
+示例输出：{"birth_year":"1981","zodiac":"天蝎","height_cm":180,"weight_kg":85,"hometown":"沈阳","current_location":"松户","education":"大学","occupation":"软件","hobbies":"书法，摄影","has_house":true,"has_car":false,"marital_status":"离婚"}
+"""
+
+
+@dataclass(slots=True)
 class ProcessedPerson:
-    """Data structure for processed person information"""
+    """Data structure for processed person information
+
+    Slotted, with interned categorical values; raw_text may be a RawTextRef
+    that is only resolved when the person is written out (see to_dict).
+    """
 
     id: str
-    raw_text: Optional[str] = None
+    raw_text: Optional[Union[str, RawTextRef]] = None
 
     # Basic info
     gender: Optional[str] = None
@@ -84,6 +220,50 @@ class ProcessedPerson:
             normalized_hobbies = normalize_hobbies(self.hobbies)
             self.hobbies = ", ".join(normalized_hobbies)
 
+        # Share one string object per distinct categorical value
+        for name in CATEGORICAL_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
+    def get_raw_text(self) -> Optional[str]:
+        """Return raw_text, loading it from the source file if it is a reference"""
+        if isinstance(self.raw_text, RawTextRef):
+            return self.raw_text.load()
+        return self.raw_text
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Field dict with raw_text resolved, ready for CSV/JSON output"""
+        data = {field.name: getattr(self, field.name) for field in fields(self)}
+        data["raw_text"] = self.get_raw_text()
+        return data
+
+
+class APIError(Exception):
+    """A failed extraction request, classified for retry scheduling
+
+    error_class is one of the retry_queue.RETRY_POLICIES keys; retry_after is
+    the server's Retry-After in seconds, when it sent one.
+    """
+
+    def __init__(
+        self, error_class: str, message: str, retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.error_class = error_class
+        self.retry_after = retry_after
+
+
+# Failures of the endpoint rather than the profile: try another endpoint
+FAILOVER_ERROR_CLASSES = {"rate_limit", "server", "timeout", "network"}
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
 
 class DeepSeekProcessor:
     """Process personal data using DeepSeek API with cost control"""
@@ -95,84 +275,60 @@ class DeepSeekProcessor:
         delay_between_requests: float = 3.5,
         max_retries: int = 3,
         retry_delay: float = 5.0,
+        endpoints: Optional[List[Endpoint]] = None,
     ):
         self.api_key = api_key
-        self.base_url = "https://api.deepseek.com/v1/chat/completions"
         self.max_requests_per_minute = max_requests_per_minute
-        self.delay_between_requests = delay_between_requests
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.request_count = 0
-        self.start_time = time.time()
 
-        self.system_prompt = """
-你是一个专业的个人信息提取助手。用户将提供包含个人档案信息的中文文本。
-
-请严格按以下JSON格式返回提取到的所有信息，未提及的字段返回null。
-注意：性别将由系统根据文件名自动确定，无需从文本中提取。
-
-{
-    "birth_year": "出生年份（4位数字字符串，如'1990'）或null",
-    "zodiac": "星座或null", 
-    "mbti": "MBTI性格类型（4字母，如'ENTJ'）或null",
-    "height_cm": "身高厘米数（整数）或null",
-    "weight_kg": "体重千克数（整数）或null",
-    "hometown": "家乡/出生地或null",
-    "current_location": "现居住地/地区或null", 
-    "education": "学历或null",
-    "occupation": "职业或null",
-    "annual_income": "年收入描述或null",
-    "hobbies": "爱好兴趣（合并为一个字符串）或null",
-    "personality": "性格描述或null",
-    "has_house": "是否有房（true/false/null）",
-    "has_car": "是否有车（true/false/null）",
-    "marital_status": "婚姻状况或null",
-    "partner_preferences": "择偶要求或null",
-    "self_introduction": "自我介绍或null"
-}
-
-提取规则：
-1. 年份转换：81年->1981年，04年->2004年，2位数年份：>30加1900，<=30加2000
-2. 单位转换：自动转换身高体重到厘米和千克
-3. 房车状态：从"有房无车"、"无房有车"等文本中提取布尔值
-4. ：将所有爱好合并为一个字符串合并相似字段
-5. 只返回JSON，不要其他文字说明
-6. 不要提取性别信息（系统会自动处理）
-
-示例输入："81年生，身高180，体重85，松户，沈阳，大学，软件，天蝎，有房无车，离婚，爱好：书法，摄影"
-示例输出：{"birth_year":"1981","zodiac":"天蝎","height_cm":180,"weight_kg":85,"hometown":"沈阳","current_location":"松户","education":"大学","occupation":"软件","hobbies":"书法，摄影","has_house":true,"has_car":false,"marital_status":"离婚"}
-"""
-
-    def rate_limit_control(self):
-        """Control API request rate to avoid costs"""
-        self.request_count += 1
-
-        # Check if we've exceeded the rate limit
-        elapsed_time = time.time() - self.start_time
-        if elapsed_time < 60 and self.request_count >= self.max_requests_per_minute:
-            sleep_time = 60 - elapsed_time
-            print(f"Rate limit reached. Sleeping for {sleep_time:.1f} seconds...")
-            time.sleep(sleep_time)
-            self.request_count = 0
-            self.start_time = time.time()
+        self.system_prompt = SYSTEM_PROMPT
+        # Requests go to the endpoint with the most headroom; each endpoint
+        # has its own rate limiter and circuit breaker. Without a pool the
+        # single key talks to DeepSeek as before.
+        if not endpoints:
+            endpoints = [
+                Endpoint(
+                    api_key,
+                    max_requests_per_minute=max_requests_per_minute,
+                    delay_between_requests=delay_between_requests,
+                )
+            ]
+        self.pool = EndpointPool(endpoints)
 
-        # Delay between requests
-        time.sleep(self.delay_between_requests)
+    @property
+    def delay_between_requests(self) -> float:
+        """Effective seconds per request across the pool"""
+        return self.pool.delay_between_requests
 
-    def call_api(self, text: str) -> Dict[str, Any]:
-        """Make API call with retry logic and rate limiting"""
+    def call_api(self, text: str, **options) -> Dict[str, Any]:
+        """Make API call with retry logic and rate limiting
 
-        for attempt in range(self.max_retries + 1):  # +1 for initial attempt
+        `options` (system_prompt, max_tokens) are passed to request_extraction.
+        """
+        attempt = 0
+        while True:
             try:
-                return self._make_api_request(text)
-            except requests.exceptions.RequestException as e:
+                return self.request_extraction(text, **options)
+            except APIError as e:
+                if e.error_class == "circuit_open":
+                    # Endpoint is down; waiting for the probe is not an attempt
+                    print(f"⏸️  {e}; waiting before the next probe...")
+                    time.sleep(e.retry_after)
+                    continue
+                if e.error_class in ("bad_response", "unexpected"):
+                    print(f"❌ Unexpected error during API call: {e}")
+                    return {}
                 if attempt < self.max_retries:
                     wait_time = self.retry_delay * (2**attempt)  # Exponential backoff
+                    if e.error_class == "rate_limit":
+                        wait_time = max(wait_time, e.retry_after or self.retry_delay * 2)
                     print(
                         f"⚠️  API request failed (attempt {attempt + 1}/{self.max_retries + 1}): {e}"
                     )
                     print(f"🔄 Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
+                    attempt += 1
                 else:
                     print(
                         f"❌ API request failed after {self.max_retries + 1} attempts: {e}"
@@ -182,45 +338,94 @@ class DeepSeekProcessor:
                 print(f"❌ Unexpected error during API call: {e}")
                 return {}
 
-        return {}
-
-    def _make_api_request(self, text: str) -> Dict[str, Any]:
-        """Make the actual API request (internal method)"""
-        self.rate_limit_control()
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+    def request_extraction(
+        self, text: str, system_prompt: Optional[str] = None, max_tokens: int = 1000
+    ) -> Dict[str, Any]:
+        """Make a single extraction without sleeping on failure
+
+        Errors are raised as APIError with an error class, so the caller can
+        defer the profile (see retry_queue.py) and keep processing others.
+        An endpoint failure that says nothing about the profile (rate limit,
+        server error, timeout, network) fails over to the next endpoint with
+        headroom, so one request may touch several endpoints. While every
+        endpoint's circuit breaker is open no request is sent and the error
+        class is "circuit_open". `system_prompt` replaces the extraction
+        prompt (e.g. for a field-delta request).
+        """
+        tried = set()
+        last_error = None
+        while True:
+            endpoint = self.pool.acquire(exclude=tried)
+            if endpoint is None:
+                if last_error is None or self.pool.retry_in() > 0:
+                    raise APIError(
+                        "circuit_open",
+                        f"{last_error or 'All endpoints unavailable'} (circuit open)",
+                        self.pool.retry_in(),
+                    ) from last_error
+                raise last_error
 
-        payload = {
-            "model": "deepseek-chat",
+            try:
+                result = self._make_api_request(
+                    text, endpoint, system_prompt=system_prompt, max_tokens=max_tokens
+                )
+            except Exception as e:
+                error = self._classify_error(e)
+                endpoint.stats["failed"] += 1
+                if error.error_class == "rate_limit":
+                    endpoint.stats["rate_limited"] += 1
+                    endpoint.limiter.cooldown(error.retry_after or self.retry_delay)
+                endpoint.breaker.record_failure(error.error_class)
+                if error.error_class not in FAILOVER_ERROR_CLASSES:
+                    raise error from e
+                tried.add(endpoint)
+                last_error = error
+                continue
+            finally:
+                self.pool.release(endpoint)
+
+            endpoint.stats["succeeded"] += 1
+            endpoint.breaker.record_success()
+            return result
+
+    @staticmethod
+    def _classify_error(error: Exception) -> "APIError":
+        import requests
+
+        if isinstance(error, APIError):
+            return error
+        if isinstance(error, requests.exceptions.Timeout):
+            return APIError("timeout", str(error))
+        if isinstance(error, requests.exceptions.HTTPError):
+            return APIError("client", str(error))
+        if isinstance(error, requests.exceptions.RequestException):
+            return APIError("network", str(error))
+        if isinstance(error, (ValueError, KeyError, IndexError, TypeError)):
+            return APIError("bad_response", f"Unreadable API response: {error}")
+        return APIError("unexpected", str(error))
+
+    def build_payload(
+        self,
+        text: str,
+        model: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 1000,
+    ) -> Dict[str, Any]:
+        """Chat completion request body for one profile block"""
+        return {
+            "model": model,
             "messages": [
-                {"role": "system", "content": self.system_prompt},
+                {"role": "system", "content": system_prompt or self.system_prompt},
                 {"role": "user", "content": text},
             ],
             "temperature": 0.1,  # Low temperature for consistent extraction
-            "max_tokens": 1000,
+            "max_tokens": max_tokens,
             "stream": False,
         }
 
-        response = requests.post(
-            self.base_url, headers=headers, json=payload, timeout=30
-        )
-
-        # Handle specific HTTP status codes
-        if response.status_code == 429:  # Rate limit exceeded
-            print("⚠️  Rate limit exceeded, waiting longer...")
-            time.sleep(self.retry_delay * 2)
-            raise requests.exceptions.RequestException("Rate limit exceeded")
-        elif response.status_code >= 500:  # Server errors
-            raise requests.exceptions.RequestException(
-                f"Server error: {response.status_code}"
-            )
-
-        response.raise_for_status()
-
-        result = response.json()
+    @staticmethod
+    def parse_completion(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Extracted fields from a chat completion response body"""
         content = result["choices"][0]["message"]["content"].strip()
 
         # Extract JSON from response
@@ -231,40 +436,41 @@ class DeepSeekProcessor:
             print(f"⚠️  No JSON found in response: {content}")
             return {}
 
-    def extract_person_blocks(self, content: str) -> List[Dict[str, str]]:
-        """Extract individual person blocks from markdown content"""
-        person_blocks = []
-
-        # Split by person entries (编号XX pattern)
-        pattern = r"编号"
-        splits = re.split(pattern, content)
-
-        # Process splits in pairs (id, content)
-        for i in range(1, len(splits)):
-            person_id = i
-            person_content = splits[i]
-            person_number = None
-
-            if "\n" in person_content:
-
-                # extract the number ID
-                first_line = person_content[: person_content.find("\n")]
-                match = re.search(r"(\d+)", first_line)
-                person_number = match.group(1) if match else "None"
-
-                person_content = (
-                    "编号"
-                    + person_number
-                    + "\n"
-                    + person_content[person_content.find("\n") + 1 :]
-                )
+    def _make_api_request(
+        self,
+        text: str,
+        endpoint: Endpoint,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 1000,
+    ) -> Dict[str, Any]:
+        """Make the actual API request (internal method)"""
+        import requests
 
-            if person_content:
-                person_blocks.append(
-                    {"id": person_id, "content": person_content, "番号": person_number}
-                )  # id is assigned by my code, 番号 is assigned by the administrator
+        headers = {
+            "Authorization": f"Bearer {endpoint.api_key}",
+            "Content-Type": "application/json",
+        }
+        payload = self.build_payload(text, endpoint.model, system_prompt, max_tokens)
 
-        return person_blocks
+        response = requests.post(endpoint.url, headers=headers, json=payload, timeout=30)
+
+        # Handle specific HTTP status codes
+        # The caller decides how long to wait; nothing sleeps here
+        if response.status_code == 429:  # Rate limit exceeded
+            raise APIError(
+                "rate_limit", "Rate limit exceeded", _retry_after_seconds(response)
+            )
+        elif response.status_code >= 500:  # Server errors
+            raise APIError("server", f"Server error: {response.status_code}")
+
+        response.raise_for_status()
+
+        return self.parse_completion(response.json())
+
+    def extract_person_blocks(self, content: str) -> List[Dict[str, str]]:
+        """Extract individual person blocks from markdown content"""
+        # id is assigned by my code, 番号 is assigned by the administrator
+        return split_person_blocks(content)
 
     def determine_gender_from_filename(self, file_path: Path) -> Optional[str]:
         """Determine gender from filename pattern"""
@@ -370,7 +576,8 @@ class DeepSeekProcessor:
         print(f"\nProcessing complete!")
         print(f"Files processed: {processed_files}")
         print(f"Total people processed: {len(all_people)}")
-        print(f"Total API requests made: {self.request_count}")
+        requests_made = sum(stats["requests"] for stats in self.pool.report().values())
+        print(f"Total API requests made: {requests_made}")
 
         return all_people
 
@@ -381,11 +588,19 @@ class DeepSeekProcessor:
 
         fieldnames = list(ProcessedPerson.__dataclass_fields__.keys())
 
-        with open(output_file, "w", newline="", encoding="utf-8-sig") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for person in people:
-                writer.writerow(asdict(person))
+        # Temp file plus rename: an interrupted save leaves the old CSV intact
+        output_file = Path(output_file)
+        tmp_file = output_file.with_name(f".{output_file.name}.tmp")
+        try:
+            with open(tmp_file, "w", newline="", encoding="utf-8-sig") as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer.writeheader()
+                for person in people:
+                    writer.writerow(person.to_dict())
+            os.replace(tmp_file, output_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
 
         print(f"Data saved to {output_file}")
 
@@ -0,0 +1,216 @@
+"""
+Endpoint Pool
+Spreads extraction requests over several API keys / OpenAI-compatible
+endpoints, each with its own rate limiter and circuit breaker
+"""
+
+import os
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+if __package__:
+    from .circuit_breaker import CLOSED, CircuitBreaker, CircuitOpenError
+else:
+    from circuit_breaker import CLOSED, CircuitBreaker, CircuitOpenError
+
+DEFAULT_BASE_URL = "https://api.deepseek.com/v1"
+DEFAULT_MODEL = "deepseek-chat"
+
+
+def chat_completions_url(base_url: str) -> str:
+    """Accept either an API root (".../v1") or the full completions URL"""
+    base_url = base_url.rstrip("/")
+    if base_url.endswith("/chat/completions"):
+        return base_url
+    return f"{base_url}/chat/completions"
+
+
+class RateLimiter:
+    """Spaces requests at a fixed interval and honours server cooldowns
+
+    Each request reserves the next free send slot, so concurrent callers
+    queue up behind each other instead of all sleeping the same delay.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_minute: float,
+        min_interval: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.interval = max(60.0 / max_requests_per_minute, min_interval)
+        self.clock = clock
+        self.next_free = 0.0
+
+    def wait_time(self) -> float:
+        """Seconds until the next slot (0 if a request could go now)"""
+        return max(0.0, self.next_free - self.clock())
+
+    def reserve(self) -> float:
+        """Take the next slot; return how long the caller must wait for it"""
+        now = self.clock()
+        slot = max(now, self.next_free)
+        self.next_free = slot + self.interval
+        return slot - now
+
+    def cooldown(self, seconds: float):
+        """Hold back new requests for `seconds` (e.g. after a 429)"""
+        self.next_free = max(self.next_free, self.clock() + seconds)
+
+
+class Endpoint:
+    """One API key at one OpenAI-compatible base URL"""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        model: str = DEFAULT_MODEL,
+        name: Optional[str] = None,
+        max_requests_per_minute: float = 20,
+        delay_between_requests: float = 0.0,
+        max_concurrency: int = 1,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.api_key = api_key
+        self.url = chat_completions_url(base_url)
+        self.api_root = self.url[: -len("/chat/completions")]
+        self.model = model
+        self.name = name or f"{self.url} …{api_key[-4:]}"
+        self.limiter = RateLimiter(max_requests_per_minute, delay_between_requests)
+        self.max_concurrency = max_concurrency
+        self.breaker = breaker or CircuitBreaker()
+        self.in_flight = 0
+        self.stats = {"requests": 0, "succeeded": 0, "failed": 0, "rate_limited": 0}
+
+    def __repr__(self):
+        return f"Endpoint({self.name!r})"
+
+
+class EndpointPool:
+    """Routes each request to the healthy endpoint with the most headroom
+
+    Headroom is how soon the endpoint's limiter has a free slot, then how
+    busy it is. Endpoints whose breaker is open are skipped until their probe
+    is due; a caller can exclude endpoints it already tried, to fail over.
+    """
+
+    def __init__(self, endpoints: List[Endpoint]):
+        if not endpoints:
+            raise ValueError("EndpointPool needs at least one endpoint")
+        self.endpoints = list(endpoints)
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    @property
+    def max_concurrency(self) -> int:
+        """Requests the pool can usefully have in flight at once"""
+        return sum(endpoint.max_concurrency for endpoint in self.endpoints)
+
+    @property
+    def delay_between_requests(self) -> float:
+        """Effective pool-wide seconds per request, for time estimates"""
+        return 1.0 / sum(1.0 / endpoint.limiter.interval for endpoint in self.endpoints)
+
+    def retry_in(self) -> float:
+        """Seconds until any endpoint accepts a request (0 if one does now)"""
+        return min(endpoint.breaker.retry_in() for endpoint in self.endpoints)
+
+    def acquire(self, exclude: Optional[Set[Endpoint]] = None) -> Optional[Endpoint]:
+        """Reserve a send slot on the best endpoint, sleeping until it is due
+
+        Returns None when every endpoint not in `exclude` has an open
+        breaker. Call release() when the request is done.
+        """
+        exclude = exclude or set()
+        with self._condition:
+            while True:
+                candidates = [
+                    endpoint
+                    for endpoint in self.endpoints
+                    if endpoint not in exclude and endpoint.breaker.retry_in() == 0
+                ]
+                if not candidates:
+                    return None
+                available = [
+                    endpoint
+                    for endpoint in candidates
+                    if endpoint.in_flight < endpoint.max_concurrency
+                ]
+                if not available:
+                    self._condition.wait()
+                    continue
+
+                endpoint = min(
+                    available,
+                    key=lambda e: (e.limiter.wait_time(), e.in_flight / e.max_concurrency),
+                )
+                try:
+                    endpoint.breaker.before_call()
+                except CircuitOpenError:
+                    # Another caller took the half-open probe
+                    exclude = exclude | {endpoint}
+                    continue
+                endpoint.in_flight += 1
+                endpoint.stats["requests"] += 1
+                wait = endpoint.limiter.reserve()
+                break
+
+        if wait > 0:
+            time.sleep(wait)
+        return endpoint
+
+    def release(self, endpoint: Endpoint):
+        with self._condition:
+            endpoint.in_flight -= 1
+            self._condition.notify_all()
+
+    def report(self) -> Dict[str, Any]:
+        """Per-endpoint request counts and breaker transitions"""
+        return {
+            endpoint.name: {
+                **endpoint.stats,
+                "state": endpoint.breaker.state,
+                "transitions": endpoint.breaker.transitions,
+            }
+            for endpoint in self.endpoints
+        }
+
+    def transitions(self) -> List[Dict[str, Any]]:
+        """Every endpoint's breaker transitions, oldest first"""
+        transitions = [
+            {**transition, "endpoint": endpoint.name}
+            for endpoint in self.endpoints
+            for transition in endpoint.breaker.transitions
+        ]
+        return sorted(transitions, key=lambda transition: transition["time"])
+
+    def healthy_count(self) -> int:
+        return sum(endpoint.breaker.state == CLOSED for endpoint in self.endpoints)
+
+
+def load_endpoints(config_file, **defaults) -> List[Endpoint]:
+    """Build endpoints from a JSON list of endpoint settings
+
+    Each entry takes the Endpoint arguments; "api_key_env" names an
+    environment variable to read the key from, so the file holds no secrets.
+    `defaults` fill in settings an entry leaves out.
+    """
+    with open(Path(config_file), "r", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    endpoints = []
+    for entry in entries:
+        settings = {**defaults, **entry}
+        key_variable = settings.pop("api_key_env", None)
+        if key_variable:
+            settings["api_key"] = os.environ.get(key_variable, "")
+        if not settings.get("api_key"):
+            raise ValueError(f"No API key for endpoint {entry}")
+        endpoints.append(Endpoint(**settings))
+    return endpoints
@@ -0,0 +1,239 @@
+"""
+Profile Image Cache
+Fetches profile image URLs concurrently, dedupes identical images by content
+hash and writes fixed-size thumbnails into a content-addressed asset folder
+"""
+
+import io
+import os
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+current_dir = Path(__file__).parent
+project_root = current_dir.parent.parent
+
+# Thumbnails live under the Flutter assets folder, named by content hash, so
+# the "thumbnail" path in a character record is also its asset key
+DEFAULT_THUMBNAIL_DIR = project_root / "assets" / "thumbnails"
+DEFAULT_INDEX = current_dir / "output" / "image_index.json"
+
+INDEX_VERSION = 1
+THUMBNAIL_SIZE = (480, 640)  # bounding box; aspect ratio is kept
+THUMBNAIL_QUALITY = 80
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+SAVE_EVERY = 20  # index checkpoints while fetching, for resume
+
+
+def _require_pillow():
+    try:
+        from PIL import Image, ImageOps
+    except ImportError as e:
+        raise ImportError(
+            "Thumbnails need Pillow. Run: pip install Pillow"
+        ) from e
+    return Image, ImageOps
+
+
+class ImageCache:
+    """Content-addressed thumbnail cache for profile image URLs
+
+    The index maps each fetched URL to the sha256 of its bytes and the
+    thumbnail path; URLs already in the index are never fetched again, so an
+    interrupted run resumes where it stopped. Failed URLs are retried next run.
+    """
+
+    def __init__(
+        self,
+        thumbnail_dir=None,
+        index_file=None,
+        max_workers: int = 8,
+        timeout: float = 30,
+        asset_root=None,
+    ):
+        self.thumbnail_dir = Path(thumbnail_dir or DEFAULT_THUMBNAIL_DIR)
+        self.index_file = Path(index_file or DEFAULT_INDEX)
+        # Thumbnail paths are recorded relative to this folder (the Flutter
+        # project root, where asset keys start)
+        self.asset_root = Path(asset_root or project_root)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.index: Dict[str, Dict[str, str]] = self._load_index()
+        self._lock = threading.Lock()
+        self._hash_locks: Dict[str, threading.Lock] = {}
+
+    def _load_index(self) -> Dict[str, Dict[str, str]]:
+        if not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != INDEX_VERSION:
+            return {}
+        return data.get("urls", {})
+
+    def save_index(self):
+        """Write the URL index atomically (temp file plus rename)"""
+        with self._lock:
+            data = {"version": INDEX_VERSION, "urls": dict(sorted(self.index.items()))}
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_name(f".{self.index_file.name}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_file, self.index_file)
+
+    def thumbnails(self) -> Dict[str, str]:
+        """URL -> thumbnail path for every cached image (no network)"""
+        return {
+            url: entry["thumbnail"]
+            for url, entry in self.index.items()
+            if (self.asset_root / entry["thumbnail"]).exists()
+        }
+
+    def _thumbnail_path(self, digest: str) -> Path:
+        return self.thumbnail_dir / f"{digest}.jpg"
+
+    def _download(self, url: str) -> bytes:
+        import requests
+
+        with requests.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                size += len(chunk)
+                if size > MAX_IMAGE_BYTES:
+                    raise ValueError(f"image larger than {MAX_IMAGE_BYTES} bytes")
+                chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _write_thumbnail(self, data: bytes, target: Path):
+        Image, ImageOps = _require_pillow()
+        with Image.open(io.BytesIO(data)) as image:
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail(THUMBNAIL_SIZE)
+            image = image.convert("RGB")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = target.with_name(f".{target.name}.{threading.get_ident()}.tmp")
+            image.save(tmp_file, "JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+        os.replace(tmp_file, target)
+
+    def _fetch_one(self, url: str) -> Dict[str, Any]:
+        data = self._download(url)
+        digest = hashlib.sha256(data).hexdigest()
+        target = self._thumbnail_path(digest)
+
+        # One thumbnail per distinct image, even if several URLs race for it
+        with self._lock:
+            hash_lock = self._hash_locks.setdefault(digest, threading.Lock())
+        with hash_lock:
+            duplicate = target.exists()
+            if not duplicate:
+                self._write_thumbnail(data, target)
+
+        entry = {
+            "sha256": digest,
+            "thumbnail": target.relative_to(self.asset_root).as_posix(),
+        }
+        return {"entry": entry, "bytes": len(data), "duplicate": duplicate}
+
+    def prefetch(self, urls: Iterable[Optional[str]]) -> Dict[str, Any]:
+        """Fetch and thumbnail every URL not already cached
+
+        Returns a report with fetched/cached/duplicate/failed counts.
+        """
+        _require_pillow()  # fail before any download if thumbnails cannot be made
+        pending: List[str] = []
+        cached = 0
+        for url in dict.fromkeys(url for url in urls if url):
+            entry = self.index.get(url)
+            if entry and (self.asset_root / entry["thumbnail"]).exists():
+                cached += 1
+            else:
+                pending.append(url)
+
+        report = {
+            "fetched": 0,
+            "cached": cached,
+            "duplicates": 0,
+            "failed": {},
+            "bytes": 0,
+        }
+        if not pending:
+            return report
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {pool.submit(self._fetch_one, url): url for url in pending}
+                for done, future in enumerate(as_completed(futures), 1):
+                    url = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        report["failed"][url] = str(e)
+                        continue
+                    with self._lock:
+                        self.index[url] = result["entry"]
+                    report["fetched"] += 1
+                    report["bytes"] += result["bytes"]
+                    report["duplicates"] += int(result["duplicate"])
+                    if done % SAVE_EVERY == 0:
+                        self.save_index()
+        finally:
+            self.save_index()
+        return report
+
+    def add_thumbnails(
+        self, characters: List[Dict[str, Any]], fetch: bool = True
+    ) -> Dict[str, Any]:
+        """Set each character's "thumbnail" from its "image", fetching if needed"""
+        report = {}
+        if fetch:
+            report = self.prefetch(character.get("image") for character in characters)
+        thumbnails = self.thumbnails()
+        for character in characters:
+            character["thumbnail"] = thumbnails.get(character.get("image"))
+        return report
+
+
+def print_prefetch_report(report: Dict[str, Any]):
+    """Print a prefetch report in the pipeline's style"""
+    print(
+        f"🖼️ Images: {report['fetched']} fetched "
+        f"({report['bytes'] / 1e6:.1f} MB), {report['cached']} cached, "
+        f"{report['duplicates']} duplicate content"
+    )
+    if report["failed"]:
+        print(f"⚠️  {len(report['failed'])} images failed (retried next run)")
+        for url, error in list(report["failed"].items())[:5]:
+            print(f"   ❌ {url}: {error}")
+
+
+def main():
+    """Prefetch thumbnails for the generated Flutter JSON and update it"""
+    json_file = current_dir / "output" / "flutter_characters.json"
+    if not json_file.exists():
+        print(f"❌ {json_file} not found. Run the pipeline first.")
+        return
+
+    with open(json_file, "r", encoding="utf-8") as f:
+        characters = json.load(f)
+
+    cache = ImageCache()
+    report = cache.add_thumbnails(characters)
+    print_prefetch_report(report)
+
+    tmp_file = json_file.with_name(f".{json_file.name}.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(characters, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, json_file)
+    print(f"✅ Updated {json_file}")
+
+
+if __name__ == "__main__":
+    main()
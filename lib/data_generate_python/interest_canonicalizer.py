@@ -0,0 +1,235 @@
+"""
+Interest Canonicalizer
+Maps free-text hobbies to a canonical interest vocabulary (with synonyms) in
+one linear pass using an Aho-Corasick automaton
+"""
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Canonical interest -> surface forms that mean the same thing. The canonical
+# name itself is always matched, so only synonyms need listing. Longer forms
+# win over shorter ones ("自驾游" is 自驾, not 旅游), and a form containing a
+# known interest maps to it ("看电影" -> 电影, "打羽毛球" -> 羽毛球).
+INTEREST_SYNONYMS: Dict[str, List[str]] = {
+    "旅游": ["旅行", "旅遊", "出行"],
+    "摄影": ["拍照", "拍摄", "相机", "相機"],
+    "健身": ["健身房", "锻炼", "撸铁"],
+    "滑雪": ["单板", "双板"],
+    "爬山": ["登山"],
+    "徒步": [],
+    "户外": ["露营", "大自然"],
+    "游泳": [],
+    "做饭": ["做菜", "料理", "烹饪", "下厨", "下廚", "煮饭", "烘焙"],
+    "美食": ["探店", "吃好吃的", "干饭"],
+    "游戏": ["打游戏", "玩游戏", "电子游戏", "主机游戏", "手游", "端游", "lol", "csgo", "王者"],
+    "电影": [],
+    "追剧": ["看剧", "刷剧", "电视剧", "日剧", "韩剧", "美剧"],
+    "动漫": ["二次元", "动画", "番剧"],
+    "唱歌": ["k歌", "ktv", "卡拉ok", "麦霸"],
+    "音乐": ["听歌", "演唱会", "音乐会", "livehouse"],
+    "阅读": ["看书", "读书", "小说", "文学"],
+    "看展": ["展览", "艺术展", "美术馆", "博物馆"],
+    "温泉": ["泡汤", "岩盘浴"],
+    "散步": ["walk", "city walk", "citywalk"],
+    "跑步": ["长跑", "马拉松"],
+    "骑行": ["骑车", "自行车"],
+    "自驾": ["自驾游", "开车", "兜风", "驾驶"],
+    "羽毛球": [],
+    "篮球": [],
+    "足球": [],
+    "网球": [],
+    "乒乓球": [],
+    "台球": [],
+    "瑜伽": ["普拉提"],
+    "潜水": [],
+    "冲浪": [],
+    "滑板": [],
+    "钓鱼": ["钓钓鱼"],
+    "逛街": ["逛超市", "购物"],
+    "宠物": ["撸猫", "吸猫", "养猫", "养狗", "猫咖", "小动物"],
+    "画画": ["绘画", "写生"],
+    "书法": [],
+    "钢琴": ["弹琴"],
+    "吉他": ["电吉他", "弹吉他"],
+    "桌游": ["桌遊", "剧本杀", "狼人杀", "麻将", "日麻", "卡牌"],
+    "乐高": ["拼乐高", "模型", "手办"],
+    "喝茶": ["品茗", "红茶"],
+    "喝酒": ["小酌", "调酒"],
+    "运动": ["体育运动", "各种运动"],
+    "舞蹈": ["跳舞", "现代舞", "街舞"],
+    "历史": [],
+    "追星": [],
+}
+
+# Forms that contain an interest but mean the opposite; they are consumed
+# without producing one ("不喝酒" must not become 喝酒)
+NEGATED_FORMS = ["不抽烟", "不喝酒", "不咋喝酒", "不怎么喝酒", "不喜欢户外"]
+
+# Unknown segments longer than this are free text, not a hobby name, and a
+# profile lists at most MAX_INTERESTS interests, in order of first appearance
+MAX_SEGMENT_LENGTH = 12
+MAX_INTERESTS = 10
+
+SEGMENT = re.compile(r"[^,，;；、/|\s]+")
+SEGMENT_STRIP = "（）()[]【】「」.。!！?？~～-·・"
+
+
+class AhoCorasick:
+    """Multi-pattern matcher returning leftmost-longest non-overlapping hits"""
+
+    def __init__(self, patterns: Dict[str, Optional[int]]):
+        # Trie as parallel lists: goto transitions, failure links, the
+        # pattern (length, value) ending at each state, and dictionary links
+        # to the nearest state down the failure chain that ends a pattern
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Optional[Tuple[int, Optional[int]]]] = [None]
+        self._dict_link: List[int] = [0]
+
+        for pattern, value in patterns.items():
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(None)
+                    self._dict_link.append(0)
+                state = next_state
+            self._output[state] = (len(pattern), value)
+
+        # Breadth-first failure links; every pattern ending at a state is
+        # its own output plus those along its dictionary links
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                target = target if target != next_state else 0
+                self._fail[next_state] = target
+                self._dict_link[next_state] = (
+                    target if self._output[target] is not None else self._dict_link[target]
+                )
+
+    def find(self, text: str) -> List[Tuple[int, int, Optional[int]]]:
+        """Return (start, end, value) for leftmost-longest non-overlapping hits"""
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        candidates = []
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            # Every pattern ending here, not just the longest: a shorter one
+            # may start after a match that ends earlier
+            hit_state = state if output[state] is not None else dict_link[state]
+            while hit_state:
+                length, value = output[hit_state]
+                candidates.append((end - length, end, value))
+                hit_state = dict_link[hit_state]
+
+        # Candidates are ordered by end; pick leftmost, then longest
+        candidates.sort(key=lambda hit: (hit[0], hit[0] - hit[1]))
+        matches = []
+        last_end = 0
+        for start, end, value in candidates:
+            if start >= last_end:
+                matches.append((start, end, value))
+                last_end = end
+        return matches
+
+
+class InterestCanonicalizer:
+    """Canonicalize hobby strings against INTEREST_SYNONYMS
+
+    Segments (split on the usual separators) that contain known interests are
+    replaced by their canonical names; segments with no known interest are
+    kept as written unless they are longer than MAX_SEGMENT_LENGTH, and at
+    most MAX_INTERESTS interests are returned. Results are cached per
+    input string, since the same hobby strings repeat across the corpus.
+    """
+
+    def __init__(
+        self,
+        synonyms: Optional[Dict[str, List[str]]] = None,
+        negated_forms: Optional[List[str]] = None,
+        cache_size: int = 65536,
+    ):
+        synonyms = INTEREST_SYNONYMS if synonyms is None else synonyms
+        negated_forms = NEGATED_FORMS if negated_forms is None else negated_forms
+
+        self.vocabulary: List[str] = list(synonyms)
+        self._index = {name: i for i, name in enumerate(self.vocabulary)}
+        patterns: Dict[str, Optional[int]] = {}
+        for interest_id, canonical in enumerate(self.vocabulary):
+            for form in [canonical, *synonyms[canonical]]:
+                patterns[form.lower()] = interest_id
+        for form in negated_forms:
+            patterns[form.lower()] = None
+
+        self._automaton = AhoCorasick(patterns)
+        self.canonicalize = lru_cache(maxsize=cache_size)(self._canonicalize)
+
+    def interest_ids(self, hobbies_str: str) -> List[int]:
+        """Vocabulary indices of the known interests in a hobby string"""
+        index = self._index
+        return [index[name] for name in self.canonicalize(hobbies_str) if name in index]
+
+    def _canonicalize(self, hobbies_str: str) -> Tuple[str, ...]:
+        """Return canonical interests in order of first appearance, deduped"""
+        if not hobbies_str:
+            return ()
+
+        text = hobbies_str.lower()
+        if len(text) != len(hobbies_str):
+            text = hobbies_str  # lower() changed offsets; match case-sensitively
+        matches = self._automaton.find(text)
+
+        result: List[str] = []
+        seen = set()
+
+        def add(name: str):
+            if name and name not in seen:
+                seen.add(name)
+                result.append(name)
+
+        # Walk segments and matches together; both are ordered by position. A
+        # match may span a separator ("city walk"), covering later segments.
+        match_index = 0
+        covered_until = 0
+        for segment in SEGMENT.finditer(text):
+            consumed = segment.start() < covered_until
+            while match_index < len(matches) and matches[match_index][0] < segment.end():
+                _, end, interest_id = matches[match_index]
+                match_index += 1
+                consumed = True
+                covered_until = max(covered_until, end)
+                if interest_id is not None:
+                    add(self.vocabulary[interest_id])
+            if not consumed:
+                original = hobbies_str[segment.start() : segment.end()].strip(SEGMENT_STRIP)
+                if len(original) <= MAX_SEGMENT_LENGTH:
+                    add(original)
+        return tuple(result[:MAX_INTERESTS])
+
+
+@lru_cache(maxsize=1)
+def get_canonicalizer() -> InterestCanonicalizer:
+    """Shared canonicalizer, built on first use"""
+    return InterestCanonicalizer()
+
+
+def canonicalize_interests(hobbies_str: Optional[str]) -> List[str]:
+    """Canonical interests for a hobby string using the shared vocabulary"""
+    if not hobbies_str:
+        return []
+    return list(get_canonicalizer().canonicalize(str(hobbies_str)))
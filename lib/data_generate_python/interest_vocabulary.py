@@ -0,0 +1,153 @@
+"""
+Interest Vocabulary
+Corpus-level interest vocabulary with counts, accumulated in one streaming
+pass over converted profiles and updated incrementally between runs
+"""
+
+import os
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+VOCABULARY_VERSION = 1
+
+current_dir = Path(__file__).parent
+DEFAULT_VOCABULARY = current_dir / "output" / "interest_vocabulary.json"
+
+
+class InterestVocabulary:
+    """Global interest -> integer id mapping with per-profile interest ids
+
+    Ids are assigned in first-seen order and never reused or renumbered, so
+    ids already shipped in the app stay valid when profiles are appended.
+    The saved file lists interests ranked by how many profiles mention them.
+    """
+
+    def __init__(self, vocabulary_file=None):
+        self.vocabulary_file = Path(vocabulary_file or DEFAULT_VOCABULARY)
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.counts: Counter = Counter()
+        self.profiles: Dict[str, List[int]] = {}
+
+    @classmethod
+    def load(cls, vocabulary_file=None) -> "InterestVocabulary":
+        """Load a saved vocabulary, or start an empty one"""
+        vocabulary = cls(vocabulary_file)
+        if not vocabulary.vocabulary_file.exists():
+            return vocabulary
+        try:
+            with open(vocabulary.vocabulary_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return vocabulary  # unreadable: rebuild from scratch
+        if data.get("version") != VOCABULARY_VERSION:
+            return vocabulary
+
+        entries = sorted(data.get("interests", []), key=lambda entry: entry["id"])
+        for entry in entries:
+            vocabulary.ids[entry["name"]] = entry["id"]
+            vocabulary.names.append(entry["name"])
+        vocabulary.profiles = {
+            profile_id: list(ids) for profile_id, ids in data.get("profiles", {}).items()
+        }
+        for ids in vocabulary.profiles.values():
+            vocabulary.counts.update(ids)
+        return vocabulary
+
+    def interest_id(self, name: str) -> int:
+        """Id of an interest, assigning the next free id to a new one"""
+        interest_id = self.ids.get(name)
+        if interest_id is None:
+            interest_id = len(self.names)
+            self.ids[name] = interest_id
+            self.names.append(name)
+        return interest_id
+
+    def add_profile(self, profile_id: str, interests: Iterable[str]) -> List[int]:
+        """Record (or update) one profile's interests and return their ids"""
+        ids = [self.interest_id(name) for name in interests]
+        previous = self.profiles.get(profile_id)
+        if previous != ids:
+            if previous:
+                self.counts.subtract(previous)
+            self.counts.update(ids)
+            self.profiles[profile_id] = ids
+        return ids
+
+    def update(
+        self, characters: Iterable[Dict[str, Any]], prune: bool = False
+    ) -> Dict[str, int]:
+        """Stream character dicts through the vocabulary, setting interest_ids
+
+        With prune=True, profiles that did not appear are dropped (the input
+        is the whole corpus rather than newly appended profiles).
+        """
+        report: Dict[str, int] = {}
+        for _ in self.stream(characters, prune=prune, report=report):
+            pass
+        return report
+
+    def stream(
+        self,
+        characters: Iterable[Dict[str, Any]],
+        prune: bool = False,
+        report: Optional[Dict[str, int]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """update() as a generator: yields each character with interest_ids set
+
+        `report` is filled in (and profiles pruned) once the input is
+        exhausted, so a writer can pass characters on without keeping them.
+        """
+        report = {} if report is None else report
+        known_ids = set(self.profiles)
+        vocabulary_size = len(self.names)
+        report.update({"added": 0, "updated": 0, "unchanged": 0, "removed": 0})
+        seen = set()
+
+        for character in characters:
+            profile_id = character["id"]
+            previous = self.profiles.get(profile_id)
+            character["interest_ids"] = self.add_profile(
+                profile_id, character.get("interests") or []
+            )
+            seen.add(profile_id)
+            if profile_id not in known_ids:
+                report["added"] += 1
+            elif previous != character["interest_ids"]:
+                report["updated"] += 1
+            else:
+                report["unchanged"] += 1
+            yield character
+
+        if prune:
+            for profile_id in known_ids - seen:
+                self.counts.subtract(self.profiles.pop(profile_id))
+                report["removed"] += 1
+
+        report["new_interests"] = len(self.names) - vocabulary_size
+
+    def ranked(self) -> List[Dict[str, Any]]:
+        """Interests by profile count (descending), ties broken by id"""
+        order = sorted(range(len(self.names)), key=lambda i: (-self.counts[i], i))
+        return [
+            {"id": i, "name": self.names[i], "count": self.counts[i], "rank": rank}
+            for rank, i in enumerate(order, 1)
+        ]
+
+    def save(self, vocabulary_file=None):
+        """Write the ranked vocabulary and per-profile ids atomically"""
+        target = Path(vocabulary_file or self.vocabulary_file)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": VOCABULARY_VERSION,
+            "total_profiles": len(self.profiles),
+            "interests": self.ranked(),
+            "profiles": self.profiles,
+        }
+        tmp_file = target.with_name(f".{target.name}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_file, target)
+
@@ -0,0 +1,228 @@
+"""
+Parallel Extraction
+Multi-process extraction: pending profiles are cut into block ranges that
+worker processes extract independently while sharing one rate budget per
+endpoint. Each range is written to its own CSV part; the parent process
+records progress and merges the parts in a fixed (file, block) order
+"""
+
+import os
+import csv
+import time
+import multiprocessing
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List
+
+if __package__:
+    from .deepseek_data_processor import (
+        APIError,
+        DeepSeekProcessor,
+        ProcessedPerson,
+        RawTextRef,
+    )
+    from .endpoint_pool import Endpoint
+    from .processed_store import person_from_csv_row
+    from .retry_queue import DeferredRetryQueue
+else:
+    from deepseek_data_processor import (
+        APIError,
+        DeepSeekProcessor,
+        ProcessedPerson,
+        RawTextRef,
+    )
+    from endpoint_pool import Endpoint
+    from processed_store import person_from_csv_row
+    from retry_queue import DeferredRetryQueue
+
+current_dir = Path(__file__).parent
+DEFAULT_PARTS_DIR = current_dir / "output" / "parts"
+DEFAULT_UNIT_SIZE = 10  # profiles per work unit (and per part file)
+
+
+class SharedRateLimiter:
+    """RateLimiter whose next free slot lives in shared memory
+
+    Every worker process reserves its send slots from the same value, so
+    any number of workers together stay within one endpoint's rate limit.
+    Same interface as endpoint_pool.RateLimiter; pass it to the workers
+    when they are started (shared memory is inherited, not pickled).
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        next_free,
+        lock,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.interval = interval
+        self._next_free = next_free
+        self._lock = lock
+        self.clock = clock
+
+    @classmethod
+    def create(cls, interval: float, context=None) -> "SharedRateLimiter":
+        context = context or multiprocessing.get_context()
+        return cls(interval, context.RawValue("d", 0.0), context.Lock())
+
+    @property
+    def next_free(self) -> float:
+        return self._next_free.value
+
+    def wait_time(self) -> float:
+        """Seconds until the next slot (0 if a request could go now)"""
+        return max(0.0, self._next_free.value - self.clock())
+
+    def reserve(self) -> float:
+        """Take the next slot; return how long the caller must wait for it"""
+        with self._lock:
+            now = self.clock()
+            slot = max(now, self._next_free.value)
+            self._next_free.value = slot + self.interval
+        return slot - now
+
+    def cooldown(self, seconds: float):
+        """Hold back every worker's requests for `seconds` (e.g. after a 429)"""
+        with self._lock:
+            self._next_free.value = max(self._next_free.value, self.clock() + seconds)
+
+
+def endpoint_settings(endpoint: Endpoint) -> Dict[str, Any]:
+    """Endpoint arguments a worker needs to rebuild the endpoint"""
+    return {
+        "api_key": endpoint.api_key,
+        "base_url": endpoint.api_root,
+        "model": endpoint.model,
+        "name": endpoint.name,
+        "max_concurrency": endpoint.max_concurrency,
+    }
+
+
+def plan_units(tasks: List[Dict[str, Any]], unit_size: int = DEFAULT_UNIT_SIZE):
+    """Cut tasks into units of consecutive blocks of one file
+
+    Units are named after the file and block range, so a unit's part file
+    has the same name however the units are scheduled.
+    """
+    units = []
+    by_file: Dict[str, List[Dict[str, Any]]] = {}
+    for task in tasks:
+        by_file.setdefault(task["file_path"], []).append(task)
+    for file_path, file_tasks in by_file.items():
+        stem = Path(file_path).stem
+        for first in range(0, len(file_tasks), unit_size):
+            unit_tasks = file_tasks[first : first + unit_size]
+            name = f"{stem}_{unit_tasks[0]['block']:05d}-{unit_tasks[-1]['block']:05d}"
+            units.append({"name": name, "tasks": unit_tasks})
+    return units
+
+
+# Per-process state of a worker, set up once by init_worker
+_worker: Dict[str, Any] = {}
+
+
+def init_worker(settings: List[Dict[str, Any]], limiters: List[SharedRateLimiter]):
+    """Build the worker's processor on endpoints that share the parent's limiters"""
+    endpoints = []
+    for endpoint_args, limiter in zip(settings, limiters):
+        endpoint = Endpoint(**endpoint_args)
+        endpoint.limiter = limiter
+        endpoints.append(endpoint)
+    _worker["processor"] = DeepSeekProcessor(endpoints[0].api_key, endpoints=endpoints)
+
+
+def extract_tasks(processor: DeepSeekProcessor, tasks: List[Dict[str, Any]]):
+    """Extract tasks one after another, retrying deferred ones at the end
+
+    Returns the extracted people and the failures ({"id", "error",
+    "error_class"}) of the tasks whose attempts were used up.
+    """
+    retry_queue = DeferredRetryQueue()
+    people: List[ProcessedPerson] = []
+    failed: List[Dict[str, Any]] = []
+
+    def attempt(task):
+        text = RawTextRef(task["file_path"], task["start"], task["end"]).load()
+        try:
+            extracted_info = processor.request_extraction(text)
+            if not extracted_info:
+                raise APIError("bad_response", "No data extracted")
+            extracted_info.update(id=task["id"], raw_text=text, gender=task["gender"])
+            people.append(ProcessedPerson(**extracted_info))
+        except APIError as e:
+            if retry_queue.defer(task, e.error_class, e.retry_after) is None:
+                failed.append({"id": task["id"], "error": str(e), "error_class": e.error_class})
+        except Exception as e:
+            failed.append({"id": task["id"], "error": str(e), "error_class": None})
+
+    for task in tasks:
+        attempt(task)
+    for task in retry_queue.drain():
+        attempt(task)
+    return people, failed
+
+
+def extract_unit(unit: Dict[str, Any], parts_dir) -> Dict[str, Any]:
+    """Extract one unit's profiles in a worker and write them to its part
+
+    Failed requests are deferred and retried inside the worker (other
+    workers keep going meanwhile). Returns the completed ids and the
+    failures for the parent to record.
+    """
+    people, failed = extract_tasks(_worker["processor"], unit["tasks"])
+
+    part_file = Path(parts_dir) / f"{unit['name']}.csv"
+    if people:
+        write_part(people, part_file)
+    print(f"   📦 [{os.getpid()}] {unit['name']}: {len(people)} done, {len(failed)} failed")
+    return {
+        "name": unit["name"],
+        "completed": [person.id for person in people],
+        "failed": failed,
+    }
+
+
+def write_part(people: List[ProcessedPerson], part_file):
+    """Write a unit's people as CSV, atomically (a part is complete or absent)"""
+    part_file = Path(part_file)
+    part_file.parent.mkdir(parents=True, exist_ok=True)
+    fieldnames = list(ProcessedPerson.__dataclass_fields__.keys())
+    tmp_file = part_file.with_name(f".{part_file.name}.tmp")
+    with open(tmp_file, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for person in people:
+            writer.writerow(person.to_dict())
+    os.replace(tmp_file, part_file)
+
+
+def read_part(part_file) -> List[ProcessedPerson]:
+    with open(part_file, "r", encoding="utf-8-sig", newline="") as f:
+        return [person_from_csv_row(row) for row in csv.DictReader(f)]
+
+
+def merge_parts(
+    base_people: List[ProcessedPerson],
+    part_files: Iterable[Path],
+    order: Dict[str, Any],
+) -> List[ProcessedPerson]:
+    """Checkpointed people plus every part, one row per id, in a fixed order
+
+    `order` maps profile ids to sort keys (file, block); ids it does not
+    know keep their checkpoint order after the known ones. The result does
+    not depend on which worker wrote which part or when.
+    """
+    merged = {person.id: person for person in base_people}
+    for part_file in sorted(part_files):
+        for person in read_part(part_file):
+            merged[person.id] = person
+    return order_people(merged, order)
+
+
+def order_people(
+    people: Dict[str, ProcessedPerson], order: Dict[str, Any]
+) -> List[ProcessedPerson]:
+    """People by id in `order`'s (file, block) order, unknown ids last"""
+    known = sorted((pid for pid in people if pid in order), key=order.__getitem__)
+    unknown = [pid for pid in people if pid not in order]
+    return [people[pid] for pid in known + unknown]
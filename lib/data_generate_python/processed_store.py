@@ -0,0 +1,253 @@
+"""
+Processed Profile Store
+Typed columnar (Parquet) checkpoint of processed profiles with an explicit
+schema, plus the CSV row parser kept for older checkpoints. raw_text that is
+a RawTextRef is stored as the reference, not the text
+"""
+
+import os
+import sys
+from dataclasses import fields
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+if __package__:
+    from .deepseek_data_processor import ProcessedPerson, RawTextRef
+else:
+    from deepseek_data_processor import ProcessedPerson, RawTextRef
+
+SCHEMA_VERSION = "2"
+
+# Column name -> storage type. Heights and weights are stored as doubles so
+# float answers survive; integral values are turned back into ints on load.
+COLUMN_TYPES = {
+    "id": "string",
+    "raw_text": "string",
+    "gender": "category",
+    "birth_year": "category",
+    "age": "int32",
+    "zodiac": "category",
+    "mbti": "category",
+    "height_cm": "float64",
+    "weight_kg": "float64",
+    "bmi": "float64",
+    "hometown": "category",
+    "current_location": "category",
+    "education": "category",
+    "occupation": "string",
+    "annual_income": "string",
+    "hobbies": "string",
+    "personality": "string",
+    "has_house": "bool",
+    "has_car": "bool",
+    "marital_status": "category",
+    "partner_preferences": "string",
+    "self_introduction": "string",
+}
+
+# Where raw_text is read from when it is a reference into raw_data (the
+# raw_text column is then null)
+REF_COLUMN_TYPES = {
+    "raw_text_path": "category",
+    "raw_text_start": "int64",
+    "raw_text_end": "int64",
+}
+REF_COLUMNS = list(REF_COLUMN_TYPES)
+
+TRUE_WORDS = {"true", "1", "yes", "y"}
+FALSE_WORDS = {"false", "0", "no", "n"}
+
+
+def parquet_available() -> bool:
+    """Whether pyarrow is installed (Parquet checkpoints are optional)"""
+    import importlib.util
+
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet checkpoints need pyarrow. Run: pip install pyarrow"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def processed_schema():
+    """Build the explicit Arrow schema for processed profiles"""
+    pa, _ = _require_pyarrow()
+    arrow_types = {
+        "string": pa.string(),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "int32": pa.int32(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+    }
+    return pa.schema(
+        [
+            pa.field(name, arrow_types[kind])
+            for name, kind in {**COLUMN_TYPES, **REF_COLUMN_TYPES}.items()
+        ],
+        metadata={"schema_version": SCHEMA_VERSION},
+    )
+
+
+def _to_number(value) -> Optional[float]:
+    """Parse ints, floats and negative numbers; anything else becomes None"""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if number != number else number  # drop NaN
+
+
+def _to_int_if_integral(value):
+    number = _to_number(value)
+    if number is None:
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def _to_bool(value) -> Optional[bool]:
+    if value is None or isinstance(value, bool):
+        return value
+    word = str(value).strip().lower()
+    if word in TRUE_WORDS:
+        return True
+    if word in FALSE_WORDS:
+        return False
+    return None
+
+
+def _to_storage(value, kind: str):
+    """Coerce a ProcessedPerson value to its column's storage type"""
+    if value is None or value == "":
+        return None
+    if kind in ("string", "category"):
+        return str(value)
+    if kind == "int32":
+        number = _to_number(value)
+        return int(number) if number is not None else None
+    if kind == "float64":
+        return _to_number(value)
+    return _to_bool(value)
+
+
+def save_to_parquet(people: List[ProcessedPerson], output_file):
+    """Write people to a Parquet file atomically (temp file plus rename)"""
+    pa, pq = _require_pyarrow()
+    columns = {name: [] for name in [*COLUMN_TYPES, *REF_COLUMNS]}
+    for person in people:
+        for name, kind in COLUMN_TYPES.items():
+            value = getattr(person, name)
+            if isinstance(value, RawTextRef):
+                value = None
+            columns[name].append(_to_storage(value, kind))
+        ref = person.raw_text if isinstance(person.raw_text, RawTextRef) else None
+        columns["raw_text_path"].append(ref.path if ref else None)
+        columns["raw_text_start"].append(ref.start if ref else None)
+        columns["raw_text_end"].append(ref.end if ref else None)
+
+    table = pa.Table.from_pydict(columns, schema=processed_schema())
+    output_file = Path(output_file)
+    tmp_file = output_file.with_name(f".{output_file.name}.tmp")
+    pq.write_table(table, tmp_file)
+    os.replace(tmp_file, output_file)
+
+
+def _decode_category(column) -> list:
+    """Decode a dictionary column via its indices, one interned str per value"""
+    values = []
+    for chunk in column.chunks:
+        if not hasattr(chunk, "dictionary"):
+            values.extend(
+                sys.intern(v) if v is not None else None for v in chunk.to_pylist()
+            )
+            continue
+        dictionary = [sys.intern(v) for v in chunk.dictionary.to_pylist()]
+        dictionary.append(None)
+        null_index = len(dictionary) - 1
+        values.extend(
+            dictionary[i] for i in chunk.indices.fill_null(null_index).to_pylist()
+        )
+    return values
+
+
+def load_processed_people(parquet_file) -> List[ProcessedPerson]:
+    """Load people from a Parquet checkpoint in one columnar read
+
+    Stored values are already normalized (hobbies, BMI, age), so people are
+    restored as-is without re-running ProcessedPerson.__post_init__. Stored
+    references come back as RawTextRef, so the texts stay on disk.
+    """
+    _, pq = _require_pyarrow()
+    table = pq.read_table(parquet_file)
+
+    names = [field.name for field in fields(ProcessedPerson)]
+    columns = []
+    for name in names:
+        if name not in table.column_names:
+            columns.append([None] * table.num_rows)
+            continue
+        column = table.column(name)
+        if name in ("height_cm", "weight_kg"):
+            values = [_to_int_if_integral(v) for v in column.to_pylist()]
+        elif COLUMN_TYPES.get(name) == "category":
+            values = _decode_category(column)
+        else:
+            values = column.to_pylist()
+        columns.append(values)
+    if "raw_text_path" in table.column_names:
+        raw_texts = columns[names.index("raw_text")]
+        refs = zip(
+            _decode_category(table.column("raw_text_path")),
+            table.column("raw_text_start").to_pylist(),
+            table.column("raw_text_end").to_pylist(),
+        )
+        for i, (path, start, end) in enumerate(refs):
+            if path is not None:
+                raw_texts[i] = RawTextRef(path, start, end)
+
+    people = []
+    new_person = ProcessedPerson.__new__
+    setters = [ProcessedPerson.__dict__[name].__set__ for name in names]
+    for row in zip(*columns):
+        person = new_person(ProcessedPerson)
+        for setter, value in zip(setters, row):
+            setter(person, value)
+        people.append(person)
+    return people
+
+
+def resolve_raw_text(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace a Parquet row's reference columns by the raw_text they point at"""
+    path, start, end = (row.pop(name, None) for name in REF_COLUMNS)
+    if path is not None:
+        row["raw_text"] = RawTextRef(path, start, end).load()
+    return row
+
+
+def person_from_csv_row(row: Dict[str, Any]) -> ProcessedPerson:
+    """Convert a CSV row (all strings) back to a ProcessedPerson
+
+    Used when resuming from a CSV-only checkpoint; unlike the old per-field
+    isdigit() checks this keeps negative and float numbers.
+    """
+    converted = {}
+    for key, value in row.items():
+        kind = COLUMN_TYPES.get(key)
+        if kind is None:
+            continue  # columns ProcessedPerson does not know about
+        if value in ("", "None", None):
+            converted[key] = None
+        elif key in ("height_cm", "weight_kg"):
+            converted[key] = _to_int_if_integral(value)
+        else:
+            converted[key] = _to_storage(value, kind)
+    return ProcessedPerson(**converted)
@@ -0,0 +1,170 @@
+"""
+Raw Data Manifest
+Tracks size, mtime, content hash and person blocks of every raw markdown file
+so pipeline stages can skip files that have not changed since the last run
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+if __package__:
+    from .deepseek_data_processor import split_person_blocks
+else:
+    from deepseek_data_processor import split_person_blocks
+
+# Files in raw_data that never contain profiles
+NON_DATA_FILES = ["__init__.py", "tinder.md"]
+
+MANIFEST_VERSION = 1
+
+
+class RawDataManifest:
+    """Incrementally maintained index of the raw_data folder
+
+    Unchanged files (same size and mtime) are never re-read. A file whose
+    stat changed is re-hashed, and only re-split if its content hash differs.
+    """
+
+    def __init__(self, raw_data_path, manifest_file=None):
+        self.raw_data_path = Path(raw_data_path)
+        self.manifest_file = (
+            Path(manifest_file)
+            if manifest_file
+            else self.raw_data_path.parent / "raw_data_manifest.json"
+        )
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.last_refresh: Dict[str, List[str]] = {}
+        self.load()
+
+    def load(self):
+        """Load the manifest from disk (an unreadable manifest is rebuilt)"""
+        if not self.manifest_file.exists():
+            return
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.files = data.get("files", {})
+
+    def save(self):
+        """Write the manifest atomically (temp file plus rename)"""
+        tmp_file = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": MANIFEST_VERSION, "files": self.files},
+                f,
+                ensure_ascii=False,
+                indent=1,
+            )
+        os.replace(tmp_file, self.manifest_file)
+
+    def data_files(self, file_patterns: Optional[List[str]] = None) -> List[Path]:
+        """List the data files matching the patterns, sorted and deduplicated"""
+        if file_patterns is None:
+            file_patterns = ["*.md"]
+
+        files = set()
+        for pattern in file_patterns:
+            for file_path in self.raw_data_path.glob(pattern):
+                if file_path.name not in NON_DATA_FILES and file_path.is_file():
+                    files.add(file_path)
+        return sorted(files)
+
+    def refresh(
+        self, file_patterns: Optional[List[str]] = None, save: bool = True
+    ) -> Dict[str, List[str]]:
+        """Bring the manifest up to date and report what changed
+
+        Returns a dict with "added", "changed", "unchanged" and "removed"
+        file names. Entries for files outside the patterns are left alone.
+        """
+        report = {"added": [], "changed": [], "unchanged": [], "removed": []}
+        seen = set()
+
+        for file_path in self.data_files(file_patterns):
+            name = file_path.name
+            seen.add(name)
+            stat = file_path.stat()
+            entry = self.files.get(name)
+
+            if (
+                entry
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+            ):
+                report["unchanged"].append(name)
+                continue
+
+            data = file_path.read_bytes()
+            content_hash = hashlib.sha256(data).hexdigest()
+
+            if entry and entry["sha256"] == content_hash:
+                # Touched but identical: keep the blocks, remember the new stat
+                entry["size"] = stat.st_size
+                entry["mtime_ns"] = stat.st_mtime_ns
+                report["unchanged"].append(name)
+                continue
+
+            self.files[name] = self._build_entry(data, stat, content_hash)
+            report["changed" if entry else "added"].append(name)
+
+        if file_patterns is None:
+            for name in list(self.files):
+                if name not in seen:
+                    del self.files[name]
+                    report["removed"].append(name)
+
+        self.last_refresh = report
+        if save and (report["added"] or report["changed"] or report["removed"]):
+            self.save()
+        return report
+
+    def _build_entry(self, data: bytes, stat, content_hash: str) -> Dict[str, Any]:
+        """Split a file's content into blocks and record their hashes"""
+        blocks = split_person_blocks(data.decode("utf-8"))
+        return {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": content_hash,
+            "block_count": len(blocks),
+            "blocks": [
+                {
+                    "番号": block["番号"],
+                    "sha1": hashlib.sha1(block["content"].encode("utf-8")).hexdigest(),
+                    "start": block["start"],
+                    "end": block["end"],
+                }
+                for block in blocks
+            ],
+        }
+
+    def block_count(self, file_name: str) -> int:
+        """Number of person blocks in a file (0 if unknown)"""
+        return self.files.get(file_name, {}).get("block_count", 0)
+
+    def blocks(self, file_name: str) -> List[Dict[str, Any]]:
+        """Block entries (番号, sha1, byte range) for a file"""
+        return self.files.get(file_name, {}).get("blocks", [])
+
+    def profile_ids(self, file_name: str) -> List[str]:
+        """Pipeline profile ids ("<stem>_<番号>") for a file, without reading it"""
+        stem = Path(file_name).stem
+        return [f"{stem}_{block['番号']}" for block in self.blocks(file_name)]
+
+    def total_profiles(self, file_patterns: Optional[List[str]] = None) -> int:
+        """Total block count over the files matching the patterns"""
+        return sum(
+            self.block_count(file_path.name)
+            for file_path in self.data_files(file_patterns)
+        )
+
+    def is_changed(self, file_name: str) -> bool:
+        """Whether the file was added or changed by the last refresh"""
+        return file_name in self.last_refresh.get(
+            "added", []
+        ) or file_name in self.last_refresh.get("changed", [])
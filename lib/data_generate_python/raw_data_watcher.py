@@ -0,0 +1,74 @@
+"""
+Raw Data Watcher
+Polls the raw_data folder for added, changed and removed data files, and
+reports them in batches once writes have been quiet for a debounce period,
+so a file copied in several writes (or a burst of files) is one batch
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+if __package__:
+    from .raw_data_manifest import NON_DATA_FILES
+else:
+    from raw_data_manifest import NON_DATA_FILES
+
+
+class RawDataWatcher:
+    """Stat-polling watcher: no file is read until its batch is handed out
+
+    A file's signature is its (size, mtime_ns). Every poll compares the
+    signatures with the previous poll; changes are collected until a poll
+    sees none for `debounce` seconds, then handed out as one batch.
+    """
+
+    def __init__(
+        self,
+        raw_data_path,
+        file_patterns: Optional[List[str]] = None,
+        debounce: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.raw_data_path = Path(raw_data_path)
+        self.file_patterns = file_patterns or ["*.md"]
+        self.debounce = debounce
+        self.clock = clock
+        # Files present at start are the caller's to catch up on
+        self.signatures = self.scan()
+        self.pending = set()
+        self.last_change = None
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        signatures = {}
+        for pattern in self.file_patterns:
+            for file_path in self.raw_data_path.glob(pattern):
+                if file_path.name in NON_DATA_FILES:
+                    continue
+                try:
+                    stat = file_path.stat()
+                except FileNotFoundError:  # removed between glob and stat
+                    continue
+                if file_path.is_file():
+                    signatures[file_path.name] = (stat.st_size, stat.st_mtime_ns)
+        return signatures
+
+    def poll(self) -> List[str]:
+        """Names changed since the last batch, once quiet for `debounce`; else []"""
+        current = self.scan()
+        changed = {
+            name
+            for name in current.keys() | self.signatures.keys()
+            if current.get(name) != self.signatures.get(name)
+        }
+        self.signatures = current
+        now = self.clock()
+        if changed:
+            self.pending |= changed
+            self.last_change = now
+            return []
+        if self.pending and now - self.last_change >= self.debounce:
+            batch = sorted(self.pending)
+            self.pending = set()
+            return batch
+        return []
@@ -0,0 +1,171 @@
+"""
+Raw Text Store
+Keeps the cleaned profile texts out of the character records: one UTF-8
+blob file plus an id -> (offset, length) table, so the dataset carries only
+a reference and a single text is read back with one seek
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Key that replaces raw_text in a character record: [offset, length] in bytes
+RAW_TEXT_REF_KEY = "raw_text_ref"
+
+INDEX_VERSION = 1
+
+
+def index_file_for(blob_file) -> Path:
+    """The offset table of a blob file (raw_texts.bin -> raw_texts.index.json)"""
+    blob_file = Path(blob_file)
+    return blob_file.with_name(f"{blob_file.stem}.index.json")
+
+
+class RawTextBlobWriter:
+    """Appends texts to a blob file and records where each one is
+
+    Use as a context manager: the blob and its table are written to temp
+    files and only replace the old ones when the block exits without an
+    error, so the JSON that references them and the blob stay in step.
+    Identical texts are stored once and share a reference.
+    """
+
+    def __init__(self, blob_file):
+        self.blob_file = Path(blob_file)
+        self.index_file = index_file_for(self.blob_file)
+        self.texts: Dict[str, List[int]] = {}
+        self.stats = {"texts": 0, "stored": 0, "bytes": 0}
+        self._tmp_blob = self.blob_file.with_name(f".{self.blob_file.name}.tmp")
+        self._tmp_index = self.index_file.with_name(f".{self.index_file.name}.tmp")
+        self._refs_by_digest: Dict[bytes, List[int]] = {}
+        self._file = None
+
+    def __enter__(self) -> "RawTextBlobWriter":
+        self.blob_file.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp_blob, "wb")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is not None:
+            self._tmp_blob.unlink(missing_ok=True)
+            return False
+        try:
+            with open(self._tmp_index, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": INDEX_VERSION,
+                        "blob": self.blob_file.name,
+                        "size": self.stats["bytes"],
+                        "texts": self.texts,
+                    },
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            os.replace(self._tmp_blob, self.blob_file)
+            os.replace(self._tmp_index, self.index_file)
+        except BaseException:
+            self._tmp_blob.unlink(missing_ok=True)
+            self._tmp_index.unlink(missing_ok=True)
+            raise
+        return False
+
+    def add(self, char_id: str, text: str) -> List[int]:
+        """Store a text for `char_id`; returns its [offset, length] reference"""
+        data = text.encode("utf-8")
+        digest = hashlib.sha1(data).digest()
+        ref = self._refs_by_digest.get(digest)
+        if ref is None:
+            ref = [self.stats["bytes"], len(data)]
+            self._file.write(data)
+            self._refs_by_digest[digest] = ref
+            self.stats["stored"] += 1
+            self.stats["bytes"] += len(data)
+        self.texts[char_id] = ref
+        self.stats["texts"] += 1
+        return ref
+
+    def detach(self, characters: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield characters with raw_text moved to the blob
+
+        The text is replaced by a raw_text_ref at the same position in the
+        record; characters without text keep raw_text as null.
+        """
+        for character in characters:
+            text = character.get("raw_text")
+            if text:
+                ref = self.add(character["id"], text)
+                detached = {}
+                for key, value in character.items():
+                    if key == "raw_text":
+                        detached[RAW_TEXT_REF_KEY] = ref
+                    else:
+                        detached[key] = value
+                character = detached
+            yield character
+
+
+class RawTextStore:
+    """Read access to a blob written by RawTextBlobWriter
+
+    The offset table is loaded on first use and the blob is kept open, so
+    fetching a text is one seek and one read.
+    """
+
+    def __init__(self, blob_file):
+        self.blob_file = Path(blob_file)
+        self.index_file = index_file_for(self.blob_file)
+        self._texts: Optional[Dict[str, List[int]]] = None
+        self._file = None
+
+    def __enter__(self) -> "RawTextStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __contains__(self, char_id: str) -> bool:
+        return char_id in self.texts
+
+    @property
+    def texts(self) -> Dict[str, List[int]]:
+        if self._texts is None:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") != INDEX_VERSION:
+                raise ValueError(
+                    f"{self.index_file.name}: unsupported raw text index "
+                    f"version {index.get('version')}"
+                )
+            self._texts = index["texts"]
+        return self._texts
+
+    def get(self, char_id: str) -> Optional[str]:
+        """The text of a character, or None when it has none"""
+        ref = self.texts.get(char_id)
+        return self.read(ref) if ref else None
+
+    def read(self, ref: List[int]) -> str:
+        """The text at an [offset, length] reference from a character record"""
+        offset, length = ref
+        if self._file is None:
+            self._file = open(self.blob_file, "rb")
+        self._file.seek(offset)
+        data = self._file.read(length)
+        if len(data) != length:
+            raise ValueError(
+                f"{self.blob_file.name}: reference {ref} is past the end of the blob"
+            )
+        return data.decode("utf-8")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,160 @@
+"""
+Deferred Retry Queue
+Failed profiles wait in a delayed queue keyed by error class and not-before
+time while the rest of the run continues, instead of sleeping inline
+"""
+
+import heapq
+import itertools
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Error class -> (base delay in seconds, max attempts within one run). The
+# delay doubles with each attempt; client errors (bad key, bad request) are
+# not worth retrying in the same run.
+RETRY_POLICIES: Dict[str, Tuple[float, int]] = {
+    "rate_limit": (10.0, 6),
+    "server": (5.0, 4),
+    "timeout": (5.0, 4),
+    "network": (5.0, 4),
+    "bad_response": (1.0, 2),
+    "client": (0.0, 1),
+    "circuit_open": (30.0, 0),
+    # The worker's raw file differs from the one the task was queued from;
+    # wait for a worker with the queued copy (or a fresh checkout here)
+    "source_mismatch": (30.0, 3),
+}
+# Failures that say nothing about the profile (the endpoint was down); they
+# wait for the breaker's probe time and do not use up attempts
+NON_COUNTING_CLASSES = {"circuit_open"}
+MAX_PARKED = 20  # give up on a task after this many non-counting deferrals
+DEFAULT_POLICY = (5.0, 3)
+MAX_DELAY = 300.0
+
+
+def retry_delay(
+    error_class: str,
+    attempts: int,
+    retry_after: Optional[float] = None,
+    policies: Optional[Dict[str, Tuple[float, int]]] = None,
+) -> Optional[float]:
+    """Delay before retrying a task that has failed `attempts` times
+
+    None once the error class's attempts are used up. The server's
+    Retry-After, when given, is a lower bound on the delay.
+    """
+    policies = RETRY_POLICIES if policies is None else policies
+    base_delay, max_attempts = policies.get(error_class, DEFAULT_POLICY)
+    if attempts >= max_attempts:
+        return None
+    delay = min(base_delay * (2 ** (attempts - 1)), MAX_DELAY)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class DeferredRetryQueue:
+    """Per-error-class min-heaps of (not_before, seq, task)
+
+    Tasks are dicts; the queue tracks their "attempts" and "error_class".
+    `clock` and `sleep` are injectable so the timing can be tested.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, Tuple[float, int]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.policies = RETRY_POLICIES if policies is None else policies
+        self.clock = clock
+        self.sleep = sleep
+        self._heaps: Dict[str, List[Tuple[float, int, Dict[str, Any]]]] = {}
+        self._seq = itertools.count()
+        self.stats = {"deferred": Counter(), "exhausted": Counter(), "retried": Counter()}
+
+    def __len__(self) -> int:
+        return sum(len(heap) for heap in self._heaps.values())
+
+    def defer(
+        self,
+        task: Dict[str, Any],
+        error_class: str,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """Queue a failed task; return its delay, or None if attempts are used up
+
+        The server's Retry-After, when given, is a lower bound on the delay.
+        """
+        base_delay, _ = self.policies.get(error_class, DEFAULT_POLICY)
+        if error_class in NON_COUNTING_CLASSES:
+            task["error_class"] = error_class
+            task["parked"] = task.get("parked", 0) + 1
+            if task["parked"] > MAX_PARKED:
+                self.stats["exhausted"][error_class] += 1
+                return None
+            delay = retry_after if retry_after is not None else base_delay
+            self._push(task, error_class, delay)
+            return delay
+
+        attempts = task.get("attempts", 0) + 1
+        task["attempts"] = attempts
+        task["error_class"] = error_class
+        delay = retry_delay(error_class, attempts, retry_after, self.policies)
+        if delay is None:
+            self.stats["exhausted"][error_class] += 1
+            return None
+        self._push(task, error_class, delay)
+        return delay
+
+    def _push(self, task: Dict[str, Any], error_class: str, delay: float):
+        not_before = self.clock() + delay
+        heapq.heappush(
+            self._heaps.setdefault(error_class, []), (not_before, next(self._seq), task)
+        )
+        self.stats["deferred"][error_class] += 1
+
+    def _earliest(self) -> Optional[str]:
+        """Error class whose head task has the earliest not-before time"""
+        heads = [(heap[0][:2], name) for name, heap in self._heaps.items() if heap]
+        return min(heads)[1] if heads else None
+
+    def next_ready_in(self) -> Optional[float]:
+        """Seconds until the next task is due (0 if one is due), None if empty"""
+        name = self._earliest()
+        if name is None:
+            return None
+        return max(0.0, self._heaps[name][0][0] - self.clock())
+
+    def pop_ready(self) -> Optional[Dict[str, Any]]:
+        """Pop the earliest task whose not-before time has passed, if any"""
+        name = self._earliest()
+        if name is None or self._heaps[name][0][0] > self.clock():
+            return None
+        task = heapq.heappop(self._heaps[name])[2]
+        self.stats["retried"][name] += 1
+        return task
+
+    def drain(self) -> Iterator[Dict[str, Any]]:
+        """Yield every task as it becomes due, sleeping only when none is
+
+        Tasks deferred again while draining are picked up in the same loop.
+        """
+        while True:
+            wait = self.next_ready_in()
+            if wait is None:
+                return
+            if wait > 0:
+                print(f"   ⏳ Waiting {wait:.1f}s for {len(self)} deferred retries...")
+                self.sleep(wait)
+            task = self.pop_ready()
+            if task is not None:
+                yield task
+
+    def pending_by_class(self) -> Dict[str, int]:
+        return {name: len(heap) for name, heap in self._heaps.items() if heap}
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Deferred/retried/exhausted counts per error class, for the run report"""
+        return {key: dict(counter) for key, counter in self.stats.items()}
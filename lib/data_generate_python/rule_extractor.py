@@ -0,0 +1,320 @@
+"""
+Rule Extractor
+Offline field extraction from profile blocks without the API: precompiled
+label rules, run only for labels a single keyword scan found in the block
+(replaces history/generate_data.py's own extract_person_info, same output;
+tests/test_rule_extractor.py keeps that original as the parity reference)
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+FLAGS = re.IGNORECASE | re.DOTALL
+
+# Same order as the original pattern dict, so the result dict is too
+RULES_BEFORE_BIRTH_YEAR: List[Tuple[str, Tuple[str, ...], str]] = [
+    ("gender", ("性别",), r"[：:]?\s*([男女])"),
+]
+# Not label-anchored: a bare number after whitespace counts. Apart from a
+# match at the very start, the year digits follow an alternative ending in
+# one of the characters below or whitespace, which began at most
+# BIRTH_YEAR_LEAD characters earlier
+BIRTH_YEAR_LEAD = 4  # 出生年份
+BEFORE_YEAR = re.compile(r"(?:[生年月日龄份齢令岁数]|\s)(?=\d\d)")
+YEAR_DIGITS = re.compile(r"\d\d")
+BIRTH_YEAR = re.compile(
+    r"(?:出生[年月日]?|生年|年龄|出生年份|出生年|年[齢令]|ご?年齢|出厂日|(\d{1,2})岁|岁数|^|\s)"
+    r"(\d{2,4})年?[^\d]?",
+    FLAGS,
+)
+# (field, labels, pattern after the label)
+LABEL_RULES: List[Tuple[str, Tuple[str, ...], str]] = [
+    ("zodiac", ("星座",), r"[：:]?\s*([^\n]+)"),
+    ("mbti", ("MBTI",), r"[：:]?\s*([A-Za-z]{4})"),
+    # Physical attributes
+    ("height", ("身高",), r"[：:]?\s*(\d{2,3}\s*cm|\d{2,3})"),
+    ("weight", ("体重",), r"[：:]?\s*(\d{2,3}\s*kg|\d{2,3})"),
+    ("bmi", ("BMI",), r"[：:]?\s*([\d\.]+)"),
+    # Background
+    (
+        "hometown",
+        ("出生地", "籍贯", "戸籍地", "户籍地", "老家", "祖籍", "家乡", "◇籍贯", "◇戸籍地"),
+        r"[：:]?\s*([^\n]+)",
+    ),
+    ("current_residence", ("现居住地", "現住所", "现住", "居住地", "◇現住所"), r"[：:]?\s*([^\n]+)"),
+    (
+        "education",
+        ("学历", "最終学歴", "毕业院校", "学校", "学历", "毕业学校"),
+        r"[：:]?\s*([^\n]+)",
+    ),
+    ("occupation", ("工作", "ご職業", "职业", "行业", "工作方面", "职业"), r"[：:]?\s*([^\n]+)"),
+    (
+        "annual_income",
+        ("年收", "ご年収", "年收", "收入", "年収", "年收"),
+        r"[：:]?\s*([\d\-〜～\+]+[万wW]?)",
+    ),
+    (
+        "visa_status",
+        ("签证类型", "在就资格", "签证种类", "在留", "◇签证类型"),
+        r"[：:]?\s*([^\n]+)",
+    ),
+    ("years_in_japan", ("来日", "赴日"), r"[：:]?\s*([^\n]+)"),
+    ("japanese_level", ("日本語程度", "日语"), r"[：:]?\s*([^\n]+)"),
+    # Lifestyle
+    ("hobbies", ("兴趣爱好", "趣味", "爱好", "兴趣"), r"[：:]?\s*([\s\S]+?)(?:\n\n|$)"),
+    ("smoking", ("抽烟", "吸烟"), r"[：:]?\s*([^\n]+)"),
+    ("drinking", ("喝酒", "饮酒"), r"[：:]?\s*([^\n]+)"),
+    ("has_pets", ("养宠物", "有猫", "有狗", "养猫", "养狗"), r"[：:]?\s*([^\n]+)"),
+    # Family
+    ("marital_status", ("婚史", "感情状态", "婚歴", "婚姻状况"), r"[：:]?\s*([^\n]+)"),
+    (
+        "has_children",
+        ("有孩子", "有女儿", "有儿子", "有小孩", "孩子情况"),
+        r"[：:]?\s*([^\n]+)",
+    ),
+    (
+        "family_info",
+        ("家庭状况", "家庭情况", "原生家庭", "家族との同居"),
+        r"[：:]?\s*([^\n]+)",
+    ),
+    # Assets
+    (
+        "has_property",
+        ("有房", "已购房", "有2套房", "有自己的房子", "◇是否已买房"),
+        r"[：:]?\s*([^\n]+)",
+    ),
+    ("has_car", ("有车", "有自己的车子", "◇是否已买车"), r"[：:]?\s*([^\n]+)"),
+    # Personality
+    ("personality", ("性格", "性格特点", "自我性格特征"), r"[：:]?\s*([\s\S]+?)(?:\n\n|$)"),
+    # Partner preferences
+    (
+        "partner_preferences",
+        (
+            "对女方的要求",
+            "对方的要求",
+            "希望对方",
+            "择偶要求",
+            "期待女生",
+            "择偶标准",
+            "择偶条件",
+            "要求男方",
+            "对伴侣的期望",
+        ),
+        r"[：:]?\s*([\s\S]+?)(?:\n\n|\Z)",
+    ),
+]
+BOOLEAN_FIELDS = {"has_property", "has_car", "has_children"}
+
+# Free-text sections joined into other_info, in this order
+OTHER_INFO_RULES: List[Tuple[str, str]] = [
+    ("other:0", r"其他[：:]\s*([\s\S]+?)(?=\n\n|$)"),
+    ("other:1", r"补充介绍[：:]\s*([\s\S]+?)(?=\n\n|$)"),
+    ("other:2", r"自我介绍[：:]\s*([\s\S]+?)(?=\n\n|$)"),
+    ("other:3", r"简介[：:]\s*([\s\S]+?)(?=\n\n|$)"),
+    ("other:4", r"其他介绍[：:]\s*([\s\S]+?)(?=\n\n|$)"),
+]
+OTHER_INFO_KEYWORDS = {
+    "other:0": "其他",
+    "other:1": "补充介绍",
+    "other:2": "自我介绍",
+    "other:3": "简介",
+    "other:4": "其他介绍",
+}
+
+ID_PATTERN = re.compile(r"编号\s*(\d+)|（编号(\d+)）")
+HEIGHT_WEIGHT = re.compile(r"(\d{3})\s*[/／]\s*(\d{2,3})")
+SLASH = re.compile(r"[/／]")
+INCOME_RANGE = re.compile(r"(\d+)\s*[〜～\-]\s*(\d+)\s*[万wW]")
+NON_DIGITS = re.compile(r"[^\d]")
+VISA_LEVEL = re.compile(r"(永住|高度人才|工作签证|経営・管理|特定活動)")
+EDUCATION_LEVEL = re.compile(r"(专科|本科|修士|硕士|博士|大学院|研究生|高校)")
+JAPANESE_LEVEL = re.compile(r"(N1|N2|N3|N4|N5|JLPT)")
+
+
+def _compile_rules():
+    """Compile each rule and index every label keyword by the rules it starts
+
+    The keyword scan reports non-overlapping matches, so a keyword may hide
+    another one inside it or overlapping its end. Each keyword therefore
+    also points at rules whose keywords it contains or overlaps, with the
+    offset where they would begin; starting a rule's search a little early
+    is harmless, starting it late would not be.
+    """
+    rules = []
+    keywords: List[Tuple[str, str]] = []  # (keyword, rule name)
+    cased_labels: List[str] = []
+    for field, labels, value_pattern in RULES_BEFORE_BIRTH_YEAR + LABEL_RULES:
+        alternation = "|".join(re.escape(label) for label in labels)
+        rules.append((field, re.compile(f"(?:{alternation}){value_pattern}", FLAGS)))
+        # A case-insensitive scan is several times slower than a plain one,
+        # so rules with cased labels (MBTI, BMI) are gated separately
+        if any(label.lower() != label.upper() for label in labels):
+            cased_labels.extend(labels)
+        else:
+            keywords.extend((label, field) for label in labels)
+    other_rules = [(name, re.compile(pattern)) for name, pattern in OTHER_INFO_RULES]
+    keywords.extend((keyword, name) for name, keyword in OTHER_INFO_KEYWORDS.items())
+    keywords.append(("编号", "id"))
+
+    by_keyword: Dict[str, Dict[str, int]] = {}
+    for found, _ in keywords:
+        starts = by_keyword.setdefault(found, {})
+        for other, rule in keywords:
+            offset = found.find(other)
+            if offset < 0:
+                # `other` beginning inside `found` and running past its end
+                offset = next(
+                    (
+                        len(found) - size
+                        for size in range(len(other) - 1, 0, -1)
+                        if found.endswith(other[:size])
+                    ),
+                    -1,
+                )
+            if offset >= 0 and offset < starts.get(rule, len(found)):
+                starts[rule] = offset
+
+    ordered = sorted(by_keyword, key=len, reverse=True)
+    scan = re.compile("|".join(re.escape(keyword) for keyword in ordered))
+    gate = re.compile("|".join(re.escape(label) for label in cased_labels), re.IGNORECASE)
+    gated = [field for field, labels, _ in LABEL_RULES if set(labels) & set(cased_labels)]
+    return rules, other_rules, scan, by_keyword, gate, gated
+
+
+(
+    RULES,
+    OTHER_RULES,
+    KEYWORD_SCAN,
+    KEYWORD_STARTS,
+    CASED_GATE,
+    CASED_RULES,
+) = _compile_rules()
+
+
+def _rule_starts(text: str) -> Dict[str, int]:
+    """Earliest position each rule could match at; absent rules cannot match"""
+    starts: Dict[str, int] = {}
+    for match in KEYWORD_SCAN.finditer(text):
+        position = match.start()
+        for rule, offset in KEYWORD_STARTS[match.group()].items():
+            if rule not in starts:
+                starts[rule] = position + offset
+    gate = CASED_GATE.search(text)
+    if gate:
+        for rule in CASED_RULES:
+            starts[rule] = gate.start()
+    return starts
+
+
+def _search_birth_year(text: str) -> Optional[re.Match]:
+    """BIRTH_YEAR.search(text), trying only the starts a match can have"""
+    checked = 0
+    if YEAR_DIGITS.match(text):
+        match = BIRTH_YEAR.match(text)  # `^` lets a match start on the digits
+        if match:
+            return match
+        checked = 1
+    for before in BEFORE_YEAR.finditer(text):
+        digits = before.end()
+        for position in range(max(checked, digits - BIRTH_YEAR_LEAD), digits):
+            match = BIRTH_YEAR.match(text, position)
+            if match:
+                return match
+        checked = digits
+    return None
+
+
+def _search_height_weight(text: str) -> Optional[re.Match]:
+    """HEIGHT_WEIGHT.search(text), trying only the digits before each slash"""
+    for slash in SLASH.finditer(text):
+        position = slash.start()
+        while position and text[position - 1].isspace():
+            position -= 1
+        if position >= 3:
+            match = HEIGHT_WEIGHT.match(text, position - 3)
+            if match:
+                return match
+    return None
+
+
+def _apply_rules(text: str, rules, starts: Dict[str, int], info: Dict[str, Any]):
+    for field, pattern in rules:
+        start = starts.get(field)
+        if start is None:
+            continue
+        match = pattern.search(text, start)
+        if match is None:
+            continue
+        if field in BOOLEAN_FIELDS:
+            value = "有" in match.group(0)
+        else:
+            value = match.group(1)
+        if value:
+            info[field] = value
+
+
+def extract_person_info(text: str) -> Dict[str, Any]:
+    """Extract labelled profile fields from one person block"""
+    info: Dict[str, Any] = {}
+    starts = _rule_starts(text)
+
+    if "id" in starts:
+        id_match = ID_PATTERN.search(text, starts["id"])
+        if id_match:
+            info["id"] = id_match.group(1) or id_match.group(2)
+
+    split = len(RULES_BEFORE_BIRTH_YEAR)
+    _apply_rules(text, RULES[:split], starts, info)
+    match = _search_birth_year(text)
+    if match:
+        info["birth_year"] = match.group(1) or match.group(2)
+    _apply_rules(text, RULES[split:], starts, info)
+
+    # Combined height/weight format (e.g. "163/50")
+    hw_match = _search_height_weight(text)
+    if hw_match:
+        if "height" not in info:
+            info["height"] = hw_match.group(1)
+        if "weight" not in info:
+            info["weight"] = hw_match.group(2)
+
+    if "annual_income" in info:
+        range_match = INCOME_RANGE.search(info["annual_income"])
+        if range_match:
+            info["income_min"] = range_match.group(1)
+            info["income_max"] = range_match.group(2)
+
+    for field in ("height", "weight"):
+        if field in info:
+            info[field] = NON_DIGITS.sub("", info[field])
+
+    sections: List[str] = []
+    for name, pattern in OTHER_RULES:
+        start = starts.get(name)
+        if start is not None:
+            sections.extend(pattern.findall(text, start))
+    if sections:
+        info["other_info"] = "\n\n".join(section.strip() for section in sections)
+
+    if "visa_status" in info:
+        visa_match = VISA_LEVEL.search(info["visa_status"])
+        if visa_match:
+            info["visa_status"] = visa_match.group(1)
+
+    if "education" in info:
+        education_match = EDUCATION_LEVEL.search(info["education"])
+        if education_match:
+            info["education_level"] = education_match.group(1)
+
+    if "japanese_level" in info:
+        level_match = JAPANESE_LEVEL.search(info["japanese_level"])
+        if level_match:
+            info["japanese_level"] = level_match.group(1)
+
+    return info
+
+
+def split_blocks(content: str) -> List[str]:
+    """Person blocks as the original extractor split them (text after 编号N)"""
+    blocks = re.split(r"编号\d+", content)
+    return [block.strip() for block in blocks if block.strip()]
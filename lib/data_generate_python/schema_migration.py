@@ -0,0 +1,220 @@
+"""
+Schema Migration
+When a field is added to the extraction schema, asks the API for just the
+new fields of already-processed profiles (several profiles per request,
+answers cached) instead of re-running the full extraction
+"""
+
+import os
+import re
+import csv
+import json
+import hashlib
+import sys
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+if __package__:
+    from .deepseek_data_processor import (
+        CATEGORICAL_FIELDS,
+        SYSTEM_PROMPT,
+        ProcessedPerson,
+    )
+    from .processed_store import COLUMN_TYPES, parquet_available
+else:
+    from deepseek_data_processor import (
+        CATEGORICAL_FIELDS,
+        SYSTEM_PROMPT,
+        ProcessedPerson,
+    )
+    from processed_store import COLUMN_TYPES, parquet_available
+
+current_dir = Path(__file__).parent
+DEFAULT_CACHE = current_dir / "output" / "field_delta_cache.json"
+
+CACHE_VERSION = 1
+DEFAULT_BATCH_SIZE = 10
+TOKENS_PER_FIELD = 40  # answer budget per profile and field
+
+# One `"field": "description"` line of the JSON template in SYSTEM_PROMPT
+PROMPT_FIELD = re.compile(r'^\s*"(\w+)":\s*"(.*)",?\s*$', re.MULTILINE)
+
+DELTA_PROMPT = """
+你是一个专业的个人信息提取助手。用户将提供多份中文个人档案，每份以【档案ID】开头。
+
+只提取以下字段，未提及的字段返回null：
+{fields}
+
+请严格返回一个JSON对象，键为档案ID，值为上述字段组成的对象，不要其他文字说明。
+示例输出：{{"档案ID": {example}}}
+"""
+
+
+def extraction_fields(prompt: str = SYSTEM_PROMPT) -> Dict[str, str]:
+    """Field -> description from the prompt's JSON template, for stored fields
+
+    A field becomes part of the schema once it is a ProcessedPerson field,
+    has a COLUMN_TYPES entry and is described in the extraction prompt.
+    """
+    person_fields = {field.name for field in fields(ProcessedPerson)}
+    return {
+        name: description
+        for name, description in PROMPT_FIELD.findall(prompt)
+        if name in person_fields and name in COLUMN_TYPES
+    }
+
+
+def stored_fields(csv_output) -> Optional[Set[str]]:
+    """Columns of the checkpoint load_checkpoint would read (None if none)"""
+    csv_output = Path(csv_output)
+    parquet_output = csv_output.with_suffix(".parquet")
+    if parquet_available() and parquet_output.exists():
+        import pyarrow.parquet as pq
+
+        return set(pq.read_schema(parquet_output).names)
+    if csv_output.exists():
+        with open(csv_output, "r", encoding="utf-8-sig", newline="") as f:
+            return set(next(csv.reader(f), []))
+    return None
+
+
+def detect_added_fields(csv_output, prompt: str = SYSTEM_PROMPT) -> Dict[str, str]:
+    """Schema fields the stored checkpoint has no column for"""
+    columns = stored_fields(csv_output)
+    if columns is None:
+        return {}
+    return {
+        name: description
+        for name, description in extraction_fields(prompt).items()
+        if name not in columns
+    }
+
+
+def build_delta_prompt(field_specs: Dict[str, str]) -> str:
+    """System prompt asking only for `field_specs`, keyed by profile id"""
+    template = json.dumps(field_specs, ensure_ascii=False, indent=4)
+    example = json.dumps({name: None for name in field_specs}, ensure_ascii=False)
+    return DELTA_PROMPT.format(fields=template, example=example)
+
+
+class FieldDeltaExtractor:
+    """Extract a few fields for many stored profiles, batched and cached
+
+    Answers are cached by the field descriptions plus the profile text, so an
+    interrupted migration resumes and unchanged profiles are never re-asked.
+    """
+
+    def __init__(
+        self,
+        processor,
+        field_specs: Dict[str, str],
+        cache_file=None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.processor = processor
+        self.field_specs = dict(field_specs)
+        self.cache_file = Path(cache_file or DEFAULT_CACHE)
+        self.batch_size = batch_size
+        self.system_prompt = build_delta_prompt(self.field_specs)
+        self._schema_key = json.dumps(self.field_specs, ensure_ascii=False, sort_keys=True)
+        self.cache = self._load_cache()
+        self.stats = {"cached": 0, "extracted": 0, "failed": 0, "requests": 0}
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("answers", {})
+
+    def save_cache(self):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": CACHE_VERSION, "answers": self.cache}
+        tmp_file = self.cache_file.with_name(f".{self.cache_file.name}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+
+    def _cache_key(self, raw_text: str) -> str:
+        digest = hashlib.sha256(self._schema_key.encode("utf-8"))
+        digest.update(raw_text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _request_batch(self, batch: List[Dict[str, str]]) -> Dict[str, Any]:
+        text = "\n\n".join(f"【{item['id']}】\n{item['text']}" for item in batch)
+        max_tokens = 50 + len(batch) * len(self.field_specs) * TOKENS_PER_FIELD
+        self.stats["requests"] += 1
+        return self.processor.call_api(
+            text, system_prompt=self.system_prompt, max_tokens=max_tokens
+        )
+
+    def extract(self, people: List[ProcessedPerson]) -> Dict[str, Dict[str, Any]]:
+        """Person id -> new field values, for every profile that got an answer"""
+        answers: Dict[str, Dict[str, Any]] = {}
+        pending = []
+        for person in people:
+            raw_text = person.get_raw_text()
+            if not raw_text:
+                continue
+            key = self._cache_key(raw_text)
+            if key in self.cache:
+                answers[person.id] = self.cache[key]
+                self.stats["cached"] += 1
+            else:
+                pending.append({"id": person.id, "text": raw_text, "key": key})
+
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start : start + self.batch_size]
+            print(
+                f"   🔄 Fields {', '.join(self.field_specs)} for profiles "
+                f"{start + 1}-{start + len(batch)} of {len(pending)}..."
+            )
+            # call_api retries and returns {} if the batch still failed
+            response = self._request_batch(batch)
+
+            for item in batch:
+                answer = response.get(item["id"]) if isinstance(response, dict) else None
+                if not isinstance(answer, dict):
+                    self.stats["failed"] += 1
+                    continue
+                values = {name: answer.get(name) for name in self.field_specs}
+                self.cache[item["key"]] = values
+                answers[item["id"]] = values
+                self.stats["extracted"] += 1
+            self.save_cache()
+
+        return answers
+
+
+def merge_answers(
+    people: List[ProcessedPerson], answers: Dict[str, Dict[str, Any]]
+) -> int:
+    """Write new field values into the people; return how many were updated"""
+    updated = 0
+    for person in people:
+        values = answers.get(person.id)
+        if values is None:
+            continue
+        for name, value in values.items():
+            if name in CATEGORICAL_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(person, name, value)
+        updated += 1
+    return updated
+
+
+def estimate_prompt_chars(
+    field_specs: Dict[str, str], people: List[ProcessedPerson], batch_size: int
+):
+    """Prompt characters for a full re-extraction vs. the field-delta requests"""
+    texts = sum(len(person.get_raw_text() or "") for person in people)
+    batches = -(-len(people) // batch_size)
+    full = len(people) * len(SYSTEM_PROMPT) + texts
+    delta = batches * len(build_delta_prompt(field_specs)) + texts
+    return full, delta
@@ -0,0 +1,349 @@
+"""
+Similar Profiles
+Encodes each converted character as a fixed-width feature vector (age,
+height, BMI, zodiac, MBTI, region and a hashed interest set) and finds the
+nearest profiles of every profile for "more like this": exactly, block by
+block, or approximately for large corpora by comparing each profile only
+with the clusters nearest to its own
+"""
+
+import math
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if __package__:
+    from .compatibility_matcher import REGION_CODES, region_of
+else:
+    from compatibility_matcher import REGION_CODES, region_of
+
+DEFAULT_K = 10
+
+# Rows (profiles) x columns (candidates) of squared distances per block
+DEFAULT_BLOCK_SIZE = (1024, 8192)
+
+# method="auto" switches from the exact search to clusters above this size
+APPROXIMATE_ABOVE = 50_000
+# Clusters searched per profile by the approximate search
+DEFAULT_NPROBE = 16
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE = 20_000
+
+# Distances are rounded to this many decimals; ties go to the earlier profile
+DISTANCE_DECIMALS = 6
+
+# A full mismatch in a group adds its weight squared to the squared
+# distance; for numbers, so does a difference of one NUMERIC_SCALES unit
+FEATURE_WEIGHTS = {
+    "age": 2.0,
+    "height": 1.0,
+    "bmi": 1.0,
+    "zodiac": 0.5,
+    "mbti": 1.0,
+    "location": 1.5,
+    "interests": 2.0,
+}
+NUMERIC_SCALES = {"age": 5.0, "height": 8.0, "bmi": 3.0}
+
+ZODIACS = ["白羊", "金牛", "双子", "巨蟹", "狮子", "处女", "天秤", "天蝎", "射手", "摩羯", "水瓶", "双鱼"]
+ZODIAC_ALIASES = {"天平": "天秤", "雙子": "双子", "処女": "处女"}
+MBTI_AXES = ["EI", "SN", "TF", "JP"]
+INTEREST_BUCKETS = 64
+
+# Column layout of a feature vector
+_GROUPS = [
+    ("numeric", len(NUMERIC_SCALES)),
+    ("zodiac", len(ZODIACS)),
+    ("mbti", len(MBTI_AXES)),
+    ("location", len(REGION_CODES)),
+    ("interests", INTEREST_BUCKETS),
+]
+_OFFSETS = {}
+FEATURE_WIDTH = 0
+for _name, _width in _GROUPS:
+    _OFFSETS[_name] = FEATURE_WIDTH
+    FEATURE_WIDTH += _width
+
+# One-hot groups differ in two columns, so sqrt(1/2) makes a mismatch cost weight²
+_ONE_HOT = math.sqrt(0.5)
+
+
+def zodiac_index(zodiac: Optional[str]) -> Optional[int]:
+    """Index into ZODIACS of a zodiac value ("天蝎座", "天平"), or None"""
+    if not zodiac:
+        return None
+    for alias, name in ZODIAC_ALIASES.items():
+        zodiac = zodiac.replace(alias, name)
+    for index, name in enumerate(ZODIACS):
+        if name in zodiac:
+            return index
+    return None
+
+
+def interest_bucket(interest: str) -> int:
+    """Stable hash bucket of an interest name (same on every run)"""
+    return zlib.crc32(interest.encode("utf-8")) % INTEREST_BUCKETS
+
+
+def _number(value) -> float:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+    return number if number > 0 else float("nan")
+
+
+def feature_vector(character: Dict[str, Any]) -> List[float]:
+    """FEATURE_WIDTH weighted values; NaN where a number is unknown
+
+    Unknown categories are all zeros, half a mismatch away from any value.
+    """
+    vector = [0.0] * FEATURE_WIDTH
+
+    offset = _OFFSETS["numeric"]
+    for i, (key, scale) in enumerate(NUMERIC_SCALES.items()):
+        vector[offset + i] = _number(character.get(key)) / scale * FEATURE_WEIGHTS[key]
+
+    zodiac = zodiac_index(character.get("zodiac"))
+    if zodiac is not None:
+        vector[_OFFSETS["zodiac"] + zodiac] = FEATURE_WEIGHTS["zodiac"] * _ONE_HOT
+
+    # Four opposite axes of +-weight/4: all four opposed costs weight²
+    mbti = (character.get("mbti") or "").upper()
+    for i, (axis, letter) in enumerate(zip(MBTI_AXES, mbti[:4])):
+        if letter in axis:
+            sign = 1.0 if letter == axis[0] else -1.0
+            vector[_OFFSETS["mbti"] + i] = sign * FEATURE_WEIGHTS["mbti"] / 4
+
+    region = region_of(character.get("current_location"))
+    if region:
+        vector[_OFFSETS["location"] + REGION_CODES[region]] = (
+            FEATURE_WEIGHTS["location"] * _ONE_HOT
+        )
+
+    # Unit length, so the distance follows the cosine of the two sets
+    buckets = {interest_bucket(i) for i in character.get("interests") or [] if i}
+    for bucket in buckets:
+        vector[_OFFSETS["interests"] + bucket] = (
+            FEATURE_WEIGHTS["interests"] * _ONE_HOT / math.sqrt(len(buckets))
+        )
+    return vector
+
+
+def encode_characters(
+    characters: Iterable[Dict[str, Any]], chunk_size: int = 4096
+) -> Tuple[List[str], Any]:
+    """Ids and an (n, FEATURE_WIDTH) array, unknown numbers set to the corpus mean"""
+    import numpy as np
+
+    ids, chunks, rows = [], [], []
+    for character in characters:
+        ids.append(character["id"])
+        rows.append(feature_vector(character))
+        if len(rows) == chunk_size:
+            chunks.append(np.array(rows, dtype=np.float64))
+            rows = []
+    chunks.append(np.array(rows, dtype=np.float64).reshape(len(rows), FEATURE_WIDTH))
+    vectors = np.concatenate(chunks)
+
+    numeric = vectors[:, : len(NUMERIC_SCALES)]
+    unknown = np.isnan(numeric)
+    known = (~unknown).sum(axis=0)
+    means = np.where(known > 0, np.nansum(numeric, axis=0) / np.maximum(known, 1), 0.0)
+    numeric[unknown] = np.broadcast_to(means, numeric.shape)[unknown]
+    return ids, vectors
+
+
+def _merge_nearest(top_keys, top_index, block_keys, block_index):
+    """The smallest keys per row of [current top | new block], as many as top has"""
+    import numpy as np
+
+    k = top_keys.shape[1]
+    keys = np.concatenate([top_keys, block_keys], axis=1)
+    index = np.concatenate([top_index, np.broadcast_to(block_index, block_keys.shape)], axis=1)
+    keep = np.argpartition(keys, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(keys, keep, axis=1), np.take_along_axis(index, keep, axis=1)
+
+
+class SimilarProfiles:
+    """Feature vectors of a corpus and the nearest neighbours of each profile
+
+    Neighbours are by squared Euclidean distance between feature vectors,
+    nearest first; a profile is never its own neighbour.
+    """
+
+    def __init__(
+        self,
+        characters: Iterable[Dict[str, Any]],
+        block_size: Tuple[int, int] = DEFAULT_BLOCK_SIZE,
+        workers: int = 1,
+    ):
+        import numpy as np
+
+        self.ids, self.vectors = encode_characters(characters)
+        self.squares = np.einsum("ij,ij->i", self.vectors, self.vectors)
+        self.block_size = block_size
+        self.workers = workers
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def distance(self, i: int, j: int) -> float:
+        """Squared distance of two profiles, one value at a time (the naive baseline)"""
+        return sum((a - b) ** 2 for a, b in zip(self.vectors[i].tolist(), self.vectors[j].tolist()))
+
+    def _block_keys(self, rows, cols):
+        """Integer keys of rows x cols: rounded distance, then the candidate index"""
+        import numpy as np
+
+        n = len(self.ids)
+        distances = (
+            self.squares[rows][:, None]
+            + self.squares[cols][None, :]
+            - 2.0 * (self.vectors[rows] @ self.vectors[cols].T)
+        )
+        scale = 10**DISTANCE_DECIMALS
+        keys = np.rint(np.maximum(distances, 0.0) * scale).astype(np.int64) * (n + 1) + cols
+        keys[rows[:, None] == cols[None, :]] = np.iinfo(np.int64).max
+        return keys
+
+    def _search(self, rows, candidates, k: int):
+        """Top k keys and indexes of `rows` among `candidates` (index arrays)"""
+        import numpy as np
+
+        top_keys = np.full((len(rows), k), np.iinfo(np.int64).max, dtype=np.int64)
+        top_index = np.full_like(top_keys, -1)
+        step = self.block_size[1]
+        for c in range(0, len(candidates), step):
+            cols = candidates[c : c + step]
+            top_keys, top_index = _merge_nearest(
+                top_keys, top_index, self._block_keys(rows, cols), cols
+            )
+        return top_keys, top_index
+
+    def _run(self, tasks, k: int):
+        """Run (rows, candidates) searches, in threads when workers > 1"""
+        import numpy as np
+
+        n = len(self.ids)
+        top_keys = np.empty((n, k), dtype=np.int64)
+        top_index = np.empty((n, k), dtype=np.int64)
+        if k == 0:
+            return top_index
+
+        def run(task):
+            rows, candidates = task
+            top_keys[rows], top_index[rows] = self._search(rows, candidates, k)
+
+        if self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(run, tasks))
+        else:
+            for task in tasks:
+                run(task)
+        order = np.argsort(top_keys, axis=1)
+        return np.take_along_axis(top_index, order, axis=1)
+
+    def exact(self, k: int = DEFAULT_K):
+        """(n, k) neighbour indexes from every pair, one block at a time"""
+        import numpy as np
+
+        n = len(self.ids)
+        everyone = np.arange(n)
+        step = self.block_size[0]
+        tasks = [(everyone[r : r + step], everyone) for r in range(0, n, step)]
+        return self._run(tasks, min(k, max(n - 1, 0)))
+
+    def approximate(self, k: int = DEFAULT_K, nprobe: int = DEFAULT_NPROBE, seed: int = 0):
+        """(n, k) neighbour indexes from the nprobe clusters nearest each profile's own
+
+        About sqrt(n) k-means clusters of about sqrt(n) profiles each, so
+        the work grows as n * nprobe * sqrt(n) instead of n².
+        """
+        import numpy as np
+
+        n = len(self.ids)
+        k = min(k, max(n - 1, 0))
+        if k == 0:
+            return self._run([], k)
+        centroids = self._kmeans(max(1, int(math.sqrt(n))), seed)
+        assignment = self._nearest_centroid(centroids)
+        order = np.argsort(assignment, kind="stable")
+        sizes = np.bincount(assignment, minlength=len(centroids))
+        starts = np.concatenate([[0], np.cumsum(sizes)])
+
+        centroid_squares = np.einsum("ij,ij->i", centroids, centroids)
+        between = (
+            centroid_squares[:, None] + centroid_squares[None, :] - 2.0 * centroids @ centroids.T
+        )
+        tasks = []
+        step = self.block_size[0]
+        for cluster in np.flatnonzero(sizes):
+            # Nearest clusters first, until nprobe of them hold k other profiles
+            probe = np.argsort(between[cluster], kind="stable")
+            reach = np.cumsum(sizes[probe])
+            count = max(nprobe, int(np.searchsorted(reach, k + 1)) + 1)
+            candidates = np.sort(
+                np.concatenate([order[starts[c] : starts[c + 1]] for c in probe[:count]])
+            )
+            members = order[starts[cluster] : starts[cluster + 1]]
+            tasks.extend((members[r : r + step], candidates) for r in range(0, len(members), step))
+        return self._run(tasks, k)
+
+    def _kmeans(self, clusters: int, seed: int):
+        """Centroids from a few Lloyd iterations over a sample of the vectors"""
+        import numpy as np
+
+        random = np.random.RandomState(seed)
+        n = len(self.ids)
+        sample = self.vectors[random.choice(n, min(n, KMEANS_SAMPLE), replace=False)]
+        centroids = sample[random.choice(len(sample), clusters, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            assignment = self._nearest_centroid(centroids, sample)
+            counts = np.bincount(assignment, minlength=clusters)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            filled = counts > 0  # an empty cluster keeps its centroid
+            centroids[filled] = sums[filled] / counts[filled, None]
+        return centroids
+
+    def _nearest_centroid(self, centroids, vectors=None):
+        import numpy as np
+
+        vectors = self.vectors if vectors is None else vectors
+        squares = np.einsum("ij,ij->i", centroids, centroids)
+        nearest = np.empty(len(vectors), dtype=np.int64)
+        step = self.block_size[0]
+        for r in range(0, len(vectors), step):
+            block = vectors[r : r + step]
+            nearest[r : r + step] = np.argmin(squares[None, :] - 2.0 * block @ centroids.T, axis=1)
+        return nearest
+
+    def neighbours(
+        self, k: int = DEFAULT_K, method: str = "auto", nprobe: int = DEFAULT_NPROBE
+    ):
+        """(n, k) neighbour indexes: "exact", "approximate" or "auto" by corpus size"""
+        if method == "auto":
+            method = "exact" if len(self.ids) <= APPROXIMATE_ABOVE else "approximate"
+        if method == "exact":
+            return self.exact(k)
+        if method == "approximate":
+            return self.approximate(k, nprobe)
+        raise ValueError(f"Unknown neighbour search method: {method}")
+
+    def similar_ids(self, k: int = DEFAULT_K, method: str = "auto") -> Dict[str, List[str]]:
+        """Every profile id -> the ids of its k most similar profiles"""
+        neighbours = self.neighbours(k, method).tolist()
+        return {
+            profile_id: [self.ids[j] for j in row]
+            for profile_id, row in zip(self.ids, neighbours)
+        }
+
+
+def attach_similar_ids(
+    characters: Iterable[Dict[str, Any]], similar: Dict[str, List[str]]
+) -> Iterator[Dict[str, Any]]:
+    """Yield each character with its similar_ids list set"""
+    for character in characters:
+        character["similar_ids"] = similar.get(character["id"], [])
+        yield character
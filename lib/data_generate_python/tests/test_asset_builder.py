@@ -0,0 +1,123 @@
+"""
+Test script for the hash-gated prebuild step
+Builds the Flutter asset from a cached CSV without any API calls
+"""
+
+import csv
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from asset_builder import AssetBuilder
+
+
+def _write_csv(path: Path, rows):
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _make_builder(tmp: Path) -> AssetBuilder:
+    raw_data = tmp / "raw_data"
+    raw_data.mkdir()
+    (raw_data / "men_100.md").write_text(
+        "- (编号1)\n身高：170\n\n- (编号2)\n身高：180\n", encoding="utf-8"
+    )
+    _write_csv(
+        tmp / "profiles.csv",
+        [{"id": "men_100_1", "gender": "male", "age": 30, "raw_text": "编号1"}],
+    )
+    return AssetBuilder(
+        raw_data_path=raw_data,
+        csv_file=tmp / "profiles.csv",
+        json_file=tmp / "characters.json",
+        dart_file=tmp / "lib" / "generated_characters_data.dart",
+        stamp_file=tmp / "stamp.json",
+        vocabulary_file=tmp / "interest_vocabulary.json",
+        image_index_file=tmp / "image_index.json",
+        search_index_file=tmp / "assets" / "search_index.bin",
+    )
+
+
+def test_build_is_hash_gated():
+    """Second build with unchanged inputs does nothing"""
+    print("🧪 Testing hash-gated prebuild...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        builder = _make_builder(Path(tmp))
+
+        report = builder.build()
+        assert len(report["rebuilt"]) == 3, report
+        assert report["pending_profiles"] == ["men_100_2"], report
+        with open(builder.json_file, "r", encoding="utf-8") as f:
+            assert json.load(f)[0]["id"] == "profile_men_100_1"
+        dart_source = builder.dart_file.read_text(encoding="utf-8")
+        assert "id: 'profile_men_100_1'," in dart_source
+
+        report = builder.build()
+        assert report["changed"] == [] and report["rebuilt"] == [], report
+
+        print("   ✅ Unchanged inputs skip the build")
+
+
+def test_cache_change_rebuilds_json():
+    """A new cached extraction rebuilds the JSON and the Dart module"""
+    print("🧪 Testing rebuild after cache change...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        builder = _make_builder(Path(tmp))
+        builder.build()
+
+        _write_csv(
+            builder.csv_file,
+            [
+                {"id": "men_100_1", "gender": "male", "age": 30, "raw_text": "a"},
+                {"id": "men_100_2", "gender": "male", "age": 40, "raw_text": "b"},
+            ],
+        )
+        report = builder.build()
+        assert report["changed"] == ["extractions"], report
+        with open(builder.json_file, "r", encoding="utf-8") as f:
+            assert len(json.load(f)) == 2
+        assert not list(builder.json_file.parent.glob("*.tmp"))
+        dart_source = builder.dart_file.read_text(encoding="utf-8")
+        assert "id: 'profile_men_100_2'," in dart_source
+
+        # A JSON written by the pipeline itself: publish follows it
+        characters = json.loads(builder.json_file.read_text(encoding="utf-8"))
+        builder.json_file.write_text(json.dumps(characters[:1]), encoding="utf-8")
+        assert builder.publish() == [str(builder.dart_file), str(builder.search_index_file)]
+        dart_source = builder.dart_file.read_text(encoding="utf-8")
+        assert dart_source.count("id: 'profile_men_100_") == 1
+        assert builder.publish() == []
+
+        print("   ✅ Data rebuilt from cached extractions")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Asset Builder Test Suite")
+    print("=" * 50)
+
+    tests = [test_build_is_hash_gated, test_cache_change_rebuilds_json]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,232 @@
+"""
+Test script for batch extraction
+Runs a local stand-in for the files/batches API: request file format,
+submit-then-import across runs, failed requests resubmitted next batch
+"""
+
+import json
+import sys
+import tempfile
+import threading
+from email.parser import BytesParser
+from email.policy import default as email_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from batch_extraction import parse_batch_output
+from data_pipeline import DataPipeline
+from deepseek_data_processor import DeepSeekProcessor
+from endpoint_pool import Endpoint
+
+
+def start_batch_stand_in(fail_once=()):
+    """Files + batches API; custom_ids in `fail_once` fail on their first batch"""
+    files = {}
+    batches = {}
+    failed_before = set()
+
+    def run_batch(batch):
+        output, errors = [], []
+        for line in files[batch["input_file_id"]].decode().splitlines():
+            request = json.loads(line)
+            custom_id = request["custom_id"]
+            if custom_id in fail_once and custom_id not in failed_before:
+                failed_before.add(custom_id)
+                errors.append(
+                    {
+                        "custom_id": custom_id,
+                        "response": {"status_code": 500, "body": {"error": "boom"}},
+                    }
+                )
+                continue
+            content = json.dumps({"height_cm": 170, "hobbies": "旅游, 摄影"})
+            body = {"choices": [{"message": {"content": content}}]}
+            output.append({"custom_id": custom_id, "response": {"status_code": 200, "body": body}})
+        for key, records in (("output_file_id", output), ("error_file_id", errors)):
+            if records:
+                file_id = f"file-{len(files)}"
+                files[file_id] = "".join(json.dumps(r) + "\n" for r in records).encode()
+                batch[key] = file_id
+        batch["request_counts"] = {
+            "total": len(output) + len(errors),
+            "completed": len(output),
+            "failed": len(errors),
+        }
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, payload, raw=False):
+            body = payload if raw else json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            if self.path == "/v1/files":
+                header = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n"
+                message = BytesParser(policy=email_policy).parsebytes(header.encode() + body)
+                parts = {
+                    part.get_param("name", header="content-disposition"): part
+                    for part in message.iter_parts()
+                }
+                assert parts["purpose"].get_content() == "batch"
+                file_id = f"file-{len(files)}"
+                files[file_id] = parts["file"].get_payload(decode=True)
+                self._send({"id": file_id})
+            elif self.path == "/v1/batches":
+                request = json.loads(body)
+                assert request["endpoint"] == "/v1/chat/completions"
+                batch_id = f"batch-{len(batches)}"
+                batches[batch_id] = {
+                    "id": batch_id,
+                    "status": "validating",
+                    "input_file_id": request["input_file_id"],
+                    "polls": 0,
+                }
+                self._send(batches[batch_id])
+            else:
+                self.send_error(404)
+
+        def do_GET(self):
+            if self.path.startswith("/v1/batches/"):
+                batch = batches[self.path.rsplit("/", 1)[1]]
+                batch["polls"] += 1
+                if batch["polls"] == 1:
+                    batch["status"] = "in_progress"
+                elif batch["status"] != "completed":
+                    run_batch(batch)
+                    batch["status"] = "completed"
+                self._send(batch)
+            elif self.path.endswith("/content"):
+                self._send(files[self.path.split("/")[3]], raw=True)
+            else:
+                self.send_error(404)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1", files
+
+
+def test_parse_batch_output():
+    """Output and error lines are split by custom_id"""
+    print("🧪 Testing batch output parsing...")
+
+    ok = {"choices": [{"message": {"content": '```json\n{"mbti": "INTJ"}\n```'}}]}
+    lines = [
+        json.dumps({"custom_id": "a", "response": {"status_code": 200, "body": ok}}),
+        json.dumps({"custom_id": "b", "response": {"status_code": 429, "body": {}}}),
+        json.dumps({"custom_id": "c", "error": {"message": "expired"}}),
+        "",
+    ]
+    results, errors = parse_batch_output(lines, DeepSeekProcessor.parse_completion)
+    assert results == {"a": {"mbti": "INTJ"}}
+    assert set(errors) == {"b", "c"} and "HTTP 429" in errors["b"]
+    print("   ✅ Batch output parsing OK")
+
+
+def test_submit_poll_import():
+    """Submit without waiting, import on the next run, resubmit only failures"""
+    print("🧪 Testing batch submit and import...")
+
+    server, url, files = start_batch_stand_in(fail_once={"men_1_3"})
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            raw = tmp / "raw_data"
+            raw.mkdir()
+            (raw / "men_1.md").write_text(
+                "".join(f"编号{i}\n身高170 爱好旅游\n\n" for i in range(1, 5)),
+                encoding="utf-8",
+            )
+            (raw / "women_1.md").write_text(
+                "编号1\n身高160\n\n编号2\n身高165\n", encoding="utf-8"
+            )
+
+            pipeline = DataPipeline(
+                "test-key", endpoints=[Endpoint("test-key", url, model="batch-model")]
+            )
+            options = dict(
+                input_folder=str(raw),
+                csv_output=str(tmp / "out" / "profiles.csv"),
+                json_output=str(tmp / "out" / "characters.json"),
+                progress_file=str(tmp / "progress.json"),
+                batch_dir=str(tmp / "batches"),
+                poll_interval=0,
+            )
+
+            # Run 1: submit only
+            assert pipeline.run_batch_pipeline(wait=False, **options)
+            request_files = list((tmp / "batches").glob("*.jsonl"))
+            assert len(request_files) == 1
+            requests = [
+                json.loads(line)
+                for line in request_files[0].read_text(encoding="utf-8").splitlines()
+            ]
+            assert [r["custom_id"] for r in requests] == [
+                "men_1_1", "men_1_2", "men_1_3", "men_1_4", "women_1_1", "women_1_2"
+            ]
+            assert requests[0]["url"] == "/v1/chat/completions"
+            assert requests[0]["body"]["model"] == "batch-model"
+            assert requests[0]["body"]["messages"][1]["content"].startswith("编号1")
+            progress = json.loads((tmp / "progress.json").read_text(encoding="utf-8"))
+            job = progress["batch_jobs"][0]
+            assert job["batch_id"] == "batch-0" and not job.get("imported")
+            assert job["profiles"]["women_1_2"]["gender"] == "female"
+
+            # Run 2: the recorded job is polled and imported, not resubmitted
+            assert pipeline.run_batch_pipeline(**options)
+            progress = json.loads((tmp / "progress.json").read_text(encoding="utf-8"))
+            assert len(progress["batch_jobs"]) == 1
+            assert len(progress["completed_profiles"]) == 5
+            assert [f["id"] for f in progress["failed_profiles"]] == ["men_1_3"]
+            people = pipeline.load_checkpoint(tmp / "out" / "profiles.csv")
+            assert len(people) == 5
+            person = next(p for p in people if p.id == "women_1_2")
+            assert person.gender == "female" and person.height_cm == 170
+            assert person.get_raw_text().startswith("编号2")
+
+            # Run 3: only the failed profile goes into the next batch
+            assert pipeline.run_batch_pipeline(**options)
+            progress = json.loads((tmp / "progress.json").read_text(encoding="utf-8"))
+            assert len(progress["batch_jobs"]) == 2
+            assert list(progress["batch_jobs"][1]["profiles"]) == ["men_1_3"]
+            assert len(progress["completed_profiles"]) == 6
+            assert progress["failed_profiles"] == []
+            characters = json.loads(
+                (tmp / "out" / "characters.json").read_text(encoding="utf-8")
+            )
+            assert len(characters) == 6
+    finally:
+        server.shutdown()
+    print("   ✅ Batch submit and import OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Batch Extraction Test Suite")
+    print("=" * 50)
+
+    tests = [test_parse_batch_output, test_submit_poll_import]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,140 @@
+"""
+Test script for the background checkpoint writer
+Coalescing of pending snapshots, backpressure when writes fall behind,
+flush on close, and atomic progress/CSV writes that leave the old file
+in place when a save fails
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from checkpoint_writer import CheckpointWriter
+from data_pipeline import DataPipeline
+from deepseek_data_processor import DeepSeekProcessor, ProcessedPerson, RawTextRef
+
+
+def test_coalescing_and_backpressure():
+    """Only the newest snapshot is kept; a lagging writer slows submit()"""
+    print("🧪 Testing coalescing and backpressure...")
+
+    written = []
+    started = threading.Event()
+    gate = threading.Event()
+
+    def slow_write(snapshot):
+        written.append(snapshot)
+        started.set()
+        gate.wait()
+
+    writer = CheckpointWriter(slow_write, max_coalesced=3)
+    writer.submit(1)
+    assert started.wait(5)  # the writer is busy with 1
+
+    start = time.perf_counter()
+    for snapshot in (2, 3, 4):
+        writer.submit(snapshot)  # 2 and 3 are replaced while 1 is written
+    assert time.perf_counter() - start < 0.5
+    assert writer.stats["coalesced"] == 2
+
+    # The third replacement in a row waits for the writer
+    fifth = threading.Thread(target=writer.submit, args=(5,))
+    fifth.start()
+    fifth.join(0.3)
+    assert fifth.is_alive(), "submit() did not wait for a lagging writer"
+    gate.set()
+    fifth.join(5)
+    assert not fifth.is_alive()
+
+    writer.close()
+    assert written == [1, 4, 5]
+    assert writer.stats["waited"] == 1
+    assert writer.stats["written"] == 3
+    try:
+        writer.submit(6)
+        assert False, "submit() after close() should fail"
+    except RuntimeError:
+        pass
+    print("   ✅ Coalescing and backpressure OK")
+
+
+def test_errors_and_flush():
+    """A failed write is reported, later snapshots are still written"""
+    print("🧪 Testing write errors and flush...")
+
+    written = []
+
+    def flaky_write(snapshot):
+        if snapshot == "bad":
+            raise OSError("disk full")
+        written.append(snapshot)
+
+    writer = CheckpointWriter(flaky_write)
+    writer.submit("bad")
+    writer.flush()
+    writer.submit("good")
+    writer.flush()
+    assert written == ["good"]
+    assert isinstance(writer.last_error, OSError)
+    assert writer.stats["failed"] == 1
+    writer.close()
+    writer.close()
+    print("   ✅ Write errors and flush OK")
+
+
+def test_atomic_saves():
+    """Progress and CSV are replaced whole; a failed save keeps the old file"""
+    print("🧪 Testing atomic progress and CSV saves...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pipeline = DataPipeline("test-key")
+        progress_file = tmp / "progress.json"
+        pipeline.save_progress({"completed_profiles": [{"id": "men_1_1"}]}, str(progress_file))
+        assert json.loads(progress_file.read_text(encoding="utf-8"))["completed_profiles"]
+
+        processor = DeepSeekProcessor("test-key")
+        csv_file = tmp / "profiles.csv"
+        processor.save_to_csv([ProcessedPerson(id="men_1_1", height_cm=170)], csv_file)
+        before = csv_file.read_bytes()
+
+        # The raw text of the second person cannot be loaded mid-write
+        broken = ProcessedPerson(id="men_1_2", raw_text=RawTextRef(tmp / "gone.md", 0, 10))
+        try:
+            processor.save_to_csv([ProcessedPerson(id="men_1_1"), broken], csv_file)
+            assert False, "save_to_csv should have failed"
+        except OSError:
+            pass
+        assert csv_file.read_bytes() == before
+        assert sorted(p.name for p in tmp.iterdir()) == ["profiles.csv", "progress.json"]
+    print("   ✅ Atomic saves OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Checkpoint Writer Test Suite")
+    print("=" * 50)
+
+    tests = [test_coalescing_and_backpressure, test_errors_and_flush, test_atomic_saves]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,118 @@
+"""
+Test script for the extraction circuit breaker
+Checks tripping, half-open probing and that an open breaker sends nothing
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from deepseek_data_processor import APIError, DeepSeekProcessor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_trip_and_probe():
+    """Consecutive server failures open it; one probe decides what happens next"""
+    print("🧪 Testing breaker transitions...")
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+
+    breaker.record_failure("server")
+    breaker.record_failure("rate_limit")  # endpoint answered: streak resets
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure("timeout")
+    assert breaker.state == OPEN
+
+    try:
+        breaker.before_call()
+        assert False, "open breaker admitted a request"
+    except CircuitOpenError as e:
+        assert e.retry_in == 10
+
+    # Half-open: a single probe; its failure doubles the timeout
+    clock.now = 10
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    try:
+        breaker.before_call()
+        assert False, "second probe admitted"
+    except CircuitOpenError:
+        pass
+    breaker.record_failure("server")
+    assert breaker.state == OPEN and breaker.retry_in() == 20
+
+    clock.now = 30
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert [t["to"] for t in breaker.transitions] == [OPEN, HALF_OPEN, OPEN, HALF_OPEN, CLOSED]
+
+    print("   ✅ Transitions OK")
+
+
+def test_processor_skips_requests_while_open():
+    """request_extraction reports circuit_open without calling the endpoint"""
+    print("🧪 Testing processor integration...")
+
+    processor = DeepSeekProcessor(
+        "test-key", max_requests_per_minute=6000, delay_between_requests=0
+    )
+    processor.pool.endpoints[0].breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout=60
+    )
+    calls = []
+
+    def failing_request(text, endpoint, **options):
+        calls.append(text)
+        raise APIError("server", "Server error: 503")
+
+    processor._make_api_request = failing_request
+
+    error_classes = []
+    for _ in range(4):
+        try:
+            processor.request_extraction("编号1")
+        except APIError as e:
+            error_classes.append(e.error_class)
+
+    # The failure that trips the breaker is reported as an outage too
+    assert error_classes == ["server", "circuit_open", "circuit_open", "circuit_open"]
+    assert len(calls) == 2
+
+    print("   ✅ Processor integration OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Circuit Breaker Test Suite")
+    print("=" * 50)
+
+    tests = [test_trip_and_probe, test_processor_skips_requests_while_open]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,200 @@
+"""
+Test script for the compatibility matcher
+Preference parsing into constraints, blocked NumPy top-k that agrees with
+a plain double loop for any block size, bounded memory, and the
+top_matches.json written next to the dataset
+"""
+
+import csv
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from compatibility_matcher import (
+    REGION_CODES,
+    CompatibilityMatcher,
+    parse_preferences,
+    write_top_matches,
+)
+from deepseek_data_processor import ProcessedPerson
+from processed_store import person_from_csv_row
+
+SOURCE_CSV = parent_dir / "output" / "processed_dating_profiles.csv"
+
+
+def load_people():
+    with open(SOURCE_CSV, "r", encoding="utf-8-sig", newline="") as f:
+        return [person_from_csv_row(row) for row in csv.DictReader(f)]
+
+
+def naive_top(matcher, k):
+    """Top k per profile from pair_score over every pair, one at a time"""
+    top = {}
+    for i, man in enumerate(matcher.men.ids):
+        scored = sorted(
+            (
+                (round(matcher.pair_score(i, j) * 1e6), -j)
+                for j in range(len(matcher.women))
+            ),
+            reverse=True,
+        )
+        top[man] = [(matcher.women.ids[-j], score / 1e6) for score, j in scored[:k]]
+    for j, woman in enumerate(matcher.women.ids):
+        scored = sorted(
+            (
+                (round(matcher.pair_score(i, j) * 1e6), -i)
+                for i in range(len(matcher.men))
+            ),
+            reverse=True,
+        )
+        top[woman] = [(matcher.men.ids[-i], score / 1e6) for score, i in scored[:k]]
+    return top
+
+
+def test_parse_preferences():
+    """Ages, heights, BMI, marital status, house, car and regions from free text"""
+    print("🧪 Testing preference parsing...")
+
+    c = parse_preferences(
+        "希望对方年龄28-40岁，身高160cm以上，标准BMI，未婚", reference_year=2025
+    )
+    assert (c.min_age, c.max_age, c.min_height, c.max_height) == (28, 40, 160, None)
+    assert (c.min_bmi, c.max_bmi, c.never_married) == (18.5, 25.0, True)
+
+    c = parse_preferences("88年～92年出生，裸足172以上", reference_year=2025)
+    assert (c.min_age, c.max_age, c.min_height) == (33, 37, 172)
+
+    c = parse_preferences("95后00后均可，身高160 ± 10", reference_year=2025)
+    assert (c.min_age, c.max_age) == (16, 30)
+    assert (c.min_height, c.max_height) == (150, 170)
+
+    c = parse_preferences(
+        "年纪上下五岁以内，年收500+，不接受异地", own_age=30, own_location="东京品川区"
+    )
+    assert (c.min_age, c.max_age, c.min_height) == (25, 35, None)
+    assert c.regions == 1 << REGION_CODES["东京"]
+
+    c = parse_preferences("37岁或以下，在关东发展，有房")
+    assert (c.min_age, c.max_age, c.needs_house) == (18, 37, True)
+    assert c.regions == sum(1 << REGION_CODES[r] for r in ("东京", "埼玉", "千叶", "神奈川"))
+
+    # One-sided limits narrow each other instead of widening to 18-80
+    c = parse_preferences("年龄20岁以上39岁以下。")
+    assert (c.min_age, c.max_age) == (20, 39)
+    c = parse_preferences("25-35岁，40岁以下")
+    assert (c.min_age, c.max_age) == (25, 35)
+    c = parse_preferences("身高165cm以上，175以下")
+    assert (c.min_height, c.max_height) == (165, 175)
+
+    # Accepted, not required
+    c = parse_preferences("不要求有房有车")
+    assert (c.needs_house, c.needs_car) == (False, False)
+    assert not parse_preferences("有没有房无所谓").needs_house
+    assert not parse_preferences("未婚或者离异无孩").never_married
+    c = parse_preferences("有房，有没有车无所谓")
+    assert (c.needs_house, c.needs_car) == (True, False)
+
+    assert parse_preferences("真诚善良就好") == parse_preferences(None)
+    print("   ✅ Preference parsing OK")
+
+
+def test_matches_naive_loop():
+    """Blocked top-k equals the double loop, whatever the block size"""
+    print("🧪 Testing blocked scoring against a double loop...")
+
+    people = load_people()
+    expected = None
+    for block_size in [(37, 50), (1000, 1000)]:
+        matcher = CompatibilityMatcher(people, reference_year=2025, block_size=block_size)
+        top = matcher.top_matches(k=5)
+        if expected is None:
+            expected = naive_top(matcher, 5)
+        assert top == expected, block_size
+    assert len(top) == len(matcher.men) + len(matcher.women)
+    assert all(top[woman][0][0].startswith("men_") for woman in matcher.women.ids)
+
+    # k larger than the other population: everyone, best first
+    women = [p for p in people if p.id.startswith("women_")]
+    small = CompatibilityMatcher(people[:5] + women[:2])
+    top_small = small.top_matches(k=10)
+    assert all(len(top_small[man]) == 2 for man in small.men.ids)
+    print(f"   ✅ {len(matcher.men)} x {len(matcher.women)} pairs identical")
+
+
+def test_bounded_memory():
+    """Peak memory follows the block size, not the number of pairs"""
+    print("🧪 Testing bounded memory...")
+
+    people = []
+    for i in range(4000):
+        prefix = "men" if i % 2 else "women"
+        people.append(
+            ProcessedPerson(
+                id=f"{prefix}_1_{i}",
+                age=20 + i % 30,
+                height_cm=150 + i % 40,
+                current_location="东京" if i % 3 else "大阪",
+                partner_preferences="年龄25-35岁，身高165以上" if i % 5 else "不接受异地",
+            )
+        )
+    matcher = CompatibilityMatcher(people, block_size=(128, 256))
+    tracemalloc.start()
+    top = matcher.top_matches(k=10)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    full_matrix = len(matcher.men) * len(matcher.women) * 8
+    print(f"   peak {peak / 2**20:.1f} MB for a {full_matrix / 2**20:.0f} MB score matrix")
+    assert peak < full_matrix / 4
+    assert len(top) == 4000 and all(len(v) == 10 for v in top.values())
+    print("   ✅ Memory bounded by the block size")
+
+
+def test_write_top_matches():
+    """top_matches.json maps every profile to [id, score] pairs"""
+    print("🧪 Testing top matches file...")
+
+    people = load_people()
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp, "top_matches.json")
+        assert write_top_matches(people, output, k=3, reference_year=2025) == len(people)
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["k"] == 3 and len(data["matches"]) == len(people)
+        first = data["matches"][people[0].id]
+        assert len(first) == 3 and all(0 <= score <= 1 for _, score in first)
+        assert [p.name for p in Path(tmp).iterdir()] == ["top_matches.json"]
+    print("   ✅ Top matches file OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Compatibility Matcher Test Suite")
+    print("=" * 50)
+
+    tests = [
+        test_parse_preferences,
+        test_matches_naive_loop,
+        test_bounded_memory,
+        test_write_top_matches,
+    ]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,219 @@
+"""
+Test script for the multi-endpoint request pool
+Runs local OpenAI-compatible stand-ins: headroom routing, failover on
+server errors and rate limits, an exhausted pool, and the request total
+reported at the end of process_all_files
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from endpoint_pool import Endpoint, RateLimiter, chat_completions_url
+from deepseek_data_processor import APIError, DeepSeekProcessor
+
+
+def start_stand_in(status: int = 200, retry_after=None):
+    """Serve /v1/chat/completions, answering with `status`; count requests"""
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            seen.append((self.headers["Authorization"], body["model"]))
+            if status != 200:
+                self.send_response(status)
+                if retry_after is not None:
+                    self.send_header("Retry-After", str(retry_after))
+                self.end_headers()
+                return
+            content = json.dumps({"height_cm": 170, "hobbies": "旅游"})
+            payload = json.dumps({"choices": [{"message": {"content": content}}]})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(payload.encode())
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1", seen
+
+
+def fast_endpoint(api_key, base_url, **settings):
+    return Endpoint(
+        api_key, base_url, name=api_key, max_requests_per_minute=60000, **settings
+    )
+
+
+def test_rate_limiter_and_urls():
+    """Slots are spaced by the interval; cooldowns push the next slot back"""
+    print("🧪 Testing rate limiter...")
+
+    now = [0.0]
+    limiter = RateLimiter(max_requests_per_minute=30, clock=lambda: now[0])
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 2.0, 4.0]
+    now[0] = 10.0
+    assert limiter.reserve() == 0.0
+    limiter.cooldown(5)
+    assert limiter.wait_time() == 5.0
+
+    assert chat_completions_url("https://api.deepseek.com/v1/") == (
+        "https://api.deepseek.com/v1/chat/completions"
+    )
+    assert chat_completions_url("http://x/v1/chat/completions") == (
+        "http://x/v1/chat/completions"
+    )
+    print("   ✅ Rate limiter OK")
+
+
+def test_routing_spreads_load():
+    """Concurrent requests are spread over every endpoint's key"""
+    print("🧪 Testing headroom routing...")
+
+    servers = [start_stand_in() for _ in range(3)]
+    try:
+        endpoints = [
+            fast_endpoint(f"key-{i}", url, model=f"model-{i}")
+            for i, (_, url, _) in enumerate(servers)
+        ]
+        processor = DeepSeekProcessor("unused", endpoints=endpoints)
+        assert processor.pool.max_concurrency == 3
+
+        with ThreadPoolExecutor(max_workers=3) as workers:
+            results = list(workers.map(processor.request_extraction, ["编号1"] * 30))
+
+        assert all(result["hobbies"] == "旅游" for result in results)
+        counts = [len(seen) for _, _, seen in servers]
+        assert sum(counts) == 30 and min(counts) >= 5, counts
+        # Each endpoint's own key and model were used
+        for i, (_, _, seen) in enumerate(servers):
+            assert set(seen) == {(f"Bearer key-{i}", f"model-{i}")}
+    finally:
+        for server, _, _ in servers:
+            server.shutdown()
+    print("   ✅ Headroom routing OK")
+
+
+def test_failover():
+    """Server errors and 429s fail over; the failing endpoint's breaker opens"""
+    print("🧪 Testing failover...")
+
+    broken, broken_url, broken_seen = start_stand_in(status=503)
+    limited, limited_url, limited_seen = start_stand_in(status=429, retry_after=60)
+    healthy, healthy_url, healthy_seen = start_stand_in()
+    try:
+        endpoints = [
+            fast_endpoint("broken", broken_url),
+            fast_endpoint("limited", limited_url),
+            fast_endpoint("healthy", healthy_url),
+        ]
+        endpoints[0].breaker.failure_threshold = 2
+        processor = DeepSeekProcessor("unused", endpoints=endpoints)
+
+        for _ in range(10):
+            assert processor.request_extraction("编号1")["height_cm"] == 170
+
+        assert len(healthy_seen) == 10
+        assert len(broken_seen) <= 2  # breaker opened after two failures
+        assert endpoints[0].breaker.state == "open"
+        # Retry-After put the limited endpoint on cooldown after one 429
+        assert len(limited_seen) == 1
+        assert endpoints[1].limiter.wait_time() > 50
+        report = processor.pool.report()
+        assert report["healthy"]["succeeded"] == 10
+        assert report["limited"]["rate_limited"] == 1
+    finally:
+        for server in (broken, limited, healthy):
+            server.shutdown()
+    print("   ✅ Failover OK")
+
+
+def test_all_endpoints_failing():
+    """With no endpoint left the last error (or circuit_open) is raised"""
+    print("🧪 Testing exhausted pool...")
+
+    limited, url, seen = start_stand_in(status=429, retry_after=1)
+    try:
+        processor = DeepSeekProcessor("unused", endpoints=[fast_endpoint("a", url)])
+        try:
+            processor.request_extraction("编号1")
+            assert False, "expected an APIError"
+        except APIError as e:
+            assert e.error_class == "rate_limit" and e.retry_after == 1
+
+        # A pool whose only breaker is open sends nothing
+        pool_endpoint = processor.pool.endpoints[0]
+        for _ in range(pool_endpoint.breaker.failure_threshold):
+            pool_endpoint.breaker.record_failure("server")
+        try:
+            processor.request_extraction("编号1")
+            assert False, "expected circuit_open"
+        except APIError as e:
+            assert e.error_class == "circuit_open" and e.retry_after > 0
+        assert len(seen) == 1
+    finally:
+        limited.shutdown()
+    print("   ✅ Exhausted pool OK")
+
+
+def test_process_all_files_summary():
+    """A whole-folder run ends with the pool's request total"""
+    print("🧪 Testing process_all_files summary...")
+
+    processor = DeepSeekProcessor("unused", endpoints=[fast_endpoint("a", "http://unused/v1")])
+    processor.call_api = lambda text, **options: {"height_cm": 170, "hobbies": "旅游"}
+    processor.pool.endpoints[0].stats["requests"] = 2  # as if two requests were sent
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "men_1.md").write_text(
+            "- (编号1)\n身高：170\n\n- (编号2)\n身高：180\n", encoding="utf-8"
+        )
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            people = processor.process_all_files(Path(tmp), Path(tmp, "out.csv"), ["men_*.md"])
+        assert [person.height_cm for person in people] == [170, 170]
+        assert Path(tmp, "out.csv").exists()
+    assert "Total API requests made: 2" in output.getvalue()
+    print("   ✅ process_all_files summary OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Endpoint Pool Test Suite")
+    print("=" * 50)
+
+    tests = [
+        test_rate_limiter_and_urls,
+        test_routing_spreads_load,
+        test_failover,
+        test_all_endpoints_failing,
+        test_process_all_files_summary,
+    ]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
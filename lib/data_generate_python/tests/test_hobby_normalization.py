@@ -10,7 +10,7 @@ import sys
 import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from csv_to_flutter_converter import FlutterDataConverter
+from interest_canonicalizer import canonicalize_interests
 from deepseek_data_processor import normalize_hobbies
 
 
@@ -52,14 +52,14 @@ def test_normalization():
         basic_split = normalize_hobbies(input_str)
         print(f"Split:  {basic_split}")
 
-        # Step 2: Remove redundant combinations
-        final_result = FlutterDataConverter._normalize_interests(basic_split)
+        # Step 2: Canonicalize, which also splits redundant combinations
+        final_result = canonicalize_interests(", ".join(basic_split))
         print(f"Final:  {final_result}")
 
         # Show what was removed
         removed = set(basic_split) - set(final_result)
         if removed:
-            print(f"Removed: {sorted(removed)} (redundant combinations)")
+            print(f"Removed: {sorted(removed)} (redundant combinations or synonyms)")
 
         print(f"Reduction: {len(basic_split)} → {len(final_result)} interests")
         print("-" * 60)
@@ -0,0 +1,139 @@
+"""
+Test script for the profile image cache
+Fetches images from a local HTTP stand-in: dedupe by content hash,
+thumbnail size, failures and resume without refetching
+"""
+
+import io
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from image_cache import THUMBNAIL_SIZE, ImageCache
+
+
+def _png(color, size=(1200, 1600)) -> bytes:
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _start_server(images):
+    """Serve `images` (path -> bytes) and count requests per path"""
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(self.path)
+            body = images.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests_seen
+
+
+def test_prefetch_dedupe_and_resume():
+    """Identical images share a thumbnail; a second run fetches nothing"""
+    print("🧪 Testing image prefetch...")
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("   ⚠️ Pillow not installed, skipping")
+        return
+
+    red = _png("red")
+    images = {"/a.png": red, "/b.png": red, "/c.png": _png("blue", (300, 200))}
+    server, requests_seen = _start_server(images)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+
+            def make_cache():
+                return ImageCache(
+                    thumbnail_dir=tmp / "assets" / "thumbnails",
+                    index_file=tmp / "image_index.json",
+                    asset_root=tmp,
+                    max_workers=4,
+                )
+
+            characters = [
+                {"id": "1", "image": f"{base}/a.png"},
+                {"id": "2", "image": f"{base}/b.png"},
+                {"id": "3", "image": f"{base}/c.png"},
+                {"id": "4", "image": f"{base}/missing.png"},
+                {"id": "5", "image": None},
+            ]
+            report = make_cache().add_thumbnails(characters)
+            assert report["fetched"] == 3 and report["duplicates"] == 1, report
+            assert list(report["failed"]) == [f"{base}/missing.png"]
+
+            thumbnails = sorted((tmp / "assets" / "thumbnails").glob("*.jpg"))
+            assert len(thumbnails) == 2
+            assert characters[0]["thumbnail"] == characters[1]["thumbnail"]
+            assert characters[0]["thumbnail"].startswith("assets/thumbnails/")
+            assert characters[3]["thumbnail"] is None
+            assert characters[4]["thumbnail"] is None
+
+            from PIL import Image
+
+            with Image.open(tmp / characters[0]["thumbnail"]) as image:
+                assert image.size[0] <= THUMBNAIL_SIZE[0]
+                assert image.size[1] <= THUMBNAIL_SIZE[1]
+            with Image.open(tmp / characters[2]["thumbnail"]) as image:
+                assert image.size == (300, 200)  # small images are not upscaled
+
+            # Resume: only the failed URL is requested again
+            requests_seen.clear()
+            report = make_cache().add_thumbnails(characters)
+            assert report["cached"] == 3 and report["fetched"] == 0, report
+            assert requests_seen == ["/missing.png"], requests_seen
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("   ✅ Prefetch, dedupe and resume OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Image Cache Test Suite")
+    print("=" * 50)
+
+    tests = [test_prefetch_dedupe_and_resume]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,97 @@
+"""
+Test script for the interest canonicalizer
+Checks synonym merging, composite splitting and negated forms
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from csv_to_flutter_converter import FlutterDataConverter
+from interest_canonicalizer import MAX_INTERESTS, AhoCorasick, InterestCanonicalizer
+
+
+def test_leftmost_longest_matching():
+    """The automaton prefers the longest match at the leftmost position"""
+    print("🧪 Testing Aho-Corasick matching...")
+
+    automaton = AhoCorasick({"自驾": 0, "自驾游": 1, "游泳": 2, "he": 3, "she": 4})
+    assert automaton.find("自驾游泳") == [(0, 3, 1)]
+    assert automaton.find("游泳自驾") == [(0, 2, 2), (2, 4, 0)]
+    assert automaton.find("ushers") == [(1, 4, 4)]
+
+    # A shorter pattern ending with a longer one still counts once the
+    # longer one overlaps an earlier match
+    automaton = AhoCorasick({"ab": 0, "bcd": 1, "cd": 2})
+    assert automaton.find("abcd") == [(0, 2, 0), (2, 4, 2)]
+
+    print("   ✅ Matching OK")
+
+
+def test_synonyms_and_composites():
+    """Synonyms merge, composites split, unknown hobbies are kept"""
+    print("🧪 Testing canonicalization...")
+
+    canonicalizer = InterestCanonicalizer()
+    assert canonicalizer.canonicalize("旅游，旅行，摄影，拍照") == ("旅游", "摄影")
+    assert canonicalizer.canonicalize("游泳，读书，游泳读书") == ("游泳", "阅读")
+    assert canonicalizer.canonicalize("KTV, city walk") == ("唱歌", "散步")
+    assert canonicalizer.canonicalize("不抽烟不喝酒，宝可梦（") == ("宝可梦",)
+    assert canonicalizer.interest_ids("拍照") == [canonicalizer.vocabulary.index("摄影")]
+
+    # Cached: the same tuple object comes back for a repeated string
+    first = canonicalizer.canonicalize("看电影、打羽毛球")
+    assert first == ("电影", "羽毛球")
+    assert canonicalizer.canonicalize("看电影、打羽毛球") is first
+
+    print("   ✅ Canonicalization OK")
+
+
+def test_converter_keeps_all_interests():
+    """The converter keeps known interests past 6; free text is capped"""
+    print("🧪 Testing converter interests...")
+
+    converter = FlutterDataConverter()
+    hobbies = "滑雪，爬山，游泳，做饭，电影，动漫，唱歌，看YouTube玄学视频"
+    interests = converter._extract_interests(hobbies)
+    assert len(interests) == 8, interests
+    assert interests[-1] == "看YouTube玄学视频"
+    assert converter._extract_interests(None) == []
+
+    # A long unknown fragment is a sentence, not a hobby; lists are capped
+    interests = converter._extract_interests("游泳，现在也没有啥特别喜欢的希望你能带我培养")
+    assert interests == ["游泳"], interests
+    many = "，".join(["滑雪", "爬山", "游泳", "做饭", "电影", "动漫", "唱歌", "钢琴"] * 2)
+    assert len(converter._extract_interests(many + "，桌游，乐高，喝茶")) == MAX_INTERESTS
+
+    print("   ✅ Converter interests OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Interest Canonicalizer Test Suite")
+    print("=" * 50)
+
+    tests = [
+        test_leftmost_longest_matching,
+        test_synonyms_and_composites,
+        test_converter_keeps_all_interests,
+    ]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
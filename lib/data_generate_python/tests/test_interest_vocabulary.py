@@ -0,0 +1,125 @@
+"""
+Test script for the corpus interest vocabulary
+Checks counts, ranking, stable ids across incremental updates and the
+converter's interest_ids output
+"""
+
+import csv
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from csv_to_flutter_converter import FlutterDataConverter
+from interest_vocabulary import InterestVocabulary
+
+
+def test_counts_and_ranking():
+    """Counts are per profile and the ranking is by count, then id"""
+    print("🧪 Testing vocabulary counts...")
+
+    vocabulary = InterestVocabulary()
+    report = vocabulary.update(
+        [
+            {"id": "a", "interests": ["旅游", "摄影"]},
+            {"id": "b", "interests": ["摄影"]},
+            {"id": "c", "interests": []},
+        ]
+    )
+    assert report["added"] == 3 and report["new_interests"] == 2
+    assert [(e["name"], e["count"]) for e in vocabulary.ranked()] == [
+        ("摄影", 2),
+        ("旅游", 1),
+    ]
+
+    print("   ✅ Counts and ranking OK")
+
+
+def test_incremental_update_keeps_ids():
+    """Reloaded vocabularies keep ids; appended profiles only add"""
+    print("🧪 Testing incremental updates...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vocabulary_file = Path(tmp, "interest_vocabulary.json")
+        first = InterestVocabulary.load(vocabulary_file)
+        first.update([{"id": "a", "interests": ["滑雪", "健身"]}])
+        first.save()
+
+        second = InterestVocabulary.load(vocabulary_file)
+        characters = [
+            {"id": "a", "interests": ["滑雪", "健身"]},
+            {"id": "b", "interests": ["健身", "游泳"]},
+        ]
+        report = second.update(characters, prune=True)
+        assert report == {
+            "added": 1,
+            "updated": 0,
+            "unchanged": 1,
+            "removed": 0,
+            "new_interests": 1,
+        }, report
+        assert characters[0]["interest_ids"] == [0, 1]
+        assert characters[1]["interest_ids"] == [1, 2]
+
+        # Dropping a profile from the corpus removes its counts
+        second.update([{"id": "b", "interests": ["健身", "游泳"]}], prune=True)
+        assert second.counts[0] == 0 and second.counts[1] == 1
+
+    print("   ✅ Incremental updates OK")
+
+
+def test_converter_writes_interest_ids():
+    """The converter adds interest_ids and saves the vocabulary"""
+    print("🧪 Testing converter interest ids...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = Path(tmp, "profiles.csv")
+        with open(csv_file, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.DictWriter(f, fieldnames=["id", "hobbies"])
+            writer.writeheader()
+            writer.writerow({"id": "men_100_1", "hobbies": "旅行，拍照"})
+            writer.writerow({"id": "men_100_2", "hobbies": "旅游"})
+
+        vocabulary_file = Path(tmp, "interest_vocabulary.json")
+        characters = FlutterDataConverter().csv_to_character_data(
+            str(csv_file), vocabulary_file=str(vocabulary_file)
+        )
+        assert [c["interest_ids"] for c in characters] == [[0, 1], [0]]
+
+        with open(vocabulary_file, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        assert saved["interests"][0]["name"] == "旅游"
+        assert saved["interests"][0]["count"] == 2
+
+    print("   ✅ Converter interest ids OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Interest Vocabulary Test Suite")
+    print("=" * 50)
+
+    tests = [
+        test_counts_and_ranking,
+        test_incremental_update_keeps_ids,
+        test_converter_writes_interest_ids,
+    ]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
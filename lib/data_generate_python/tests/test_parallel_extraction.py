@@ -0,0 +1,169 @@
+"""
+Test script for parallel extraction
+Worker processes against a local stand-in API: one shared rate budget,
+per-unit part files, recovery of parts from an interrupted run, and a
+merged checkpoint that does not depend on the number of workers
+"""
+
+import json
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from data_pipeline import DataPipeline
+from deepseek_data_processor import ProcessedPerson
+from endpoint_pool import Endpoint
+from parallel_extraction import SharedRateLimiter, plan_units, write_part
+
+INTERVAL = 0.1  # seconds between requests the key allows
+
+
+def start_stand_in():
+    """Answers height from the profile number; profiles saying FAIL get a 400"""
+    arrivals = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            arrivals.append(time.monotonic())
+            text = body["messages"][1]["content"]
+            if "FAIL" in text:
+                self.send_response(400)
+                self.end_headers()
+                return
+            number = int(re.match(r"编号(\d+)", text).group(1))
+            content = json.dumps({"height_cm": 150 + number, "hobbies": "旅游"})
+            payload = json.dumps({"choices": [{"message": {"content": content}}]})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(payload.encode())
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1", arrivals
+
+
+def write_raw_data(raw: Path):
+    raw.mkdir()
+    (raw / "men_1.md").write_text(
+        "".join(f"编号{i}\n身高{150 + i} 爱好旅游\n\n" for i in range(1, 11)),
+        encoding="utf-8",
+    )
+    (raw / "women_1.md").write_text(
+        "编号1\n身高151\n\n编号2\nFAIL\n\n编号3\n身高153\n", encoding="utf-8"
+    )
+
+
+def run_pipeline(tmp: Path, url: str, workers: int):
+    pipeline = DataPipeline(
+        "test-key",
+        endpoints=[Endpoint("test-key", url, max_requests_per_minute=60 / INTERVAL)],
+    )
+    return pipeline.run_parallel_pipeline(
+        input_folder=str(tmp / "raw_data"),
+        csv_output=str(tmp / "out" / "profiles.csv"),
+        json_output=str(tmp / "out" / "characters.json"),
+        progress_file=str(tmp / "progress.json"),
+        workers=workers,
+        unit_size=3,
+        parts_dir=str(tmp / "parts"),
+    )
+
+
+def test_shared_limiter_and_units():
+    """Slots are spaced by the interval; units are named by block range"""
+    print("🧪 Testing shared limiter and unit planning...")
+
+    now = [100.0]
+    limiter = SharedRateLimiter.create(2.0)
+    limiter.clock = lambda: now[0]
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 2.0, 4.0]
+    limiter.cooldown(10.0)
+    assert limiter.wait_time() == 10.0
+
+    tasks = [{"id": f"men_1_{i}", "file_path": "raw/men_1.md", "block": i} for i in (0, 1, 2, 5)]
+    units = plan_units(tasks, unit_size=3)
+    assert [unit["name"] for unit in units] == ["men_1_00000-00002", "men_1_00005-00005"]
+    print("   ✅ Shared limiter and unit planning OK")
+
+
+def test_parallel_run_and_merge():
+    """Four workers stay within one key's rate; output matches one worker"""
+    print("🧪 Testing parallel extraction and merge...")
+
+    server, url, arrivals = start_stand_in()
+    try:
+        outputs = []
+        for workers in (4, 1):
+            with tempfile.TemporaryDirectory() as tmp:
+                tmp = Path(tmp)
+                write_raw_data(tmp / "raw_data")
+                # A part left behind by an interrupted run is merged, not redone
+                write_part(
+                    [ProcessedPerson(id="women_1_3", raw_text="编号3\n身高153\n", height_cm=153)],
+                    tmp / "parts" / "women_1_00002-00002.csv",
+                )
+                arrivals.clear()
+                assert run_pipeline(tmp, url, workers)
+
+                assert len(arrivals) == 12  # 10 men + women_1_1 + women_1_2 (fails)
+                # One budget for all workers (allowing for scheduling jitter):
+                # no burst of four, and the run as long as one worker's would be
+                bursts = [b - a for a, b in zip(arrivals, arrivals[3:])]
+                assert min(bursts) > 1.5 * INTERVAL, f"4 requests in {min(bursts):.3f}s"
+                assert arrivals[-1] - arrivals[0] > 0.8 * 11 * INTERVAL
+
+                progress = json.loads((tmp / "progress.json").read_text(encoding="utf-8"))
+                assert len(progress["completed_profiles"]) == 12
+                assert [f["id"] for f in progress["failed_profiles"]] == ["women_1_2"]
+                assert progress["failed_profiles"][0]["error_class"] == "client"
+                assert not list((tmp / "parts").glob("*.csv"))
+
+                csv_text = (tmp / "out" / "profiles.csv").read_text(encoding="utf-8-sig")
+                ids = re.findall(r"^((?:wo)?men_1_\d+),", csv_text, re.MULTILINE)
+                assert ids == [f"men_1_{i}" for i in range(1, 11)] + ["women_1_1", "women_1_3"]
+                outputs.append(csv_text)
+
+                # Resume: only the failed profile is requested again
+                arrivals.clear()
+                assert run_pipeline(tmp, url, workers)
+                assert len(arrivals) == 1
+        assert outputs[0] == outputs[1]
+    finally:
+        server.shutdown()
+    print("   ✅ Parallel extraction and merge OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Parallel Extraction Test Suite")
+    print("=" * 50)
+
+    tests = [test_shared_limiter_and_units, test_parallel_run_and_merge]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
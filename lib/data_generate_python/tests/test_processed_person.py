@@ -0,0 +1,86 @@
+"""
+Test script for the compact ProcessedPerson representation
+Checks slots, interned categorical values and lazily loaded raw_text
+"""
+
+import csv
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from deepseek_data_processor import (
+    DeepSeekProcessor,
+    ProcessedPerson,
+    RawTextRef,
+    split_person_blocks,
+)
+
+SAMPLE_FILE = "前言\n- (编号12)\n```\n星座：天蝎\n身高：180\n```\n\n- (编号11）\n女\n"
+
+
+def test_slots_and_interning():
+    """No per-instance __dict__ and shared categorical strings"""
+    print("🧪 Testing slots and interning...")
+
+    first = ProcessedPerson(id="a", zodiac="".join(["天", "蝎"]), mbti="ENTJ")
+    second = ProcessedPerson(id="b", zodiac="".join(["天", "蝎"]), mbti="ENTJ")
+
+    assert not hasattr(first, "__dict__")
+    assert first.zodiac is second.zodiac
+    print("   ✅ Slots and interning OK")
+
+
+def test_raw_text_reference():
+    """raw_text references resolve to the same text as the block splitter"""
+    print("🧪 Testing raw_text references...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp, "men_100.md")
+        source.write_text(SAMPLE_FILE, encoding="utf-8")
+        blocks = split_person_blocks(SAMPLE_FILE)
+
+        people = [
+            ProcessedPerson(
+                id=f"men_100_{block['番号']}",
+                raw_text=RawTextRef(source, block["start"], block["end"]),
+            )
+            for block in blocks
+        ]
+        for person, block in zip(people, blocks):
+            assert person.get_raw_text() == block["content"]
+
+        # Text is loaded when written out
+        output = Path(tmp, "out.csv")
+        DeepSeekProcessor("test-key").save_to_csv(people, output)
+        with open(output, "r", encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["raw_text"] for row in rows] == [b["content"] for b in blocks]
+
+    print("   ✅ raw_text references OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 ProcessedPerson Test Suite")
+    print("=" * 50)
+
+    tests = [test_slots_and_interning, test_raw_text_reference]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,140 @@
+"""
+Test script for the processed profile store
+Checks the Parquet checkpoint round trip (raw texts kept as references)
+and the CSV row parser
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from csv_to_flutter_converter import _read_row_chunks
+from deepseek_data_processor import ProcessedPerson, RawTextRef, split_person_blocks
+from processed_store import (
+    load_processed_people,
+    parquet_available,
+    person_from_csv_row,
+    save_to_parquet,
+)
+
+
+def test_csv_row_parsing():
+    """CSV strings become typed values; floats and negatives survive"""
+    print("🧪 Testing CSV row parsing...")
+
+    person = person_from_csv_row(
+        {
+            "id": "men_100_1",
+            "age": "30",
+            "height_cm": "172.5",
+            "weight_kg": "-1",
+            "has_car": "True",
+            "hobbies": "",
+            "extra_column": "ignored",
+        }
+    )
+    assert person.age == 30
+    assert person.height_cm == 172.5 and person.weight_kg == -1
+    assert person.has_car is True and person.hobbies is None
+
+    print("   ✅ CSV row parsing OK")
+
+
+def test_parquet_round_trip():
+    """People reload from Parquet with the same values and types"""
+    print("🧪 Testing Parquet round trip...")
+
+    if not parquet_available():
+        print("   ⚠️ pyarrow not installed, skipping")
+        return
+
+    people = [
+        ProcessedPerson(
+            id="men_100_1",
+            raw_text="编号1",
+            gender="male",
+            zodiac="天蝎",
+            height_cm=180,
+            weight_kg=70.5,
+            has_house=False,
+            hobbies="登山，摄影",
+        ),
+        ProcessedPerson(id="women_100_2", gender="female", zodiac="天蝎"),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp, "profiles.parquet")
+        save_to_parquet(people, output)
+        loaded = load_processed_people(output)
+
+    assert [p.to_dict() for p in loaded] == [p.to_dict() for p in people]
+    assert isinstance(loaded[0].height_cm, int)
+    assert loaded[0].zodiac is loaded[1].zodiac
+
+    print("   ✅ Parquet round trip OK")
+
+
+def test_raw_text_refs():
+    """References are stored, not resolved, and come back as references"""
+    print("🧪 Testing raw_text references in Parquet...")
+
+    if not parquet_available():
+        print("   ⚠️ pyarrow not installed, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw = Path(tmp, "men_1.md")
+        raw.write_text("编号1\n身高170\n\n编号2\n身高180\n", encoding="utf-8")
+        blocks = split_person_blocks(raw.read_text(encoding="utf-8"))
+        people = [
+            ProcessedPerson(
+                id=f"men_1_{block['番号']}",
+                raw_text=RawTextRef(raw, block["start"], block["end"]),
+            )
+            for block in blocks
+        ]
+        people.append(ProcessedPerson(id="men_1_3", raw_text="编号3"))
+        output = Path(tmp, "profiles.parquet")
+        save_to_parquet(people, output)
+
+        loaded = load_processed_people(output)
+        assert isinstance(loaded[0].raw_text, RawTextRef)
+        assert (loaded[1].raw_text.start, loaded[1].raw_text.end) == (
+            people[1].raw_text.start,
+            people[1].raw_text.end,
+        )
+        assert loaded[2].raw_text == "编号3"
+        assert [p.to_dict() for p in loaded] == [p.to_dict() for p in people]
+
+        # The converter reads the text through the reference
+        rows = next(_read_row_chunks(output, 10, ["id", "raw_text"]))
+        assert [row["raw_text"] for row in rows] == [p.get_raw_text() for p in people]
+        assert set(rows[0]) == {"id", "raw_text"}
+
+    print("   ✅ raw_text references OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Processed Store Test Suite")
+    print("=" * 50)
+
+    tests = [test_csv_row_parsing, test_parquet_round_trip, test_raw_text_refs]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
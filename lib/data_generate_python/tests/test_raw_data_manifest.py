@@ -0,0 +1,113 @@
+"""
+Test script for the raw data manifest
+Checks that unchanged files are skipped and changed files are re-split
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from raw_data_manifest import RawDataManifest
+
+SAMPLE_FILE = """[返回导航页](https://example.com/tinder.md)
+
+- (编号2)
+```
+出生：90
+身高：170
+```
+
+- (编号1)
+```
+出生：95
+身高：160
+```
+"""
+
+
+def _write(path: Path, content: str, mtime_ns: int):
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_incremental_refresh():
+    """Only new or modified files are reported and re-split"""
+    print("🧪 Testing incremental manifest refresh...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_data = Path(tmp, "raw_data")
+        raw_data.mkdir()
+        _write(raw_data / "men_100.md", SAMPLE_FILE, 1_000_000_000)
+        _write(raw_data / "tinder.md", "编号1\nnot a profile\n", 1_000_000_000)
+
+        manifest = RawDataManifest(raw_data)
+        report = manifest.refresh()
+        assert report["added"] == ["men_100.md"], report
+        assert manifest.block_count("men_100.md") == 2
+        assert manifest.profile_ids("men_100.md") == ["men_100_2", "men_100_1"]
+
+        # A fresh manifest loaded from disk sees nothing new
+        manifest = RawDataManifest(raw_data)
+        report = manifest.refresh()
+        assert report["unchanged"] == ["men_100.md"], report
+
+        # Touching a file without changing content keeps its blocks
+        _write(raw_data / "men_100.md", SAMPLE_FILE, 2_000_000_000)
+        report = manifest.refresh()
+        assert report["unchanged"] == ["men_100.md"], report
+
+        # One new file: only that file is read
+        _write(raw_data / "women_100.md", SAMPLE_FILE + "\n- (编号3)\n女\n", 1)
+        report = manifest.refresh(["men_*.md", "women_*.md"])
+        assert report["added"] == ["women_100.md"], report
+        assert report["unchanged"] == ["men_100.md"], report
+        assert manifest.total_profiles(["men_*.md", "women_*.md"]) == 5
+
+        print("   ✅ Incremental refresh OK")
+
+
+def test_block_byte_ranges():
+    """Block byte ranges point back at the 编号 marker in the source file"""
+    print("🧪 Testing block byte ranges...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_data = Path(tmp, "raw_data")
+        raw_data.mkdir()
+        _write(raw_data / "men_100.md", SAMPLE_FILE, 1_000_000_000)
+
+        manifest = RawDataManifest(raw_data)
+        manifest.refresh()
+        data = (raw_data / "men_100.md").read_bytes()
+        for block in manifest.blocks("men_100.md"):
+            segment = data[block["start"] : block["end"]].decode("utf-8")
+            assert segment.startswith("编号" + block["番号"]), segment
+
+        print("   ✅ Byte ranges OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Raw Data Manifest Test Suite")
+    print("=" * 50)
+
+    tests = [test_incremental_refresh, test_block_byte_ranges]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,203 @@
+"""
+Test script for watch mode
+Debounced, coalesced change batches from the raw data watcher, and the
+watch loop extracting only new or edited blocks against a local stand-in
+"""
+
+import csv
+import json
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from data_pipeline import DataPipeline
+from endpoint_pool import Endpoint
+from raw_data_watcher import RawDataWatcher
+
+
+def start_stand_in():
+    """Answers the height written in the profile; counts requests per 编号"""
+    requests = Counter()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            text = body["messages"][1]["content"]
+            requests[int(re.match(r"编号(\d+)", text).group(1))] += 1
+            height = int(re.search(r"身高(\d+)", text).group(1))
+            content = json.dumps({"height_cm": height, "hobbies": "旅游"})
+            payload = json.dumps({"choices": [{"message": {"content": content}}]})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(payload.encode())
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1", requests
+
+
+def profiles(*numbers, heights=None) -> str:
+    heights = heights or {}
+    return "".join(f"编号{n}\n身高{heights.get(n, 150 + n)}\n\n" for n in numbers)
+
+
+def wait_until(condition, timeout: float = 20.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_debounce_and_coalescing():
+    """Writes in a burst come out as one batch after a quiet period"""
+    print("🧪 Testing debounce and coalescing...")
+
+    now = [0.0]
+    with tempfile.TemporaryDirectory() as tmp:
+        raw = Path(tmp)
+        (raw / "men_1.md").write_text(profiles(1), encoding="utf-8")
+        watcher = RawDataWatcher(
+            raw, ["men_*.md", "women_*.md"], debounce=2.0, clock=lambda: now[0]
+        )
+        assert watcher.poll() == []  # files present at start are not a change
+
+        # A file arriving in two writes, then a second file
+        (raw / "men_2.md").write_text(profiles(1), encoding="utf-8")
+        assert watcher.poll() == []
+        now[0] += 1.5
+        with open(raw / "men_2.md", "a", encoding="utf-8") as f:
+            f.write(profiles(2))
+        assert watcher.poll() == []
+        now[0] += 1.5
+        (raw / "women_1.md").write_text(profiles(1), encoding="utf-8")
+        (raw / "notes.txt").write_text("not data", encoding="utf-8")
+        assert watcher.poll() == []
+        now[0] += 1.5
+        assert watcher.poll() == []  # still within the debounce
+        now[0] += 0.5
+        assert watcher.poll() == ["men_2.md", "women_1.md"]
+        assert watcher.poll() == []
+
+        (raw / "men_1.md").unlink()
+        assert watcher.poll() == []
+        now[0] += 2.0
+        assert watcher.poll() == ["men_1.md"]
+    print("   ✅ Debounce and coalescing OK")
+
+
+def test_watch_mode_incremental():
+    """Only new and edited blocks are requested; outputs follow the folder"""
+    print("🧪 Testing incremental watch mode...")
+
+    server, url, requests = start_stand_in()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            raw = tmp / "raw_data"
+            raw.mkdir()
+            (raw / "men_1.md").write_text(profiles(1, 2, 3), encoding="utf-8")
+            csv_output = tmp / "out" / "profiles.csv"
+            json_output = tmp / "out" / "characters.json"
+
+            def heights():
+                if not csv_output.exists():
+                    return {}
+                with open(csv_output, "r", encoding="utf-8-sig", newline="") as f:
+                    return {row["id"]: row["height_cm"] for row in csv.DictReader(f)}
+
+            pipeline = DataPipeline(
+                "test-key",
+                endpoints=[Endpoint("test-key", url, max_requests_per_minute=6000)],
+            )
+            stop = threading.Event()
+            watch = threading.Thread(
+                target=pipeline.run_watch_mode,
+                kwargs={
+                    "input_folder": str(raw),
+                    "csv_output": str(csv_output),
+                    "json_output": str(json_output),
+                    "progress_file": str(tmp / "progress.json"),
+                    "debounce": 0.3,
+                    "poll_interval": 0.05,
+                    "stop": stop,
+                },
+            )
+            watch.start()
+            try:
+                # Catch-up pass over the files already there
+                assert wait_until(lambda: len(heights()) == 3)
+                assert wait_until(json_output.exists)
+                assert requests == Counter({1: 1, 2: 1, 3: 1})
+
+                # A new file written in two bursts
+                (raw / "men_2.md").write_text(profiles(10), encoding="utf-8")
+                with open(raw / "men_2.md", "a", encoding="utf-8") as f:
+                    f.write(profiles(11))
+                assert wait_until(lambda: len(heights()) == 5)
+                assert list(heights()) == [
+                    "men_1_1", "men_1_2", "men_1_3", "men_2_10", "men_2_11"
+                ]
+
+                # Editing one block re-extracts just that block
+                (raw / "men_1.md").write_text(
+                    profiles(1, 2, 3, heights={2: 180}), encoding="utf-8"
+                )
+                assert wait_until(lambda: heights().get("men_1_2") == "180")
+
+                # Deleting a file and a block drops them without any request
+                (raw / "men_2.md").unlink()
+                (raw / "men_1.md").write_text(
+                    profiles(1, 3, heights={2: 180}), encoding="utf-8"
+                )
+                assert wait_until(lambda: list(heights()) == ["men_1_1", "men_1_3"])
+            finally:
+                stop.set()
+                watch.join()
+
+            assert requests == Counter({1: 1, 2: 2, 3: 1, 10: 1, 11: 1}), requests
+            characters = json.loads(json_output.read_text(encoding="utf-8"))
+            assert [c["id"] for c in characters] == ["profile_men_1_1", "profile_men_1_3"]
+            progress = json.loads((tmp / "progress.json").read_text(encoding="utf-8"))
+            assert [e["id"] for e in progress["completed_profiles"]] == ["men_1_1", "men_1_3"]
+            assert all(entry["sha1"] for entry in progress["completed_profiles"])
+    finally:
+        server.shutdown()
+    print("   ✅ Incremental watch mode OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Watch Mode Test Suite")
+    print("=" * 50)
+
+    tests = [test_debounce_and_coalescing, test_watch_mode_incremental]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
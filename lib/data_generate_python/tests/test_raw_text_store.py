@@ -0,0 +1,133 @@
+"""
+Test script for the raw text blob store
+Texts moved out of the character JSON come back byte for byte by id and
+by reference, identical texts are stored once, a failed export keeps the
+previous blob, and the dataset without texts is much smaller
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from csv_to_flutter_converter import FlutterDataConverter
+from raw_text_store import RAW_TEXT_REF_KEY, RawTextBlobWriter, RawTextStore, index_file_for
+
+SOURCE_CSV = parent_dir / "output" / "processed_dating_profiles.csv"
+
+
+def test_round_trip():
+    """get() by id and read() by reference return the stored text"""
+    print("🧪 Testing blob round trip...")
+
+    texts = {"a": "第一个人\n身高170", "b": "", "c": "second ✨ profile", "d": "第一个人\n身高170"}
+    with tempfile.TemporaryDirectory() as tmp:
+        blob_file = Path(tmp, "texts.bin")
+        with RawTextBlobWriter(blob_file) as blobs:
+            refs = {char_id: blobs.add(char_id, text) for char_id, text in texts.items()}
+
+        assert refs["a"] == refs["d"], "identical texts should share a reference"
+        assert blobs.stats == {"texts": 4, "stored": 3, "bytes": blob_file.stat().st_size}
+        assert index_file_for(blob_file).name == "texts.index.json"
+
+        with RawTextStore(blob_file) as store:
+            assert len(store) == 4 and "c" in store and "z" not in store
+            for char_id, text in texts.items():
+                assert store.get(char_id) == text
+                assert store.read(refs[char_id]) == text
+            assert store.get("z") is None
+            try:
+                store.read([blob_file.stat().st_size - 1, 10])
+                assert False, "a reference past the end should fail"
+            except ValueError:
+                pass
+    print("   ✅ Blob round trip OK")
+
+
+def test_converter_blob_export():
+    """Records carry raw_text_ref in place of raw_text; texts match"""
+    print("🧪 Testing converter export with a raw text blob...")
+
+    converter = FlutterDataConverter()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        converter.stream_character_data(str(SOURCE_CSV), str(tmp / "full.json"))
+        count = converter.stream_character_data(
+            str(SOURCE_CSV), str(tmp / "slim.json"), raw_text_blob=str(tmp / "raw_texts.bin")
+        )
+        full = json.loads((tmp / "full.json").read_text(encoding="utf-8"))
+        slim = json.loads((tmp / "slim.json").read_text(encoding="utf-8"))
+        assert count == len(full) == len(slim)
+
+        with RawTextStore(tmp / "raw_texts.bin") as store:
+            for before, after in zip(full, slim):
+                if before["raw_text"]:
+                    keys = [RAW_TEXT_REF_KEY if k == "raw_text" else k for k in before]
+                    assert list(after) == keys
+                    assert store.read(after[RAW_TEXT_REF_KEY]) == before["raw_text"]
+                    assert store.get(after["id"]) == before["raw_text"]
+                else:
+                    assert after == before
+
+        full_size = (tmp / "full.json").stat().st_size
+        slim_size = (tmp / "slim.json").stat().st_size
+        print(f"   dataset {full_size / 1024:.0f} KB -> {slim_size / 1024:.0f} KB without texts")
+        assert slim_size * 2 < full_size
+
+        # The generated Dart module passes the reference on to Character
+        dart = FlutterDataConverter.render_dart_module(slim[:1])
+        assert "rawTextRef: const <int>[" in dart and "rawText:" in dart
+    print(f"   ✅ {count} characters exported with texts in the blob")
+
+
+def test_failed_export_keeps_blob():
+    """An error while writing leaves the previous blob and table in place"""
+    print("🧪 Testing failed export...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blob_file = Path(tmp, "texts.bin")
+        with RawTextBlobWriter(blob_file) as blobs:
+            blobs.add("a", "old text")
+        before = blob_file.read_bytes(), index_file_for(blob_file).read_bytes()
+
+        def characters():
+            yield {"id": "a", "raw_text": "new text"}
+            raise OSError("disk full")
+
+        try:
+            with RawTextBlobWriter(blob_file) as blobs:
+                list(blobs.detach(characters()))
+            assert False, "the error should propagate"
+        except OSError:
+            pass
+        assert (blob_file.read_bytes(), index_file_for(blob_file).read_bytes()) == before
+        assert sorted(p.name for p in Path(tmp).iterdir()) == ["texts.bin", "texts.index.json"]
+        assert RawTextStore(blob_file).get("a") == "old text"
+    print("   ✅ Failed export keeps the previous blob")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Raw Text Store Test Suite")
+    print("=" * 50)
+
+    tests = [test_round_trip, test_converter_blob_export, test_failed_export_keeps_blob]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
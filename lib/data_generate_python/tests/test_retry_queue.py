@@ -0,0 +1,116 @@
+"""
+Test script for the deferred retry queue
+Uses a fake clock to check not-before ordering, per-class backoff,
+exhaustion and draining
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from retry_queue import DeferredRetryQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _queue(clock: FakeClock) -> DeferredRetryQueue:
+    policies = {"rate_limit": (10.0, 3), "server": (2.0, 3), "client": (0.0, 1)}
+    return DeferredRetryQueue(policies, clock=clock.time, sleep=clock.sleep)
+
+
+def test_not_before_ordering():
+    """Tasks come back only when due, earliest first across classes"""
+    print("🧪 Testing not-before ordering...")
+
+    clock = FakeClock()
+    queue = _queue(clock)
+    assert queue.defer({"id": "a"}, "rate_limit") == 10.0
+    assert queue.defer({"id": "b"}, "server") == 2.0
+    assert queue.defer({"id": "c"}, "rate_limit", retry_after=30) == 30
+
+    assert queue.pop_ready() is None
+    assert queue.next_ready_in() == 2.0
+    clock.now = 10.0
+    assert [queue.pop_ready()["id"], queue.pop_ready()["id"]] == ["b", "a"]
+    assert queue.pop_ready() is None and len(queue) == 1
+
+    print("   ✅ Ordering OK")
+
+
+def test_backoff_and_exhaustion():
+    """Delays double per attempt; attempts are capped per error class"""
+    print("🧪 Testing backoff and exhaustion...")
+
+    clock = FakeClock()
+    queue = _queue(clock)
+    task = {"id": "a"}
+    assert queue.defer(task, "server") == 2.0
+    assert queue.defer(task, "server") == 4.0
+    assert queue.defer(task, "server") is None  # third failure: give up
+    assert queue.defer({"id": "b"}, "client") is None  # never retried
+    assert queue.summary()["exhausted"] == {"server": 1, "client": 1}
+
+    print("   ✅ Backoff and exhaustion OK")
+
+
+def test_drain_sleeps_only_when_idle():
+    """Draining sleeps until the next task is due, including re-deferred ones"""
+    print("🧪 Testing drain...")
+
+    clock = FakeClock()
+    queue = _queue(clock)
+    queue.defer({"id": "a"}, "server")
+    queue.defer({"id": "b"}, "rate_limit")
+
+    drained = []
+    for task in queue.drain():
+        drained.append((task["id"], clock.now))
+        if task["id"] == "a" and task["attempts"] == 1:
+            queue.defer(task, "server")  # fails again: back in 4s
+
+    assert drained == [("a", 2.0), ("a", 6.0), ("b", 10.0)], drained
+    assert clock.slept == [2.0, 4.0, 4.0]
+    assert len(queue) == 0
+
+    print("   ✅ Drain OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Retry Queue Test Suite")
+    print("=" * 50)
+
+    tests = [
+        test_not_before_ordering,
+        test_backoff_and_exhaustion,
+        test_drain_sleeps_only_when_idle,
+    ]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,161 @@
+"""
+Test script for field-delta schema migration
+Detects fields missing from a stored checkpoint, asks a local stand-in API
+for only those fields (several profiles per request) and merges the answers
+"""
+
+import csv
+import json
+import re
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from data_pipeline import DataPipeline
+from deepseek_data_processor import ProcessedPerson
+from endpoint_pool import Endpoint
+from schema_migration import (
+    build_delta_prompt,
+    detect_added_fields,
+    extraction_fields,
+)
+
+PROFILES = {
+    f"men_1_{i}": f"编号{i}\n81年生，身高{170 + i}，天蝎座，INTJ，爱好摄影"
+    for i in range(1, 8)
+}
+
+
+def start_delta_stand_in():
+    """Answer delta requests: zodiac/mbti for every 【id】 in the user message"""
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            system, user = (m["content"] for m in body["messages"])
+            seen.append({"system": system, "user": user, "max_tokens": body["max_tokens"]})
+            answer = {
+                profile_id: {"zodiac": "天蝎", "mbti": "INTJ", "occupation": "ignored"}
+                for profile_id in re.findall(r"【(\w+)】", user)
+            }
+            content = json.dumps(answer, ensure_ascii=False)
+            payload = json.dumps({"choices": [{"message": {"content": content}}]})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(payload.encode())
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1", seen
+
+
+def write_old_checkpoint(csv_file: Path, dropped=("zodiac", "mbti")):
+    """A CSV checkpoint written before `dropped` were part of the schema"""
+    people = [
+        ProcessedPerson(id=pid, raw_text=text, gender="male", height_cm=170)
+        for pid, text in PROFILES.items()
+    ]
+    columns = [c for c in ProcessedPerson.__dataclass_fields__ if c not in dropped]
+    with open(csv_file, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for person in people:
+            writer.writerow(person.to_dict())
+
+
+def test_field_detection():
+    """Prompt fields missing from the stored columns are the added fields"""
+    print("🧪 Testing added-field detection...")
+
+    specs = extraction_fields()
+    assert specs["mbti"].startswith("MBTI") and "id" not in specs
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = Path(tmp) / "profiles.csv"
+        assert detect_added_fields(csv_file) == {}  # no checkpoint yet
+        write_old_checkpoint(csv_file)
+        assert list(detect_added_fields(csv_file)) == ["zodiac", "mbti"]
+
+    prompt = build_delta_prompt({"mbti": specs["mbti"]})
+    assert '"mbti"' in prompt and '"zodiac"' not in prompt
+    print("   ✅ Added-field detection OK")
+
+
+def test_migration_batches_caches_and_merges():
+    """Seven profiles take two requests; a rerun is free; rows gain the fields"""
+    print("🧪 Testing field-delta migration...")
+
+    server, url, seen = start_delta_stand_in()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            csv_file = tmp / "profiles.csv"
+            write_old_checkpoint(csv_file)
+            pipeline = DataPipeline(
+                "test-key",
+                endpoints=[Endpoint("test-key", url, max_requests_per_minute=60000)],
+            )
+            options = dict(
+                csv_output=str(csv_file),
+                json_output=str(tmp / "characters.json"),
+                batch_size=5,
+                cache_file=str(tmp / "delta_cache.json"),
+            )
+
+            assert pipeline.run_schema_migration(**options)
+            assert len(seen) == 2
+            assert "【men_1_5】" in seen[0]["user"] and "【men_1_6】" in seen[1]["user"]
+            # Minimal prompt: only the new fields are asked for
+            assert '"mbti"' in seen[0]["system"] and '"height_cm"' not in seen[0]["system"]
+            assert seen[0]["max_tokens"] < 1000
+
+            people = {p.id: p for p in pipeline.load_checkpoint(csv_file)}
+            assert len(people) == 7
+            assert all(p.zodiac == "天蝎" and p.mbti == "INTJ" for p in people.values())
+            # Fields that were not asked for are left alone
+            assert all(p.occupation is None for p in people.values())
+            assert people["men_1_3"].height_cm == 170
+            assert detect_added_fields(csv_file) == {}
+
+            # Same fields, same texts: answered from the cache
+            csv_file.with_suffix(".parquet").unlink(missing_ok=True)
+            write_old_checkpoint(csv_file)
+            assert list(detect_added_fields(csv_file)) == ["zodiac", "mbti"]
+            assert pipeline.run_schema_migration(**options)
+            assert len(seen) == 2
+    finally:
+        server.shutdown()
+    print("   ✅ Field-delta migration OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Schema Migration Test Suite")
+    print("=" * 50)
+
+    tests = [test_field_detection, test_migration_batches_caches_and_merges]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
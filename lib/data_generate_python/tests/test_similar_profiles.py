@@ -0,0 +1,192 @@
+"""
+Test script for the similar profiles index
+Fixed-width feature vectors, an exact blocked search that agrees with
+comparing every pair one at a time, the approximate clustered search's
+recall, and similar_ids written into the streamed dataset
+"""
+
+import json
+import math
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from csv_to_flutter_converter import FlutterDataConverter
+from similar_profiles import (
+    FEATURE_WIDTH,
+    NUMERIC_SCALES,
+    SimilarProfiles,
+    encode_characters,
+    feature_vector,
+    zodiac_index,
+)
+
+SOURCE_CSV = parent_dir / "output" / "processed_dating_profiles.csv"
+DATASET = parent_dir / "output" / "flutter_characters.json"
+
+
+def load_characters():
+    with open(DATASET, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def naive_neighbours(profiles, k):
+    """k nearest of every profile from distance() over every pair"""
+    n = len(profiles)
+    return [
+        [
+            j
+            for _, j in sorted(
+                (round(profiles.distance(i, j) * 1e6), j) for j in range(n) if j != i
+            )[:k]
+        ]
+        for i in range(n)
+    ]
+
+
+def test_feature_vectors():
+    """Same width for every profile; unknown numbers become the corpus mean"""
+    print("🧪 Testing feature vectors...")
+
+    assert zodiac_index("天蝎座") == zodiac_index("天蝎") == 7
+    assert zodiac_index("天平座") == zodiac_index("天秤")
+    assert zodiac_index("牛") is None and zodiac_index(None) is None
+
+    full = {
+        "id": "a",
+        "age": 30,
+        "height": 170,
+        "bmi": 21.0,
+        "zodiac": "双鱼座",
+        "mbti": "INFJ-A",
+        "current_location": "横滨",
+        "interests": ["旅行", "摄影", "美食"],
+    }
+    vector = feature_vector(full)
+    empty = feature_vector({"id": "b"})
+    assert len(vector) == len(empty) == FEATURE_WIDTH
+    assert all(math.isnan(value) for value in empty[: len(NUMERIC_SCALES)])
+    assert not any(empty[len(NUMERIC_SCALES) :])
+
+    # A one-hot or interest-set mismatch costs its weight squared
+    moved = feature_vector({**full, "current_location": "大阪"})
+    assert abs(sum((a - b) ** 2 for a, b in zip(vector, moved)) - 1.5**2) < 1e-9
+    others = feature_vector({**full, "interests": ["钓鱼"]})
+    cost = sum((a - b) ** 2 for a, b in zip(vector, others))
+    assert cost <= 2.0**2 + 1e-9
+
+    ids, vectors = encode_characters([full, {"id": "b", "age": 40}, {"id": "c"}])
+    assert ids == ["a", "b", "c"] and vectors.shape == (3, FEATURE_WIDTH)
+    assert abs(vectors[2, 0] - vectors[:2, 0].mean()) < 1e-12
+    assert vectors[2, 1] == vectors[0, 1]  # one known height
+    print(f"   ✅ {FEATURE_WIDTH} features per profile")
+
+
+def test_exact_matches_naive_loop():
+    """Blocked top-k equals comparing every pair, whatever the blocks or threads"""
+    print("🧪 Testing exact search against every pair...")
+
+    characters = load_characters()
+    expected = None
+    for block_size, workers in [((37, 50), 1), ((1024, 8192), 1), ((64, 100), 3)]:
+        profiles = SimilarProfiles(characters, block_size=block_size, workers=workers)
+        if expected is None:
+            expected = naive_neighbours(profiles, 5)
+        assert profiles.exact(5).tolist() == expected, (block_size, workers)
+
+    similar = profiles.similar_ids(5, method="exact")
+    first = characters[0]["id"]
+    assert similar[first] == [characters[j]["id"] for j in expected[0]]
+
+    # k larger than the corpus: everyone else, nearest first
+    small = SimilarProfiles(characters[:3])
+    assert all(len(row) == 2 and i not in row for i, row in enumerate(small.exact(10).tolist()))
+    assert SimilarProfiles([]).similar_ids() == {}
+    print(f"   ✅ {len(characters)} profiles identical")
+
+
+def test_approximate_recall():
+    """The clustered search finds most exact neighbours, never the profile itself"""
+    print("🧪 Testing approximate search...")
+
+    base = load_characters()
+    rng = random.Random(0)
+    characters = []
+    for i in range(3000):
+        character = dict(base[i % len(base)], id=f"p{i}")
+        if character.get("age"):
+            character["age"] += rng.randint(-3, 3)
+        characters.append(character)
+
+    profiles = SimilarProfiles(characters)
+    exact = profiles.neighbours(10, method="exact").tolist()
+    approximate = profiles.neighbours(10, method="approximate").tolist()
+    assert all(i not in row and len(set(row)) == 10 for i, row in enumerate(approximate))
+    # Ties are common in a replicated corpus: a neighbour counts when it is
+    # no farther than the exact 10th
+    found = 0
+    for i, (a, e) in enumerate(zip(approximate, exact)):
+        tenth = round(max(profiles.distance(i, j) for j in e), 6)
+        found += sum(round(profiles.distance(i, j), 6) <= tenth for j in a)
+    recall = found / (10 * len(exact))
+    print(f"   recall@10 {recall:.3f}")
+    assert recall > 0.95
+    try:
+        profiles.neighbours(10, method="lsh")
+        assert False, "an unknown method should be rejected"
+    except ValueError:
+        pass
+    print("   ✅ Approximate search OK")
+
+
+def test_stream_writes_similar_ids():
+    """stream_character_data lists each profile's neighbours in similar_ids"""
+    print("🧪 Testing similar_ids in the dataset...")
+
+    converter = FlutterDataConverter()
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp, "characters.json")
+        count = converter.stream_character_data(str(SOURCE_CSV), str(output), similar_k=3)
+        characters = json.loads(output.read_text(encoding="utf-8"))
+
+    expected = SimilarProfiles(converter.iter_characters(str(SOURCE_CSV))).similar_ids(3)
+    ids = {c["id"] for c in characters}
+    assert count == len(characters) == len(expected)
+    for character in characters:
+        assert character["similar_ids"] == expected[character["id"]]
+        assert character["id"] not in character["similar_ids"]
+        assert set(character["similar_ids"]) <= ids
+    print("   ✅ similar_ids written for every profile")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Similar Profiles Test Suite")
+    print("=" * 50)
+
+    tests = [
+        test_feature_vectors,
+        test_exact_matches_naive_loop,
+        test_approximate_recall,
+        test_stream_writes_similar_ids,
+    ]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,211 @@
+"""
+Test script for the streaming JSON conversion
+Checks stream_character_data writes byte for byte what the in-memory
+conversion (json.dump of the full list) wrote, in chunks of any size,
+that only the columns the output is made from are read, and that its
+memory peak does not grow with the number of rows
+"""
+
+import csv
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from csv_to_flutter_converter import (
+    CHARACTER_FIELDS,
+    FlutterDataConverter,
+    write_characters_json,
+)
+from interest_vocabulary import InterestVocabulary
+from processed_store import parquet_available, person_from_csv_row, save_to_parquet
+
+SOURCE_CSV = parent_dir / "output" / "processed_dating_profiles.csv"
+
+
+def legacy_json(csv_file) -> bytes:
+    """The pre-streaming conversion: whole DataFrame, row Series, one json.dump"""
+    import pandas as pd
+
+    converter = FlutterDataConverter()
+    if str(csv_file).endswith(".parquet"):
+        df = pd.read_parquet(csv_file)
+    else:
+        df = pd.read_csv(csv_file)
+    characters = [converter._convert_row_to_character(df.iloc[i], i) for i in range(len(df))]
+    return json.dumps(
+        characters, ensure_ascii=False, indent=2, default=str, allow_nan=False
+    ).encode("utf-8")
+
+
+def replicate_csv(target: Path, count: int):
+    """The committed CSV's rows repeated up to `count` rows, ids made unique"""
+    with open(SOURCE_CSV, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        rows = list(reader)
+    with open(target, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for i in range(count):
+            writer.writerow({**rows[i % len(rows)], "id": f"p{i}"})
+
+
+def test_parity_with_full_conversion():
+    """Same bytes as json.dump of the whole list, for CSV and Parquet input"""
+    print("🧪 Testing streamed output against the full conversion...")
+
+    converter = FlutterDataConverter()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        inputs = [SOURCE_CSV]
+        if parquet_available():
+            with open(SOURCE_CSV, "r", encoding="utf-8-sig", newline="") as f:
+                people = [person_from_csv_row(row) for row in csv.DictReader(f)]
+            save_to_parquet(people, tmp / "profiles.parquet")
+            inputs.append(tmp / "profiles.parquet")
+
+        for source in inputs:
+            expected = legacy_json(source)
+            for chunk_size in (7, 10_000):
+                count = converter.stream_character_data(
+                    str(source), str(tmp / "out.json"), chunk_size=chunk_size
+                )
+                assert (tmp / "out.json").read_bytes() == expected, (source.name, chunk_size)
+            assert count == len(json.loads(expected))
+            # The list-returning conversion writes the same file
+            converter.csv_to_character_data(str(source), str(tmp / "list.json"))
+            assert (tmp / "list.json").read_bytes() == expected
+
+        minified = converter.stream_character_data(
+            str(SOURCE_CSV), str(tmp / "min.json"), minify=True
+        )
+        text = (tmp / "min.json").read_text(encoding="utf-8")
+        assert json.loads(text) == json.loads(legacy_json(SOURCE_CSV))
+        assert minified == count and '",\n' not in text and '": ' not in text
+        assert not [p.name for p in tmp.iterdir() if p.name.startswith(".")]
+    print(f"   ✅ {count} characters identical ({len(inputs)} input formats)")
+
+
+def test_vocabulary_and_empty_input():
+    """Streamed vocabulary update matches update(); no rows gives []"""
+    print("🧪 Testing vocabulary streaming and empty input...")
+
+    converter = FlutterDataConverter()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        converter.csv_to_character_data(
+            str(SOURCE_CSV), str(tmp / "list.json"), str(tmp / "list_vocabulary.json")
+        )
+        converter.stream_character_data(
+            str(SOURCE_CSV), str(tmp / "stream.json"), str(tmp / "stream_vocabulary.json")
+        )
+        assert (tmp / "list.json").read_bytes() == (tmp / "stream.json").read_bytes()
+        assert InterestVocabulary.load(tmp / "list_vocabulary.json").ranked() == (
+            InterestVocabulary.load(tmp / "stream_vocabulary.json").ranked()
+        )
+
+        assert write_characters_json(iter([]), tmp / "empty.json") == 0
+        assert (tmp / "empty.json").read_text(encoding="utf-8") == json.dumps([], indent=2)
+        assert write_characters_json([{"a": 1}], tmp / "one.json") == 1
+        assert (tmp / "one.json").read_text(encoding="utf-8") == json.dumps([{"a": 1}], indent=2)
+    print("   ✅ Vocabulary streaming and empty input OK")
+
+
+def test_column_projection():
+    """Rows hold only the source columns; a new field pulls its column in"""
+    print("🧪 Testing column projection...")
+
+    class RecordingConverter(FlutterDataConverter):
+        def _convert_row_to_character(self, row, index):
+            self.columns_seen.update(row.keys())
+            return super()._convert_row_to_character(row, index)
+
+    needed = {"id"} | {column for _, column, _ in CHARACTER_FIELDS}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        inputs = [SOURCE_CSV]
+        if parquet_available():
+            with open(SOURCE_CSV, "r", encoding="utf-8-sig", newline="") as f:
+                people = [person_from_csv_row(row) for row in csv.DictReader(f)]
+            save_to_parquet(people, tmp / "profiles.parquet")
+            inputs.append(tmp / "profiles.parquet")
+
+        for source in inputs:
+            converter = RecordingConverter()
+            converter.columns_seen = set()
+            converter.stream_character_data(str(source), str(tmp / "out.json"))
+            assert converter.columns_seen == needed, sorted(converter.columns_seen ^ needed)
+            assert "self_introduction" not in converter.columns_seen
+
+            # An extra output field brings its source column with it
+            converter = RecordingConverter()
+            converter.columns_seen = set()
+            converter._fields.append(("education", "education", converter._safe_str))
+            characters = converter.csv_to_character_data(str(source))
+            assert converter.columns_seen == needed | {"education"}
+            assert any(character["education"] for character in characters)
+            assert list(characters[0])[-1] == "education"
+    print(f"   ✅ {len(needed)} columns read ({len(inputs)} input formats)")
+
+
+def test_flat_memory():
+    """Peak traced memory of the streamed conversion does not grow with rows"""
+    print("🧪 Testing memory stays flat...")
+
+    converter = FlutterDataConverter()
+    peaks = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for count in (1_000, 6_000):
+            source = tmp / f"profiles_{count}.csv"
+            replicate_csv(source, count)
+            for mode in ("stream", "list"):
+                tracemalloc.start()
+                if mode == "stream":
+                    converter.stream_character_data(
+                        str(source), str(tmp / "out.json"), chunk_size=500
+                    )
+                else:
+                    converter.csv_to_character_data(str(source), str(tmp / "out.json"))
+                peaks[mode, count] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+    for (mode, count), peak in sorted(peaks.items()):
+        print(f"   {mode:<6} {count:>5} rows: peak {peak / 2**20:6.1f} MB")
+    assert peaks["stream", 6_000] < 1.5 * peaks["stream", 1_000]
+    assert peaks["list", 6_000] > 3 * peaks["list", 1_000]
+    print("   ✅ Streaming memory stays flat")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Streaming JSON Test Suite")
+    print("=" * 50)
+
+    tests = [
+        test_parity_with_full_conversion,
+        test_vocabulary_and_empty_input,
+        test_column_projection,
+        test_flat_memory,
+    ]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,125 @@
+"""
+Test script for the full-text search index
+CJK bigram and ASCII word terms, AND queries that return exactly what a
+linear scan of the same text finds, BM25 top-k order, and a byte-stable
+serialized asset
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from text_search_index import (
+    TextSearchIndex,
+    build_index_bytes,
+    normalize,
+    query_terms,
+    searchable_text,
+    tokenize,
+)
+
+DATASET = parent_dir / "output" / "flutter_characters.json"
+
+
+def linear_scan(characters, query):
+    """Ids of characters whose searchable text holds every query term"""
+    terms = query_terms(query)
+    return [
+        c["id"]
+        for c in characters
+        if terms and all(term in normalize(searchable_text(c)) for term in terms)
+    ]
+
+
+def test_terms():
+    """Bigrams and characters for CJK, words for ASCII, NFKC folded"""
+    print("🧪 Testing tokenization...")
+
+    assert list(tokenize("埼玉县 ＩＴ工程师, Python3")) == [
+        "埼", "玉", "县", "埼玉", "玉县", "it", "工", "程", "师", "工程", "程师", "python3",
+    ]
+    assert query_terms("医疗") == ["医疗"]
+    assert query_terms("猫") == ["猫"]
+    assert query_terms("软件工程 东京 ENTJ") == ["软件", "件工", "工程", "东京", "entj"]
+    assert query_terms("!!") == []
+    print("   ✅ Tokenization OK")
+
+
+def test_matches_linear_scan():
+    """Every query finds exactly what scanning all texts finds"""
+    print("🧪 Testing queries against a linear scan...")
+
+    with open(DATASET, "r", encoding="utf-8") as f:
+        characters = json.load(f)
+    index = TextSearchIndex.build(characters)
+    assert len(index) == len(characters)
+
+    for query in ["医疗", "埼玉", "猫", "东京 软件", "entj", "程序员", "不存在的词", ""]:
+        expected = linear_scan(characters, query)
+        assert index.match(query) == expected, query
+    assert index.match("猫"), "the dataset mentions cats"
+    print(f"   ✅ {len(characters)} profiles, 8 queries identical")
+
+
+def test_ranking_and_round_trip():
+    """Top-k follows BM25 (more occurrences, shorter text first) and survives a reload"""
+    print("🧪 Testing ranking and serialization...")
+
+    characters = [
+        {"id": "a", "raw_text": "喜欢猫。" + "其他内容" * 20},
+        {"id": "b", "raw_text": "猫猫猫，养了三只猫", "interests": ["猫"]},
+        {"id": "c", "raw_text": "喜欢狗"},
+        {"id": "d", "raw_text": "喜欢猫", "occupation": "医疗"},
+    ]
+    data = build_index_bytes(characters)
+    assert data == build_index_bytes(characters), "output must be deterministic"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_file = Path(tmp, "search_index.bin")
+        index_file.write_bytes(data)
+        index = TextSearchIndex.load(index_file)
+
+    results = index.search("猫", k=3)
+    assert [doc_id for doc_id, _ in results] == ["b", "d", "a"], results
+    assert results[0][1] > results[1][1] > results[2][1]
+    assert [doc_id for doc_id, _ in index.search("猫", k=1)] == ["b"]
+    assert index.match("喜欢 医疗") == ["d"]
+    assert index.search("医疗 狗") == []
+    assert index.postings("喜欢") == [(0, 1), (2, 1), (3, 1)]
+
+    empty = TextSearchIndex(build_index_bytes([]))
+    assert len(empty) == 0 and empty.search("猫") == []
+    try:
+        TextSearchIndex(b"nope")
+        assert False, "a foreign file should be rejected"
+    except ValueError:
+        pass
+    print("   ✅ Ranking and serialization OK")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Text Search Index Test Suite")
+    print("=" * 50)
+
+    tests = [test_terms, test_matches_linear_scan, test_ranking_and_round_trip]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
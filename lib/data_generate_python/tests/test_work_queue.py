@@ -0,0 +1,294 @@
+"""
+Test script for the leased work queue
+Leases, heartbeats and reclaiming on a simulated clock, and several queue
+workers (each its own "machine") draining one queue against a local
+stand-in API without requesting any profile twice; a worker whose raw
+file differs from the queued one sends none of the changed blocks, and a
+slow request does not hold up the other slots
+"""
+
+import json
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+from data_pipeline import QUEUE_TASK_KEYS, DataPipeline
+from endpoint_pool import Endpoint
+from raw_data_manifest import RawDataManifest
+from retry_queue import RETRY_POLICIES
+from work_queue import LeasedWorkQueue
+
+PROFILES = 12
+
+
+def start_stand_in():
+    """Answers height from the profile number; profiles saying FAIL get a 400
+
+    Profiles saying SLOW take a second; `spans` records when each request
+    started and ended.
+    """
+    requests = Counter()
+    spans = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            text = body["messages"][1]["content"]
+            number = int(re.match(r"编号(\d+)", text).group(1))
+            requests[number] += 1
+            started = time.monotonic()
+            time.sleep(1.0 if "SLOW" in text else 0.05)
+            spans[number] = (started, time.monotonic())
+            if "FAIL" in text:
+                self.send_response(400)
+                self.end_headers()
+                return
+            content = json.dumps({"height_cm": 150 + number, "hobbies": "旅游"})
+            payload = json.dumps({"choices": [{"message": {"content": content}}]})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(payload.encode())
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1", requests, spans
+
+
+def test_leases_and_reclaim():
+    """Claims are disjoint; lapsed leases move to the next claimer"""
+    print("🧪 Testing leases, heartbeats and reclaiming...")
+
+    now = [1000.0]
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "queue.db"
+        a = LeasedWorkQueue(db, worker_id="a", lease_seconds=60, clock=lambda: now[0])
+        b = LeasedWorkQueue(db, worker_id="b", lease_seconds=60, clock=lambda: now[0])
+        tasks = [{"id": f"men_1_{i}", "rank": i, "file": "men_1.md"} for i in range(5)]
+        assert a.add(tasks) == 5
+        assert b.add(tasks) == 0  # seeding twice adds nothing
+
+        claimed_a = [task["id"] for task in a.claim(2)]
+        claimed_b = [task["id"] for task in b.claim(2)]
+        assert claimed_a == ["men_1_0", "men_1_1"]
+        assert claimed_b == ["men_1_2", "men_1_3"]
+        assert a.claim(1)[0]["file"] == "men_1.md"  # men_1_4
+        assert b.claim(5) == []
+
+        # a keeps only men_1_0 alive; its other leases lapse and b takes them
+        now[0] += 40
+        assert a.heartbeat(["men_1_0"]) == set()
+        assert b.heartbeat(["men_1_2", "men_1_3"]) == set()
+        now[0] += 30
+        reclaimed = b.claim(5)
+        assert [task["id"] for task in reclaimed] == ["men_1_1", "men_1_4"]
+        assert all(task["reclaimed"] for task in reclaimed)
+        assert a.heartbeat(["men_1_0", "men_1_1"]) == {"men_1_1"}
+        assert not a.complete("men_1_1", {"height_cm": 1})  # a's result is refused
+        assert a.complete("men_1_0", {"height_cm": 150})
+
+        # A retryable failure waits, a final one stays failed
+        assert b.fail("men_1_1", "timed out", "timeout", retry_in=10)
+        assert b.fail("men_1_2", "bad request", "client", retry_in=None)
+        assert b.claim(5) == []
+        assert 9 < b.next_ready_in() <= 10
+        now[0] += 10
+        retried = b.claim(5)
+        assert [(t["id"], t["attempts"]) for t in retried] == [("men_1_1", 1)]
+        for task_id in ("men_1_1", "men_1_3", "men_1_4"):
+            assert b.complete(task_id, {"height_cm": 150})
+
+        assert b.counts() == {"done": 4, "failed": 1}
+        assert b.next_ready_in() is None
+        assert [task["id"] for task in a.results()] == [
+            "men_1_0", "men_1_1", "men_1_3", "men_1_4"
+        ]
+        assert a.failures()[0]["error_class"] == "client"
+        a.close()
+        b.close()
+    print("   ✅ Leases, heartbeats and reclaiming OK")
+
+
+def test_workers_share_queue():
+    """Three workers and a crashed one: every profile requested exactly once"""
+    print("🧪 Testing workers draining a shared queue...")
+
+    server, url, requests, _ = start_stand_in()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            raw = tmp / "raw_data"
+            raw.mkdir()
+            (raw / "men_1.md").write_text(
+                "".join(
+                    f"编号{i}\n{'FAIL' if i == 5 else f'身高{150 + i}'}\n\n"
+                    for i in range(1, PROFILES + 1)
+                ),
+                encoding="utf-8",
+            )
+            queue_file = tmp / "queue.db"
+
+            def run_worker(name, results):
+                pipeline = DataPipeline(
+                    "test-key",
+                    endpoints=[Endpoint("test-key", url, max_requests_per_minute=3000)],
+                )
+                results[name] = pipeline.run_queue_worker(
+                    queue_path=str(queue_file),
+                    input_folder=str(raw),
+                    csv_output=str(tmp / name / "profiles.csv"),
+                    json_output=str(tmp / name / "characters.json"),
+                    lease_seconds=0.5,
+                    worker_id=name,
+                    poll_interval=0.1,
+                )
+
+            # A worker that claimed two profiles and died without a word
+            manifest = RawDataManifest(raw)
+            manifest.refresh(["men_*.md"])
+            blocks = manifest.blocks("men_1.md")
+            crashed = LeasedWorkQueue(queue_file, worker_id="crashed", lease_seconds=0.3)
+            crashed.add(
+                {
+                    "id": f"men_1_{block['番号']}",
+                    "rank": index,
+                    "file": "men_1.md",
+                    "start": block["start"],
+                    "end": block["end"],
+                    "sha1": block["sha1"],
+                    "gender": "male",
+                }
+                for index, block in enumerate(blocks[:2])
+            )
+            assert len(crashed.claim(2)) == 2
+            crashed.close()
+
+            results = {}
+            threads = [
+                threading.Thread(target=run_worker, args=(f"w{n}", results))
+                for n in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert all(results[f"w{n}"] for n in range(3))
+            assert set(requests) == set(range(1, PROFILES + 1))
+            assert max(requests.values()) == 1, f"requested twice: {requests}"
+
+            queue = LeasedWorkQueue(queue_file)
+            assert queue.counts() == {"done": PROFILES - 1, "failed": 1}
+            owners = {task["id"] for task in queue.results()}
+            assert {"men_1_1", "men_1_2"} <= owners  # reclaimed from the crash
+            queue.close()
+
+            # Every worker exports the same, complete result
+            csv_texts = {
+                (tmp / f"w{n}" / "profiles.csv").read_text(encoding="utf-8-sig")
+                for n in range(3)
+            }
+            assert len(csv_texts) == 1
+            ids = re.findall(r"^(men_1_\d+),", csv_texts.pop(), re.MULTILINE)
+            assert ids == [f"men_1_{i}" for i in range(1, PROFILES + 1) if i != 5]
+    finally:
+        server.shutdown()
+    print("   ✅ Shared queue drained without duplicate requests")
+
+
+def test_stale_copy_and_free_slots():
+    """Changed blocks are not sent; a slow request leaves the other slot busy"""
+    print("🧪 Testing a worker with a changed raw file...")
+
+    server, url, requests, spans = start_stand_in()
+    policy = RETRY_POLICIES["source_mismatch"]
+    RETRY_POLICIES["source_mismatch"] = (0.0, 2)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            queued, here = tmp / "queued", tmp / "here"
+            queued.mkdir()
+            here.mkdir()
+            text = "".join(
+                f"编号{i}\n{'SLOW' if i == 1 else f'身高{150 + i}'}\n\n"
+                for i in range(1, 7)
+            )
+            (queued / "men_1.md").write_text(text, encoding="utf-8")
+            # Same offsets here, but block 3 was edited after it was queued
+            (here / "men_1.md").write_text(text.replace("身高153", "身高351"), encoding="utf-8")
+
+            pipeline = DataPipeline(
+                "test-key",
+                endpoints=[
+                    Endpoint("test-key", url, max_requests_per_minute=3000, max_concurrency=2)
+                ],
+            )
+            # Queued by a worker that had the original file
+            manifest = RawDataManifest(queued)
+            manifest.refresh(["men_*.md"])
+            queue_file = tmp / "queue.db"
+            seeder = LeasedWorkQueue(queue_file, worker_id="seeder")
+            seeder.add(
+                {key: task[key] for key in QUEUE_TASK_KEYS}
+                for task in pipeline.profile_tasks(manifest, ["men_*.md"])
+            )
+            seeder.close()
+
+            assert pipeline.run_queue_worker(
+                queue_path=str(queue_file),
+                input_folder=str(here),
+                csv_output=str(tmp / "profiles.csv"),
+                json_output=str(tmp / "characters.json"),
+                worker_id="here",
+                poll_interval=0.05,
+            )
+
+            assert 3 not in requests and set(requests) == {1, 2, 4, 5, 6}
+            queue = LeasedWorkQueue(queue_file)
+            failure = queue.failures()[0]
+            assert failure["id"] == "men_1_3" and failure["error_class"] == "source_mismatch"
+            assert queue.counts() == {"done": 5, "failed": 1}
+            queue.close()
+
+            # The second slot kept working while profile 1 was slow
+            slow_end = spans[1][1]
+            assert all(spans[n][1] < slow_end for n in (2, 4, 5, 6)), spans
+    finally:
+        RETRY_POLICIES["source_mismatch"] = policy
+        server.shutdown()
+    print("   ✅ Changed block held back, free slot refilled")
+
+
+def main():
+    """Main test function"""
+    print("🧪 Leased Work Queue Test Suite")
+    print("=" * 50)
+
+    tests = [test_leases_and_reclaim, test_workers_share_queue, test_stale_copy_and_free_slots]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            success_count += 1
+        except AssertionError as e:
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n🎯 Test Results: {success_count}/{len(tests)} tests passed")
+    return success_count == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
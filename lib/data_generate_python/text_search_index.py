@@ -0,0 +1,242 @@
+"""
+Text Search Index
+Inverted index over the profile text and key fields of the Flutter dataset:
+CJK characters and bigrams plus ASCII words, with delta-encoded posting
+lists, so a free-text query ("医疗", "埼玉", "猫") reads a few short lists
+instead of scanning every raw_text
+"""
+
+import heapq
+import json
+import math
+import re
+import struct
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+MAGIC = b"TSI1"
+
+# Character fields whose text is searchable (interests are joined)
+INDEXED_FIELDS = [
+    "raw_text",
+    "occupation",
+    "hometown",
+    "current_location",
+    "interests",
+    "mbti",
+    "zodiac",
+]
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Runs of ASCII letters/digits, or of kana and CJK ideographs
+_TOKEN_RE = re.compile(r"[a-z0-9]+|[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+
+
+def normalize(text: str) -> str:
+    """NFKC (full-width letters and digits to ASCII) and lower case"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def tokenize(text: str) -> Iterator[str]:
+    """Index terms of a text: ASCII words, CJK characters and CJK bigrams"""
+    for run in _TOKEN_RE.findall(normalize(text)):
+        if run.isascii():
+            yield run
+            continue
+        yield from run
+        for i in range(len(run) - 1):
+            yield run[i : i + 2]
+
+
+def query_terms(query: str) -> List[str]:
+    """Terms that must all occur for a document to match the query
+
+    A CJK run is its bigrams (a single character stands for itself), so a
+    match has every bigram of the query but not necessarily adjacent.
+    """
+    terms = []
+    for run in _TOKEN_RE.findall(normalize(query)):
+        if run.isascii() or len(run) == 1:
+            terms.append(run)
+        else:
+            terms.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return list(dict.fromkeys(terms))
+
+
+def searchable_text(character: Dict[str, Any]) -> str:
+    """The indexed fields of a character, one per line"""
+    parts = []
+    for field in INDEXED_FIELDS:
+        value = character.get(field)
+        if isinstance(value, list):
+            value = " ".join(str(item) for item in value)
+        if value:
+            parts.append(str(value))
+    return "\n".join(parts)
+
+
+def _encode_varint(value: int, out: bytearray):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varints(data: memoryview) -> List[int]:
+    numbers = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        numbers.append(value)
+        value = shift = 0
+    return numbers
+
+
+def _decode_postings(data: memoryview) -> List[Tuple[int, int]]:
+    """(document, term frequency) pairs of one delta-encoded posting list"""
+    numbers = _decode_varints(data)
+    postings = []
+    doc = 0
+    for i in range(0, len(numbers), 2):
+        doc += numbers[i]
+        postings.append((doc, numbers[i + 1]))
+    return postings
+
+
+def build_index_bytes(characters: Iterable[Dict[str, Any]]) -> bytes:
+    """Serialize the index of `characters` (documents in the given order)
+
+    Layout: MAGIC, a little-endian uint32 header length, the JSON header
+    (document ids and lengths, sorted terms joined by newlines), the term
+    table (varint posting list size and document count per term), then the
+    posting lists: varint pairs of document gap and term frequency. Equal
+    input gives equal bytes.
+    """
+    ids = []
+    lengths = []
+    postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    for doc, character in enumerate(characters):
+        counts = Counter(tokenize(searchable_text(character)))
+        ids.append(character.get("id"))
+        lengths.append(sum(counts.values()))
+        for term, tf in counts.items():
+            postings[term].append((doc, tf))
+
+    terms = sorted(postings)
+    table = bytearray()
+    blob = bytearray()
+    for term in terms:
+        start = len(blob)
+        previous = 0
+        for doc, tf in postings[term]:
+            _encode_varint(doc - previous, blob)
+            _encode_varint(tf, blob)
+            previous = doc
+        _encode_varint(len(blob) - start, table)
+        _encode_varint(len(postings[term]), table)
+
+    header = json.dumps(
+        {"ids": ids, "lengths": lengths, "terms": "\n".join(terms), "table": len(table)},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return MAGIC + struct.pack("<I", len(header)) + header + bytes(table) + bytes(blob)
+
+
+class TextSearchIndex:
+    """Query side of an index written by build_index_bytes
+
+    Posting lists stay encoded until a query needs them.
+    """
+
+    def __init__(self, data: bytes):
+        if data[:4] != MAGIC:
+            raise ValueError("not a text search index")
+        (header_size,) = struct.unpack_from("<I", data, 4)
+        header = json.loads(bytes(data[8 : 8 + header_size]).decode("utf-8"))
+        self.ids: List[str] = header["ids"]
+        self.lengths: List[int] = header["lengths"]
+        # term -> (offset, size, document count) of its posting list
+        self.terms: Dict[str, Tuple[int, int, int]] = {}
+        start = 8 + header_size
+        table = _decode_varints(memoryview(data)[start : start + header["table"]])
+        offset = 0
+        for i, term in enumerate(header["terms"].split("\n") if header["terms"] else []):
+            size, df = table[2 * i], table[2 * i + 1]
+            self.terms[term] = (offset, size, df)
+            offset += size
+        self._postings = memoryview(data)[start + header["table"] :]
+        self._average_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+
+    @classmethod
+    def load(cls, index_file) -> "TextSearchIndex":
+        return cls(Path(index_file).read_bytes())
+
+    @classmethod
+    def build(cls, characters: Iterable[Dict[str, Any]]) -> "TextSearchIndex":
+        return cls(build_index_bytes(characters))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def postings(self, term: str) -> List[Tuple[int, int]]:
+        """(document, term frequency) pairs of a term, in document order"""
+        entry = self.terms.get(term)
+        if entry is None:
+            return []
+        offset, size, _ = entry
+        return _decode_postings(self._postings[offset : offset + size])
+
+    def _matching(self, terms: List[str]) -> Dict[int, List[int]]:
+        """Documents holding every term -> their frequency of each term"""
+        if not terms or any(term not in self.terms for term in terms):
+            return {}
+        # Intersect from the rarest term so candidates only shrink
+        order = sorted(range(len(terms)), key=lambda i: self.terms[terms[i]][2])
+        matches = None
+        for i in order:
+            narrowed = {}
+            for doc, tf in self.postings(terms[i]):
+                if matches is None:
+                    narrowed[doc] = [0] * len(terms)
+                elif doc not in matches:
+                    continue
+                else:
+                    narrowed[doc] = matches[doc]
+                narrowed[doc][i] = tf
+            matches = narrowed
+            if not matches:
+                break
+        return matches
+
+    def match(self, query: str) -> List[str]:
+        """Ids of every document with all query terms, in dataset order"""
+        return [self.ids[doc] for doc in sorted(self._matching(query_terms(query)))]
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """Top `k` (id, BM25 score) among documents with all query terms"""
+        terms = query_terms(query)
+        matches = self._matching(terms)
+        count = len(self.ids)
+        idf = []
+        for term in terms:
+            df = self.terms[term][2] if term in self.terms else 0
+            idf.append(math.log(1 + (count - df + 0.5) / (df + 0.5)))
+
+        def score(doc: int, tfs: List[int]) -> float:
+            norm = K1 * (1 - B + B * self.lengths[doc] / self._average_length)
+            return sum(w * tf * (K1 + 1) / (tf + norm) for w, tf in zip(idf, tfs))
+
+        best = heapq.nlargest(
+            k, ((score(doc, tfs), -doc) for doc, tfs in matches.items())
+        )
+        return [(self.ids[-negative_doc], value) for value, negative_doc in best]
+
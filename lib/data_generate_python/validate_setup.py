@@ -4,18 +4,10 @@ Quick Setup and Validation Script
 Validates the data processing setup and runs a minimal test
 """
 import sys
-import os
 from pathlib import Path
 
-# Add current directory and parent directory to Python path
+# Files are checked relative to this script, whatever the cwd
 current_dir = Path(__file__).parent
-sys.path.append(str(current_dir))
-sys.path.append(str(current_dir.parent.parent.parent))  # Add root folder
-
-# Change working directory to script location if running from elsewhere
-if Path.cwd() != current_dir:
-    print(f"Changing working directory to: {current_dir}")
-    os.chdir(current_dir)
 
 
 def check_files():
@@ -28,7 +20,7 @@ def check_files():
 
     missing_files = []
     for file in required_files:
-        if not Path(file).exists():
+        if not (current_dir / file).exists():
             missing_files.append(file)
 
     if missing_files:
@@ -55,22 +47,30 @@ def check_dependencies():
 
 def check_data_folder():
     """Check if raw_data folder exists and has files"""
-    data_path = Path("raw_data")
+    data_path = current_dir / "raw_data"
 
     if not data_path.exists():
         print("❌ raw_data folder not found")
         print("💡 Create the folder and add your .md data files")
         return False
 
-    md_files = list(data_path.glob("*.md"))
+    # The manifest only re-reads files that changed since the last check
+    from raw_data_manifest import RawDataManifest
+
+    manifest = RawDataManifest(data_path)
+    manifest.refresh()
+    md_files = manifest.data_files()
     if not md_files:
         print("❌ No .md files found in raw_data")
         print("💡 Add your dating profile .md files to raw_data folder")
         return False
 
-    print(f"✅ Found {len(md_files)} data files:")
+    print(
+        f"✅ Found {len(md_files)} data files "
+        f"({manifest.total_profiles()} profiles):"
+    )
     for file in md_files[:5]:  # Show first 5
-        print(f"   - {file.name}")
+        print(f"   - {file.name} ({manifest.block_count(file.name)} profiles)")
     if len(md_files) > 5:
         print(f"   ... and {len(md_files) - 5} more")
 
@@ -0,0 +1,342 @@
+"""
+Leased Work Queue
+A SQLite work queue that several pipeline runs (processes or machines) can
+share. Workers claim profiles under time-limited leases, extend them with
+heartbeats while the requests are in flight, and store the extracted fields
+in the queue itself. A lease that runs out (its worker crashed or lost the
+share) is reclaimed by the next claim, so every profile is requested once
+as long as its worker stays alive
+
+The database lives on a path every worker can reach. WAL mode lets readers
+and the one writer overlap, but needs the workers' locks and shared memory
+to work on that filesystem; on a network share open the queue with
+journal_mode="DELETE". Lease times come from the workers' wall clocks,
+which must agree to well within the lease length.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+current_dir = Path(__file__).parent
+DEFAULT_QUEUE_FILE = current_dir / "output" / "work_queue.db"
+DEFAULT_LEASE_SECONDS = 300.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    rank INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_until REAL,
+    not_before REAL NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    error_class TEXT,
+    result TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_by_status ON tasks (status, rank);
+"""
+
+
+def default_worker_id() -> str:
+    """host:pid:random, unique per queue user even across restarts"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class LeasedWorkQueue:
+    """Profiles to extract, shared by any number of workers
+
+    A task is pending, leased (to one worker, until lease_until), done (with
+    its result) or failed. Every state change is a single transaction, so a
+    worker that dies at any point leaves at most an expiring lease behind.
+    """
+
+    def __init__(
+        self,
+        db_path=DEFAULT_QUEUE_FILE,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        journal_mode: str = "WAL",
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db_path = Path(db_path)
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.journal_mode = journal_mode
+        self.clock = clock
+        # sqlite3 connections belong to the thread that opened them
+        self._local = threading.local()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit; writes take the lock up front with BEGIN IMMEDIATE
+            connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            connection.execute(f"PRAGMA journal_mode={self.journal_mode}")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _write(self, statements):
+        """Run (sql, params) pairs in one write transaction; return rowcounts"""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            counts = [connection.execute(sql, params).rowcount for sql, params in statements]
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return counts
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def add(self, tasks: Iterable[Dict[str, Any]]) -> int:
+        """Add tasks ({"id", "rank", **payload}); ids already queued are kept
+
+        Every worker may seed the same tasks; only the first copy counts.
+        Returns how many were new.
+        """
+        rows = []
+        for task in tasks:
+            payload = {k: v for k, v in task.items() if k not in ("id", "rank")}
+            rows.append((task["id"], task["rank"], json.dumps(payload, ensure_ascii=False)))
+        if not rows:
+            return 0
+        connection = self._connection()
+        before = connection.total_changes
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "INSERT OR IGNORE INTO tasks (id, rank, payload) VALUES (?, ?, ?)", rows
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return connection.total_changes - before
+
+    def claim(self, limit: int = 1) -> List[Dict[str, Any]]:
+        """Lease up to `limit` tasks to this worker, in rank order
+
+        Takes pending tasks that are due and leased tasks whose lease ran
+        out. Each returned task carries its payload, "attempts" and
+        "reclaimed" (True if another worker's lease had expired).
+        """
+        now = self.clock()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                "SELECT id, payload, attempts, status FROM tasks"
+                " WHERE (status = 'pending' AND not_before <= ?)"
+                " OR (status = 'leased' AND lease_until <= ?)"
+                " ORDER BY rank LIMIT ?",
+                (now, now, limit),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE tasks SET status = 'leased', owner = ?, lease_until = ?, updated = ?"
+                " WHERE id = ?",
+                [(self.worker_id, now + self.lease_seconds, now, row[0]) for row in rows],
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return [
+            {
+                "id": task_id,
+                **json.loads(payload),
+                "attempts": attempts,
+                "reclaimed": status == "leased",
+            }
+            for task_id, payload, attempts, status in rows
+        ]
+
+    def heartbeat(self, task_ids: Iterable[str]) -> Set[str]:
+        """Extend this worker's leases; return the ids it no longer holds"""
+        task_ids = list(task_ids)
+        now = self.clock()
+        counts = self._write(
+            (
+                "UPDATE tasks SET lease_until = ?, updated = ?"
+                " WHERE id = ? AND owner = ? AND status = 'leased'",
+                (now + self.lease_seconds, now, task_id, self.worker_id),
+            )
+            for task_id in task_ids
+        )
+        return {task_id for task_id, count in zip(task_ids, counts) if not count}
+
+    def complete(self, task_id: str, result: Dict[str, Any]) -> bool:
+        """Store a task's result; False if the lease was lost to another worker"""
+        (count,) = self._write(
+            [
+                (
+                    "UPDATE tasks SET status = 'done', result = ?, owner = NULL,"
+                    " lease_until = NULL, error = NULL, error_class = NULL, updated = ?"
+                    " WHERE id = ? AND owner = ? AND status = 'leased'",
+                    (
+                        json.dumps(result, ensure_ascii=False),
+                        self.clock(),
+                        task_id,
+                        self.worker_id,
+                    ),
+                )
+            ]
+        )
+        return bool(count)
+
+    def fail(
+        self,
+        task_id: str,
+        error: str,
+        error_class: Optional[str] = None,
+        retry_in: Optional[float] = None,
+        count_attempt: bool = True,
+    ) -> bool:
+        """Record a failed attempt; the task is retried after `retry_in`
+        seconds, or given up for good when it is None
+
+        False if the lease was lost to another worker.
+        """
+        now = self.clock()
+        status = "failed" if retry_in is None else "pending"
+        (count,) = self._write(
+            [
+                (
+                    "UPDATE tasks SET status = ?, not_before = ?, attempts = attempts + ?,"
+                    " error = ?, error_class = ?, owner = NULL, lease_until = NULL,"
+                    " updated = ? WHERE id = ? AND owner = ? AND status = 'leased'",
+                    (
+                        status,
+                        now + (retry_in or 0.0),
+                        int(count_attempt),
+                        error,
+                        error_class,
+                        now,
+                        task_id,
+                        self.worker_id,
+                    ),
+                )
+            ]
+        )
+        return bool(count)
+
+    def release(self, task_ids: Iterable[str]):
+        """Hand unstarted tasks back (e.g. on shutdown) without an attempt"""
+        self._write(
+            (
+                "UPDATE tasks SET status = 'pending', owner = NULL, lease_until = NULL,"
+                " updated = ? WHERE id = ? AND owner = ? AND status = 'leased'",
+                (self.clock(), task_id, self.worker_id),
+            )
+            for task_id in list(task_ids)
+        )
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._connection().execute(
+            "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+        ).fetchall()
+        return {status: rows_count for status, rows_count in rows}
+
+    def next_ready_in(self) -> Optional[float]:
+        """Seconds until a task could next be claimed; None when all are settled"""
+        row = self._connection().execute(
+            "SELECT MIN(CASE status WHEN 'pending' THEN not_before ELSE lease_until END)"
+            " FROM tasks WHERE status IN ('pending', 'leased')"
+        ).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - self.clock())
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Done tasks in rank order, each with its payload and "result" """
+        rows = self._connection().execute(
+            "SELECT id, payload, result FROM tasks WHERE status = 'done' ORDER BY rank"
+        ).fetchall()
+        return [
+            {"id": task_id, **json.loads(payload), "result": json.loads(result)}
+            for task_id, payload, result in rows
+        ]
+
+    def failures(self) -> List[Dict[str, Any]]:
+        rows = self._connection().execute(
+            "SELECT id, attempts, error, error_class, updated FROM tasks"
+            " WHERE status = 'failed' ORDER BY rank"
+        ).fetchall()
+        return [
+            {
+                "id": task_id,
+                "attempts": attempts,
+                "error": error,
+                "error_class": error_class,
+                "timestamp": updated,
+            }
+            for task_id, attempts, error, error_class, updated in rows
+        ]
+
+
+class LeaseKeeper:
+    """Background heartbeat for the leases a worker is holding
+
+    Extends every held lease each `interval` seconds (a third of the lease
+    by default, so two heartbeats may fail before a lease runs out). Ids
+    whose lease was lost are collected in `lost`. The heartbeat thread
+    uses its own connection (connections are per thread).
+    """
+
+    def __init__(self, queue: LeasedWorkQueue, interval: Optional[float] = None):
+        self.queue = queue
+        self.interval = interval or queue.lease_seconds / 3
+        self.held: Set[str] = set()
+        self.lost: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def hold(self, task_ids: Iterable[str]):
+        with self._lock:
+            self.held.update(task_ids)
+
+    def drop(self, task_id: str):
+        with self._lock:
+            self.held.discard(task_id)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                held = list(self.held)
+            if not held:
+                continue
+            try:
+                lost = self.queue.heartbeat(held)
+            except sqlite3.Error as e:
+                print(f"   ⚠️  Heartbeat failed: {e}")
+                continue
+            with self._lock:
+                self.lost.update(lost)
+                self.held.difference_update(lost)
+        self.queue.close()
+
+    def __enter__(self) -> "LeaseKeeper":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
@@ -2,10 +2,10 @@ import 'dart:convert';
 import 'dart:io';
 import 'dart:math';
 import 'package:flutter/foundation.dart';
-import 'package:flutter/services.dart';
 import 'package:path_provider/path_provider.dart';
 import 'package:shared_preferences/shared_preferences.dart';
 import '../data/character.dart';
+import '../data/generated_characters_data.dart';
 import '../models/filter_options.dart';
 
 class CharacterService {
@@ -152,20 +152,21 @@ class CharacterService {
     }
   }
 
-  /// Load characters from assets
+  /// Load the bundled characters from the generated Dart module (no JSON
+  /// parsing). The data pipeline and scripts/prebuild.py regenerate it
+  /// whenever output/flutter_characters.json changes.
   static Future<List<Character>> _loadFromAssets() async {
-    print('CharacterService: Loading from assets/data/flutter_characters.json');
-
-    final jsonString = await rootBundle.loadString(
-      'assets/data/flutter_characters.json',
-    );
-    final List<dynamic> jsonList = json.decode(jsonString);
-
-    print(
-      '✅ CharacterService: Asset loaded (${jsonList.length} items, ${jsonString.length} chars)',
-    );
-
-    return jsonList.map((json) => Character.fromJson(json)).toList();
+    final generated = GeneratedCharactersData.getCharacters();
+    if (generated.isEmpty) {
+      print(
+        '⚠️ CharacterService: Generated character data is empty; run scripts/prebuild.py',
+      );
+    } else {
+      print(
+        '✅ CharacterService: Loaded ${generated.length} generated characters',
+      );
+    }
+    return generated;
   }
 
   /// Restore user state from browser local storage (web only)
@@ -443,6 +444,19 @@ class CharacterService {
     return bookmarked;
   }
 
+  /// "More like this": the character's precomputed similar profiles,
+  /// nearest first (ids missing from [characters] are skipped)
+  static List<Character> getSimilarCharacters(
+    Character character,
+    List<Character> characters,
+  ) {
+    final byId = {for (final c in characters) c.id: c};
+    return character.similarIds
+        .map((id) => byId[id])
+        .whereType<Character>()
+        .toList();
+  }
+
   static int getCompatibilityScore(
     Character character,
     List<String> userInterests,
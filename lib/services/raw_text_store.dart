@@ -0,0 +1,27 @@
+import 'dart:convert';
+import 'package:flutter/services.dart';
+import '../data/character.dart';
+
+/// Profile texts kept out of the character dataset
+///
+/// When the converter runs with a raw text blob, characters carry a
+/// [Character.rawTextRef] instead of their text. The blob asset is loaded
+/// the first time a text is needed (the detail view), never at startup;
+/// list [blobAsset] under assets in pubspec.yaml when the blob is used.
+class RawTextStore {
+  static const String blobAsset = 'assets/data/raw_texts.bin';
+
+  static Future<ByteData>? _blob;
+
+  /// The character's profile text, read from the blob when it was moved
+  static Future<String> textFor(Character character) async {
+    final ref = character.rawTextRef;
+    if (ref == null) {
+      return character.rawText;
+    }
+    final blob = await (_blob ??= rootBundle.load(blobAsset));
+    return utf8.decode(
+      blob.buffer.asUint8List(blob.offsetInBytes + ref[0], ref[1]),
+    );
+  }
+}
@@ -1,4 +1,5 @@
 import 'package:date_app/data/character.dart';
+import 'package:date_app/services/raw_text_store.dart';
 import 'package:flutter/material.dart';
 
 class CharacterCard extends StatelessWidget {
@@ -31,8 +32,12 @@ class CharacterCard extends StatelessWidget {
                   SizedBox(
                     width: double.infinity,
                     child: character.imageUrl != null
-                        ? Image.network(
-                            character.imageUrl!,
+                        ? Image(
+                            // Bundled thumbnail first; the original is large
+                            image: character.thumbnail != null
+                                ? AssetImage(character.thumbnail!)
+                                      as ImageProvider
+                                : NetworkImage(character.imageUrl!),
                             width: double.infinity,
                             fit: BoxFit
                                 .fitWidth, // Show full image width, adjust height automatically
@@ -216,12 +221,17 @@ class CharacterCard extends StatelessWidget {
                                 ),
                           ),
                           const SizedBox(height: 8),
-                          SelectableText(
-                            character.rawText,
-                            style: const TextStyle(
-                              fontSize: 14,
-                              height: 1.5,
-                              color: Colors.black87,
+                          // Loaded from the raw text blob when it was moved out
+                          FutureBuilder<String>(
+                            future: RawTextStore.textFor(character),
+                            initialData: character.rawText,
+                            builder: (context, snapshot) => SelectableText(
+                              snapshot.data ?? '',
+                              style: const TextStyle(
+                                fontSize: 14,
+                                height: 1.5,
+                                color: Colors.black87,
+                              ),
                             ),
                           ),
                         ],
@@ -1,43 +1,47 @@
 #!/usr/bin/env python3
 """
-Pre-build script to generate fresh test_characters.json data before Flutter runs
+Pre-build script to refresh the app's generated character data before Flutter runs
+
+By default this is hash-gated and offline: it only rebuilds
+lib/data/generated_characters_data.dart and assets/data/search_index.bin from
+the cached extractions when raw data, prompt, pipeline code or converter changed.
+Pass --network to run the (paid) test extraction pipeline first; it reads the
+API key from DEEPSEEK_API_KEY.
 """
 
 import sys
 import os
-import subprocess
+import argparse
 
-# Add the data_generate_python directory to the path
+# Make the data_generate_python package importable
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
-data_generate_dir = os.path.join(parent_dir, 'lib', 'data_generate_python')
-sys.path.append(data_generate_dir)
+sys.path.insert(0, os.path.join(parent_dir, "lib"))
+
 
 def main():
-    print(" Generating fresh test data before Flutter build...")
-    
-    try:
-        # Change to the data generation directory
-        os.chdir(data_generate_dir)
-        
-        # Import and run the data pipeline
-        from data_pipeline import DataPipeline
-        
-        pipeline = DataPipeline()
-        
-        # Generate fresh test data
-        print(" Running test data pipeline...")
-        pipeline.run_test_pipeline()
-        
-        print("✅ Fresh test data generated successfully!")
-        print(" Updated: assets/test_characters.json")
-        
-    except Exception as e:
-        print(f"❌ Error generating test data: {e}")
-        print("⚠️  Continuing with existing data...")
-        return 1
-    
-    return 0
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild even if nothing changed"
+    )
+    parser.add_argument(
+        "--network",
+        action="store_true",
+        help="run the test extraction pipeline against the API first",
+    )
+    args = parser.parse_args()
+
+    if args.network:
+        from data_generate_python.data_pipeline import DataPipeline
+
+        print("🔄 Running test data pipeline...")
+        if not DataPipeline().run_test_pipeline():
+            print("⚠️  Test pipeline failed, building from cached data...")
+
+    from data_generate_python.asset_builder import run_prebuild
+
+    return run_prebuild(force=args.force)
+
 
 if __name__ == "__main__":
     exit_code = main()